@@ -26,6 +26,13 @@
 
 from ctypes import *
 
+# NumPy is optional - used to present batched object records as a 
+# structured array when available.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 _dsl = CDLL('/usr/local/lib/libdsl.so')
 
 DSL_RETURN_SUCCESS = 0
@@ -51,6 +58,13 @@ DSL_PPH_EVENT_STREAM_ADDED   = 0
 DSL_PPH_EVENT_STREAM_DELETED = 1
 DSL_PPH_EVENT_STREAM_ENDED   = 2
 
+DSL_PPH_CUSTOM_ASYNC_POLICY_DROP   = 0
+DSL_PPH_CUSTOM_ASYNC_POLICY_SAMPLE = 1
+DSL_PPH_CUSTOM_ASYNC_POLICY_BLOCK  = 2
+
+DSL_PPH_CUSTOM_ASYNC_DEFAULT_MAX_SIZE        = 8
+DSL_PPH_CUSTOM_ASYNC_DEFAULT_SAMPLE_INTERVAL = 4
+
 DSL_SINK_APP_DATA_TYPE_SAMPLE = 0
 DSL_SINK_APP_DATA_TYPE_BUFFER = 1
 
@@ -151,6 +165,42 @@ DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS = 0
 DSL_COMPONENT_QUEUE_UNIT_OF_BYTES   = 1
 DSL_COMPONENT_QUEUE_UNIT_OF_TIME    = 2
 
+DSL_COMPONENT_PROPERTY_TYPE_BOOLEAN = 0
+DSL_COMPONENT_PROPERTY_TYPE_INT     = 1
+DSL_COMPONENT_PROPERTY_TYPE_UINT    = 2
+DSL_COMPONENT_PROPERTY_TYPE_FLOAT   = 3
+DSL_COMPONENT_PROPERTY_TYPE_STRING  = 4
+
+DSL_TEE_BRANCH_OP_ADD     = 0
+DSL_TEE_BRANCH_OP_REMOVE  = 1
+DSL_TEE_BRANCH_OP_MOVE_TO = 2
+
+DSL_TEE_BRANCH_ANY_STREAM = 0xFFFFFFFF
+
+DSL_QUEUE_SAMPLER_DEFAULT_INTERVAL    = 100
+DSL_QUEUE_SAMPLER_DEFAULT_WINDOW_SIZE = 600
+
+DSL_QUEUE_AUTO_SIZE_GROW_THRESHOLD   = 90
+DSL_QUEUE_AUTO_SIZE_SHRINK_THRESHOLD = 25
+DSL_QUEUE_AUTO_SIZE_UPDATE_SAMPLES   = 10
+
+DSL_QUEUE_BOTTLENECK_THRESHOLD = 75
+
+DSL_INFER_INTERVAL_DEFAULT_UPDATE_INTERVAL = 1000
+DSL_INFER_INTERVAL_DEFAULT_MIN_INTERVAL    = 0
+DSL_INFER_INTERVAL_DEFAULT_MAX_INTERVAL    = 4
+DSL_INFER_INTERVAL_DEFAULT_LOW_OCCUPANCY   = 30
+DSL_INFER_INTERVAL_DEFAULT_HIGH_OCCUPANCY  = 80
+DSL_INFER_INTERVAL_DEFAULT_STEP_UP_COUNT   = 2
+DSL_INFER_INTERVAL_DEFAULT_STEP_DOWN_COUNT = 5
+
+DSL_INFER_INTERVAL_LATENCY_RECOVERY_PERCENT = 75
+
+DSL_PIPELINE_STARTUP_EVENT_STATE_CHANGE = 0
+DSL_PIPELINE_STARTUP_EVENT_LINK         = 1
+DSL_PIPELINE_STARTUP_EVENT_UNLINK       = 2
+DSL_PIPELINE_STARTUP_EVENT_FIRST_BUFFER = 3
+
 DSL_STATE_NULL = 1
 DSL_STATE_READY = 2
 DSL_STATE_PAUSED = 3
@@ -300,6 +350,13 @@ DSL_SOCKET_CONNECTION_STATE_INITIATED = 1
 DSL_SOCKET_CONNECTION_STATE_FAILED    = 2
 
 DSL_WEBSOCKET_SERVER_DEFAULT_HTTP_PORT = 60001
+DSL_WEBSOCKET_SERVER_PUBLISH_PATH = '/pubsub'
+
+DSL_WEBSOCKET_TOPIC_DROP_POLICY_DROP_OLDEST = 0
+DSL_WEBSOCKET_TOPIC_DROP_POLICY_DROP_NEWEST = 1
+DSL_WEBSOCKET_TOPIC_DROP_POLICY_DISCONNECT  = 2
+
+DSL_WEBSOCKET_TOPIC_DEFAULT_MAX_QUEUE_SIZE = 16
 
 DSL_MSG_PAYLOAD_DEEPSTREAM         = 0
 DSL_MSG_PAYLOAD_DEEPSTREAM_MINIMAL = 1
@@ -414,6 +471,169 @@ class dsl_threshold_value(Structure):
         ('threshold', c_uint),
         ('value', c_uint)]
 
+class dsl_component_property(Structure):
+    _fields_ = [
+        ('name', c_wchar_p),
+        ('property', c_wchar_p),
+        ('type', c_uint),
+        ('boolean_value', c_bool),
+        ('int_value', c_int64),
+        ('uint_value', c_uint64),
+        ('float_value', c_double),
+        ('string_value', c_wchar_p)]
+
+class dsl_tee_branch_op(Structure):
+    _fields_ = [
+        ('op', c_uint),
+        ('branch', c_wchar_p),
+        ('stream_id', c_uint)]
+
+class dsl_tee_branch_op_result(Structure):
+    _fields_ = [
+        ('branch', c_wchar_p),
+        ('op', c_uint),
+        ('stream_id', c_uint),
+        ('result', c_uint),
+        ('time_us', c_uint64)]
+
+class dsl_ode_object_record(Structure):
+    _fields_ = [
+        ('tracking_id', c_uint64),
+        ('source_id', c_uint),
+        ('class_id', c_int),
+        ('inference_confidence', c_float),
+        ('tracker_confidence', c_float),
+        ('left', c_float),
+        ('top', c_float),
+        ('width', c_float),
+        ('height', c_float),
+        ('frame_num', c_uint)]
+
+# NumPy dtype matching the dsl_ode_object_record structure layout
+DSL_ODE_OBJECT_RECORD_DTYPE = None if np is None else np.dtype([
+    ('tracking_id', np.uint64),
+    ('source_id', np.uint32),
+    ('class_id', np.int32),
+    ('inference_confidence', np.float32),
+    ('tracker_confidence', np.float32),
+    ('left', np.float32),
+    ('top', np.float32),
+    ('width', np.float32),
+    ('height', np.float32),
+    ('frame_num', np.uint32)], align=True)
+
+class dsl_queue_telemetry(Structure):
+    _fields_ = [
+        ('component', c_wchar_p),
+        ('samples', c_uint),
+        ('current_level_buffers', c_uint64),
+        ('current_level_bytes', c_uint64),
+        ('current_level_time', c_uint64),
+        ('max_size_buffers', c_uint64),
+        ('max_size_bytes', c_uint64),
+        ('max_size_time', c_uint64),
+        ('leaky', c_uint),
+        ('occupancy_p50', c_double),
+        ('occupancy_p90', c_double),
+        ('occupancy_p99', c_double),
+        ('occupancy_max', c_double),
+        ('overruns', c_uint64),
+        ('overrun_rate', c_double),
+        ('is_bottleneck', c_bool)]
+
+class dsl_stalled_source(Structure):
+    _fields_ = [
+        ('name', c_wchar_p),
+        ('timeout', c_uint),
+        ('time_since_last_buffer', c_uint64)]
+
+class dsl_infer_load(Structure):
+    _fields_ = [
+        ('occupancy', c_double),
+        ('overruns', c_uint64),
+        ('fps', c_double),
+        ('latency', c_uint)]
+
+class dsl_infer_interval_metrics(Structure):
+    _fields_ = [
+        ('interval', c_uint),
+        ('updates', c_uint64),
+        ('overloaded_updates', c_uint64),
+        ('underloaded_updates', c_uint64),
+        ('step_ups', c_uint64),
+        ('step_downs', c_uint64),
+        ('last_load', dsl_infer_load)]
+
+class dsl_pipeline_pool_metrics(Structure):
+    _fields_ = [
+        ('size', c_uint),
+        ('available', c_uint),
+        ('acquisitions', c_uint64),
+        ('releases', c_uint64),
+        ('exhausted', c_uint64),
+        ('relinks', c_uint64),
+        ('standby_time', c_double),
+        ('last_time_to_first_frame', c_double),
+        ('average_time_to_first_frame', c_double),
+        ('max_time_to_first_frame', c_double)]
+
+class dsl_pipeline_startup_profile(Structure):
+    _fields_ = [
+        ('link_time', c_double),
+        ('time_to_playing', c_double),
+        ('time_to_first_frame', c_double),
+        ('slowest_element', c_wchar_p),
+        ('slowest_state_change', c_double)]
+
+class dsl_pipeline_startup_event(Structure):
+    _fields_ = [
+        ('type', c_uint),
+        ('element', c_wchar_p),
+        ('pad', c_wchar_p),
+        ('previous_state', c_uint),
+        ('new_state', c_uint),
+        ('timestamp', c_double),
+        ('duration', c_double)]
+
+class dsl_websocket_topic_metrics(Structure):
+    _fields_ = [
+        ('subscribers', c_uint),
+        ('published', c_uint64),
+        ('sent', c_uint64),
+        ('dropped', c_uint64),
+        ('coalesced', c_uint64),
+        ('disconnects', c_uint64)]
+
+class dsl_pph_custom_async_metrics(Structure):
+    _fields_ = [
+        ('current_level', c_uint),
+        ('max_level', c_uint),
+        ('queued', c_uint64),
+        ('processed', c_uint64),
+        ('dropped', c_uint64),
+        ('blocked_time', c_uint64)]
+
+class dsl_ode_action_async_metrics(Structure):
+    _fields_ = [
+        ('pending', c_uint),
+        ('max_pending', c_uint),
+        ('queued', c_uint64),
+        ('coalesced', c_uint64),
+        ('executed', c_uint64),
+        ('latency_total', c_uint64),
+        ('latency_max', c_uint64)]
+
+class dsl_ode_action_capture_metrics(Structure):
+    _fields_ = [
+        ('pooled', c_uint),
+        ('in_use', c_uint),
+        ('acquired', c_uint64),
+        ('hits', c_uint64),
+        ('allocated', c_uint64),
+        ('failed', c_uint64),
+        ('batches', c_uint64),
+        ('captures', c_uint64)]
+
 ##
 ## Pointer Typedefs
 ##
@@ -429,6 +649,17 @@ DSL_LONG_P = POINTER(c_long)
 DSL_DOUBLE_P = POINTER(c_double)
 DSL_FLOAT_P = POINTER(c_float)
 DSL_RTSP_CONNECTION_DATA_P = POINTER(dsl_rtsp_connection_data)
+DSL_QUEUE_TELEMETRY_P = POINTER(dsl_queue_telemetry)
+DSL_STALLED_SOURCE_P = POINTER(dsl_stalled_source)
+DSL_INFER_INTERVAL_METRICS_P = POINTER(dsl_infer_interval_metrics)
+DSL_PIPELINE_POOL_METRICS_P = POINTER(dsl_pipeline_pool_metrics)
+DSL_PIPELINE_STARTUP_PROFILE_P = POINTER(dsl_pipeline_startup_profile)
+DSL_PIPELINE_STARTUP_EVENT_P = POINTER(dsl_pipeline_startup_event)
+DSL_WEBSOCKET_TOPIC_METRICS_P = POINTER(dsl_websocket_topic_metrics)
+DSL_PPH_CUSTOM_ASYNC_METRICS_P = POINTER(dsl_pph_custom_async_metrics)
+DSL_ODE_ACTION_ASYNC_METRICS_P = POINTER(dsl_ode_action_async_metrics)
+DSL_ODE_ACTION_CAPTURE_METRICS_P = POINTER(dsl_ode_action_capture_metrics)
+DSL_TEE_BRANCH_OP_RESULT_P = POINTER(dsl_tee_branch_op_result)
 
 ##
 ## Callback Typedefs
@@ -450,6 +681,10 @@ DSL_ODE_CHECK_FOR_OCCURRENCE = \
 DSL_ODE_POST_PROCESS_FRAME = \
     CFUNCTYPE(c_bool, c_void_p, c_void_p, c_void_p)
 
+# dsl_ode_check_for_occurrence_batch_cb
+DSL_ODE_CHECK_FOR_OCCURRENCE_BATCH = \
+    CFUNCTYPE(c_uint, c_void_p, c_uint, c_void_p, c_void_p)
+
 # dsl_ode_enabled_state_change_listener_cb
 DSL_ODE_ENABLED_STATE_CHANGE_LISTENER = \
     CFUNCTYPE(None, c_bool, c_void_p)
@@ -474,6 +709,10 @@ DSL_PPH_STREAM_EVENT_HANDLER = \
 DSL_STATE_CHANGE_LISTENER = \
     CFUNCTYPE(None, c_uint, c_uint, c_void_p)
 
+# dsl_infer_interval_change_listener_cb
+DSL_INFER_INTERVAL_CHANGE_LISTENER = \
+    CFUNCTYPE(None, c_uint, c_uint, DSL_INFER_INTERVAL_METRICS_P, c_void_p)
+
 # dsl_eos_listener_cb
 DSL_EOS_LISTENER = \
     CFUNCTYPE(None, c_void_p)
@@ -562,6 +801,10 @@ DSL_COMPONENT_QUEUE_OVERRUN_LISTENER = \
 DSL_COMPONENT_QUEUE_UNDERRUN_LISTENER = \
     CFUNCTYPE(None, c_wchar_p, c_void_p)
 
+# dsl_tee_branch_ops_complete_listener_cb
+DSL_TEE_BRANCH_OPS_COMPLETE_LISTENER = \
+    CFUNCTYPE(None, c_wchar_p, DSL_TEE_BRANCH_OP_RESULT_P, c_uint, c_void_p)
+
 ##
 ## TODO: CTYPES callback management needs to be completed before any of
 ## the callback remove wrapper functions will work correctly.
@@ -1034,6 +1277,69 @@ def dsl_ode_action_capture_mailer_remove(name, mailer):
     result = _dsl.dsl_ode_action_capture_mailer_remove(name, mailer)
     return int(result)
 
+##
+## dsl_ode_action_capture_object_best_shot_get()
+##
+_dsl.dsl_ode_action_capture_object_best_shot_get.argtypes = [c_wchar_p, 
+    POINTER(c_bool), POINTER(c_uint), POINTER(c_uint), POINTER(c_bool)]
+_dsl.dsl_ode_action_capture_object_best_shot_get.restype = c_uint
+def dsl_ode_action_capture_object_best_shot_get(name):
+    global _dsl
+    enabled = c_bool(0)
+    timeout = c_uint(0)
+    max_hold = c_uint(0)
+    sharpness = c_bool(0)
+    result = _dsl.dsl_ode_action_capture_object_best_shot_get(name, 
+        DSL_BOOL_P(enabled), DSL_UINT_P(timeout), DSL_UINT_P(max_hold), 
+        DSL_BOOL_P(sharpness))
+    return int(result), enabled.value, timeout.value, max_hold.value, sharpness.value
+
+##
+## dsl_ode_action_capture_object_best_shot_set()
+##
+_dsl.dsl_ode_action_capture_object_best_shot_set.argtypes = [c_wchar_p, 
+    c_bool, c_uint, c_uint, c_bool]
+_dsl.dsl_ode_action_capture_object_best_shot_set.restype = c_uint
+def dsl_ode_action_capture_object_best_shot_set(name, 
+    enabled, timeout, max_hold, sharpness):
+    global _dsl
+    result = _dsl.dsl_ode_action_capture_object_best_shot_set(name, 
+        enabled, timeout, max_hold, sharpness)
+    return int(result)
+
+##
+## dsl_ode_action_capture_metrics_get()
+##
+_dsl.dsl_ode_action_capture_metrics_get.argtypes = [c_wchar_p, 
+    DSL_ODE_ACTION_CAPTURE_METRICS_P]
+_dsl.dsl_ode_action_capture_metrics_get.restype = c_uint
+def dsl_ode_action_capture_metrics_get(name):
+    global _dsl
+    metrics = dsl_ode_action_capture_metrics()
+    result =_dsl.dsl_ode_action_capture_metrics_get(name, 
+        DSL_ODE_ACTION_CAPTURE_METRICS_P(metrics))
+    return int(result), metrics
+
+##
+## dsl_ode_action_capture_metrics_clear()
+##
+_dsl.dsl_ode_action_capture_metrics_clear.argtypes = [c_wchar_p]
+_dsl.dsl_ode_action_capture_metrics_clear.restype = c_uint
+def dsl_ode_action_capture_metrics_clear(name):
+    global _dsl
+    result =_dsl.dsl_ode_action_capture_metrics_clear(name)
+    return int(result)
+
+##
+## dsl_ode_action_capture_websocket_topic_set()
+##
+_dsl.dsl_ode_action_capture_websocket_topic_set.argtypes = [c_wchar_p, c_wchar_p]
+_dsl.dsl_ode_action_capture_websocket_topic_set.restype = c_uint
+def dsl_ode_action_capture_websocket_topic_set(name, topic):
+    global _dsl
+    result = _dsl.dsl_ode_action_capture_websocket_topic_set(name, topic)
+    return int(result)
+
 ##
 ## dsl_ode_action_label_customize_new()
 ##
@@ -1345,6 +1651,16 @@ def dsl_ode_action_redact_new(name):
     result =_dsl.dsl_ode_action_redact_new(name)
     return int(result)
 
+##
+## dsl_ode_action_websocket_publish_new()
+##
+_dsl.dsl_ode_action_websocket_publish_new.argtypes = [c_wchar_p, c_wchar_p]
+_dsl.dsl_ode_action_websocket_publish_new.restype = c_uint
+def dsl_ode_action_websocket_publish_new(name, topic):
+    global _dsl
+    result =_dsl.dsl_ode_action_websocket_publish_new(name, topic)
+    return int(result)
+
 ##
 ## dsl_ode_action_sink_add_new()
 ##
@@ -1598,6 +1914,29 @@ def dsl_ode_action_enabled_state_change_listener_remove(client_listener):
     result = _dsl.dsl_ode_action_enabled_state_change_listener_remove(c_client_listener)
     return int(result)
 
+##
+## dsl_ode_action_async_metrics_get()
+##
+_dsl.dsl_ode_action_async_metrics_get.argtypes = [c_wchar_p, 
+    DSL_ODE_ACTION_ASYNC_METRICS_P]
+_dsl.dsl_ode_action_async_metrics_get.restype = c_uint
+def dsl_ode_action_async_metrics_get(name):
+    global _dsl
+    metrics = dsl_ode_action_async_metrics()
+    result =_dsl.dsl_ode_action_async_metrics_get(name, 
+        DSL_ODE_ACTION_ASYNC_METRICS_P(metrics))
+    return int(result), metrics
+
+##
+## dsl_ode_action_async_metrics_clear()
+##
+_dsl.dsl_ode_action_async_metrics_clear.argtypes = [c_wchar_p]
+_dsl.dsl_ode_action_async_metrics_clear.restype = c_uint
+def dsl_ode_action_async_metrics_clear(name):
+    global _dsl
+    result =_dsl.dsl_ode_action_async_metrics_clear(name)
+    return int(result)
+
 
 ##
 ## dsl_ode_action_delete()
@@ -1797,6 +2136,79 @@ def dsl_ode_trigger_custom_new(name,
         source, class_id, limit, checker_cb, processor_cb, c_client_data)
     return int(result)
 
+##
+## dsl_ode_trigger_custom_batch_new()
+##
+_dsl.dsl_ode_trigger_custom_batch_new.argtypes = [c_wchar_p, c_wchar_p, 
+    c_uint, c_uint, DSL_ODE_CHECK_FOR_OCCURRENCE_BATCH, c_void_p]
+_dsl.dsl_ode_trigger_custom_batch_new.restype = c_uint
+def dsl_ode_trigger_custom_batch_new(name, 
+    source, class_id, limit, client_checker, client_data):
+    global _dsl
+    
+    # The client_checker is called with the frame's object records - as a NumPy
+    # structured array if NumPy is available, a ctypes array otherwise - and 
+    # returns either a boolean mask or an array of indices of triggered objects.
+    # A mask of the wrong length, or an index out of range, is reported and 
+    # results in no occurrence as an exception can't be raised to the caller.
+    def flags_error(message):
+        print('dsl_ode_trigger_custom_batch_new:', name, 
+            'client_checker returned', message, '- no occurrence')
+        return 0
+        
+    def batch_checker(records, count, results, c_client_data):
+        if np is not None:
+            record_array = np.frombuffer((c_char * (count * 
+                sizeof(dsl_ode_object_record))).from_address(records),
+                dtype=DSL_ODE_OBJECT_RECORD_DTYPE)
+            result_array = np.frombuffer(
+                (c_uint8 * count).from_address(results), dtype=np.uint8)
+            flags = client_checker(record_array, client_data)
+            if flags is None:
+                return 0
+            flags = np.asarray(flags)
+            if flags.dtype == np.bool_:
+                if flags.shape != (count,):
+                    return flags_error('a mask of shape ' + str(flags.shape) + 
+                        ' for ' + str(count) + ' records')
+                result_array[:] = flags
+            elif flags.size:
+                if flags.ndim != 1 or \
+                    not np.issubdtype(flags.dtype, np.integer) or \
+                    flags.min() < 0 or flags.max() >= count:
+                    return flags_error('invalid indices ' + str(flags) + 
+                        ' for ' + str(count) + ' records')
+                result_array[flags] = 1
+            return int(np.count_nonzero(result_array))
+
+        record_array = (dsl_ode_object_record * count).from_address(records)
+        result_array = (c_uint8 * count).from_address(results)
+        flags = client_checker(record_array, client_data)
+        if flags is None:
+            return 0
+        flags = list(flags)
+        if flags and all(isinstance(flag, bool) for flag in flags):
+            if len(flags) != count:
+                return flags_error('a mask of length ' + str(len(flags)) + 
+                    ' for ' + str(count) + ' records')
+            for i, flag in enumerate(flags):
+                result_array[i] = int(flag)
+        else:
+            if not all(isinstance(i, int) and 0 <= i < count for i in flags):
+                return flags_error('invalid indices ' + str(flags) + 
+                    ' for ' + str(count) + ' records')
+            for i in flags:
+                result_array[i] = 1
+        return sum(result_array)
+        
+    checker_cb = DSL_ODE_CHECK_FOR_OCCURRENCE_BATCH(batch_checker)
+    callbacks.append(checker_cb)
+    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
+    clientdata.append(c_client_data)
+    result = _dsl.dsl_ode_trigger_custom_batch_new(name, 
+        source, class_id, limit, checker_cb, c_client_data)
+    return int(result)
+
 ##
 ## dsl_ode_trigger_intersection_new()
 ##
@@ -2993,6 +3405,58 @@ def dsl_pph_ode_display_meta_alloc_size_set(name, size):
     result =_dsl.dsl_pph_ode_display_meta_alloc_size_set(name, size)
     return int(result)
 
+##
+## dsl_pph_ode_frame_workers_get()
+##
+_dsl.dsl_pph_ode_frame_workers_get.argtypes = [c_wchar_p, POINTER(c_uint)]
+_dsl.dsl_pph_ode_frame_workers_get.restype = c_uint
+def dsl_pph_ode_frame_workers_get(name):
+    global _dsl
+    workers = c_uint(0)
+    result =_dsl.dsl_pph_ode_frame_workers_get(name, DSL_UINT_P(workers))
+    return int(result), workers.value
+
+##
+## dsl_pph_ode_frame_workers_set()
+##
+_dsl.dsl_pph_ode_frame_workers_set.argtypes = [c_wchar_p, c_uint]
+_dsl.dsl_pph_ode_frame_workers_set.restype = c_uint
+def dsl_pph_ode_frame_workers_set(name, workers):
+    global _dsl
+    result =_dsl.dsl_pph_ode_frame_workers_set(name, workers)
+    return int(result)
+
+##
+## dsl_pph_ode_replay()
+##
+_dsl.dsl_pph_ode_replay.argtypes = [c_wchar_p, c_wchar_p, DSL_UINT64_P]
+_dsl.dsl_pph_ode_replay.restype = c_uint
+def dsl_pph_ode_replay(name, file_path):
+    global _dsl
+    frames = c_uint64(0)
+    result =_dsl.dsl_pph_ode_replay(name, file_path, DSL_UINT64_P(frames))
+    return int(result), frames.value
+
+##
+## dsl_pph_meta_recorder_new()
+##
+_dsl.dsl_pph_meta_recorder_new.argtypes = [c_wchar_p, c_wchar_p]
+_dsl.dsl_pph_meta_recorder_new.restype = c_uint
+def dsl_pph_meta_recorder_new(name, file_path):
+    global _dsl
+    result =_dsl.dsl_pph_meta_recorder_new(name, file_path)
+    return int(result)
+
+##
+## dsl_pph_meta_publisher_new()
+##
+_dsl.dsl_pph_meta_publisher_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_uint]
+_dsl.dsl_pph_meta_publisher_new.restype = c_uint
+def dsl_pph_meta_publisher_new(name, shm_name, slot_count, max_objects):
+    global _dsl
+    result =_dsl.dsl_pph_meta_publisher_new(name, shm_name, slot_count, max_objects)
+    return int(result)
+
 ##
 ## dsl_pph_custom_new()
 ##
@@ -3007,6 +3471,78 @@ def dsl_pph_custom_new(name, client_handler, client_data):
     result =_dsl.dsl_pph_custom_new(name, client_handler_cb, c_client_data)
     return int(result)
 
+##
+## dsl_pph_custom_async_enabled_get()
+##
+_dsl.dsl_pph_custom_async_enabled_get.argtypes = [c_wchar_p, POINTER(c_bool)]
+_dsl.dsl_pph_custom_async_enabled_get.restype = c_uint
+def dsl_pph_custom_async_enabled_get(name):
+    global _dsl
+    enabled = c_bool(0)
+    result =_dsl.dsl_pph_custom_async_enabled_get(name, DSL_BOOL_P(enabled))
+    return int(result), enabled.value
+
+##
+## dsl_pph_custom_async_enabled_set()
+##
+_dsl.dsl_pph_custom_async_enabled_set.argtypes = [c_wchar_p, c_bool]
+_dsl.dsl_pph_custom_async_enabled_set.restype = c_uint
+def dsl_pph_custom_async_enabled_set(name, enabled):
+    global _dsl
+    result =_dsl.dsl_pph_custom_async_enabled_set(name, enabled)
+    return int(result)
+
+##
+## dsl_pph_custom_async_queue_settings_get()
+##
+_dsl.dsl_pph_custom_async_queue_settings_get.argtypes = [c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint), POINTER(c_uint)]
+_dsl.dsl_pph_custom_async_queue_settings_get.restype = c_uint
+def dsl_pph_custom_async_queue_settings_get(name):
+    global _dsl
+    max_size = c_uint(0)
+    policy = c_uint(0)
+    sample_interval = c_uint(0)
+    result =_dsl.dsl_pph_custom_async_queue_settings_get(name, 
+        DSL_UINT_P(max_size), DSL_UINT_P(policy), DSL_UINT_P(sample_interval))
+    return int(result), max_size.value, policy.value, sample_interval.value
+
+##
+## dsl_pph_custom_async_queue_settings_set()
+##
+_dsl.dsl_pph_custom_async_queue_settings_set.argtypes = [c_wchar_p, 
+    c_uint, c_uint, c_uint]
+_dsl.dsl_pph_custom_async_queue_settings_set.restype = c_uint
+def dsl_pph_custom_async_queue_settings_set(name, 
+    max_size, policy, sample_interval):
+    global _dsl
+    result =_dsl.dsl_pph_custom_async_queue_settings_set(name, 
+        max_size, policy, sample_interval)
+    return int(result)
+
+##
+## dsl_pph_custom_async_metrics_get()
+##
+_dsl.dsl_pph_custom_async_metrics_get.argtypes = [c_wchar_p, 
+    DSL_PPH_CUSTOM_ASYNC_METRICS_P]
+_dsl.dsl_pph_custom_async_metrics_get.restype = c_uint
+def dsl_pph_custom_async_metrics_get(name):
+    global _dsl
+    metrics = dsl_pph_custom_async_metrics()
+    result =_dsl.dsl_pph_custom_async_metrics_get(name, 
+        DSL_PPH_CUSTOM_ASYNC_METRICS_P(metrics))
+    return int(result), metrics
+
+##
+## dsl_pph_custom_async_metrics_clear()
+##
+_dsl.dsl_pph_custom_async_metrics_clear.argtypes = [c_wchar_p]
+_dsl.dsl_pph_custom_async_metrics_clear.restype = c_uint
+def dsl_pph_custom_async_metrics_clear(name):
+    global _dsl
+    result =_dsl.dsl_pph_custom_async_metrics_clear(name)
+    return int(result)
+
 ##
 ## dsl_pph_meter_new()
 ##
@@ -4257,6 +4793,59 @@ def dsl_source_video_buffer_out_frame_rate_set(name, fps_n, fps_d):
         fps_n, fps_d)
     return int(result)
 
+##
+## dsl_source_video_decimation_frame_rate_get()
+##
+_dsl.dsl_source_video_decimation_frame_rate_get.argtypes = [c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)]
+_dsl.dsl_source_video_decimation_frame_rate_get.restype = c_uint
+def dsl_source_video_decimation_frame_rate_get(name):
+    global _dsl
+    fps_n = c_uint(0)
+    fps_d = c_uint(0)
+    result = _dsl.dsl_source_video_decimation_frame_rate_get(name, 
+        DSL_UINT_P(fps_n), DSL_UINT_P(fps_d))
+    return int(result), fps_n.value, fps_d.value 
+
+##
+## dsl_source_video_decimation_frame_rate_set()
+##
+_dsl.dsl_source_video_decimation_frame_rate_set.argtypes = [c_wchar_p, 
+    c_uint, c_uint]
+_dsl.dsl_source_video_decimation_frame_rate_set.restype = c_uint
+def dsl_source_video_decimation_frame_rate_set(name, fps_n, fps_d):
+    global _dsl
+    result = _dsl.dsl_source_video_decimation_frame_rate_set(name, 
+        fps_n, fps_d)
+    return int(result)
+
+##
+## dsl_source_video_decimation_stats_get()
+##
+_dsl.dsl_source_video_decimation_stats_get.argtypes = [c_wchar_p, 
+    POINTER(c_uint64), POINTER(c_uint64), POINTER(c_uint64)]
+_dsl.dsl_source_video_decimation_stats_get.restype = c_uint
+def dsl_source_video_decimation_stats_get(name):
+    global _dsl
+    frames_passed = c_uint64(0)
+    frames_dropped = c_uint64(0)
+    frames_dropped_pre_decode = c_uint64(0)
+    result = _dsl.dsl_source_video_decimation_stats_get(name, 
+        DSL_UINT64_P(frames_passed), DSL_UINT64_P(frames_dropped), 
+        DSL_UINT64_P(frames_dropped_pre_decode))
+    return (int(result), frames_passed.value, frames_dropped.value, 
+        frames_dropped_pre_decode.value)
+
+##
+## dsl_source_video_decimation_stats_clear()
+##
+_dsl.dsl_source_video_decimation_stats_clear.argtypes = [c_wchar_p]
+_dsl.dsl_source_video_decimation_stats_clear.restype = c_uint
+def dsl_source_video_decimation_stats_clear(name):
+    global _dsl
+    result = _dsl.dsl_source_video_decimation_stats_clear(name)
+    return int(result)
+
 ##
 ## dsl_source_video_buffer_out_crop_rectangle_get()
 ##
@@ -5610,6 +6199,52 @@ def dsl_tee_blocking_timeout_set(name, timeout):
     result = _dsl.dsl_tee_blocking_timeout_set(name, timeout)
     return int(result)
 
+##
+## dsl_tee_branch_ops_apply()
+##
+_dsl.dsl_tee_branch_ops_apply.argtypes = [c_wchar_p, 
+    POINTER(dsl_tee_branch_op), c_uint, DSL_TEE_BRANCH_OP_RESULT_P]
+_dsl.dsl_tee_branch_ops_apply.restype = c_uint
+def dsl_tee_branch_ops_apply(name, ops):
+    global _dsl
+    
+    # list form [(op, branch), (op, branch, stream_id), ...]
+    arr = (dsl_tee_branch_op * len(ops))()
+    for i, op in enumerate(ops):
+        arr[i].op = op[0]
+        arr[i].branch = op[1]
+        arr[i].stream_id = op[2] if len(op) > 2 else DSL_TEE_BRANCH_ANY_STREAM
+        
+    results = (dsl_tee_branch_op_result * len(ops))()
+    result = _dsl.dsl_tee_branch_ops_apply(name, arr, len(ops), results)
+    return int(result), results
+
+##
+## dsl_tee_branch_ops_apply_async()
+##
+_dsl.dsl_tee_branch_ops_apply_async.argtypes = [c_wchar_p, 
+    POINTER(dsl_tee_branch_op), c_uint, DSL_TEE_BRANCH_OPS_COMPLETE_LISTENER, 
+    c_void_p]
+_dsl.dsl_tee_branch_ops_apply_async.restype = c_uint
+def dsl_tee_branch_ops_apply_async(name, ops, client_listener, client_data):
+    global _dsl
+    
+    # list form [(op, branch), (op, branch, stream_id), ...]
+    arr = (dsl_tee_branch_op * len(ops))()
+    for i, op in enumerate(ops):
+        arr[i].op = op[0]
+        arr[i].branch = op[1]
+        arr[i].stream_id = op[2] if len(op) > 2 else DSL_TEE_BRANCH_ANY_STREAM
+
+    c_client_listener = DSL_TEE_BRANCH_OPS_COMPLETE_LISTENER(client_listener) \
+        if client_listener else DSL_TEE_BRANCH_OPS_COMPLETE_LISTENER()
+    callbacks.append(c_client_listener)
+    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
+    clientdata.append(c_client_data)
+    result = _dsl.dsl_tee_branch_ops_apply_async(name, arr, len(ops), 
+        c_client_listener, c_client_data)
+    return int(result)
+
 ##
 ## dsl_tee_pph_add()
 ##
@@ -7197,6 +7832,71 @@ def dsl_sink_frame_capture_schedule(name, frame_number):
     global _dsl
     result =_dsl.dsl_sink_frame_capture_schedule(name, frame_number)
     return int(result)
+
+##
+## dsl_sink_frame_capture_ring_settings_get()
+##
+_dsl.dsl_sink_frame_capture_ring_settings_get.argtypes = [c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint), POINTER(c_uint64)]
+_dsl.dsl_sink_frame_capture_ring_settings_get.restype = c_uint
+def dsl_sink_frame_capture_ring_settings_get(name):
+    global _dsl
+    width = c_uint(0)
+    duration = c_uint(0)
+    max_size = c_uint64(0)
+    result =_dsl.dsl_sink_frame_capture_ring_settings_get(name, 
+        DSL_UINT_P(width), DSL_UINT_P(duration), DSL_UINT64_P(max_size))
+    return int(result), width.value, duration.value, max_size.value
+
+##
+## dsl_sink_frame_capture_ring_settings_set()
+##
+_dsl.dsl_sink_frame_capture_ring_settings_set.argtypes = [c_wchar_p, 
+    c_uint, c_uint, c_uint64]
+_dsl.dsl_sink_frame_capture_ring_settings_set.restype = c_uint
+def dsl_sink_frame_capture_ring_settings_set(name, width, duration, max_size):
+    global _dsl
+    result =_dsl.dsl_sink_frame_capture_ring_settings_set(name, 
+        width, duration, max_size)
+    return int(result)
+
+##
+## dsl_sink_frame_capture_ring_size_get()
+##
+_dsl.dsl_sink_frame_capture_ring_size_get.argtypes = [c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint64)]
+_dsl.dsl_sink_frame_capture_ring_size_get.restype = c_uint
+def dsl_sink_frame_capture_ring_size_get(name):
+    global _dsl
+    frames = c_uint(0)
+    size = c_uint64(0)
+    result =_dsl.dsl_sink_frame_capture_ring_size_get(name, 
+        DSL_UINT_P(frames), DSL_UINT64_P(size))
+    return int(result), frames.value, size.value
+
+##
+## dsl_sink_frame_capture_ring_initiate()
+##
+_dsl.dsl_sink_frame_capture_ring_initiate.argtypes = [c_wchar_p, c_uint64]
+_dsl.dsl_sink_frame_capture_ring_initiate.restype = c_uint
+def dsl_sink_frame_capture_ring_initiate(name, timestamp):
+    global _dsl
+    result =_dsl.dsl_sink_frame_capture_ring_initiate(name, timestamp)
+    return int(result)
+
+##
+## dsl_sink_frame_capture_ring_initiate_range()
+##
+_dsl.dsl_sink_frame_capture_ring_initiate_range.argtypes = [c_wchar_p, 
+    c_uint64, c_uint64, POINTER(c_uint)]
+_dsl.dsl_sink_frame_capture_ring_initiate_range.restype = c_uint
+def dsl_sink_frame_capture_ring_initiate_range(name, 
+    start_timestamp, end_timestamp):
+    global _dsl
+    count = c_uint(0)
+    result =_dsl.dsl_sink_frame_capture_ring_initiate_range(name, 
+        start_timestamp, end_timestamp, DSL_UINT_P(count))
+    return int(result), count.value
     
 ##
 ## dsl_sink_sync_enabled_get()
@@ -7350,6 +8050,51 @@ def dsl_websocket_server_client_listener_remove(client_listener):
     result = _dsl.dsl_websocket_server_client_listener_remove(c_client_listener)
     return int(result)
 
+##
+## dsl_websocket_server_topic_add()
+##
+_dsl.dsl_websocket_server_topic_add.argtypes = [c_wchar_p, 
+    c_uint, c_uint, c_bool]
+_dsl.dsl_websocket_server_topic_add.restype = c_uint
+def dsl_websocket_server_topic_add(topic, max_queue_size, drop_policy, coalesce):
+    global _dsl
+    result = _dsl.dsl_websocket_server_topic_add(topic, 
+        max_queue_size, drop_policy, coalesce)
+    return int(result)
+
+##
+## dsl_websocket_server_topic_remove()
+##
+_dsl.dsl_websocket_server_topic_remove.argtypes = [c_wchar_p]
+_dsl.dsl_websocket_server_topic_remove.restype = c_uint
+def dsl_websocket_server_topic_remove(topic):
+    global _dsl
+    result = _dsl.dsl_websocket_server_topic_remove(topic)
+    return int(result)
+
+##
+## dsl_websocket_server_topic_publish()
+##
+_dsl.dsl_websocket_server_topic_publish.argtypes = [c_wchar_p, c_wchar_p]
+_dsl.dsl_websocket_server_topic_publish.restype = c_uint
+def dsl_websocket_server_topic_publish(topic, message):
+    global _dsl
+    result = _dsl.dsl_websocket_server_topic_publish(topic, message)
+    return int(result)
+
+##
+## dsl_websocket_server_topic_metrics_get()
+##
+_dsl.dsl_websocket_server_topic_metrics_get.argtypes = [c_wchar_p, 
+    DSL_WEBSOCKET_TOPIC_METRICS_P]
+_dsl.dsl_websocket_server_topic_metrics_get.restype = c_uint
+def dsl_websocket_server_topic_metrics_get(topic):
+    global _dsl
+    metrics = dsl_websocket_topic_metrics()
+    result = _dsl.dsl_websocket_server_topic_metrics_get(topic, 
+        DSL_WEBSOCKET_TOPIC_METRICS_P(metrics))
+    return int(result), metrics
+
 ##
 ## dsl_component_custom_new()
 ##
@@ -7637,6 +8382,67 @@ def dsl_component_queue_min_threshold_set_many(names, unit, min_threshold):
         unit, min_threshold)
     return int(result)
 
+##
+## dsl_component_queue_auto_size_get()
+##
+_dsl.dsl_component_queue_auto_size_get.argtypes = [c_wchar_p, 
+    c_uint, POINTER(c_uint64), POINTER(c_uint64)]
+_dsl.dsl_component_queue_auto_size_get.restype = c_uint
+def dsl_component_queue_auto_size_get(name, unit):
+    global _dsl
+    min_size = c_uint64(0)
+    max_size = c_uint64(0)
+    result = _dsl.dsl_component_queue_auto_size_get(name, 
+        unit, DSL_UINT64_P(min_size), DSL_UINT64_P(max_size))
+    return int(result), min_size.value, max_size.value
+
+##
+## dsl_component_queue_auto_size_set()
+##
+_dsl.dsl_component_queue_auto_size_set.argtypes = [c_wchar_p, 
+    c_uint, c_uint64, c_uint64]
+_dsl.dsl_component_queue_auto_size_set.restype = c_uint
+def dsl_component_queue_auto_size_set(name, unit, min_size, max_size):
+    global _dsl
+    result =_dsl.dsl_component_queue_auto_size_set(name, 
+        unit, min_size, max_size)
+    return int(result)
+
+##
+## dsl_component_queue_auto_size_set_many()
+##
+_dsl.dsl_component_queue_auto_size_set_many.restype = c_uint
+def dsl_component_queue_auto_size_set_many(names, unit, min_size, max_size):
+    global _dsl
+    arr = (c_wchar_p * len(names))()
+    arr[:] = names
+    result =_dsl.dsl_component_queue_auto_size_set_many(arr, 
+        c_uint(unit), c_uint64(min_size), c_uint64(max_size))
+    return int(result)
+
+##
+## dsl_component_queue_auto_leaky_enabled_get()
+##
+_dsl.dsl_component_queue_auto_leaky_enabled_get.argtypes = [c_wchar_p, 
+    POINTER(c_bool)]
+_dsl.dsl_component_queue_auto_leaky_enabled_get.restype = c_uint
+def dsl_component_queue_auto_leaky_enabled_get(name):
+    global _dsl
+    enabled = c_bool(0)
+    result = _dsl.dsl_component_queue_auto_leaky_enabled_get(name, 
+        DSL_BOOL_P(enabled))
+    return int(result), enabled.value
+
+##
+## dsl_component_queue_auto_leaky_enabled_set()
+##
+_dsl.dsl_component_queue_auto_leaky_enabled_set.argtypes = [c_wchar_p, c_bool]
+_dsl.dsl_component_queue_auto_leaky_enabled_set.restype = c_uint
+def dsl_component_queue_auto_leaky_enabled_set(name, enabled):
+    global _dsl
+    result = _dsl.dsl_component_queue_auto_leaky_enabled_set(name, enabled)
+    return int(result)
+
 ##
 ## dsl_component_queue_overrun_listener_add()
 ##
@@ -7827,6 +8633,50 @@ def dsl_component_nvbuf_mem_type_set_many(components, type):
     result =_dsl.dsl_component_nvbuf_mem_type_set_many(arr, type)
     return int(result)
 
+##
+## dsl_component_property_batch_set()
+##
+_dsl.dsl_component_property_batch_set.argtypes = [POINTER(dsl_component_property),
+    c_uint, POINTER(c_uint)]
+_dsl.dsl_component_property_batch_set.restype = c_uint
+def dsl_component_property_batch_set(properties):
+    global _dsl
+    
+    # dict form {name: {property: value, ...}, ...} or
+    # list form [(name, property, value), ...]
+    if isinstance(properties, dict):
+        settings = [(name, property, value) 
+            for name, values in properties.items() 
+            for property, value in values.items()]
+    else:
+        settings = list(properties)
+
+    arr = (dsl_component_property * len(settings))()
+    for i, (name, property, value) in enumerate(settings):
+        arr[i].name = name
+        arr[i].property = property
+        
+        # bool must be tested before int as bool is a subclass of int
+        if isinstance(value, bool):
+            arr[i].type = DSL_COMPONENT_PROPERTY_TYPE_BOOLEAN
+            arr[i].boolean_value = value
+        elif isinstance(value, int) and value < 0:
+            arr[i].type = DSL_COMPONENT_PROPERTY_TYPE_INT
+            arr[i].int_value = value
+        elif isinstance(value, int):
+            arr[i].type = DSL_COMPONENT_PROPERTY_TYPE_UINT
+            arr[i].uint_value = value
+        elif isinstance(value, float):
+            arr[i].type = DSL_COMPONENT_PROPERTY_TYPE_FLOAT
+            arr[i].float_value = value
+        else:
+            arr[i].type = DSL_COMPONENT_PROPERTY_TYPE_STRING
+            arr[i].string_value = str(value)
+            
+    results = (c_uint * len(settings))()
+    result =_dsl.dsl_component_property_batch_set(arr, len(settings), results)
+    return int(result), [int(r) for r in results]
+
 ##
 ## dsl_branch_new()
 ##
@@ -8443,6 +9293,146 @@ def dsl_pipeline_main_loop_delete(name):
     result =_dsl.dsl_pipeline_main_loop_delete(name)
     return int(result)
 
+##
+## dsl_pipeline_time_to_first_frame_get()
+##
+_dsl.dsl_pipeline_time_to_first_frame_get.argtypes = [c_wchar_p, 
+    POINTER(c_double)]
+_dsl.dsl_pipeline_time_to_first_frame_get.restype = c_uint
+def dsl_pipeline_time_to_first_frame_get(name):
+    global _dsl
+    time_to_first_frame = c_double(0)
+    result = _dsl.dsl_pipeline_time_to_first_frame_get(name, 
+        DSL_DOUBLE_P(time_to_first_frame))
+    return int(result), time_to_first_frame.value
+
+##
+## dsl_pipeline_startup_profile_get()
+##
+_dsl.dsl_pipeline_startup_profile_get.argtypes = [c_wchar_p, 
+    DSL_PIPELINE_STARTUP_PROFILE_P, POINTER(DSL_PIPELINE_STARTUP_EVENT_P), 
+    POINTER(c_uint)]
+_dsl.dsl_pipeline_startup_profile_get.restype = c_uint
+def dsl_pipeline_startup_profile_get(name):
+    global _dsl
+    profile = dsl_pipeline_startup_profile()
+    events = DSL_PIPELINE_STARTUP_EVENT_P()
+    size = c_uint(0)
+    result = _dsl.dsl_pipeline_startup_profile_get(name, 
+        DSL_PIPELINE_STARTUP_PROFILE_P(profile), byref(events), DSL_UINT_P(size))
+        
+    # copy the summary and each event to a dictionary as the names and the 
+    # array are owned and reused by the Pipeline
+    profile_dict = {field[0]: getattr(profile, field[0]) 
+        for field in dsl_pipeline_startup_profile._fields_}
+    event_list = []
+    for i in range(size.value):
+        event_list.append({field[0]: getattr(events[i], field[0]) 
+            for field in dsl_pipeline_startup_event._fields_})
+    return int(result), profile_dict, event_list
+
+##
+## dsl_pipeline_pool_new()
+##
+#_dsl.dsl_pipeline_pool_new.argtypes = [c_wchar_p, ??, c_uint, c_bool]
+_dsl.dsl_pipeline_pool_new.restype = c_uint
+def dsl_pipeline_pool_new(name, pipelines, standby_state, is_live):
+    global _dsl
+    arr = (c_wchar_p * len(pipelines))()
+    arr[:] = pipelines
+    result = _dsl.dsl_pipeline_pool_new(name, arr, 
+        c_uint(standby_state), c_bool(is_live))
+    return int(result)
+
+##
+## dsl_pipeline_pool_delete()
+##
+_dsl.dsl_pipeline_pool_delete.argtypes = [c_wchar_p]
+_dsl.dsl_pipeline_pool_delete.restype = c_uint
+def dsl_pipeline_pool_delete(name):
+    global _dsl
+    result = _dsl.dsl_pipeline_pool_delete(name)
+    return int(result)
+
+##
+## dsl_pipeline_pool_delete_all()
+##
+_dsl.dsl_pipeline_pool_delete_all.argtypes = []
+_dsl.dsl_pipeline_pool_delete_all.restype = c_uint
+def dsl_pipeline_pool_delete_all():
+    global _dsl
+    result = _dsl.dsl_pipeline_pool_delete_all()
+    return int(result)
+
+##
+## dsl_pipeline_pool_list_size()
+##
+_dsl.dsl_pipeline_pool_list_size.restype = c_uint
+def dsl_pipeline_pool_list_size():
+    global _dsl
+    result = _dsl.dsl_pipeline_pool_list_size()
+    return int(result)
+
+##
+## dsl_pipeline_pool_acquire()
+##
+#_dsl.dsl_pipeline_pool_acquire.argtypes = [c_wchar_p, ??, POINTER(c_wchar_p)]
+_dsl.dsl_pipeline_pool_acquire.restype = c_uint
+def dsl_pipeline_pool_acquire(name, sources):
+    global _dsl
+    arr = (c_wchar_p * len(sources))()
+    arr[:] = sources
+    pipeline = c_wchar_p(0)
+    result = _dsl.dsl_pipeline_pool_acquire(name, arr, DSL_WCHAR_PP(pipeline))
+    return int(result), pipeline.value 
+
+##
+## dsl_pipeline_pool_release()
+##
+_dsl.dsl_pipeline_pool_release.argtypes = [c_wchar_p, c_wchar_p]
+_dsl.dsl_pipeline_pool_release.restype = c_uint
+def dsl_pipeline_pool_release(name, pipeline):
+    global _dsl
+    result = _dsl.dsl_pipeline_pool_release(name, pipeline)
+    return int(result)
+
+##
+## dsl_pipeline_pool_size_get()
+##
+_dsl.dsl_pipeline_pool_size_get.argtypes = [c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)]
+_dsl.dsl_pipeline_pool_size_get.restype = c_uint
+def dsl_pipeline_pool_size_get(name):
+    global _dsl
+    size = c_uint(0)
+    available = c_uint(0)
+    result = _dsl.dsl_pipeline_pool_size_get(name, 
+        DSL_UINT_P(size), DSL_UINT_P(available))
+    return int(result), size.value, available.value
+
+##
+## dsl_pipeline_pool_metrics_get()
+##
+_dsl.dsl_pipeline_pool_metrics_get.argtypes = [c_wchar_p, 
+    DSL_PIPELINE_POOL_METRICS_P]
+_dsl.dsl_pipeline_pool_metrics_get.restype = c_uint
+def dsl_pipeline_pool_metrics_get(name):
+    global _dsl
+    metrics = dsl_pipeline_pool_metrics()
+    result = _dsl.dsl_pipeline_pool_metrics_get(name, 
+        DSL_PIPELINE_POOL_METRICS_P(metrics))
+    return int(result), metrics
+
+##
+## dsl_pipeline_pool_metrics_clear()
+##
+_dsl.dsl_pipeline_pool_metrics_clear.argtypes = [c_wchar_p]
+_dsl.dsl_pipeline_pool_metrics_clear.restype = c_uint
+def dsl_pipeline_pool_metrics_clear(name):
+    global _dsl
+    result = _dsl.dsl_pipeline_pool_metrics_clear(name)
+    return int(result)
+
 ##
 ## dsl_pipeline_dump_to_dot()
 ##
@@ -8463,6 +9453,275 @@ def dsl_pipeline_dump_to_dot_with_ts(pipeline, filename):
     result =_dsl.dsl_pipeline_dump_to_dot_with_ts(pipeline, filename)
     return int(result)
 
+##
+## dsl_pipeline_queue_sampler_settings_get()
+##
+_dsl.dsl_pipeline_queue_sampler_settings_get.argtypes = [c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)]
+_dsl.dsl_pipeline_queue_sampler_settings_get.restype = c_uint
+def dsl_pipeline_queue_sampler_settings_get(name):
+    global _dsl
+    interval = c_uint(0)
+    window_size = c_uint(0)
+    result = _dsl.dsl_pipeline_queue_sampler_settings_get(name, 
+        DSL_UINT_P(interval), DSL_UINT_P(window_size))
+    return int(result), interval.value, window_size.value
+
+##
+## dsl_pipeline_queue_sampler_settings_set()
+##
+_dsl.dsl_pipeline_queue_sampler_settings_set.argtypes = [c_wchar_p, 
+    c_uint, c_uint]
+_dsl.dsl_pipeline_queue_sampler_settings_set.restype = c_uint
+def dsl_pipeline_queue_sampler_settings_set(name, interval, window_size):
+    global _dsl
+    result = _dsl.dsl_pipeline_queue_sampler_settings_set(name, 
+        interval, window_size)
+    return int(result)
+
+##
+## dsl_pipeline_queue_sampler_enabled_get()
+##
+_dsl.dsl_pipeline_queue_sampler_enabled_get.argtypes = [c_wchar_p, 
+    POINTER(c_bool)]
+_dsl.dsl_pipeline_queue_sampler_enabled_get.restype = c_uint
+def dsl_pipeline_queue_sampler_enabled_get(name):
+    global _dsl
+    enabled = c_bool(0)
+    result = _dsl.dsl_pipeline_queue_sampler_enabled_get(name, 
+        DSL_BOOL_P(enabled))
+    return int(result), enabled.value
+
+##
+## dsl_pipeline_queue_sampler_enabled_set()
+##
+_dsl.dsl_pipeline_queue_sampler_enabled_set.argtypes = [c_wchar_p, c_bool]
+_dsl.dsl_pipeline_queue_sampler_enabled_set.restype = c_uint
+def dsl_pipeline_queue_sampler_enabled_set(name, enabled):
+    global _dsl
+    result = _dsl.dsl_pipeline_queue_sampler_enabled_set(name, enabled)
+    return int(result)
+
+##
+## dsl_pipeline_queue_telemetry_get()
+##
+_dsl.dsl_pipeline_queue_telemetry_get.argtypes = [c_wchar_p, 
+    POINTER(DSL_QUEUE_TELEMETRY_P), POINTER(c_uint)]
+_dsl.dsl_pipeline_queue_telemetry_get.restype = c_uint
+def dsl_pipeline_queue_telemetry_get(name):
+    global _dsl
+    telemetry = DSL_QUEUE_TELEMETRY_P()
+    size = c_uint(0)
+    result = _dsl.dsl_pipeline_queue_telemetry_get(name, 
+        byref(telemetry), DSL_UINT_P(size))
+        
+    # copy each structure to a dictionary as the array, including the
+    # component names, is owned and reused by the Pipeline
+    telemetry_list = []
+    for i in range(size.value):
+        telemetry_list.append({field[0]: getattr(telemetry[i], field[0]) 
+            for field in dsl_queue_telemetry._fields_})
+    return int(result), telemetry_list
+
+##
+## dsl_pipeline_queue_telemetry_clear()
+##
+_dsl.dsl_pipeline_queue_telemetry_clear.argtypes = [c_wchar_p]
+_dsl.dsl_pipeline_queue_telemetry_clear.restype = c_uint
+def dsl_pipeline_queue_telemetry_clear(name):
+    global _dsl
+    result = _dsl.dsl_pipeline_queue_telemetry_clear(name)
+    return int(result)
+
+##
+## dsl_pipeline_queue_bottleneck_get()
+##
+_dsl.dsl_pipeline_queue_bottleneck_get.argtypes = [c_wchar_p, 
+    POINTER(c_wchar_p)]
+_dsl.dsl_pipeline_queue_bottleneck_get.restype = c_uint
+def dsl_pipeline_queue_bottleneck_get(name):
+    global _dsl
+    component = c_wchar_p(0)
+    result = _dsl.dsl_pipeline_queue_bottleneck_get(name, 
+        DSL_WCHAR_PP(component))
+    return int(result), component.value 
+
+##
+## dsl_pipeline_infer_interval_bounds_get()
+##
+_dsl.dsl_pipeline_infer_interval_bounds_get.argtypes = [c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)]
+_dsl.dsl_pipeline_infer_interval_bounds_get.restype = c_uint
+def dsl_pipeline_infer_interval_bounds_get(name):
+    global _dsl
+    min_interval = c_uint(0)
+    max_interval = c_uint(0)
+    result = _dsl.dsl_pipeline_infer_interval_bounds_get(name, 
+        DSL_UINT_P(min_interval), DSL_UINT_P(max_interval))
+    return int(result), min_interval.value, max_interval.value
+
+##
+## dsl_pipeline_infer_interval_bounds_set()
+##
+_dsl.dsl_pipeline_infer_interval_bounds_set.argtypes = [c_wchar_p, 
+    c_uint, c_uint]
+_dsl.dsl_pipeline_infer_interval_bounds_set.restype = c_uint
+def dsl_pipeline_infer_interval_bounds_set(name, min_interval, max_interval):
+    global _dsl
+    result = _dsl.dsl_pipeline_infer_interval_bounds_set(name, 
+        min_interval, max_interval)
+    return int(result)
+
+##
+## dsl_pipeline_infer_interval_thresholds_get()
+##
+_dsl.dsl_pipeline_infer_interval_thresholds_get.argtypes = [c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint), POINTER(c_uint), POINTER(c_uint)]
+_dsl.dsl_pipeline_infer_interval_thresholds_get.restype = c_uint
+def dsl_pipeline_infer_interval_thresholds_get(name):
+    global _dsl
+    low_occupancy = c_uint(0)
+    high_occupancy = c_uint(0)
+    max_latency = c_uint(0)
+    min_fps = c_uint(0)
+    result = _dsl.dsl_pipeline_infer_interval_thresholds_get(name, 
+        DSL_UINT_P(low_occupancy), DSL_UINT_P(high_occupancy), 
+        DSL_UINT_P(max_latency), DSL_UINT_P(min_fps))
+    return int(result), low_occupancy.value, high_occupancy.value, \
+        max_latency.value, min_fps.value
+
+##
+## dsl_pipeline_infer_interval_thresholds_set()
+##
+_dsl.dsl_pipeline_infer_interval_thresholds_set.argtypes = [c_wchar_p, 
+    c_uint, c_uint, c_uint, c_uint]
+_dsl.dsl_pipeline_infer_interval_thresholds_set.restype = c_uint
+def dsl_pipeline_infer_interval_thresholds_set(name, 
+    low_occupancy, high_occupancy, max_latency, min_fps):
+    global _dsl
+    result = _dsl.dsl_pipeline_infer_interval_thresholds_set(name, 
+        low_occupancy, high_occupancy, max_latency, min_fps)
+    return int(result)
+
+##
+## dsl_pipeline_infer_interval_hysteresis_get()
+##
+_dsl.dsl_pipeline_infer_interval_hysteresis_get.argtypes = [c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint), POINTER(c_uint)]
+_dsl.dsl_pipeline_infer_interval_hysteresis_get.restype = c_uint
+def dsl_pipeline_infer_interval_hysteresis_get(name):
+    global _dsl
+    update_interval = c_uint(0)
+    step_up_count = c_uint(0)
+    step_down_count = c_uint(0)
+    result = _dsl.dsl_pipeline_infer_interval_hysteresis_get(name, 
+        DSL_UINT_P(update_interval), DSL_UINT_P(step_up_count), 
+        DSL_UINT_P(step_down_count))
+    return int(result), update_interval.value, step_up_count.value, \
+        step_down_count.value
+
+##
+## dsl_pipeline_infer_interval_hysteresis_set()
+##
+_dsl.dsl_pipeline_infer_interval_hysteresis_set.argtypes = [c_wchar_p, 
+    c_uint, c_uint, c_uint]
+_dsl.dsl_pipeline_infer_interval_hysteresis_set.restype = c_uint
+def dsl_pipeline_infer_interval_hysteresis_set(name, 
+    update_interval, step_up_count, step_down_count):
+    global _dsl
+    result = _dsl.dsl_pipeline_infer_interval_hysteresis_set(name, 
+        update_interval, step_up_count, step_down_count)
+    return int(result)
+
+##
+## dsl_pipeline_infer_interval_controller_enabled_get()
+##
+_dsl.dsl_pipeline_infer_interval_controller_enabled_get.argtypes = [c_wchar_p, 
+    POINTER(c_bool)]
+_dsl.dsl_pipeline_infer_interval_controller_enabled_get.restype = c_uint
+def dsl_pipeline_infer_interval_controller_enabled_get(name):
+    global _dsl
+    enabled = c_bool(0)
+    result = _dsl.dsl_pipeline_infer_interval_controller_enabled_get(name, 
+        DSL_BOOL_P(enabled))
+    return int(result), enabled.value
+
+##
+## dsl_pipeline_infer_interval_controller_enabled_set()
+##
+_dsl.dsl_pipeline_infer_interval_controller_enabled_set.argtypes = [c_wchar_p, 
+    c_bool]
+_dsl.dsl_pipeline_infer_interval_controller_enabled_set.restype = c_uint
+def dsl_pipeline_infer_interval_controller_enabled_set(name, enabled):
+    global _dsl
+    result = _dsl.dsl_pipeline_infer_interval_controller_enabled_set(name, 
+        enabled)
+    return int(result)
+
+##
+## dsl_pipeline_infer_interval_load_report()
+##
+_dsl.dsl_pipeline_infer_interval_load_report.argtypes = [c_wchar_p, 
+    c_double, c_uint]
+_dsl.dsl_pipeline_infer_interval_load_report.restype = c_uint
+def dsl_pipeline_infer_interval_load_report(name, fps, latency):
+    global _dsl
+    result = _dsl.dsl_pipeline_infer_interval_load_report(name, fps, latency)
+    return int(result)
+
+##
+## dsl_pipeline_infer_interval_metrics_get()
+##
+_dsl.dsl_pipeline_infer_interval_metrics_get.argtypes = [c_wchar_p, 
+    DSL_INFER_INTERVAL_METRICS_P]
+_dsl.dsl_pipeline_infer_interval_metrics_get.restype = c_uint
+def dsl_pipeline_infer_interval_metrics_get(name):
+    global _dsl
+    metrics = dsl_infer_interval_metrics()
+    result = _dsl.dsl_pipeline_infer_interval_metrics_get(name, 
+        DSL_INFER_INTERVAL_METRICS_P(metrics))
+    return int(result), metrics
+
+##
+## dsl_pipeline_infer_interval_metrics_clear()
+##
+_dsl.dsl_pipeline_infer_interval_metrics_clear.argtypes = [c_wchar_p]
+_dsl.dsl_pipeline_infer_interval_metrics_clear.restype = c_uint
+def dsl_pipeline_infer_interval_metrics_clear(name):
+    global _dsl
+    result = _dsl.dsl_pipeline_infer_interval_metrics_clear(name)
+    return int(result)
+
+##
+## dsl_pipeline_infer_interval_change_listener_add()
+##
+_dsl.dsl_pipeline_infer_interval_change_listener_add.argtypes = [c_wchar_p, 
+    DSL_INFER_INTERVAL_CHANGE_LISTENER, c_void_p]
+_dsl.dsl_pipeline_infer_interval_change_listener_add.restype = c_uint
+def dsl_pipeline_infer_interval_change_listener_add(name, 
+    client_listener, client_data):
+    global _dsl
+    c_client_listener = DSL_INFER_INTERVAL_CHANGE_LISTENER(client_listener)
+    callbacks.append(c_client_listener)
+    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
+    clientdata.append(c_client_data)
+    result = _dsl.dsl_pipeline_infer_interval_change_listener_add(name, 
+        c_client_listener, c_client_data)
+    return int(result)
+    
+##
+## dsl_pipeline_infer_interval_change_listener_remove()
+##
+_dsl.dsl_pipeline_infer_interval_change_listener_remove.argtypes = [c_wchar_p, 
+    DSL_INFER_INTERVAL_CHANGE_LISTENER]
+_dsl.dsl_pipeline_infer_interval_change_listener_remove.restype = c_uint
+def dsl_pipeline_infer_interval_change_listener_remove(name, client_listener):
+    global _dsl
+    c_client_listener = DSL_INFER_INTERVAL_CHANGE_LISTENER(client_listener)
+    result = _dsl.dsl_pipeline_infer_interval_change_listener_remove(name, 
+        c_client_listener)
+    return int(result)
+
 ##
 ## dsl_pipeline_state_change_listener_add()
 ##
@@ -9294,3 +10553,24 @@ def dsl_info_log_function_restore():
     global _dsl
     result = _dsl.dsl_info_log_function_restore()
     return int(result)
+
+##
+## dsl_info_stalled_sources_get()
+##
+_dsl.dsl_info_stalled_sources_get.argtypes = [POINTER(DSL_STALLED_SOURCE_P), 
+    POINTER(c_uint)]
+_dsl.dsl_info_stalled_sources_get.restype = c_uint
+def dsl_info_stalled_sources_get():
+    global _dsl
+    sources = DSL_STALLED_SOURCE_P()
+    size = c_uint(0)
+    result = _dsl.dsl_info_stalled_sources_get(byref(sources), 
+        DSL_UINT_P(size))
+        
+    # copy each structure to a dictionary as the array, including the
+    # names, is owned and reused by the Stall Watchdog
+    source_list = []
+    for i in range(size.value):
+        source_list.append({field[0]: getattr(sources[i], field[0]) 
+            for field in dsl_stalled_source._fields_})
+    return int(result), source_list
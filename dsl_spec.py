@@ -0,0 +1,672 @@
+################################################################################
+# The MIT License
+#
+# Copyright (c)  2019-2024, Prominence AI, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+################################################################################
+
+################################################################################
+#
+# Declarative Pipeline Spec Loader for dsl.py
+#
+# Builds one or more Pipelines -- with their Sources, Inference Components,
+# Trackers, ODE graphs, Sinks, Branches, and Tees -- from a single JSON or YAML
+# description with one call to dsl_spec_load().
+#
+#  - every object is described by its unique name, its type, and the keyword
+#    parameters of its dsl.py constructor; e.g. {"name": "uri-source-1",
+#    "type": "source_uri", "uri": "...", "is_live": false, ...} is constructed
+#    with dsl_source_uri_new(). Each section below maps its types to the
+#    constructors dsl_<prefix><type>_new().
+#  - the whole spec is validated before any object is created; constructors
+#    and their parameters, name uniqueness, all references between objects,
+#    single use of each child, Branch/Tee cycles, and all config files.
+#  - config files are parsed once and cached -- by path, size, and mtime --
+#    across specs and Pipelines. The files referenced by infer config files
+#    are validated as well. The cache only speeds up validation; each
+#    component still reads and parses its own config files when constructed.
+#  - independent objects are constructed in parallel, stage by stage, with a
+#    pool of threads. On any failure, all objects created are deleted.
+#  - a report with per-stage construction timings is returned on success.
+#
+# Spec sections, in order of construction:
+#
+#  "display_types" - dsl_display_type_<type>_new()
+#  "ode_areas"     - dsl_ode_area_<type>_new()
+#  "ode_actions"   - dsl_ode_action_<type>_new()
+#  "ode_triggers"  - dsl_ode_trigger_<type>_new(), "actions": [...], "areas": [...]
+#  "pphs"          - dsl_pph_<type>_new(), "triggers": [...]
+#  "gst_elements"  - dsl_gst_element_new(), "factory_name": "..."
+#  "components"    - dsl_<type>_new(), "elements": [...], "pph_add": [...]
+#  "branches"      - dsl_branch_new_component_add_many(), "components": [...]
+#  "components"    - Tees and Remuxers, "branches": [...]
+#  "pipelines"     - dsl_pipeline_new_component_add_many(), "components": [...]
+#
+# All objects may also define:
+#
+#  "settings"   - {<key>: value, ...} applied with dsl_<type>_<key>_set(),
+#                 searched from the full type to the shortest type prefix;
+#                 e.g. "interval" for an "infer_gie_primary" calls
+#                 dsl_infer_interval_set(). A list value is passed as
+#                 positional arguments, a dict as keyword arguments.
+#  "properties" - {<property>: value, ...} for GST Elements and Components,
+#                 applied to all objects with one call to
+#                 dsl_component_property_batch_set().
+#
+# Parameter values that are strings naming a dsl.py constant, e.g.
+# "DSL_PAD_SRC", are replaced by the constant. Values of the form "@<key>" are
+# replaced by bindings[<key>] as passed to dsl_spec_load() -- used for client
+# handlers, listeners, and client data that can't be described in JSON.
+#
+################################################################################
+
+#!/usr/bin/env python
+
+import concurrent.futures
+import configparser
+import inspect
+import json
+import os
+import threading
+import time
+
+try:
+    import yaml
+    _YAML_ERRORS = (yaml.YAMLError,)
+except ImportError:
+    yaml = None
+    _YAML_ERRORS = ()
+
+import dsl
+
+DSL_SPEC_DEFAULT_MAX_WORKERS = 4
+
+DSL_SPEC_STAGE_VALIDATE = 'validate'
+DSL_SPEC_STAGE_DISPLAY_TYPES = 'display_types'
+DSL_SPEC_STAGE_ODE_AREAS = 'ode_areas'
+DSL_SPEC_STAGE_ODE_ACTIONS = 'ode_actions'
+DSL_SPEC_STAGE_ODE_TRIGGERS = 'ode_triggers'
+DSL_SPEC_STAGE_PPHS = 'pphs'
+DSL_SPEC_STAGE_GST_ELEMENTS = 'gst_elements'
+DSL_SPEC_STAGE_COMPONENTS = 'components'
+DSL_SPEC_STAGE_BRANCHES = 'branches'
+DSL_SPEC_STAGE_TEES = 'tees'
+DSL_SPEC_STAGE_PROPERTIES = 'properties'
+DSL_SPEC_STAGE_PIPELINES = 'pipelines'
+
+##
+# Exception raised when a spec fails to validate or construct. All
+# errors found are listed in errors.
+##
+class SpecError(ValueError):
+    def __init__(self, message, errors=None):
+        super().__init__(message)
+        self.errors = errors or []
+
+    def __str__(self):
+        return '\n  '.join([super().__str__()] + self.errors)
+
+##
+# Private definition of a spec section.
+# prefix - constructor prefix, the object's type is appended.
+# namespace - DSL container the object names must be unique in.
+# delete - service to delete an object on rollback.
+# lists - {key: (service suffix, referenced namespace)} for lists of
+#     objects added to the object with dsl_<type>_<suffix>(name, [...]).
+# stage - construction stage.
+##
+class _Section:
+    def __init__(self, key, prefix, namespace, delete, lists, stage):
+        self.key = key
+        self.prefix = prefix
+        self.namespace = namespace
+        self.delete = delete
+        self.lists = lists
+        self.stage = stage
+
+_SECTIONS = [
+    _Section('display_types', 'dsl_display_type_', 'display_types',
+        'dsl_display_type_delete', {}, DSL_SPEC_STAGE_DISPLAY_TYPES),
+    _Section('ode_areas', 'dsl_ode_area_', 'ode_areas',
+        'dsl_ode_area_delete', {}, DSL_SPEC_STAGE_ODE_AREAS),
+    _Section('ode_actions', 'dsl_ode_action_', 'ode_actions',
+        'dsl_ode_action_delete', {}, DSL_SPEC_STAGE_ODE_ACTIONS),
+    _Section('ode_triggers', 'dsl_ode_trigger_', 'ode_triggers',
+        'dsl_ode_trigger_delete',
+        {'actions': ('action_add_many', 'ode_actions'),
+        'areas': ('area_add_many', 'ode_areas')},
+        DSL_SPEC_STAGE_ODE_TRIGGERS),
+    _Section('pphs', 'dsl_pph_', 'pphs', 'dsl_pph_delete',
+        {'triggers': ('trigger_add_many', 'ode_triggers')},
+        DSL_SPEC_STAGE_PPHS),
+    _Section('gst_elements', 'dsl_gst_element', 'gst_elements',
+        'dsl_gst_element_delete', {}, DSL_SPEC_STAGE_GST_ELEMENTS),
+    _Section('components', 'dsl_', 'components', 'dsl_component_delete',
+        {'elements': ('element_add_many', 'gst_elements'),
+        'branches': ('branch_add_many', 'components')},
+        DSL_SPEC_STAGE_COMPONENTS),
+    _Section('branches', 'dsl_branch', 'components', 'dsl_component_delete',
+        {'components': (None, 'components')}, DSL_SPEC_STAGE_BRANCHES),
+    _Section('pipelines', 'dsl_pipeline', 'pipelines', 'dsl_pipeline_delete',
+        {'components': (None, 'components')}, DSL_SPEC_STAGE_PIPELINES),
+]
+
+# Keys that are not passed to an object's constructor.
+_RESERVED_KEYS = set(['name', 'type', 'settings', 'properties', 'pph_add',
+    'actions', 'areas', 'triggers', 'elements', 'branches', 'components'])
+
+# Files referenced by [property] in nvinfer config files.
+_INFER_CONFIG_FILE_KEYS = ['labelfile-path', 'onnx-file', 'tlt-encoded-model',
+    'model-file', 'proto-file', 'int8-calib-file', 'custom-lib-path']
+
+################################################################################
+# Config file cache
+################################################################################
+
+_g_config_cache = {}
+_g_config_cache_lock = threading.Lock()
+_g_config_cache_hits = 0
+_g_config_cache_misses = 0
+
+##
+# Parses a config file into a dictionary of sections, each a dictionary of
+# key/value pairs. Files that are not INI or YAML are returned as empty.
+# Raises SpecError if a YAML file is malformed.
+##
+def _config_file_parse(path):
+    if path.endswith(('.yml', '.yaml')):
+        if yaml is None:
+            return {}
+        with open(path) as config_file:
+            try:
+                config = yaml.safe_load(config_file)
+            except _YAML_ERRORS as e:
+                raise SpecError('Unable to parse config file ' + path,
+                    [repr(e)])
+        return config if isinstance(config, dict) else {}
+    parser = configparser.ConfigParser(strict=False, interpolation=None)
+    try:
+        parser.read(path)
+    except configparser.Error:
+        return {}
+    return dict((section, dict(parser.items(section)))
+        for section in parser.sections())
+
+##
+# Returns the parsed config file for path from the cache, parsing the file if
+# not cached or if the file has changed since cached. Raises OSError if the
+# file does not exist, and SpecError if it's malformed. The parsed result is
+# used for validation only, it is not passed to the components constructed.
+##
+def _config_file_get(path):
+    global _g_config_cache_hits, _g_config_cache_misses
+
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    key = (stat.st_size, stat.st_mtime_ns)
+    with _g_config_cache_lock:
+        entry = _g_config_cache.get(path)
+        if entry is not None and entry[0] == key:
+            _g_config_cache_hits += 1
+            return entry[1]
+        _g_config_cache_misses += 1
+    config = _config_file_parse(path)
+    with _g_config_cache_lock:
+        _g_config_cache[path] = (key, config)
+    return config
+
+##
+# Clears the config file cache.
+##
+def dsl_spec_config_cache_clear():
+    global _g_config_cache_hits, _g_config_cache_misses
+
+    with _g_config_cache_lock:
+        _g_config_cache.clear()
+        _g_config_cache_hits = 0
+        _g_config_cache_misses = 0
+
+##
+# Returns the current config file cache metrics as a dictionary of
+# 'files', 'hits', and 'misses'.
+##
+def dsl_spec_config_cache_metrics_get():
+    with _g_config_cache_lock:
+        return {'files': len(_g_config_cache), 'hits': _g_config_cache_hits,
+            'misses': _g_config_cache_misses}
+
+################################################################################
+# Validation
+################################################################################
+
+##
+# Private validated object ready to construct.
+##
+class _Object:
+    def __init__(self, section, entry):
+        self.section = section
+        self.entry = entry
+        self.name = entry.get('name')
+        self.type = entry.get('type')
+        self.constructor = None
+        self.service_prefix = None
+        self.kwargs = {}
+        self.lists = []
+        self.settings = []
+        self.pph_adds = []
+
+##
+# Loads a spec from a JSON or YAML file. Raises SpecError if the file can't be
+# read or is malformed.
+##
+def dsl_spec_file_load(path):
+    try:
+        with open(path) as spec_file:
+            if path.endswith(('.yml', '.yaml')):
+                if yaml is None:
+                    raise SpecError('PyYAML is required to load ' + path)
+                return yaml.safe_load(spec_file)
+            return json.load(spec_file)
+    except (OSError, ValueError) + _YAML_ERRORS as e:
+        if isinstance(e, SpecError):
+            raise
+        raise SpecError('Unable to load spec file ' + path, [repr(e)])
+
+##
+# Returns the dsl.py service for the longest prefix of service_prefix, e.g.
+# 'dsl_infer_gie_primary', followed by suffix. Returns None if not found.
+##
+def _service_find(service_prefix, suffix, fallback=None):
+    tokens = service_prefix.split('_')
+    for count in range(len(tokens), 1, -1):
+        service = getattr(dsl, '_'.join(tokens[:count] + [suffix]), None)
+        if callable(service):
+            return service
+    if fallback is not None:
+        return _service_find(fallback, suffix)
+    return None
+
+##
+# Resolves a parameter value, replacing dsl.py constant names and bindings.
+##
+def _value_resolve(value, bindings, errors, where):
+    if isinstance(value, list):
+        return [_value_resolve(item, bindings, errors, where) for item in value]
+    if not isinstance(value, str):
+        return value
+    if value.startswith('@'):
+        if value[1:] not in bindings:
+            errors.append(where + ': no binding for ' + value)
+            return None
+        return bindings[value[1:]]
+    if value.startswith('DSL_') and hasattr(dsl, value):
+        return getattr(dsl, value)
+    return value
+
+##
+# Validates a config file parameter, and for infer config files all files
+# referenced by the config file.
+##
+def _config_file_validate(key, path, errors, where):
+    if not isinstance(path, str) or not path:
+        return
+    try:
+        config = _config_file_get(path)
+    except OSError:
+        errors.append(where + ': ' + key + ' not found: ' + path)
+        return
+    except SpecError as e:
+        errors.append(where + ': ' + key + ' is malformed: ' + path)
+        errors.extend(e.errors)
+        return
+    if key != 'infer_config_file':
+        return
+    properties = config.get('property', {})
+    if not isinstance(properties, dict):
+        return
+    config_dir = os.path.dirname(os.path.abspath(path))
+    for file_key in _INFER_CONFIG_FILE_KEYS:
+        file_path = properties.get(file_key)
+        if not isinstance(file_path, str) or not file_path:
+            continue
+        if not os.path.isfile(os.path.join(config_dir, file_path)):
+            errors.append(where + ': ' + file_key + ' in ' + path
+                + ' not found: ' + file_path)
+
+##
+# Validates the constructor, parameters, settings, and pph-adds for a single
+# object.
+##
+def _object_validate(obj, bindings, errors):
+    section = obj.section
+    where = section.key + " '" + str(obj.name) + "'"
+
+    if section.key in ('gst_elements', 'branches', 'pipelines'):
+        obj.service_prefix = section.prefix
+        if section.key == 'gst_elements':
+            obj.constructor = dsl.dsl_gst_element_new
+        else:
+            obj.constructor = getattr(dsl, section.prefix
+                + '_new_component_add_many')
+    else:
+        if not isinstance(obj.type, str) or not obj.type:
+            errors.append(where + ': missing type')
+            return
+        obj.service_prefix = section.prefix + obj.type
+        obj.constructor = getattr(dsl, obj.service_prefix + '_new', None)
+        if not callable(obj.constructor):
+            errors.append(where + ': unknown type ' + obj.type)
+            return
+
+    obj.kwargs = dict((key, _value_resolve(value, bindings, errors, where))
+        for key, value in obj.entry.items() if key not in _RESERVED_KEYS)
+    if section.key in ('branches', 'pipelines'):
+        obj.kwargs['components'] = list(obj.entry.get('components', [])) + [None]
+    try:
+        inspect.signature(obj.constructor).bind(obj.name, **obj.kwargs)
+    except TypeError as e:
+        errors.append(where + ': invalid parameters: ' + str(e))
+    for key, value in obj.kwargs.items():
+        if key.endswith('config_file'):
+            _config_file_validate(key, value, errors, where)
+
+    # component settings fall back to the common component services,
+    # e.g. dsl_component_queue_leaky_set()
+    fallback = 'dsl_component' if section.key == 'components' else None
+
+    for key, value in obj.entry.get('settings', {}).items():
+        service = _service_find(obj.service_prefix, key + '_set', fallback)
+        if service is None:
+            errors.append(where + ': unknown setting ' + key)
+            continue
+        value = _value_resolve(value, bindings, errors, where)
+        if isinstance(value, dict):
+            obj.settings.append((service, [], value))
+        elif isinstance(value, list):
+            obj.settings.append((service, value, {}))
+        else:
+            obj.settings.append((service, [value], {}))
+        if key.endswith('config_file'):
+            _config_file_validate(key, value, errors, where)
+
+    for pph_add in obj.entry.get('pph_add', []):
+        service = _service_find(obj.service_prefix, 'pph_add')
+        if service is None:
+            errors.append(where + ': does not support pph_add')
+            break
+        pad = _value_resolve(pph_add.get('pad', dsl.DSL_PAD_SRC),
+            bindings, errors, where)
+        if pad == 'src':
+            pad = dsl.DSL_PAD_SRC
+        elif pad == 'sink':
+            pad = dsl.DSL_PAD_SINK
+        args = [pph_add.get('handler')]
+        if 'pad' in inspect.signature(service).parameters:
+            args.append(pad)
+        obj.pph_adds.append((service, args))
+
+    for key, (suffix, namespace) in section.lists.items():
+        if key not in obj.entry or suffix is None:
+            continue
+        service = _service_find(obj.service_prefix, suffix)
+        if service is None:
+            errors.append(where + ': does not support ' + key)
+            continue
+        obj.lists.append((key, service, list(obj.entry[key]) + [None]))
+
+##
+# Validates a complete spec. Returns a tuple of the list of errors found
+# and the dictionary of validated objects by section.
+##
+def _spec_validate(spec, bindings):
+    errors = []
+    objects = dict((section.key, []) for section in _SECTIONS)
+    names = dict((section.namespace, {}) for section in _SECTIONS)
+
+    if not isinstance(spec, dict):
+        return (['spec must be a dictionary of sections'], objects)
+
+    known = set(section.key for section in _SECTIONS)
+    for key in spec:
+        if key not in known:
+            errors.append('unknown section ' + str(key))
+
+    for section in _SECTIONS:
+        entries = spec.get(section.key, [])
+        if not isinstance(entries, list):
+            errors.append(section.key + ': must be a list')
+            continue
+        for entry in entries:
+            if not isinstance(entry, dict) or not isinstance(
+                entry.get('name'), str) or not entry['name']:
+                errors.append(section.key + ': every entry requires a name')
+                continue
+            obj = _Object(section, entry)
+            if obj.name in names[section.namespace]:
+                errors.append(section.key + " '" + obj.name
+                    + "': name is not unique")
+                continue
+            names[section.namespace][obj.name] = obj
+            _object_validate(obj, bindings, errors)
+            objects[section.key].append(obj)
+
+    # references, and single use of each child in a branch, tee, or pipeline.
+    used = {}
+    for section in _SECTIONS:
+        for obj in objects[section.key]:
+            where = section.key + " '" + obj.name + "'"
+            for key, (suffix, namespace) in section.lists.items():
+                for child in obj.entry.get(key, []):
+                    if child not in names[namespace]:
+                        errors.append(where + ': ' + key + " '" + str(child)
+                            + "' not found")
+                    elif namespace in ('components', 'gst_elements'):
+                        if (namespace, child) in used:
+                            errors.append(where + ': ' + namespace[:-1] + " '"
+                                + child + "' already used by '"
+                                + used[(namespace, child)] + "'")
+                        used[(namespace, child)] = obj.name
+            for pph_add in obj.entry.get('pph_add', []):
+                if pph_add.get('handler') not in names['pphs']:
+                    errors.append(where + ": pph '"
+                        + str(pph_add.get('handler')) + "' not found")
+
+    # Branch/Tee cycles
+    children = {}
+    for obj in objects['components'] + objects['branches']:
+        children[obj.name] = list(obj.entry.get('branches', [])) \
+            + list(obj.entry.get('components', []))
+    visiting = set()
+    visited = set()
+    def visit(name):
+        if name in visiting:
+            return True
+        if name in visited:
+            return False
+        visiting.add(name)
+        cycle = any(visit(child) for child in children.get(name, []))
+        visiting.discard(name)
+        visited.add(name)
+        return cycle
+    for name in children:
+        if visit(name):
+            errors.append("components: cycle found at '" + name + "'")
+            break
+
+    return (errors, objects)
+
+##
+# Validates a spec -- a dictionary or the path to a JSON or YAML spec file --
+# without constructing any objects. Returns the list of errors found.
+##
+def dsl_spec_validate(spec, bindings=None):
+    if isinstance(spec, str):
+        spec = dsl_spec_file_load(spec)
+    return _spec_validate(spec, bindings or {})[0]
+
+################################################################################
+# Construction
+################################################################################
+
+##
+# Private state for a single dsl_spec_load() call.
+##
+class _Builder:
+    def __init__(self, max_workers):
+        self.max_workers = max(1, max_workers)
+        self.created = []
+        self.mutex = threading.Lock()
+
+    ##
+    # Calls a dsl.py service, returns None on success or an error string.
+    ##
+    def call(self, where, service, args, kwargs={}):
+        retval = service(*args, **kwargs)
+        if isinstance(retval, tuple):
+            retval = retval[0]
+        if retval != dsl.DSL_RETURN_SUCCESS:
+            return where + ': ' + service.__name__ + ' failed with ' \
+                + str(dsl.dsl_return_value_to_string(retval))
+        return None
+
+    ##
+    # Constructs a single object and applies its lists, pph-adds, and
+    # settings. Returns None on success or an error string.
+    ##
+    def construct(self, obj, tees):
+        where = obj.section.key + " '" + obj.name + "'"
+        if not tees:
+            error = self.call(where, obj.constructor, [obj.name], obj.kwargs)
+            if error:
+                return error
+            with self.mutex:
+                self.created.append((obj.section.delete, obj.name))
+        for key, service, names in obj.lists:
+            if (key == 'branches') != tees:
+                continue
+            error = self.call(where, service, [obj.name, names])
+            if error:
+                return error
+        if tees:
+            return None
+        for service, args in obj.pph_adds:
+            error = self.call(where, service, [obj.name] + args)
+            if error:
+                return error
+        for service, args, kwargs in obj.settings:
+            error = self.call(where, service, [obj.name] + args, kwargs)
+            if error:
+                return error
+        return None
+
+    ##
+    # Constructs all objects in a stage, in parallel. Returns the list of
+    # errors.
+    ##
+    def stage_run(self, objects, tees=False):
+        if self.max_workers == 1 or len(objects) < 2:
+            results = [self.construct(obj, tees) for obj in objects]
+        else:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_workers) as executor:
+                results = list(executor.map(
+                    lambda obj: self.construct(obj, tees), objects))
+        return [error for error in results if error]
+
+    ##
+    # Deletes all objects created in reverse order. Objects that are in use
+    # by another object are retried once their parent has been deleted.
+    ##
+    def rollback(self):
+        remaining = list(reversed(self.created))
+        while remaining:
+            failed = [(delete, name) for delete, name in remaining
+                if getattr(dsl, delete)(name) != dsl.DSL_RETURN_SUCCESS]
+            if len(failed) == len(remaining):
+                break
+            remaining = failed
+        self.created = []
+
+##
+# Loads a spec -- a dictionary or the path to a JSON or YAML spec file -- and
+# constructs all of its objects. Raises SpecError if the spec fails to validate
+# or if any object fails to construct, in which case all objects created are
+# deleted.
+# bindings - dictionary of client handlers, listeners, and data referenced by
+#     "@<key>" parameter values.
+# max_workers - maximum number of threads constructing the independent objects
+#     of each stage in parallel. Set to 1 to construct in order.
+# Returns a report dictionary with 'pipelines', the list of Pipeline names,
+# 'objects', the number of objects constructed, 'stages', the ordered list of
+# (stage, seconds) timings, 'total', the total seconds, and 'config_cache',
+# the config file cache metrics.
+##
+def dsl_spec_load(spec, bindings=None,
+    max_workers=DSL_SPEC_DEFAULT_MAX_WORKERS):
+    start_time = time.perf_counter()
+
+    if isinstance(spec, str):
+        spec = dsl_spec_file_load(spec)
+    errors, objects = _spec_validate(spec, bindings or {})
+    if errors:
+        raise SpecError('spec failed validation', errors)
+
+    stages = [(DSL_SPEC_STAGE_VALIDATE, time.perf_counter() - start_time)]
+
+    builder = _Builder(max_workers)
+
+    def stage(name, stage_objects, tees=False):
+        stage_start = time.perf_counter()
+        errors = builder.stage_run(stage_objects, tees)
+        stages.append((name, time.perf_counter() - stage_start))
+        if errors:
+            builder.rollback()
+            raise SpecError('spec failed to construct at stage ' + name, errors)
+
+    for section in _SECTIONS:
+        stage(section.stage, objects[section.key])
+        if section.key == 'branches':
+            stage(DSL_SPEC_STAGE_TEES, [obj for obj in objects['components']
+                if 'branches' in obj.entry], tees=True)
+
+            # properties for all GST Elements and Components with one call
+            properties = [(obj.name, key, value)
+                for obj in objects['gst_elements'] + objects['components']
+                for key, value in obj.entry.get('properties', {}).items()]
+            stage_start = time.perf_counter()
+            if properties:
+                retval, results = dsl.dsl_component_property_batch_set(
+                    properties)
+                if retval != dsl.DSL_RETURN_SUCCESS:
+                    builder.rollback()
+                    raise SpecError('spec failed to construct at stage '
+                        + DSL_SPEC_STAGE_PROPERTIES,
+                        [name + ' ' + key + ': '
+                            + str(dsl.dsl_return_value_to_string(result))
+                            for (name, key, value), result
+                            in zip(properties, results)
+                            if result != dsl.DSL_RETURN_SUCCESS])
+            stages.append((DSL_SPEC_STAGE_PROPERTIES,
+                time.perf_counter() - stage_start))
+
+    return {'pipelines': [obj.name for obj in objects['pipelines']],
+        'objects': len(builder.created), 'stages': stages,
+        'total': time.perf_counter() - start_time,
+        'config_cache': dsl_spec_config_cache_metrics_get()}
@@ -0,0 +1,581 @@
+################################################################################
+# The MIT License
+#
+# Copyright (c)  2019-2024, Prominence AI, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+################################################################################
+
+################################################################################
+#
+# Multi-process Pipeline Supervisor for dsl.py
+#
+# DSL Services is a per-process singleton and all Python client callbacks
+# contend for the same GIL. The Supervisor launches each Pipeline -- or each
+# shard of Sources -- in its own worker process, each with its own instance of
+# libdsl, its own default main-loop, and its own interpreter.
+#
+#  - each worker calls a client "builder" function that creates and returns
+#    the names of the worker's Pipelines. All Python callbacks (handlers and
+#    listeners) must be added by the builder as they run in the worker.
+#  - the worker plays its Pipelines and runs dsl_main_loop_run() until stopped.
+#  - any dsl_* service can be called in a worker from the supervising process
+#    with a WorkerProxy -- e.g. supervisor.proxy('worker-1').dsl_pipeline_pause(
+#    'pipeline-1') -- over a duplex multiprocessing Pipe.
+#  - each worker posts periodic metrics -- Pipeline states and the result of
+#    an optional client metrics function -- and client events posted with
+#    dsl_supervisor_event_post() to the supervising process over a shared
+#    multiprocessing Queue.
+#  - workers that exit abnormally are restarted, with a backoff, up to a
+#    maximum number of consecutive restarts. A worker's restart count is reset
+#    once it has run for a healthy uptime, so that occasional crashes over a
+#    long run do not exhaust its restarts.
+#
+# Workers are started with the 'spawn' method so that libdsl, GStreamer, and
+# GLib are initialized fresh in each process. The builder and metrics functions
+# must therefore be defined at module level so they can be pickled by reference.
+#
+################################################################################
+
+#!/usr/bin/env python
+
+import multiprocessing
+import queue
+import threading
+import time
+import traceback
+
+DSL_SUPERVISOR_EVENT_WORKER_STARTED = 0
+DSL_SUPERVISOR_EVENT_WORKER_STOPPED = 1
+DSL_SUPERVISOR_EVENT_WORKER_CRASHED = 2
+DSL_SUPERVISOR_EVENT_WORKER_RESTARTED = 3
+DSL_SUPERVISOR_EVENT_WORKER_FAILED = 4
+DSL_SUPERVISOR_EVENT_WORKER_METRICS = 5
+DSL_SUPERVISOR_EVENT_CLIENT = 6
+
+DSL_SUPERVISOR_WORKER_STATE_IDLE = 0
+DSL_SUPERVISOR_WORKER_STATE_RUNNING = 1
+DSL_SUPERVISOR_WORKER_STATE_RESTARTING = 2
+DSL_SUPERVISOR_WORKER_STATE_STOPPED = 3
+DSL_SUPERVISOR_WORKER_STATE_FAILED = 4
+
+DSL_SUPERVISOR_DEFAULT_MAX_RESTARTS = 3
+DSL_SUPERVISOR_DEFAULT_RESTART_BACKOFF = 1.0
+DSL_SUPERVISOR_DEFAULT_METRICS_INTERVAL = 1.0
+DSL_SUPERVISOR_DEFAULT_CALL_TIMEOUT = 10.0
+DSL_SUPERVISOR_DEFAULT_HEALTHY_UPTIME = 60.0
+
+# Exit code used by a worker whose builder failed. Builder failures are not
+# restarted as they will fail again.
+_WORKER_EXIT_BUILD_FAILED = 3
+
+# Period for the supervising monitor thread.
+_MONITOR_INTERVAL = 0.1
+
+##
+# Exception raised when a call cannot be delivered to, or answered by, a worker.
+##
+class SupervisorError(RuntimeError):
+    pass
+
+################################################################################
+# Worker side
+################################################################################
+
+# Set in each worker process once started.
+_g_worker_name = None
+_g_event_queue = None
+
+##
+# Posts a client event from within a worker process to the supervising
+# process, where it is passed to all event listeners with the event type
+# DSL_SUPERVISOR_EVENT_CLIENT. The data must be picklable. Intended to be
+# called from the Pipeline callbacks added by the worker's builder.
+##
+def dsl_supervisor_event_post(data):
+    if _g_event_queue is None:
+        return False
+    try:
+        _g_event_queue.put_nowait(
+            (DSL_SUPERVISOR_EVENT_CLIENT, _g_worker_name, data))
+    except queue.Full:
+        return False
+    return True
+
+##
+# Returns the name of the worker the calling process is running as, or None
+# if called from outside of a worker process.
+##
+def dsl_supervisor_worker_name_get():
+    return _g_worker_name
+
+##
+# Converts a dsl_* return value to a form that can be sent over the Pipe.
+# ctypes Structures are converted to dictionaries of their fields.
+##
+def _to_picklable(value):
+    if isinstance(value, (tuple, list)):
+        return type(value)(_to_picklable(item) for item in value)
+    fields = getattr(value, '_fields_', None)
+    if fields is not None:
+        return dict((field[0], _to_picklable(getattr(value, field[0])))
+            for field in fields)
+    return value
+
+##
+# Worker thread function serving dsl_* calls made with a WorkerProxy.
+##
+def _worker_command_thread_func(dsl, cmd_conn):
+    while True:
+        try:
+            request = cmd_conn.recv()
+        except (EOFError, OSError):
+            # The supervising process has gone away.
+            dsl.dsl_main_loop_quit()
+            return
+        if request[0] == 'stop':
+            dsl.dsl_main_loop_quit()
+            return
+        call_id, name, args, kwargs = request[1:]
+        try:
+            if not name.startswith('dsl_'):
+                raise AttributeError('not a DSL service: ' + name)
+            result = _to_picklable(getattr(dsl, name)(*args, **kwargs))
+            reply = ('result', call_id, result)
+        except Exception as e:
+            reply = ('error', call_id, repr(e))
+        try:
+            cmd_conn.send(reply)
+        except Exception as e:
+            cmd_conn.send(('error', call_id, repr(e)))
+
+##
+# Worker thread function posting periodic metrics to the supervising process.
+##
+def _worker_metrics_thread_func(dsl, pipelines, metrics_fn, interval,
+    stop_event):
+    while not stop_event.wait(interval):
+        metrics = {'timestamp': time.time(), 'pipelines': {}}
+        for pipeline in pipelines:
+            retval, state = dsl.dsl_pipeline_state_get(pipeline)
+            metrics['pipelines'][pipeline] = \
+                state if retval == dsl.DSL_RETURN_SUCCESS else None
+        if metrics_fn is not None:
+            try:
+                metrics['client'] = metrics_fn(pipelines)
+            except Exception:
+                metrics['client'] = None
+        try:
+            _g_event_queue.put_nowait(
+                (DSL_SUPERVISOR_EVENT_WORKER_METRICS, _g_worker_name, metrics))
+        except queue.Full:
+            pass
+
+##
+# Entry point for each worker process.
+##
+def _worker_main(name, builder, args, metrics_fn, metrics_interval,
+    cmd_conn, event_queue):
+    global _g_worker_name, _g_event_queue
+
+    _g_worker_name = name
+    _g_event_queue = event_queue
+
+    # Import DSL in the worker only - the supervising process never loads libdsl
+    import dsl
+
+    try:
+        pipelines = builder(name, *args)
+    except Exception:
+        traceback.print_exc()
+        pipelines = None
+    if isinstance(pipelines, str):
+        pipelines = [pipelines]
+    if not isinstance(pipelines, (list, tuple)):
+        print('Supervisor worker', name, 'failed to build with result =',
+            pipelines)
+        dsl.dsl_delete_all()
+        raise SystemExit(_WORKER_EXIT_BUILD_FAILED)
+
+    command_thread = threading.Thread(target=_worker_command_thread_func,
+        args=(dsl, cmd_conn), daemon=True)
+    command_thread.start()
+
+    for pipeline in pipelines:
+        retval = dsl.dsl_pipeline_play(pipeline)
+        if retval != dsl.DSL_RETURN_SUCCESS:
+            print('Supervisor worker', name, 'failed to play', pipeline,
+                'with result =', dsl.dsl_return_value_to_string(retval))
+            dsl.dsl_delete_all()
+            raise SystemExit(_WORKER_EXIT_BUILD_FAILED)
+
+    stop_event = threading.Event()
+    metrics_thread = threading.Thread(target=_worker_metrics_thread_func,
+        args=(dsl, list(pipelines), metrics_fn, metrics_interval, stop_event),
+        daemon=True)
+    metrics_thread.start()
+
+    event_queue.put((DSL_SUPERVISOR_EVENT_WORKER_STARTED, name,
+        {'pid': multiprocessing.current_process().pid,
+        'pipelines': list(pipelines)}))
+
+    # blocking call until stopped by the supervisor or by a client callback.
+    dsl.dsl_main_loop_run()
+
+    stop_event.set()
+    for pipeline in pipelines:
+        dsl.dsl_pipeline_stop(pipeline)
+    dsl.dsl_delete_all()
+
+    event_queue.put((DSL_SUPERVISOR_EVENT_WORKER_STOPPED, name, None))
+
+################################################################################
+# Supervisor side
+################################################################################
+
+##
+# Proxy mirroring the dsl_* services of a single worker. Each call is executed
+# in the worker process and its return value is returned to the caller.
+##
+class WorkerProxy:
+    def __init__(self, supervisor, name):
+        self._supervisor = supervisor
+        self._name = name
+
+    def __getattr__(self, attr):
+        if not attr.startswith('dsl_'):
+            raise AttributeError(attr)
+        def call(*args, **kwargs):
+            return self._supervisor._call(self._name, attr, args, kwargs)
+        call.__name__ = attr
+        return call
+
+##
+# Private bookkeeping for each worker added to the supervisor.
+##
+class _Worker:
+    def __init__(self, name, builder, args, metrics_fn):
+        self.name = name
+        self.builder = builder
+        self.args = args
+        self.metrics_fn = metrics_fn
+        self.process = None
+        self.conn = None
+        self.conn_lock = threading.Lock()
+        self.next_call_id = 0
+        self.state = DSL_SUPERVISOR_WORKER_STATE_IDLE
+        self.stopping = False
+        self.restarts = 0
+        self.restart_time = None
+        self.start_time = None
+        self.pipelines = []
+        self.last_metrics = None
+
+##
+# Supervises a set of worker processes, each running its own Pipelines.
+##
+class Supervisor:
+
+    ##
+    # Creates a new Supervisor
+    # max_restarts - maximum number of consecutive times a crashed worker is
+    #     restarted.
+    # restart_backoff - seconds to wait before the first restart, doubled for
+    #     each consecutive restart of the same worker.
+    # metrics_interval - seconds between metrics posted by each worker.
+    # call_timeout - seconds to wait for the reply to a proxied call.
+    # healthy_uptime - seconds a worker must run before its restart count, and
+    #     backoff, is reset. None to never reset.
+    ##
+    def __init__(self, max_restarts=DSL_SUPERVISOR_DEFAULT_MAX_RESTARTS,
+        restart_backoff=DSL_SUPERVISOR_DEFAULT_RESTART_BACKOFF,
+        metrics_interval=DSL_SUPERVISOR_DEFAULT_METRICS_INTERVAL,
+        call_timeout=DSL_SUPERVISOR_DEFAULT_CALL_TIMEOUT,
+        healthy_uptime=DSL_SUPERVISOR_DEFAULT_HEALTHY_UPTIME):
+        self._context = multiprocessing.get_context('spawn')
+        self._event_queue = self._context.Queue()
+        self._max_restarts = max_restarts
+        self._restart_backoff = restart_backoff
+        self._metrics_interval = metrics_interval
+        self._call_timeout = call_timeout
+        self._healthy_uptime = healthy_uptime
+        self._workers = {}
+        self._listeners = []
+        self._mutex = threading.RLock()
+        self._monitor_thread = None
+        self._running = False
+        self._all_done = threading.Event()
+
+    ##
+    # Adds a worker to run its own Pipelines in its own process.
+    # name - unique name for the worker.
+    # builder - module level function called in the worker as
+    #     builder(name, *args). Returns a Pipeline name or list of Pipeline
+    #     names to play on success, anything else on failure.
+    # args - picklable arguments to pass to the builder.
+    # metrics_fn - optional module level function called in the worker as
+    #     metrics_fn(pipelines) on each metrics interval. The picklable
+    #     return value is added to the worker's metrics as 'client'.
+    ##
+    def worker_add(self, name, builder, args=(), metrics_fn=None):
+        with self._mutex:
+            if name in self._workers:
+                raise ValueError('worker name is not unique: ' + name)
+            worker = _Worker(name, builder, tuple(args), metrics_fn)
+            self._workers[name] = worker
+            if self._running:
+                self._spawn(worker)
+
+    ##
+    # Adds a callback to be called as listener(event_type, worker_name, data)
+    # from the supervisor's monitor thread on each worker and client event.
+    ##
+    def event_listener_add(self, listener):
+        with self._mutex:
+            if listener in self._listeners:
+                raise ValueError('listener is not unique')
+            self._listeners.append(listener)
+
+    def event_listener_remove(self, listener):
+        with self._mutex:
+            self._listeners.remove(listener)
+
+    ##
+    # Returns a WorkerProxy for the named worker.
+    ##
+    def proxy(self, name):
+        with self._mutex:
+            if name not in self._workers:
+                raise KeyError(name)
+        return WorkerProxy(self, name)
+
+    ##
+    # Starts all workers and the monitor thread.
+    ##
+    def start(self):
+        with self._mutex:
+            if self._running:
+                return
+            self._running = True
+            self._all_done.clear()
+            for worker in self._workers.values():
+                self._spawn(worker)
+        self._monitor_thread = threading.Thread(
+            target=self._monitor_thread_func, daemon=True)
+        self._monitor_thread.start()
+
+    ##
+    # Stops all workers, waiting up to timeout seconds for each to exit
+    # before terminating it.
+    ##
+    def stop(self, timeout=10.0):
+        with self._mutex:
+            workers = list(self._workers.values())
+            for worker in workers:
+                worker.stopping = True
+                if worker.conn is not None:
+                    try:
+                        with worker.conn_lock:
+                            worker.conn.send(('stop',))
+                    except (OSError, ValueError):
+                        pass
+        for worker in workers:
+            if worker.process is not None:
+                worker.process.join(timeout)
+                if worker.process.is_alive():
+                    worker.process.terminate()
+                    worker.process.join()
+        with self._mutex:
+            self._running = False
+        if self._monitor_thread is not None:
+            self._monitor_thread.join()
+            self._monitor_thread = None
+        self._drain_events()
+        with self._mutex:
+            for worker in workers:
+                if worker.state != DSL_SUPERVISOR_WORKER_STATE_FAILED:
+                    worker.state = DSL_SUPERVISOR_WORKER_STATE_STOPPED
+                if worker.conn is not None:
+                    worker.conn.close()
+                    worker.conn = None
+        self._all_done.set()
+
+    ##
+    # Blocks until all workers have stopped or failed, or until timeout.
+    # Returns True if all workers are done.
+    ##
+    def join(self, timeout=None):
+        return self._all_done.wait(timeout)
+
+    ##
+    # Returns a dictionary of metrics for each worker.
+    ##
+    def metrics(self):
+        now = time.time()
+        with self._mutex:
+            return dict((worker.name, {
+                'state': worker.state,
+                'pid': worker.process.pid if worker.process else None,
+                'restarts': worker.restarts,
+                'uptime': now - worker.start_time
+                    if worker.start_time and
+                        worker.state == DSL_SUPERVISOR_WORKER_STATE_RUNNING
+                    else 0.0,
+                'pipelines': list(worker.pipelines),
+                'last_metrics': worker.last_metrics})
+                for worker in self._workers.values())
+
+    def _spawn(self, worker):
+        if worker.conn is not None:
+            worker.conn.close()
+        parent_conn, child_conn = self._context.Pipe(duplex=True)
+        worker.conn = parent_conn
+        worker.process = self._context.Process(target=_worker_main,
+            name='dsl-worker-' + worker.name,
+            args=(worker.name, worker.builder, worker.args, worker.metrics_fn,
+                self._metrics_interval, child_conn, self._event_queue),
+            daemon=True)
+        worker.process.start()
+
+        # The child end is owned by the worker once started.
+        child_conn.close()
+        worker.state = DSL_SUPERVISOR_WORKER_STATE_RUNNING
+        worker.start_time = time.time()
+        worker.stopping = False
+
+    def _call(self, name, attr, args, kwargs):
+        with self._mutex:
+            worker = self._workers.get(name)
+            if worker is None:
+                raise KeyError(name)
+            conn = worker.conn
+        if conn is None or worker.state != DSL_SUPERVISOR_WORKER_STATE_RUNNING:
+            raise SupervisorError('worker ' + name + ' is not running')
+        with worker.conn_lock:
+            worker.next_call_id += 1
+            call_id = worker.next_call_id
+            try:
+                conn.send(('call', call_id, attr, args, kwargs))
+                while True:
+                    if not conn.poll(self._call_timeout):
+                        raise SupervisorError('timeout calling ' + attr +
+                            ' in worker ' + name)
+                    status, reply_id, value = conn.recv()
+
+                    # Replies to calls that previously timed out are discarded.
+                    if reply_id == call_id:
+                        break
+            except (EOFError, OSError) as e:
+                raise SupervisorError('worker ' + name +
+                    ' connection lost: ' + repr(e))
+        if status == 'error':
+            raise SupervisorError(attr + ' failed in worker ' + name +
+                ': ' + value)
+        return value
+
+    def _notify(self, event_type, name, data):
+        with self._mutex:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(event_type, name, data)
+            except Exception:
+                traceback.print_exc()
+
+    def _drain_events(self):
+        while True:
+            try:
+                event_type, name, data = self._event_queue.get_nowait()
+            except (queue.Empty, OSError, ValueError):
+                return
+            with self._mutex:
+                worker = self._workers.get(name)
+                if worker is not None:
+                    if event_type == DSL_SUPERVISOR_EVENT_WORKER_METRICS:
+                        worker.last_metrics = data
+                    elif event_type == DSL_SUPERVISOR_EVENT_WORKER_STARTED:
+                        worker.pipelines = data['pipelines']
+            self._notify(event_type, name, data)
+
+    def _check_workers(self):
+        events = []
+        now = time.time()
+        with self._mutex:
+            for worker in self._workers.values():
+                if worker.state == DSL_SUPERVISOR_WORKER_STATE_RESTARTING:
+                    if worker.stopping:
+                        worker.state = DSL_SUPERVISOR_WORKER_STATE_STOPPED
+                    elif now >= worker.restart_time:
+                        self._spawn(worker)
+                        events.append((DSL_SUPERVISOR_EVENT_WORKER_RESTARTED,
+                            worker.name, {'restarts': worker.restarts}))
+                    continue
+                if worker.state != DSL_SUPERVISOR_WORKER_STATE_RUNNING:
+                    continue
+
+                # A worker that has run for the healthy uptime starts over
+                # with its full number of restarts.
+                if (worker.restarts and self._healthy_uptime is not None and
+                        now - worker.start_time >= self._healthy_uptime):
+                    worker.restarts = 0
+                if worker.process.is_alive() or worker.stopping:
+                    continue
+                exitcode = worker.process.exitcode
+                if exitcode == 0:
+                    worker.state = DSL_SUPERVISOR_WORKER_STATE_STOPPED
+                    continue
+                events.append((DSL_SUPERVISOR_EVENT_WORKER_CRASHED,
+                    worker.name, {'exitcode': exitcode}))
+                if (exitcode == _WORKER_EXIT_BUILD_FAILED or
+                        worker.restarts >= self._max_restarts):
+                    worker.state = DSL_SUPERVISOR_WORKER_STATE_FAILED
+                    events.append((DSL_SUPERVISOR_EVENT_WORKER_FAILED,
+                        worker.name, {'exitcode': exitcode,
+                        'restarts': worker.restarts}))
+                    continue
+                worker.state = DSL_SUPERVISOR_WORKER_STATE_RESTARTING
+                worker.restart_time = now + \
+                    self._restart_backoff * (2 ** worker.restarts)
+                worker.restarts += 1
+            all_done = self._workers and all(worker.state in
+                (DSL_SUPERVISOR_WORKER_STATE_STOPPED,
+                DSL_SUPERVISOR_WORKER_STATE_FAILED)
+                for worker in self._workers.values())
+        for event in events:
+            self._notify(*event)
+        if all_done:
+            self._all_done.set()
+
+    def _monitor_thread_func(self):
+        while True:
+            with self._mutex:
+                if not self._running:
+                    return
+            self._drain_events()
+            self._check_workers()
+            time.sleep(_MONITOR_INTERVAL)
+
+##
+# Splits a list of sources into num_shards lists, round-robin, so that each
+# shard can be built into the Pipeline of its own worker.
+##
+def dsl_supervisor_sources_shard(sources, num_shards):
+    if num_shards < 1:
+        raise ValueError('num_shards must be >= 1')
+    return [list(sources[i::num_shards]) for i in range(num_shards)]
@@ -0,0 +1,106 @@
+/*
+The MIT License
+
+Copyright (c) 2022, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+/* ------------------------------------------------------------------------------------
+ This example demonstrates a small C reader process attached to the shared-memory
+ ring buffer of a Metadata Publisher Pad Probe Handler -- created with 
+ dsl_pph_meta_publisher_new -- running in a separate Pipeline process. 
+ 
+ The reader waits on the Publisher's doorbell and prints each frame's object 
+ metadata. Frames overwritten before they could be read (reader lagging by more
+ than slot_count frames) are skipped and counted. The reader never slows the
+ Pipeline, and any number of readers can attach to the same segment.
+ 
+ Build with:
+    gcc -I../../src meta_shm_reader.c -o meta_shm_reader -lrt
+ 
+ Run with:
+    ./meta_shm_reader /dsl-meta
+*/
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <signal.h>
+
+#include "DslMetaShmReader.h"
+
+static volatile sig_atomic_t g_running = 1;
+
+static void on_signal(int signum)
+{
+    g_running = 0;
+}
+
+int main(int argc, char** argv)
+{
+    dsl_meta_shm_reader reader;
+    dsl_meta_shm_frame frame;
+    dsl_meta_shm_object* objects;
+    const char* shm_name = (argc > 1) ? argv[1] : "/dsl-meta";
+    uint32_t i;
+
+    if (dsl_meta_shm_reader_open(&reader, shm_name) < 0)
+    {
+        perror("failed to attach to Metadata Publisher shared-memory");
+        return EXIT_FAILURE;
+    }
+    printf("attached to '%s': %u slots, %u max objects per frame\n", shm_name, 
+        reader.header->slot_count, reader.header->max_objects);
+    
+    objects = calloc(reader.header->max_objects, sizeof(dsl_meta_shm_object));
+    
+    signal(SIGINT, on_signal);
+    
+    while (g_running)
+    {
+        if (!dsl_meta_shm_reader_wait(&reader, 1000))
+        {
+            continue;
+        }
+        while (dsl_meta_shm_reader_next(&reader, &frame, objects, 
+            reader.header->max_objects))
+        {
+            printf("seq=%lu source=%u frame=%ld objects=%u%s\n", 
+                (unsigned long)frame.sequence, frame.source_id, 
+                (long)frame.frame_num, frame.object_count,
+                (frame.flags & DSL_META_SHM_FRAME_OBJECTS_TRUNCATED) 
+                    ? " (truncated)" : "");
+                
+            for (i = 0; i < frame.object_count; i++)
+            {
+                printf("    id=%lu class=%d conf=%.2f bbox=[%.0f, %.0f, %.0f, %.0f]\n", 
+                    (unsigned long)objects[i].object_id, objects[i].class_id, 
+                    objects[i].confidence, objects[i].left, objects[i].top, 
+                    objects[i].width, objects[i].height);
+            }
+        }
+    }
+    printf("frames read = %lu, frames skipped = %lu\n", 
+        (unsigned long)reader.frames_read, (unsigned long)reader.frames_skipped);
+        
+    free(objects);
+    dsl_meta_shm_reader_close(&reader);
+    
+    return EXIT_SUCCESS;
+}
@@ -0,0 +1,230 @@
+################################################################################
+# The MIT License
+#
+# Copyright (c) 2021-2023, Prominence AI, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+################################################################################
+
+################################################################################
+#
+# This example demonstrates a zero-copy NumPy reader process attached to the 
+# shared-memory ring buffer of a Metadata Publisher Pad Probe Handler -- created
+# with dsl_pph_meta_publisher_new -- running in a separate Pipeline process.
+#
+# The ring buffer is memory-mapped read-only and viewed as structured NumPy 
+# arrays matching the fixed schema defined in DslApi.h, so frame and object 
+# records are read in place without copying. Frames overwritten before they 
+# could be read (reader lagging by more than slot_count frames) are skipped and
+# counted. The reader never slows the Pipeline, and any number of readers can
+# attach to the same segment.
+#
+# Usage:
+#    python3 meta_shm_reader.py /dsl-meta
+#
+################################################################################
+
+#!/usr/bin/env python
+
+import mmap
+import os
+import sys
+import time
+
+import numpy as np
+
+DSL_META_SHM_MAGIC = b'DSLSHM'
+DSL_META_SHM_VERSION = 1
+
+DSL_META_SHM_FRAME_INFER_DONE = 0x00000001
+DSL_META_SHM_FRAME_OBJECTS_TRUNCATED = 0x00000002
+
+## dsl_meta_shm_header
+META_SHM_HEADER_DTYPE = np.dtype([
+    ('magic', 'S8'),
+    ('version', '<u4'),
+    ('slot_count', '<u4'),
+    ('slot_size', '<u4'),
+    ('max_objects', '<u4'),
+    ('write_sequence', '<u8'),
+    ('doorbell', '<u4'),
+    ('waiters', '<u4'),
+    ('writer_pid', '<u4'),
+    ('reserved', '<u4', (5,))])
+
+## dsl_meta_shm_frame
+META_SHM_FRAME_DTYPE = np.dtype([
+    ('sequence', '<u8'),
+    ('source_id', '<u4'),
+    ('batch_id', '<u4'),
+    ('frame_num', '<i8'),
+    ('ntp_timestamp', '<u8'),
+    ('buf_pts', '<u8'),
+    ('source_frame_width', '<u4'),
+    ('source_frame_height', '<u4'),
+    ('object_count', '<u4'),
+    ('flags', '<u4'),
+    ('reserved', '<u8')])
+
+## dsl_meta_shm_object
+META_SHM_OBJECT_DTYPE = np.dtype([
+    ('object_id', '<u8'),
+    ('class_id', '<i4'),
+    ('infer_id', '<i4'),
+    ('confidence', '<f4'),
+    ('tracker_confidence', '<f4'),
+    ('left', '<f4'),
+    ('top', '<f4'),
+    ('width', '<f4'),
+    ('height', '<f4')])
+
+class MetaShmReader:
+    """
+    Zero-copy reader for a Metadata Publisher shared-memory ring buffer.
+    """
+    def __init__(self, shm_name):
+        path = os.path.join('/dev/shm', shm_name.lstrip('/'))
+        with open(path, 'rb') as shm_file:
+            self._map = mmap.mmap(shm_file.fileno(), 0, access=mmap.ACCESS_READ)
+            
+        self.header = np.frombuffer(self._map, 
+            dtype=META_SHM_HEADER_DTYPE, count=1)[0]
+        if (self.header['magic'] != DSL_META_SHM_MAGIC or 
+                self.header['version'] != DSL_META_SHM_VERSION):
+            raise ValueError("'{}' is not a Metadata Publisher segment".format(path))
+
+        self.slot_count = int(self.header['slot_count'])
+        self.max_objects = int(self.header['max_objects'])
+        
+        slot_dtype = np.dtype({
+            'names': ['frame', 'objects'],
+            'formats': [META_SHM_FRAME_DTYPE, 
+                (META_SHM_OBJECT_DTYPE, (self.max_objects,))],
+            'offsets': [0, META_SHM_FRAME_DTYPE.itemsize],
+            'itemsize': int(self.header['slot_size'])})
+        slots = np.frombuffer(self._map, dtype=slot_dtype, 
+            count=self.slot_count, offset=META_SHM_HEADER_DTYPE.itemsize)
+            
+        # Views into shared-memory, not copies
+        self._frames = slots['frame']
+        self._objects = slots['objects']
+        self._sequences = self._frames['sequence']
+
+        self.next_sequence = int(self.header['write_sequence']) + 1
+        self.frames_read = 0
+        self.frames_skipped = 0
+
+    def _slot(self, sequence):
+        return (sequence - 1) % self.slot_count
+
+    def next(self, copy=False):
+        """
+        Returns the next (sequence, frame, objects) tuple, or None if no new 
+        frame is available. With copy=False, frame and objects are views into
+        shared-memory that remain valid only while is_valid(sequence) is True;
+        call is_valid after processing them. With copy=True, the records are 
+        copied out and validated before they are returned.
+        """
+        while True:
+            write_sequence = int(self.header['write_sequence'])
+            if self.next_sequence > write_sequence:
+                return None
+                
+            # Skip ahead if the publisher has lapped the reader.
+            if write_sequence - self.next_sequence >= self.slot_count:
+                oldest = write_sequence - self.slot_count + 1
+                self.frames_skipped += oldest - self.next_sequence
+                self.next_sequence = oldest
+                
+            sequence = self.next_sequence
+            self.next_sequence += 1
+            
+            slot = self._slot(sequence)
+            if int(self._sequences[slot]) == sequence:
+                frame = self._frames[slot]
+                count = min(int(frame['object_count']), self.max_objects)
+                objects = self._objects[slot, :count]
+                if copy:
+                    frame = frame.copy()
+                    objects = objects.copy()
+                if not copy or self.is_valid(sequence):
+                    self.frames_read += 1
+                    return sequence, frame, objects
+                    
+            # Overwritten, or being overwritten, by a newer frame.
+            self.frames_skipped += 1
+
+    def is_valid(self, sequence):
+        """
+        Returns True if the frame with the given sequence number has not been
+        overwritten by the publisher.
+        """
+        return int(self._sequences[self._slot(sequence)]) == sequence
+
+    def wait(self, timeout, poll_interval=0.001):
+        """
+        Waits up to timeout seconds for a new frame to be published. 
+        Returns True if a new frame is available, False otherwise.
+        """
+        deadline = time.monotonic() + timeout
+        while self.next_sequence > int(self.header['write_sequence']):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(poll_interval)
+        return True
+
+    def close(self):
+        self.header = self._frames = self._objects = self._sequences = None
+        self._map.close()
+
+def main(args):
+
+    reader = MetaShmReader(args[0] if len(args) else '/dsl-meta')
+    print("attached with {} slots, {} max objects per frame".format(
+        reader.slot_count, reader.max_objects))
+    try:
+        while True:
+            if not reader.wait(1.0):
+                continue
+            while True:
+                record = reader.next()
+                if record is None:
+                    break
+                sequence, frame, objects = record
+                
+                # Vectorized processing of the object records in place.
+                centers = np.stack((objects['left'] + objects['width']/2,
+                    objects['top'] + objects['height']/2), axis=-1)
+                classes = objects['class_id'].copy()
+                
+                if not reader.is_valid(sequence):
+                    continue
+                print('seq={} source={} frame={} objects={} classes={} centers={}'.format(
+                    sequence, frame['source_id'], frame['frame_num'], 
+                    len(objects), classes.tolist(), centers.round().tolist()))
+                    
+    except KeyboardInterrupt:
+        pass
+        
+    print('frames read = {}, frames skipped = {}'.format(
+        reader.frames_read, reader.frames_skipped))
+    reader.close()
+    
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
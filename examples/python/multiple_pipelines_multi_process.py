@@ -0,0 +1,184 @@
+################################################################################
+# The MIT License
+#
+# Copyright (c)  2019-2024, Prominence AI, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+################################################################################
+
+################################################################################
+#
+# This example demonstrates how to run multiple Pipelines, each in its own 
+# worker process, using the Supervisor defined in dsl_supervisor.py.
+#
+# Eight URI Sources are sharded across four workers. Each worker builds its own
+# Pipeline -- with a Primary GIE, Tiler, and Fake Sink -- from its shard of
+# Sources. All Python callbacks run in the worker that added them, so the
+# Pipelines no longer contend for a single interpreter and GIL.
+#
+# The Meter PPH callback in each worker posts the measured FPS to the 
+# supervising process with dsl_supervisor_event_post. The supervising process
+# prints each worker's events and metrics, pauses and resumes one Pipeline
+# through the worker's proxy, and restarts any worker that crashes.
+#
+# Each worker exits on EOS, or all workers are stopped with Ctrl-C.
+#
+################################################################################
+
+#!/usr/bin/env python
+
+import sys
+sys.path.insert(0, "../../")
+import multiprocessing
+import time
+
+from dsl_supervisor import *
+
+# Load DSL in the worker processes only. The supervising process never calls
+# into libdsl directly, all calls are made through the worker proxies.
+if multiprocessing.parent_process() is not None:
+    from dsl import *
+
+NUM_WORKERS = 4
+
+# Test URI used for all sources
+uri = '/opt/nvidia/deepstream/deepstream/samples/streams/sample_1080p_h265.mp4'
+
+URIS = [uri]*8
+
+# Filespecs (Jetson and dGPU) for the Primary GIE
+primary_infer_config_file = \
+    '/opt/nvidia/deepstream/deepstream/samples/configs/deepstream-app/config_infer_primary.txt'
+primary_model_engine_file = \
+    '/opt/nvidia/deepstream/deepstream/samples/models/Primary_Detector/resnet18_trafficcamnet.etlt_b8_gpu0_int8.engine'
+
+TILER_WIDTH = 1280
+TILER_HEIGHT = 720
+
+################################################################################
+# Worker side - called in each worker process only.
+################################################################################
+
+## 
+# Function to be called on End-of-Stream (EOS) event - in the worker process.
+## 
+def eos_event_listener(client_data):
+    dsl_supervisor_event_post('EOS')
+    dsl_main_loop_quit()
+
+## 
+# Meter PPH client callback funtion - in the worker process.
+## 
+def meter_pph_handler(session_avgs, interval_avgs, source_count, client_data):
+    dsl_supervisor_event_post({'interval-fps':
+        [round(interval_avgs[source], 2) for source in range(source_count)]})
+    return True
+
+##
+# Builder function called by each worker to create its Pipeline from its shard
+# of URIs. Returns the name of the Pipeline to play on success.
+##
+def build_pipeline(worker_name, uris):
+
+    pipeline = 'pipeline-' + worker_name
+    sources = []
+    for i, uri in enumerate(uris):
+        sources.append('uri-source-' + str(i))
+        retval = dsl_source_uri_new(sources[-1], uri, False, False, 0)
+        if retval != DSL_RETURN_SUCCESS:
+            return retval
+
+    retval = dsl_pph_meter_new('meter-pph', interval=1, 
+        client_handler=meter_pph_handler, client_data=None)
+    if retval != DSL_RETURN_SUCCESS:
+        return retval
+
+    retval = dsl_infer_gie_primary_new('primary-gie', 
+        primary_infer_config_file, primary_model_engine_file, 4)
+    if retval != DSL_RETURN_SUCCESS:
+        return retval
+
+    retval = dsl_tiler_new('tiler', TILER_WIDTH, TILER_HEIGHT)
+    if retval != DSL_RETURN_SUCCESS:
+        return retval
+
+    retval = dsl_tiler_pph_add('tiler', 'meter-pph', DSL_PAD_SINK)
+    if retval != DSL_RETURN_SUCCESS:
+        return retval
+
+    retval = dsl_sink_fake_new('fake-sink')
+    if retval != DSL_RETURN_SUCCESS:
+        return retval
+
+    retval = dsl_pipeline_new_component_add_many(pipeline, components=
+        sources + ['primary-gie', 'tiler', 'fake-sink', None])
+    if retval != DSL_RETURN_SUCCESS:
+        return retval
+
+    retval = dsl_pipeline_eos_listener_add(pipeline, eos_event_listener, None)
+    if retval != DSL_RETURN_SUCCESS:
+        return retval
+
+    return pipeline
+
+################################################################################
+# Supervisor side
+################################################################################
+
+## 
+# Function to be called by the Supervisor on every worker and client event.
+## 
+def supervisor_event_listener(event_type, worker_name, data):
+    if event_type == DSL_SUPERVISOR_EVENT_WORKER_METRICS:
+        return
+    print(worker_name, 'event =', event_type, 'data =', data)
+
+def main(args):
+
+    supervisor = Supervisor(max_restarts=3, restart_backoff=1.0)
+    supervisor.event_listener_add(supervisor_event_listener)
+
+    # Shard the Sources across the workers, one Pipeline per worker.
+    for i, shard in enumerate(dsl_supervisor_sources_shard(URIS, NUM_WORKERS)):
+        supervisor.worker_add('worker-' + str(i), build_pipeline, (shard,))
+
+    supervisor.start()
+
+    try:
+        # Let the Pipelines run for a while, then pause and resume the first
+        # Pipeline by calling the DSL services in its worker through a proxy.
+        time.sleep(10)
+        worker_0 = supervisor.proxy('worker-0')
+        print('pause worker-0 =', worker_0.dsl_return_value_to_string(
+            worker_0.dsl_pipeline_pause('pipeline-worker-0')))
+        time.sleep(2)
+        print('play worker-0 =', worker_0.dsl_return_value_to_string(
+            worker_0.dsl_pipeline_play('pipeline-worker-0')))
+
+        # Print the worker metrics until all workers are done - on EOS.
+        while not supervisor.join(5):
+            for worker_name, metrics in supervisor.metrics().items():
+                print(worker_name, metrics)
+    except KeyboardInterrupt:
+        pass
+
+    supervisor.stop()
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
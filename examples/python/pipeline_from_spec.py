@@ -0,0 +1,137 @@
+################################################################################
+# The MIT License
+#
+# Copyright (c)  2019-2024, Prominence AI, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+################################################################################
+
+################################################################################
+#
+# This example demonstrates how to build a Pipeline from a declarative JSON
+# spec using the loader defined in dsl_spec.py.
+#
+# The spec file pipeline_from_spec.json describes two URI Sources, a Primary
+# GIE, IOU Tracker, Tiler, On-Screen Display, and Window Sink -- along with an
+# ODE Handler with an Instance Trigger and Print Action added to the src-pad
+# of the Tracker, and a Meter PPH added to the sink-pad of the Tiler. The
+# Meter's client handler is passed to the loader as a binding.
+#
+# The complete spec is validated -- including all config files -- before any
+# components are created. The time spent in each stage of construction is
+# printed once the Pipeline has been built.
+#
+################################################################################
+
+#!/usr/bin/env python
+
+import os
+import sys
+sys.path.insert(0, "../../")
+
+from dsl import *
+from dsl_spec import *
+
+spec_file = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+    'pipeline_from_spec.json')
+
+## 
+# Meter PPH client callback funtion - referenced as "@meter_pph_handler"
+## 
+def meter_pph_handler(session_avgs, interval_avgs, source_count, client_data):
+    print('interval-fps =',
+        [round(interval_avgs[source], 2) for source in range(source_count)])
+    return True
+
+## 
+# Function to be called on XWindow KeyRelease event
+## 
+def xwindow_key_event_handler(key_string, client_data):
+    print('key released = ', key_string)
+    if key_string.upper() == 'P':
+        dsl_pipeline_pause('pipeline')
+    elif key_string.upper() == 'R':
+        dsl_pipeline_play('pipeline')
+    elif key_string.upper() == 'Q' or key_string == '' or key_string == '':
+        dsl_pipeline_stop('pipeline')
+        dsl_main_loop_quit()
+ 
+## 
+# Function to be called on XWindow Delete event
+## 
+def xwindow_delete_event_handler(client_data):
+    print('delete window event')
+    dsl_pipeline_stop('pipeline')
+    dsl_main_loop_quit()
+
+# Function to be called on End-of-Stream (EOS) event
+def eos_event_listener(client_data):
+    print('Pipeline EOS event')
+    dsl_pipeline_stop('pipeline')
+    dsl_main_loop_quit()
+
+def main(args):
+
+    # Since we're not using args, we can Let DSL initialize GST on first call
+    while True:
+
+        # Validate and build all objects in the spec file. All objects
+        # created are deleted if any one fails to build.
+        try:
+            report = dsl_spec_load(spec_file, 
+                bindings={'meter_pph_handler': meter_pph_handler})
+        except SpecError as e:
+            print(e)
+            return 1
+
+        for stage, seconds in report['stages']:
+            print('{:<16}{:8.3f} ms'.format(stage, seconds*1000))
+        print('{:<16}{:8.3f} ms'.format('total', report['total']*1000))
+
+        # Add the XWindow event handler functions defined above
+        retval = dsl_sink_window_key_event_handler_add('egl-sink', 
+            xwindow_key_event_handler, None)
+        if retval != DSL_RETURN_SUCCESS:
+            break
+        retval = dsl_sink_window_delete_event_handler_add('egl-sink', 
+            xwindow_delete_event_handler, None)
+        if retval != DSL_RETURN_SUCCESS:
+            break
+
+        retval = dsl_pipeline_eos_listener_add('pipeline', eos_event_listener, None)
+        if retval != DSL_RETURN_SUCCESS:
+            break
+
+        # Play the pipeline
+        retval = dsl_pipeline_play('pipeline')
+        if retval != DSL_RETURN_SUCCESS:
+            break
+
+        dsl_main_loop_run()
+        retval = DSL_RETURN_SUCCESS
+        break
+
+    # Print out the final result
+    print(dsl_return_value_to_string(retval))
+
+    dsl_pipeline_delete_all()
+    dsl_component_delete_all()
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
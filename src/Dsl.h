@@ -44,6 +44,7 @@ THE SOFTWARE.
 #include <math.h>
 #include <fstream>
 #include <thread>
+#include <atomic>
 #include <chrono>
 #include <unordered_map>
 #include <typeinfo>
@@ -53,6 +54,7 @@ THE SOFTWARE.
 #include <sys/types.h>
 #include <sys/stat.h>
 #include <regex>
+#include <functional>
 
 #include <nvds_version.h>
 #include <gstnvdsmeta.h>
@@ -840,6 +840,84 @@ DslReturnType dsl_ode_action_capture_mailer_remove(const wchar_t* name,
 #endif
 }
 
+DslReturnType dsl_ode_action_capture_object_best_shot_get(const wchar_t* name, 
+    boolean* enabled, uint* timeout, uint* max_hold, boolean* sharpness)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(enabled);
+    RETURN_IF_PARAM_IS_NULL(timeout);
+    RETURN_IF_PARAM_IS_NULL(max_hold);
+    RETURN_IF_PARAM_IS_NULL(sharpness);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->OdeActionCaptureObjectBestShotGet(
+        cstrName.c_str(), enabled, timeout, max_hold, sharpness);
+}
+
+DslReturnType dsl_ode_action_capture_object_best_shot_set(const wchar_t* name, 
+    boolean enabled, uint timeout, uint max_hold, boolean sharpness)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->OdeActionCaptureObjectBestShotSet(
+        cstrName.c_str(), enabled, timeout, max_hold, sharpness);
+}
+
+DslReturnType dsl_ode_action_capture_metrics_get(const wchar_t* name,
+    dsl_ode_action_capture_metrics* metrics)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(metrics);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->OdeActionCaptureMetricsGet(
+        cstrName.c_str(), metrics);
+}
+
+DslReturnType dsl_ode_action_capture_metrics_clear(const wchar_t* name)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->OdeActionCaptureMetricsClear(
+        cstrName.c_str());
+}
+
+DslReturnType dsl_ode_action_capture_websocket_topic_set(const wchar_t* name, 
+    const wchar_t* topic)
+{
+#if !defined(BUILD_WEBRTC)
+    #error "BUILD_WEBRTC must be defined"
+#elif BUILD_WEBRTC != true
+    LOG_ERROR("WebRTC & WebSocket services require BUILD_WEBRTC to be set to true \
+        in the Makefile");
+    return DSL_RESULT_API_NOT_SUPPORTED;
+#else
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+    std::string cstrTopic;
+    if (topic)
+    {
+        std::wstring wstrTopic(topic);
+        cstrTopic.assign(wstrTopic.begin(), wstrTopic.end());
+    }
+
+    return DSL::Services::GetServices()->OdeActionCaptureWebsocketTopicSet(
+        cstrName.c_str(), cstrTopic.c_str());
+#endif
+}
+
 DslReturnType dsl_ode_action_label_customize_new(const wchar_t* name,  
     const uint* content_types, uint size)
 {
@@ -1245,6 +1323,29 @@ DslReturnType dsl_ode_action_redact_new(const wchar_t* name)
     return DSL::Services::GetServices()->OdeActionRedactNew(cstrName.c_str());
 }
 
+DslReturnType dsl_ode_action_websocket_publish_new(const wchar_t* name, 
+    const wchar_t* topic)
+{
+#if !defined(BUILD_WEBRTC)
+    #error "BUILD_WEBRTC must be defined"
+#elif BUILD_WEBRTC != true
+    LOG_ERROR("WebRTC & WebSocket services require BUILD_WEBRTC to be set to true \
+        in the Makefile");
+    return DSL_RESULT_API_NOT_SUPPORTED;
+#else
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(topic);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+    std::wstring wstrTopic(topic);
+    std::string cstrTopic(wstrTopic.begin(), wstrTopic.end());
+
+    return DSL::Services::GetServices()->OdeActionWebsocketPublishNew(
+        cstrName.c_str(), cstrTopic.c_str());
+#endif
+}
+
 DslReturnType dsl_ode_action_sink_add_new(const wchar_t* name,
     const wchar_t* pipeline, const wchar_t* sink)
 {
@@ -1616,6 +1717,30 @@ DslReturnType dsl_ode_action_enabled_state_change_listener_remove(const wchar_t*
     return DSL::Services::GetServices()->OdeActionEnabledStateChangeListenerRemove(
         cstrName.c_str(), listener);
 }
+
+DslReturnType dsl_ode_action_async_metrics_get(const wchar_t* name,
+    dsl_ode_action_async_metrics* metrics)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(metrics);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->OdeActionAsyncMetricsGet(
+        cstrName.c_str(), metrics);
+}
+
+DslReturnType dsl_ode_action_async_metrics_clear(const wchar_t* name)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->OdeActionAsyncMetricsClear(
+        cstrName.c_str());
+}
     
 DslReturnType dsl_ode_action_delete(const wchar_t* name)
 {
@@ -1942,6 +2067,26 @@ DslReturnType dsl_ode_trigger_custom_new(const wchar_t* name, const wchar_t* sou
     return DSL::Services::GetServices()->OdeTriggerCustomNew(cstrName.c_str(), cstrSource.c_str(), 
         class_id, limit, client_checker, client_post_processor, client_data);
 }
+
+DslReturnType dsl_ode_trigger_custom_batch_new(const wchar_t* name, 
+    const wchar_t* source, uint class_id, uint limit, 
+    dsl_ode_check_for_occurrence_batch_cb client_checker, void* client_data)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(client_checker);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    std::string cstrSource;
+    if (source)
+    {
+        std::wstring wstrSource(source);
+        cstrSource.assign(wstrSource.begin(), wstrSource.end());
+    }
+    return DSL::Services::GetServices()->OdeTriggerCustomBatchNew(cstrName.c_str(), 
+        cstrSource.c_str(), class_id, limit, client_checker, client_data);
+}
     
 DslReturnType dsl_ode_trigger_count_new(const wchar_t* name, const wchar_t* source, 
     uint class_id, uint limit, uint minimum, uint maximum)
@@ -3325,6 +3470,82 @@ DslReturnType dsl_pph_custom_new(const wchar_t* name,
         client_handler, client_data);
 }
 
+DslReturnType dsl_pph_custom_async_enabled_get(const wchar_t* name, 
+    boolean* enabled)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(enabled);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PphCustomAsyncEnabledGet(cstrName.c_str(), 
+        enabled);
+}
+
+DslReturnType dsl_pph_custom_async_enabled_set(const wchar_t* name, 
+    boolean enabled)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PphCustomAsyncEnabledSet(cstrName.c_str(), 
+        enabled);
+}
+
+DslReturnType dsl_pph_custom_async_queue_settings_get(const wchar_t* name, 
+    uint* max_size, uint* policy, uint* sample_interval)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(max_size);
+    RETURN_IF_PARAM_IS_NULL(policy);
+    RETURN_IF_PARAM_IS_NULL(sample_interval);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PphCustomAsyncQueueSettingsGet(
+        cstrName.c_str(), max_size, policy, sample_interval);
+}
+
+DslReturnType dsl_pph_custom_async_queue_settings_set(const wchar_t* name, 
+    uint max_size, uint policy, uint sample_interval)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PphCustomAsyncQueueSettingsSet(
+        cstrName.c_str(), max_size, policy, sample_interval);
+}
+
+DslReturnType dsl_pph_custom_async_metrics_get(const wchar_t* name, 
+    dsl_pph_custom_async_metrics* metrics)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(metrics);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PphCustomAsyncMetricsGet(
+        cstrName.c_str(), metrics);
+}
+
+DslReturnType dsl_pph_custom_async_metrics_clear(const wchar_t* name)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PphCustomAsyncMetricsClear(
+        cstrName.c_str());
+}
+
 DslReturnType dsl_pph_meter_new(const wchar_t* name, uint interval,
     dsl_pph_meter_client_handler_cb client_handler, void* client_data)
 {
@@ -3469,6 +3690,75 @@ DslReturnType dsl_pph_ode_display_meta_alloc_size_set(const wchar_t* name, uint
         cstrName.c_str(), size);
 }
 
+DslReturnType dsl_pph_ode_frame_workers_get(const wchar_t* name, uint* workers)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(workers);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PphOdeFrameWorkersGet(
+        cstrName.c_str(), workers);
+}
+
+DslReturnType dsl_pph_ode_frame_workers_set(const wchar_t* name, uint workers)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PphOdeFrameWorkersSet(
+        cstrName.c_str(), workers);
+}
+
+DslReturnType dsl_pph_ode_replay(const wchar_t* name, 
+    const wchar_t* file_path, uint64_t* frames)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(file_path);
+    RETURN_IF_PARAM_IS_NULL(frames);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+    std::wstring wstrFilePath(file_path);
+    std::string cstrFilePath(wstrFilePath.begin(), wstrFilePath.end());
+
+    return DSL::Services::GetServices()->PphOdeReplay(cstrName.c_str(), 
+        cstrFilePath.c_str(), frames);
+}
+
+DslReturnType dsl_pph_meta_recorder_new(const wchar_t* name, 
+    const wchar_t* file_path)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(file_path);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+    std::wstring wstrFilePath(file_path);
+    std::string cstrFilePath(wstrFilePath.begin(), wstrFilePath.end());
+
+    return DSL::Services::GetServices()->PphMetaRecorderNew(cstrName.c_str(), 
+        cstrFilePath.c_str());
+}
+
+DslReturnType dsl_pph_meta_publisher_new(const wchar_t* name, 
+    const wchar_t* shm_name, uint slot_count, uint max_objects)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(shm_name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+    std::wstring wstrShmName(shm_name);
+    std::string cstrShmName(wstrShmName.begin(), wstrShmName.end());
+
+    return DSL::Services::GetServices()->PphMetaPublisherNew(cstrName.c_str(), 
+        cstrShmName.c_str(), slot_count, max_objects);
+}
+
 DslReturnType dsl_pph_buffer_timeout_new(const wchar_t* name,
     uint timeout, dsl_pph_buffer_timeout_handler_cb handler, void* client_data)
 {
@@ -5145,6 +5435,60 @@ DslReturnType dsl_source_video_buffer_out_frame_rate_set(const wchar_t* name,
         cstrName.c_str(), fps_n, fps_d);
 }
 
+DslReturnType dsl_source_video_decimation_frame_rate_get(const wchar_t* name, 
+    uint* fps_n, uint* fps_d)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(fps_n);
+    RETURN_IF_PARAM_IS_NULL(fps_d);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->SourceVideoDecimationFrameRateGet(
+        cstrName.c_str(), fps_n, fps_d);
+}
+
+DslReturnType dsl_source_video_decimation_frame_rate_set(const wchar_t* name, 
+    uint fps_n, uint fps_d)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->SourceVideoDecimationFrameRateSet(
+        cstrName.c_str(), fps_n, fps_d);
+}
+
+DslReturnType dsl_source_video_decimation_stats_get(const wchar_t* name, 
+    uint64_t* frames_passed, uint64_t* frames_dropped, 
+    uint64_t* frames_dropped_pre_decode)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(frames_passed);
+    RETURN_IF_PARAM_IS_NULL(frames_dropped);
+    RETURN_IF_PARAM_IS_NULL(frames_dropped_pre_decode);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->SourceVideoDecimationStatsGet(
+        cstrName.c_str(), frames_passed, frames_dropped, 
+        frames_dropped_pre_decode);
+}
+
+DslReturnType dsl_source_video_decimation_stats_clear(const wchar_t* name)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->SourceVideoDecimationStatsClear(
+        cstrName.c_str());
+}
+
 DslReturnType dsl_source_video_buffer_out_crop_rectangle_get(const wchar_t* name,
     uint crop_at, uint* left, uint* top, uint* width, uint* height)
 {
@@ -7201,19 +7545,70 @@ DslReturnType dsl_tee_blocking_timeout_set(const wchar_t* name,
         cstrName.c_str(), timeout);
 }
     
-DslReturnType dsl_tee_pph_add(const wchar_t* name, const wchar_t* handler)
+DslReturnType dsl_tee_branch_ops_apply(const wchar_t* name, 
+    const dsl_tee_branch_op* ops, uint count, dsl_tee_branch_op_result* results)
 {
     RETURN_IF_PARAM_IS_NULL(name);
-    RETURN_IF_PARAM_IS_NULL(handler);
+    RETURN_IF_PARAM_IS_NULL(ops);
+    RETURN_IF_PARAM_IS_NULL(results);
 
     std::wstring wstrName(name);
     std::string cstrName(wstrName.begin(), wstrName.end());
-    std::wstring wstrHandler(handler);
-    std::string cstrHandler(wstrHandler.begin(), wstrHandler.end());
+
+    std::vector<DSL::BranchOp> branchOps;
     
-    return DSL::Services::GetServices()->TeePphAdd(cstrName.c_str(), 
-        cstrHandler.c_str());
-}
+    for (uint i = 0; i < count; i++)
+    {
+        RETURN_IF_PARAM_IS_NULL(ops[i].branch);
+
+        std::wstring wstrBranch(ops[i].branch);
+        branchOps.push_back(DSL::BranchOp(ops[i].op, 
+            std::string(wstrBranch.begin(), wstrBranch.end()), ops[i].stream_id));
+            
+        // the result refers to the client's own Branch name.
+        results[i].branch = ops[i].branch;
+    }
+    return DSL::Services::GetServices()->TeeBranchOpsApply(
+        cstrName.c_str(), branchOps, results);
+}
+
+DslReturnType dsl_tee_branch_ops_apply_async(const wchar_t* name, 
+    const dsl_tee_branch_op* ops, uint count, 
+    dsl_tee_branch_ops_complete_listener_cb listener, void* client_data)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(ops);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    std::vector<DSL::BranchOp> branchOps;
+    
+    for (uint i = 0; i < count; i++)
+    {
+        RETURN_IF_PARAM_IS_NULL(ops[i].branch);
+
+        std::wstring wstrBranch(ops[i].branch);
+        branchOps.push_back(DSL::BranchOp(ops[i].op, 
+            std::string(wstrBranch.begin(), wstrBranch.end()), ops[i].stream_id));
+    }
+    return DSL::Services::GetServices()->TeeBranchOpsApplyAsync(
+        cstrName.c_str(), branchOps, listener, client_data);
+}
+
+DslReturnType dsl_tee_pph_add(const wchar_t* name, const wchar_t* handler)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(handler);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+    std::wstring wstrHandler(handler);
+    std::string cstrHandler(wstrHandler.begin(), wstrHandler.end());
+    
+    return DSL::Services::GetServices()->TeePphAdd(cstrName.c_str(), 
+        cstrHandler.c_str());
+}
 
 DslReturnType dsl_tee_pph_remove(const wchar_t* name, const wchar_t* handler)
 {
@@ -8932,6 +9327,112 @@ DslReturnType dsl_sink_frame_capture_schedule(const wchar_t* name,
         cstrName.c_str(), frame_number);
 #endif        
 }
+
+DslReturnType dsl_sink_frame_capture_ring_settings_get(const wchar_t* name,
+    uint* width, uint* duration, uint64_t* max_size)
+{
+#if !defined(BUILD_WITH_FFMPEG) || !defined(BUILD_WITH_OPENCV)
+    #error "BUILD_WITH_FFMPEG and BUILD_WITH_OPENCV must be defined"
+#elif (BUILD_WITH_FFMPEG != true) && (BUILD_WITH_OPENCV != true)
+    LOG_ERROR("dsl_sink_frame_capture_new requires one of BUILD_WITH_FFMPEG \
+       or BUILD_WITH_OPENCV to be set true in the Makefile");
+    return DSL_RESULT_API_NOT_SUPPORTED;
+#else    
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(width);
+    RETURN_IF_PARAM_IS_NULL(duration);
+    RETURN_IF_PARAM_IS_NULL(max_size);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->SinkFrameCaptureRingSettingsGet(
+        cstrName.c_str(), width, duration, max_size);
+#endif        
+}
+
+DslReturnType dsl_sink_frame_capture_ring_settings_set(const wchar_t* name,
+    uint width, uint duration, uint64_t max_size)
+{
+#if !defined(BUILD_WITH_FFMPEG) || !defined(BUILD_WITH_OPENCV)
+    #error "BUILD_WITH_FFMPEG and BUILD_WITH_OPENCV must be defined"
+#elif (BUILD_WITH_FFMPEG != true) && (BUILD_WITH_OPENCV != true)
+    LOG_ERROR("dsl_sink_frame_capture_new requires one of BUILD_WITH_FFMPEG \
+       or BUILD_WITH_OPENCV to be set true in the Makefile");
+    return DSL_RESULT_API_NOT_SUPPORTED;
+#else    
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->SinkFrameCaptureRingSettingsSet(
+        cstrName.c_str(), width, duration, max_size);
+#endif        
+}
+
+DslReturnType dsl_sink_frame_capture_ring_size_get(const wchar_t* name,
+    uint* frames, uint64_t* size)
+{
+#if !defined(BUILD_WITH_FFMPEG) || !defined(BUILD_WITH_OPENCV)
+    #error "BUILD_WITH_FFMPEG and BUILD_WITH_OPENCV must be defined"
+#elif (BUILD_WITH_FFMPEG != true) && (BUILD_WITH_OPENCV != true)
+    LOG_ERROR("dsl_sink_frame_capture_new requires one of BUILD_WITH_FFMPEG \
+       or BUILD_WITH_OPENCV to be set true in the Makefile");
+    return DSL_RESULT_API_NOT_SUPPORTED;
+#else    
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(frames);
+    RETURN_IF_PARAM_IS_NULL(size);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->SinkFrameCaptureRingSizeGet(
+        cstrName.c_str(), frames, size);
+#endif        
+}
+
+DslReturnType dsl_sink_frame_capture_ring_initiate(const wchar_t* name,
+    uint64_t timestamp)
+{
+#if !defined(BUILD_WITH_FFMPEG) || !defined(BUILD_WITH_OPENCV)
+    #error "BUILD_WITH_FFMPEG and BUILD_WITH_OPENCV must be defined"
+#elif (BUILD_WITH_FFMPEG != true) && (BUILD_WITH_OPENCV != true)
+    LOG_ERROR("dsl_sink_frame_capture_new requires one of BUILD_WITH_FFMPEG \
+       or BUILD_WITH_OPENCV to be set true in the Makefile");
+    return DSL_RESULT_API_NOT_SUPPORTED;
+#else    
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->SinkFrameCaptureRingInitiate(
+        cstrName.c_str(), timestamp);
+#endif        
+}
+
+DslReturnType dsl_sink_frame_capture_ring_initiate_range(const wchar_t* name,
+    uint64_t start_timestamp, uint64_t end_timestamp, uint* count)
+{
+#if !defined(BUILD_WITH_FFMPEG) || !defined(BUILD_WITH_OPENCV)
+    #error "BUILD_WITH_FFMPEG and BUILD_WITH_OPENCV must be defined"
+#elif (BUILD_WITH_FFMPEG != true) && (BUILD_WITH_OPENCV != true)
+    LOG_ERROR("dsl_sink_frame_capture_new requires one of BUILD_WITH_FFMPEG \
+       or BUILD_WITH_OPENCV to be set true in the Makefile");
+    return DSL_RESULT_API_NOT_SUPPORTED;
+#else    
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(count);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->SinkFrameCaptureRingInitiateRange(
+        cstrName.c_str(), start_timestamp, end_timestamp, count);
+#endif        
+}
  
     
 // NOTE: the WebRTC Sink implementation requires DS 1.18.0 or later
@@ -9192,6 +9693,89 @@ DslReturnType dsl_websocket_server_client_listener_remove(
 #endif    
 }
 
+DslReturnType dsl_websocket_server_topic_add(const wchar_t* topic,
+    uint max_queue_size, uint drop_policy, boolean coalesce)
+{
+#if !defined(BUILD_WEBRTC)
+    #error "BUILD_WEBRTC must be defined"
+#elif BUILD_WEBRTC != true
+    LOG_ERROR("WebRTC & WebSocket services require BUILD_WEBRTC to be set to true \
+        in the Makefile");
+    return DSL_RESULT_API_NOT_SUPPORTED;
+#else
+    RETURN_IF_PARAM_IS_NULL(topic);
+
+    std::wstring wstrTopic(topic);
+    std::string cstrTopic(wstrTopic.begin(), wstrTopic.end());
+
+    return DSL::Services::GetServices()->WebsocketServerTopicAdd(
+        cstrTopic.c_str(), max_queue_size, drop_policy, coalesce);
+#endif    
+}
+
+DslReturnType dsl_websocket_server_topic_remove(const wchar_t* topic)
+{
+#if !defined(BUILD_WEBRTC)
+    #error "BUILD_WEBRTC must be defined"
+#elif BUILD_WEBRTC != true
+    LOG_ERROR("WebRTC & WebSocket services require BUILD_WEBRTC to be set to true \
+        in the Makefile");
+    return DSL_RESULT_API_NOT_SUPPORTED;
+#else
+    RETURN_IF_PARAM_IS_NULL(topic);
+
+    std::wstring wstrTopic(topic);
+    std::string cstrTopic(wstrTopic.begin(), wstrTopic.end());
+
+    return DSL::Services::GetServices()->WebsocketServerTopicRemove(
+        cstrTopic.c_str());
+#endif    
+}
+
+DslReturnType dsl_websocket_server_topic_publish(const wchar_t* topic,
+    const wchar_t* message)
+{
+#if !defined(BUILD_WEBRTC)
+    #error "BUILD_WEBRTC must be defined"
+#elif BUILD_WEBRTC != true
+    LOG_ERROR("WebRTC & WebSocket services require BUILD_WEBRTC to be set to true \
+        in the Makefile");
+    return DSL_RESULT_API_NOT_SUPPORTED;
+#else
+    RETURN_IF_PARAM_IS_NULL(topic);
+    RETURN_IF_PARAM_IS_NULL(message);
+
+    std::wstring wstrTopic(topic);
+    std::string cstrTopic(wstrTopic.begin(), wstrTopic.end());
+    std::wstring wstrMessage(message);
+    std::string cstrMessage(wstrMessage.begin(), wstrMessage.end());
+
+    return DSL::Services::GetServices()->WebsocketServerTopicPublish(
+        cstrTopic.c_str(), cstrMessage.c_str());
+#endif    
+}
+
+DslReturnType dsl_websocket_server_topic_metrics_get(const wchar_t* topic,
+    dsl_websocket_topic_metrics* metrics)
+{
+#if !defined(BUILD_WEBRTC)
+    #error "BUILD_WEBRTC must be defined"
+#elif BUILD_WEBRTC != true
+    LOG_ERROR("WebRTC & WebSocket services require BUILD_WEBRTC to be set to true \
+        in the Makefile");
+    return DSL_RESULT_API_NOT_SUPPORTED;
+#else
+    RETURN_IF_PARAM_IS_NULL(topic);
+    RETURN_IF_PARAM_IS_NULL(metrics);
+
+    std::wstring wstrTopic(topic);
+    std::string cstrTopic(wstrTopic.begin(), wstrTopic.end());
+
+    return DSL::Services::GetServices()->WebsocketServerTopicMetricsGet(
+        cstrTopic.c_str(), metrics);
+#endif    
+}
+
 DslReturnType dsl_sink_message_new(const wchar_t* name, 
     const wchar_t* converter_config_file, uint payload_type, 
     const wchar_t* broker_config_file, const wchar_t* protocol_lib, 
@@ -10142,6 +10726,76 @@ DslReturnType dsl_component_queue_min_threshold_set_many(const wchar_t** names,
     return DSL_RESULT_SUCCESS;
 }
 
+DslReturnType dsl_component_queue_auto_size_get(const wchar_t* name, 
+    uint unit, uint64_t* min_size, uint64_t* max_size)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(min_size);
+    RETURN_IF_PARAM_IS_NULL(max_size);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->ComponentQueueAutoSizeGet(
+        cstrName.c_str(), unit, min_size, max_size);
+}
+
+DslReturnType dsl_component_queue_auto_size_set(const wchar_t* name, 
+    uint unit, uint64_t min_size, uint64_t max_size)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->ComponentQueueAutoSizeSet(
+        cstrName.c_str(), unit, min_size, max_size);
+}
+
+DslReturnType dsl_component_queue_auto_size_set_many(const wchar_t** names, 
+    uint unit, uint64_t min_size, uint64_t max_size)
+{
+    RETURN_IF_PARAM_IS_NULL(names);
+
+    for (const wchar_t** name = names; *name; name++)
+    {
+        std::wstring wstrName(*name);
+        std::string cstrName(wstrName.begin(), wstrName.end());
+        DslReturnType retval = DSL::Services::GetServices()->
+            ComponentQueueAutoSizeSet(cstrName.c_str(), unit, min_size, max_size);
+        if (retval != DSL_RESULT_SUCCESS)
+        {
+            return retval;
+        }
+    }
+    return DSL_RESULT_SUCCESS;
+}
+
+DslReturnType dsl_component_queue_auto_leaky_enabled_get(const wchar_t* name, 
+    boolean* enabled)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(enabled);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->ComponentQueueAutoLeakyEnabledGet(
+        cstrName.c_str(), enabled);
+}
+
+DslReturnType dsl_component_queue_auto_leaky_enabled_set(const wchar_t* name, 
+    boolean enabled)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->ComponentQueueAutoLeakyEnabledSet(
+        cstrName.c_str(), enabled);
+}
+
 DslReturnType dsl_component_queue_overrun_listener_add(const wchar_t* name, 
     dsl_component_queue_overrun_listener_cb listener, void* client_data)
 {
@@ -10351,6 +11005,44 @@ DslReturnType dsl_component_nvbuf_mem_type_set_many(const wchar_t** names, uint
     return DSL_RESULT_SUCCESS;
 }
 
+DslReturnType dsl_component_property_batch_set(
+    const dsl_component_property* properties, uint count, DslReturnType* results)
+{
+    RETURN_IF_PARAM_IS_NULL(properties);
+    RETURN_IF_PARAM_IS_NULL(results);
+
+    // convert all wide strings up front so the batch can be validated 
+    // and applied under a single Services lock.
+    std::vector<DSL::PropertySetting> settings(count);
+    
+    for (uint i = 0; i < count; i++)
+    {
+        RETURN_IF_PARAM_IS_NULL(properties[i].name);
+        RETURN_IF_PARAM_IS_NULL(properties[i].property);
+
+        std::wstring wstrName(properties[i].name);
+        settings[i].name.assign(wstrName.begin(), wstrName.end());
+        std::wstring wstrProperty(properties[i].property);
+        settings[i].property.assign(wstrProperty.begin(), wstrProperty.end());
+
+        settings[i].type = properties[i].type;
+        settings[i].booleanValue = properties[i].boolean_value;
+        settings[i].intValue = properties[i].int_value;
+        settings[i].uintValue = properties[i].uint_value;
+        settings[i].floatValue = properties[i].float_value;
+
+        if (properties[i].type == DSL_COMPONENT_PROPERTY_TYPE_STRING)
+        {
+            RETURN_IF_PARAM_IS_NULL(properties[i].string_value);
+            
+            std::wstring wstrValue(properties[i].string_value);
+            settings[i].stringValue.assign(wstrValue.begin(), wstrValue.end());
+        }
+    }
+    return DSL::Services::GetServices()->ComponentPropertyBatchSet(
+        settings, results);
+}
+
 DslReturnType dsl_branch_new(const wchar_t* name)
 {
     RETURN_IF_PARAM_IS_NULL(name);
@@ -11124,47 +11816,304 @@ DslReturnType dsl_pipeline_dump_to_dot_with_ts(const wchar_t* name,
         cstrFilename.c_str());
 }
 
-DslReturnType dsl_pipeline_state_change_listener_add(const wchar_t* name, 
-    dsl_state_change_listener_cb listener, void* client_data)
+DslReturnType dsl_pipeline_queue_sampler_settings_get(const wchar_t* name, 
+    uint* interval, uint* window_size)
 {
     RETURN_IF_PARAM_IS_NULL(name);
-    RETURN_IF_PARAM_IS_NULL(listener);
+    RETURN_IF_PARAM_IS_NULL(interval);
+    RETURN_IF_PARAM_IS_NULL(window_size);
 
     std::wstring wstrName(name);
     std::string cstrName(wstrName.begin(), wstrName.end());
 
-    return DSL::Services::GetServices()->
-        PipelineStateChangeListenerAdd(cstrName.c_str(), listener, client_data);
+    return DSL::Services::GetServices()->PipelineQueueSamplerSettingsGet(
+        cstrName.c_str(), interval, window_size);
 }
 
-DslReturnType dsl_pipeline_state_change_listener_remove(const wchar_t* name, 
-    dsl_state_change_listener_cb listener)
+DslReturnType dsl_pipeline_queue_sampler_settings_set(const wchar_t* name, 
+    uint interval, uint window_size)
 {
     RETURN_IF_PARAM_IS_NULL(name);
-    RETURN_IF_PARAM_IS_NULL(listener);
 
     std::wstring wstrName(name);
     std::string cstrName(wstrName.begin(), wstrName.end());
 
-    return DSL::Services::GetServices()->
-        PipelineStateChangeListenerRemove(cstrName.c_str(), listener);
+    return DSL::Services::GetServices()->PipelineQueueSamplerSettingsSet(
+        cstrName.c_str(), interval, window_size);
 }
 
-DslReturnType dsl_pipeline_eos_listener_add(const wchar_t* name, 
-    dsl_eos_listener_cb listener, void* client_data)
+DslReturnType dsl_pipeline_queue_sampler_enabled_get(const wchar_t* name, 
+    boolean* enabled)
 {
     RETURN_IF_PARAM_IS_NULL(name);
-    RETURN_IF_PARAM_IS_NULL(listener);
+    RETURN_IF_PARAM_IS_NULL(enabled);
 
     std::wstring wstrName(name);
     std::string cstrName(wstrName.begin(), wstrName.end());
 
-    return DSL::Services::GetServices()->
-        PipelineEosListenerAdd(cstrName.c_str(), listener, client_data);
+    return DSL::Services::GetServices()->PipelineQueueSamplerEnabledGet(
+        cstrName.c_str(), enabled);
 }
 
-DslReturnType dsl_pipeline_eos_listener_remove(const wchar_t* name, 
-    dsl_eos_listener_cb listener)
+DslReturnType dsl_pipeline_queue_sampler_enabled_set(const wchar_t* name, 
+    boolean enabled)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelineQueueSamplerEnabledSet(
+        cstrName.c_str(), enabled);
+}
+
+DslReturnType dsl_pipeline_queue_telemetry_get(const wchar_t* name, 
+    const dsl_queue_telemetry** telemetry, uint* size)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(telemetry);
+    RETURN_IF_PARAM_IS_NULL(size);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelineQueueTelemetryGet(
+        cstrName.c_str(), telemetry, size);
+}
+
+DslReturnType dsl_pipeline_queue_telemetry_clear(const wchar_t* name)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelineQueueTelemetryClear(
+        cstrName.c_str());
+}
+
+DslReturnType dsl_pipeline_queue_bottleneck_get(const wchar_t* name, 
+    const wchar_t** component)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(component);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelineQueueBottleneckGet(
+        cstrName.c_str(), component);
+}
+
+DslReturnType dsl_pipeline_infer_interval_bounds_get(const wchar_t* name, 
+    uint* min_interval, uint* max_interval)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(min_interval);
+    RETURN_IF_PARAM_IS_NULL(max_interval);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelineInferIntervalBoundsGet(
+        cstrName.c_str(), min_interval, max_interval);
+}
+
+DslReturnType dsl_pipeline_infer_interval_bounds_set(const wchar_t* name, 
+    uint min_interval, uint max_interval)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelineInferIntervalBoundsSet(
+        cstrName.c_str(), min_interval, max_interval);
+}
+
+DslReturnType dsl_pipeline_infer_interval_thresholds_get(const wchar_t* name, 
+    uint* low_occupancy, uint* high_occupancy, uint* max_latency, uint* min_fps)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(low_occupancy);
+    RETURN_IF_PARAM_IS_NULL(high_occupancy);
+    RETURN_IF_PARAM_IS_NULL(max_latency);
+    RETURN_IF_PARAM_IS_NULL(min_fps);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelineInferIntervalThresholdsGet(
+        cstrName.c_str(), low_occupancy, high_occupancy, max_latency, min_fps);
+}
+
+DslReturnType dsl_pipeline_infer_interval_thresholds_set(const wchar_t* name, 
+    uint low_occupancy, uint high_occupancy, uint max_latency, uint min_fps)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelineInferIntervalThresholdsSet(
+        cstrName.c_str(), low_occupancy, high_occupancy, max_latency, min_fps);
+}
+
+DslReturnType dsl_pipeline_infer_interval_hysteresis_get(const wchar_t* name, 
+    uint* update_interval, uint* step_up_count, uint* step_down_count)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(update_interval);
+    RETURN_IF_PARAM_IS_NULL(step_up_count);
+    RETURN_IF_PARAM_IS_NULL(step_down_count);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelineInferIntervalHysteresisGet(
+        cstrName.c_str(), update_interval, step_up_count, step_down_count);
+}
+
+DslReturnType dsl_pipeline_infer_interval_hysteresis_set(const wchar_t* name, 
+    uint update_interval, uint step_up_count, uint step_down_count)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelineInferIntervalHysteresisSet(
+        cstrName.c_str(), update_interval, step_up_count, step_down_count);
+}
+
+DslReturnType dsl_pipeline_infer_interval_controller_enabled_get(const wchar_t* name, 
+    boolean* enabled)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(enabled);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelineInferIntervalControllerEnabledGet(
+        cstrName.c_str(), enabled);
+}
+
+DslReturnType dsl_pipeline_infer_interval_controller_enabled_set(const wchar_t* name, 
+    boolean enabled)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelineInferIntervalControllerEnabledSet(
+        cstrName.c_str(), enabled);
+}
+
+DslReturnType dsl_pipeline_infer_interval_load_report(const wchar_t* name, 
+    double fps, uint latency)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelineInferIntervalLoadReport(
+        cstrName.c_str(), fps, latency);
+}
+
+DslReturnType dsl_pipeline_infer_interval_metrics_get(const wchar_t* name, 
+    dsl_infer_interval_metrics* metrics)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(metrics);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelineInferIntervalMetricsGet(
+        cstrName.c_str(), metrics);
+}
+
+DslReturnType dsl_pipeline_infer_interval_metrics_clear(const wchar_t* name)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelineInferIntervalMetricsClear(
+        cstrName.c_str());
+}
+
+DslReturnType dsl_pipeline_infer_interval_change_listener_add(const wchar_t* name, 
+    dsl_infer_interval_change_listener_cb listener, void* client_data)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(listener);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelineInferIntervalChangeListenerAdd(
+        cstrName.c_str(), listener, client_data);
+}
+
+DslReturnType dsl_pipeline_infer_interval_change_listener_remove(const wchar_t* name, 
+    dsl_infer_interval_change_listener_cb listener)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(listener);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelineInferIntervalChangeListenerRemove(
+        cstrName.c_str(), listener);
+}
+
+DslReturnType dsl_pipeline_state_change_listener_add(const wchar_t* name, 
+    dsl_state_change_listener_cb listener, void* client_data)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(listener);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->
+        PipelineStateChangeListenerAdd(cstrName.c_str(), listener, client_data);
+}
+
+DslReturnType dsl_pipeline_state_change_listener_remove(const wchar_t* name, 
+    dsl_state_change_listener_cb listener)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(listener);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->
+        PipelineStateChangeListenerRemove(cstrName.c_str(), listener);
+}
+
+DslReturnType dsl_pipeline_eos_listener_add(const wchar_t* name, 
+    dsl_eos_listener_cb listener, void* client_data)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(listener);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->
+        PipelineEosListenerAdd(cstrName.c_str(), listener, client_data);
+}
+
+DslReturnType dsl_pipeline_eos_listener_remove(const wchar_t* name, 
+    dsl_eos_listener_cb listener)
 {
     RETURN_IF_PARAM_IS_NULL(name);
     RETURN_IF_PARAM_IS_NULL(listener);
@@ -11297,6 +12246,166 @@ DslReturnType dsl_pipeline_main_loop_delete(const wchar_t* name)
         PipelineMainLoopDelete(cstrName.c_str());
 }
 
+DslReturnType dsl_pipeline_time_to_first_frame_get(const wchar_t* name,
+    double* time_to_first_frame)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(time_to_first_frame);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelineTimeToFirstFrameGet(
+        cstrName.c_str(), time_to_first_frame);
+}
+
+DslReturnType dsl_pipeline_startup_profile_get(const wchar_t* name,
+    dsl_pipeline_startup_profile* profile, 
+    const dsl_pipeline_startup_event** events, uint* size)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(profile);
+    RETURN_IF_PARAM_IS_NULL(events);
+    RETURN_IF_PARAM_IS_NULL(size);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelineStartupProfileGet(
+        cstrName.c_str(), profile, events, size);
+}
+
+DslReturnType dsl_pipeline_pool_new(const wchar_t* name, 
+    const wchar_t** pipelines, uint standby_state, boolean is_live)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(pipelines);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+    
+    DslReturnType retval = DSL::Services::GetServices()->PipelinePoolNew(
+        cstrName.c_str(), standby_state, is_live);
+    if (retval != DSL_RESULT_SUCCESS)
+    {
+        return retval;
+    }
+    for (const wchar_t** pipeline = pipelines; *pipeline; pipeline++)
+    {
+        std::wstring wstrPipeline(*pipeline);
+        std::string cstrPipeline(wstrPipeline.begin(), wstrPipeline.end());
+        DslReturnType retval = DSL::Services::GetServices()->
+            PipelinePoolPipelineAdd(cstrName.c_str(), cstrPipeline.c_str());
+        if (retval != DSL_RESULT_SUCCESS)
+        {
+            return retval;
+        }
+    }
+    return DSL_RESULT_SUCCESS;
+}
+
+DslReturnType dsl_pipeline_pool_delete(const wchar_t* name)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelinePoolDelete(cstrName.c_str());
+}
+
+DslReturnType dsl_pipeline_pool_delete_all()
+{
+    return DSL::Services::GetServices()->PipelinePoolDeleteAll();
+}
+
+uint dsl_pipeline_pool_list_size()
+{
+    return DSL::Services::GetServices()->PipelinePoolListSize();
+}
+
+DslReturnType dsl_pipeline_pool_acquire(const wchar_t* name, 
+    const wchar_t** sources, const wchar_t** pipeline)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(sources);
+    RETURN_IF_PARAM_IS_NULL(pipeline);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+    
+    // Convert the NULL terminated list of Sources so that all Sources are
+    // added, or none, with a single call.
+    std::vector<std::string> cstrSources;
+    for (const wchar_t** source = sources; *source; source++)
+    {
+        std::wstring wstrSource(*source);
+        cstrSources.push_back(std::string(wstrSource.begin(), wstrSource.end()));
+    }
+    std::vector<const char*> cstrSourcePtrs;
+    for (auto const& ivec: cstrSources)
+    {
+        cstrSourcePtrs.push_back(ivec.c_str());
+    }
+    cstrSourcePtrs.push_back(NULL);
+
+    return DSL::Services::GetServices()->PipelinePoolAcquire(
+        cstrName.c_str(), &cstrSourcePtrs[0], pipeline);
+}
+
+DslReturnType dsl_pipeline_pool_release(const wchar_t* name, 
+    const wchar_t* pipeline)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(pipeline);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+    std::wstring wstrPipeline(pipeline);
+    std::string cstrPipeline(wstrPipeline.begin(), wstrPipeline.end());
+
+    return DSL::Services::GetServices()->PipelinePoolRelease(
+        cstrName.c_str(), cstrPipeline.c_str());
+}
+
+DslReturnType dsl_pipeline_pool_size_get(const wchar_t* name, 
+    uint* size, uint* available)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(size);
+    RETURN_IF_PARAM_IS_NULL(available);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelinePoolSizeGet(
+        cstrName.c_str(), size, available);
+}
+
+DslReturnType dsl_pipeline_pool_metrics_get(const wchar_t* name, 
+    dsl_pipeline_pool_metrics* metrics)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(metrics);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelinePoolMetricsGet(
+        cstrName.c_str(), metrics);
+}
+
+DslReturnType dsl_pipeline_pool_metrics_clear(const wchar_t* name)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelinePoolMetricsClear(
+        cstrName.c_str());
+}
+
 DslReturnType dsl_player_new(const wchar_t* name,
     const wchar_t* file_source, const wchar_t* sink)
 {
@@ -12247,3 +13356,12 @@ DslReturnType dsl_info_log_function_restore()
     return DSL::Services::GetServices()->InfoLogFunctionRestore();
 }
 
+DslReturnType dsl_info_stalled_sources_get(const dsl_stalled_source** sources,
+    uint* size)
+{
+    RETURN_IF_PARAM_IS_NULL(sources);
+    RETURN_IF_PARAM_IS_NULL(size);
+
+    return DSL::Services::GetServices()->InfoStalledSourcesGet(sources, size);
+}
+
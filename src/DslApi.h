@@ -66,6 +66,8 @@ THE SOFTWARE.
 #define DSL_RESULT_COMPONENT_ELEMENT_ADD_FAILED                     0x0001000F
 #define DSL_RESULT_COMPONENT_ELEMENT_REMOVE_FAILED                  0x00010010
 #define DSL_RESULT_COMPONENT_ELEMENT_NOT_IN_USE                     0x00010011
+#define DSL_RESULT_COMPONENT_PROPERTY_INVALID                       0x00010012
+#define DSL_RESULT_COMPONENT_PROPERTY_NOT_APPLIED                   0x00010013
 
 /**
  * Source API Return Values
@@ -229,6 +231,7 @@ THE SOFTWARE.
 #define DSL_RESULT_TEE_HANDLER_ADD_FAILED                           0x000A000B
 #define DSL_RESULT_TEE_HANDLER_REMOVE_FAILED                        0x000A000C
 #define DSL_RESULT_TEE_COMPONENT_IS_NOT_TEE                         0x000A000D
+#define DSL_RESULT_TEE_BRANCH_OP_INVALID                            0x000A000E
 
 /**
  * Tile API Return Values
@@ -270,6 +273,13 @@ THE SOFTWARE.
 #define DSL_RESULT_PIPELINE_GET_FAILED                              0x00080013
 #define DSL_RESULT_PIPELINE_SET_FAILED                              0x00080014
 #define DSL_RESULT_PIPELINE_MAIN_LOOP_REQUEST_FAILED                0x00080015
+#define DSL_RESULT_PIPELINE_POOL_NAME_NOT_UNIQUE                    0x00080016
+#define DSL_RESULT_PIPELINE_POOL_NAME_NOT_FOUND                     0x00080017
+#define DSL_RESULT_PIPELINE_POOL_IN_USE                             0x00080018
+#define DSL_RESULT_PIPELINE_POOL_EXHAUSTED                          0x00080019
+#define DSL_RESULT_PIPELINE_POOL_STANDBY_FAILED                     0x0008001A
+#define DSL_RESULT_PIPELINE_POOL_ACQUIRE_FAILED                     0x0008001B
+#define DSL_RESULT_PIPELINE_POOL_RELEASE_FAILED                     0x0008001C
 
 #define DSL_RESULT_BRANCH_RESULT                                    0x000B0000
 #define DSL_RESULT_BRANCH_NAME_NOT_UNIQUE                           0x000B0001
@@ -295,6 +305,9 @@ THE SOFTWARE.
 #define DSL_RESULT_PPH_ODE_TRIGGER_NOT_IN_USE                       0x000D0009
 #define DSL_RESULT_PPH_METER_INVALID_INTERVAL                       0x000D000A
 #define DSL_RESULT_PPH_PAD_TYPE_INVALID                             0x000D000B
+#define DSL_RESULT_PPH_CUSTOM_ASYNC_POLICY_INVALID                  0x000D000C
+#define DSL_RESULT_PPH_META_RECORD_FILE_ERROR                       0x000D000D
+#define DSL_RESULT_PPH_META_SHM_CREATE_FAILED                       0x000D000E
 
 /**
  * ODE Trigger API Return Values
@@ -433,6 +446,9 @@ THE SOFTWARE.
 #define DSL_RESULT_WEBSOCKET_SERVER_SET_FAILED                      0x00700002
 #define DSL_RESULT_WEBSOCKET_SERVER_CLIENT_LISTENER_ADD_FAILED      0x00700003
 #define DSL_RESULT_WEBSOCKET_SERVER_CLIENT_LISTENER_REMOVE_FAILED   0x00700004
+#define DSL_RESULT_WEBSOCKET_SERVER_TOPIC_NOT_FOUND                 0x00700005
+#define DSL_RESULT_WEBSOCKET_SERVER_TOPIC_NOT_UNIQUE                0x00700006
+#define DSL_RESULT_WEBSOCKET_SERVER_TOPIC_PUBLISH_FAILED            0x00700007
 
 /**
  * Message Broker API Return Values
@@ -558,6 +574,16 @@ THE SOFTWARE.
 #define DSL_PPH_EVENT_STREAM_DELETED                                1
 #define DSL_PPH_EVENT_STREAM_ENDED                                  2
 
+/**
+ * @brief DSL Custom Pad Probe Handler - asynchronous queue-full policies
+ */
+#define DSL_PPH_CUSTOM_ASYNC_POLICY_DROP                            0
+#define DSL_PPH_CUSTOM_ASYNC_POLICY_SAMPLE                          1
+#define DSL_PPH_CUSTOM_ASYNC_POLICY_BLOCK                           2
+
+#define DSL_PPH_CUSTOM_ASYNC_DEFAULT_MAX_SIZE                       8
+#define DSL_PPH_CUSTOM_ASYNC_DEFAULT_SAMPLE_INTERVAL                4
+
 /**
  * @brief DSL Stream Format Types
  */
@@ -680,6 +706,26 @@ THE SOFTWARE.
  */
 #define DSL_WEBSOCKET_SERVER_DEFAULT_WEBSOCKET_PORT                 60001
 
+/**
+ * @brief Websocket path served by the Soup Server Manager for clients
+ * subscribing to published Topics.
+ */
+#define DSL_WEBSOCKET_SERVER_PUBLISH_PATH                           L"/pubsub"
+
+/**
+ * @brief Drop policies for a Websocket Topic, applied when a subscribed 
+ * client's bounded send-queue for the Topic is full.
+ */
+#define DSL_WEBSOCKET_TOPIC_DROP_POLICY_DROP_OLDEST                 0
+#define DSL_WEBSOCKET_TOPIC_DROP_POLICY_DROP_NEWEST                 1
+#define DSL_WEBSOCKET_TOPIC_DROP_POLICY_DISCONNECT                  2
+
+/**
+ * @brief Default maximum number of unsent messages queued per client 
+ * for a Websocket Topic.
+ */
+#define DSL_WEBSOCKET_TOPIC_DEFAULT_MAX_QUEUE_SIZE                  16
+
 /**
  * @brief WebRTC Websocket connection states, used by the 
  * WebRTC to communicate current state to listening clients 
@@ -772,6 +818,65 @@ THE SOFTWARE.
 #define DSL_COMPONENT_QUEUE_UNIT_OF_BYTES                           1
 #define DSL_COMPONENT_QUEUE_UNIT_OF_TIME                            2
 
+/**
+ * @brief Component property value types - identifies which value member
+ * of a dsl_component_property structure is set.
+*/
+#define DSL_COMPONENT_PROPERTY_TYPE_BOOLEAN                         0
+#define DSL_COMPONENT_PROPERTY_TYPE_INT                             1
+#define DSL_COMPONENT_PROPERTY_TYPE_UINT                            2
+#define DSL_COMPONENT_PROPERTY_TYPE_FLOAT                           3
+#define DSL_COMPONENT_PROPERTY_TYPE_STRING                          4
+
+/**
+ * @brief Default Pipeline Queue Sampler settings - sample interval in
+ * milliseconds and the number of samples retained per Component queue.
+*/
+#define DSL_QUEUE_SAMPLER_DEFAULT_INTERVAL                          100
+#define DSL_QUEUE_SAMPLER_DEFAULT_WINDOW_SIZE                       600
+
+/**
+ * @brief Queue auto-size thresholds as a percentage of max-size occupancy,
+ * and the number of samples between auto-size updates.
+*/
+#define DSL_QUEUE_AUTO_SIZE_GROW_THRESHOLD                          90
+#define DSL_QUEUE_AUTO_SIZE_SHRINK_THRESHOLD                        25
+#define DSL_QUEUE_AUTO_SIZE_UPDATE_SAMPLES                          10
+
+/**
+ * @brief Minimum p90 occupancy (percent) for a Component queue, without
+ * overruns, to be identified as the Pipeline's bottleneck.
+*/
+#define DSL_QUEUE_BOTTLENECK_THRESHOLD                              75
+
+/**
+ * @brief Default Pipeline Infer Interval Controller settings - update interval 
+ * in milliseconds, load-shedding interval bounds, queue occupancy thresholds 
+ * as a percentage of max-size, and the number of consecutive overloaded or 
+ * underloaded updates required to step the interval up or down (hysteresis).
+*/
+#define DSL_INFER_INTERVAL_DEFAULT_UPDATE_INTERVAL                  1000
+#define DSL_INFER_INTERVAL_DEFAULT_MIN_INTERVAL                     0
+#define DSL_INFER_INTERVAL_DEFAULT_MAX_INTERVAL                     4
+#define DSL_INFER_INTERVAL_DEFAULT_LOW_OCCUPANCY                    30
+#define DSL_INFER_INTERVAL_DEFAULT_HIGH_OCCUPANCY                   80
+#define DSL_INFER_INTERVAL_DEFAULT_STEP_UP_COUNT                    2
+#define DSL_INFER_INTERVAL_DEFAULT_STEP_DOWN_COUNT                  5
+
+/**
+ * @brief Reported latency, as a percentage of the max-latency threshold, 
+ * that must be reached before the Infer Interval Controller steps down.
+*/
+#define DSL_INFER_INTERVAL_LATENCY_RECOVERY_PERCENT                 75
+
+/**
+ * @brief Pipeline startup profile event types.
+*/
+#define DSL_PIPELINE_STARTUP_EVENT_STATE_CHANGE                     0
+#define DSL_PIPELINE_STARTUP_EVENT_LINK                             1
+#define DSL_PIPELINE_STARTUP_EVENT_UNLINK                           2
+#define DSL_PIPELINE_STARTUP_EVENT_FIRST_BUFFER                     3
+
 /**
  * @brief Predefined Color Constants - rows 1 and 2.
  */
@@ -956,6 +1061,20 @@ THE SOFTWARE.
 
 #define DSL_TEE_DEFAULT_BLOCKING_TIMEOUT_IN_SEC                     1
 
+/**
+ * @brief Tee Branch Operations, applied as a batch with 
+ * dsl_tee_branch_ops_apply or dsl_tee_branch_ops_apply_async.
+ */
+#define DSL_TEE_BRANCH_OP_ADD                                       0
+#define DSL_TEE_BRANCH_OP_REMOVE                                    1
+#define DSL_TEE_BRANCH_OP_MOVE_TO                                   2
+
+/**
+ * @brief stream-id for a Tee Branch Operation that does not target a 
+ * specific stream, i.e. the next available stream is used.
+ */
+#define DSL_TEE_BRANCH_ANY_STREAM                                   0xFFFFFFFF
+
 #define DSL_BBOX_POINT_CENTER                                       0
 #define DSL_BBOX_POINT_NORTH_WEST                                   1
 #define DSL_BBOX_POINT_NORTH                                        2
@@ -1396,187 +1515,1063 @@ typedef struct _dsl_ode_occurrence_object_info
     /**
      * @brief tracker confidence if current frame was not inferred on.
      */
-    float tracker_confidence;
+    float tracker_confidence;
+
+    /**
+     * @brief the Object's bounding box left coordinate in pixels.
+     */
+    uint left;
+    
+    /**
+     * @brief the Object's bounding box top coordinate in pixels.
+     */
+    uint top;
+    
+    /**
+     * @brief the Object's bounding box width in pixels.
+     */
+    uint width;
+    
+    /**
+     * @brief the Object's bounding box height in pixels.
+     */
+    uint height;
+    
+} dsl_ode_occurrence_object_info;
+
+/**
+ * @struct _dsl_ode_occurrence_accumulative_info
+ * @brief Accumulative ODE Occurrence metrics provided to the 
+ * client on callback.
+ */
+typedef struct _dsl_ode_occurrence_accumulative_info
+{
+    /**
+     * @brief the total number of object detection occurrences for the 
+     * frame-level ODE occurrence - Count, New-High, New-Low Triggers
+     * or from an ODE accumulator.
+     */
+    uint occurrences_total;
+    
+    /**
+     * @brief the number of Line-Cross ODE occurrences in the "in-direction".
+     * Requires an ODE Cross-Trigger with ODE Accumulator
+     */
+    uint occurrences_in;
+
+    /**
+     * @brief the number of Line-Cross ODE occurrences in the "out-direction".
+     * Requires an ODE Cross-Trigger with ODE Accumulator
+     */
+    uint occurrences_out;
+
+} dsl_ode_occurrence_accumulative_info;
+
+
+/**
+ * @struct dsl_ode_occurrence_criteria_info
+ * @brief ODE Trigger Criteria used for the ODE Occurrence.
+ */
+typedef struct _dsl_ode_occurrence_criteria_info
+{
+    /**
+     * @brief class id filter for ODE occurrence
+     */
+    uint class_id;
+    
+    /**
+     * @brief inference id filter for ODE occurrence
+     */
+    uint inference_component_id;
+    
+    /**
+     * @brief the minimum inference confidence to trigger an ODE occurrence.
+     */
+    float min_inference_confidence;
+    
+    /**
+     * @brief the minimum tracker confidence to trigger an ODE occurrence.
+     */
+    float min_tracker_confidence;
+    
+    /**
+     * @brief inference must be performed to trigger an ODE occurrence.
+     */
+    boolean inference_done_only;
+     
+    /**
+     * @brief the minimum bounding box width to trigger an ODE occurrence.
+     */
+    uint min_width;
+    
+    /**
+     * @brief the minimum bounding box height to trigger an ODE occurrence.
+     */
+    uint min_height;
+    
+    /**
+     * @brief the maximum bounding box width to trigger an ODE occurrence.
+     */
+    uint max_width;
+    
+    /**
+     * @brief the maximum bounding box height to trigger an ODE occurrence.
+     */
+    uint max_height;
+    
+    /**
+     * @brief the interval for checking for an ODE occurrence.
+     */
+    uint interval;
+    
+} dsl_ode_occurrence_criteria_info;
+
+/**
+ * @struct dsl_ode_occurrence_info
+ * @brief ODE Occurrence information provided to the client on callback
+ */
+typedef struct _dsl_ode_occurrence_info
+{
+    /**
+     * @brief the unique name of the ODE Trigger that triggered the occurrence
+     */
+    const wchar_t* trigger_name;
+    
+    /**
+     * @brief unique occurrence Id for this occurrence.
+     */
+    uint64_t unique_ode_id;
+    
+    /**
+     * @brief Network Time for this event.
+     */
+    uint64_t ntp_timestamp;
+    
+    /**
+     * @brief Video Source information this ODE Occurrence
+     */
+    dsl_ode_occurrence_source_info source_info;
+
+    /**
+     * @brief true if the ODE occurrence information is for a specific object,
+     * false for frame-level multi-object events. (absence, new-high count, etc.). 
+     */
+    boolean is_object_occurrence;
+    
+    // NOTE: object_info and accumulative_info are mutually exclusive
+    // determined by the boolean is_object_occurrence flag above.
+    
+    /**
+     * @brief Object information if object_occurrence == true
+     */
+    dsl_ode_occurrence_object_info object_info;
+    
+    /**
+     * @brief Accumulative information if object_occurrence == false
+     */
+    dsl_ode_occurrence_accumulative_info accumulative_info;
+    
+    /**
+     * @brief Trigger Criteria information for this ODE occurrence.
+     */
+    dsl_ode_occurrence_criteria_info criteria_info;
+       
+} dsl_ode_occurrence_info;
+
+/**
+ * @brief magic string identifying a Metadata Publisher shared-memory segment.
+ */
+#define DSL_META_SHM_MAGIC                                          "DSLSHM"
+
+/**
+ * @brief current version of the Metadata Publisher shared-memory schema.
+ */
+#define DSL_META_SHM_VERSION                                        1
+
+/**
+ * @brief Metadata Publisher frame flags.
+ */
+#define DSL_META_SHM_FRAME_INFER_DONE                               0x00000001
+#define DSL_META_SHM_FRAME_OBJECTS_TRUNCATED                        0x00000002
+
+/**
+ * @struct dsl_meta_shm_header
+ * @brief header at offset 0 of a Metadata Publisher shared-memory segment.
+ * The header is followed by slot_count slots of slot_size bytes. Each slot 
+ * holds one dsl_meta_shm_frame followed by up to max_objects 
+ * dsl_meta_shm_object records. All structures are 8-byte aligned and the 
+ * header and slots are 64-byte (cache-line) aligned.
+ */
+typedef struct _dsl_meta_shm_header
+{
+    /**
+     * @brief null terminated DSL_META_SHM_MAGIC string, written last by
+     * the publisher once the header is complete.
+     */
+    char magic[8];
+
+    /**
+     * @brief schema version, DSL_META_SHM_VERSION.
+     */
+    uint32_t version;
+
+    /**
+     * @brief number of frame slots in the ring buffer.
+     */
+    uint32_t slot_count;
+
+    /**
+     * @brief size of each slot in bytes.
+     */
+    uint32_t slot_size;
+
+    /**
+     * @brief maximum number of object records per frame slot.
+     */
+    uint32_t max_objects;
+
+    /**
+     * @brief sequence number of the last frame published, 0 if none. 
+     * Frame sequence n is written to slot (n-1) % slot_count.
+     */
+    uint64_t write_sequence;
+
+    /**
+     * @brief futex word incremented once for each batch published. 
+     */
+    uint32_t doorbell;
+
+    /**
+     * @brief number of readers currently waiting on the doorbell. The
+     * publisher only makes the futex-wake system call when non-zero.
+     */
+    uint32_t waiters;
+
+    /**
+     * @brief process id of the publisher.
+     */
+    uint32_t writer_pid;
+
+    /**
+     * @brief reserved for future use.
+     */
+    uint32_t reserved[5];
+    
+} dsl_meta_shm_header;
+
+/**
+ * @struct dsl_meta_shm_frame
+ * @brief frame record at the start of each slot, followed by 
+ * object_count dsl_meta_shm_object records.
+ */
+typedef struct _dsl_meta_shm_frame
+{
+    /**
+     * @brief sequence number of the frame. Set to 0 by the publisher while 
+     * the slot is being written. A reader must read the same non-zero 
+     * sequence before and after copying the slot for the copy to be valid.
+     */
+    uint64_t sequence;
+
+    /**
+     * @brief source_id of the frame.
+     */
+    uint32_t source_id;
+
+    /**
+     * @brief batch_id of the frame.
+     */
+    uint32_t batch_id;
+
+    /**
+     * @brief frame_num of the frame.
+     */
+    int64_t frame_num;
+
+    /**
+     * @brief ntp_timestamp of the frame.
+     */
+    uint64_t ntp_timestamp;
+
+    /**
+     * @brief presentation timestamp of the frame's buffer in nanoseconds.
+     */
+    uint64_t buf_pts;
+
+    /**
+     * @brief source_frame_width of the frame.
+     */
+    uint32_t source_frame_width;
+
+    /**
+     * @brief source_frame_height of the frame.
+     */
+    uint32_t source_frame_height;
+
+    /**
+     * @brief number of object records following the frame record.
+     */
+    uint32_t object_count;
+
+    /**
+     * @brief DSL_META_SHM_FRAME flags.
+     */
+    uint32_t flags;
+
+    /**
+     * @brief reserved for future use.
+     */
+    uint64_t reserved;
+    
+} dsl_meta_shm_frame;
+
+/**
+ * @struct dsl_meta_shm_object
+ * @brief object record published for each object in a frame.
+ */
+typedef struct _dsl_meta_shm_object
+{
+    /**
+     * @brief object_id (tracking id) of the object.
+     */
+    uint64_t object_id;
+
+    /**
+     * @brief class_id of the object.
+     */
+    int32_t class_id;
+
+    /**
+     * @brief unique_component_id of the inference component.
+     */
+    int32_t infer_id;
+
+    /**
+     * @brief inference confidence of the object.
+     */
+    float confidence;
+
+    /**
+     * @brief tracker confidence of the object.
+     */
+    float tracker_confidence;
+
+    /**
+     * @brief bounding box of the object.
+     */
+    float left;
+    float top;
+    float width;
+    float height;
+    
+} dsl_meta_shm_object;
+
+/**
+ * @struct _dsl_threshold_value
+ * @brief defines an abstract class that contains two data points; a
+ * minimum threshold and a value to use if the threshold is met.
+ */
+typedef struct _dsl_threshold_value
+{
+    /**
+     * @brief the minimum threshold that defines when value is first valid.
+     */
+    uint threshold;
+
+    /**
+     * @brief the value to use if the minimum threshold is met.
+     */
+    uint value;
+    
+} dsl_threshold_value;
+
+/**
+ * @struct _dsl_component_property
+ * @brief a single property setting for a named Component or GST Element
+ * as applied by dsl_component_property_batch_set.
+ */
+typedef struct _dsl_component_property
+{
+    /**
+     * @brief unique name of the GST Element or Component to update.
+     */
+    const wchar_t* name;
+
+    /**
+     * @brief name of the property to update. 
+     */
+    const wchar_t* property;
+
+    /**
+     * @brief one of the DSL_COMPONENT_PROPERTY_TYPE constants, identifies 
+     * which of the value members below is set.
+     */
+    uint type;
+
+    /**
+     * @brief new value for DSL_COMPONENT_PROPERTY_TYPE_BOOLEAN.
+     */
+    boolean boolean_value;
+
+    /**
+     * @brief new value for DSL_COMPONENT_PROPERTY_TYPE_INT.
+     */
+    int64_t int_value;
+
+    /**
+     * @brief new value for DSL_COMPONENT_PROPERTY_TYPE_UINT.
+     */
+    uint64_t uint_value;
+
+    /**
+     * @brief new value for DSL_COMPONENT_PROPERTY_TYPE_FLOAT.
+     */
+    double float_value;
+
+    /**
+     * @brief new value for DSL_COMPONENT_PROPERTY_TYPE_STRING. 
+     * Strings are deserialized for properties of other types, e.g. enum
+     * nicks or caps strings.
+     */
+    const wchar_t* string_value;
+    
+} dsl_component_property;
+
+/**
+ * @struct _dsl_queue_telemetry
+ * @brief Queue telemetry for a single Component as computed by a Pipeline's 
+ * Queue Sampler over the current sampling window.
+ */
+typedef struct _dsl_queue_telemetry
+{
+    /**
+     * @brief unique name of the Component that owns the queue.
+     */
+    const wchar_t* component;
+
+    /**
+     * @brief number of samples currently in the sampling window.
+     */
+    uint samples;
+
+    /**
+     * @brief most recent current-level-buffers sample.
+     */
+    uint64_t current_level_buffers;
+
+    /**
+     * @brief most recent current-level-bytes sample.
+     */
+    uint64_t current_level_bytes;
+
+    /**
+     * @brief most recent current-level-time sample in nanoseconds.
+     */
+    uint64_t current_level_time;
+
+    /**
+     * @brief current max-size-buffers setting, 0 = unlimited.
+     */
+    uint64_t max_size_buffers;
+
+    /**
+     * @brief current max-size-bytes setting, 0 = unlimited.
+     */
+    uint64_t max_size_bytes;
+
+    /**
+     * @brief current max-size-time setting in nanoseconds, 0 = unlimited.
+     */
+    uint64_t max_size_time;
+
+    /**
+     * @brief current leaky setting, one of DSL_COMPONENT_QUEUE_LEAKY_*.
+     */
+    uint leaky;
+
+    /**
+     * @brief 50th percentile occupancy as a percentage of max-size.
+     */
+    double occupancy_p50;
+
+    /**
+     * @brief 90th percentile occupancy as a percentage of max-size.
+     */
+    double occupancy_p90;
+
+    /**
+     * @brief 99th percentile occupancy as a percentage of max-size.
+     */
+    double occupancy_p99;
+
+    /**
+     * @brief maximum occupancy as a percentage of max-size.
+     */
+    double occupancy_max;
+
+    /**
+     * @brief number of queue overruns within the sampling window.
+     */
+    uint64_t overruns;
+
+    /**
+     * @brief rate of queue overruns within the sampling window in overruns/second.
+     */
+    double overrun_rate;
+
+    /**
+     * @brief true if this queue is identified as the Pipeline's bottleneck.
+     */
+    boolean is_bottleneck;
+
+} dsl_queue_telemetry;
+
+/**
+ * @struct _dsl_stalled_source
+ * @brief A single stalled Source or Buffer Timeout Pad Probe Handler as 
+ * reported by the Stall Watchdog.
+ */
+typedef struct _dsl_stalled_source
+{
+    /**
+     * @brief unique name of the RTSP Source or Buffer Timeout PPH.
+     */
+    const wchar_t* name;
+
+    /**
+     * @brief current buffer timeout setting in milliseconds.
+     */
+    uint timeout;
+
+    /**
+     * @brief time since the last buffer in milliseconds. Measured from the 
+     * start of stall detection if no buffer has been received.
+     */
+    uint64_t time_since_last_buffer;
+} dsl_stalled_source;
+
+/**
+ * @struct _dsl_infer_load
+ * @brief Pipeline load as evaluated by a Pipeline's Infer Interval Controller
+ * on each update.
+ */
+typedef struct _dsl_infer_load
+{
+    /**
+     * @brief peak 90th percentile queue occupancy, as a percentage of max-size,
+     * over all Component queues since the last update.
+     */
+    double occupancy;
+
+    /**
+     * @brief total number of queue overruns since the last update.
+     */
+    uint64_t overruns;
+
+    /**
+     * @brief most recently reported frame-rate, 0 = not reported.
+     */
+    double fps;
+
+    /**
+     * @brief most recently reported end-to-end latency in milliseconds,
+     * 0 = not reported.
+     */
+    uint latency;
+
+} dsl_infer_load;
+
+/**
+ * @struct _dsl_infer_interval_metrics
+ * @brief Decision metrics for a Pipeline's Infer Interval Controller.
+ */
+typedef struct _dsl_infer_interval_metrics
+{
+    /**
+     * @brief current load-shedding interval applied to all Infer Components.
+     */
+    uint interval;
+
+    /**
+     * @brief total number of controller updates.
+     */
+    uint64_t updates;
+
+    /**
+     * @brief number of updates that evaluated the Pipeline as overloaded.
+     */
+    uint64_t overloaded_updates;
+
+    /**
+     * @brief number of updates that evaluated the Pipeline as underloaded.
+     */
+    uint64_t underloaded_updates;
+
+    /**
+     * @brief number of times the interval was stepped up to shed load.
+     */
+    uint64_t step_ups;
+
+    /**
+     * @brief number of times the interval was stepped down to recover.
+     */
+    uint64_t step_downs;
+
+    /**
+     * @brief the load evaluated by the most recent update.
+     */
+    dsl_infer_load last_load;
+
+} dsl_infer_interval_metrics;
+
+/**
+ * @struct _dsl_pipeline_pool_metrics
+ * @brief Usage and timing metrics for a Pipeline Pool.
+ */
+typedef struct _dsl_pipeline_pool_metrics
+{
+    /**
+     * @brief number of Pipelines in the Pool.
+     */
+    uint size;
+
+    /**
+     * @brief number of Pipelines in standby, available to acquire.
+     */
+    uint available;
+
+    /**
+     * @brief total number of successful acquisitions.
+     */
+    uint64_t acquisitions;
+
+    /**
+     * @brief total number of successful releases.
+     */
+    uint64_t releases;
+
+    /**
+     * @brief number of acquisitions that failed with no Pipeline available.
+     */
+    uint64_t exhausted;
+
+    /**
+     * @brief number of releases that required the Pipeline to be relinked
+     * and re-initialized, i.e. after a stop or EOS.
+     */
+    uint64_t relinks;
+
+    /**
+     * @brief average time to link and initialize a Pipeline from NULL to 
+     * its standby state in milliseconds, i.e. the cost paid in advance.
+     */
+    double standby_time;
+
+    /**
+     * @brief time-to-first-frame for the most recent acquisition in 
+     * milliseconds, measured from acquire to the first batched buffer.
+     */
+    double last_time_to_first_frame;
+
+    /**
+     * @brief average time-to-first-frame for all acquisitions in milliseconds.
+     */
+    double average_time_to_first_frame;
+
+    /**
+     * @brief maximum time-to-first-frame for all acquisitions in milliseconds.
+     */
+    double max_time_to_first_frame;
+
+} dsl_pipeline_pool_metrics;
+
+/**
+ * @struct _dsl_pipeline_startup_profile
+ * @brief Startup profile summary for a Pipeline, measured from the start of
+ * the most recent call to dsl_pipeline_play from a state of NULL or READY.
+ */
+typedef struct _dsl_pipeline_startup_profile
+{
+    /**
+     * @brief time to link all components in milliseconds.
+     */
+    double link_time;
+
+    /**
+     * @brief time for the Pipeline to reach PLAYING in milliseconds, 
+     * 0 if the Pipeline has yet to reach PLAYING.
+     */
+    double time_to_playing;
+
+    /**
+     * @brief time for the Pipeline's Streammuxer to produce its first batched
+     * buffer in milliseconds, 0 if the first buffer is pending.
+     */
+    double time_to_first_frame;
+
+    /**
+     * @brief name of the element with the slowest state change, 
+     * empty string if no state changes have been recorded.
+     */
+    const wchar_t* slowest_element;
+
+    /**
+     * @brief duration of the slowest state change in milliseconds.
+     */
+    double slowest_state_change;
+
+} dsl_pipeline_startup_profile;
+
+/**
+ * @struct _dsl_pipeline_startup_event
+ * @brief A single timestamped event in a Pipeline's startup profile.
+ */
+typedef struct _dsl_pipeline_startup_event
+{
+    /**
+     * @brief one of the DSL_PIPELINE_STARTUP_EVENT constants.
+     */
+    uint type;
+
+    /**
+     * @brief name of the element, or Pipeline, that the event occurred on.
+     */
+    const wchar_t* element;
+
+    /**
+     * @brief name of the pad for DSL_PIPELINE_STARTUP_EVENT_FIRST_BUFFER
+     * events, empty string otherwise.
+     */
+    const wchar_t* pad;
+
+    /**
+     * @brief previous DSL_STATE for DSL_PIPELINE_STARTUP_EVENT_STATE_CHANGE
+     * events, 0 otherwise.
+     */
+    uint previous_state;
+
+    /**
+     * @brief new DSL_STATE for DSL_PIPELINE_STARTUP_EVENT_STATE_CHANGE
+     * events, 0 otherwise.
+     */
+    uint new_state;
+
+    /**
+     * @brief time of the event in milliseconds from the start of the profile.
+     */
+    double timestamp;
+
+    /**
+     * @brief duration of the event in milliseconds. For link and unlink 
+     * events, the time taken to link or unlink. For state-change events, the 
+     * time since the previous state change in the profile. As Bins change the 
+     * state of their children in sequence, this is the time taken by the 
+     * element to change state. 0 for first-buffer events.
+     */
+    double duration;
+
+} dsl_pipeline_startup_event;
+
+/**
+ * @struct _dsl_websocket_topic_metrics
+ * @brief Publish/subscribe metrics for a Websocket Topic served
+ * by the Soup Server Manager. Counters are totals since the Topic was added.
+ */
+typedef struct _dsl_websocket_topic_metrics
+{
+    /**
+     * @brief number of clients currently subscribed to the Topic.
+     */
+    uint subscribers;
+
+    /**
+     * @brief number of messages published to the Topic.
+     */
+    uint64_t published;
+
+    /**
+     * @brief number of messages sent to subscribed clients.
+     */
+    uint64_t sent;
+
+    /**
+     * @brief number of messages dropped because a client's send-queue was full.
+     */
+    uint64_t dropped;
+
+    /**
+     * @brief number of unsent messages replaced by a newer message 
+     * for a coalescing Topic.
+     */
+    uint64_t coalesced;
+
+    /**
+     * @brief number of clients disconnected by the 
+     * DSL_WEBSOCKET_TOPIC_DROP_POLICY_DISCONNECT policy.
+     */
+    uint64_t disconnects;
+
+} dsl_websocket_topic_metrics;
+
+/**
+ * @struct _dsl_ode_object_record
+ * @brief Compact, fixed size record of a single object's metadata passed,
+ * in a contiguous array, to a client's batch check-for-occurrence callback.
+ */
+typedef struct _dsl_ode_object_record
+{
+    /**
+     * @brief unique tracking id for the object, UINT64_MAX if untracked.
+     */
+    uint64_t tracking_id;
+
+    /**
+     * @brief unique source id for the frame that contains the object.
+     */
+    uint source_id;
+
+    /**
+     * @brief class id for the object as set by the inference component.
+     */
+    int class_id;
+
+    /**
+     * @brief inference confidence for the object.
+     */
+    float inference_confidence;
+
+    /**
+     * @brief tracker confidence for the object.
+     */
+    float tracker_confidence;
+
+    /**
+     * @brief left coordinate of the object's bounding box in pixels.
+     */
+    float left;
 
     /**
-     * @brief the Object's bounding box left coordinate in pixels.
+     * @brief top coordinate of the object's bounding box in pixels.
      */
-    uint left;
-    
+    float top;
+
     /**
-     * @brief the Object's bounding box top coordinate in pixels.
+     * @brief width of the object's bounding box in pixels.
      */
-    uint top;
-    
+    float width;
+
     /**
-     * @brief the Object's bounding box width in pixels.
+     * @brief height of the object's bounding box in pixels.
      */
-    uint width;
-    
+    float height;
+
     /**
-     * @brief the Object's bounding box height in pixels.
+     * @brief frame number for the frame that contains the object.
      */
-    uint height;
-    
-} dsl_ode_occurrence_object_info;
+    uint frame_num;
+
+} dsl_ode_object_record;
 
 /**
- * @struct _dsl_ode_occurrence_accumulative_info
- * @brief Accumulative ODE Occurrence metrics provided to the 
- * client on callback.
+ * @struct _dsl_pph_custom_async_metrics
+ * @brief Queue and drop metrics for a Custom Pad Probe Handler 
+ * operating in asynchronous mode.
  */
-typedef struct _dsl_ode_occurrence_accumulative_info
+typedef struct _dsl_pph_custom_async_metrics
 {
     /**
-     * @brief the total number of object detection occurrences for the 
-     * frame-level ODE occurrence - Count, New-High, New-Low Triggers
-     * or from an ODE accumulator.
+     * @brief current number of buffers waiting in the queue.
      */
-    uint occurrences_total;
-    
+    uint current_level;
+
     /**
-     * @brief the number of Line-Cross ODE occurrences in the "in-direction".
-     * Requires an ODE Cross-Trigger with ODE Accumulator
+     * @brief maximum number of buffers held in the queue since last cleared.
      */
-    uint occurrences_in;
+    uint max_level;
 
     /**
-     * @brief the number of Line-Cross ODE occurrences in the "out-direction".
-     * Requires an ODE Cross-Trigger with ODE Accumulator
+     * @brief total number of buffers added to the queue.
      */
-    uint occurrences_out;
+    uint64_t queued;
 
-} dsl_ode_occurrence_accumulative_info;
+    /**
+     * @brief total number of buffers processed by the client handler.
+     */
+    uint64_t processed;
+
+    /**
+     * @brief total number of buffers dropped because the queue was full.
+     */
+    uint64_t dropped;
 
+    /**
+     * @brief total time, in microseconds, the streaming thread was blocked
+     * waiting on a full queue, DSL_PPH_CUSTOM_ASYNC_POLICY_BLOCK only.
+     */
+    uint64_t blocked_time;
+    
+} dsl_pph_custom_async_metrics;
 
 /**
- * @struct dsl_ode_occurrence_criteria_info
- * @brief ODE Trigger Criteria used for the ODE Occurrence.
+ * @struct _dsl_ode_action_async_metrics
+ * @brief Queue-depth and latency metrics for an asynchronous ODE Action;
+ * Pipeline, Player, Source, Sink, and Branch Actions. All latencies are
+ * measured from the time of occurrence to the time of execution in 
+ * microseconds. Average latency = latency_total/executed.
  */
-typedef struct _dsl_ode_occurrence_criteria_info
+typedef struct _dsl_ode_action_async_metrics
 {
     /**
-     * @brief class id filter for ODE occurrence
+     * @brief current number of requests waiting to be executed.
      */
-    uint class_id;
-    
+    uint pending;
+
     /**
-     * @brief inference id filter for ODE occurrence
+     * @brief maximum number of requests waiting since last cleared.
      */
-    uint inference_component_id;
-    
+    uint max_pending;
+
     /**
-     * @brief the minimum inference confidence to trigger an ODE occurrence.
+     * @brief total number of occurrences requesting execution.
      */
-    float min_inference_confidence;
-    
+    uint64_t queued;
+
     /**
-     * @brief the minimum tracker confidence to trigger an ODE occurrence.
+     * @brief total number of requests collapsed into a pending request.
      */
-    float min_tracker_confidence;
-    
+    uint64_t coalesced;
+
     /**
-     * @brief inference must be performed to trigger an ODE occurrence.
+     * @brief total number of requests executed in the main-loop context.
      */
-    boolean inference_done_only;
-     
+    uint64_t executed;
+
     /**
-     * @brief the minimum bounding box width to trigger an ODE occurrence.
+     * @brief total latency of all executed requests in microseconds.
      */
-    uint min_width;
-    
+    uint64_t latency_total;
+
     /**
-     * @brief the minimum bounding box height to trigger an ODE occurrence.
+     * @brief maximum latency of any executed request in microseconds.
      */
-    uint min_height;
+    uint64_t latency_max;
     
+} dsl_ode_action_async_metrics;
+
+/**
+ * @struct _dsl_tee_branch_op
+ * @brief a single Branch operation for a Demuxer or Splitter Tee as applied 
+ * by dsl_tee_branch_ops_apply and dsl_tee_branch_ops_apply_async.
+ */
+typedef struct _dsl_tee_branch_op
+{
     /**
-     * @brief the maximum bounding box width to trigger an ODE occurrence.
+     * @brief one of the DSL_TEE_BRANCH_OP constants.
      */
-    uint max_width;
-    
+    uint op;
+
     /**
-     * @brief the maximum bounding box height to trigger an ODE occurrence.
+     * @brief unique name of the Branch to add, remove, or move.
      */
-    uint max_height;
-    
+    const wchar_t* branch;
+
     /**
-     * @brief the interval for checking for an ODE occurrence.
+     * @brief Demuxer stream-id to add or move the Branch to. Must be
+     * DSL_TEE_BRANCH_ANY_STREAM for all Splitter operations and for
+     * DSL_TEE_BRANCH_OP_REMOVE. 
      */
-    uint interval;
-    
-} dsl_ode_occurrence_criteria_info;
+    uint stream_id;
+
+} dsl_tee_branch_op;
 
 /**
- * @struct dsl_ode_occurrence_info
- * @brief ODE Occurrence information provided to the client on callback
+ * @struct _dsl_tee_branch_op_result
+ * @brief the outcome of a single Branch operation applied to a Tee.
  */
-typedef struct _dsl_ode_occurrence_info
+typedef struct _dsl_tee_branch_op_result
 {
     /**
-     * @brief the unique name of the ODE Trigger that triggered the occurrence
+     * @brief unique name of the Branch the operation was applied to.
      */
-    const wchar_t* trigger_name;
-    
+    const wchar_t* branch;
+
     /**
-     * @brief unique occurrence Id for this occurrence.
+     * @brief one of the DSL_TEE_BRANCH_OP constants.
      */
-    uint64_t unique_ode_id;
-    
+    uint op;
+
     /**
-     * @brief Network Time for this event.
+     * @brief stream-id the Branch was linked to on add or move, or 
+     * unlinked from on remove. DSL_TEE_BRANCH_ANY_STREAM if unknown.
      */
-    uint64_t ntp_timestamp;
-    
+    uint stream_id;
+
     /**
-     * @brief Video Source information this ODE Occurrence
+     * @brief DSL_RESULT_SUCCESS if the operation was applied, one of 
+     * DSL_RESULT_TEE_RESULT otherwise.
      */
-    dsl_ode_occurrence_source_info source_info;
+    DslReturnType result;
 
     /**
-     * @brief true if the ODE occurrence information is for a specific object,
-     * false for frame-level multi-object events. (absence, new-high count, etc.). 
+     * @brief time in microseconds from when the batch was applied, or 
+     * queued, to when this operation completed.
      */
-    boolean is_object_occurrence;
-    
-    // NOTE: object_info and accumulative_info are mutually exclusive
-    // determined by the boolean is_object_occurrence flag above.
-    
+    uint64_t time_us;
+
+} dsl_tee_branch_op_result;
+
+/**
+ * @struct _dsl_ode_action_capture_metrics
+ * @brief Surface Pool and batched transform metrics for a Capture ODE Action. 
+ * All images requested for a frame are captured with a single batched 
+ * transform to surfaces reused from a pool of mapped surfaces bucketed by size.
+ * Average images per transform = captures/batches.
+ */
+typedef struct _dsl_ode_action_capture_metrics
+{
     /**
-     * @brief Object information if object_occurrence == true
+     * @brief current number of free surfaces held by the pool.
      */
-    dsl_ode_occurrence_object_info object_info;
-    
+    uint pooled;
+
     /**
-     * @brief Accumulative information if object_occurrence == false
+     * @brief current number of surfaces in use - queued, being converted,
+     * or held as best-shots.
      */
-    dsl_ode_occurrence_accumulative_info accumulative_info;
-    
+    uint in_use;
+
     /**
-     * @brief Trigger Criteria information for this ODE occurrence.
+     * @brief total number of surfaces acquired from the pool.
      */
-    dsl_ode_occurrence_criteria_info criteria_info;
-       
-} dsl_ode_occurrence_info;
+    uint64_t acquired;
 
-/**
- * @struct _dsl_threshold_value
- * @brief defines an abstract class that contains two data points; a
- * minimum threshold and a value to use if the threshold is met.
- */
-typedef struct _dsl_threshold_value
-{
     /**
-     * @brief the minimum threshold that defines when value is first valid.
+     * @brief total number of surfaces acquired that were reused.
      */
-    uint threshold;
+    uint64_t hits;
 
     /**
-     * @brief the value to use if the minimum threshold is met.
+     * @brief total number of new surfaces allocated by the pool.
      */
-    uint value;
+    uint64_t allocated;
+
+    /**
+     * @brief total number of new surfaces the pool failed to allocate. 
+     * The image requested is not captured.
+     */
+    uint64_t failed;
+
+    /**
+     * @brief total number of batched transforms.
+     */
+    uint64_t batches;
+
+    /**
+     * @brief total number of images captured.
+     */
+    uint64_t captures;
     
-} dsl_threshold_value;
+} dsl_ode_action_capture_metrics;
 
 //------------------------------------------------------------------------------------
 
@@ -1635,6 +2630,24 @@ typedef boolean (*dsl_ode_check_for_occurrence_cb)(void* buffer,
  */
 typedef boolean (*dsl_ode_post_process_frame_cb)(void* buffer,
     void* frame_meta, void* client_data);
+
+/**
+ * @brief Callback typedef for a client ODE Custom Batch Trigger check-for-occurrence
+ * function. Once registered, the function will be called once per frame with a
+ * contiguous array of records, one for every object in the frame that meets the 
+ * minimum criteria for the Trigger. The client sets results[i] to a non-zero 
+ * value for every object that triggers an ODE occurrence, and all ODE Actions 
+ * owned by the Trigger will be invoked for each flagged object.
+ * @param[in] records pointer to an array of object records to check.
+ * @param[in] count number of records in the array.
+ * @param[out] results array of count elements, all initialized to 0. Set to 
+ * non-zero for each object that triggers an ODE occurrence.
+ * @param[in] client_data opaque pointer to client's user data
+ * @return the number of objects flagged in results, 0 to skip the results.
+ */
+typedef uint (*dsl_ode_check_for_occurrence_batch_cb)(
+    const dsl_ode_object_record* records, uint count, 
+    uint8_t* results, void* client_data);
     
 /**
  * @brief Callback typedef for a client listener function. Once added to an
@@ -1728,6 +2741,19 @@ typedef uint (*dsl_pph_stream_event_handler_cb)(uint stream_event,
 typedef void (*dsl_state_change_listener_cb)(uint prev_state, 
     uint curr_state, void* client_data);
 
+/**
+ * @brief callback typedef for a client listener function. Once added to a Pipeline, 
+ * the function will be called when the Pipeline's Infer Interval Controller
+ * changes the load-shedding interval.
+ * @param[in] prev_interval the previous load-shedding interval.
+ * @param[in] curr_interval the new load-shedding interval.
+ * @param[in] metrics the controller's metrics, including the load that 
+ * caused the change.
+ * @param[in] client_data opaque pointer to client's data
+ */
+typedef void (*dsl_infer_interval_change_listener_cb)(uint prev_interval, 
+    uint curr_interval, dsl_infer_interval_metrics* metrics, void* client_data);
+
 /**
  * @brief callback typedef for a client listener function. Once added to a Pipeline, 
  * the function will be called on receipt of EOS message from the Pipeline bus.
@@ -1932,6 +2958,19 @@ typedef void (*dsl_component_queue_overrun_listener_cb)(const wchar_t* name,
 typedef void (*dsl_component_queue_underrun_listener_cb)(const wchar_t* name, 
     void* client_data);
 
+/**
+ * @brief Callback typedef for a client listener function to be notified when
+ * a batch of Branch operations, queued with dsl_tee_branch_ops_apply_async, 
+ * has completed. The listener is called from the main-loop context. 
+ * @param[in] name name of the Tee the operations were applied to.
+ * @param[in] results array of results, one per operation in the order queued.
+ * The array is valid for the duration of the callback only.
+ * @param[in] count number of results in the array.
+ * @param[in] client_data opaque pointer to client's user data.
+ */
+typedef void (*dsl_tee_branch_ops_complete_listener_cb)(const wchar_t* name, 
+    dsl_tee_branch_op_result* results, uint count, void* client_data);
+
 // -----------------------------------------------------------------------------------
 // Start of DSL Services 
 
@@ -2376,6 +3415,68 @@ DslReturnType dsl_ode_action_capture_mailer_add(const wchar_t* name,
 DslReturnType dsl_ode_action_capture_mailer_remove(const wchar_t* name, 
     const wchar_t* mailer);
 
+/**
+ * @brief Sets the Websocket Topic for a named Capture Action to publish each 
+ * captured JPEG image to. Clients subscribed to the Topic that have requested 
+ * a thumbnail width receive a downscaled image of that width. 
+ * Requires BUILD_WEBRTC to be set to true in the Makefile.
+ * @param[in] name unique name of the Capture Action to update
+ * @param[in] topic unique name of the Websocket Topic to publish to. Set to 
+ * NULL (or an empty string) to stop publishing.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_ODE_ACTION_RESULT otherwise.
+ */
+DslReturnType dsl_ode_action_capture_websocket_topic_set(const wchar_t* name, 
+    const wchar_t* topic);
+
+/**
+ * @brief Gets the current best-shot settings for a named Capture Object Action.
+ * @param[in] name unique name of the Capture Object Action to query
+ * @param[out] enabled true if best-shot capture is enabled, false otherwise
+ * @param[out] timeout time in milliseconds without an occurrence for a tracked 
+ * object before its best-shot image is written
+ * @param[out] max_hold maximum time in milliseconds to hold a best-shot image 
+ * before it is written, 0 = no maximum 
+ * @param[out] sharpness true if the image sharpness is part of the score
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_ODE_ACTION_RESULT otherwise.
+ */
+DslReturnType dsl_ode_action_capture_object_best_shot_get(const wchar_t* name, 
+    boolean* enabled, uint* timeout, uint* max_hold, boolean* sharpness);
+
+/**
+ * @brief Sets the best-shot settings for a named Capture Object Action. When 
+ * enabled, one image is captured per tracked object -- the highest scoring by
+ * confidence, bbox area, and (optionally) sharpness -- and written when the 
+ * object times out or after max_hold. Held images are written on disable.
+ * @param[in] name unique name of the Capture Object Action to update
+ * @param[in] enabled set to true to enable best-shot capture, false to disable
+ * @param[in] timeout time in milliseconds without an occurrence for a tracked 
+ * object before its best-shot image is written
+ * @param[in] max_hold maximum time in milliseconds to hold a best-shot image 
+ * before it is written, 0 = no maximum 
+ * @param[in] sharpness set to true to include the image sharpness in the score
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_ODE_ACTION_RESULT otherwise.
+ */
+DslReturnType dsl_ode_action_capture_object_best_shot_set(const wchar_t* name, 
+    boolean enabled, uint timeout, uint max_hold, boolean sharpness);
+
+/**
+ * @brief Gets the current Surface Pool and batched transform metrics for 
+ * a named Capture Action.
+ * @param[in] name unique name of the Capture Action to query
+ * @param[out] metrics current metrics for the Capture Action
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_ODE_ACTION_RESULT otherwise.
+ */
+DslReturnType dsl_ode_action_capture_metrics_get(const wchar_t* name,
+    dsl_ode_action_capture_metrics* metrics);
+
+/**
+ * @brief Clears the accumulated metrics for a named Capture Action. The
+ * pooled and in_use counts are retained.
+ * @param[in] name unique name of the Capture Action to update
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_ODE_ACTION_RESULT otherwise.
+ */
+DslReturnType dsl_ode_action_capture_metrics_clear(const wchar_t* name);
+
 /**
  * @brief Creates a uniquely named ODE Custom Action
  * @param[in] name unique name for the ODE Custom Action 
@@ -2750,6 +3851,17 @@ DslReturnType dsl_ode_action_print_new(const wchar_t* name, boolean force_flush)
  */
 DslReturnType dsl_ode_action_redact_new(const wchar_t* name);
 
+/**
+ * @brief Creates a uniquely named Websocket Publish ODE Action that publishes 
+ * each ODE occurrence as a JSON message to a Websocket Topic.
+ * Requires BUILD_WEBRTC to be set to true in the Makefile.
+ * @param[in] name unique name for the Websocket Publish ODE Action
+ * @param[in] topic unique name of the Websocket Topic to publish to.
+ * @return DSL_RESULT_SUCCESS on success, one of DSL_RESULT_ODE_ACTION_RESULT otherwise.
+ */
+DslReturnType dsl_ode_action_websocket_publish_new(const wchar_t* name, 
+    const wchar_t* topic);
+
 /**
  * @brief Creates a uniquely named Add Sink Action that adds
  * a named Sink to a named Pipeline
@@ -2999,6 +4111,24 @@ DslReturnType dsl_ode_action_enabled_state_change_listener_add(const wchar_t* na
  */
 DslReturnType dsl_ode_action_enabled_state_change_listener_remove(const wchar_t* name,
     dsl_ode_enabled_state_change_listener_cb listener);
+
+/**
+ * @brief Gets the current queue-depth and latency metrics for a named
+ * asynchronous ODE Action; Pipeline, Player, Source, Sink, or Branch Action.
+ * @param[in] name unique name of the ODE Action to query.
+ * @param[out] metrics current metrics for the named ODE Action.
+ * @return DSL_RESULT_SUCCESS on successful query, DSL_RESULT_ODE_ACTION_RESULT otherwise.
+ */
+DslReturnType dsl_ode_action_async_metrics_get(const wchar_t* name,
+    dsl_ode_action_async_metrics* metrics);
+
+/**
+ * @brief Clears the queue-depth and latency metrics for a named 
+ * asynchronous ODE Action. The current pending count is retained.
+ * @param[in] name unique name of the ODE Action to update.
+ * @return DSL_RESULT_SUCCESS on successful update, DSL_RESULT_ODE_ACTION_RESULT otherwise.
+ */
+DslReturnType dsl_ode_action_async_metrics_clear(const wchar_t* name);
     
 /**
  * @brief Deletes an ODE Action of any type
@@ -3246,6 +4376,25 @@ DslReturnType dsl_ode_trigger_custom_new(const wchar_t* name, const wchar_t* sou
     uint class_id, uint limit, dsl_ode_check_for_occurrence_cb client_checker, 
     dsl_ode_post_process_frame_cb client_post_processor, void* client_data);
 
+/**
+ * @brief Custom Batch ODE Trigger that allows the client to provide a custom 
+ * batch "check-for-occurrence" function to be called once per frame with a
+ * contiguous array of compact object records, one for each object that meets
+ * the trigger's criteria: class id, min dimensions, min confidence, etc. 
+ * All ODE Actions are invoked for each object flagged by the client.
+ * @param[in] name unique name for the ODE Trigger
+ * @param[in] source unique source name filter for the ODE Trigger, NULL = ANY_SOURCE
+ * @param[in] class_id class id filter for this ODE Trigger
+ * @param[in] limit limits the number of ODE occurrences, a value of 0 = NO limit
+ * @param[in] client_checker client custom callback function to check the batch
+ * of object records for ODE occurrences.
+ * @param[in] client_data opaque client data returned to the client on callback
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_ODE_TRIGGER_RESULT otherwise.
+ */
+DslReturnType dsl_ode_trigger_custom_batch_new(const wchar_t* name, 
+    const wchar_t* source, uint class_id, uint limit, 
+    dsl_ode_check_for_occurrence_batch_cb client_checker, void* client_data);
+
 /**
  * @brief Occurence trigger that checks for the occurrence of Objects within a frame for a 
  * specified source and object class_id.
@@ -4354,6 +5503,74 @@ DslReturnType dsl_pph_ode_display_meta_alloc_size_get(const wchar_t* name, uint*
  */
 DslReturnType dsl_pph_ode_display_meta_alloc_size_set(const wchar_t* name, uint size);
 
+/**
+ * @brief Gets the number of frame workers an ODE Handler uses to evaluate
+ * the frames of each batch in parallel. 
+ * @param[in] name unique name of the ODE Handler to query.
+ * @param[out] workers current number of frame workers, 0 if disabled (default).
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PPH_RESULT otherwise
+ */
+DslReturnType dsl_pph_ode_frame_workers_get(const wchar_t* name, uint* workers);
+
+/**
+ * @brief Sets the number of frame workers an ODE Handler uses to evaluate
+ * the frames of each batch in parallel. The frames of each source are 
+ * processed, in order, concurrently with the frames of other sources by the 
+ * leading Triggers that are per-source safe, up to the first Trigger in index
+ * order that is not. The remaining Triggers are processed serially after, so 
+ * that all Triggers are evaluated in index order. A Trigger is per-source safe if it filters on a single source, has no
+ * Accumulator or Heat-Mapper, and all of its Actions are parallel safe.
+ * @param[in] name unique name of the ODE Handler to update.
+ * @param[in] workers new number of frame workers, 0 to disable.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PPH_RESULT otherwise
+ */
+DslReturnType dsl_pph_ode_frame_workers_set(const wchar_t* name, uint workers);
+
+/**
+ * @brief Replays all batch records from a Metadata Record file, created by a
+ * Metadata Recorder pad-probe-handler, through the named ODE Handler and its
+ * ODE Triggers. The records are processed as synthetic batch-metadata, in the 
+ * calling thread, as fast as possible, without a Pipeline. ODE Actions that 
+ * require the frame buffer (Capture and Custom Actions) are not invoked on 
+ * replay. Tracked time is measured with the recorded frame timestamps. 
+ * @param[in] name unique name of the ODE Handler to replay through.
+ * @param[in] file_path absolute or relative path to the Metadata Record file.
+ * @param[out] frames total number of frames replayed.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PPH_RESULT otherwise.
+ */
+DslReturnType dsl_pph_ode_replay(const wchar_t* name, 
+    const wchar_t* file_path, uint64_t* frames);
+
+/**
+ * @brief Creates a new, uniquely named Metadata Recorder pad-probe-handler. 
+ * The frame and object metadata (source, frame number, NTP timestamp, class,
+ * tracking id, confidences, and bbox) of each batch is written to a compact, 
+ * indexed binary file. The file is closed when the Handler is deleted.
+ * @param[in] name unique name for the new Metadata Recorder.
+ * @param[in] file_path absolute or relative path to the file to create.
+ * Any existing file will be overwritten.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PPH_RESULT otherwise.
+ */
+DslReturnType dsl_pph_meta_recorder_new(const wchar_t* name, 
+    const wchar_t* file_path);
+
+/**
+ * @brief Creates a new, uniquely named Metadata Publisher pad-probe-handler.
+ * The frame and object metadata of each frame is written to a ring buffer in 
+ * POSIX shared-memory for co-located reader processes. The Publisher never 
+ * waits on its readers; readers that fall more than slot_count frames behind 
+ * skip the overwritten frames. The shared-memory segment is unlinked when 
+ * the Handler is deleted.
+ * @param[in] name unique name for the new Metadata Publisher.
+ * @param[in] shm_name name of the POSIX shared-memory segment to create, 
+ * e.g. L"/dsl-meta". Any existing segment with the same name is replaced.
+ * @param[in] slot_count number of frame slots in the ring buffer.
+ * @param[in] max_objects maximum number of objects published per frame.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PPH_RESULT otherwise.
+ */
+DslReturnType dsl_pph_meta_publisher_new(const wchar_t* name, 
+    const wchar_t* shm_name, uint slot_count, uint max_objects);
+
 /**
  * @brief creates a new, uniquely named Custom pad-probe-handler to process a buffer
  * @param[in] name unique component name for the new Custom Handler
@@ -4361,8 +5578,81 @@ DslReturnType dsl_pph_ode_display_meta_alloc_size_set(const wchar_t* name, uint
  * @param[in] client_data opaque pointer to client date returned with the callback
  * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PPH_RESULT otherwise
  */
-DslReturnType dsl_pph_custom_new(const wchar_t* name,
-     dsl_pph_custom_client_handler_cb client_handler, void* client_data);
+DslReturnType dsl_pph_custom_new(const wchar_t* name,
+     dsl_pph_custom_client_handler_cb client_handler, void* client_data);
+
+/**
+ * @brief Gets the current asynchronous mode enabled setting for the named 
+ * Custom pad-probe-handler.
+ * @param[in] name unique name of the Custom Handler to query.
+ * @param[out] enabled true if the client handler is called from a worker thread,
+ * false if called synchronously in the streaming thread (default).
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PPH_RESULT otherwise.
+ */
+DslReturnType dsl_pph_custom_async_enabled_get(const wchar_t* name, 
+    boolean* enabled);
+
+/**
+ * @brief Sets the asynchronous mode enabled setting for the named Custom 
+ * pad-probe-handler. When enabled, a read-only snapshot of each buffer -- 
+ * the buffer's timestamps and a deep copy of its batch-meta, without frame
+ * data -- is added to a bounded queue, drained by a worker thread that calls 
+ * the client handler. The client's return value is ignored and the buffer 
+ * continues downstream without waiting. Only read-only handlers should be 
+ * run asynchronously.
+ * @param[in] name unique name of the Custom Handler to update.
+ * @param[in] enabled set to true to enable asynchronous mode, false to disable.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PPH_RESULT otherwise.
+ */
+DslReturnType dsl_pph_custom_async_enabled_set(const wchar_t* name, 
+    boolean enabled);
+
+/**
+ * @brief Gets the current asynchronous queue settings for the named Custom 
+ * pad-probe-handler.
+ * @param[in] name unique name of the Custom Handler to query.
+ * @param[out] max_size maximum number of buffers the queue can hold.
+ * @param[out] policy one of the DSL_PPH_CUSTOM_ASYNC_POLICY constants, 
+ * applied when the queue is full.
+ * @param[out] sample_interval with DSL_PPH_CUSTOM_ASYNC_POLICY_SAMPLE, every 
+ * Nth buffer received while full replaces the oldest buffer in the queue.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PPH_RESULT otherwise.
+ */
+DslReturnType dsl_pph_custom_async_queue_settings_get(const wchar_t* name, 
+    uint* max_size, uint* policy, uint* sample_interval);
+
+/**
+ * @brief Sets the asynchronous queue settings for the named Custom 
+ * pad-probe-handler. The settings can not be changed while asynchronous
+ * mode is enabled.
+ * @param[in] name unique name of the Custom Handler to update.
+ * @param[in] max_size maximum number of buffers the queue can hold, > 0.
+ * @param[in] policy one of the DSL_PPH_CUSTOM_ASYNC_POLICY constants, 
+ * applied when the queue is full.
+ * @param[in] sample_interval with DSL_PPH_CUSTOM_ASYNC_POLICY_SAMPLE, every 
+ * Nth buffer received while full replaces the oldest buffer in the queue, > 0.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PPH_RESULT otherwise.
+ */
+DslReturnType dsl_pph_custom_async_queue_settings_set(const wchar_t* name, 
+    uint max_size, uint policy, uint sample_interval);
+
+/**
+ * @brief Gets the current asynchronous queue and drop metrics for the named
+ * Custom pad-probe-handler.
+ * @param[in] name unique name of the Custom Handler to query.
+ * @param[out] metrics current metrics for the Handler's queue.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PPH_RESULT otherwise.
+ */
+DslReturnType dsl_pph_custom_async_metrics_get(const wchar_t* name, 
+    dsl_pph_custom_async_metrics* metrics);
+
+/**
+ * @brief Clears the asynchronous queue and drop metrics for the named
+ * Custom pad-probe-handler. The current queue level is retained.
+ * @param[in] name unique name of the Custom Handler to update.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PPH_RESULT otherwise.
+ */
+DslReturnType dsl_pph_custom_async_metrics_clear(const wchar_t* name);
      
 /**
  * @brief creates a new, uniquely named Meter pad-probe-handler to calcaulate performance measurements
@@ -5500,6 +6790,51 @@ DslReturnType dsl_source_video_buffer_out_frame_rate_get(const wchar_t* name,
 DslReturnType dsl_source_video_buffer_out_frame_rate_set(const wchar_t* name, 
     uint fps_n, uint fps_d);
 
+/**
+ * @brief Returns the decimation frame-rate as a fraction for the named Video 
+ * Source. The default values of 0 for fps_n and fps_d indicate no decimation.
+ * @param[in] name unique name of the source to query
+ * @param[out] fps_n frames per second numerator
+ * @param[out] fps_d frames per second denominator
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_SOURCE_RESULT otherwise.
+ */
+DslReturnType dsl_source_video_decimation_frame_rate_get(const wchar_t* name, 
+    uint* fps_n, uint* fps_d);
+
+/**
+ * @brief Sets the decimation frame-rate as a fraction for the named Video 
+ * Source. Frames are dropped by pad probe - before decode where possible for 
+ * RTSP and URI Sources, a GOP at a time, and after decode otherwise. Unlike 
+ * the buffer-out-frame-rate, the decimation frame-rate can be set in any state.
+ * Set fps_n and fps_d to 0 to disable decimation.
+ * @param[in] name unique name of the source to update
+ * @param[in] fps_n frames per second numerator
+ * @param[in] fps_d frames per second denominator
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_SOURCE_RESULT otherwise.
+ */
+DslReturnType dsl_source_video_decimation_frame_rate_set(const wchar_t* name, 
+    uint fps_n, uint fps_d);
+
+/**
+ * @brief Gets the decimation frame counters for the named Video Source.
+ * @param[in] name unique name of the source to query
+ * @param[out] frames_passed number of frames passed.
+ * @param[out] frames_dropped total number of frames dropped.
+ * @param[out] frames_dropped_pre_decode number of the dropped frames that
+ * were dropped before decode.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_SOURCE_RESULT otherwise.
+ */
+DslReturnType dsl_source_video_decimation_stats_get(const wchar_t* name, 
+    uint64_t* frames_passed, uint64_t* frames_dropped, 
+    uint64_t* frames_dropped_pre_decode);
+
+/**
+ * @brief Clears the decimation frame counters for the named Video Source.
+ * @param[in] name unique name of the source to update
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_SOURCE_RESULT otherwise.
+ */
+DslReturnType dsl_source_video_decimation_stats_clear(const wchar_t* name);
+
 /**
  * @brief Gets one of the buffer-out crop-rectangle for the named Video Source
  * The buffer can be cropped pre-video-conversion and/or post-video-conversion.
@@ -6922,6 +8257,45 @@ DslReturnType dsl_tee_blocking_timeout_get(const wchar_t* name,
 DslReturnType dsl_tee_blocking_timeout_set(const wchar_t* name, 
     uint timeout);
 
+/**
+ * @brief Applies a batch of Branch operations -- add, remove, and move-to --
+ * to a named Demuxer or Splitter Tee, blocking until all have completed. When 
+ * playing, all Branches to unlink are blocked and unlinked in a single 
+ * blocking-timeout window, followed by all Branches to link. The stream-ids 
+ * of all removed and moved Branches are released before any are reserved,
+ * so Branches can be swapped between streams in a single batch. 
+ * Each operation is applied independently; if a move fails, the Branch is 
+ * removed from the Tee.
+ * @param[in] name name of the Tee to update.
+ * @param[in] ops array of Branch operations to apply.
+ * @param[in] count number of operations in the ops array.
+ * @param[out] results array of count results, one per operation. 
+ * @return DSL_RESULT_SUCCESS if all operations were applied, the result of the 
+ * first failed operation otherwise.
+ */
+DslReturnType dsl_tee_branch_ops_apply(const wchar_t* name, 
+    const dsl_tee_branch_op* ops, uint count, dsl_tee_branch_op_result* results);
+
+/**
+ * @brief Queues a batch of Branch operations to be applied to a named Demuxer 
+ * or Splitter Tee without blocking the calling thread. The operations are 
+ * validated, and the Tee's Branches updated, before returning. The GStreamer 
+ * linking and unlinking is done by a worker thread owned by the Tee, one batch
+ * at a time in the order queued. See dsl_tee_branch_ops_apply for details.
+ * @param[in] name name of the Tee to update.
+ * @param[in] ops array of Branch operations to queue.
+ * @param[in] count number of operations in the ops array.
+ * @param[in] listener optional client listener to call when the batch 
+ * completes, set to NULL to omit.
+ * @param[in] client_data opaque pointer to client data passed to the listener.
+ * @return DSL_RESULT_SUCCESS if all operations were queued, the result of the 
+ * first operation that failed validation otherwise. Operations that fail 
+ * validation are reported to the listener but are not applied.
+ */
+DslReturnType dsl_tee_branch_ops_apply_async(const wchar_t* name, 
+    const dsl_tee_branch_op* ops, uint count, 
+    dsl_tee_branch_ops_complete_listener_cb listener, void* client_data);
+
 /**
  * @brief Adds a pad-probe-handler to a named Tee.
  * One or more Pad Probe Handlers can be added to the SINK PAD only.
@@ -8159,6 +9533,70 @@ DslReturnType dsl_sink_frame_capture_initiate(const wchar_t* name);
  */
 DslReturnType dsl_sink_frame_capture_schedule(const wchar_t* name,
     uint64_t frame_number);
+
+/**
+ * @brief Gets the current settings for the named Frame-Capture Sink's ring of
+ * retained frames.
+ * @param[in] name unique name of the Frame-Capture Sink to query.
+ * @param[out] width width the retained frames are downscaled to, 0 = full size.
+ * @param[out] duration maximum duration of the retained frames in milliseconds,
+ * 0 = ring disabled.
+ * @param[out] max_size maximum total size of the retained frames in bytes,
+ * 0 = ring disabled.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_SINK_RESULT on failure.
+ */
+DslReturnType dsl_sink_frame_capture_ring_settings_get(const wchar_t* name,
+    uint* width, uint* duration, uint64_t* max_size);
+
+/**
+ * @brief Sets the settings for the named Frame-Capture Sink's ring of retained
+ * frames. When enabled, each frame is downscaled and copied to system memory, 
+ * and retained until older than the duration or until the total size exceeds
+ * max_size. All currently retained frames are released on set.
+ * @param[in] name unique name of the Frame-Capture Sink to update.
+ * @param[in] width width to downscale the retained frames to, preserving the
+ * aspect ratio. Set to 0 to retain full size frames.
+ * @param[in] duration maximum duration of the retained frames in milliseconds,
+ * 0 to disable the ring.
+ * @param[in] max_size maximum total size of the retained frames in bytes,
+ * 0 to disable the ring.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_SINK_RESULT on failure.
+ */
+DslReturnType dsl_sink_frame_capture_ring_settings_set(const wchar_t* name,
+    uint width, uint duration, uint64_t max_size);
+
+/**
+ * @brief Gets the current number and total size of the frames retained by
+ * the named Frame-Capture Sink.
+ * @param[in] name unique name of the Frame-Capture Sink to query.
+ * @param[out] frames current number of retained frames.
+ * @param[out] size current total size of the retained frames in bytes.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_SINK_RESULT on failure.
+ */
+DslReturnType dsl_sink_frame_capture_ring_size_get(const wchar_t* name,
+    uint* frames, uint64_t* size);
+
+/**
+ * @brief Captures the frame, retained by the named Frame-Capture Sink, with
+ * the closest NTP timestamp. 
+ * @param[in] name unique name of the Frame-Capture Sink to use.
+ * @param[in] timestamp NTP timestamp of the frame to capture in nanoseconds.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_SINK_RESULT on failure.
+ */
+DslReturnType dsl_sink_frame_capture_ring_initiate(const wchar_t* name,
+    uint64_t timestamp);
+
+/**
+ * @brief Captures all frames, retained by the named Frame-Capture Sink, within
+ * a range of NTP timestamps. Frames already captured are skipped.
+ * @param[in] name unique name of the Frame-Capture Sink to use.
+ * @param[in] start_timestamp start of the range in nanoseconds, inclusive.
+ * @param[in] end_timestamp end of the range in nanoseconds, inclusive.
+ * @param[out] count number of frames captured.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_SINK_RESULT on failure.
+ */
+DslReturnType dsl_sink_frame_capture_ring_initiate_range(const wchar_t* name,
+    uint64_t start_timestamp, uint64_t end_timestamp, uint* count);
     
 /**
  * @brief creates a new, uniquely named WebRTC Sink component
@@ -8279,6 +9717,47 @@ DslReturnType dsl_websocket_server_client_listener_add(
 DslReturnType dsl_websocket_server_client_listener_remove(
     dsl_websocket_server_client_listener_cb listener);
 
+/**
+ * @brief Adds a new Topic for the Websocket Server to publish to. Clients connect
+ * on the DSL_WEBSOCKET_SERVER_PUBLISH_PATH and subscribe to Topics by name.
+ * @param[in] topic unique name for the new Topic.
+ * @param[in] max_queue_size maximum number of unsent messages to queue for each
+ * subscribed client before the drop policy is applied.
+ * @param[in] drop_policy one of the DSL_WEBSOCKET_TOPIC_DROP_POLICY constants.
+ * @param[in] coalesce if true, a new message replaces the client's unsent 
+ * message for the Topic, i.e. only the latest message is sent.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_WEBSOCKET_SERVER_RESULT otherwise.
+ */
+DslReturnType dsl_websocket_server_topic_add(const wchar_t* topic,
+    uint max_queue_size, uint drop_policy, boolean coalesce);
+
+/**
+ * @brief Removes a Topic from the Websocket Server. All unsent messages 
+ * for the Topic are discarded.
+ * @param[in] topic unique name of the Topic to remove.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_WEBSOCKET_SERVER_RESULT otherwise.
+ */
+DslReturnType dsl_websocket_server_topic_remove(const wchar_t* topic);
+
+/**
+ * @brief Publishes a JSON message to all clients subscribed to a named Topic.
+ * This service is thread safe and does not block on slow clients.
+ * @param[in] topic unique name of the Topic to publish to.
+ * @param[in] message JSON value (object, array, string, or number) to publish.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_WEBSOCKET_SERVER_RESULT otherwise.
+ */
+DslReturnType dsl_websocket_server_topic_publish(const wchar_t* topic,
+    const wchar_t* message);
+
+/**
+ * @brief Gets the current publish/subscribe metrics for a named Topic.
+ * @param[in] topic unique name of the Topic to query.
+ * @param[out] metrics current metrics for the named Topic.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_WEBSOCKET_SERVER_RESULT otherwise.
+ */
+DslReturnType dsl_websocket_server_topic_metrics_get(const wchar_t* topic,
+    dsl_websocket_topic_metrics* metrics);
+
 /**
  * @brief Creates a new, uniquely named Message Sink.
  * @param[in] name unique component name for the new Message Sink.
@@ -8853,6 +10332,69 @@ DslReturnType dsl_component_queue_min_threshold_set(const wchar_t* name,
     DslReturnType dsl_component_queue_min_threshold_set_many(const wchar_t** names, 
         uint unit, uint64_t min_threshold);
 
+/**
+ * @brief Gets the current queue auto-size bounds for a named Component. 
+ * Auto-sizing is applied by the Queue Sampler of the Pipeline that owns 
+ * the Component when the sampler is enabled.
+ * @param[in] name unique name of the Component to query.
+ * @param[in] unit one of the DSL_COMPONENT_QUEUE_UNIT_OF constants.
+ * @param[out] min_size minimum max-size the queue can be reduced to.
+ * @param[out] max_size maximum max-size the queue can be increased to.
+ * 0 = auto-sizing is disabled for the specified unit.
+ * @return DSL_RESULT_SUCCESS on success, one of DSL_RESULT_COMPONENT_RESULT on failure.
+ */
+DslReturnType dsl_component_queue_auto_size_get(const wchar_t* name, 
+    uint unit, uint64_t* min_size, uint64_t* max_size);
+
+/**
+ * @brief Sets the queue auto-size bounds for a named Component. The Pipeline's
+ * Queue Sampler grows the max-size by 50% on overrun or sustained occupancy
+ * above DSL_QUEUE_AUTO_SIZE_GROW_THRESHOLD and shrinks it by 25% on sustained
+ * occupancy below DSL_QUEUE_AUTO_SIZE_SHRINK_THRESHOLD, within the bounds.
+ * @param[in] name unique name of the Component to update.
+ * @param[in] unit one of the DSL_COMPONENT_QUEUE_UNIT_OF constants.
+ * @param[in] min_size minimum max-size the queue can be reduced to.
+ * @param[in] max_size maximum max-size the queue can be increased to.
+ * Set min_size and max_size to 0 to disable auto-sizing for the unit.
+ * @return DSL_RESULT_SUCCESS on success, one of DSL_RESULT_COMPONENT_RESULT on failure.
+ */
+DslReturnType dsl_component_queue_auto_size_set(const wchar_t* name, 
+    uint unit, uint64_t min_size, uint64_t max_size);
+
+/**
+ * @brief Sets the queue auto-size bounds for a null terminated list of 
+ * named Components.
+ * @param[in] names null terminated list of names of Components to update.
+ * @param[in] unit one of the DSL_COMPONENT_QUEUE_UNIT_OF constants.
+ * @param[in] min_size minimum max-size the queue can be reduced to.
+ * @param[in] max_size maximum max-size the queue can be increased to.
+ * @return DSL_RESULT_SUCCESS on success, one of DSL_RESULT_COMPONENT_RESULT on failure.
+ */
+DslReturnType dsl_component_queue_auto_size_set_many(const wchar_t** names, 
+    uint unit, uint64_t min_size, uint64_t max_size);
+
+/**
+ * @brief Gets the current queue auto-leaky enabled setting for a named Component.
+ * @param[in] name unique name of the Component to query.
+ * @param[out] enabled true if auto-leaky is enabled, false otherwise.
+ * @return DSL_RESULT_SUCCESS on success, one of DSL_RESULT_COMPONENT_RESULT on failure.
+ */
+DslReturnType dsl_component_queue_auto_leaky_enabled_get(const wchar_t* name, 
+    boolean* enabled);
+
+/**
+ * @brief Sets the queue auto-leaky enabled setting for a named Component. When
+ * enabled, the Pipeline's Queue Sampler sets the queue to leak downstream if it
+ * continues to overrun with all auto-size units at their maximum bounds. The 
+ * original leaky setting is restored once occupancy drops below the shrink
+ * threshold. Default = false.
+ * @param[in] name unique name of the Component to update.
+ * @param[in] enabled set to true to enable auto-leaky, false otherwise.
+ * @return DSL_RESULT_SUCCESS on success, one of DSL_RESULT_COMPONENT_RESULT on failure.
+ */
+DslReturnType dsl_component_queue_auto_leaky_enabled_set(const wchar_t* name, 
+    boolean enabled);
+
 /**
  * @brief Adds a queue-client-listener callback function to a named Component to 
  * be called when the queue's buffer becomes full (overrun). A buffer is full if  
@@ -8989,6 +10531,27 @@ DslReturnType dsl_component_nvbuf_mem_type_set(const wchar_t* name,
  */
 DslReturnType dsl_component_nvbuf_mem_type_set_many(const wchar_t** names, 
     uint type);
+
+/**
+ * @brief Applies a batch of property settings to named GST Elements and
+ * Components with a single service call. All settings are validated before
+ * any are applied. The batch is applied atomically - if any setting fails 
+ * to apply, all settings already applied are restored to their previous values.
+ * Settings for GST Elements may name any writable GObject property. Settings for
+ * Components may name one of "gpu-id", "nvbuf-mem-type", "queue-leaky", 
+ * "queue-max-size-buffers", "queue-max-size-bytes", "queue-max-size-time",
+ * "queue-min-threshold-buffers", "queue-min-threshold-bytes", or
+ * "queue-min-threshold-time".
+ * @param[in] properties array of property settings to apply.
+ * @param[in] count number of property settings in the array.
+ * @param[out] results array of size count to receive the result for each 
+ * setting. Valid settings that were not applied because of the failure of 
+ * another setting receive DSL_RESULT_COMPONENT_PROPERTY_NOT_APPLIED.
+ * @return DSL_RESULT_SUCCESS if all settings were applied, the result of the 
+ * first failed setting otherwise.
+ */
+DslReturnType dsl_component_property_batch_set(
+    const dsl_component_property* properties, uint count, DslReturnType* results);
     
 /**
  * @brief creates a new, uniquely named Branch
@@ -9514,6 +11077,253 @@ DslReturnType dsl_pipeline_dump_to_dot(const wchar_t* name, const wchar_t* filen
 DslReturnType dsl_pipeline_dump_to_dot_with_ts(const wchar_t* name, 
     const wchar_t* filename);
 
+/**
+ * @brief Gets the current Queue Sampler settings for a named Pipeline.
+ * @param[in] name unique name of the Pipeline to query.
+ * @param[out] interval sample interval in units of milliseconds.
+ * @param[out] window_size maximum number of samples retained per Component queue.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_queue_sampler_settings_get(const wchar_t* name, 
+    uint* interval, uint* window_size);
+
+/**
+ * @brief Sets the Queue Sampler settings for a named Pipeline. The settings 
+ * can only be updated while the Sampler is disabled. Updating the settings
+ * clears all current telemetry.
+ * @param[in] name unique name of the Pipeline to update.
+ * @param[in] interval sample interval in units of milliseconds.
+ * Default = DSL_QUEUE_SAMPLER_DEFAULT_INTERVAL.
+ * @param[in] window_size maximum number of samples retained per Component queue.
+ * Default = DSL_QUEUE_SAMPLER_DEFAULT_WINDOW_SIZE.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_queue_sampler_settings_set(const wchar_t* name, 
+    uint interval, uint window_size);
+
+/**
+ * @brief Gets the current Queue Sampler enabled setting for a named Pipeline.
+ * @param[in] name unique name of the Pipeline to query.
+ * @param[out] enabled true if the Sampler is enabled, false otherwise.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_queue_sampler_enabled_get(const wchar_t* name, 
+    boolean* enabled);
+
+/**
+ * @brief Sets the Queue Sampler enabled setting for a named Pipeline. When 
+ * enabled, the current level of every Component queue in the Pipeline is 
+ * sampled at the set interval, and queue auto-sizing is applied to all
+ * Components with auto-size bounds set. Default = false.
+ * @param[in] name unique name of the Pipeline to update.
+ * @param[in] enabled set to true to enable the Sampler, false to disable.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_queue_sampler_enabled_set(const wchar_t* name, 
+    boolean enabled);
+
+/**
+ * @brief Gets the queue telemetry for all Components in a named Pipeline 
+ * with a single call. 
+ * @param[in] name unique name of the Pipeline to query.
+ * @param[out] telemetry pointer to an array of dsl_queue_telemetry structures,
+ * one per Component queue. The array is owned by the Pipeline and remains 
+ * valid until the next call to this service or until the Pipeline is deleted.
+ * @param[out] size number of structures in the array.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_queue_telemetry_get(const wchar_t* name, 
+    const dsl_queue_telemetry** telemetry, uint* size);
+
+/**
+ * @brief Clears all queue telemetry collected for a named Pipeline.
+ * @param[in] name unique name of the Pipeline to update.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_queue_telemetry_clear(const wchar_t* name);
+
+/**
+ * @brief Gets the name of the Component identified as the bottleneck of a
+ * named Pipeline. The bottleneck is the Component queue with the highest
+ * overrun rate or, if no overruns occurred, the highest 90th percentile
+ * occupancy at or above DSL_QUEUE_BOTTLENECK_THRESHOLD. 
+ * @param[in] name unique name of the Pipeline to query.
+ * @param[out] component name of the bottleneck Component, empty string if none.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_queue_bottleneck_get(const wchar_t* name, 
+    const wchar_t** component);
+
+/**
+ * @brief Gets the current load-shedding interval bounds for a named
+ * Pipeline's Infer Interval Controller.
+ * @param[in] name unique name of the Pipeline to query.
+ * @param[out] min_interval minimum load-shedding interval.
+ * @param[out] max_interval maximum load-shedding interval.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_infer_interval_bounds_get(const wchar_t* name, 
+    uint* min_interval, uint* max_interval);
+
+/**
+ * @brief Sets the load-shedding interval bounds for a named Pipeline's Infer
+ * Interval Controller. Each Infer Component uses the greater of its own 
+ * configured interval and the controller's load-shedding interval.
+ * @param[in] name unique name of the Pipeline to update.
+ * @param[in] min_interval minimum load-shedding interval. 
+ * Default = DSL_INFER_INTERVAL_DEFAULT_MIN_INTERVAL.
+ * @param[in] max_interval maximum load-shedding interval. 
+ * Default = DSL_INFER_INTERVAL_DEFAULT_MAX_INTERVAL.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_infer_interval_bounds_set(const wchar_t* name, 
+    uint min_interval, uint max_interval);
+
+/**
+ * @brief Gets the current load thresholds for a named Pipeline's Infer 
+ * Interval Controller.
+ * @param[in] name unique name of the Pipeline to query.
+ * @param[out] low_occupancy queue occupancy, as a percentage of max-size, 
+ * at or below which the Pipeline is underloaded.
+ * @param[out] high_occupancy queue occupancy, as a percentage of max-size,
+ * at or above which the Pipeline is overloaded.
+ * @param[out] max_latency reported latency in ms above which the Pipeline
+ * is overloaded, 0 = disabled.
+ * @param[out] min_fps reported frame-rate below which the Pipeline is 
+ * overloaded, 0 = disabled.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_infer_interval_thresholds_get(const wchar_t* name, 
+    uint* low_occupancy, uint* high_occupancy, uint* max_latency, uint* min_fps);
+
+/**
+ * @brief Sets the load thresholds for a named Pipeline's Infer Interval 
+ * Controller. The Pipeline is overloaded if the peak queue occupancy is at or 
+ * above high_occupancy, if any queue overruns, or if the reported latency or 
+ * frame-rate is beyond its threshold. The Pipeline is underloaded if the peak 
+ * occupancy is at or below low_occupancy, no queue overruns, and the reported 
+ * latency is within DSL_INFER_INTERVAL_LATENCY_RECOVERY_PERCENT of max_latency.
+ * @param[in] name unique name of the Pipeline to update.
+ * @param[in] low_occupancy underloaded occupancy threshold in percent.
+ * Default = DSL_INFER_INTERVAL_DEFAULT_LOW_OCCUPANCY.
+ * @param[in] high_occupancy overloaded occupancy threshold in percent.
+ * Default = DSL_INFER_INTERVAL_DEFAULT_HIGH_OCCUPANCY.
+ * @param[in] max_latency latency threshold in ms, 0 = disabled (default).
+ * @param[in] min_fps frame-rate threshold, 0 = disabled (default).
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_infer_interval_thresholds_set(const wchar_t* name, 
+    uint low_occupancy, uint high_occupancy, uint max_latency, uint min_fps);
+
+/**
+ * @brief Gets the current update and hysteresis settings for a named 
+ * Pipeline's Infer Interval Controller.
+ * @param[in] name unique name of the Pipeline to query.
+ * @param[out] update_interval controller update interval in milliseconds.
+ * @param[out] step_up_count number of consecutive overloaded updates 
+ * required to step the load-shedding interval up.
+ * @param[out] step_down_count number of consecutive underloaded updates 
+ * required to step the load-shedding interval down.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_infer_interval_hysteresis_get(const wchar_t* name, 
+    uint* update_interval, uint* step_up_count, uint* step_down_count);
+
+/**
+ * @brief Sets the update and hysteresis settings for a named Pipeline's Infer 
+ * Interval Controller. The settings can only be updated while the controller 
+ * is disabled. Each step up doubles the inference period (interval+1), each 
+ * step down decrements the interval by one.
+ * @param[in] name unique name of the Pipeline to update.
+ * @param[in] update_interval controller update interval in milliseconds.
+ * Default = DSL_INFER_INTERVAL_DEFAULT_UPDATE_INTERVAL.
+ * @param[in] step_up_count consecutive overloaded updates required to step up.
+ * Default = DSL_INFER_INTERVAL_DEFAULT_STEP_UP_COUNT.
+ * @param[in] step_down_count consecutive underloaded updates required to 
+ * step down. Default = DSL_INFER_INTERVAL_DEFAULT_STEP_DOWN_COUNT.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_infer_interval_hysteresis_set(const wchar_t* name, 
+    uint update_interval, uint step_up_count, uint step_down_count);
+
+/**
+ * @brief Gets the current Infer Interval Controller enabled setting for a 
+ * named Pipeline.
+ * @param[in] name unique name of the Pipeline to query.
+ * @param[out] enabled true if the controller is enabled, false otherwise.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_infer_interval_controller_enabled_get(
+    const wchar_t* name, boolean* enabled);
+
+/**
+ * @brief Sets the Infer Interval Controller enabled setting for a named 
+ * Pipeline. When enabled, the controller evaluates the Pipeline's load at the 
+ * update interval and adjusts the load-shedding interval of all Primary and 
+ * Secondary Infer Components within the bounds. Queue occupancy is provided
+ * by the Pipeline's Queue Sampler which must be enabled as well. Disabling 
+ * the controller restores all Infer Components to their configured interval.
+ * Default = false.
+ * @param[in] name unique name of the Pipeline to update.
+ * @param[in] enabled set to true to enable the controller, false to disable.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_infer_interval_controller_enabled_set(
+    const wchar_t* name, boolean enabled);
+
+/**
+ * @brief Reports the current frame-rate and end-to-end latency to a named 
+ * Pipeline's Infer Interval Controller, typically from a Meter Pad Probe 
+ * Handler's client callback. The values are used by all subsequent updates
+ * until reported again.
+ * @param[in] name unique name of the Pipeline to update.
+ * @param[in] fps current frame-rate, 0 = not available.
+ * @param[in] latency current end-to-end latency in ms, 0 = not available.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_infer_interval_load_report(const wchar_t* name, 
+    double fps, uint latency);
+
+/**
+ * @brief Gets the current decision metrics for a named Pipeline's Infer 
+ * Interval Controller.
+ * @param[in] name unique name of the Pipeline to query.
+ * @param[out] metrics pointer to a client structure to fill in.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_infer_interval_metrics_get(const wchar_t* name, 
+    dsl_infer_interval_metrics* metrics);
+
+/**
+ * @brief Clears the decision metrics for a named Pipeline's Infer Interval 
+ * Controller. The current interval is unaffected.
+ * @param[in] name unique name of the Pipeline to update.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_infer_interval_metrics_clear(const wchar_t* name);
+
+/**
+ * @brief Adds a callback to be notified when a named Pipeline's Infer Interval
+ * Controller changes the load-shedding interval.
+ * @param[in] name name of the Pipeline to update.
+ * @param[in] listener pointer to the client's function to call on change.
+ * @param[in] client_data opaque pointer to client data passed into the 
+ * listener function.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_infer_interval_change_listener_add(const wchar_t* name, 
+    dsl_infer_interval_change_listener_cb listener, void* client_data);
+
+/**
+ * @brief Removes a callback previously added with 
+ * dsl_pipeline_infer_interval_change_listener_add.
+ * @param[in] name name of the Pipeline to update.
+ * @param[in] listener pointer to the client's function to remove.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_infer_interval_change_listener_remove(
+    const wchar_t* name, dsl_infer_interval_change_listener_cb listener);
+
 /**
  * @brief adds a callback to be notified on End of Stream (EOS)
  * @param[in] name name of the pipeline to update
@@ -9635,6 +11445,125 @@ DslReturnType dsl_pipeline_main_loop_quit(const wchar_t* name);
  * @param name name of the Pipeline to update. 
  */
 DslReturnType dsl_pipeline_main_loop_delete(const wchar_t* name);
+
+/**
+ * @brief Gets the time-to-first-frame for a named Pipeline, measured from 
+ * the call to dsl_pipeline_play -- from a state of NULL or READY -- to the
+ * first batched buffer produced by the Pipeline's Streammuxer.
+ * @param[in] name name of the Pipeline to query.
+ * @param[out] time_to_first_frame time-to-first-frame in milliseconds, 
+ * 0 if the measurement is pending or the Pipeline has never played.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_time_to_first_frame_get(const wchar_t* name,
+    double* time_to_first_frame);
+
+/**
+ * @brief Gets the startup profile for a named Pipeline. The profile records
+ * the link time, every element state change, and the first buffer on each 
+ * element pad, timestamped from the start of the most recent call to 
+ * dsl_pipeline_play from a state of NULL or READY. The profile is updated
+ * as events occur and can be queried at any time.
+ * @param[in] name name of the Pipeline to query.
+ * @param[out] profile pointer to a client structure to fill in with the
+ * profile summary.
+ * @param[out] events pointer to an array of dsl_pipeline_startup_event 
+ * structures in the order they occurred. The array is owned by the Pipeline 
+ * and remains valid until the next call to this service or until the 
+ * Pipeline is deleted.
+ * @param[out] size number of structures in the array.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_startup_profile_get(const wchar_t* name,
+    dsl_pipeline_startup_profile* profile, 
+    const dsl_pipeline_startup_event** events, uint* size);
+
+/**
+ * @brief Creates a new, uniquely named Pipeline Pool from a NULL terminated
+ * list of Pipelines built from a common template. Each Pipeline is linked 
+ * -- without Sources -- and taken to the standby state with all Inference
+ * engines loaded. Each Pipeline must have its Streammuxer batch-size set.
+ * @param[in] name unique name for the new Pipeline Pool.
+ * @param[in] pipelines NULL terminated list of Pipeline names to add.
+ * @param[in] standby_state one of DSL_STATE_READY or DSL_STATE_PAUSED.
+ * @param[in] is_live set to true if the Sources to be added are live, 
+ * false otherwise.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_pool_new(const wchar_t* name, 
+    const wchar_t** pipelines, uint standby_state, boolean is_live);
+
+/**
+ * @brief Deletes a named Pipeline Pool. All Pipelines in standby are stopped
+ * and unlinked. The Pipelines are not deleted. The Pool can't be deleted 
+ * while any of its Pipelines are acquired.
+ * @param[in] name unique name of the Pipeline Pool to delete.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_pool_delete(const wchar_t* name);
+
+/**
+ * @brief Deletes all Pipeline Pools. Pipelines still acquired are left in 
+ * their current state with their Sources.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_pool_delete_all();
+
+/**
+ * @brief Returns the current number of Pipeline Pools.
+ * @return size of the list of Pipeline Pools.
+ */
+uint dsl_pipeline_pool_list_size();
+
+/**
+ * @brief Acquires an available Pipeline from a named Pipeline Pool, adds a
+ * NULL terminated list of Sources with the dynamic Source add path, and 
+ * plays the Pipeline.
+ * @param[in] name unique name of the Pipeline Pool to acquire from.
+ * @param[in] sources NULL terminated list of Source names to add.
+ * @param[out] pipeline unique name of the acquired Pipeline.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_pool_acquire(const wchar_t* name, 
+    const wchar_t** sources, const wchar_t** pipeline);
+
+/**
+ * @brief Releases a Pipeline previously acquired from a named Pipeline Pool.
+ * The Sources added on acquire are removed and the Pipeline is returned to
+ * its standby state to be reused.
+ * @param[in] name unique name of the Pipeline Pool to release to.
+ * @param[in] pipeline unique name of the Pipeline to release.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_pool_release(const wchar_t* name, 
+    const wchar_t* pipeline);
+
+/**
+ * @brief Gets the current size and availability of a named Pipeline Pool.
+ * @param[in] name unique name of the Pipeline Pool to query.
+ * @param[out] size number of Pipelines in the Pool.
+ * @param[out] available number of Pipelines available to acquire.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_pool_size_get(const wchar_t* name, 
+    uint* size, uint* available);
+
+/**
+ * @brief Gets the current metrics for a named Pipeline Pool.
+ * @param[in] name unique name of the Pipeline Pool to query.
+ * @param[out] metrics current metrics for the Pool.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_pool_metrics_get(const wchar_t* name, 
+    dsl_pipeline_pool_metrics* metrics);
+
+/**
+ * @brief Clears the current metrics for a named Pipeline Pool.
+ * @param[in] name unique name of the Pipeline Pool to update.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PIPELINE_RESULT on failure.
+ */
+DslReturnType dsl_pipeline_pool_metrics_clear(const wchar_t* name);
+
 /**
  * @brief Creates a new, uniquely named Player
  * @param[in] name unique name for the new Player
@@ -10323,6 +12252,21 @@ DslReturnType dsl_info_log_file_set_with_ts(const wchar_t* file_path);
  */
 DslReturnType dsl_info_log_function_restore();
 
+/**
+ * @brief Gets all RTSP Sources and Buffer Timeout Pad Probe Handlers that are 
+ * currently stalled, i.e. that have exceeded their buffer timeout without 
+ * receiving a new buffer. Sources and PPHs that have yet to receive their
+ * first buffer are not reported. All stall detection is performed by a single 
+ * Stall Watchdog.
+ * @param[out] sources pointer to an array of dsl_stalled_source structures,
+ * one per stalled Source or PPH. The array is owned by the Stall Watchdog and 
+ * remains valid until the next call to this service. NULL if size = 0.
+ * @param[out] size number of structures in the array.
+ * @return DSL_RESULT_SUCCESS on success, one of DSL_RESULT otherwise.
+ */
+DslReturnType dsl_info_stalled_sources_get(const dsl_stalled_source** sources,
+    uint* size);
+
 
 EXTERN_C_END
 
@@ -325,6 +325,17 @@ namespace DSL
             return m_pChildren.size();
         }
 
+        /**
+         * @brief returns a copy of this Object's map of Child Objects.
+         * @return map of Child Objects by unique name.
+         */
+        virtual std::map<std::string, DSL_BASE_PTR> GetChildren()
+        {
+            LOG_FUNC();
+            
+            return m_pChildren;
+        }
+
         
     protected:
 
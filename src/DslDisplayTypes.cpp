@@ -151,6 +151,32 @@ namespace DSL
         LOG_FUNC();
         LOG_ERROR("Base Display Type can not be overlaid");
     }
+
+    uint DisplayType::CopyLineParams(std::vector<NvDsDisplayMeta*>& displayMetaData,
+        const std::vector<NvOSD_LineParams>& lineParams)
+    {
+        uint copied(0);
+        
+        // fill each display meta structure in order, copying as many lines
+        // as will fit with a single copy for each.
+        for (const auto& ivec: displayMetaData)
+        {
+            if (copied == lineParams.size())
+            {
+                break;
+            }
+            uint available = MAX_ELEMENTS_IN_DISPLAY_META - ivec->num_lines;
+            uint count = std::min(available, (uint)lineParams.size() - copied);
+            if (count)
+            {
+                memcpy(&ivec->line_params[ivec->num_lines], &lineParams[copied],
+                    count*sizeof(NvOSD_LineParams));
+                ivec->num_lines += count;
+                copied += count;
+            }
+        }
+        return copied;
+    }
     
     // ********************************************************************
 
@@ -428,6 +454,29 @@ namespace DSL
     {
 //        LOG_FUNC();
 
+        AddTextMeta(displayMetaData, m_text);
+    }
+    
+    void RgbaText::AddDynamicTextMeta(std::vector<NvDsDisplayMeta*>& displayMetaData,
+        uint sourceId, uint64_t value, 
+        const std::function<std::string(uint64_t)>& render)
+    {
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        
+        auto ientry = m_renderedText.find(sourceId);
+        
+        // only render the text on first use or on change of value for the source.
+        if (ientry == m_renderedText.end() or ientry->second.first != value)
+        {
+            m_renderedText[sourceId] = std::make_pair(value, render(value));
+            ientry = m_renderedText.find(sourceId);
+        }
+        AddTextMeta(displayMetaData, ientry->second.second);
+    }
+    
+    void RgbaText::AddTextMeta(std::vector<NvDsDisplayMeta*>& displayMetaData,
+        const std::string& text)
+    {
         // check to see if we're adding meta data - client can disable
         // by setting the PPH ODE display meta alloc size to 0.
         // and ensure we have available space in the vector of meta structs.
@@ -458,13 +507,13 @@ namespace DSL
 
             // need to allocate storage for actual text, then copy.
             pTextParams->display_text = (gchar*) g_malloc0(MAX_DISPLAY_LEN);
-            m_text.copy(pTextParams->display_text, MAX_DISPLAY_LEN, 0);
+            text.copy(pTextParams->display_text, MAX_DISPLAY_LEN-1, 0);
 
             pTextParams->font_params = *m_pShadowFont;
             // Font, font-size, font-color
             pTextParams->font_params.font_name = (gchar*) g_malloc0(MAX_DISPLAY_LEN);
             m_pShadowFont->m_fontName.copy(pTextParams->font_params.font_name, 
-                MAX_DISPLAY_LEN, 0);
+                MAX_DISPLAY_LEN-1, 0);
                 
         }
         NvOSD_TextParams *pTextParams = &pDisplayMeta->
@@ -477,12 +526,12 @@ namespace DSL
         
         // need to allocate storage for actual text, then copy.
         pTextParams->display_text = (gchar*) g_malloc0(MAX_DISPLAY_LEN);
-        m_text.copy(pTextParams->display_text, MAX_DISPLAY_LEN, 0);
+        text.copy(pTextParams->display_text, MAX_DISPLAY_LEN-1, 0);
         
         // Font, font-size, font-color
         pTextParams->font_params.font_name = (gchar*) g_malloc0(MAX_DISPLAY_LEN);
         m_pFont->m_fontName.copy(pTextParams->font_params.font_name, 
-            MAX_DISPLAY_LEN, 0);
+            MAX_DISPLAY_LEN-1, 0);
     }
         
     // ********************************************************************
@@ -639,6 +688,18 @@ namespace DSL
         this->coordinates = 
             (dsl_coordinate*) g_malloc0(numCoordinates*sizeof(dsl_coordinate));
         memcpy(this->coordinates, coordinates, numCoordinates*sizeof(dsl_coordinate));
+        
+        // compile the closed set of line params once, one for each side.
+        for (uint i = 0; i < num_coordinates; i++)
+        {
+            m_lineParams.push_back({
+                this->coordinates[i].x, 
+                this->coordinates[i].y, 
+                this->coordinates[(i+1)%num_coordinates].x, 
+                this->coordinates[(i+1)%num_coordinates].y, 
+                border_width, 
+                color});
+        }
     }
 
     RgbaPolygon::~RgbaPolygon()
@@ -653,39 +714,24 @@ namespace DSL
     {
 //        LOG_FUNC();
 
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+
+        // update the compiled line params only if the color has changed.
         m_pColor->Lock();
-        color = *m_pColor;
-        m_pColor->Unlock();
-        
-        for (uint i = 0; i < num_coordinates; i++)
+        const NvOSD_ColorParams& currentColor = *m_pColor;
+        if (memcmp(&color, &currentColor, sizeof(NvOSD_ColorParams)))
         {
-            // check to see if we're adding meta data - client can disable
-            // by setting the PPH ODE display meta alloc size to 0.
-            // and ensure we have available space in the vector of meta structs.
-            NvDsDisplayMeta* pDisplayMeta(NULL);
-            for (const auto& ivec: displayMetaData)
-            {
-                if (ivec->num_lines < MAX_ELEMENTS_IN_DISPLAY_META)
-                {
-                    pDisplayMeta = ivec;
-                    break;
-                }
-            }
-            if (!pDisplayMeta)
+            color = currentColor;
+            for (auto& line: m_lineParams)
             {
-                return;
+                line.line_color = color;
             }
-            
-            NvOSD_LineParams line = {
-                coordinates[i].x, 
-                coordinates[i].y, 
-                coordinates[(i+1)%num_coordinates].x, 
-                coordinates[(i+1)%num_coordinates].y, 
-                border_width, 
-                color};
-                
-            pDisplayMeta->line_params[pDisplayMeta->num_lines++] = line;
         }
+        m_pColor->Unlock();
+        
+        // check to see if we're adding meta data - client can disable
+        // by setting the PPH ODE display meta alloc size to 0.
+        CopyLineParams(displayMetaData, m_lineParams);
     }
 
     // ********************************************************************
@@ -703,6 +749,18 @@ namespace DSL
         this->coordinates = 
             (dsl_coordinate*) g_malloc0(numCoordinates*sizeof(dsl_coordinate));
         memcpy(this->coordinates, coordinates, numCoordinates*sizeof(dsl_coordinate));
+
+        // compile the open set of line params once, one for each segment.
+        for (uint i = 0; i+1 < num_coordinates; i++)
+        {
+            m_lineParams.push_back({
+                this->coordinates[i].x, 
+                this->coordinates[i].y, 
+                this->coordinates[i+1].x, 
+                this->coordinates[i+1].y, 
+                line_width, 
+                color});
+        }
     }
 
     RgbaMultiLine::~RgbaMultiLine()
@@ -717,38 +775,24 @@ namespace DSL
     {
 //        LOG_FUNC();
 
-        m_pColor->Lock();
-        color = *m_pColor;
-        m_pColor->Unlock();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
 
-        for (uint i = 0; i < num_coordinates-1; i++)
+        // update the compiled line params only if the color has changed.
+        m_pColor->Lock();
+        const NvOSD_ColorParams& currentColor = *m_pColor;
+        if (memcmp(&color, &currentColor, sizeof(NvOSD_ColorParams)))
         {
-            // check to see if we're adding meta data - client can disable
-            // by setting the PPH ODE display meta alloc size to 0.
-            // and ensure we have available space in the vector of meta structs.
-            NvDsDisplayMeta* pDisplayMeta(NULL);
-            for (const auto& ivec: displayMetaData)
-            {
-                if (ivec->num_lines < MAX_ELEMENTS_IN_DISPLAY_META)
-                {
-                    pDisplayMeta = ivec;
-                    break;
-                }
-            }
-            if (!pDisplayMeta)
+            color = currentColor;
+            for (auto& line: m_lineParams)
             {
-                return;
+                line.line_color = color;
             }
-            NvOSD_LineParams line = {
-                coordinates[i].x, 
-                coordinates[i].y, 
-                coordinates[(i+1)].x, 
-                coordinates[(i+1)].y, 
-                line_width, 
-                color};
-                
-            pDisplayMeta->line_params[pDisplayMeta->num_lines++] = line;
         }
+        m_pColor->Unlock();
+
+        // check to see if we're adding meta data - client can disable
+        // by setting the PPH ODE display meta alloc size to 0.
+        CopyLineParams(displayMetaData, m_lineParams);
     }
     // ********************************************************************
 
@@ -808,10 +852,16 @@ namespace DSL
         NvDsFrameMeta* pFrameMeta) 
     {
 //        LOG_FUNC();
-        m_text = std::to_string(pFrameMeta->source_frame_width) + " x " + 
-            std::to_string(pFrameMeta->source_frame_height);
-
-        RgbaText::AddMeta(displayMetaData, pFrameMeta);
+        // pack the dimensions into a single value to detect a change.
+        uint64_t dimensions = ((uint64_t)pFrameMeta->source_frame_width << 32) |
+            pFrameMeta->source_frame_height;
+            
+        AddDynamicTextMeta(displayMetaData, pFrameMeta->source_id, dimensions,
+            [](uint64_t value)
+            {
+                return std::to_string(value >> 32) + " x " + 
+                    std::to_string(value & 0xFFFFFFFF);
+            });
     }
 
     // ********************************************************************
@@ -860,9 +910,11 @@ namespace DSL
     {
 //        LOG_FUNC();
 
-        m_text = int_to_hex(pFrameMeta->source_id);
-
-        RgbaText::AddMeta(displayMetaData, pFrameMeta);
+        AddDynamicTextMeta(displayMetaData, pFrameMeta->source_id, 
+            pFrameMeta->source_id, [](uint64_t value)
+            {
+                return int_to_hex((uint)value);
+            });
     }
 
     // ********************************************************************
@@ -885,10 +937,11 @@ namespace DSL
     {
 //        LOG_FUNC();
 
-        m_text = std::to_string(pFrameMeta->source_id & 
-            DSL_PIPELINE_SOURCE_STREAM_ID_MASK);
-
-        RgbaText::AddMeta(displayMetaData, pFrameMeta);
+        AddDynamicTextMeta(displayMetaData, pFrameMeta->source_id, 
+            pFrameMeta->source_id, [](uint64_t value)
+            {
+                return std::to_string(value & DSL_PIPELINE_SOURCE_STREAM_ID_MASK);
+            });
     }
 
     // ********************************************************************
@@ -172,6 +172,17 @@ namespace DSL
             displayMetaData, NvDsFrameMeta* pFrameMeta);
             
     protected:
+    
+        /**
+         * @brief Bulk copies a block of precompiled line params into the 
+         * Display Meta structures with available space, filling each in order.
+         * @param displayMetaData vector of allocated Display metadata to add 
+         * the lines to.
+         * @param lineParams precompiled line params to copy.
+         * @return the number of lines copied. 
+         */
+        static uint CopyLineParams(std::vector<NvDsDisplayMeta*>& displayMetaData,
+            const std::vector<NvOSD_LineParams>& lineParams);
         
         /**
          * @brief Mutex to ensure mutual exlusion for propery read/writes
@@ -501,8 +512,39 @@ namespace DSL
         
         std::string m_text;
         
+    protected:
+    
+        /**
+         * @brief Adds the Text's meta, with the provided display text, 
+         * to the provided displayMetaData.
+         * @param displayMetaData vector of allocated Display metadata to add 
+         * the meta to
+         * @param text display text to add.
+         */
+        void AddTextMeta(std::vector<NvDsDisplayMeta*>& displayMetaData,
+            const std::string& text);
+            
+        /**
+         * @brief Adds the Text's meta for a dynamic field. The text is rendered 
+         * once per source and re-rendered only when the field's value changes.
+         * @param displayMetaData vector of allocated Display metadata to add 
+         * the meta to
+         * @param sourceId unique source id for the frame the meta is added to.
+         * @param value current value of the dynamic field for the source.
+         * @param render function to render the display text from the value.
+         */
+        void AddDynamicTextMeta(std::vector<NvDsDisplayMeta*>& displayMetaData,
+            uint sourceId, uint64_t value, 
+            const std::function<std::string(uint64_t)>& render);
+        
     private:
     
+        /**
+         * @brief map of source id to last rendered value and text, 
+         * used for dynamic text fields.
+         */
+        std::unordered_map<uint, std::pair<uint64_t, std::string>> m_renderedText;
+    
         /**
          * @breif shared pointer to a RGBA Font Type for this RGBA Text
          */
@@ -732,6 +774,13 @@ namespace DSL
          * @breif shared pointer to a RGBA Color Type for this RGBA Polygon
          */
         DSL_RGBA_COLOR_PTR m_pColor;
+        
+        /**
+         * @brief line params compiled once on construction, ready to be
+         * bulk copied into the frame's display meta. Only the color is 
+         * updated, and only when the RGBA Color changes.
+         */
+        std::vector<NvOSD_LineParams> m_lineParams;
     };
 
     // ********************************************************************
@@ -799,6 +848,13 @@ namespace DSL
          * @breif shared pointer to a RGBA Color Type for this RGBA Multi-Line
          */
         DSL_RGBA_COLOR_PTR m_pColor;
+        
+        /**
+         * @brief line params compiled once on construction, ready to be
+         * bulk copied into the frame's display meta. Only the color is 
+         * updated, and only when the RGBA Color changes.
+         */
+        std::vector<NvOSD_LineParams> m_lineParams;
     };
 
     
@@ -0,0 +1,313 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include "Dsl.h"
+#include "DslFrameDecimator.h"
+
+namespace DSL
+{
+    FrameDecimator::FrameDecimator(const char* name)
+        : m_name(name)
+        , m_fpsN(0)
+        , m_fpsD(0)
+        , m_interval(0)
+        , m_nextPts(GST_CLOCK_TIME_NONE)
+        , m_lastPassedPts(GST_CLOCK_TIME_NONE)
+        , m_lastDecodedPts(GST_CLOCK_TIME_NONE)
+        , m_keyFramePts(GST_CLOCK_TIME_NONE)
+        , m_gopDuration(GST_CLOCK_TIME_NONE)
+        , m_dropToKeyFrame(false)
+        , m_framesPassed(0)
+        , m_framesDropped(0)
+        , m_framesDroppedPreDecode(0)
+    {
+        LOG_FUNC();
+    }
+
+    FrameDecimator::~FrameDecimator()
+    {
+        LOG_FUNC();
+
+        RemoveAllPadProbes();
+    }
+
+    void FrameDecimator::GetFrameRate(uint* fpsN, uint* fpsD)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_decimatorMutex);
+
+        *fpsN = m_fpsN;
+        *fpsD = m_fpsD;
+    }
+
+    bool FrameDecimator::SetFrameRate(uint fpsN, uint fpsD)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_decimatorMutex);
+
+        if (fpsN and !fpsD)
+        {
+            LOG_ERROR("Invalid frame-rate " << fpsN << "/" << fpsD 
+                << " for the FrameDecimator of Source '" << m_name << "'");
+            return false;
+        }
+        m_fpsN = fpsN;
+        m_fpsD = (fpsN) ? fpsD : 0;
+
+        // Restart the schedule with the next decoded frame.
+        m_interval.store((fpsN) 
+            ? gst_util_uint64_scale(GST_SECOND, fpsD, fpsN) : 0);
+        m_nextPts.store(GST_CLOCK_TIME_NONE);
+
+        LOG_INFO("FrameDecimator for Source '" << m_name 
+            << "' set to frame-rate " << m_fpsN << "/" << m_fpsD);
+        return true;
+    }
+
+    void FrameDecimator::GetStats(uint64_t* framesPassed, 
+        uint64_t* framesDropped, uint64_t* framesDroppedPreDecode)
+    {
+        LOG_FUNC();
+
+        *framesPassed = m_framesPassed.load(std::memory_order_relaxed);
+        *framesDropped = m_framesDropped.load(std::memory_order_relaxed);
+        *framesDroppedPreDecode = 
+            m_framesDroppedPreDecode.load(std::memory_order_relaxed);
+    }
+
+    void FrameDecimator::ClearStats()
+    {
+        LOG_FUNC();
+
+        m_framesPassed.store(0, std::memory_order_relaxed);
+        m_framesDropped.store(0, std::memory_order_relaxed);
+        m_framesDroppedPreDecode.store(0, std::memory_order_relaxed);
+    }
+
+    bool FrameDecimator::AddPadProbe(GstPad* pPad, bool encoded)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_decimatorMutex);
+
+        if (m_decodedPadProbes.find(pPad) != m_decodedPadProbes.end() or
+            m_encodedPadProbes.find(pPad) != m_encodedPadProbes.end())
+        {
+            LOG_ERROR("FrameDecimator for Source '" << m_name 
+                << "' has already been added to pad '" 
+                << GST_PAD_NAME(pPad) << "'");
+            return false;
+        }
+        gulong probeId = gst_pad_add_probe(pPad, GST_PAD_PROBE_TYPE_BUFFER, 
+            (encoded) ? FrameDecimatorEncodedPadProbeCB 
+                : FrameDecimatorDecodedPadProbeCB, this, NULL);
+        if (!probeId)
+        {
+            LOG_ERROR("Failed to add pad probe for the FrameDecimator of Source '"
+                << m_name << "'");
+            return false;
+        }
+        if (encoded)
+        {
+            // New encoded stream - wait for the first key frame to measure
+            // the GOP duration before dropping anything.
+            m_keyFramePts = GST_CLOCK_TIME_NONE;
+            m_gopDuration = GST_CLOCK_TIME_NONE;
+            m_dropToKeyFrame = false;
+        }
+        else
+        {
+            m_lastDecodedPts = GST_CLOCK_TIME_NONE;
+            m_nextPts.store(GST_CLOCK_TIME_NONE);
+            m_lastPassedPts.store(GST_CLOCK_TIME_NONE);
+        }
+        std::map<GstPad*, gulong>& padProbes = (encoded) 
+            ? m_encodedPadProbes : m_decodedPadProbes;
+        padProbes[GST_PAD(gst_object_ref(pPad))] = probeId;
+
+        LOG_INFO("FrameDecimator for Source '" << m_name << "' added to "
+            << ((encoded) ? "encoded" : "decoded") << " pad '" 
+            << GST_PAD_NAME(pPad) << "'");
+        return true;
+    }
+
+    void FrameDecimator::RemovePadProbes(bool encoded)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_decimatorMutex);
+
+        std::map<GstPad*, gulong>& padProbes = (encoded) 
+            ? m_encodedPadProbes : m_decodedPadProbes;
+
+        for (auto const& imap: padProbes)
+        {
+            gst_pad_remove_probe(imap.first, imap.second);
+            gst_object_unref(imap.first);
+        }
+        padProbes.clear();
+    }
+
+    void FrameDecimator::RemoveAllPadProbes()
+    {
+        LOG_FUNC();
+
+        RemovePadProbes(false);
+        RemovePadProbes(true);
+    }
+
+    uint FrameDecimator::GetNumPadProbes(bool encoded)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_decimatorMutex);
+
+        return (encoded) ? m_encodedPadProbes.size() 
+            : m_decodedPadProbes.size();
+    }
+
+    GstPadProbeReturn FrameDecimator::HandleDecodedBuffer(GstBuffer* pBuffer)
+    {
+        // Note: called for every decoded buffer - atomics only, no lock.
+        uint64_t interval = m_interval.load(std::memory_order_relaxed);
+        GstClockTime pts = GST_BUFFER_PTS(pBuffer);
+
+        if (!interval or !GST_CLOCK_TIME_IS_VALID(pts))
+        {
+            m_framesPassed.fetch_add(1, std::memory_order_relaxed);
+            return GST_PAD_PROBE_OK;
+        }
+
+        GstClockTime nextPts = m_nextPts.load();
+
+        // The PTS has moved back - seek, loop, or reconnect - restart the schedule.
+        if (GST_CLOCK_TIME_IS_VALID(m_lastDecodedPts) and pts < m_lastDecodedPts)
+        {
+            nextPts = GST_CLOCK_TIME_NONE;
+        }
+        m_lastDecodedPts = pts;
+
+        // Allow for PTS jitter of up to half a frame.
+        GstClockTime tolerance = (GST_BUFFER_DURATION_IS_VALID(pBuffer))
+            ? GST_BUFFER_DURATION(pBuffer)/2 : 0;
+
+        if (GST_CLOCK_TIME_IS_VALID(nextPts) and pts + tolerance < nextPts)
+        {
+            m_framesDropped.fetch_add(1, std::memory_order_relaxed);
+            return GST_PAD_PROBE_DROP;
+        }
+
+        // Step the schedule one interval to hold the average rate, unless
+        // the stream has fallen behind by more than an interval.
+        nextPts = (!GST_CLOCK_TIME_IS_VALID(nextPts) or pts >= nextPts + interval)
+            ? pts + interval : nextPts + interval;
+
+        m_nextPts.store(nextPts);
+        m_lastPassedPts.store(pts);
+        m_framesPassed.fetch_add(1, std::memory_order_relaxed);
+        return GST_PAD_PROBE_OK;
+    }
+
+    GstPadProbeReturn FrameDecimator::HandleEncodedBuffer(GstBuffer* pBuffer)
+    {
+        // Note: called for every encoded buffer - atomics only, no lock.
+        
+        // Never drop stream headers, they are not frames.
+        if (GST_BUFFER_FLAG_IS_SET(pBuffer, GST_BUFFER_FLAG_HEADER))
+        {
+            return GST_PAD_PROBE_OK;
+        }
+
+        uint64_t interval = m_interval.load(std::memory_order_relaxed);
+        GstClockTime pts = GST_BUFFER_PTS(pBuffer);
+
+        if (!GST_BUFFER_FLAG_IS_SET(pBuffer, GST_BUFFER_FLAG_DELTA_UNIT))
+        {
+            // New GOP - update the GOP duration from the last key frame.
+            // If the PTS has moved back, wait for the next GOP to measure.
+            m_gopDuration = (GST_CLOCK_TIME_IS_VALID(pts) and 
+                GST_CLOCK_TIME_IS_VALID(m_keyFramePts) and pts > m_keyFramePts)
+                ? pts - m_keyFramePts : GST_CLOCK_TIME_NONE;
+            m_keyFramePts = pts;
+            m_dropToKeyFrame = false;
+
+            GstClockTime nextPts = m_nextPts.load();
+
+            // Drop the whole GOP if it ends before the next frame is due.
+            if (interval and GST_CLOCK_TIME_IS_VALID(m_gopDuration) and
+                GST_CLOCK_TIME_IS_VALID(nextPts) and 
+                pts + m_gopDuration <= nextPts)
+            {
+                m_dropToKeyFrame = true;
+            }
+        }
+        else if (!m_dropToKeyFrame and interval and 
+            GST_CLOCK_TIME_IS_VALID(m_gopDuration))
+        {
+            GstClockTime nextPts = m_nextPts.load();
+            GstClockTime lastPassedPts = m_lastPassedPts.load();
+
+            // Drop the rest of the GOP once a frame of this GOP has been
+            // passed after decode and the next frame is not due in this GOP.
+            if (GST_CLOCK_TIME_IS_VALID(nextPts) and 
+                GST_CLOCK_TIME_IS_VALID(lastPassedPts) and
+                lastPassedPts >= m_keyFramePts and
+                nextPts >= m_keyFramePts + m_gopDuration)
+            {
+                m_dropToKeyFrame = true;
+            }
+        }
+
+        // Once dropping, always drop to the next key frame - even if disabled -
+        // as the decoder can't decode the delta frames that follow.
+        if (m_dropToKeyFrame)
+        {
+            m_framesDropped.fetch_add(1, std::memory_order_relaxed);
+            m_framesDroppedPreDecode.fetch_add(1, std::memory_order_relaxed);
+            return GST_PAD_PROBE_DROP;
+        }
+        return GST_PAD_PROBE_OK;
+    }
+
+    static GstPadProbeReturn FrameDecimatorDecodedPadProbeCB(GstPad* pPad, 
+        GstPadProbeInfo* pInfo, gpointer pDecimator)
+    {
+        GstBuffer* pBuffer = GST_PAD_PROBE_INFO_BUFFER(pInfo);
+        if (!pBuffer)
+        {
+            return GST_PAD_PROBE_OK;
+        }
+        return static_cast<FrameDecimator*>(pDecimator)->
+            HandleDecodedBuffer(pBuffer);
+    }
+
+    static GstPadProbeReturn FrameDecimatorEncodedPadProbeCB(GstPad* pPad, 
+        GstPadProbeInfo* pInfo, gpointer pDecimator)
+    {
+        GstBuffer* pBuffer = GST_PAD_PROBE_INFO_BUFFER(pInfo);
+        if (!pBuffer)
+        {
+            return GST_PAD_PROBE_OK;
+        }
+        return static_cast<FrameDecimator*>(pDecimator)->
+            HandleEncodedBuffer(pBuffer);
+    }
+}
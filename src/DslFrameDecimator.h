@@ -0,0 +1,248 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#ifndef _DSL_FRAME_DECIMATOR_H
+#define _DSL_FRAME_DECIMATOR_H
+
+#include "Dsl.h"
+#include "DslApi.h"
+
+namespace DSL
+{
+    #define DSL_FRAME_DECIMATOR_PTR std::shared_ptr<FrameDecimator>
+    #define DSL_FRAME_DECIMATOR_NEW(name) \
+        std::shared_ptr<FrameDecimator>(new FrameDecimator(name))
+
+    /**
+     * @class FrameDecimator
+     * @brief Implements a best-effort frame decimator for a single Video Source.
+     * Decoded buffers are dropped by pad probe to hold a target frame-rate 
+     * based on buffer PTS. Encoded buffers are dropped before decode only in 
+     * whole or trailing parts of a GOP, i.e. from a frame no longer needed up 
+     * to the next key frame, so the decoder never sees a broken reference chain.
+     */
+    class FrameDecimator
+    {
+    public:
+
+        /**
+         * @brief ctor for the FrameDecimator class.
+         * @param[in] name unique name of the Source that owns the decimator.
+         */
+        FrameDecimator(const char* name);
+
+        /**
+         * @brief dtor for the FrameDecimator class.
+         */
+        ~FrameDecimator();
+
+        /**
+         * @brief Gets the current target frame-rate for the FrameDecimator.
+         * @param[out] fpsN current frames per second numerator, 0 = disabled.
+         * @param[out] fpsD current frames per second denominator.
+         */
+        void GetFrameRate(uint* fpsN, uint* fpsD);
+
+        /**
+         * @brief Sets the target frame-rate for the FrameDecimator. Can be
+         * called at any time. The new rate takes effect on the next buffer.
+         * @param[in] fpsN new frames per second numerator, 0 to disable.
+         * @param[in] fpsD new frames per second denominator.
+         * @return true if successfully set, false otherwise.
+         */
+        bool SetFrameRate(uint fpsN, uint fpsD);
+
+        /**
+         * @brief Gets the current frame counters for the FrameDecimator.
+         * @param[out] framesPassed number of decoded frames passed.
+         * @param[out] framesDropped total number of frames dropped.
+         * @param[out] framesDroppedPreDecode number of the dropped frames that 
+         * were dropped before decode.
+         */
+        void GetStats(uint64_t* framesPassed, uint64_t* framesDropped, 
+            uint64_t* framesDroppedPreDecode);
+
+        /**
+         * @brief Clears all frame counters for the FrameDecimator.
+         */
+        void ClearStats();
+
+        /**
+         * @brief Adds a buffer pad probe for the FrameDecimator to a pad.
+         * @param[in] pPad pad to add the probe to. A reference is held until
+         * the probe is removed.
+         * @param[in] encoded true if the pad carries encoded buffers (i.e. the 
+         * decoder's sink pad), false if it carries decoded buffers.
+         * @return true if successfully added, false otherwise.
+         */
+        bool AddPadProbe(GstPad* pPad, bool encoded);
+
+        /**
+         * @brief Removes the pad probes added to pads carrying encoded, or 
+         * decoded, buffers by the FrameDecimator.
+         * @param[in] encoded true to remove the probes added to encoded pads,
+         * false to remove the probes added to decoded pads.
+         */
+        void RemovePadProbes(bool encoded);
+
+        /**
+         * @brief Removes all pad probes added to pads by the FrameDecimator.
+         */
+        void RemoveAllPadProbes();
+
+        /**
+         * @brief Gets the number of pad probes currently added to pads 
+         * carrying encoded, or decoded, buffers by the FrameDecimator.
+         * @param[in] encoded true for encoded pads, false for decoded pads.
+         * @return current number of pad probes.
+         */
+        uint GetNumPadProbes(bool encoded);
+
+        /**
+         * @brief Handles a decoded buffer. Passes the buffer if it's due
+         * according to the target frame-rate, drops it otherwise.
+         * @param[in] pBuffer decoded buffer to handle.
+         * @return GST_PAD_PROBE_OK to pass, GST_PAD_PROBE_DROP to drop.
+         */
+        GstPadProbeReturn HandleDecodedBuffer(GstBuffer* pBuffer);
+
+        /**
+         * @brief Handles an encoded buffer. Drops the buffer only if it and 
+         * all buffers up to the next key frame are no longer needed.
+         * @param[in] pBuffer encoded buffer to handle.
+         * @return GST_PAD_PROBE_OK to pass, GST_PAD_PROBE_DROP to drop.
+         */
+        GstPadProbeReturn HandleEncodedBuffer(GstBuffer* pBuffer);
+
+    private:
+
+        /**
+         * @brief unique name of the Source that owns the decimator.
+         */
+        std::string m_name;
+
+        /**
+         * @brief mutex to protect mutual access to the frame-rate and probes.
+         */
+        DslMutex m_decimatorMutex;
+
+        /**
+         * @brief current target frames per second numerator, 0 = disabled.
+         */
+        uint m_fpsN;
+
+        /**
+         * @brief current target frames per second denominator.
+         */
+        uint m_fpsD;
+
+        /**
+         * @brief time between passed frames in nanoseconds, 0 = disabled.
+         * Read by the streaming threads without locking.
+         */
+        std::atomic<uint64_t> m_interval;
+
+        /**
+         * @brief PTS the next decoded frame is due at, GST_CLOCK_TIME_NONE 
+         * to pass the next frame and restart the schedule.
+         */
+        std::atomic<uint64_t> m_nextPts;
+
+        /**
+         * @brief PTS of the last decoded frame passed.
+         */
+        std::atomic<uint64_t> m_lastPassedPts;
+
+        /**
+         * @brief PTS of the last decoded frame handled - decoded stream only.
+         */
+        GstClockTime m_lastDecodedPts;
+
+        /**
+         * @brief PTS of the last key frame - encoded stream only.
+         */
+        GstClockTime m_keyFramePts;
+
+        /**
+         * @brief duration of the last complete GOP - encoded stream only.
+         */
+        GstClockTime m_gopDuration;
+
+        /**
+         * @brief true if all encoded buffers are to be dropped until the 
+         * next key frame - encoded stream only.
+         */
+        bool m_dropToKeyFrame;
+
+        /**
+         * @brief number of decoded frames passed.
+         */
+        std::atomic<uint64_t> m_framesPassed;
+
+        /**
+         * @brief total number of frames dropped.
+         */
+        std::atomic<uint64_t> m_framesDropped;
+
+        /**
+         * @brief number of frames dropped before decode.
+         */
+        std::atomic<uint64_t> m_framesDroppedPreDecode;
+
+        /**
+         * @brief map of pad probe ids for decoded pads, indexed by the pads 
+         * they're added to.
+         */
+        std::map<GstPad*, gulong> m_decodedPadProbes;
+
+        /**
+         * @brief map of pad probe ids for encoded pads, indexed by the pads 
+         * they're added to. Kept when the decoded stream is unlinked as the 
+         * encoded pads, i.e. the decoder's sink pad, are linked only once.
+         */
+        std::map<GstPad*, gulong> m_encodedPadProbes;
+    };
+
+    /**
+     * @brief Pad probe callback for a FrameDecimator's decoded stream.
+     * @param[in] pPad pad that produced the buffer.
+     * @param[in] pInfo pad probe info with the buffer to handle.
+     * @param[in] pDecimator pointer to the FrameDecimator.
+     * @return GST_PAD_PROBE_OK to pass, GST_PAD_PROBE_DROP to drop.
+     */
+    static GstPadProbeReturn FrameDecimatorDecodedPadProbeCB(GstPad* pPad, 
+        GstPadProbeInfo* pInfo, gpointer pDecimator);
+
+    /**
+     * @brief Pad probe callback for a FrameDecimator's encoded stream.
+     * @param[in] pPad pad that produced the buffer.
+     * @param[in] pInfo pad probe info with the buffer to handle.
+     * @param[in] pDecimator pointer to the FrameDecimator.
+     * @return GST_PAD_PROBE_OK to pass, GST_PAD_PROBE_DROP to drop.
+     */
+    static GstPadProbeReturn FrameDecimatorEncodedPadProbeCB(GstPad* pPad, 
+        GstPadProbeInfo* pInfo, gpointer pDecimator);
+}
+
+#endif // _DSL_FRAME_DECIMATOR_H
@@ -463,7 +463,7 @@ namespace DSL
     {
         // Don't log function entry/exit
         
-        GEOSCoordSequence* geosCoordSequence = GEOSCoordSeq_create(multiLine.num_coordinates+1, 2);
+        GEOSCoordSequence* geosCoordSequence = GEOSCoordSeq_create(multiLine.num_coordinates, 2);
         if (!geosCoordSequence)
         {
             LOG_ERROR("Exception when creating GEOS Coordinate Sequence");
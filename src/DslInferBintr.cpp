@@ -39,6 +39,7 @@ namespace DSL
         , m_inferType(inferType)
         , m_processMode(processMode)
         , m_interval(interval)
+        , m_loadSheddingInterval(0)
         , m_batchSizeSetByClient(false)
         , m_inferConfigFile(inferConfigFile)
         , m_modelEngineFile(modelEngineFile)
@@ -261,7 +262,7 @@ namespace DSL
             return false;
         }
         m_interval = interval;
-        m_pInferEngine->SetAttribute("interval", m_interval);
+        m_pInferEngine->SetAttribute("interval", GetActiveInterval());
         
         return true;
     }
@@ -273,6 +274,31 @@ namespace DSL
         return m_interval;
     }
 
+    uint InferBintr::GetLoadSheddingInterval()
+    {
+        LOG_FUNC();
+        
+        return m_loadSheddingInterval;
+    }
+
+    void InferBintr::SetLoadSheddingInterval(uint interval)
+    {
+        LOG_FUNC();
+        
+        m_loadSheddingInterval = interval;
+        
+        // The interval property is mutable in any state, unlike the 
+        // configured interval which can only be set while unlinked.
+        m_pInferEngine->SetAttribute("interval", GetActiveInterval());
+    }
+
+    uint InferBintr::GetActiveInterval()
+    {
+        LOG_FUNC();
+        
+        return std::max(m_interval, m_loadSheddingInterval);
+    }
+
     int InferBintr::GetUniqueId()
     {
         LOG_FUNC();
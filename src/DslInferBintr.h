@@ -163,6 +163,26 @@ namespace DSL
          */
         uint GetInterval();
 
+        /**
+         * @brief Gets the current load-shedding interval for this InferBintr.
+         * @return the current load-shedding interval, 0 = none.
+         */
+        uint GetLoadSheddingInterval();
+
+        /**
+         * @brief Sets the load-shedding interval for this InferBintr. Unlike
+         * SetInterval, can be called while linked and in any state.
+         * @param[in] interval new load-shedding interval, 0 = none.
+         */
+        void SetLoadSheddingInterval(uint interval);
+
+        /**
+         * @brief Gets the interval currently in use by the infer engine, the 
+         * greater of the configured and load-shedding intervals.
+         * @return the active interval.
+         */
+        uint GetActiveInterval();
+
         /**
          * @brief gets the current unique Id in use by this InferBintr
          * @return the current unique Id
@@ -242,6 +262,12 @@ namespace DSL
          */
         uint m_interval;
 
+        /**
+         * @brief current load-shedding interval set by the Pipeline's
+         * Infer Interval Controller, 0 = none.
+         */
+        uint m_loadSheddingInterval;
+
         /**
          @brief Current process mode in use by the Primary
          */
@@ -0,0 +1,519 @@
+/*
+The MIT License
+
+Copyright (c) 2019-2021, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include "Dsl.h"
+#include "DslServices.h"
+#include "DslInferIntervalController.h"
+#include "DslInferBintr.h"
+
+namespace DSL
+{
+    static int InferIntervalControllerTimeoutHandler(void* user_data);
+
+    InferIntervalController::InferIntervalController(const char* name, 
+        Base* pParent, DSL_QUEUE_SAMPLER_PTR pQueueSampler)
+        : m_name(name)
+        , m_pParent(pParent)
+        , m_pQueueSampler(pQueueSampler)
+        , m_minInterval(DSL_INFER_INTERVAL_DEFAULT_MIN_INTERVAL)
+        , m_maxInterval(DSL_INFER_INTERVAL_DEFAULT_MAX_INTERVAL)
+        , m_lowOccupancy(DSL_INFER_INTERVAL_DEFAULT_LOW_OCCUPANCY)
+        , m_highOccupancy(DSL_INFER_INTERVAL_DEFAULT_HIGH_OCCUPANCY)
+        , m_maxLatency(0)
+        , m_minFps(0)
+        , m_updateInterval(DSL_INFER_INTERVAL_DEFAULT_UPDATE_INTERVAL)
+        , m_stepUpCount(DSL_INFER_INTERVAL_DEFAULT_STEP_UP_COUNT)
+        , m_stepDownCount(DSL_INFER_INTERVAL_DEFAULT_STEP_DOWN_COUNT)
+        , m_isEnabled(false)
+        , m_timerId(0)
+        , m_interval(DSL_INFER_INTERVAL_DEFAULT_MIN_INTERVAL)
+        , m_appliedInterval(0)
+        , m_overloadedCount(0)
+        , m_underloadedCount(0)
+        , m_reportedFps(0)
+        , m_reportedLatency(0)
+        , m_metrics{0}
+    {
+        LOG_FUNC();
+        
+        m_metrics.interval = m_interval;
+    }
+
+    InferIntervalController::~InferIntervalController()
+    {
+        LOG_FUNC();
+
+        if (m_timerId)
+        {
+            g_source_remove(m_timerId);
+        }
+    }
+
+    void InferIntervalController::GetBounds(uint* minInterval, uint* maxInterval)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_controllerMutex);
+
+        *minInterval = m_minInterval;
+        *maxInterval = m_maxInterval;
+    }
+
+    bool InferIntervalController::SetBounds(uint minInterval, uint maxInterval)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_controllerMutex);
+
+        if (minInterval > maxInterval)
+        {
+            LOG_ERROR("Invalid bounds min-interval = " << minInterval 
+                << ", max-interval = " << maxInterval 
+                << " for the Infer Interval Controller of Pipeline '" 
+                << m_name << "'");
+            return false;
+        }
+        m_minInterval = minInterval;
+        m_maxInterval = maxInterval;
+        
+        return true;
+    }
+
+    void InferIntervalController::GetThresholds(uint* lowOccupancy, 
+        uint* highOccupancy, uint* maxLatency, uint* minFps)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_controllerMutex);
+
+        *lowOccupancy = m_lowOccupancy;
+        *highOccupancy = m_highOccupancy;
+        *maxLatency = m_maxLatency;
+        *minFps = m_minFps;
+    }
+
+    bool InferIntervalController::SetThresholds(uint lowOccupancy, 
+        uint highOccupancy, uint maxLatency, uint minFps)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_controllerMutex);
+
+        // the dead-band between the thresholds provides the hysteresis
+        if (lowOccupancy >= highOccupancy or highOccupancy > 100)
+        {
+            LOG_ERROR("Invalid thresholds low-occupancy = " << lowOccupancy 
+                << ", high-occupancy = " << highOccupancy 
+                << " for the Infer Interval Controller of Pipeline '" 
+                << m_name << "'");
+            return false;
+        }
+        m_lowOccupancy = lowOccupancy;
+        m_highOccupancy = highOccupancy;
+        m_maxLatency = maxLatency;
+        m_minFps = minFps;
+        
+        return true;
+    }
+
+    void InferIntervalController::GetHysteresis(uint* updateInterval, 
+        uint* stepUpCount, uint* stepDownCount)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_controllerMutex);
+
+        *updateInterval = m_updateInterval;
+        *stepUpCount = m_stepUpCount;
+        *stepDownCount = m_stepDownCount;
+    }
+
+    bool InferIntervalController::SetHysteresis(uint updateInterval, 
+        uint stepUpCount, uint stepDownCount)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_controllerMutex);
+
+        if (m_isEnabled)
+        {
+            LOG_ERROR("Unable to set hysteresis for the Infer Interval Controller of Pipeline '" 
+                << m_name << "' as it's currently enabled");
+            return false;
+        }
+        if (!updateInterval or !stepUpCount or !stepDownCount)
+        {
+            LOG_ERROR("Invalid hysteresis update-interval = " << updateInterval 
+                << ", step-up-count = " << stepUpCount 
+                << ", step-down-count = " << stepDownCount
+                << " for the Infer Interval Controller of Pipeline '" 
+                << m_name << "'");
+            return false;
+        }
+        m_updateInterval = updateInterval;
+        m_stepUpCount = stepUpCount;
+        m_stepDownCount = stepDownCount;
+        m_overloadedCount = 0;
+        m_underloadedCount = 0;
+        
+        return true;
+    }
+
+    bool InferIntervalController::GetEnabled()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_controllerMutex);
+
+        return m_isEnabled;
+    }
+
+    bool InferIntervalController::SetEnabled(bool enabled)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_controllerMutex);
+
+        if (m_isEnabled == enabled)
+        {
+            LOG_ERROR("Can't set Infer Interval Controller enabled to the same value of " 
+                << enabled << " for Pipeline '" << m_name << "'");
+            return false;
+        }
+        if (enabled)
+        {
+            if (!m_pQueueSampler or !m_pQueueSampler->GetEnabled())
+            {
+                LOG_WARN("The Queue Sampler for Pipeline '" << m_name 
+                    << "' is disabled - the Infer Interval Controller will "
+                    << "use reported frame-rate and latency only");
+            }
+            LOG_INFO("Enabling the Infer Interval Controller for Pipeline '" 
+                << m_name << "' with update interval = " << m_updateInterval << "ms");
+                
+            // remove the timer of a previous failed update, if still running
+            if (m_timerId)
+            {
+                g_source_remove(m_timerId);
+            }
+            m_interval = m_minInterval;
+            m_overloadedCount = 0;
+            m_underloadedCount = 0;
+            ApplyInterval(m_interval);
+            m_appliedInterval = m_interval;
+            
+            m_timerId = g_timeout_add(m_updateInterval, 
+                InferIntervalControllerTimeoutHandler, this);
+        }
+        else
+        {
+            LOG_INFO("Disabling the Infer Interval Controller for Pipeline '" 
+                << m_name << "'");
+            if (m_timerId and !g_source_remove(m_timerId))
+            {
+                LOG_ERROR("Update-timer shutdown failed for the Infer Interval Controller of Pipeline '" 
+                    << m_name << "'");
+                return false;
+            }
+            m_timerId = 0;
+            
+            // restore all InferBintrs to their configured interval
+            m_interval = 0;
+            ApplyInterval(m_interval);
+            m_appliedInterval = m_interval;
+        }
+        m_metrics.interval = m_interval;
+        m_isEnabled = enabled;
+        return true;
+    }
+
+    void InferIntervalController::ReportLoad(double fps, uint latency)
+    {
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_controllerMutex);
+
+        m_reportedFps = fps;
+        m_reportedLatency = latency;
+    }
+
+    uint InferIntervalController::Update(const dsl_infer_load& load)
+    {
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_controllerMutex);
+
+        m_metrics.updates++;
+        m_metrics.last_load = load;
+
+        bool overloaded = (load.occupancy >= m_highOccupancy or load.overruns
+            or (m_maxLatency and load.latency > m_maxLatency)
+            or (m_minFps and load.fps > 0 and load.fps < m_minFps));
+
+        // Latency must drop well below the threshold before recovering,
+        // otherwise the interval oscillates around the threshold.
+        bool underloaded = (!overloaded and load.occupancy <= m_lowOccupancy
+            and (!m_maxLatency or load.latency*100 <= 
+                m_maxLatency*DSL_INFER_INTERVAL_LATENCY_RECOVERY_PERCENT));
+
+        // the bounds may have been updated since the last update
+        uint interval = std::min(std::max(m_interval, m_minInterval), 
+            m_maxInterval);
+
+        if (overloaded)
+        {
+            m_metrics.overloaded_updates++;
+            m_underloadedCount = 0;
+            if (m_overloadedCount < m_stepUpCount)
+            {
+                m_overloadedCount++;
+            }
+            if (m_overloadedCount == m_stepUpCount and interval < m_maxInterval)
+            {
+                // shed load fast - double the inference period (interval+1)
+                interval = std::min(interval*2 + 1, m_maxInterval);
+                m_metrics.step_ups++;
+                m_overloadedCount = 0;
+            }
+        }
+        else if (underloaded)
+        {
+            m_metrics.underloaded_updates++;
+            m_overloadedCount = 0;
+            if (m_underloadedCount < m_stepDownCount)
+            {
+                m_underloadedCount++;
+            }
+            if (m_underloadedCount == m_stepDownCount and interval > m_minInterval)
+            {
+                // recover slowly - one interval step at a time
+                interval--;
+                m_metrics.step_downs++;
+                m_underloadedCount = 0;
+            }
+        }
+        else
+        {
+            // within the dead-band
+            m_overloadedCount = 0;
+            m_underloadedCount = 0;
+        }
+        
+        if (interval != m_interval)
+        {
+            LOG_INFO("Infer Interval Controller for Pipeline '" << m_name 
+                << "' changing interval from " << m_interval << " to " << interval
+                << " with occupancy = " << load.occupancy << "%, overruns = " 
+                << load.overruns << ", fps = " << load.fps << ", latency = " 
+                << load.latency << "ms");
+        }
+        m_interval = interval;
+        m_metrics.interval = interval;
+        
+        return interval;
+    }
+
+    int InferIntervalController::HandleUpdateTimeout()
+    {
+        // Don't log function entry/exit - called on every update
+        try
+        {
+            dsl_infer_load load{0};
+            bool isEnabled(false);
+            uint prevInterval(0);
+            uint updateInterval(0);
+            {
+                LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_controllerMutex);
+                
+                isEnabled = m_isEnabled;
+                load.fps = m_reportedFps;
+                load.latency = m_reportedLatency;
+                prevInterval = m_appliedInterval;
+                updateInterval = m_updateInterval;
+            }
+            if (!isEnabled)
+            {
+                return restoreConfiguredInterval();
+            }
+            if (m_pQueueSampler and m_pQueueSampler->GetEnabled())
+            {
+                uint sampleInterval(0), windowSize(0);
+                m_pQueueSampler->GetSettings(&sampleInterval, &windowSize);
+                
+                // all samples since the last update, plus the last sample 
+                // before it to count the overruns in between.
+                uint count = (updateInterval + sampleInterval - 1)/sampleInterval + 1;
+                m_pQueueSampler->GetPeakLoad(count, &load.occupancy, &load.overruns);
+            }
+            
+            uint currInterval = Update(load);
+            if (currInterval != prevInterval)
+            {
+                // A Services call in progress may be waiting on the main-loop
+                // - the new interval is applied on the next update instead.
+                if (!Services::GetServices()->PipelineInferIntervalApply(
+                    m_pParent, currInterval))
+                {
+                    LOG_DEBUG("Services call in progress - deferring interval "
+                        << "update for Pipeline '" << m_name << "'");
+                    return true;
+                }
+                {
+                    LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_controllerMutex);
+                    m_appliedInterval = currInterval;
+                }
+                NotifyChangeListeners(prevInterval, currInterval);
+            }
+        }
+        catch(...)
+        {
+            LOG_ERROR("Infer Interval Controller for Pipeline '" << m_name 
+                << "' threw an exception on update");
+            {
+                LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_controllerMutex);
+                m_isEnabled = false;
+                m_interval = 0;
+                m_metrics.interval = m_interval;
+            }
+            return restoreConfiguredInterval();
+        }
+        return true;
+    }
+
+    int InferIntervalController::restoreConfiguredInterval()
+    {
+        LOG_FUNC();
+        
+        // The timer keeps running until the restore succeeds.
+        if (!Services::GetServices()->PipelineInferIntervalApply(m_pParent, 0))
+        {
+            return true;
+        }
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_controllerMutex);
+        m_appliedInterval = 0;
+        m_timerId = 0;
+        return false;
+    }
+
+    uint InferIntervalController::GetInterval()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_controllerMutex);
+
+        return m_interval;
+    }
+
+    void InferIntervalController::GetMetrics(dsl_infer_interval_metrics* metrics)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_controllerMutex);
+
+        *metrics = m_metrics;
+    }
+
+    void InferIntervalController::ClearMetrics()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_controllerMutex);
+
+        m_metrics = {0};
+        m_metrics.interval = m_interval;
+    }
+
+    bool InferIntervalController::AddChangeListener(
+        dsl_infer_interval_change_listener_cb listener, void* clientData)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_controllerMutex);
+
+        if (m_changeListeners.find(listener) != m_changeListeners.end())
+        {   
+            LOG_ERROR("Infer interval change listener is not unique");
+            return false;
+        }
+        m_changeListeners[listener] = clientData;
+        
+        return true;
+    }
+
+    bool InferIntervalController::RemoveChangeListener(
+        dsl_infer_interval_change_listener_cb listener)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_controllerMutex);
+
+        if (m_changeListeners.find(listener) == m_changeListeners.end())
+        {   
+            LOG_ERROR("Infer interval change listener was not found");
+            return false;
+        }
+        m_changeListeners.erase(listener);
+        
+        return true;
+    }
+
+    void InferIntervalController::ApplyInterval(uint interval)
+    {
+        ApplyInterval(m_pParent, interval);
+    }
+
+    void InferIntervalController::ApplyInterval(Base* pParent, uint interval)
+    {
+        if (!pParent)
+        {
+            return;
+        }
+        for (auto const& imap: pParent->GetChildren())
+        {
+            DSL_INFER_PTR pInferBintr = 
+                std::dynamic_pointer_cast<InferBintr>(imap.second);
+            if (pInferBintr)
+            {
+                pInferBintr->SetLoadSheddingInterval(interval);
+            }
+            ApplyInterval(imap.second.get(), interval);
+        }
+    }
+
+    void InferIntervalController::NotifyChangeListeners(uint prevInterval, 
+        uint currInterval)
+    {
+        // Copy the listeners and metrics so that the listeners can call 
+        // back into the Controller without deadlock.
+        std::map<dsl_infer_interval_change_listener_cb, void*> listeners;
+        dsl_infer_interval_metrics metrics;
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_controllerMutex);
+            
+            listeners = m_changeListeners;
+            metrics = m_metrics;
+        }
+        for (auto const& imap: listeners)
+        {
+            try
+            {
+                imap.first(prevInterval, currInterval, &metrics, imap.second);
+            }
+            catch(...)
+            {
+                LOG_ERROR("Infer Interval Controller for Pipeline '" << m_name 
+                    << "' threw an exception calling client listener");
+            }
+        }
+    }
+
+    static int InferIntervalControllerTimeoutHandler(void* user_data)
+    {
+        return static_cast<InferIntervalController*>(user_data)->
+            HandleUpdateTimeout();
+    }
+}
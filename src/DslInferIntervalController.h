@@ -0,0 +1,345 @@
+/*
+The MIT License
+
+Copyright (c) 2019-2021, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#ifndef _DSL_INFER_INTERVAL_CONTROLLER_H
+#define _DSL_INFER_INTERVAL_CONTROLLER_H
+
+#include "Dsl.h"
+#include "DslApi.h"
+#include "DslBase.h"
+#include "DslQueueSampler.h"
+
+namespace DSL
+{
+    #define DSL_INFER_INTERVAL_CONTROLLER_PTR std::shared_ptr<InferIntervalController>
+    #define DSL_INFER_INTERVAL_CONTROLLER_NEW(name, pParent, pQueueSampler) \
+        std::shared_ptr<InferIntervalController>(new InferIntervalController( \
+            name, pParent, pQueueSampler))
+
+    /**
+     * @class InferIntervalController
+     * @brief Implements a load-shedding controller that adjusts the interval
+     * of all Primary and Secondary InferBintrs in a Pipeline based on queue
+     * occupancy, queue overruns, and client reported frame-rate and latency.
+     */
+    class InferIntervalController
+    {
+    public:
+
+        /**
+         * @brief ctor for the InferIntervalController class.
+         * @param[in] name unique name of the Pipeline that owns the Controller.
+         * @param[in] pParent the parent object whose InferBintrs will be 
+         * controlled, NULL for none.
+         * @param[in] pQueueSampler the parent's Queue Sampler to provide 
+         * queue occupancy, NULL for none.
+         */
+        InferIntervalController(const char* name, Base* pParent, 
+            DSL_QUEUE_SAMPLER_PTR pQueueSampler);
+
+        /**
+         * @brief dtor for the InferIntervalController class.
+         */
+        ~InferIntervalController();
+
+        /**
+         * @brief Gets the current load-shedding interval bounds.
+         * @param[out] minInterval minimum load-shedding interval.
+         * @param[out] maxInterval maximum load-shedding interval.
+         */
+        void GetBounds(uint* minInterval, uint* maxInterval);
+
+        /**
+         * @brief Sets the load-shedding interval bounds. The current 
+         * interval is clamped to the new bounds on next update.
+         * @param[in] minInterval minimum load-shedding interval.
+         * @param[in] maxInterval maximum load-shedding interval.
+         * @return true if successfully set, false otherwise.
+         */
+        bool SetBounds(uint minInterval, uint maxInterval);
+
+        /**
+         * @brief Gets the current load thresholds.
+         * @param[out] lowOccupancy underloaded occupancy threshold in percent.
+         * @param[out] highOccupancy overloaded occupancy threshold in percent.
+         * @param[out] maxLatency latency threshold in ms, 0 = disabled.
+         * @param[out] minFps frame-rate threshold, 0 = disabled.
+         */
+        void GetThresholds(uint* lowOccupancy, uint* highOccupancy, 
+            uint* maxLatency, uint* minFps);
+
+        /**
+         * @brief Sets the load thresholds.
+         * @param[in] lowOccupancy underloaded occupancy threshold in percent.
+         * @param[in] highOccupancy overloaded occupancy threshold in percent.
+         * @param[in] maxLatency latency threshold in ms, 0 = disabled.
+         * @param[in] minFps frame-rate threshold, 0 = disabled.
+         * @return true if successfully set, false otherwise.
+         */
+        bool SetThresholds(uint lowOccupancy, uint highOccupancy, 
+            uint maxLatency, uint minFps);
+
+        /**
+         * @brief Gets the current update and hysteresis settings.
+         * @param[out] updateInterval update interval in milliseconds.
+         * @param[out] stepUpCount consecutive overloaded updates to step up.
+         * @param[out] stepDownCount consecutive underloaded updates to step down.
+         */
+        void GetHysteresis(uint* updateInterval, uint* stepUpCount, 
+            uint* stepDownCount);
+
+        /**
+         * @brief Sets the update and hysteresis settings. Can only be called
+         * while the Controller is disabled.
+         * @param[in] updateInterval update interval in milliseconds.
+         * @param[in] stepUpCount consecutive overloaded updates to step up.
+         * @param[in] stepDownCount consecutive underloaded updates to step down.
+         * @return true if successfully set, false otherwise.
+         */
+        bool SetHysteresis(uint updateInterval, uint stepUpCount, 
+            uint stepDownCount);
+
+        /**
+         * @brief Gets the current enabled setting for the Controller.
+         * @return true if enabled, false otherwise.
+         */
+        bool GetEnabled();
+
+        /**
+         * @brief Sets the enabled setting for the Controller, starting or 
+         * stopping the update timer. Disabling the Controller restores all 
+         * InferBintrs to their configured interval.
+         * @param[in] enabled set to true to enable, false to disable.
+         * @return true if successfully set, false otherwise.
+         */
+        bool SetEnabled(bool enabled);
+
+        /**
+         * @brief Reports the current frame-rate and latency to the Controller.
+         * @param[in] fps current frame-rate, 0 = not available.
+         * @param[in] latency current end-to-end latency in ms, 0 = not available.
+         */
+        void ReportLoad(double fps, uint latency);
+
+        /**
+         * @brief Evaluates a single load sample and updates the current 
+         * interval. Independent of the Pipeline so that the control logic
+         * can be driven by simulated load.
+         * @param[in] load the Pipeline load to evaluate.
+         * @return the new load-shedding interval.
+         */
+        uint Update(const dsl_infer_load& load);
+
+        /**
+         * @brief Handles the update timer timeout - collects the current 
+         * Pipeline load, updates the interval, and applies any change.
+         * @return true to continue the timer, false to stop.
+         */
+        int HandleUpdateTimeout();
+
+        /**
+         * @brief Gets the current load-shedding interval.
+         * @return current load-shedding interval.
+         */
+        uint GetInterval();
+
+        /**
+         * @brief Gets the current decision metrics.
+         * @param[out] metrics structure to fill in.
+         */
+        void GetMetrics(dsl_infer_interval_metrics* metrics);
+
+        /**
+         * @brief Clears the current decision metrics.
+         */
+        void ClearMetrics();
+
+        /**
+         * @brief Adds a client listener to be notified on interval change.
+         * @param[in] listener client callback function to add.
+         * @param[in] clientData opaque pointer to client data.
+         * @return true if successfully added, false otherwise.
+         */
+        bool AddChangeListener(dsl_infer_interval_change_listener_cb listener, 
+            void* clientData);
+
+        /**
+         * @brief Removes a client listener previously added.
+         * @param[in] listener client callback function to remove.
+         * @return true if successfully removed, false otherwise.
+         */
+        bool RemoveChangeListener(dsl_infer_interval_change_listener_cb listener);
+
+        /**
+         * @brief Recursively applies a load-shedding interval to all 
+         * InferBintrs owned by a parent object. The caller must hold
+         * the Services lock.
+         * @param[in] pParent parent object to search.
+         * @param[in] interval the interval to apply.
+         */
+        static void ApplyInterval(Base* pParent, uint interval);
+
+    private:
+
+        /**
+         * @brief Applies a load-shedding interval to all InferBintrs owned 
+         * by the parent object. The caller must hold the Services lock.
+         * @param[in] interval the interval to apply.
+         */
+        void ApplyInterval(uint interval);
+
+        /**
+         * @brief Restores all InferBintrs owned by the parent object to their 
+         * configured interval after a failed update, from the main-loop.
+         * @return false once restored, true if the Services lock is busy
+         * and the restore must be retried on the next update.
+         */
+        int restoreConfiguredInterval();
+
+        /**
+         * @brief Calls all client listeners with an interval change.
+         * @param[in] prevInterval the previous load-shedding interval.
+         * @param[in] currInterval the new load-shedding interval.
+         */
+        void NotifyChangeListeners(uint prevInterval, uint currInterval);
+
+        /**
+         * @brief unique name of the Pipeline that owns the Controller.
+         */
+        std::string m_name;
+
+        /**
+         * @brief parent object whose InferBintrs are controlled.
+         */
+        Base* m_pParent;
+
+        /**
+         * @brief Queue Sampler providing the queue occupancy.
+         */
+        DSL_QUEUE_SAMPLER_PTR m_pQueueSampler;
+
+        /**
+         * @brief mutex to protect mutual access to the Controller's state.
+         */
+        DslMutex m_controllerMutex;
+
+        /**
+         * @brief minimum load-shedding interval.
+         */
+        uint m_minInterval;
+
+        /**
+         * @brief maximum load-shedding interval.
+         */
+        uint m_maxInterval;
+
+        /**
+         * @brief underloaded occupancy threshold in percent.
+         */
+        uint m_lowOccupancy;
+
+        /**
+         * @brief overloaded occupancy threshold in percent.
+         */
+        uint m_highOccupancy;
+
+        /**
+         * @brief overloaded latency threshold in ms, 0 = disabled.
+         */
+        uint m_maxLatency;
+
+        /**
+         * @brief overloaded frame-rate threshold, 0 = disabled.
+         */
+        uint m_minFps;
+
+        /**
+         * @brief update interval in milliseconds.
+         */
+        uint m_updateInterval;
+
+        /**
+         * @brief consecutive overloaded updates required to step up.
+         */
+        uint m_stepUpCount;
+
+        /**
+         * @brief consecutive underloaded updates required to step down.
+         */
+        uint m_stepDownCount;
+
+        /**
+         * @brief true if the Controller is enabled, false otherwise.
+         */
+        bool m_isEnabled;
+
+        /**
+         * @brief gnome timer id for the update timer.
+         */
+        uint m_timerId;
+
+        /**
+         * @brief current load-shedding interval.
+         */
+        uint m_interval;
+        
+        /**
+         * @brief load-shedding interval last applied to the InferBintrs. 
+         * Differs from m_interval while the Services lock is busy.
+         */
+        uint m_appliedInterval;
+
+        /**
+         * @brief current number of consecutive overloaded updates.
+         */
+        uint m_overloadedCount;
+
+        /**
+         * @brief current number of consecutive underloaded updates.
+         */
+        uint m_underloadedCount;
+
+        /**
+         * @brief most recently reported frame-rate, 0 = not reported.
+         */
+        double m_reportedFps;
+
+        /**
+         * @brief most recently reported latency in ms, 0 = not reported.
+         */
+        uint m_reportedLatency;
+
+        /**
+         * @brief current decision metrics.
+         */
+        dsl_infer_interval_metrics m_metrics;
+
+        /**
+         * @brief map of all client listeners to notify on interval change.
+         */
+        std::map<dsl_infer_interval_change_listener_cb, void*> m_changeListeners;
+    };
+}
+
+#endif // _DSL_INFER_INTERVAL_CONTROLLER_H
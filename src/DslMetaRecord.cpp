@@ -0,0 +1,367 @@
+/*
+The MIT License
+
+Copyright (c) 2019-2021, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include <sys/mman.h>
+#include <fcntl.h>
+#include <unistd.h>
+
+#include "Dsl.h"
+#include "DslMetaRecord.h"
+
+namespace DSL
+{
+    /**
+     * @brief Appends a fixed size record to a serialization buffer.
+     * @param[in,out] buffer buffer to append to.
+     * @param[in] pRecord pointer to the record to append.
+     * @param[in] size size of the record in bytes.
+     * @return offset of the record in the buffer.
+     */
+    static size_t append_record(std::vector<char>& buffer, 
+        const void* pRecord, size_t size)
+    {
+        size_t offset = buffer.size();
+        buffer.resize(offset + size);
+        memcpy(&buffer[offset], pRecord, size);
+        return offset;
+    }
+    
+    MetaRecordWriter::MetaRecordWriter(const char* filePath)
+        : m_filePath(filePath)
+        , m_nextOffset(sizeof(MetaRecordFileHeader))
+        , m_maxBatchSize(0)
+    {
+        LOG_FUNC();
+        
+        m_ostream.open(m_filePath, std::ofstream::out | 
+            std::ofstream::binary | std::ofstream::trunc);
+        if (!m_ostream.is_open())
+        {
+            LOG_ERROR("Failed to open Metadata Record file '" 
+                << m_filePath << "' for writing");
+            throw std::exception();
+        }
+        
+        // Write the initial header, rewritten with final values on Close.
+        // A header with an index offset of 0 identifies an unclosed file.
+        MetaRecordFileHeader header = {{0}};
+        memcpy(header.magic, DSL_META_RECORD_MAGIC, sizeof(header.magic));
+        header.version = DSL_META_RECORD_VERSION;
+        
+        m_ostream.write((const char*)&header, sizeof(header));
+    }
+    
+    MetaRecordWriter::~MetaRecordWriter()
+    {
+        LOG_FUNC();
+        
+        if (m_ostream.is_open())
+        {
+            Close();
+        }
+    }
+
+    bool MetaRecordWriter::Write(NvDsBatchMeta* pBatchMeta)
+    {
+        // Don't log function entry/exit - called for every batch
+        
+        if (!m_ostream.is_open())
+        {
+            LOG_ERROR("Metadata Record file '" << m_filePath << "' is not open");
+            return false;
+        }
+        
+        // Serialize the complete batch record before a single write
+        m_recordBuffer.clear();
+        
+        MetaRecordBatch batch = {0};
+        append_record(m_recordBuffer, &batch, sizeof(batch));
+        
+        for (NvDsMetaList* pFrameMetaList = pBatchMeta->frame_meta_list; 
+            pFrameMetaList; pFrameMetaList = pFrameMetaList->next)
+        {
+            NvDsFrameMeta* pFrameMeta = (NvDsFrameMeta*) (pFrameMetaList->data);
+            if (pFrameMeta == NULL)
+            {
+                continue;
+            }
+            MetaRecordFrame frame = {0};
+            frame.sourceId = pFrameMeta->source_id;
+            frame.batchId = pFrameMeta->batch_id;
+            frame.frameNum = pFrameMeta->frame_num;
+            frame.ntpTimestamp = pFrameMeta->ntp_timestamp;
+            frame.sourceFrameWidth = pFrameMeta->source_frame_width;
+            frame.sourceFrameHeight = pFrameMeta->source_frame_height;
+            frame.flags = (pFrameMeta->bInferDone) 
+                ? DSL_META_RECORD_FRAME_INFER_DONE : 0;
+            
+            size_t frameOffset = append_record(m_recordBuffer, 
+                &frame, sizeof(frame));
+            
+            for (NvDsMetaList* pObjectMetaList = pFrameMeta->obj_meta_list; 
+                pObjectMetaList; pObjectMetaList = pObjectMetaList->next)
+            {
+                NvDsObjectMeta* pObjectMeta = 
+                    (NvDsObjectMeta*) (pObjectMetaList->data);
+                if (pObjectMeta == NULL)
+                {
+                    continue;
+                }
+                MetaRecordObject object;
+                object.objectId = pObjectMeta->object_id;
+                object.classId = pObjectMeta->class_id;
+                object.inferId = pObjectMeta->unique_component_id;
+                object.confidence = pObjectMeta->confidence;
+                object.trackerConfidence = pObjectMeta->tracker_confidence;
+                object.left = pObjectMeta->rect_params.left;
+                object.top = pObjectMeta->rect_params.top;
+                object.width = pObjectMeta->rect_params.width;
+                object.height = pObjectMeta->rect_params.height;
+                
+                append_record(m_recordBuffer, &object, sizeof(object));
+                frame.objectCount++;
+            }
+            // Update the frame record with its final object count
+            memcpy(&m_recordBuffer[frameOffset], &frame, sizeof(frame));
+            
+            batch.frameCount++;
+            batch.objectCount += frame.objectCount;
+        }
+        memcpy(&m_recordBuffer[0], &batch, sizeof(batch));
+        
+        m_ostream.write(&m_recordBuffer[0], m_recordBuffer.size());
+        if (!m_ostream)
+        {
+            LOG_ERROR("Failed to write batch record to Metadata Record file '" 
+                << m_filePath << "'");
+            return false;
+        }
+        m_batchOffsets.push_back(m_nextOffset);
+        m_nextOffset += m_recordBuffer.size();
+        m_maxBatchSize = std::max(m_maxBatchSize, batch.frameCount);
+        
+        return true;
+    }
+    
+    bool MetaRecordWriter::Close()
+    {
+        LOG_FUNC();
+        
+        if (!m_ostream.is_open())
+        {
+            LOG_ERROR("Metadata Record file '" << m_filePath << "' is not open");
+            return false;
+        }
+        
+        // Append the batch index, then rewrite the header with the final values
+        if (m_batchOffsets.size())
+        {
+            m_ostream.write((const char*)&m_batchOffsets[0], 
+                m_batchOffsets.size()*sizeof(uint64_t));
+        }
+        MetaRecordFileHeader header = {{0}};
+        memcpy(header.magic, DSL_META_RECORD_MAGIC, sizeof(header.magic));
+        header.version = DSL_META_RECORD_VERSION;
+        header.maxBatchSize = m_maxBatchSize;
+        header.batchCount = m_batchOffsets.size();
+        header.indexOffset = m_nextOffset;
+        
+        m_ostream.seekp(0);
+        m_ostream.write((const char*)&header, sizeof(header));
+        
+        bool result(m_ostream.good());
+        m_ostream.close();
+        
+        if (!result)
+        {
+            LOG_ERROR("Failed to write batch index to Metadata Record file '" 
+                << m_filePath << "'");
+            return false;
+        }
+        LOG_INFO("Metadata Record file '" << m_filePath << "' closed with " 
+            << header.batchCount << " batch records");
+        
+        return true;
+    }
+    
+    //--------------------------------------------------------------------------------
+
+    MetaRecordReader::MetaRecordReader(const char* filePath)
+        : m_fd(-1)
+        , m_pMap(NULL)
+        , m_mapSize(0)
+        , m_batchCount(0)
+        , m_maxBatchSize(0)
+        , m_pIndex(NULL)
+    {
+        LOG_FUNC();
+        
+        m_fd = open(filePath, O_RDONLY);
+        if (m_fd < 0)
+        {
+            LOG_ERROR("Failed to open Metadata Record file '" << filePath << "'");
+            throw std::exception();
+        }
+        struct stat fileStat;
+        if (fstat(m_fd, &fileStat) or 
+            fileStat.st_size < (off_t)sizeof(MetaRecordFileHeader))
+        {
+            LOG_ERROR("Invalid Metadata Record file '" << filePath << "'");
+            close(m_fd);
+            throw std::exception();
+        }
+        m_mapSize = fileStat.st_size;
+        
+        void* pMap = mmap(NULL, m_mapSize, PROT_READ, MAP_PRIVATE, m_fd, 0);
+        if (pMap == MAP_FAILED)
+        {
+            LOG_ERROR("Failed to map Metadata Record file '" << filePath << "'");
+            close(m_fd);
+            throw std::exception();
+        }
+        m_pMap = (const uint8_t*)pMap;
+        
+        // Records are read in order when replayed
+        madvise(pMap, m_mapSize, MADV_SEQUENTIAL);
+        
+        const MetaRecordFileHeader* pHeader = (const MetaRecordFileHeader*)m_pMap;
+        
+        if (strncmp(pHeader->magic, DSL_META_RECORD_MAGIC, sizeof(pHeader->magic)) or
+            pHeader->version != DSL_META_RECORD_VERSION)
+        {
+            LOG_ERROR("Metadata Record file '" << filePath 
+                << "' has an invalid header or unsupported version");
+            munmap(pMap, m_mapSize);
+            close(m_fd);
+            throw std::exception();
+        }
+        
+        // If the file was closed by the writer, use the index in the file.
+        if (pHeader->indexOffset and 
+            !(pHeader->indexOffset % sizeof(uint64_t)) and
+            pHeader->indexOffset <= m_mapSize and
+            pHeader->batchCount <= 
+                (m_mapSize - pHeader->indexOffset) / sizeof(uint64_t))
+        {
+            m_batchCount = pHeader->batchCount;
+            m_maxBatchSize = pHeader->maxBatchSize;
+            m_pIndex = (const uint64_t*)(m_pMap + pHeader->indexOffset);
+        }
+        // Otherwise, the file was not closed; index the complete batch records.
+        else
+        {
+            LOG_WARN("Metadata Record file '" << filePath 
+                << "' was not closed, scanning for batch records");
+            ScanBatchIndex();
+        }
+        LOG_INFO("Metadata Record file '" << filePath << "' opened with " 
+            << m_batchCount << " batch records");
+    }
+    
+    MetaRecordReader::~MetaRecordReader()
+    {
+        LOG_FUNC();
+        
+        munmap((void*)m_pMap, m_mapSize);
+        close(m_fd);
+    }
+    
+    const MetaRecordBatch* MetaRecordReader::GetBatch(uint64_t index)
+    {
+        // Don't log function entry/exit - called for every batch
+        
+        if (index >= m_batchCount)
+        {
+            return NULL;
+        }
+        uint64_t offset = m_pIndex[index];
+        if ((offset % sizeof(uint64_t)) or !ValidateBatch(offset))
+        {
+            LOG_ERROR("Invalid batch record at index " << index);
+            return NULL;
+        }
+        return (const MetaRecordBatch*)(m_pMap + offset);
+    }
+    
+    uint64_t MetaRecordReader::ValidateBatch(uint64_t offset)
+    {
+        if (offset < sizeof(MetaRecordFileHeader) or offset > m_mapSize or
+            sizeof(MetaRecordBatch) > m_mapSize - offset)
+        {
+            return 0;
+        }
+        const MetaRecordBatch* pBatch = (const MetaRecordBatch*)(m_pMap + offset);
+        
+        uint64_t position = offset + sizeof(MetaRecordBatch);
+        uint64_t objectCount(0);
+        
+        for (uint i = 0; i < pBatch->frameCount; i++)
+        {
+            if (sizeof(MetaRecordFrame) > m_mapSize - position)
+            {
+                return 0;
+            }
+            const MetaRecordFrame* pFrame = 
+                (const MetaRecordFrame*)(m_pMap + position);
+            position += sizeof(MetaRecordFrame);
+            
+            if (pFrame->objectCount > 
+                (m_mapSize - position) / sizeof(MetaRecordObject))
+            {
+                return 0;
+            }
+            position += pFrame->objectCount * sizeof(MetaRecordObject);
+            objectCount += pFrame->objectCount;
+        }
+        if (objectCount != pBatch->objectCount)
+        {
+            return 0;
+        }
+        return position - offset;
+    }
+    
+    void MetaRecordReader::ScanBatchIndex()
+    {
+        LOG_FUNC();
+        
+        uint64_t offset = sizeof(MetaRecordFileHeader);
+        
+        // Stop at the first incomplete record, i.e. at the end of the
+        // last batch record to be fully written before the file was closed.
+        while (offset < m_mapSize)
+        {
+            uint64_t size = ValidateBatch(offset);
+            if (!size)
+            {
+                break;
+            }
+            m_scannedIndex.push_back(offset);
+            m_maxBatchSize = std::max(m_maxBatchSize, 
+                ((const MetaRecordBatch*)(m_pMap + offset))->frameCount);
+            offset += size;
+        }
+        m_batchCount = m_scannedIndex.size();
+        m_pIndex = m_scannedIndex.data();
+    }
+}
@@ -0,0 +1,373 @@
+/*
+The MIT License
+
+Copyright (c) 2019-2021, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#ifndef _DSL_META_RECORD_H
+#define _DSL_META_RECORD_H
+
+#include "Dsl.h"
+#include "DslApi.h"
+
+namespace DSL
+{
+    #define DSL_META_RECORD_WRITER_PTR std::shared_ptr<MetaRecordWriter>
+    #define DSL_META_RECORD_WRITER_NEW(filePath) \
+        std::shared_ptr<MetaRecordWriter>(new MetaRecordWriter(filePath))
+
+    #define DSL_META_RECORD_READER_PTR std::shared_ptr<MetaRecordReader>
+    #define DSL_META_RECORD_READER_NEW(filePath) \
+        std::shared_ptr<MetaRecordReader>(new MetaRecordReader(filePath))
+
+    /**
+     * @brief magic string identifying a Metadata Record file.
+     */
+    #define DSL_META_RECORD_MAGIC                   "DSLMETA"
+
+    /**
+     * @brief current version of the Metadata Record file format.
+     */
+    #define DSL_META_RECORD_VERSION                 1
+
+    /**
+     * @brief frame record flag set if bInferDone was set for the frame.
+     */
+    #define DSL_META_RECORD_FRAME_INFER_DONE        0x00000001
+
+    /**
+     * @struct MetaRecordFileHeader
+     * @brief header written at the start of every Metadata Record file.
+     * The header is rewritten with the final counts and index offset when
+     * the file is closed. A file with an index offset of 0 was not closed 
+     * and is indexed by a sequential scan when opened for reading.
+     */
+    struct MetaRecordFileHeader
+    {
+        /**
+         * @brief null terminated DSL_META_RECORD_MAGIC string.
+         */
+        char magic[8];
+
+        /**
+         * @brief file format version, DSL_META_RECORD_VERSION.
+         */
+        uint32_t version;
+
+        /**
+         * @brief maximum number of frames in any one batch.
+         */
+        uint32_t maxBatchSize;
+
+        /**
+         * @brief total number of batch records in the file.
+         */
+        uint64_t batchCount;
+
+        /**
+         * @brief file offset of the batch index, an array of batchCount
+         * uint64_t file offsets, one for each batch record.
+         */
+        uint64_t indexOffset;
+    };
+
+    /**
+     * @struct MetaRecordBatch
+     * @brief batch record header, followed by frameCount frame records.
+     */
+    struct MetaRecordBatch
+    {
+        /**
+         * @brief number of frame records in the batch.
+         */
+        uint32_t frameCount;
+
+        /**
+         * @brief total number of object records over all frames in the batch.
+         */
+        uint32_t objectCount;
+    };
+
+    /**
+     * @struct MetaRecordFrame
+     * @brief frame record, followed by objectCount object records.
+     */
+    struct MetaRecordFrame
+    {
+        /**
+         * @brief source_id of the frame.
+         */
+        uint32_t sourceId;
+
+        /**
+         * @brief batch_id of the frame.
+         */
+        uint32_t batchId;
+
+        /**
+         * @brief frame_num of the frame.
+         */
+        int64_t frameNum;
+
+        /**
+         * @brief ntp_timestamp of the frame.
+         */
+        uint64_t ntpTimestamp;
+
+        /**
+         * @brief source_frame_width of the frame.
+         */
+        uint32_t sourceFrameWidth;
+
+        /**
+         * @brief source_frame_height of the frame.
+         */
+        uint32_t sourceFrameHeight;
+
+        /**
+         * @brief number of object records that follow the frame record.
+         */
+        uint32_t objectCount;
+
+        /**
+         * @brief frame flags, DSL_META_RECORD_FRAME_INFER_DONE if set.
+         */
+        uint32_t flags;
+    };
+
+    /**
+     * @struct MetaRecordObject
+     * @brief object record.
+     */
+    struct MetaRecordObject
+    {
+        /**
+         * @brief object_id (tracking id) of the object.
+         */
+        uint64_t objectId;
+
+        /**
+         * @brief class_id of the object.
+         */
+        int32_t classId;
+
+        /**
+         * @brief unique_component_id of the inference component.
+         */
+        int32_t inferId;
+
+        /**
+         * @brief inference confidence of the object.
+         */
+        float confidence;
+
+        /**
+         * @brief tracker confidence of the object.
+         */
+        float trackerConfidence;
+
+        /**
+         * @brief rect_params (bbox) of the object.
+         */
+        float left;
+        float top;
+        float width;
+        float height;
+    };
+
+    /**
+     * @class MetaRecordWriter
+     * @brief Implements a writer of batched frame and object metadata to a 
+     * compact, indexed binary Metadata Record file.
+     */
+    class MetaRecordWriter
+    {
+    public:
+
+        /**
+         * @brief ctor for the MetaRecordWriter class.
+         * @param[in] filePath absolute or relative path to the file to create.
+         * Any existing file will be overwritten. 
+         */
+        MetaRecordWriter(const char* filePath);
+
+        /**
+         * @brief dtor for the MetaRecordWriter class. Closes the file if open.
+         */
+        ~MetaRecordWriter();
+
+        /**
+         * @brief Gets the path of the file being written.
+         * @return file path as provided on construction.
+         */
+        const char* GetFilePath(){return m_filePath.c_str();};
+
+        /**
+         * @brief Writes the frame and object metadata of a batch as a single 
+         * batch record.
+         * @param[in] pBatchMeta batch metadata to write.
+         * @return true if the record was written successfully, false otherwise.
+         */
+        bool Write(NvDsBatchMeta* pBatchMeta);
+
+        /**
+         * @brief Writes the batch index and final header and closes the file.
+         * @return true if the file was closed successfully, false otherwise.
+         */
+        bool Close();
+
+        /**
+         * @brief Gets the number of batch records written.
+         * @return number of batch records.
+         */
+        uint64_t GetBatchCount(){return m_batchOffsets.size();};
+
+    private:
+
+        /**
+         * @brief path of the file being written.
+         */
+        std::string m_filePath;
+
+        /**
+         * @brief output stream for the file being written.
+         */
+        std::ofstream m_ostream;
+
+        /**
+         * @brief reusable buffer used to serialize each batch record
+         * for a single write to the output stream.
+         */
+        std::vector<char> m_recordBuffer;
+
+        /**
+         * @brief file offsets of each batch record, written as the 
+         * batch index on Close.
+         */
+        std::vector<uint64_t> m_batchOffsets;
+
+        /**
+         * @brief file offset of the next batch record.
+         */
+        uint64_t m_nextOffset;
+
+        /**
+         * @brief maximum number of frames in any one batch written.
+         */
+        uint32_t m_maxBatchSize;
+    };
+
+    /**
+     * @class MetaRecordReader
+     * @brief Implements a read-only, memory-mapped reader of a Metadata 
+     * Record file created by a MetaRecordWriter.
+     */
+    class MetaRecordReader
+    {
+    public:
+
+        /**
+         * @brief ctor for the MetaRecordReader class. Throws on failure
+         * to open, map, or validate the file.
+         * @param[in] filePath absolute or relative path to the file to read.
+         */
+        MetaRecordReader(const char* filePath);
+
+        /**
+         * @brief dtor for the MetaRecordReader class. Unmaps the file.
+         */
+        ~MetaRecordReader();
+
+        /**
+         * @brief Gets the number of batch records in the file.
+         * @return number of batch records.
+         */
+        uint64_t GetBatchCount(){return m_batchCount;};
+
+        /**
+         * @brief Gets the maximum number of frames in any one batch.
+         * @return maximum batch size.
+         */
+        uint32_t GetMaxBatchSize(){return m_maxBatchSize;};
+
+        /**
+         * @brief Gets a batch record by index. The frame records follow the 
+         * batch record in memory, each followed by its object records.
+         * @param[in] index index of the batch record, 0..GetBatchCount()-1.
+         * @return pointer into the mapped file, NULL if index is out of range.
+         */
+        const MetaRecordBatch* GetBatch(uint64_t index);
+
+    private:
+
+        /**
+         * @brief Validates a batch record and all of its frame records.
+         * @param[in] offset file offset of the batch record.
+         * @return size of the batch record in bytes, 0 if invalid.
+         */
+        uint64_t ValidateBatch(uint64_t offset);
+
+        /**
+         * @brief Builds the batch index by sequentially scanning the file.
+         * Used for files that were not closed by the writer.
+         */
+        void ScanBatchIndex();
+
+        /**
+         * @brief file descriptor of the open file.
+         */
+        int m_fd;
+
+        /**
+         * @brief start of the memory-mapped file.
+         */
+        const uint8_t* m_pMap;
+
+        /**
+         * @brief size of the memory-mapped file in bytes.
+         */
+        uint64_t m_mapSize;
+
+        /**
+         * @brief number of batch records in the file.
+         */
+        uint64_t m_batchCount;
+
+        /**
+         * @brief maximum number of frames in any one batch.
+         */
+        uint32_t m_maxBatchSize;
+
+        /**
+         * @brief pointer to the batch index, either into the mapped file
+         * or to m_scannedIndex for files that were not closed.
+         */
+        const uint64_t* m_pIndex;
+
+        /**
+         * @brief batch index built by a sequential scan of the file.
+         */
+        std::vector<uint64_t> m_scannedIndex;
+    };
+
+}
+
+#endif // _DSL_META_RECORD_H
@@ -0,0 +1,219 @@
+/*
+The MIT License
+
+Copyright (c) 2019-2021, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <sys/syscall.h>
+#include <linux/futex.h>
+#include <climits>
+#include <cerrno>
+#include <fcntl.h>
+#include <unistd.h>
+
+#include "Dsl.h"
+#include "DslMetaShm.h"
+
+namespace DSL
+{
+    /**
+     * @brief slot size alignment, one cache line, so that slots written by
+     * the publisher never share a cache line with slots read by a reader.
+     */
+    #define DSL_META_SHM_SLOT_ALIGNMENT             64
+
+    MetaShmWriter::MetaShmWriter(const char* shmName, 
+        uint slotCount, uint maxObjects)
+        : m_shmName(shmName)
+        , m_shmSize(0)
+        , m_pHeader(NULL)
+        , m_pSlots(NULL)
+        , m_slotCount(slotCount)
+        , m_slotSize(0)
+        , m_maxObjects(maxObjects)
+        , m_sequence(0)
+    {
+        LOG_FUNC();
+        
+        if (!m_slotCount or !m_maxObjects)
+        {
+            LOG_ERROR("Invalid slot count = " << m_slotCount 
+                << " or max objects = " << m_maxObjects 
+                << " for shared-memory segment '" << m_shmName << "'");
+            throw std::exception();
+        }
+        if (m_shmName.empty() or m_shmName[0] != '/')
+        {
+            m_shmName.insert(0, "/");
+        }
+        m_slotSize = sizeof(dsl_meta_shm_frame) + 
+            m_maxObjects*sizeof(dsl_meta_shm_object);
+        m_slotSize = (m_slotSize + DSL_META_SHM_SLOT_ALIGNMENT - 1) & 
+            ~(DSL_META_SHM_SLOT_ALIGNMENT - 1);
+        m_shmSize = sizeof(dsl_meta_shm_header) + 
+            (size_t)m_slotCount*m_slotSize;
+        
+        // Replace any stale segment left behind by a previous process.
+        shm_unlink(m_shmName.c_str());
+        
+        int fd = shm_open(m_shmName.c_str(), O_CREAT | O_EXCL | O_RDWR, 0666);
+        if (fd < 0)
+        {
+            LOG_ERROR("Failed to create shared-memory segment '" 
+                << m_shmName << "' errno = " << errno);
+            throw std::exception();
+        }
+        if (ftruncate(fd, m_shmSize) < 0)
+        {
+            LOG_ERROR("Failed to size shared-memory segment '" 
+                << m_shmName << "' to " << m_shmSize << " bytes");
+            close(fd);
+            shm_unlink(m_shmName.c_str());
+            throw std::exception();
+        }
+        void* pMap = mmap(NULL, m_shmSize, 
+            PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+        close(fd);
+        if (pMap == MAP_FAILED)
+        {
+            LOG_ERROR("Failed to map shared-memory segment '" 
+                << m_shmName << "'");
+            shm_unlink(m_shmName.c_str());
+            throw std::exception();
+        }
+        m_pHeader = (dsl_meta_shm_header*)pMap;
+        m_pSlots = (uint8_t*)pMap + sizeof(dsl_meta_shm_header);
+        
+        // The segment is zero filled by ftruncate. The magic string is 
+        // written last so that readers never attach to a partial header. 
+        m_pHeader->version = DSL_META_SHM_VERSION;
+        m_pHeader->slot_count = m_slotCount;
+        m_pHeader->slot_size = m_slotSize;
+        m_pHeader->max_objects = m_maxObjects;
+        m_pHeader->writer_pid = getpid();
+        __atomic_thread_fence(__ATOMIC_RELEASE);
+        memcpy(m_pHeader->magic, DSL_META_SHM_MAGIC, sizeof(DSL_META_SHM_MAGIC));
+    }
+    
+    MetaShmWriter::~MetaShmWriter()
+    {
+        LOG_FUNC();
+        
+        // Readers that remain attached keep their mappings until they detach.
+        munmap(m_pHeader, m_shmSize);
+        shm_unlink(m_shmName.c_str());
+    }
+    
+    uint MetaShmWriter::Publish(NvDsBatchMeta* pBatchMeta, uint64_t bufPts)
+    {
+        // Don't log function entry/exit - called for every batch
+        
+        uint frameCount(0);
+        
+        for (NvDsMetaList* pFrameMetaList = pBatchMeta->frame_meta_list; 
+            pFrameMetaList; pFrameMetaList = pFrameMetaList->next)
+        {
+            NvDsFrameMeta* pFrameMeta = (NvDsFrameMeta*) (pFrameMetaList->data);
+            if (pFrameMeta == NULL)
+            {
+                continue;
+            }
+            PublishFrame(pFrameMeta, bufPts);
+            frameCount++;
+        }
+        if (frameCount)
+        {
+            RingDoorbell();
+        }
+        return frameCount;
+    }
+    
+    void MetaShmWriter::PublishFrame(NvDsFrameMeta* pFrameMeta, uint64_t bufPts)
+    {
+        uint64_t sequence = ++m_sequence;
+        
+        dsl_meta_shm_frame* pFrame = (dsl_meta_shm_frame*)
+            (m_pSlots + ((sequence - 1) % m_slotCount)*m_slotSize);
+        
+        // Invalidate the slot before any of its contents are modified. 
+        __atomic_store_n(&pFrame->sequence, 0, __ATOMIC_RELAXED);
+        __atomic_thread_fence(__ATOMIC_RELEASE);
+        
+        pFrame->source_id = pFrameMeta->source_id;
+        pFrame->batch_id = pFrameMeta->batch_id;
+        pFrame->frame_num = pFrameMeta->frame_num;
+        pFrame->ntp_timestamp = pFrameMeta->ntp_timestamp;
+        pFrame->buf_pts = bufPts;
+        pFrame->source_frame_width = pFrameMeta->source_frame_width;
+        pFrame->source_frame_height = pFrameMeta->source_frame_height;
+        pFrame->flags = (pFrameMeta->bInferDone) 
+            ? DSL_META_SHM_FRAME_INFER_DONE : 0;
+
+        dsl_meta_shm_object* pObject = (dsl_meta_shm_object*)(pFrame + 1);
+        uint objectCount(0);
+        
+        for (NvDsMetaList* pObjectMetaList = pFrameMeta->obj_meta_list; 
+            pObjectMetaList; pObjectMetaList = pObjectMetaList->next)
+        {
+            NvDsObjectMeta* pObjectMeta = 
+                (NvDsObjectMeta*) (pObjectMetaList->data);
+            if (pObjectMeta == NULL)
+            {
+                continue;
+            }
+            if (objectCount == m_maxObjects)
+            {
+                pFrame->flags |= DSL_META_SHM_FRAME_OBJECTS_TRUNCATED;
+                break;
+            }
+            pObject->object_id = pObjectMeta->object_id;
+            pObject->class_id = pObjectMeta->class_id;
+            pObject->infer_id = pObjectMeta->unique_component_id;
+            pObject->confidence = pObjectMeta->confidence;
+            pObject->tracker_confidence = pObjectMeta->tracker_confidence;
+            pObject->left = pObjectMeta->rect_params.left;
+            pObject->top = pObjectMeta->rect_params.top;
+            pObject->width = pObjectMeta->rect_params.width;
+            pObject->height = pObjectMeta->rect_params.height;
+            pObject++;
+            objectCount++;
+        }
+        pFrame->object_count = objectCount;
+        
+        // Validate the slot only once all of its contents are written.
+        __atomic_store_n(&pFrame->sequence, sequence, __ATOMIC_RELEASE);
+    }
+    
+    void MetaShmWriter::RingDoorbell()
+    {
+        __atomic_store_n(&m_pHeader->write_sequence, m_sequence, __ATOMIC_RELEASE);
+        __atomic_add_fetch(&m_pHeader->doorbell, 1, __ATOMIC_SEQ_CST);
+        
+        // Only make the system call if one or more readers are waiting.
+        if (__atomic_load_n(&m_pHeader->waiters, __ATOMIC_SEQ_CST))
+        {
+            syscall(SYS_futex, &m_pHeader->doorbell, FUTEX_WAKE, 
+                INT_MAX, NULL, NULL, 0);
+        }
+    }
+}
@@ -0,0 +1,153 @@
+/*
+The MIT License
+
+Copyright (c) 2019-2021, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#ifndef _DSL_META_SHM_H
+#define _DSL_META_SHM_H
+
+#include "Dsl.h"
+#include "DslApi.h"
+
+namespace DSL
+{
+    #define DSL_META_SHM_WRITER_PTR std::shared_ptr<MetaShmWriter>
+    #define DSL_META_SHM_WRITER_NEW(shmName, slotCount, maxObjects) \
+        std::shared_ptr<MetaShmWriter>(new MetaShmWriter(shmName, \
+            slotCount, maxObjects))
+
+    /**
+     * @class MetaShmWriter
+     * @brief Implements a single writer of per-frame object metadata to a 
+     * ring buffer in POSIX shared-memory using the fixed, C-compatible schema
+     * defined in DslApi.h. Each slot is protected by its own sequence number
+     * (seqlock) so that any number of reader processes can attach and read 
+     * without ever blocking the writer. Readers are signaled by a futex 
+     * doorbell that is only rung (system call) when a reader is waiting.
+     */
+    class MetaShmWriter
+    {
+    public:
+
+        /**
+         * @brief ctor for the MetaShmWriter class. Throws on failure to
+         * create or map the shared-memory segment.
+         * @param[in] shmName name of the shared-memory segment to create.
+         * A leading '/' is added if not provided. Any existing segment 
+         * with the same name is unlinked and replaced.
+         * @param[in] slotCount number of frame slots in the ring buffer.
+         * @param[in] maxObjects maximum number of objects per frame slot.
+         */
+        MetaShmWriter(const char* shmName, uint slotCount, uint maxObjects);
+
+        /**
+         * @brief dtor for the MetaShmWriter class. Unmaps and unlinks
+         * the shared-memory segment.
+         */
+        ~MetaShmWriter();
+
+        /**
+         * @brief Gets the name of the shared-memory segment.
+         * @return name of the segment including the leading '/'.
+         */
+        const char* GetShmName(){return m_shmName.c_str();};
+
+        /**
+         * @brief Gets the size of the shared-memory segment.
+         * @return size of the segment in bytes.
+         */
+        size_t GetShmSize(){return m_shmSize;};
+
+        /**
+         * @brief Publishes the frame and object metadata of each frame in
+         * a batch, one slot per frame, and rings the doorbell once.
+         * @param[in] pBatchMeta batch metadata to publish.
+         * @param[in] bufPts presentation timestamp of the batched buffer.
+         * @return number of frames published.
+         */
+        uint Publish(NvDsBatchMeta* pBatchMeta, uint64_t bufPts);
+
+        /**
+         * @brief Gets the sequence number of the last frame published.
+         * @return last sequence number, 0 if no frames have been published.
+         */
+        uint64_t GetSequence(){return m_sequence;};
+
+    private:
+
+        /**
+         * @brief Writes the frame and object metadata of a single frame to
+         * the next slot in the ring buffer.
+         * @param[in] pFrameMeta frame metadata to write.
+         * @param[in] bufPts presentation timestamp of the batched buffer.
+         */
+        void PublishFrame(NvDsFrameMeta* pFrameMeta, uint64_t bufPts);
+
+        /**
+         * @brief Makes all frames written visible to readers and wakes 
+         * any readers waiting on the doorbell.
+         */
+        void RingDoorbell();
+
+        /**
+         * @brief name of the shared-memory segment.
+         */
+        std::string m_shmName;
+
+        /**
+         * @brief size of the shared-memory segment in bytes.
+         */
+        size_t m_shmSize;
+
+        /**
+         * @brief header at the start of the mapped shared-memory segment.
+         */
+        dsl_meta_shm_header* m_pHeader;
+
+        /**
+         * @brief first slot in the mapped shared-memory segment.
+         */
+        uint8_t* m_pSlots;
+
+        /**
+         * @brief number of frame slots in the ring buffer.
+         */
+        uint m_slotCount;
+
+        /**
+         * @brief size of each slot in bytes.
+         */
+        uint m_slotSize;
+
+        /**
+         * @brief maximum number of object records per frame slot.
+         */
+        uint m_maxObjects;
+
+        /**
+         * @brief sequence number of the last frame written.
+         */
+        uint64_t m_sequence;
+    };
+}
+
+#endif // _DSL_META_SHM_H
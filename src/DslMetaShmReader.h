@@ -0,0 +1,255 @@
+/*
+The MIT License
+
+Copyright (c) 2019-2021, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+/**
+ * @file DslMetaShmReader.h
+ * @brief Header-only, C-compatible reader for the Metadata Publisher 
+ * shared-memory ring buffer. Any number of reader processes can attach to 
+ * a segment. Readers never block the publisher: a reader that falls more 
+ * than slot_count frames behind skips the frames that were overwritten 
+ * and counts them in frames_skipped. Link with -lrt on glibc < 2.34.
+ */
+
+#ifndef _DSL_META_SHM_READER_H
+#define _DSL_META_SHM_READER_H
+
+#include <stdint.h>
+#include <string.h>
+#include <limits.h>
+#include <errno.h>
+#include <time.h>
+#include <fcntl.h>
+#include <unistd.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <sys/syscall.h>
+#include <linux/futex.h>
+#include <stdbool.h>
+#include <wchar.h>
+#include <sys/types.h>
+
+#include "DslApi.h"
+
+/**
+ * @struct dsl_meta_shm_reader
+ * @brief state of one reader attached to a Metadata Publisher segment.
+ */
+typedef struct _dsl_meta_shm_reader
+{
+    /**
+     * @brief header at the start of the mapped segment.
+     */
+    dsl_meta_shm_header* header;
+
+    /**
+     * @brief size of the mapped segment in bytes.
+     */
+    size_t size;
+
+    /**
+     * @brief sequence number of the next frame to read.
+     */
+    uint64_t next_sequence;
+
+    /**
+     * @brief number of frames read.
+     */
+    uint64_t frames_read;
+
+    /**
+     * @brief number of frames skipped because they were overwritten 
+     * before they could be read.
+     */
+    uint64_t frames_skipped;
+    
+} dsl_meta_shm_reader;
+
+/**
+ * @brief Attaches a reader to a Metadata Publisher shared-memory segment.
+ * Reading starts with the next frame published.
+ * @param[out] reader reader to initialize.
+ * @param[in] shm_name name of the shared-memory segment, e.g. "/dsl-meta".
+ * @return 0 on success, -1 on failure with errno set.
+ */
+static inline int dsl_meta_shm_reader_open(dsl_meta_shm_reader* reader,
+    const char* shm_name)
+{
+    struct stat shm_stat;
+    dsl_meta_shm_header* header;
+    void* map;
+    int fd;
+    
+    memset(reader, 0, sizeof(*reader));
+    
+    // Read-write access is required for the waiters count and futex wait.
+    fd = shm_open(shm_name, O_RDWR, 0);
+    if (fd < 0)
+    {
+        return -1;
+    }
+    if (fstat(fd, &shm_stat) < 0 || 
+        (size_t)shm_stat.st_size < sizeof(dsl_meta_shm_header))
+    {
+        close(fd);
+        errno = EINVAL;
+        return -1;
+    }
+    map = mmap(NULL, shm_stat.st_size, PROT_READ | PROT_WRITE, 
+        MAP_SHARED, fd, 0);
+    close(fd);
+    if (map == MAP_FAILED)
+    {
+        return -1;
+    }
+    header = (dsl_meta_shm_header*)map;
+    
+    if (memcmp(header->magic, DSL_META_SHM_MAGIC, sizeof(DSL_META_SHM_MAGIC)) ||
+        header->version != DSL_META_SHM_VERSION || !header->slot_count ||
+        header->slot_size < sizeof(dsl_meta_shm_frame) + 
+            header->max_objects*sizeof(dsl_meta_shm_object) ||
+        (size_t)shm_stat.st_size < sizeof(dsl_meta_shm_header) + 
+            (size_t)header->slot_count*header->slot_size)
+    {
+        munmap(map, shm_stat.st_size);
+        errno = EINVAL;
+        return -1;
+    }
+    __atomic_thread_fence(__ATOMIC_ACQUIRE);
+    
+    reader->header = header;
+    reader->size = shm_stat.st_size;
+    reader->next_sequence = 
+        __atomic_load_n(&header->write_sequence, __ATOMIC_ACQUIRE) + 1;
+    return 0;
+}
+
+/**
+ * @brief Detaches a reader from its shared-memory segment.
+ * @param[in] reader reader to detach.
+ */
+static inline void dsl_meta_shm_reader_close(dsl_meta_shm_reader* reader)
+{
+    if (reader->header)
+    {
+        munmap(reader->header, reader->size);
+        reader->header = NULL;
+    }
+}
+
+/**
+ * @brief Copies the next frame, and up to max_objects of its objects, out 
+ * of the ring buffer. Frames overwritten before they could be copied are 
+ * skipped and added to the reader's frames_skipped count.
+ * @param[in] reader reader to read from.
+ * @param[out] frame frame record to copy into. The object_count member is
+ * the number of objects copied.
+ * @param[out] objects array of max_objects object records to copy into.
+ * @param[in] max_objects size of the objects array.
+ * @return 1 if a frame was copied, 0 if no new frame is available.
+ */
+static inline int dsl_meta_shm_reader_next(dsl_meta_shm_reader* reader,
+    dsl_meta_shm_frame* frame, dsl_meta_shm_object* objects, 
+    uint32_t max_objects)
+{
+    dsl_meta_shm_header* header = reader->header;
+    
+    for (;;)
+    {
+        uint64_t write_sequence = 
+            __atomic_load_n(&header->write_sequence, __ATOMIC_ACQUIRE);
+        const dsl_meta_shm_frame* slot;
+        uint64_t sequence;
+        
+        if (reader->next_sequence > write_sequence)
+        {
+            return 0;
+        }
+        // Skip ahead if the publisher has lapped the reader.
+        if (write_sequence - reader->next_sequence >= header->slot_count)
+        {
+            uint64_t oldest = write_sequence - header->slot_count + 1;
+            reader->frames_skipped += oldest - reader->next_sequence;
+            reader->next_sequence = oldest;
+        }
+        slot = (const dsl_meta_shm_frame*)((const uint8_t*)(header + 1) + 
+            ((reader->next_sequence - 1) % header->slot_count)*header->slot_size);
+        
+        sequence = __atomic_load_n(&slot->sequence, __ATOMIC_ACQUIRE);
+        if (sequence == reader->next_sequence)
+        {
+            uint32_t count;
+            
+            memcpy(frame, slot, sizeof(*frame));
+            count = (frame->object_count < max_objects) 
+                ? frame->object_count : max_objects;
+            memcpy(objects, slot + 1, count*sizeof(dsl_meta_shm_object));
+            
+            // The copy is only valid if the slot was not rewritten during it.
+            __atomic_thread_fence(__ATOMIC_ACQUIRE);
+            if (__atomic_load_n(&slot->sequence, __ATOMIC_RELAXED) == sequence)
+            {
+                frame->sequence = sequence;
+                frame->object_count = count;
+                reader->next_sequence++;
+                reader->frames_read++;
+                return 1;
+            }
+        }
+        // Overwritten, or being overwritten, by a newer frame.
+        reader->frames_skipped++;
+        reader->next_sequence++;
+    }
+}
+
+/**
+ * @brief Waits on the publisher's doorbell for a new frame to be published.
+ * @param[in] reader reader to wait with.
+ * @param[in] timeout_ms maximum time to wait in milliseconds, -1 for forever.
+ * @return 1 if a new frame is available, 0 otherwise.
+ */
+static inline int dsl_meta_shm_reader_wait(dsl_meta_shm_reader* reader,
+    int timeout_ms)
+{
+    dsl_meta_shm_header* header = reader->header;
+    struct timespec timeout = {timeout_ms/1000, (timeout_ms%1000)*1000000L};
+    uint32_t doorbell = __atomic_load_n(&header->doorbell, __ATOMIC_SEQ_CST);
+    
+    if (reader->next_sequence <= 
+        __atomic_load_n(&header->write_sequence, __ATOMIC_ACQUIRE))
+    {
+        return 1;
+    }
+    __atomic_add_fetch(&header->waiters, 1, __ATOMIC_SEQ_CST);
+    
+    // Returns immediately if the doorbell was rung after it was read above.
+    syscall(SYS_futex, &header->doorbell, FUTEX_WAIT, doorbell,
+        (timeout_ms < 0) ? NULL : &timeout, NULL, 0);
+        
+    __atomic_sub_fetch(&header->waiters, 1, __ATOMIC_SEQ_CST);
+    
+    return (reader->next_sequence <= 
+        __atomic_load_n(&header->write_sequence, __ATOMIC_ACQUIRE));
+}
+
+#endif // _DSL_META_SHM_READER_H
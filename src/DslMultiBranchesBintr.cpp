@@ -23,6 +23,7 @@ THE SOFTWARE.
 */
 
 #include "Dsl.h"
+#include "DslServices.h"
 #include "DslMultiBranchesBintr.h"
 #include "DslBranchBintr.h"
 
@@ -32,6 +33,8 @@ namespace DSL
     MultiBranchesBintr::MultiBranchesBintr(const char* name, 
         const char* teeType)
         : TeeBintr(name)
+        , m_pBranchOpsThread(NULL)
+        , m_branchOpsStop(false)
     {
         LOG_FUNC();
         
@@ -51,6 +54,8 @@ namespace DSL
     {
         LOG_FUNC();
 
+        _stopBranchOpsWorker();
+
         if (IsLinked())
         {
             UnlinkAll();
@@ -68,229 +73,764 @@ namespace DSL
     {
         LOG_FUNC();
         
-        // Ensure Component uniqueness
-        if (IsChild(pChildComponent))
+        std::vector<BranchOp> ops{BranchOp(DSL_TEE_BRANCH_OP_ADD, 
+            pChildComponent, DSL_TEE_BRANCH_ANY_STREAM)};
+
+        return ApplyBranchOps(ops);
+    }
+    
+    bool MultiBranchesBintr::IsChild(DSL_BINTR_PTR pChildComponent)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_branchesMutex);
+        
+        return (m_pChildBranches.find(pChildComponent->GetName()) 
+            != m_pChildBranches.end());
+    }
+
+    bool MultiBranchesBintr::RemoveChild(DSL_BASE_PTR pChildElement)
+    {
+        LOG_FUNC();
+        
+        // call the base function to handle the remove for Elementrs
+        return Bintr::RemoveChild(pChildElement);
+    }
+
+    bool MultiBranchesBintr::RemoveChild(DSL_BINTR_PTR pChildComponent)
+    {
+        LOG_FUNC();
+
+        std::vector<BranchOp> ops{BranchOp(DSL_TEE_BRANCH_OP_REMOVE, 
+            pChildComponent, DSL_TEE_BRANCH_ANY_STREAM)};
+
+        return ApplyBranchOps(ops);
+    }
+
+    /**
+     * @brief Returns the result for a Branch operation that failed.
+     * @param[in] op one of the DSL_TEE_BRANCH_OP constants.
+     * @return one of DSL_RESULT_TEE_BRANCH_ADD/REMOVE/MOVE_FAILED.
+     */
+    static DslReturnType branch_op_failed_result(uint op)
+    {
+        switch (op)
+        {
+        case DSL_TEE_BRANCH_OP_ADD :
+            return DSL_RESULT_TEE_BRANCH_ADD_FAILED;
+        case DSL_TEE_BRANCH_OP_REMOVE :
+            return DSL_RESULT_TEE_BRANCH_REMOVE_FAILED;
+        default :
+            return DSL_RESULT_TEE_BRANCH_MOVE_FAILED;
+        }
+    }
+
+    bool MultiBranchesBintr::ApplyBranchOps(std::vector<BranchOp>& ops)
+    {
+        LOG_FUNC();
+        
+        gint64 startTime = g_get_monotonic_time();
+        
+        _prepareBranchOps(ops);
+        
+        // batches queued earlier must be applied first to preserve order.
+        WaitForBranchOps();
+        
+        _executeBranchOps(ops, startTime);
+        _completeBranchOps(ops, startTime);
+        
+        for (const auto& ivec: ops)
         {
-            LOG_ERROR("'" << pChildComponent->GetName() 
-                << "' is already a child of '" << GetName() << "'");
-            return false;
+            if (ivec.result != DSL_RESULT_SUCCESS)
+            {
+                return false;
+            }
         }
-       
-        // find the next available unused stream-id
-        uint padId(0);
+        return true;
+    }
+
+    /**
+     * @brief Worker thread function for a MultiBranchesBintr's queue of 
+     * Branch operation batches.
+     * @param[in] pTee raw pointer to the MultiBranchesBintr.
+     * @return NULL on thread exit.
+     */
+    static gpointer BranchOpsWorkerThread(gpointer pTee)
+    {
+        static_cast<MultiBranchesBintr*>(pTee)->HandleBranchOpsQueue();
+        
+        return NULL;
+    }
+
+    /**
+     * @struct BranchOpsNotification
+     * @brief wide-string copy of a completed batch for the client listener,
+     * which is called from the main-loop context.
+     */
+    struct BranchOpsNotification
+    {
+        std::wstring teeName;
+        std::vector<std::wstring> branches;
+        std::vector<dsl_tee_branch_op_result> results;
+        dsl_tee_branch_ops_complete_listener_cb listener;
+        void* clientData;
+    };
+
+    /**
+     * @brief Idle callback to notify the client listener of a completed batch.
+     * @param[in] pData pointer to a BranchOpsNotification to deliver and delete.
+     * @return FALSE always to remove the idle source.
+     */
+    static gboolean branch_ops_complete_cb(gpointer pData)
+    {
+        BranchOpsNotification* pNotification = 
+            static_cast<BranchOpsNotification*>(pData);
+        
+        for (uint i = 0; i < pNotification->results.size(); i++)
+        {
+            pNotification->results[i].branch = 
+                pNotification->branches[i].c_str();
+        }
+        try
+        {
+            pNotification->listener(pNotification->teeName.c_str(),
+                pNotification->results.data(), pNotification->results.size(),
+                pNotification->clientData);
+        }
+        catch(...)
+        {
+            LOG_ERROR("Tee branch-ops complete listener threw an exception");
+        }
+        delete pNotification;
+        
+        return FALSE;
+    }
+    
+    /**
+     * @brief Schedules the client listener, if any, for a completed batch.
+     * @param[in] teeName name of the Tee the batch was applied to.
+     * @param[in] pBatch shared pointer to the completed batch.
+     */
+    static void notify_branch_ops_complete(const std::string& teeName,
+        DSL_BRANCH_OPS_BATCH_PTR pBatch)
+    {
+        if (!pBatch->listener)
+        {
+            return;
+        }
+        BranchOpsNotification* pNotification = new BranchOpsNotification();
+        
+        pNotification->teeName.assign(teeName.begin(), teeName.end());
+        pNotification->listener = pBatch->listener;
+        pNotification->clientData = pBatch->clientData;
+        
+        for (const auto& ivec: pBatch->ops)
+        {
+            pNotification->branches.push_back(
+                std::wstring(ivec.branch.begin(), ivec.branch.end()));
+            
+            dsl_tee_branch_op_result result{0};
+            result.op = ivec.op;
+            result.stream_id = (ivec.op == DSL_TEE_BRANCH_OP_REMOVE)
+                ? ivec.prevStreamId
+                : ivec.streamId;
+            result.result = ivec.result;
+            result.time_us = ivec.timeUs;
+            pNotification->results.push_back(result);
+        }
+        g_idle_add(branch_ops_complete_cb, pNotification);
+    }
+
+    void MultiBranchesBintr::QueueBranchOps(DSL_BRANCH_OPS_BATCH_PTR pBatch)
+    {
+        LOG_FUNC();
+
+        _prepareBranchOps(pBatch->ops);
         
+        // If not linked, there are no pads to block, so the batch can be
+        // completed now... once any batches queued while linked are done. 
+        if (!IsLinked())
+        {
+            WaitForBranchOps();
+            _executeBranchOps(pBatch->ops, pBatch->startTime);
+            _completeBranchOps(pBatch->ops, pBatch->startTime);
+            notify_branch_ops_complete(GetName(), pBatch);
+            return;
+        }
+        
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_branchOpsQueueMutex);
+        
+        if (!m_pBranchOpsThread)
+        {
+            m_branchOpsStop = false;
+            m_pBranchOpsThread = g_thread_new(GetCStrName(), 
+                BranchOpsWorkerThread, this);
+        }
+        m_branchOpsQueue.push(pBatch);
+        
+        LOG_INFO("Batch of " << pBatch->ops.size() 
+            << " branch operations queued for Tee '" << GetName() 
+            << "', batches in queue = " << m_branchOpsQueue.size());
+            
+        g_cond_signal(&m_branchOpsQueuedCond);
+    }
+    
+    void MultiBranchesBintr::WaitForBranchOps()
+    {
+        LOG_FUNC();
+        
+        // The caller either holds the Services lock or is the main-loop with
+        // a Services call waiting on it. Either way, the worker is unable to 
+        // execute, so all queued batches are executed here, once the worker
+        // has finished with a batch in progress, if any.
+        ExecuteQueuedBranchOps();
+    }
+    
+    void MultiBranchesBintr::ExecuteQueuedBranchOps()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_branchOpsExecuteMutex);
+        
+        while (true)
+        {
+            DSL_BRANCH_OPS_BATCH_PTR pBatch;
+            {
+                LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_branchOpsQueueMutex);
+                
+                if (m_branchOpsQueue.empty())
+                {
+                    return;
+                }
+                pBatch = m_branchOpsQueue.front();
+                m_branchOpsQueue.pop();
+            }
+            try
+            {
+                _executeBranchOps(pBatch->ops, pBatch->startTime);
+                _completeBranchOps(pBatch->ops, pBatch->startTime);
+            }
+            catch(...)
+            {
+                LOG_ERROR("MultiBranchesBintr '" << GetName() 
+                    << "' threw an exception applying branch operations");
+            }
+            notify_branch_ops_complete(GetName(), pBatch);
+        }
+    }
+    
+    void MultiBranchesBintr::HandleBranchOpsQueue()
+    {
+        LOG_FUNC();
+        
+        while (true)
+        {
+            {
+                LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_branchOpsQueueMutex);
+                
+                while (!m_branchOpsStop and m_branchOpsQueue.empty())
+                {
+                    g_cond_wait(&m_branchOpsQueuedCond, &m_branchOpsQueueMutex);
+                }
+                // stop only once all queued batches have been applied.
+                if (m_branchOpsQueue.empty())
+                {
+                    break;
+                }
+            }
+            // The Branches are linked, unlinked and removed under the Services
+            // lock so they're never modified concurrently with a Services call.
+            // The call in progress may be waiting on the queued batches, and
+            // will execute them itself, so never block on the lock here.
+            if (!Services::GetServices()->TeeBranchOpsQueueExecute(this))
+            {
+                LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_branchOpsQueueMutex);
+                
+                g_cond_wait_until(&m_branchOpsQueuedCond, &m_branchOpsQueueMutex,
+                    g_get_monotonic_time() + DSL_TEE_BRANCH_OPS_RETRY_INTERVAL_US);
+            }
+        }
+    }
+    
+    void MultiBranchesBintr::_stopBranchOpsWorker()
+    {
+        LOG_FUNC();
+        
+        if (!m_pBranchOpsThread)
+        {
+            return;
+        }
+        // The caller holds the Services lock, so the worker can't execute 
+        // any batches that remain. 
+        WaitForBranchOps();
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_branchOpsQueueMutex);
+            m_branchOpsStop = true;
+            g_cond_signal(&m_branchOpsQueuedCond);
+        }
+        g_thread_join(m_pBranchOpsThread);
+        m_pBranchOpsThread = NULL;
+    }
+
+    bool MultiBranchesBintr::_reserveStreamId(BranchOp& op)
+    {
+        LOG_FUNC();
+        
+        if (op.streamId != DSL_TEE_BRANCH_ANY_STREAM)
+        {
+            LOG_ERROR("Tee '" << GetName() 
+                << "' does not support adding or moving branches to a stream-id");
+            return false;
+        }
         // find the next available unused stream-id
         auto ivec = find(m_usedRequestPadIds.begin(), m_usedRequestPadIds.end(), false);
         
         // If we're inserting into the location of a previously remved branch
         if (ivec != m_usedRequestPadIds.end())
         {
-            padId = ivec - m_usedRequestPadIds.begin();
-            m_usedRequestPadIds[padId] = true;
+            op.streamId = ivec - m_usedRequestPadIds.begin();
+            m_usedRequestPadIds[op.streamId] = true;
         }
         // Else we're adding to the end of the indexed map
         else
         {
-            padId = m_usedRequestPadIds.size();
+            op.streamId = m_usedRequestPadIds.size();
             m_usedRequestPadIds.push_back(true);
         }
-        // Set the branches unique id to the available stream-id
-        pChildComponent->SetRequestPadId(padId);
+        return true;
+    }
 
-        // Add the branch to the Tees collection of children mapped by name 
-        m_pChildBranches[pChildComponent->GetName()] = pChildComponent;
-        
-        // Add the branch to the Tees collection of children mapped by stream-id 
-        m_pChildBranchesIndexed[padId] = pChildComponent;
+    void MultiBranchesBintr::_prepareBranchOps(std::vector<BranchOp>& ops)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_branchesMutex);
         
-        // call the parent class to complete the add
-        if (!Bintr::AddChild(pChildComponent))
+        // Validate each operation against the current set of branches. 
+        // Operations that have already failed validation are skipped.
+        for (uint i = 0; i < ops.size(); i++)
         {
-            LOG_ERROR("Faild to add Component '" << pChildComponent->GetName() 
-                << "' as a child to '" << GetName() << "'");
-            return false;
+            BranchOp& op = ops[i];
+            
+            if (op.result != DSL_RESULT_SUCCESS)
+            {
+                continue;
+            }
+            bool isDuplicate(false);
+            for (uint j = 0; j < i; j++)
+            {
+                isDuplicate |= (ops[j].branch == op.branch);
+            }
+            bool isChild = (m_pChildBranches.find(op.branch) 
+                != m_pChildBranches.end());
+                
+            if (isDuplicate)
+            {
+                LOG_ERROR("Branch '" << op.branch 
+                    << "' can only be operated on once per batch for Tee '" 
+                    << GetName() << "'");
+                op.result = DSL_RESULT_TEE_BRANCH_OP_INVALID;
+            }
+            else if (op.op == DSL_TEE_BRANCH_OP_ADD and isChild)
+            {
+                LOG_ERROR("'" << op.branch 
+                    << "' is already a child of '" << GetName() << "'");
+                op.result = DSL_RESULT_TEE_BRANCH_ADD_FAILED;
+            }
+            else if (op.op != DSL_TEE_BRANCH_OP_ADD and !isChild)
+            {
+                LOG_ERROR("' " << op.branch 
+                    << "' is NOT a child of '" << GetName() << "'");
+                op.result = DSL_RESULT_TEE_BRANCH_IS_NOT_CHILD;
+            }
+            else
+            {
+                op.pending = true;
+            }
         }
         
-        // If the Pipeline is currently in a linked state, 
-        if (IsLinked())
+        // Release the stream-ids of all branches being removed or moved first
+        // so they can be reserved by the adds and moves of the same batch.
+        for (auto& op: ops)
         {
-            // Propagate the link method and batch size to the Child Component
-            pChildComponent->SetLinkMethod(m_linkMethod);
-            pChildComponent->SetBatchSize(m_batchSize);
+            if (!op.pending or op.op == DSL_TEE_BRANCH_OP_ADD)
+            {
+                continue;
+            }
+            op.prevStreamId = op.pBranch->GetRequestPadId();
+            m_pChildBranchesIndexed.erase(op.prevStreamId);
+            m_usedRequestPadIds[op.prevStreamId] = false;
             
-            // Link the child and then link back upstream to the Tee, 
-            // the src for this Child Component 
-            if (!pChildComponent->LinkAll() or 
-                !pChildComponent->LinkToSourceTee(m_pTee, "src_%u"))
+            if (op.op == DSL_TEE_BRANCH_OP_REMOVE)
             {
-                LOG_ERROR("MultiBranchesBintr '" << GetName() 
-                    << "' failed to Link Child Component '" 
-                    << pChildComponent->GetName() << "'");
-                return false;
+                m_pChildBranches.erase(op.branch);
+            }
+        }
+        
+        // Reserve stream-ids for moves, then for adds to a specific stream,
+        // and finally for adds to the next available stream.
+        for (uint pass = 0; pass < 3; pass++)
+        {
+            for (auto& op: ops)
+            {
+                if (!op.pending or op.op == DSL_TEE_BRANCH_OP_REMOVE or
+                    (pass == 0 and op.op != DSL_TEE_BRANCH_OP_MOVE_TO) or
+                    (pass == 1 and (op.op != DSL_TEE_BRANCH_OP_ADD or
+                        op.streamId == DSL_TEE_BRANCH_ANY_STREAM)) or
+                    (pass == 2 and (op.op != DSL_TEE_BRANCH_OP_ADD or
+                        op.streamId != DSL_TEE_BRANCH_ANY_STREAM)))
+                {
+                    continue;
+                }
+                if (!_reserveStreamId(op))
+                {
+                    op.result = branch_op_failed_result(op.op);
+                    op.streamId = DSL_TEE_BRANCH_ANY_STREAM;
+                    
+                    // A move that fails is completed as a remove, the same
+                    // as a remove followed by a failed add.
+                    if (op.op == DSL_TEE_BRANCH_OP_MOVE_TO)
+                    {
+                        m_pChildBranches.erase(op.branch);
+                    }
+                    else
+                    {
+                        op.pending = false;
+                    }
+                    continue;
+                }
+                // Set the branches unique id to the reserved stream-id
+                op.pBranch->SetRequestPadId(op.streamId);
+                m_pChildBranchesIndexed[op.streamId] = op.pBranch;
+                
+                if (op.op == DSL_TEE_BRANCH_OP_MOVE_TO)
+                {
+                    continue;
+                }
+                m_pChildBranches[op.branch] = op.pBranch;
+                
+                // call the parent class to complete the add
+                if (!Bintr::AddChild(op.pBranch))
+                {
+                    LOG_ERROR("Failed to add Branch '" << op.branch 
+                        << "' as a child to '" << GetName() << "'");
+                    m_pChildBranches.erase(op.branch);
+                    m_pChildBranchesIndexed.erase(op.streamId);
+                    m_usedRequestPadIds[op.streamId] = false;
+                    op.pBranch->SetRequestPadId(-1);
+                    op.streamId = DSL_TEE_BRANCH_ANY_STREAM;
+                    op.result = DSL_RESULT_TEE_BRANCH_ADD_FAILED;
+                    op.pending = false;
+                }
             }
-
-            // Sync component up with the parent state
-            return gst_element_sync_state_with_parent(
-                pChildComponent->GetGstElement());
         }
-        return true;
     }
     
-    bool MultiBranchesBintr::IsChild(DSL_BINTR_PTR pChildComponent)
+    void MultiBranchesBintr::_executeBranchOps(std::vector<BranchOp>& ops, 
+        gint64 startTime)
     {
         LOG_FUNC();
         
-        return (m_pChildBranches.find(pChildComponent->GetName()) 
-            != m_pChildBranches.end());
-    }
-
-    bool MultiBranchesBintr::RemoveChild(DSL_BASE_PTR pChildElement)
-    {
-        LOG_FUNC();
+        // Nothing to link or unlink until this MultiBranchesBintr is linked.
+        if (!IsLinked())
+        {
+            return;
+        }
+        GstState currentState;
+        GetState(currentState, 0);
         
-        // call the base function to handle the remove for Elementrs
-        return Bintr::RemoveChild(pChildElement);
+        std::vector<BranchOp*> detachOps;
+        std::vector<BranchOp*> attachOps;
+        
+        for (auto& op: ops)
+        {
+            if (!op.pending)
+            {
+                continue;
+            }
+            if (op.op != DSL_TEE_BRANCH_OP_ADD and 
+                op.pBranch->IsLinkedToSource())
+            {
+                detachOps.push_back(&op);
+            }
+            if (op.op != DSL_TEE_BRANCH_OP_REMOVE and 
+                op.result == DSL_RESULT_SUCCESS)
+            {
+                attachOps.push_back(&op);
+            }
+        }
+        LOG_INFO("MultiBranchesBintr '" << GetName() << "' is in the state '" 
+            << currentState << "' while unlinking " << detachOps.size() 
+            << " and linking " << attachOps.size() << " branches");
+            
+        if (detachOps.size())
+        {
+            _detachBranches(detachOps, currentState, startTime);
+        }
+        if (attachOps.size())
+        {
+            _attachBranches(attachOps, currentState, startTime);
+        }
     }
 
     /**
-     * @class _asyncData
-     * @brief structure of data required for asynchronous linking and unlinking.
+     * @class _branchOpsWindow
+     * @brief structure of data shared by all blocking pad probes installed to
+     * link or unlink a batch of branches, so that a single timeout applies.
      */
-    typedef struct _asyncData
+    typedef struct _branchOpsWindow
     {
         DslMutex asynMutex;
         DslCond asyncCond;
-        GstNodetr* pChildComponent;
+        uint remaining;
+    } BranchOpsWindow;
+
+    /**
+     * @class _branchOpsProbe
+     * @brief structure of data for one blocking pad probe in a BranchOpsWindow.
+     */
+    typedef struct _branchOpsProbe
+    {
+        BranchOpsWindow* pWindow;
+        BranchOp* pOp;
+        GstPad* pSrcPad;
         GstPad* pSinkPad;
-    } AsyncData;
+        gulong probeId;
+        bool done;
+        gint64 doneTime;
+    } BranchOpsProbe;
     
     /**
      * @brief Blocking PPH to unlink and EOS a branch
      * @param pad unused
      * @param info unused
-     * @param pData pointer to AsyncData structure
+     * @param pData pointer to BranchOpsProbe structure
      * @return GST_PAD_PROBE_REMOVE to remove the probe always.
      */
     static GstPadProbeReturn unlink_from_source_tee_cb(GstPad* pad, 
         GstPadProbeInfo *info, gpointer pData)
     {
-        AsyncData* pAsyncData = static_cast<AsyncData*>(pData);
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&(pAsyncData->asynMutex));
+        BranchOpsProbe* pProbe = static_cast<BranchOpsProbe*>(pData);
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&(pProbe->pWindow->asynMutex));
 
+        // the window may have timed out while waiting for the lock.
+        if (pProbe->done)
+        {
+            return GST_PAD_PROBE_REMOVE;
+        }
         LOG_INFO("Unlinking and EOS'ing branch '" 
-            << pAsyncData->pChildComponent->GetName() << "'");
+            << pProbe->pOp->branch << "'");
         
-        pAsyncData->pChildComponent->UnlinkFromSourceTee();
+        pProbe->pOp->pBranch->UnlinkFromSourceTee();
         
-        gst_pad_send_event(pAsyncData->pSinkPad, 
-            gst_event_new_eos());
-
-        g_cond_signal(&(pAsyncData->asyncCond));
+        gst_pad_send_event(pProbe->pSinkPad, gst_event_new_eos());
 
+        pProbe->done = true;
+        pProbe->doneTime = g_get_monotonic_time();
+        
+        if (--pProbe->pWindow->remaining == 0)
+        {
+            g_cond_signal(&(pProbe->pWindow->asyncCond));
+        }
         return GST_PAD_PROBE_REMOVE;
     }
 
-    bool MultiBranchesBintr::RemoveChild(DSL_BINTR_PTR pChildComponent)
+    void MultiBranchesBintr::_detachBranches(std::vector<BranchOp*>& ops,
+        GstState currentState, gint64 startTime)
     {
         LOG_FUNC();
-
-        if (!IsChild(pChildComponent))
+        
+        if (currentState == GST_STATE_PLAYING)
         {
-            LOG_ERROR("' " << pChildComponent->GetName() 
-                << "' is NOT a child of '" << GetName() << "'");
-            return false;
-        }
-        if (pChildComponent->IsLinkedToSource())
-        {  
-            GstState currentState;
-            GetState(currentState, 0);
-            LOG_INFO("MultiBranchesBintr '" << GetName() << "' is in the state '" 
-                << currentState << "' while removing branch '" 
-                << pChildComponent->GetName() 
-                << "' from stream-id = " << pChildComponent->GetRequestPadId());
-                
-            if (currentState == GST_STATE_PLAYING)
+            BranchOpsWindow window;
+            window.remaining = ops.size();
+            
+            std::vector<BranchOpsProbe> probes(ops.size());
             {
-                AsyncData asyncData;
-                asyncData.pChildComponent = (GstNodetr*)&*pChildComponent;
-        
-                LOCK_MUTEX_FOR_CURRENT_SCOPE(&asyncData.asynMutex);
+                LOCK_MUTEX_FOR_CURRENT_SCOPE(&window.asynMutex);
                 
-                GstPad* pStaticSinkPad = gst_element_get_static_pad(
-                    pChildComponent->GetGstElement(), "sink");
-
-                asyncData.pSinkPad = pStaticSinkPad;
-                    
-                GstPad* pRequestedSrcPad = gst_pad_get_peer(pStaticSinkPad);
-                    
-                gulong probeId = gst_pad_add_probe(pRequestedSrcPad, 
-                    GST_PAD_PROBE_TYPE_BLOCK_DOWNSTREAM,
-                    (GstPadProbeCallback)unlink_from_source_tee_cb, 
-                    &asyncData, NULL);
-
+                // Block all branches at once so they share a single 
+                // blocking-timeout window rather than one window each.
+                for (uint i = 0; i < ops.size(); i++)
+                {
+                    probes[i].pWindow = &window;
+                    probes[i].pOp = ops[i];
+                    probes[i].done = false;
+                    probes[i].pSinkPad = gst_element_get_static_pad(
+                        ops[i]->pBranch->GetGstElement(), "sink");
+                    probes[i].pSrcPad = gst_pad_get_peer(probes[i].pSinkPad);
+                    probes[i].probeId = gst_pad_add_probe(probes[i].pSrcPad, 
+                        GST_PAD_PROBE_TYPE_BLOCK_DOWNSTREAM,
+                        (GstPadProbeCallback)unlink_from_source_tee_cb, 
+                        &probes[i], NULL);
+                }
                 gint64 endTime = g_get_monotonic_time() + (G_TIME_SPAN_SECOND *
                     m_blockingTimeout);
                     
-                if (!g_cond_wait_until(&asyncData.asyncCond, 
-                    &asyncData.asynMutex, endTime))
+                while (window.remaining)
                 {
+                    if (!g_cond_wait_until(&window.asyncCond, 
+                        &window.asynMutex, endTime))
+                    {
+                        break;
+                    }
+                }
+                for (auto& probe: probes)
+                {
+                    if (probe.done)
+                    {
+                        continue;
+                    }
                     // timeout - individual source must be paused or not linked.
-                    
                     LOG_WARN("Timout waiting for blocking pad probe removing branch '" 
-                        << pChildComponent->GetName() << "' from Parent Demuxer");
+                        << probe.pOp->branch << "' from Tee '" << GetName() << "'");
                     LOG_WARN("Upstream source must be in a non-playing state");
 
-                    if (!pChildComponent->UnlinkFromSourceTee())
+                    // remove the probe since it timed out.
+                    gst_pad_remove_probe(probe.pSrcPad, probe.probeId);
+                    probe.done = true;
+                    probe.doneTime = g_get_monotonic_time();
+
+                    if (!probe.pOp->pBranch->UnlinkFromSourceTee())
                     {   
                         LOG_ERROR("MultiBranchesBintr '" << GetName() 
                             << "' failed to Unlink Child Branch '" 
-                            << pChildComponent->GetName() << "'");
-                        return false;
+                            << probe.pOp->branch << "'");
+                        probe.pOp->result = branch_op_failed_result(probe.pOp->op);
                     }                
-                    // remove the probe since it timed out.
-                    gst_pad_remove_probe(pRequestedSrcPad, probeId);
                 }
-                
-                gst_object_unref(pStaticSinkPad);
-                gst_object_unref(pRequestedSrcPad);
-                
-                // TODO: need to revisit.  Need to wait on EOS event to be
-                // received by final sink... not yet implemented.
-                // interim solution is to sleep this process and give the branch 
-                // enough time to complete the EOS process. 
-                g_usleep(100000);
-                pChildComponent->SetState(GST_STATE_NULL, 
+            }
+            for (auto& probe: probes)
+            {
+                gst_object_unref(probe.pSinkPad);
+                gst_object_unref(probe.pSrcPad);
+                probe.pOp->timeUs = probe.doneTime - startTime;
+            }
+            // TODO: need to revisit.  Need to wait on EOS event to be
+            // received by final sink... not yet implemented.
+            // interim solution is to sleep this process and give the branches 
+            // enough time to complete the EOS process, once for all branches. 
+            g_usleep(100000);
+            for (auto& op: ops)
+            {
+                op->pBranch->SetState(GST_STATE_NULL, 
                     DSL_DEFAULT_STATE_CHANGE_TIMEOUT_IN_SEC * GST_SECOND);
             }
-            else
+        }
+        else
+        {
+            for (auto& op: ops)
             {
-                if (!pChildComponent->UnlinkFromSourceTee())
+                if (!op->pBranch->UnlinkFromSourceTee())
                 {   
                     LOG_ERROR("MultiBranchesBintr '" << GetName() 
                         << "' failed to Unlink Child Branch '" 
-                        << pChildComponent->GetName() << "'");
-                    return false;
-                }                
+                        << op->branch << "'");
+                    op->result = branch_op_failed_result(op->op);
+                }
+                op->timeUs = g_get_monotonic_time() - startTime;
             }
-            pChildComponent->UnlinkAll();
         }
-        // unreference and remove from the child-branch collections
-        m_pChildBranches.erase(pChildComponent->GetName());
-        m_pChildBranchesIndexed.erase(pChildComponent->GetRequestPadId());
+        for (auto& op: ops)
+        {
+            op->pBranch->UnlinkAll();
+        }
+    }
+    
+    void MultiBranchesBintr::_attachBranches(std::vector<BranchOp*>& ops,
+        GstState currentState, gint64 startTime)
+    {
+        LOG_FUNC();
         
-        // set the used-stream id as available for reuse and clear the 
-        // stream-id (id property) for the child-branch
-        m_usedRequestPadIds[pChildComponent->GetRequestPadId()] = false;
-        pChildComponent->SetRequestPadId(-1);
+        for (auto& op: ops)
+        {
+            // Propagate the link method and batch size to the Child Component
+            op->pBranch->SetLinkMethod(m_linkMethod);
+            op->pBranch->SetBatchSize(m_batchSize);
+            
+            // Link the child and then link back upstream to the Tee, 
+            // the src for this Child Component 
+            if (!op->pBranch->LinkAll() or 
+                !op->pBranch->LinkToSourceTee(m_pTee, "src_%u"))
+            {
+                LOG_ERROR("MultiBranchesBintr '" << GetName() 
+                    << "' failed to Link Child Component '" 
+                    << op->branch << "'");
+                op->result = branch_op_failed_result(op->op);
+            }
+            // Sync component up with the parent state
+            else if (!gst_element_sync_state_with_parent(
+                op->pBranch->GetGstElement()))
+            {
+                LOG_ERROR("MultiBranchesBintr '" << GetName() 
+                    << "' failed to sync state of Child Component '" 
+                    << op->branch << "'");
+                op->result = branch_op_failed_result(op->op);
+            }
+            op->timeUs = g_get_monotonic_time() - startTime;
+        }
+    }
+    
+    void MultiBranchesBintr::_completeBranchOps(std::vector<BranchOp>& ops,
+        gint64 startTime)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_branchesMutex);
         
-        // call the base function to complete the remove
-        return Bintr::RemoveChild(pChildComponent);
+        for (auto& op: ops)
+        {
+            if (!op.pending or (op.op != DSL_TEE_BRANCH_OP_REMOVE and 
+                op.result == DSL_RESULT_SUCCESS))
+            {
+                op.pending = false;
+                if (!op.timeUs)
+                {
+                    op.timeUs = g_get_monotonic_time() - startTime;
+                }
+                continue;
+            }
+            op.pending = false;
+            
+            // Failed adds and moves are removed from the Tee
+            if (op.op != DSL_TEE_BRANCH_OP_REMOVE)
+            {
+                LOG_ERROR("Removing branch '" << op.branch << "' from Tee '" 
+                    << GetName() << "' on failure to link");
+                    
+                m_pChildBranches.erase(op.branch);
+                auto imap = m_pChildBranchesIndexed.find(op.streamId);
+                if (imap != m_pChildBranchesIndexed.end() and 
+                    imap->second == op.pBranch)
+                {
+                    m_pChildBranchesIndexed.erase(op.streamId);
+                    m_usedRequestPadIds[op.streamId] = false;
+                }
+            }
+            if (op.pBranch->IsLinkedToSource())
+            {
+                op.pBranch->UnlinkFromSourceTee();
+            }
+            if (op.pBranch->IsLinked())
+            {
+                op.pBranch->UnlinkAll();
+            }
+            // clear the stream-id (id property) for the child-branch
+            op.pBranch->SetRequestPadId(-1);
+            
+            // call the base function to complete the remove
+            if (!Bintr::RemoveChild(op.pBranch) and 
+                op.result == DSL_RESULT_SUCCESS)
+            {
+                op.result = DSL_RESULT_TEE_BRANCH_REMOVE_FAILED;
+            }
+            op.timeUs = g_get_monotonic_time() - startTime;
+        }
     }
 
     bool MultiBranchesBintr::LinkAll()
     {
         LOG_FUNC();
 
+        // complete all queued branch operations first.
+        WaitForBranchOps();
+
         if (m_isLinked)
         {
             LOG_ERROR("MultiBranchesBintr '" << GetName() 
@@ -323,6 +863,9 @@ namespace DSL
     {
         LOG_FUNC();
         
+        // complete all queued branch operations first.
+        WaitForBranchOps();
+
         if (!m_isLinked)
         {
             LOG_ERROR("MultiBranchesBintr '" << GetName() << "' is not linked");
@@ -457,24 +1000,48 @@ namespace DSL
             AddDemuxerBintr(shared_from_this());
     }
 
+    DemuxerBintr::~DemuxerBintr()
+    {
+        LOG_FUNC();
+        
+        // The worker must be stopped while the DemuxerBintr overrides 
+        // called by the worker are still valid.
+        _stopBranchOpsWorker();
+    }
+
+    /**
+     * @brief Blocking PPH to sync a newly linked branch with its Parent Demuxer
+     * @param pad unused
+     * @param info unused
+     * @param pData pointer to BranchOpsProbe structure
+     * @return GST_PAD_PROBE_REMOVE to remove the probe always.
+     */
     static GstPadProbeReturn link_to_source_tee_cb(GstPad* pad, 
         GstPadProbeInfo *info, gpointer pData)
     {
-        AsyncData* pAsyncData = static_cast<AsyncData*>(pData);
-        
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&(pAsyncData->asynMutex));
+        BranchOpsProbe* pProbe = static_cast<BranchOpsProbe*>(pData);
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&(pProbe->pWindow->asynMutex));
 
-        LOG_INFO("Synchronizing branch '" 
-            << pAsyncData->pChildComponent->GetName() 
+        // the window may have timed out while waiting for the lock.
+        if (pProbe->done)
+        {
+            return GST_PAD_PROBE_REMOVE;
+        }
+        LOG_INFO("Synchronizing branch '" << pProbe->pOp->branch 
             << "' with Parent Demuxer");
 
         gst_element_sync_state_with_parent(
-            pAsyncData->pChildComponent->GetGstElement());
+            pProbe->pOp->pBranch->GetGstElement());
 
-        // Signal the blocked service (_completeAddChild) that the add 
-        // process is now complete.
-        g_cond_signal(&(pAsyncData->asyncCond));
+        pProbe->done = true;
+        pProbe->doneTime = g_get_monotonic_time();
 
+        // Signal the blocked service (_attachBranches) once all branches
+        // of the batch have been synchronized. 
+        if (--pProbe->pWindow->remaining == 0)
+        {
+            g_cond_signal(&(pProbe->pWindow->asyncCond));
+        }
         return GST_PAD_PROBE_REMOVE;
     }
 
@@ -482,218 +1049,215 @@ namespace DSL
     {
         LOG_FUNC();
         
-        // Ensure Component uniqueness
-        if (IsChild(pChildComponent))
-        {
-            LOG_ERROR("'" << pChildComponent->GetName() 
-                << "' is already a child of '" << GetName() << "'");
-            return false;
-        }
-        // Ensure that we are not exceeding max-branches
-        if ((m_pChildBranches.size()+1) > m_maxBranches)
-        {
-            LOG_ERROR("Can't add Branch '" << pChildComponent->GetName() 
-                << "' to DemuxerBintr '" << GetName() 
-                << "' as it would exceed max-branches = " << m_maxBranches);
-            return false;
-        }
+        return MultiBranchesBintr::AddChild(pChildComponent);
+    }
 
-        // find the next available unused stream-id
-        uint streamId(0);
-        auto ivec = find(m_usedRequestPadIds.begin(), 
-            m_usedRequestPadIds.end(), false);
+    bool DemuxerBintr::AddChildTo(DSL_BINTR_PTR pChildComponent, uint streamId)
+    {
+        LOG_FUNC();
         
-        // If we're inserting into the location of a previously remved source
-        if (ivec != m_usedRequestPadIds.end())
-        {
-            streamId = ivec - m_usedRequestPadIds.begin();
-            m_usedRequestPadIds[streamId] = true;
-        }
-        // Else we're adding to the end of th indexed map
-        else
-        {
-            streamId = m_usedRequestPadIds.size();
-            m_usedRequestPadIds.push_back(true);
-        }
-        // Call the private helper to complete the common add functionality
-        // now that we have the streamId
-        return _completeAddChild(pChildComponent, streamId);
+        std::vector<BranchOp> ops{BranchOp(DSL_TEE_BRANCH_OP_ADD, 
+            pChildComponent, streamId)};
+
+        return ApplyBranchOps(ops);
     }
 
-    bool DemuxerBintr::AddChildTo(DSL_BINTR_PTR pChildComponent, uint streamId)
+    bool DemuxerBintr::MoveChildTo(DSL_BINTR_PTR pChildComponent, uint streamId)
+    {
+        LOG_FUNC();
+        
+        std::vector<BranchOp> ops{BranchOp(DSL_TEE_BRANCH_OP_MOVE_TO, 
+            pChildComponent, streamId)};
+
+        return ApplyBranchOps(ops);
+    }
+
+    bool DemuxerBintr::_reserveStreamId(BranchOp& op)
     {
         LOG_FUNC();
         
-        // Ensure Component uniqueness
-        if (IsChild(pChildComponent))
+        if (op.streamId == DSL_TEE_BRANCH_ANY_STREAM)
         {
-            LOG_ERROR("'" << pChildComponent->GetName() 
-                << "' is already a child of '" << GetName() << "'");
-            return false;
+            // find the next available unused stream-id
+            auto ivec = find(m_usedRequestPadIds.begin(), 
+                m_usedRequestPadIds.end(), false);
+            
+            uint streamId = ivec - m_usedRequestPadIds.begin();
+
+            // Ensure that we are not exceeding max-branches
+            if ((streamId+1) > m_maxBranches)
+            {
+                LOG_ERROR("Can't add Branch '" << op.branch 
+                    << "' to DemuxerBintr '" << GetName() 
+                    << "' as it would exceed max-branches = " << m_maxBranches);
+                return false;
+            }
+            // If we're inserting into the location of a previously remved source
+            if (ivec != m_usedRequestPadIds.end())
+            {
+                m_usedRequestPadIds[streamId] = true;
+            }
+            // Else we're adding to the end of th indexed map
+            else
+            {
+                m_usedRequestPadIds.push_back(true);
+            }
+            op.streamId = streamId;
+            return true;
         }
         // Ensure that we are not exceeding max-branches
-        if ((streamId+1) > m_maxBranches)
+        if ((op.streamId+1) > m_maxBranches)
         {
-            LOG_ERROR("Can't add Branch '" << pChildComponent->GetName() 
+            LOG_ERROR("Can't add Branch '" << op.branch 
                 << "' to DemuxerBintr '" << GetName() 
                 << "' as it would exceed max-branches = " << m_maxBranches);
             return false;
         }
 
         // If the streamId has been used "ever", since bintr creation
-        if ((streamId+1) <= m_usedRequestPadIds.size())
+        if ((op.streamId+1) <= m_usedRequestPadIds.size())
         {
             // Ensure that the stream-id is not currently linked
-            if (m_usedRequestPadIds[streamId] == true)
+            if (m_usedRequestPadIds[op.streamId] == true)
             {
-                LOG_ERROR("Can't add Branch '" << pChildComponent->GetName() 
+                LOG_ERROR("Can't add Branch '" << op.branch 
                     << "' to DemuxerBintr '" << GetName() << "' at stream-id = " 
-                    << streamId << " as it's currently taken");
+                    << op.streamId << " as it's currently taken");
                 return false;
             }
             // Else set the used pad-ids to true at position stream-id
-            else
-            {
-                m_usedRequestPadIds[streamId] = true;
-            }
+            m_usedRequestPadIds[op.streamId] = true;
         }
         // Else, the stream-id exceeds the size so it has never been used before
         else
         {
             // Need to pad the vector with false entries up to the new
             // requested stream-id / pad-id
-            for (auto i=m_usedRequestPadIds.size(); i<streamId; i++)
+            for (auto i=m_usedRequestPadIds.size(); i<op.streamId; i++)
             {
                 m_usedRequestPadIds.push_back(false);
             }
             // We can now push a true (currently used) entry at position stream-id.
             m_usedRequestPadIds.push_back(true);
         }
-        // Call the private helper to complete the common add functionality
-        // now that we have the streamId
-        return _completeAddChild(pChildComponent, streamId);
+        return true;
     }
 
-    bool DemuxerBintr::MoveChildTo(DSL_BINTR_PTR pChildComponent, uint streamId)
+    void DemuxerBintr::_attachBranches(std::vector<BranchOp*>& ops,
+        GstState currentState, gint64 startTime)
     {
         LOG_FUNC();
-        
-        return (RemoveChild(pChildComponent) and
-            AddChildTo(pChildComponent, streamId));
-    }
 
-    
-    bool DemuxerBintr::_completeAddChild(DSL_BINTR_PTR pChildComponent, uint streamId)
-    {
-        LOG_FUNC();
+        if (currentState == GST_STATE_PLAYING)
+        {
+            // When in a playing state, we need to do the final sync with the
+            // parent state in the context of a PPH while blocking downstream.
+            BranchOpsWindow window;
+            window.remaining = 0;
+            
+            std::vector<BranchOpsProbe> probes(ops.size());
 
-        // Set the branches unique id to the available stream-id
-        pChildComponent->SetRequestPadId(streamId);
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&window.asynMutex);
 
-        // Add the branch to the Demuxers collection of children mapped by name 
-        m_pChildBranches[pChildComponent->GetName()] = pChildComponent;
-        
-        // Add the branch to the Demuxers collection of children mapped by stream-id 
-        m_pChildBranchesIndexed[streamId] = pChildComponent;
-        
-        // call the parent class to complete the add
-        if (!Bintr::AddChild(pChildComponent))
-        {
-            LOG_ERROR("Failed to add Branch '" << pChildComponent->GetName() 
-                << "' as a child to '" << GetName() << "'");
-            return false;
-        }
-        
-        // If the Pipeline is currently in a linked state, 
-        // linkAll Elementrs now and Link with the Stream
-        if (IsLinked())
-        {
-            GstState currentState;
-            GetState(currentState, 0);
-            LOG_INFO("Demuxer '" << GetName() << "' is in state '" << currentState 
-                << "' while adding branch '" << pChildComponent->GetName() 
-                << "' to stream-id = " << streamId);
-                
-            if (currentState == GST_STATE_PLAYING)
+            for (uint i = 0; i < ops.size(); i++)
             {
-                // When in a playing state, we need to do the final sync with the
-                // parent state in the context of a PPH while blocking downstream.
-                AsyncData asyncData;
-                asyncData.pChildComponent = (GstNodetr*)&*pChildComponent;
-        
-                LOCK_MUTEX_FOR_CURRENT_SCOPE(&asyncData.asynMutex);
+                probes[i].pWindow = &window;
+                probes[i].pOp = ops[i];
+                probes[i].done = false;
+                probes[i].pSrcPad = m_requestedSrcPads[ops[i]->streamId];
 
                 // IMPORTANT: we need to install the blocking probe before we link
                 // pads so that it can block the first buffer once linked.
-                gulong probeId = gst_pad_add_probe(m_requestedSrcPads[streamId], 
+                probes[i].probeId = gst_pad_add_probe(probes[i].pSrcPad, 
                     GST_PAD_PROBE_TYPE_BLOCK_DOWNSTREAM,
                     (GstPadProbeCallback)link_to_source_tee_cb, 
-                    &asyncData, NULL);
+                    &probes[i], NULL);
 
                 // link back upstream to the Tee - now the src for the child branch.
-                if (!pChildComponent->LinkAll() or 
-                    !pChildComponent->LinkToSourceTee(m_pTee, 
-                        m_requestedSrcPads[streamId]))
+                if (!ops[i]->pBranch->LinkAll() or 
+                    !ops[i]->pBranch->LinkToSourceTee(m_pTee, probes[i].pSrcPad))
                 {
                     LOG_ERROR("DemuxerBintr '" << GetName() 
                         << "' failed to Link Child Component '" 
-                        << pChildComponent->GetName() << "'");
-                    return false;
+                        << ops[i]->branch << "'");
+                    gst_pad_remove_probe(probes[i].pSrcPad, probes[i].probeId);
+                    probes[i].done = true;
+                    probes[i].doneTime = g_get_monotonic_time();
+                    ops[i]->result = branch_op_failed_result(ops[i]->op);
+                    continue;
                 }
-
-                gint64 endTime = g_get_monotonic_time() + (G_TIME_SPAN_SECOND *
-                    m_blockingTimeout);
-                    
-                if (!g_cond_wait_until(&asyncData.asyncCond, 
-                    &asyncData.asynMutex, endTime))
+                window.remaining++;
+            }
+            
+            gint64 endTime = g_get_monotonic_time() + (G_TIME_SPAN_SECOND *
+                m_blockingTimeout);
+                
+            while (window.remaining)
+            {
+                if (!g_cond_wait_until(&window.asyncCond, 
+                    &window.asynMutex, endTime))
+                {
+                    break;
+                }
+            }
+            for (auto& probe: probes)
+            {
+                if (!probe.done)
                 {
                     // timeout - individual source must be paused or not linked.
-                    
                     LOG_ERROR("Timout waiting for blocking pad probe adding branch '" 
-                        << pChildComponent->GetName() << "' to Parent Demuxer");
+                        << probe.pOp->branch << "' to Parent Demuxer");
                     LOG_ERROR("Upstream source must be in a non-playing state");
                     
-                    pChildComponent->UnlinkFromSourceTee();
-                    pChildComponent->UnlinkAll();
                     // remove the probe since it timed out.
-                    gst_pad_remove_probe(m_requestedSrcPads[streamId], probeId);
-                    return false;
-                }
-                else
-                {
-                    // branch has been succcessfully added while the Pipeline 
-                    // and individual source stream were both playing.
-                    return true;
+                    gst_pad_remove_probe(probe.pSrcPad, probe.probeId);
+                    probe.done = true;
+                    probe.doneTime = g_get_monotonic_time();
+                    
+                    probe.pOp->pBranch->UnlinkFromSourceTee();
+                    probe.pOp->pBranch->UnlinkAll();
+                    probe.pOp->result = branch_op_failed_result(probe.pOp->op);
                 }
+                probe.pOp->timeUs = probe.doneTime - startTime;
+            }
+            return;
+        }
+        for (auto& op: ops)
+        {
+            // Else, we must be in a READY, or PAUSED state so we can
+            // link back upstream to the Tee now.
+            if (!op->pBranch->LinkAll() or 
+                !op->pBranch->LinkToSourceTee(m_pTee, 
+                    m_requestedSrcPads[op->streamId]))
+            {
+                LOG_ERROR("DemuxerBintr '" << GetName() 
+                    << "' failed to Link Child Component '" 
+                    << op->branch << "'");
+                op->result = branch_op_failed_result(op->op);
             }
             else
             {
-                // Else, we must be in a READY, or PAUSED state so we can
-                // link back upstream to the Tee now.
-                if (!pChildComponent->LinkAll() or 
-                    !pChildComponent->LinkToSourceTee(m_pTee, 
-                        m_requestedSrcPads[streamId]))
-                {
-                    LOG_ERROR("DemuxerBintr '" << GetName() 
-                        << "' failed to Link Child Component '" 
-                        << pChildComponent->GetName() << "'");
-                    return false;
-                }
                 // Sync the branch with the parent (this demuxer) state now.
-                LOG_INFO("Synchronizing branch '" << pChildComponent->GetName() 
+                LOG_INFO("Synchronizing branch '" << op->branch 
                     << "' with Parent Demuxer");
                 
-                return gst_element_sync_state_with_parent(
-                    pChildComponent->GetGstElement());
+                if (!gst_element_sync_state_with_parent(
+                    op->pBranch->GetGstElement()))
+                {
+                    op->result = branch_op_failed_result(op->op);
+                }
             }
+            op->timeUs = g_get_monotonic_time() - startTime;
         }
-        return true;
     }
     
     bool DemuxerBintr::LinkAll()
     {
         LOG_FUNC();
 
+        // complete all queued branch operations first.
+        WaitForBranchOps();
+
         if (m_isLinked)
         {
             LOG_ERROR("DemuxerBintr '" << GetName() 
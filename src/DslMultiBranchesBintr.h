@@ -51,6 +51,133 @@ namespace DSL
     #define DSL_SPLITTER_NEW(name) \
         std::shared_ptr<SplitterBintr>(new SplitterBintr(name))
 
+    #define DSL_BRANCH_OPS_BATCH_PTR std::shared_ptr<BranchOpsBatch>
+    #define DSL_BRANCH_OPS_BATCH_NEW(ops, listener, clientData) \
+        std::shared_ptr<BranchOpsBatch>(new BranchOpsBatch(ops, \
+            listener, clientData))
+
+    /**
+     * @brief time for the worker thread to wait before retrying a queued
+     * batch when the Services lock is held by a call in progress.
+     */
+    #define DSL_TEE_BRANCH_OPS_RETRY_INTERVAL_US        10000
+
+    /**
+     * @struct BranchOp
+     * @brief a single add, remove, or move-to Branch operation for a 
+     * MultiBranchesBintr, along with its outcome once applied.
+     */
+    struct BranchOp
+    {
+        BranchOp(uint op, const std::string& branch, uint streamId)
+            : op(op)
+            , branch(branch)
+            , streamId(streamId)
+            , prevStreamId(DSL_TEE_BRANCH_ANY_STREAM)
+            , pending(false)
+            , result(DSL_RESULT_SUCCESS)
+            , timeUs(0)
+        {};
+
+        BranchOp(uint op, DSL_BINTR_PTR pBranch, uint streamId)
+            : op(op)
+            , branch(pBranch->GetName())
+            , pBranch(pBranch)
+            , streamId(streamId)
+            , prevStreamId(DSL_TEE_BRANCH_ANY_STREAM)
+            , pending(false)
+            , result(DSL_RESULT_SUCCESS)
+            , timeUs(0)
+        {};
+
+        /**
+         * @brief one of the DSL_TEE_BRANCH_OP constants.
+         */
+        uint op;
+
+        /**
+         * @brief unique name of the Branch to operate on.
+         */
+        std::string branch;
+
+        /**
+         * @brief shared pointer to the Branch to operate on.
+         */
+        DSL_BINTR_PTR pBranch;
+
+        /**
+         * @brief requested stream-id on input, the reserved stream-id 
+         * once prepared for add and move-to operations.
+         */
+        uint streamId;
+
+        /**
+         * @brief stream-id released by remove and move-to operations.
+         */
+        uint prevStreamId;
+
+        /**
+         * @brief true if the operation has been prepared and the Branch 
+         * still needs to be linked, unlinked, or removed.
+         */
+        bool pending;
+
+        /**
+         * @brief DSL_RESULT_SUCCESS, or the reason the operation failed.
+         */
+        DslReturnType result;
+
+        /**
+         * @brief time from the start of the batch to the completion of 
+         * this operation in microseconds.
+         */
+        uint64_t timeUs;
+    };
+
+    /**
+     * @class BranchOpsBatch
+     * @brief A batch of Branch operations queued for a MultiBranchesBintr's
+     * worker thread along with the client's completion listener.
+     */
+    class BranchOpsBatch
+    {
+    public:
+
+        /**
+         * @brief ctor for the BranchOpsBatch class
+         * @param[in] ops Branch operations to apply.
+         * @param[in] listener optional client listener to call on completion.
+         * @param[in] clientData opaque pointer to client data for the listener.
+         */
+        BranchOpsBatch(const std::vector<BranchOp>& ops,
+            dsl_tee_branch_ops_complete_listener_cb listener, void* clientData)
+            : ops(ops)
+            , listener(listener)
+            , clientData(clientData)
+            , startTime(g_get_monotonic_time())
+        {};
+
+        /**
+         * @brief Branch operations to apply, in order.
+         */
+        std::vector<BranchOp> ops;
+
+        /**
+         * @brief client listener to call on completion, may be NULL.
+         */
+        dsl_tee_branch_ops_complete_listener_cb listener;
+
+        /**
+         * @brief opaque pointer to client data for the listener.
+         */
+        void* clientData;
+
+        /**
+         * @brief monotonic time the batch was queued in microseconds.
+         */
+        gint64 startTime;
+    };
+
     /**
      * @class TeeBintr
      * @brief Implements a virtual base Tee binter that can add, link, 
@@ -189,10 +316,50 @@ namespace DSL
         uint GetNumChildren()
         {
             LOG_FUNC();
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_branchesMutex);
             
             return m_pChildBranches.size();
         }
 
+        /**
+         * @brief Applies a batch of Branch operations, blocking until all have
+         * completed. Any batches previously queued are completed first.
+         * @param[in,out] ops Branch operations to apply. The result and time 
+         * of each operation are updated on return.
+         * @return true if all operations were applied, false otherwise.
+         */
+        bool ApplyBranchOps(std::vector<BranchOp>& ops);
+
+        /**
+         * @brief Prepares a batch of Branch operations and queues it for the 
+         * worker thread. The batch is applied inline if this MultiBranchesBintr 
+         * is not linked as there are no pads to block.
+         * @param[in] pBatch shared pointer to the batch to queue.
+         */
+        void QueueBranchOps(DSL_BRANCH_OPS_BATCH_PTR pBatch);
+
+        /**
+         * @brief Blocks the calling thread until all queued batches of 
+         * Branch operations have completed. Queued batches are executed by 
+         * the calling thread, which must hold the Services lock or be the 
+         * main-loop with a Services call waiting on it.
+         */
+        void WaitForBranchOps();
+
+        /**
+         * @brief Executes and completes all queued batches of Branch 
+         * operations, in order, and notifies the client listener of each. 
+         * Called by the worker thread under the Services lock, and by 
+         * WaitForBranchOps.
+         */
+        void ExecuteQueuedBranchOps();
+
+        /**
+         * @brief Handles the queue of Branch operation batches. Called by 
+         * the worker thread only.
+         */
+        void HandleBranchOpsQueue();
+
         /** 
          * @brief links all child Component Bintrs and their elements
          */ 
@@ -242,13 +409,109 @@ namespace DSL
          */
         bool RemoveChild(DSL_BASE_PTR pChildElement);
 
+        /**
+         * @brief Reserves a stream-id for a Branch add or move-to operation.
+         * @param[in,out] op Branch operation to reserve a stream-id for. 
+         * @return true if a stream-id was reserved, false otherwise.
+         */
+        virtual bool _reserveStreamId(BranchOp& op);
+
+        /**
+         * @brief Links the Branches of all prepared add and move-to operations
+         * to the Tee and syncs their states with this MultiBranchesBintr. 
+         * @param[in] ops Branch operations to link.
+         * @param[in] currentState current state of this MultiBranchesBintr.
+         * @param[in] startTime monotonic start time of the batch.
+         */
+        virtual void _attachBranches(std::vector<BranchOp*>& ops, 
+            GstState currentState, gint64 startTime);
+
+        /**
+         * @brief Stops the worker thread once all queued batches have completed.
+         */
+        void _stopBranchOpsWorker();
+
         /**
          * @brief Tee element -- multi-sinks, splitter or demuxer i.e. the
          * actual plugin is specific to the derived child class below.
          */
         DSL_ELEMENT_PTR m_pTee;
         
+        /**
+         * @brief mutex to protect the child-branch collections and stream-ids,
+         * which are updated by the worker thread on batch completion.
+         */
+        DslMutex m_branchesMutex;
+
+    private:
+
+        /**
+         * @brief Validates a batch of Branch operations and updates the 
+         * child-branch collections and stream-ids to their final state. 
+         * All stream-ids are released before any are reserved.
+         * @param[in,out] ops Branch operations to prepare.
+         */
+        void _prepareBranchOps(std::vector<BranchOp>& ops);
+
+        /**
+         * @brief Unlinks and links all prepared Branches, one blocking
+         * window for all Branches to unlink and one for all Branches to link.
+         * @param[in,out] ops Branch operations to execute.
+         * @param[in] startTime monotonic start time of the batch.
+         */
+        void _executeBranchOps(std::vector<BranchOp>& ops, gint64 startTime);
+
+        /**
+         * @brief Unlinks the Branches of all prepared remove and move-to 
+         * operations from the Tee. When playing, all Branches are unlinked
+         * and EOS'd from blocking pad probes that share a single timeout.
+         * @param[in] ops Branch operations to unlink.
+         * @param[in] currentState current state of this MultiBranchesBintr.
+         * @param[in] startTime monotonic start time of the batch.
+         */
+        void _detachBranches(std::vector<BranchOp*>& ops, 
+            GstState currentState, gint64 startTime);
 
+        /**
+         * @brief Removes the Branches of all removed and failed operations
+         * and sets the final time for each operation.
+         * @param[in,out] ops Branch operations to complete.
+         * @param[in] startTime monotonic start time of the batch.
+         */
+        void _completeBranchOps(std::vector<BranchOp>& ops, gint64 startTime);
+
+        /**
+         * @brief worker thread for batches queued with QueueBranchOps, 
+         * started on first use.
+         */
+        GThread* m_pBranchOpsThread;
+
+        /**
+         * @brief mutex to protect the queue of batches and worker state.
+         */
+        DslMutex m_branchOpsQueueMutex;
+
+        /**
+         * @brief condition to signal the worker that a batch was queued,
+         * or that it should stop.
+         */
+        DslCond m_branchOpsQueuedCond;
+
+        /**
+         * @brief queue of batches waiting to be executed.
+         */
+        std::queue<DSL_BRANCH_OPS_BATCH_PTR> m_branchOpsQueue;
+
+        /**
+         * @brief mutex to execute queued batches one caller at a time
+         * so that they're completed in the order they were queued.
+         */
+        DslMutex m_branchOpsExecuteMutex;
+
+        /**
+         * @brief set to true to stop the worker once the queue is empty.
+         */
+        bool m_branchOpsStop;
     };
 
     //-------------------------------------------------------------------------------
@@ -305,6 +568,11 @@ namespace DSL
          */
         DemuxerBintr(const char* name, uint maxBranches);
         
+        /**
+         * @brief dtor for the DemuxerBintr
+         */
+        ~DemuxerBintr();
+
         /**
          * @brief Adds the DemuxerBintr to a Parent Branch/Pipeline Bintr
          * @param[in] pParentBintr Parent Branch/Pipeline to add this Bintr to
@@ -367,16 +635,30 @@ namespace DSL
          */
         bool SetMaxBranches(uint maxBranches);
 
-    private:
+    protected:
 
         /**
-         * @brief Common code to complete the add child ComponentBintr process.
-         * @param[in] pChildComponent shared pointer to ComponentBintr to add
-         * @param[in] stream_id the stream-id and demuxer source pad to link to.
-         * @return true if the ComponentBintr was added correctly, false otherwise
+         * @brief Reserves either the requested or the next available stream-id,
+         * up to max-branches, for a Branch add or move-to operation.
+         * @param[in,out] op Branch operation to reserve a stream-id for. 
+         * @return true if a stream-id was reserved, false otherwise.
          */
-        bool _completeAddChild(DSL_BINTR_PTR pChildComponent, uint streamId);
-    
+        bool _reserveStreamId(BranchOp& op);
+
+        /**
+         * @brief Links the Branches of all prepared add and move-to operations
+         * to their pre-allocated source pads. When playing, all Branches are
+         * synced with this DemuxerBintr from blocking pad probes that share
+         * a single timeout.
+         * @param[in] ops Branch operations to link.
+         * @param[in] currentState current state of this DemuxerBintr.
+         * @param[in] startTime monotonic start time of the batch.
+         */
+        void _attachBranches(std::vector<BranchOp*>& ops, 
+            GstState currentState, gint64 startTime);
+
+    private:
+
         /**
          * @brief maximum number of branches this DemuxerBintr can connect.
          * Specifies the number of source pads to request prior to playing.
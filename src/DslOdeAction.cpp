@@ -30,6 +30,11 @@ THE SOFTWARE.
 #if (BUILD_WITH_FFMPEG == true) || (BUILD_WITH_OPENCV == true)
 #include "DslAvFile.h"
 #endif
+#if !defined(BUILD_WEBRTC)
+    #error "BUILD_WEBRTC must be defined"
+#elif BUILD_WEBRTC == true
+#include "DslSoupServerMgr.h"
+#endif
 
 #define DATE_BUFF_LENGTH 40
 
@@ -46,6 +51,49 @@ namespace DSL
         LOG_FUNC();
     }
     
+    thread_local std::vector<std::shared_ptr<OdeAction>> 
+        OdeAction::t_postProcessFrameActions;
+    
+    void OdeAction::PostProcessFrame(GstBuffer* pBuffer, NvDsFrameMeta* pFrameMeta)
+    {
+        // No function log - avoid overhead.
+        
+        if (t_postProcessFrameActions.empty())
+        {
+            return;
+        }
+        std::vector<std::shared_ptr<OdeAction>> actions;
+        actions.swap(t_postProcessFrameActions);
+        
+        for (auto const& pOdeAction: actions)
+        {
+            try
+            {
+                pOdeAction->postProcessFrame(pBuffer, pFrameMeta);
+            }
+            catch(...)
+            {
+                LOG_ERROR("ODE Action '" << pOdeAction->GetName() 
+                    << "' threw exception post-processing frame");
+            }
+        }
+    }
+    
+    void OdeAction::requestPostProcessFrame()
+    {
+        // No function log - avoid overhead.
+        
+        for (auto const& pOdeAction: t_postProcessFrameActions)
+        {
+            if (pOdeAction.get() == this)
+            {
+                return;
+            }
+        }
+        t_postProcessFrameActions.push_back(
+            std::dynamic_pointer_cast<OdeAction>(shared_from_this()));
+    }
+    
     std::string OdeAction::Ntp2Str(uint64_t ntp)
     {
         time_t secs = round(ntp/1000000000);
@@ -68,7 +116,6 @@ namespace DSL
 
     AsyncOdeAction::AsyncOdeAction(const char* name) 
         : OdeAction(name)
-        , m_timerId(0)
     {
         LOG_FUNC();
     };
@@ -77,15 +124,8 @@ namespace DSL
     {
         LOG_FUNC();
         
-        if (m_timerId)
-        {
-            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
-            
-            LOG_WARN("Removing scheduled asynchronous action on dtor of '"
-                << GetName() << "'");
-                
-            g_source_remove(m_timerId);
-        }
+        // remove all pending requests for this Action, if any.
+        AsyncOdeActionExecutor::GetExecutor()->CancelRequests(this);
     }
 
     void AsyncOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
@@ -96,18 +136,190 @@ namespace DSL
 
         if (m_enabled)
         {
-            // Schedule the do_async_action to add the branch in 
-            // the main-loop context.
-            m_timerId = g_timeout_add(1, do_async_action, this);
+            // Capture the occurrence payload now, while the frame-meta is 
+            // still valid, and queue the request to be executed in the
+            // main-loop context.
+            AsyncOdeOccurrence occurrence{0};
+            
+            occurrence.sourceId = pFrameMeta->source_id;
+            occurrence.frameNum = pFrameMeta->frame_num;
+            occurrence.ntpTimestamp = pFrameMeta->ntp_timestamp;
+            occurrence.coalesceKey = GetCoalesceKey(pFrameMeta);
+            occurrence.queuedTime = g_get_monotonic_time();
+            
+            AsyncOdeActionExecutor::GetExecutor()->QueueRequest(this, 
+                occurrence);
         }
     }
+    
+    void AsyncOdeAction::GetAsyncMetrics(dsl_ode_action_async_metrics* pMetrics)
+    {
+        LOG_FUNC();
+        
+        AsyncOdeActionExecutor::GetExecutor()->GetMetrics(this, pMetrics);
+    }
+    
+    void AsyncOdeAction::ClearAsyncMetrics()
+    {
+        LOG_FUNC();
+        
+        AsyncOdeActionExecutor::GetExecutor()->ClearMetrics(this);
+    }
+
+    // ********************************************************************
 
-    static int do_async_action(gpointer pAction)
+    static gboolean async_ode_action_executor_cb(gpointer pExecutor)
+    {
+        return static_cast<AsyncOdeActionExecutor*>(pExecutor)->
+            ExecuteBatch();
+    }
+
+    AsyncOdeActionExecutor* AsyncOdeActionExecutor::GetExecutor()
+    {
+        // One time, thread-safe, initialization of the single instance. The
+        // first call can come from any streaming thread, concurrently.
+        static AsyncOdeActionExecutor* pInstance = new AsyncOdeActionExecutor();
+        
+        return pInstance;
+    }
+    
+    AsyncOdeActionExecutor::AsyncOdeActionExecutor()
+        : m_idleSourceId(0)
+    {
+        LOG_FUNC();
+    }
+    
+    void AsyncOdeActionExecutor::QueueRequest(AsyncOdeAction* pAction, 
+        const AsyncOdeOccurrence& occurrence)
     {
-        static_cast<AsyncOdeAction*>(pAction)->
-            DoAsyncAction();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_queueMutex);
+        
+        dsl_ode_action_async_metrics& metrics = m_metrics[pAction];
+        metrics.queued++;
+        
+        // If the last pending request is for the same Action with the same 
+        // key, collapse the new request into it. Requests separated by those 
+        // of other Actions are never merged, so the order of execution is 
+        // preserved, e.g. Pause(A), Play(B), Pause(A) executes all three.
+        if (!m_requests.empty() and m_requests.back().pAction == pAction and
+            m_requests.back().occurrence.coalesceKey == occurrence.coalesceKey)
+        {
+            metrics.coalesced++;
+            return;
+        }
+        m_requests.push_back({pAction, pAction->weak_from_this(), occurrence});
+        
+        metrics.pending++;
+        if (metrics.pending > metrics.max_pending)
+        {
+            metrics.max_pending = metrics.pending;
+        }
+        
+        // Wake the main-loop only once per batch.
+        if (!m_idleSourceId)
+        {
+            m_idleSourceId = g_idle_add(async_ode_action_executor_cb, this);
+        }
+    }
+    
+    void AsyncOdeActionExecutor::CancelRequests(AsyncOdeAction* pAction)
+    {
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_queueMutex);
+        
+        auto isAction = [pAction]
+            (const AsyncOdeRequest& request)
+            {
+                return request.pAction == pAction;
+            };
+        
+        if (m_metrics.find(pAction) != m_metrics.end() and
+            m_metrics[pAction].pending)
+        {
+            LOG_WARN("Removing scheduled asynchronous action on dtor of '"
+                << pAction->GetName() << "'");
+        }
+        m_requests.remove_if(isAction);
+        m_batch.remove_if(isAction);
+        m_metrics.erase(pAction);
+    }
+    
+    void AsyncOdeActionExecutor::GetMetrics(AsyncOdeAction* pAction, 
+        dsl_ode_action_async_metrics* pMetrics)
+    {
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_queueMutex);
+
+        *pMetrics = m_metrics[pAction];
+    }
+
+    void AsyncOdeActionExecutor::ClearMetrics(AsyncOdeAction* pAction)
+    {
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_queueMutex);
+
+        dsl_ode_action_async_metrics& metrics = m_metrics[pAction];
+        
+        // the pending count reflects the current state of the queue.
+        uint pending = metrics.pending;
+        metrics = {0};
+        metrics.pending = pending;
+        metrics.max_pending = pending;
+    }
+    
+    bool AsyncOdeActionExecutor::ExecuteBatch()
+    {
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_queueMutex);
+            
+            // Move all pending requests to the current batch. New requests
+            // queued while executing will schedule the next batch.
+            m_batch.splice(m_batch.end(), m_requests);
+            m_idleSourceId = 0;
+        }
+        while (true)
+        {
+            AsyncOdeAction* pAction(NULL);
+            AsyncOdeOccurrence occurrence;
             
-        // on-shot timer always
+            // Shared pointer to keep the Action alive while it executes. If 
+            // the last reference is released meanwhile, the Action is 
+            // destroyed here, on return from DoAsyncAction.
+            DSL_BASE_PTR pActionRef;
+            {
+                LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_queueMutex);
+                
+                if (m_batch.empty())
+                {
+                    break;
+                }
+                pAction = m_batch.front().pAction;
+                occurrence = m_batch.front().occurrence;
+                pActionRef = m_batch.front().pWeakAction.lock();
+                m_batch.pop_front();
+                
+                // The Action is being destroyed, its requests are canceled.
+                if (!pActionRef)
+                {
+                    continue;
+                }
+                
+                dsl_ode_action_async_metrics& metrics = m_metrics[pAction];
+                uint64_t latency = g_get_monotonic_time() - occurrence.queuedTime;
+                
+                if (metrics.pending)
+                {
+                    metrics.pending--;
+                }
+                metrics.executed++;
+                metrics.latency_total += latency;
+                if (latency > metrics.latency_max)
+                {
+                    metrics.latency_max = latency;
+                }
+            }
+            // Execute the Action outside of the queue lock so that new 
+            // requests can be queued from the streaming-thread(s).
+            pAction->DoAsyncAction(occurrence);
+        }
+        // single-shot idle source always
         return false;
     }
 
@@ -456,7 +668,9 @@ namespace DSL
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
         
-        if (!m_enabled)
+        // There is no buffer to pass to the client when replaying recorded 
+        // metadata
+        if (!m_enabled or !pBuffer)
         {
             return;
         }
@@ -482,7 +696,7 @@ namespace DSL
     // ********************************************************************
 
     // Initialize static Event Counter
-    uint64_t CaptureOdeAction::s_captureId = 0;
+    std::atomic<uint64_t> CaptureOdeAction::s_captureId(0);
     
     static int idle_thread_handler(void* client_data)
     {
@@ -499,8 +713,14 @@ namespace DSL
         , m_captureType(captureType)
         , m_outdir(outdir)
         , m_idleThreadFunctionId(0)
+        , m_transformBatches(0)
+        , m_transformedImages(0)
     {
         LOG_FUNC();
+        
+        // Hold up to 4 free surfaces for each capture size.
+        m_pSurfacePool = std::shared_ptr<DslBufferSurfacePool>(
+            new DslBufferSurfacePool(4));
     }
 
     CaptureOdeAction::~CaptureOdeAction()
@@ -625,6 +845,37 @@ namespace DSL
         return true;
     }
 
+    void CaptureOdeAction::SetWebsocketTopic(const char* topic)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+
+        m_websocketTopic.assign(topic);
+    }
+
+    void CaptureOdeAction::GetCaptureMetrics(dsl_ode_action_capture_metrics* pMetrics)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+
+        m_pSurfacePool->GetMetrics(&pMetrics->pooled, &pMetrics->in_use,
+            &pMetrics->acquired, &pMetrics->hits, &pMetrics->allocated,
+            &pMetrics->failed);
+            
+        pMetrics->batches = m_transformBatches;
+        pMetrics->captures = m_transformedImages;
+    }
+
+    void CaptureOdeAction::ClearCaptureMetrics()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+
+        m_pSurfacePool->ClearMetrics();
+        m_transformBatches = 0;
+        m_transformedImages = 0;
+    }
+
     void CaptureOdeAction::RemoveAllChildren()
     {
         LOG_FUNC();
@@ -674,8 +925,95 @@ namespace DSL
         {
             return;
         }
+        // There is no buffer to capture when replaying recorded metadata
+        if (!pBuffer)
+        {
+            return;
+        }
+        CaptureRequest captureRequest{0};
+        
+        captureRequest.sourceId = pFrameMeta->source_id;
+        captureRequest.timeUs = g_get_monotonic_time();
+        
+        requestCapture(pBuffer, pFrameMeta, pObjectMeta, captureRequest);
+    }
 
-        // Map the current buffer
+    void CaptureOdeAction::requestCapture(GstBuffer* pBuffer, 
+        NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta, 
+        CaptureRequest captureRequest)
+    {
+        // No function log - avoid overhead.
+        
+        // Create crop rectangle params ensuring that width and height are divisable 
+        // by 2. This is done to ensure that the plane width and height (which 
+        // are always created as even numbers) will match the buffer width and height.
+        // Frame dimensions are set when captured.
+        if (m_captureType == DSL_CAPTURE_TYPE_OBJECT)
+        {
+            captureRequest.left = GST_ROUND_UP_2(
+                gint(std::round(pObjectMeta->rect_params.left)));
+            captureRequest.top = GST_ROUND_UP_2(
+                gint(std::round(pObjectMeta->rect_params.top)));
+            captureRequest.width = GST_ROUND_DOWN_2(
+                gint(std::round(pObjectMeta->rect_params.width)));
+            captureRequest.height = GST_ROUND_DOWN_2(
+                gint(std::round(pObjectMeta->rect_params.height)));
+                
+            // An empty rectangle would fail the frame's batched transform.
+            if (captureRequest.width <= 0 or captureRequest.height <= 0)
+            {
+                LOG_WARN("Object with dimensions " << captureRequest.width 
+                    << "x" << captureRequest.height 
+                    << " is too small to capture for Action '" << GetName() << "'");
+                return;
+            }
+        }
+        m_captureRequests[std::make_pair(pFrameMeta->source_id, 
+            (uint64_t)pFrameMeta->frame_num)].push_back(captureRequest);
+            
+        requestPostProcessFrame();
+    }
+
+    void CaptureOdeAction::postProcessFrame(GstBuffer* pBuffer, 
+        NvDsFrameMeta* pFrameMeta)
+    {
+        // No function log - avoid overhead.
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        
+        std::pair<uint, uint64_t> key(pFrameMeta->source_id, 
+            (uint64_t)pFrameMeta->frame_num);
+            
+        // Discard the requests of all other frames that were dropped or 
+        // flushed before they could be post-processed.
+        uint64_t expiryTimeUs = g_get_monotonic_time() - 
+            DSL_CAPTURE_REQUEST_EXPIRY_US;
+        for (auto imap = m_captureRequests.begin(); 
+            imap != m_captureRequests.end(); )
+        {
+            if (imap->first != key and 
+                imap->second.front().timeUs < expiryTimeUs)
+            {
+                LOG_WARN("Discarding " << imap->second.size() 
+                    << " expired capture requests for source " 
+                    << imap->first.first << " frame " << imap->first.second 
+                    << " for Action '" << GetName() << "'");
+                imap = m_captureRequests.erase(imap);
+            }
+            else
+            {
+                imap++;
+            }
+        }
+        auto iter = m_captureRequests.find(key);
+        if (iter == m_captureRequests.end())
+        {
+            return;
+        }
+        std::vector<CaptureRequest> captureRequests;
+        captureRequests.swap(iter->second);
+        m_captureRequests.erase(iter);
+        
+        // Map the current buffer once for all captures of the frame
         std::unique_ptr<DslMappedBuffer> pMappedBuffer = 
             std::unique_ptr<DslMappedBuffer>(new DslMappedBuffer(pBuffer));
             
@@ -690,63 +1028,23 @@ namespace DSL
             ? NVBUF_MEM_DEFAULT
             : NVBUF_MEM_CUDA_PINNED;
     
-        // Transforming only one frame in the batch, so create a copy of the single 
-        // surface ... becoming our new source surface. This creates a new mono 
-        // (non-batched) surface copied from the "batched frames" using the batch id 
-        // as the index
+        // Mono (non-batched) view of the frame's surface in the batched buffer,
+        // used as the source for the thumbnails.
         DslMonoSurface monoSurface(pMappedBuffer->pSurface, pFrameMeta->batch_id);
 
-        // Coordinates and dimensions for our destination surface.
-        gint left(0), top(0), width(0), height(0);
-
-        // capturing full frame or object only?
-        if (m_captureType == DSL_CAPTURE_TYPE_FRAME)
+        // The Cuda stream must outlive the transform session that uses it,
+        // so one stream is created for each GPU and kept for the Action's life.
+        std::shared_ptr<DslCudaStream>& pCudaStream = 
+            m_cudaStreams[monoSurface.gpuId];
+        if (!pCudaStream)
         {
-            width = pMappedBuffer->GetWidth(pFrameMeta->batch_id);
-            height = pMappedBuffer->GetHeight(pFrameMeta->batch_id);
-            LOG_INFO("Capturing frame with dimensions " 
-                << width << "x" << height);
+            pCudaStream = std::shared_ptr<DslCudaStream>(
+                new DslCudaStream(monoSurface.gpuId));
         }
-        // Create crop rectangle params ensuring that width and height are divisable 
-        // by 2. This is done to ensure that the plane width and height (which 
-        // are always created as even numbers) will match the buffer width and height.
-        else
-        {
-            left = GST_ROUND_UP_2(
-                gint(std::round(pObjectMeta->rect_params.left)));
-            top = GST_ROUND_UP_2(
-                gint(std::round(pObjectMeta->rect_params.top)));
-            width = GST_ROUND_DOWN_2(
-                gint(std::round(pObjectMeta->rect_params.width)));
-            height = GST_ROUND_DOWN_2(
-                gint(std::round(pObjectMeta->rect_params.height)));
-
-            LOG_INFO("Capturing object " << s_captureId 
-                << " with coordinates " << left << "," << top 
-                << " and dimensions " << width << "x" << height);
-        }
-
-        // New "create params" for our destination surface. we only need one 
-        // surface so set memory allocation (for the array of surfaces) size to 0
-        DslSurfaceCreateParams surfaceCreateParams(monoSurface.gpuId, 
-            width, height, 0, NVBUF_COLOR_FORMAT_RGBA, transformMemType);
-        
-        // New Destination surface with a batch size of 1 for transforming 
-        // the single surface 
-        std::shared_ptr<DslBufferSurface> pBufferSurface = 
-            std::shared_ptr<DslBufferSurface>(
-                new DslBufferSurface(1, surfaceCreateParams, s_captureId++));
-
-        // New "transform params" for the surface transform, croping or 
-        // (future?) scaling
-        DslTransformParams transformParams(left, top, width, height);
         
-        // New "Cuda stream" for the surface transform
-        DslCudaStream dslCudaStream(monoSurface.gpuId);
-        
-        // New "Transform Session" config params using the new Cuda stream
+        // New "Transform Session" config params using the persistent Cuda stream
         DslSurfaceTransformSessionParams dslTransformSessionParams(
-            monoSurface.gpuId, dslCudaStream);
+            monoSurface.gpuId, *pCudaStream);
         
         // Set the "Transform Params" for the current tranform session
         if (!dslTransformSessionParams.Set())
@@ -757,26 +1055,157 @@ namespace DSL
             return;
         }
         
-        // We can now transform our Mono Source surface to the first (and only) 
-        // surface in the batched buffer.
-        if (!pBufferSurface->TransformMonoSurface(monoSurface, 0, transformParams))
+        // Crop all requested images from the frame with a single transform,
+        // each to a pooled - already mapped - destination surface.
+        DslBatchedCropTransform batchedCropTransform(pMappedBuffer->pSurface, 
+            pFrameMeta->batch_id);
+        std::vector<std::shared_ptr<DslBufferSurface>> bufferSurfaces;
+        
+        // Index into captureRequests for each acquired surface, as the 
+        // requests that fail to acquire a surface are skipped.
+        std::vector<uint> requestIndexes;
+
+        for (uint i = 0; i < captureRequests.size(); i++)
+        {
+            CaptureRequest& captureRequest = captureRequests[i];
+            
+            if (m_captureType == DSL_CAPTURE_TYPE_FRAME)
+            {
+                captureRequest.width = monoSurface.width;
+                captureRequest.height = monoSurface.height;
+            }
+            std::shared_ptr<DslBufferSurface> pBufferSurface = 
+                m_pSurfacePool->Acquire(monoSurface.gpuId, captureRequest.width, 
+                    captureRequest.height, transformMemType, s_captureId++);
+            if (!pBufferSurface)
+            {
+                // Counted as failed by the Surface Pool. The remaining 
+                // requests for the frame are still captured.
+                LOG_ERROR("Destination surface failed to allocate for Action '" 
+                    << GetName() << "'");
+                continue;
+            }
+            if (m_captureType == DSL_CAPTURE_TYPE_FRAME)
+            {
+                LOG_INFO("Capturing frame with dimensions " 
+                    << captureRequest.width << "x" << captureRequest.height);
+            }
+            else
+            {
+                LOG_INFO("Capturing object " << pBufferSurface->GetUniqueId() 
+                    << " with coordinates " << captureRequest.left << "," 
+                    << captureRequest.top << " and dimensions " 
+                    << captureRequest.width << "x" << captureRequest.height);
+            }
+            batchedCropTransform.Add(pBufferSurface, captureRequest.left,
+                captureRequest.top, captureRequest.width, captureRequest.height);
+            bufferSurfaces.push_back(pBufferSurface);
+            requestIndexes.push_back(i);
+        }
+        if (bufferSurfaces.empty())
         {
-            LOG_ERROR("Destination surface failed to transform for Action '" 
-                << GetName() << "'");
             return;
         }
-
-        // Map the tranformed surface for read
-        if (!pBufferSurface->Map())
+        if (!batchedCropTransform.Transform())
         {
-            LOG_ERROR("Destination surface failed to map for Action '" 
+            LOG_ERROR("Destination surfaces failed to transform for Action '" 
                 << GetName() << "'");
             return;
         }
+        m_transformBatches++;
+        m_transformedImages += bufferSurfaces.size();
+        
+        for (uint i = 0; i < bufferSurfaces.size(); i++)
+        {
+            const CaptureRequest& captureRequest = 
+                captureRequests[requestIndexes[i]];
+                
+            // Pooled surfaces are mapped once, so they must be synchronized
+            // for CPU access after each transform on integrated GPUs.
+            if (m_cudaDeviceProp.integrated and !bufferSurfaces[i]->SyncForCpu())
+            {
+                LOG_ERROR("Destination surface failed to sync for Action '" 
+                    << GetName() << "'");
+                continue;
+            }
+            // Downscale while the source surface is still mapped, if publishing.
+            if (m_websocketTopic.size())
+            {
+                createThumbnailSurfaces(monoSurface, captureRequest.left, 
+                    captureRequest.top, captureRequest.width, 
+                    captureRequest.height, transformMemType, 
+                    bufferSurfaces[i]->GetUniqueId());
+            }
+            handleCapturedImage(captureRequest, bufferSurfaces[i]);
+        }
+    }
 
+    void CaptureOdeAction::handleCapturedImage(
+        const CaptureRequest& captureRequest,
+        std::shared_ptr<DslBufferSurface> pBufferSurface)
+    {
+        // No function log - avoid overhead.
+        
         queueCapturedImage(pBufferSurface);
     }
 
+    void CaptureOdeAction::createThumbnailSurfaces(DslMonoSurface& monoSurface, 
+        gint left, gint top, gint width, gint height,
+        NvBufSurfaceMemType transformMemType, uint64_t captureId)
+    {
+#if BUILD_WEBRTC == true
+        std::vector<std::shared_ptr<DslBufferSurface>> thumbnailSurfaces;
+
+        // One surface for each distinct width requested by the subscribers.
+        for (auto const& requestedWidth: 
+            SoupServerMgr::GetMgr()->GetThumbnailWidths(m_websocketTopic.c_str()))
+        {
+            // Full size image is published as is - no upscaling
+            if (!requestedWidth or requestedWidth >= (uint)width)
+            {
+                continue;
+            }
+            gint thumbnailWidth(requestedWidth);
+            gint thumbnailHeight = std::max(2, 
+                GST_ROUND_DOWN_2(gint(height*thumbnailWidth/width)));
+
+            DslSurfaceCreateParams surfaceCreateParams(monoSurface.gpuId, 
+                thumbnailWidth, thumbnailHeight, 0, NVBUF_COLOR_FORMAT_RGBA, 
+                transformMemType);
+
+            std::shared_ptr<DslBufferSurface> pThumbnailSurface = 
+                std::shared_ptr<DslBufferSurface>(
+                    new DslBufferSurface(1, surfaceCreateParams, captureId));
+
+            // Scale the capture rectangle down to the thumbnail dimensions
+            DslTransformParams transformParams(left, top, width, height,
+                thumbnailWidth, thumbnailHeight);
+
+            if (!pThumbnailSurface->TransformMonoSurface(monoSurface, 
+                0, transformParams) or !pThumbnailSurface->Map())
+            {
+                LOG_ERROR("Thumbnail surface failed to transform for Action '" 
+                    << GetName() << "'");
+                continue;
+            }
+            thumbnailSurfaces.push_back(pThumbnailSurface);
+        }
+        if (thumbnailSurfaces.size())
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_captureQueueMutex);
+            m_thumbnailSurfaces[captureId] = thumbnailSurfaces;
+        }
+#endif
+    }
+
+    void CaptureOdeAction::discardThumbnailSurfaces(uint64_t captureId)
+    {
+        // No function log - avoid overhead.
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_captureQueueMutex);
+        
+        m_thumbnailSurfaces.erase(captureId);
+    }
+
     void CaptureOdeAction::queueCapturedImage(
         std::shared_ptr<DslBufferSurface> pBufferSurface)
     {
@@ -792,6 +1221,26 @@ namespace DSL
         }
     }
 
+    bool CaptureOdeAction::QueueRetainedImage(
+        std::shared_ptr<DslBufferSurface> pBufferSurface)
+    {
+        LOG_FUNC();
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+            
+            if (!m_enabled)
+            {
+                LOG_ERROR("ODE Capture Action '" << GetName() 
+                    << "' is disabled, unable to queue retained image");
+                return false;
+            }
+        }
+        pBufferSurface->SetUniqueId(s_captureId++);
+        queueCapturedImage(pBufferSurface);
+        
+        return true;
+    }
+
     int CaptureOdeAction::convertCapturedImage()
     {
         LOG_FUNC();
@@ -844,6 +1293,8 @@ namespace DSL
         }
         LOG_INFO("Saved JPEG Image with id = " << pBufferSurface->GetUniqueId());
 
+        publishCapturedImage(filespec, pBufferSurface);
+
         // Create scope to lock the child-container mutex
         {
             LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_childContainerMutex);
@@ -953,6 +1404,364 @@ namespace DSL
         return FALSE;
     }
 
+    void CaptureOdeAction::publishCapturedImage(const std::string& filespec,
+        std::shared_ptr<DslBufferSurface> pBufferSurface)
+    {
+        LOG_FUNC();
+
+        uint64_t captureId(pBufferSurface->GetUniqueId());
+
+        // Always claim the thumbnails, even if no longer publishing.
+        std::vector<std::shared_ptr<DslBufferSurface>> thumbnailSurfaces;
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_captureQueueMutex);
+
+            auto iter = m_thumbnailSurfaces.find(captureId);
+            if (iter != m_thumbnailSurfaces.end())
+            {
+                thumbnailSurfaces = iter->second;
+                m_thumbnailSurfaces.erase(iter);
+            }
+        }
+        std::string topic;
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+            topic = m_websocketTopic;
+        }
+        if (topic.empty())
+        {
+            return;
+        }
+#if (BUILD_WEBRTC == true) && \
+    ((BUILD_WITH_FFMPEG == true) || (BUILD_WITH_OPENCV == true))
+        // Publishes a single JPEG file, sent as a JSON text frame 
+        // followed by a binary frame with the image.
+        auto publishJpgFile = [&](const std::string& jpgFilespec,
+            std::shared_ptr<DslBufferSurface> pSurface, bool fullSize)
+        {
+            gchar* contents(NULL);
+            gsize size(0);
+            if (!g_file_get_contents(jpgFilespec.c_str(), &contents, &size, NULL))
+            {
+                LOG_ERROR("ODE Capture Action '" << GetName() 
+                    << "' failed to read JPEG file '" << jpgFilespec << "'");
+                return;
+            }
+            uint width((&(*pSurface))->surfaceList[0].width);
+            uint height((&(*pSurface))->surfaceList[0].height);
+
+            std::ostringstream data;
+            data << "{\"capture_id\":" << captureId
+                << ",\"width\":" << width << ",\"height\":" << height 
+                << ",\"thumbnail\":" << (fullSize ? "false" : "true")
+                << ",\"size\":" << size << "}";
+
+            SoupServerMgr::GetMgr()->PublishImage(topic.c_str(), 
+                data.str().c_str(), contents, size, width, fullSize);
+            g_free(contents);
+        };
+
+        publishJpgFile(filespec, pBufferSurface, true);
+
+        // Thumbnails are encoded to temporary files, removed once published
+        for (auto const& pThumbnailSurface: thumbnailSurfaces)
+        {
+            std::ostringstream thumbnailSpec;
+            thumbnailSpec << g_get_tmp_dir() << "/" << GetName() << "_" 
+                << std::setw(5) << std::setfill('0') << captureId << "_w"
+                << (&(*pThumbnailSurface))->surfaceList[0].width << ".jpeg";
+            try
+            {
+                AvJpgOutputFile avJpgOutFile(pThumbnailSurface, 
+                    thumbnailSpec.str().c_str());
+            }
+            catch(...)
+            {
+                LOG_ERROR("ODE Capture Action '" << GetName() 
+                    << "' failed to encode thumbnail for image " << captureId);
+                continue;
+            }
+            publishJpgFile(thumbnailSpec.str(), pThumbnailSurface, false);
+            std::remove(thumbnailSpec.str().c_str());
+        }
+#endif
+    }
+
+    // ********************************************************************
+
+    static int best_shot_timer_handler(gpointer pAction)
+    {
+        return static_cast<CaptureObjectOdeAction*>(pAction)->
+            HandleBestShotTimer();
+    }
+
+    CaptureObjectOdeAction::CaptureObjectOdeAction(const char* name, 
+        const char* outdir)
+        : CaptureOdeAction(name, DSL_CAPTURE_TYPE_OBJECT, outdir)
+        , m_bestShotEnabled(false)
+        , m_bestShotTimeout(0)
+        , m_bestShotMaxHold(0)
+        , m_bestShotSharpness(false)
+        , m_bestShotTimerId(0)
+    {
+        LOG_FUNC();
+    }
+
+    CaptureObjectOdeAction::~CaptureObjectOdeAction()
+    {
+        LOG_FUNC();
+        
+        if (m_bestShotTimerId)
+        {
+            g_source_remove(m_bestShotTimerId);
+        }
+    }
+
+    void CaptureObjectOdeAction::HandleOccurrence(GstBuffer* pBuffer, 
+        NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
+    {
+        bool bestShotEnabled(false);
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+            bestShotEnabled = m_bestShotEnabled;
+        }
+        // Objects without a tracking id can't be followed over frames,
+        // so they're captured on every occurrence.
+        if (!bestShotEnabled or !pObjectMeta or 
+            pObjectMeta->object_id == UNTRACKED_OBJECT_ID)
+        {
+            CaptureOdeAction::HandleOccurrence(pBuffer, pFrameMeta, pObjectMeta);
+            return;
+        }
+
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        
+        if (!m_enabled or !pBuffer)
+        {
+            return;
+        }
+        std::pair<uint, uint64_t> trackKey(pFrameMeta->source_id, 
+            pObjectMeta->object_id);
+        uint64_t currentTimeUs = g_get_monotonic_time();
+        
+        // Score on confidence and bbox area first - both free to calculate.
+        double confidence = (pObjectMeta->confidence > 0)
+            ? pObjectMeta->confidence
+            : pObjectMeta->tracker_confidence;
+        double areaScore = std::max(confidence, 0.01) * 
+            pObjectMeta->rect_params.width * pObjectMeta->rect_params.height;
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_bestShotMutex);
+            
+            auto iter = m_bestShots.find(trackKey);
+            if (iter != m_bestShots.end())
+            {
+                iter->second.lastSeenUs = currentTimeUs;
+                
+                // Nothing to do if the best-shot has already been written, 
+                // or if the candidate can't improve on the current best-shot.
+                if (!iter->second.pBufferSurface or 
+                    areaScore <= iter->second.areaScore)
+                {
+                    return;
+                }
+            }
+        }
+        
+        // Only the candidates that out-score the current best-shot are 
+        // captured, with all other images requested for the frame.
+        CaptureRequest captureRequest{0};
+        
+        captureRequest.bestShot = true;
+        captureRequest.sourceId = pFrameMeta->source_id;
+        captureRequest.objectId = pObjectMeta->object_id;
+        captureRequest.areaScore = areaScore;
+        captureRequest.timeUs = currentTimeUs;
+        
+        requestCapture(pBuffer, pFrameMeta, pObjectMeta, captureRequest);
+    }
+
+    void CaptureObjectOdeAction::handleCapturedImage(
+        const CaptureRequest& captureRequest,
+        std::shared_ptr<DslBufferSurface> pBufferSurface)
+    {
+        // No function log - avoid overhead.
+        
+        if (!captureRequest.bestShot)
+        {
+            CaptureOdeAction::handleCapturedImage(captureRequest, pBufferSurface);
+            return;
+        }
+        double score = (m_bestShotSharpness)
+            ? captureRequest.areaScore * calculateSharpness(pBufferSurface)
+            : captureRequest.areaScore;
+
+        std::pair<uint, uint64_t> trackKey(captureRequest.sourceId, 
+            captureRequest.objectId);
+        uint64_t discardId(pBufferSurface->GetUniqueId());
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_bestShotMutex);
+            
+            auto iter = m_bestShots.find(trackKey);
+            if (iter == m_bestShots.end())
+            {
+                m_bestShots[trackKey] = {pBufferSurface, captureRequest.areaScore, 
+                    score, captureRequest.timeUs, captureRequest.timeUs};
+                return;
+            }
+            if (iter->second.pBufferSurface and score > iter->second.score)
+            {
+                discardId = iter->second.pBufferSurface->GetUniqueId();
+                iter->second.pBufferSurface = pBufferSurface;
+                iter->second.areaScore = captureRequest.areaScore;
+                iter->second.score = score;
+            }
+        }
+        discardThumbnailSurfaces(discardId);
+    }
+
+    void CaptureObjectOdeAction::GetBestShotSettings(bool* enabled, 
+        uint* timeout, uint* maxHold, bool* sharpness)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        
+        *enabled = m_bestShotEnabled;
+        *timeout = m_bestShotTimeout;
+        *maxHold = m_bestShotMaxHold;
+        *sharpness = m_bestShotSharpness;
+    }
+
+    void CaptureObjectOdeAction::SetBestShotSettings(bool enabled, 
+        uint timeout, uint maxHold, bool sharpness)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        
+        if (m_bestShotTimerId)
+        {
+            g_source_remove(m_bestShotTimerId);
+            m_bestShotTimerId = 0;
+        }
+        // Write out all held best-shots when disabling.
+        if (m_bestShotEnabled and !enabled)
+        {
+            HandleBestShotTimer(true);
+        }
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_bestShotMutex);
+            
+            m_bestShotEnabled = enabled;
+            m_bestShotTimeout = timeout;
+            m_bestShotMaxHold = maxHold;
+            m_bestShotSharpness = sharpness;
+        }
+        if (m_bestShotEnabled)
+        {
+            uint interval = (m_bestShotMaxHold)
+                ? std::min(m_bestShotTimeout, m_bestShotMaxHold)
+                : m_bestShotTimeout;
+                
+            m_bestShotTimerId = g_timeout_add(std::max(10U, interval/4), 
+                best_shot_timer_handler, this);
+        }
+    }
+
+    uint CaptureObjectOdeAction::GetBestShotCount()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_bestShotMutex);
+        
+        return m_bestShots.size();
+    }
+
+    int CaptureObjectOdeAction::HandleBestShotTimer(bool flushAll)
+    {
+        // No function log - avoid overhead.
+        
+        std::vector<std::shared_ptr<DslBufferSurface>> bestShots;
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_bestShotMutex);
+            
+            uint64_t currentTimeUs = g_get_monotonic_time();
+
+            auto iter = m_bestShots.begin();
+            while (iter != m_bestShots.end())
+            {
+                // The track has ended - or stopped triggering - so write its 
+                // best-shot if not already written, and forget the track.
+                if (flushAll or (currentTimeUs - iter->second.lastSeenUs >= 
+                    uint64_t(m_bestShotTimeout)*1000))
+                {
+                    if (iter->second.pBufferSurface)
+                    {
+                        bestShots.push_back(iter->second.pBufferSurface);
+                    }
+                    iter = m_bestShots.erase(iter);
+                    continue;
+                }
+                // Held for the maximum time, write the best-shot now and 
+                // ignore all further occurrences for the track.
+                if (m_bestShotMaxHold and iter->second.pBufferSurface and
+                    (currentTimeUs - iter->second.firstSeenUs >= 
+                        uint64_t(m_bestShotMaxHold)*1000))
+                {
+                    bestShots.push_back(iter->second.pBufferSurface);
+                    iter->second.pBufferSurface = nullptr;
+                }
+                iter++;
+            }
+        }
+        for (auto const& pBufferSurface: bestShots)
+        {
+            queueCapturedImage(pBufferSurface);
+        }
+        return TRUE;
+    }
+
+    double CaptureObjectOdeAction::calculateSharpness(
+        std::shared_ptr<DslBufferSurface> pBufferSurface)
+    {
+        // No function log - avoid overhead.
+        
+        NvBufSurfaceParams& surfaceParams = (&(*pBufferSurface))->surfaceList[0];
+        
+        const uint8_t* pData = (const uint8_t*)surfaceParams.mappedAddr.addr[0];
+        uint pitch(surfaceParams.pitch);
+        uint width(surfaceParams.width), height(surfaceParams.height);
+        
+        if (!pData or width < 3 or height < 3)
+        {
+            return 0;
+        }
+        
+        // Sample a grid of at most 64x64 pixels, using the green channel of 
+        // the RGBA image as an approximation of the luma.
+        uint stepX = std::max(1U, (width-2)/64);
+        uint stepY = std::max(1U, (height-2)/64);
+        
+        double sum(0), sumOfSquares(0);
+        uint count(0);
+        
+        for (uint y = 1; y < height-1; y += stepY)
+        {
+            const uint8_t* pRow = pData + y*pitch;
+            for (uint x = 1; x < width-1; x += stepX)
+            {
+                double laplacian = 4.0*pRow[x*4+1] - 
+                    pRow[(x-1)*4+1] - pRow[(x+1)*4+1] - 
+                    (pRow-pitch)[x*4+1] - (pRow+pitch)[x*4+1];
+                    
+                sum += laplacian;
+                sumOfSquares += laplacian*laplacian;
+                count++;
+            }
+        }
+        double mean = sum/count;
+        
+        return sumOfSquares/count - mean*mean;
+    }
+
     // ********************************************************************
 
     DisableHandlerOdeAction::DisableHandlerOdeAction(const char* name, 
@@ -2180,9 +2989,13 @@ namespace DSL
                     << GetName() << "'");
                 return;
             }
+            // The batch's user-meta pool may be shared with concurrent 
+            // frame workers
+            nvds_acquire_meta_lock(pBatchMeta);
             NvDsUserMeta *pUserMeta = nvds_acquire_user_meta_from_pool(pBatchMeta);
             if (!pUserMeta) 
             { 
+                nvds_release_meta_lock(pBatchMeta);
                 LOG_ERROR("Error occurred acquiring user meta for ODE Action '" 
                     << GetName() << "'");
                 return;
@@ -2194,6 +3007,7 @@ namespace DSL
             pUserMeta->base_meta.release_func = 
                 (NvDsMetaReleaseFunc)message_action_meta_free;
             nvds_add_user_meta_to_frame(pFrameMeta, pUserMeta);
+            nvds_release_meta_lock(pBatchMeta);
         }
     }
     
@@ -2675,7 +3489,11 @@ namespace DSL
 
         if (m_enabled)
         {
+            // The batch's object pool may be shared with concurrent frame workers
+            NvDsBatchMeta* pBatchMeta = pFrameMeta->base_meta.batch_meta;
+            nvds_acquire_meta_lock(pBatchMeta);
             nvds_remove_obj_meta_from_frame(pFrameMeta, pObjectMeta);
+            nvds_release_meta_lock(pBatchMeta);
             pObjectMeta = nullptr;
         }
     }
@@ -2695,15 +3513,13 @@ namespace DSL
         LOG_FUNC();
     }
     
-    void PipelinePauseOdeAction::DoAsyncAction()
+    void PipelinePauseOdeAction::DoAsyncAction(
+        const AsyncOdeOccurrence& occurrence)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
             
         // Ignore the return value, errors will be logged 
         Services::GetServices()->PipelinePause(m_pipeline.c_str());
-
-        // reset the timer resource id.
-        m_timerId = 0;
     }
 
     // ********************************************************************
@@ -2721,15 +3537,13 @@ namespace DSL
         LOG_FUNC();
     }
     
-    void PipelinePlayOdeAction::DoAsyncAction()
+    void PipelinePlayOdeAction::DoAsyncAction(
+        const AsyncOdeOccurrence& occurrence)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
             
         // Ignore the return value, errors will be logged 
         Services::GetServices()->PipelinePlay(m_pipeline.c_str());
-
-        // reset the timer resource id.
-        m_timerId = 0;
     }
 
     // ********************************************************************
@@ -2747,15 +3561,13 @@ namespace DSL
         LOG_FUNC();
     }
     
-    void PipelineStopOdeAction::DoAsyncAction()
+    void PipelineStopOdeAction::DoAsyncAction(
+        const AsyncOdeOccurrence& occurrence)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
             
         // Ignore the return value, errors will be logged 
         Services::GetServices()->PipelineStop(m_pipeline.c_str());
-
-        // reset the timer resource id.
-        m_timerId = 0;
     }
 
     // ********************************************************************
@@ -2773,15 +3585,13 @@ namespace DSL
         LOG_FUNC();
     }
     
-    void PlayerPauseOdeAction::DoAsyncAction()
+    void PlayerPauseOdeAction::DoAsyncAction(
+        const AsyncOdeOccurrence& occurrence)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
             
         // Ignore the return value, errors will be logged 
         Services::GetServices()->PlayerPause(m_player.c_str());
-
-        // reset the timer resource id.
-        m_timerId = 0;
     }
 
     // ********************************************************************
@@ -2799,15 +3609,13 @@ namespace DSL
         LOG_FUNC();
     }
     
-    void PlayerPlayOdeAction::DoAsyncAction()
+    void PlayerPlayOdeAction::DoAsyncAction(
+        const AsyncOdeOccurrence& occurrence)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
             
         // Ignore the return value, errors will be logged 
         Services::GetServices()->PlayerPlay(m_player.c_str());
-
-        // reset the timer resource id.
-        m_timerId = 0;
     }
 
     // ********************************************************************
@@ -2825,15 +3633,13 @@ namespace DSL
         LOG_FUNC();
     }
     
-    void PlayerStopOdeAction::DoAsyncAction()
+    void PlayerStopOdeAction::DoAsyncAction(
+        const AsyncOdeOccurrence& occurrence)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
             
         // Ignore the return value, errors will be logged 
         Services::GetServices()->PlayerStop(m_player.c_str());
-
-        // reset the timer resource id.
-        m_timerId = 0;
     }
 
     // ********************************************************************
@@ -3057,16 +3863,14 @@ namespace DSL
         LOG_FUNC();
     }
     
-    void AddSinkOdeAction::DoAsyncAction()
+    void AddSinkOdeAction::DoAsyncAction(
+        const AsyncOdeOccurrence& occurrence)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
             
         // Ignore the return value, errors will be logged 
         Services::GetServices()->PipelineComponentAdd(m_pipeline.c_str(), 
             m_sink.c_str());
-
-        // reset the timer resource id.
-        m_timerId = 0;
     }
 
     // ********************************************************************
@@ -3085,16 +3889,14 @@ namespace DSL
         LOG_FUNC();
     }
     
-    void RemoveSinkOdeAction::DoAsyncAction()
+    void RemoveSinkOdeAction::DoAsyncAction(
+        const AsyncOdeOccurrence& occurrence)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
             
         // Ignore the return value, errors will be logged 
         Services::GetServices()->PipelineComponentRemove(m_pipeline.c_str(), 
             m_sink.c_str());
-
-        // reset the timer resource id.
-        m_timerId = 0;
     }
 
     // ********************************************************************
@@ -3113,16 +3915,14 @@ namespace DSL
         LOG_FUNC();
     }
     
-    void AddSourceOdeAction::DoAsyncAction()
+    void AddSourceOdeAction::DoAsyncAction(
+        const AsyncOdeOccurrence& occurrence)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
             
         // Ignore the return value, errors will be logged 
         Services::GetServices()->PipelineComponentAdd(m_pipeline.c_str(), 
             m_source.c_str());
-
-        // reset the timer resource id.
-        m_timerId = 0;
     }
 
     // ********************************************************************
@@ -3141,16 +3941,14 @@ namespace DSL
         LOG_FUNC();
     }
     
-    void RemoveSourceOdeAction::DoAsyncAction()
+    void RemoveSourceOdeAction::DoAsyncAction(
+        const AsyncOdeOccurrence& occurrence)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
             
         // Ignore the return value, errors will be logged 
         Services::GetServices()->PipelineComponentRemove(m_pipeline.c_str(), 
             m_source.c_str());
-
-        // reset the timer resource id.
-        m_timerId = 0;
     }
 
     // ********************************************************************
@@ -3524,16 +4322,14 @@ namespace DSL
         LOG_FUNC();
     }
     
-    void AddBranchOdeAction::DoAsyncAction()
+    void AddBranchOdeAction::DoAsyncAction(
+        const AsyncOdeOccurrence& occurrence)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
             
         // Ignore the return value, errors will be logged 
         Services::GetServices()->TeeBranchAdd(m_tee.c_str(), 
             m_branch.c_str());
-
-        // reset the timer resource id.
-        m_timerId = 0;
     }
 
     // ********************************************************************
@@ -3543,7 +4339,6 @@ namespace DSL
         : AsyncOdeAction(name)
         , m_demuxer(demuxer)
         , m_branch(branch)
-        , m_destStreamId(-1)
     {
         LOG_FUNC();
     }
@@ -3553,37 +4348,22 @@ namespace DSL
         LOG_FUNC();
     }
     
-    void AddBranchToOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
-        NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
+    uint64_t AddBranchToOdeAction::GetCoalesceKey(NvDsFrameMeta* pFrameMeta)
     {
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
-
-        if (m_enabled)
-        {
-            // Get the stream-id from the frame source-id which has the 
-            // unique Pipeline-id or'ed in by the Streammuxer
-            m_destStreamId = pFrameMeta->source_id &
-                DSL_PIPELINE_SOURCE_STREAM_ID_MASK;
-            
-            // Schedule the do_async_action to remove the branch in 
-            // the main-loop context.
-            m_timerId = g_timeout_add(1, do_async_action, this);
-        }
+        // Get the stream-id from the frame source-id which has the 
+        // unique Pipeline-id or'ed in by the Streammuxer
+        return pFrameMeta->source_id & DSL_PIPELINE_SOURCE_STREAM_ID_MASK;
     }
 
-    void AddBranchToOdeAction::DoAsyncAction()
+    void AddBranchToOdeAction::DoAsyncAction(
+        const AsyncOdeOccurrence& occurrence)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
             
         // Ignore the return value, errors will be logged 
         Services::GetServices()->TeeDemuxerBranchAddTo(m_demuxer.c_str(), 
-            m_branch.c_str(), m_destStreamId);
-
-        // reset the timer resource id.
-        m_timerId = 0;
-        
-        m_destStreamId = -1;
+            m_branch.c_str(), 
+            occurrence.sourceId & DSL_PIPELINE_SOURCE_STREAM_ID_MASK);
     }
 
     // ********************************************************************
@@ -3593,7 +4373,6 @@ namespace DSL
         : AsyncOdeAction(name)
         , m_demuxer(demuxer)
         , m_branch(branch)
-        , m_destStreamId(-1)
     {
         LOG_FUNC();
     }
@@ -3603,37 +4382,22 @@ namespace DSL
         LOG_FUNC();
     }
     
-    void MoveBranchToOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
-        NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
+    uint64_t MoveBranchToOdeAction::GetCoalesceKey(NvDsFrameMeta* pFrameMeta)
     {
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
-
-        if (m_enabled)
-        {
-            // Get the stream-id from the frame source-id which has the 
-            // unique Pipeline-id or'ed in by the Streammuxer
-            m_destStreamId = pFrameMeta->source_id &
-                DSL_PIPELINE_SOURCE_STREAM_ID_MASK;
-
-            // Schedule the do_async_action to remove the branch in 
-            // the main-loop context.
-            m_timerId = g_timeout_add(1, do_async_action, this);
-        }
+        // Get the stream-id from the frame source-id which has the 
+        // unique Pipeline-id or'ed in by the Streammuxer
+        return pFrameMeta->source_id & DSL_PIPELINE_SOURCE_STREAM_ID_MASK;
     }
-    
-    void MoveBranchToOdeAction::DoAsyncAction()
+
+    void MoveBranchToOdeAction::DoAsyncAction(
+        const AsyncOdeOccurrence& occurrence)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
             
         // Ignore the return value, errors will be logged 
         Services::GetServices()->TeeDemuxerBranchMoveTo(m_demuxer.c_str(), 
-            m_branch.c_str(), m_destStreamId);
-
-        // reset the timer resource id.
-        m_timerId = 0;
-        
-        m_destStreamId = -1;
+            m_branch.c_str(), 
+            occurrence.sourceId & DSL_PIPELINE_SOURCE_STREAM_ID_MASK);
     }
     
     // ********************************************************************
@@ -3652,16 +4416,14 @@ namespace DSL
         LOG_FUNC();
     }
     
-    void RemoveBranchOdeAction::DoAsyncAction()
+    void RemoveBranchOdeAction::DoAsyncAction(
+        const AsyncOdeOccurrence& occurrence)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
             
         // Ignore the return value, errors will be logged 
         Services::GetServices()->TeeBranchRemove(m_tee.c_str(), 
             m_branch.c_str());
-
-        // reset the timer resource id.
-        m_timerId = 0;
     }
 
 }
\ No newline at end of file
@@ -53,11 +53,19 @@ namespace DSL
     #define DSL_FRAME_INFO_OCCURRENCES_DIRECTION_IN     2
     #define DSL_FRAME_INFO_OCCURRENCES_DIRECTION_OUT    3
     
+    /**
+     * @brief Time in microseconds after which a capture request, whose frame
+     * was never post-processed - dropped or flushed - is discarded.
+     */
+    #define DSL_CAPTURE_REQUEST_EXPIRY_US               1000000
+    
     /**
      * @brief convenience macros for shared pointer abstraction
      */
     #define DSL_ODE_ACTION_PTR std::shared_ptr<OdeAction>
 
+    #define DSL_ODE_ACTION_ASYNC_PTR std::shared_ptr<AsyncOdeAction>
+
     #define DSL_ODE_ACTION_CUSTOM_PTR std::shared_ptr<CustomOdeAction>
     #define DSL_ODE_ACTION_CUSTOM_NEW(name, clientHandler, clientData) \
         std::shared_ptr<CustomOdeAction>(new CustomOdeAction(name, \
@@ -329,14 +337,91 @@ namespace DSL
             GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta) = 0;
         
+        /**
+         * @brief Determines if the Action can be invoked concurrently by ODE 
+         * Triggers evaluating the frames of different sources in parallel.
+         * Actions that only update their own state and the frame's metadata
+         * are safe. Actions that update other ODE components, or call client
+         * functions, must be serialized.
+         * @return true if the Action is parallel safe, false otherwise.
+         */
+        virtual bool IsParallelSafe(){return true;};
+        
+        /**
+         * @brief Post-processes the frame for all Actions that requested it,
+         * with requestPostProcessFrame, while handling the frame's occurrences 
+         * in the calling thread. Called once all of the frame's occurrences 
+         * have been handled, while the buffer is still valid.
+         * @param[in] pBuffer pointer to the batched stream buffer for the frame.
+         * @param[in] pFrameMeta pointer to the Frame Meta data for the frame.
+         */
+        static void PostProcessFrame(GstBuffer* pBuffer, NvDsFrameMeta* pFrameMeta);
+        
     protected:
 
         std::string Ntp2Str(uint64_t ntp);
 
+        /**
+         * @brief Requests a call to postProcessFrame once all occurrences 
+         * for the current frame have been handled in the calling thread.
+         */
+        void requestPostProcessFrame();
+        
+        /**
+         * @brief Post-processes the current frame, if requested, once all of 
+         * the frame's occurrences have been handled.
+         * @param[in] pBuffer pointer to the batched stream buffer for the frame.
+         * @param[in] pFrameMeta pointer to the Frame Meta data for the frame.
+         */
+        virtual void postProcessFrame(GstBuffer* pBuffer, 
+            NvDsFrameMeta* pFrameMeta){};
+
+    private:
+    
+        /**
+         * @brief Actions that requested post-processing of the frame currently
+         * being handled by the calling thread.
+         */
+        static thread_local std::vector<std::shared_ptr<OdeAction>> 
+            t_postProcessFrameActions;
     };
 
     // ********************************************************************
     
+    /**
+     * @struct AsyncOdeOccurrence
+     * @brief Occurrence payload captured in the streaming-thread context and
+     * passed to the AsyncOdeAction when executed in the main-loop context.
+     */
+    struct AsyncOdeOccurrence
+    {
+        /**
+         * @brief unique source id of the frame that triggered the occurrence.
+         */
+        uint sourceId;
+        
+        /**
+         * @brief frame number of the frame that triggered the occurrence.
+         */
+        uint64_t frameNum;
+        
+        /**
+         * @brief NTP timestamp of the frame that triggered the occurrence.
+         */
+        uint64_t ntpTimestamp;
+        
+        /**
+         * @brief key used to coalesce duplicate requests, pending requests 
+         * for the same Action with the same key are collapsed into one.
+         */
+        uint64_t coalesceKey;
+        
+        /**
+         * @brief monotonic time the request was queued in microseconds.
+         */
+        uint64_t queuedTime;
+    };
+    
     /**
      * @class AsyncOdeAction
      * @brief Virtual class for an Asynchronous ODE Action
@@ -356,8 +441,8 @@ namespace DSL
         ~AsyncOdeAction();
         
         /**
-         * @brief Handles the ODE occurrence by scheduling the DoAsyncAction 
-         * timer callback.
+         * @brief Handles the ODE occurrence by capturing the occurrence payload
+         * and queuing a request with the shared AsyncOdeActionExecutor.
          * @param[in] pBuffer pointer to the batched stream buffer that triggered 
          * the event.
          * @param[in] pOdeTrigger shared pointer to ODE Trigger that triggered 
@@ -372,25 +457,153 @@ namespace DSL
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
 
         /**
-         * @brief Function to perform the Action asynchronously as a Timer callback.
+         * @brief Function to perform the Action asynchronously in the 
+         * main-loop context.
+         * @param[in] occurrence occurrence payload captured on HandleOccurrence.
+         */
+        virtual void DoAsyncAction(const AsyncOdeOccurrence& occurrence) = 0;
+        
+        /**
+         * @brief Gets the current async queue-depth and latency metrics 
+         * for this Action.
+         * @param[out] pMetrics metrics structure to fill in.
          */
-        virtual void DoAsyncAction() = 0;
+        void GetAsyncMetrics(dsl_ode_action_async_metrics* pMetrics);
+        
+        /**
+         * @brief Clears the async queue-depth and latency metrics for 
+         * this Action. The current pending count is retained.
+         */
+        void ClearAsyncMetrics();
         
     protected:
     
         /**
-         * @brief g_timer_add event source.
-         */ 
-        uint m_timerId;
+         * @brief Gets the key used to coalesce duplicate requests. Pending
+         * requests with the same key are collapsed into one.
+         * @param[in] pFrameMeta pointer to the Frame Meta data that triggered 
+         * the event.
+         * @return 0 by default, all pending requests are collapsed.
+         */
+        virtual uint64_t GetCoalesceKey(NvDsFrameMeta* pFrameMeta)
+        {
+            return 0;
+        };
     };
 
+    // ********************************************************************
+    
+    /**
+     * @struct AsyncOdeRequest
+     * @brief A request queued with the AsyncOdeActionExecutor. The Action is
+     * referenced weakly so that it can be kept alive while it executes.
+     */
+    struct AsyncOdeRequest
+    {
+        /**
+         * @brief raw pointer to the Action, used as the request's identity.
+         */
+        AsyncOdeAction* pAction;
+        
+        /**
+         * @brief weak pointer to the Action, locked for the duration of
+         * its execution.
+         */
+        std::weak_ptr<Base> pWeakAction;
+        
+        /**
+         * @brief captured occurrence payload for the request.
+         */
+        AsyncOdeOccurrence occurrence;
+    };
+    
     /**
-     * @brief timer callback function to call an AsyncOdeAction in the context
-     * of the main-loop. 
-     * @param pAction asynchronous action to invoke - call DoAsyncAction().
-     * @return False always - one shot timer.
+     * @class AsyncOdeActionExecutor
+     * @brief Single, shared executor for all AsyncOdeActions. Requests are 
+     * queued in order from the streaming-thread(s) and executed in batches in
+     * the main-loop context. Consecutive duplicate requests for the same 
+     * Action are coalesced and the main-loop is woken once per batch.
      */
-    static int do_async_action(gpointer pAction);
+    class AsyncOdeActionExecutor
+    {
+    public:
+    
+        /**
+         * @brief Gets the single instance of the executor.
+         * @return pointer to the single instance.
+         */
+        static AsyncOdeActionExecutor* GetExecutor();
+        
+        /**
+         * @brief Queues a request to execute an AsyncOdeAction, coalescing
+         * with the last pending request if for the same Action and key.
+         * @param[in] pAction Action to execute in the main-loop context.
+         * @param[in] occurrence captured occurrence payload for the request.
+         */
+        void QueueRequest(AsyncOdeAction* pAction, 
+            const AsyncOdeOccurrence& occurrence);
+            
+        /**
+         * @brief Cancels all pending requests for an AsyncOdeAction and 
+         * removes its metrics. Called on Action destruction, which can only 
+         * happen once the Action is no longer executing.
+         * @param[in] pAction Action to cancel.
+         */
+        void CancelRequests(AsyncOdeAction* pAction);
+        
+        /**
+         * @brief Gets the current metrics for an AsyncOdeAction.
+         * @param[in] pAction Action to query.
+         * @param[out] pMetrics metrics structure to fill in.
+         */
+        void GetMetrics(AsyncOdeAction* pAction, 
+            dsl_ode_action_async_metrics* pMetrics);
+            
+        /**
+         * @brief Clears the current metrics for an AsyncOdeAction.
+         * @param[in] pAction Action to update.
+         */
+        void ClearMetrics(AsyncOdeAction* pAction);
+        
+        /**
+         * @brief Executes all requests queued since the last batch, in order.
+         * Called in the main-loop context.
+         * @return false always to remove the idle source.
+         */
+        bool ExecuteBatch();
+        
+    private:
+    
+        /**
+         * @brief private ctor for the single instance.
+         */
+        AsyncOdeActionExecutor();
+        
+        /**
+         * @brief mutex to protect the request queues and metrics.
+         */
+        DslMutex m_queueMutex;
+        
+        /**
+         * @brief ordered queue of pending requests.
+         */
+        std::list<AsyncOdeRequest> m_requests;
+        
+        /**
+         * @brief current batch of requests being executed.
+         */
+        std::list<AsyncOdeRequest> m_batch;
+        
+        /**
+         * @brief map of Action to current metrics. 
+         */
+        std::map<AsyncOdeAction*, dsl_ode_action_async_metrics> m_metrics;
+        
+        /**
+         * @brief idle source id for the scheduled batch, 0 if not scheduled.
+         */
+        uint m_idleSourceId;
+    };
     
     // ********************************************************************
 
@@ -681,6 +894,12 @@ namespace DSL
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
             GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
+
+        /**
+         * @brief The Action calls the client handler function and must be serialized.
+         * @return false always.
+         */
+        bool IsParallelSafe(){return false;};
         
     private:
     
@@ -741,7 +960,7 @@ namespace DSL
          * @param[in] pObjectMeta pointer to Object Meta if Object detection event, 
          * NULL if Frame level absence, total, min, max, etc. events.
          */
-        void HandleOccurrence(GstBuffer* pBuffer, 
+        virtual void HandleOccurrence(GstBuffer* pBuffer, 
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
             
         /**
@@ -789,6 +1008,25 @@ namespace DSL
          * @return true on successfull remove, false otherwise
          */
         bool RemoveMailer(DSL_MAILER_PTR pMailer);
+
+        /**
+         * @brief sets the Websocket Topic to publish each captured image to.
+         * @param[in] topic name of the Websocket Topic, empty string to clear.
+         */
+        void SetWebsocketTopic(const char* topic);
+        
+        /**
+         * @brief Gets the current Surface Pool and batched transform metrics 
+         * for this CaptureOdeAction.
+         * @param[out] pMetrics pointer to a metrics structure to fill in.
+         */
+        void GetCaptureMetrics(dsl_ode_action_capture_metrics* pMetrics);
+        
+        /**
+         * @brief Clears the accumulated metrics for this CaptureOdeAction.
+         * The pooled and in-use surface counts are retained.
+         */
+        void ClearCaptureMetrics();
         
         /**
          * @brief removes all child Mailers, Players, and Listeners from this parent Object
@@ -801,6 +1039,14 @@ namespace DSL
          */
         void queueCapturedImage(std::shared_ptr<DslBufferSurface> pBufferSurface);
         
+        /**
+         * @brief Queues an image retained by a Frame-Capture Sink for conversion,
+         * assigning it a new unique capture id.
+         * @param pBufferSurface shared pointer to the mapped, retained image.
+         * @return false if the Action is disabled, true otherwise.
+         */
+        bool QueueRetainedImage(std::shared_ptr<DslBufferSurface> pBufferSurface);
+        
         /**
          * @brief implements an idle thread callback to initiate the conversion
          * of the NvBufferSurface to a JPEG image file.
@@ -809,6 +1055,105 @@ namespace DSL
         int convertCapturedImage();
 
     protected:
+
+        /**
+         * @brief Frame or object image requested on ODE occurrence, captured 
+         * with all other images requested for the same frame once all of the 
+         * frame's occurrences have been handled.
+         */
+        struct CaptureRequest
+        {
+            /**
+             * @brief coordinates and dimensions of the capture rectangle,
+             * set to the frame's dimensions for frame captures when captured.
+             */
+            gint left, top, width, height;
+            
+            /**
+             * @brief true if the image is a best-shot candidate.
+             */
+            bool bestShot;
+            
+            /**
+             * @brief source id of the frame.
+             */
+            uint sourceId;
+            
+            /**
+             * @brief tracking id of the object, if capturing an object.
+             */
+            uint64_t objectId;
+            
+            /**
+             * @brief confidence and bbox area score for best-shot candidates.
+             */
+            double areaScore;
+            
+            /**
+             * @brief monotonic time in us of the occurrence.
+             */
+            uint64_t timeUs;
+        };
+        
+        /**
+         * @brief Adds a capture request for the current frame, to be captured 
+         * on post-processing of the frame. The property mutex must be held.
+         * @param[in] pBuffer pointer to the batched stream buffer to capture from.
+         * @param[in] pFrameMeta pointer to the Frame Meta data for the frame.
+         * @param[in] pObjectMeta pointer to Object Meta if capturing an object.
+         * @param[in] captureRequest request to add, the capture rectangle is set
+         * from the Object Meta for object captures.
+         */
+        void requestCapture(GstBuffer* pBuffer, NvDsFrameMeta* pFrameMeta, 
+            NvDsObjectMeta* pObjectMeta, CaptureRequest captureRequest);
+            
+        /**
+         * @brief Captures all images requested for the frame with a single 
+         * batched transform to pooled surfaces. Requests for frames that 
+         * were never post-processed are discarded once expired.
+         * @param[in] pBuffer pointer to the batched stream buffer for the frame.
+         * @param[in] pFrameMeta pointer to the Frame Meta data for the frame.
+         */
+        void postProcessFrame(GstBuffer* pBuffer, NvDsFrameMeta* pFrameMeta);
+        
+        /**
+         * @brief Handles a captured image by queuing it for conversion.
+         * @param[in] captureRequest the request the image was captured for.
+         * @param[in] pBufferSurface shared pointer to the captured image.
+         */
+        virtual void handleCapturedImage(const CaptureRequest& captureRequest,
+            std::shared_ptr<DslBufferSurface> pBufferSurface);
+
+        /**
+         * @brief Discards the thumbnail surfaces created for a captured image 
+         * that will not be queued for conversion.
+         * @param[in] captureId unique id of the captured image.
+         */
+        void discardThumbnailSurfaces(uint64_t captureId);
+
+        /**
+         * @brief Creates a downscaled copy of a captured image for each distinct
+         * thumbnail width requested by the Websocket Topic's subscribers.
+         * @param[in] monoSurface source surface for the captured image.
+         * @param[in] left x-positional coordinate of the capture rectangle.
+         * @param[in] top y-positional coordinate of the capture rectangle.
+         * @param[in] width width of the capture rectangle.
+         * @param[in] height height of the capture rectangle.
+         * @param[in] transformMemType memory type for the new surfaces.
+         * @param[in] captureId unique id of the captured image.
+         */
+        void createThumbnailSurfaces(DslMonoSurface& monoSurface, 
+            gint left, gint top, gint width, gint height,
+            NvBufSurfaceMemType transformMemType, uint64_t captureId);
+
+        /**
+         * @brief Publishes a saved JPEG image, and its downscaled thumbnails,
+         * to the Websocket Topic. 
+         * @param[in] filespec path to the saved JPEG image file.
+         * @param[in] pBufferSurface shared pointer to the captured image.
+         */
+        void publishCapturedImage(const std::string& filespec,
+            std::shared_ptr<DslBufferSurface> pBufferSurface);
         
         /**
          * @brief Device Properties, used for aarch64/x86_64 conditional logic
@@ -823,7 +1168,7 @@ namespace DSL
         /**
          * @brief static, unique capture id shared by all Capture actions
          */
-        static uint64_t s_captureId;
+        static std::atomic<uint64_t> s_captureId;
     
         /**
          * @brief either DSL_CAPTURE_TYPE_OBJECT or DSL_CAPTURE_TYPE_FRAME
@@ -874,6 +1219,48 @@ namespace DSL
          * @brief map of all Mailers to send email.
          */
         std::map<std::string, std::shared_ptr<MailerSpecs>> m_mailers;
+
+        /**
+         * @brief name of the Websocket Topic to publish captured images to,
+         * empty string if not publishing.
+         */
+        std::string m_websocketTopic;
+
+        /**
+         * @brief downscaled thumbnail surfaces waiting to be published, 
+         * mapped by the unique id of their captured image. 
+         */
+        std::map<uint64_t, 
+            std::vector<std::shared_ptr<DslBufferSurface>>> m_thumbnailSurfaces;
+        
+        /**
+         * @brief capture requests waiting for post-processing of their frame,
+         * mapped by source id and frame number. Batched buffers are pooled 
+         * and reused, so they can't be used to identify the frame.
+         */
+        std::map<std::pair<uint, uint64_t>, 
+            std::vector<CaptureRequest>> m_captureRequests;
+            
+        /**
+         * @brief pool of mapped surfaces to capture images to.
+         */
+        std::shared_ptr<DslBufferSurfacePool> m_pSurfacePool;
+        
+        /**
+         * @brief persistent Cuda stream for each GPU, used by the transform
+         * session for the life of the Action.
+         */
+        std::map<uint, std::shared_ptr<DslCudaStream>> m_cudaStreams;
+        
+        /**
+         * @brief number of batched transforms since last cleared.
+         */
+        uint64_t m_transformBatches;
+        
+        /**
+         * @brief number of images captured since last cleared.
+         */
+        uint64_t m_transformedImages;
         
     };
 
@@ -911,10 +1298,154 @@ namespace DSL
          * @param[in] name unique name for the ODE Action
          * @param[in] outdir output directory to write captured image files
          */
-        CaptureObjectOdeAction(const char* name, const char* outdir)
-            : CaptureOdeAction(name, DSL_CAPTURE_TYPE_OBJECT, outdir)
-        {};
+        CaptureObjectOdeAction(const char* name, const char* outdir);
+
+        /**
+         * @brief dtor for the Capture Object ODE Action class
+         */
+        ~CaptureObjectOdeAction();
+
+        using CaptureOdeAction::HandleOccurrence;
+
+        /**
+         * @brief Handles the ODE occurrence by capturing the object image to file,
+         * or by updating the object's best-shot candidate if best-shot is enabled.
+         * @param[in] pBuffer pointer to the batched stream buffer that triggered the event
+         * @param[in] pFrameMeta pointer to the Frame Meta data that triggered the event
+         * @param[in] pObjectMeta pointer to Object Meta for the object to capture.
+         */
+        void HandleOccurrence(GstBuffer* pBuffer, 
+            NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
+
+        /**
+         * @brief Gets the current best-shot settings for this Capture Object Action.
+         * @param[out] enabled true if best-shot capture is enabled.
+         * @param[out] timeout time in ms without an occurrence for a tracked
+         * object before its best-shot is written.
+         * @param[out] maxHold maximum time in ms to hold a best-shot before it 
+         * is written, 0 = no maximum.
+         * @param[out] sharpness true if the image sharpness is part of the score.
+         */
+        void GetBestShotSettings(bool* enabled, 
+            uint* timeout, uint* maxHold, bool* sharpness);
+
+        /**
+         * @brief Sets the best-shot settings for this Capture Object Action.
+         * All held best-shots are written when best-shot is disabled.
+         * @param[in] enabled set to true to enable best-shot capture.
+         * @param[in] timeout time in ms without an occurrence for a tracked
+         * object before its best-shot is written.
+         * @param[in] maxHold maximum time in ms to hold a best-shot before it 
+         * is written, 0 = no maximum.
+         * @param[in] sharpness set to true to include the image sharpness in 
+         * the score.
+         */
+        void SetBestShotSettings(bool enabled, 
+            uint timeout, uint maxHold, bool sharpness);
+
+        /**
+         * @brief Gets the number of tracked objects with a best-shot currently
+         * held, or already written, by this Capture Object Action.
+         * @return number of tracked objects.
+         */
+        uint GetBestShotCount();
+
+        /**
+         * @brief Queues all held best-shots whose tracked object has timed out,
+         * or that have been held for the maximum time, for conversion.
+         * @param[in] flushAll if true, all held best-shots are queued.
+         * @return true if the best-shot timer should continue, false otherwise.
+         */
+        int HandleBestShotTimer(bool flushAll=false);
+
+    protected:
+    
+        /**
+         * @brief Handles a captured image by queuing it for conversion, or by
+         * scoring it against the object's current best-shot if a candidate.
+         * @param[in] captureRequest the request the image was captured for.
+         * @param[in] pBufferSurface shared pointer to the captured image.
+         */
+        void handleCapturedImage(const CaptureRequest& captureRequest,
+            std::shared_ptr<DslBufferSurface> pBufferSurface);
+
+    private:
+
+        /**
+         * @brief Calculates the variance of the Laplacian of a captured image
+         * as a measure of its sharpness.
+         * @param[in] pBufferSurface mapped surface with the captured RGBA image.
+         * @return the sharpness of the captured image.
+         */
+        double calculateSharpness(std::shared_ptr<DslBufferSurface> pBufferSurface);
+
+        /**
+         * @brief Best-shot candidate for a single tracked object.
+         */
+        struct BestShot
+        {
+            /**
+             * @brief best image captured for the tracked object so far, 
+             * nullptr once written.
+             */
+            std::shared_ptr<DslBufferSurface> pBufferSurface;
+
+            /**
+             * @brief confidence and bbox area score of the best image.
+             */
+            double areaScore;
+
+            /**
+             * @brief final score of the best image, including sharpness if enabled.
+             */
+            double score;
+
+            /**
+             * @brief monotonic time in us of the first occurrence.
+             */
+            uint64_t firstSeenUs;
+
+            /**
+             * @brief monotonic time in us of the last occurrence.
+             */
+            uint64_t lastSeenUs;
+        };
+
+        /**
+         * @brief true if best-shot capture is enabled.
+         */
+        bool m_bestShotEnabled;
+
+        /**
+         * @brief time in ms without an occurrence before a tracked object's 
+         * best-shot is written.
+         */
+        uint m_bestShotTimeout;
+
+        /**
+         * @brief maximum time in ms to hold a best-shot, 0 = no maximum.
+         */
+        uint m_bestShotMaxHold;
+
+        /**
+         * @brief true if the image sharpness is part of the best-shot score.
+         */
+        bool m_bestShotSharpness;
 
+        /**
+         * @brief map of best-shots by source-id and tracking-id.
+         */
+        std::map<std::pair<uint, uint64_t>, BestShot> m_bestShots;
+
+        /**
+         * @brief gnome timer id for the best-shot timer, 0 when not running.
+         */
+        uint m_bestShotTimerId;
+
+        /**
+         * @brief mutex to guard the map of best-shots.
+         */
+        DslMutex m_bestShotMutex;
     };
 
     // ********************************************************************
@@ -1086,6 +1617,12 @@ namespace DSL
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
             GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
+
+        /**
+         * @brief The Action updates an ODE Handler and must be serialized.
+         * @return false always.
+         */
+        bool IsParallelSafe(){return false;};
             
     private:
     
@@ -1280,6 +1817,12 @@ namespace DSL
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
             GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
+
+        /**
+         * @brief The Action calls the client monitor function and must be serialized.
+         * @return false always.
+         */
+        bool IsParallelSafe(){return false;};
         
     private:
     
@@ -1709,10 +2252,11 @@ namespace DSL
         ~PipelinePauseOdeAction();
         
         /**
-         * @brief Function to perform the Action asynchronously as a Timer callback.
-         * Callback function is called in the main-loop context.
+         * @brief Function to perform the Action asynchronously.
+         * Function is called in the main-loop context.
+         * @param[in] occurrence occurrence payload captured on HandleOccurrence.
          */
-        void DoAsyncAction();
+        void DoAsyncAction(const AsyncOdeOccurrence& occurrence);
 
     private:
     
@@ -1743,10 +2287,11 @@ namespace DSL
         ~PipelinePlayOdeAction();
         
         /**
-         * @brief Function to perform the Action asynchronously as a Timer callback.
-         * Callback function is called in the main-loop context.
+         * @brief Function to perform the Action asynchronously.
+         * Function is called in the main-loop context.
+         * @param[in] occurrence occurrence payload captured on HandleOccurrence.
          */
-        void DoAsyncAction();
+        void DoAsyncAction(const AsyncOdeOccurrence& occurrence);
 
     private:
     
@@ -1777,10 +2322,11 @@ namespace DSL
         ~PipelineStopOdeAction();
         
         /**
-         * @brief Function to perform the Action asynchronously as a Timer callback.
-         * Callback function is called in the main-loop context.
+         * @brief Function to perform the Action asynchronously.
+         * Function is called in the main-loop context.
+         * @param[in] occurrence occurrence payload captured on HandleOccurrence.
          */
-        void DoAsyncAction();
+        void DoAsyncAction(const AsyncOdeOccurrence& occurrence);
 
     private:
     
@@ -1811,10 +2357,11 @@ namespace DSL
         ~PlayerPauseOdeAction();
         
         /**
-         * @brief Function to perform the Action asynchronously as a Timer callback.
-         * Callback function is called in the main-loop context.
+         * @brief Function to perform the Action asynchronously.
+         * Function is called in the main-loop context.
+         * @param[in] occurrence occurrence payload captured on HandleOccurrence.
          */
-        void DoAsyncAction();
+        void DoAsyncAction(const AsyncOdeOccurrence& occurrence);
 
     private:
     
@@ -1845,10 +2392,11 @@ namespace DSL
         ~PlayerPlayOdeAction();
         
         /**
-         * @brief Function to perform the Action asynchronously as a Timer callback.
-         * Callback function is called in the main-loop context.
+         * @brief Function to perform the Action asynchronously.
+         * Function is called in the main-loop context.
+         * @param[in] occurrence occurrence payload captured on HandleOccurrence.
          */
-        void DoAsyncAction();
+        void DoAsyncAction(const AsyncOdeOccurrence& occurrence);
 
     private:
     
@@ -1879,10 +2427,11 @@ namespace DSL
         ~PlayerStopOdeAction();
         
         /**
-         * @brief Function to perform the Action asynchronously as a Timer callback.
-         * Callback function is called in the main-loop context.
+         * @brief Function to perform the Action asynchronously.
+         * Function is called in the main-loop context.
+         * @param[in] occurrence occurrence payload captured on HandleOccurrence.
          */
-        void DoAsyncAction();
+        void DoAsyncAction(const AsyncOdeOccurrence& occurrence);
 
     private:
     
@@ -2196,10 +2745,11 @@ namespace DSL
         ~AddSinkOdeAction();
 
         /**
-         * @brief Function to perform the Action asynchronously as a Timer callback.
-         * @return int return 1 always to execute only once.
+         * @brief Function to perform the Action asynchronously.
+         * Function is called in the main-loop context.
+         * @param[in] occurrence occurrence payload captured on HandleOccurrence.
          */
-        void DoAsyncAction();
+        void DoAsyncAction(const AsyncOdeOccurrence& occurrence);
         
     private:
     
@@ -2239,10 +2789,11 @@ namespace DSL
         ~RemoveSinkOdeAction();
 
         /**
-         * @brief Function to perform the Action asynchronously as a Timer callback.
-         * @return int return 1 always to execute only once.
+         * @brief Function to perform the Action asynchronously.
+         * Function is called in the main-loop context.
+         * @param[in] occurrence occurrence payload captured on HandleOccurrence.
          */
-        void DoAsyncAction();
+        void DoAsyncAction(const AsyncOdeOccurrence& occurrence);
         
     private:
     
@@ -2282,10 +2833,11 @@ namespace DSL
         ~AddSourceOdeAction();
 
         /**
-         * @brief Function to perform the Action asynchronously as a Timer callback.
-         * @return int return 1 always to execute only once.
+         * @brief Function to perform the Action asynchronously.
+         * Function is called in the main-loop context.
+         * @param[in] occurrence occurrence payload captured on HandleOccurrence.
          */
-        void DoAsyncAction();
+        void DoAsyncAction(const AsyncOdeOccurrence& occurrence);
 
     private:
     
@@ -2325,10 +2877,11 @@ namespace DSL
         ~RemoveSourceOdeAction();
 
         /**
-         * @brief Function to perform the Action asynchronously as a Timer callback.
-         * @return int return 1 always to execute only once.
+         * @brief Function to perform the Action asynchronously.
+         * Function is called in the main-loop context.
+         * @param[in] occurrence occurrence payload captured on HandleOccurrence.
          */
-        void DoAsyncAction();
+        void DoAsyncAction(const AsyncOdeOccurrence& occurrence);
         
     private:
     
@@ -2377,6 +2930,12 @@ namespace DSL
         void HandleOccurrence(DSL_BASE_PTR pBaseTrigger, 
             GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
+
+        /**
+         * @brief The Action updates other ODE Triggers and must be serialized.
+         * @return false always.
+         */
+        bool IsParallelSafe(){return false;};
         
     private:
     
@@ -2420,6 +2979,12 @@ namespace DSL
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
             GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
+
+        /**
+         * @brief The Action updates other ODE Triggers and must be serialized.
+         * @return false always.
+         */
+        bool IsParallelSafe(){return false;};
         
     private:
     
@@ -2463,6 +3028,12 @@ namespace DSL
         void HandleOccurrence(DSL_BASE_PTR pBaseTrigger, 
             GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
+
+        /**
+         * @brief The Action updates other ODE Triggers and must be serialized.
+         * @return false always.
+         */
+        bool IsParallelSafe(){return false;};
         
     private:
     
@@ -2506,6 +3077,12 @@ namespace DSL
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
             GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
+
+        /**
+         * @brief The Action updates other ODE Actions and must be serialized.
+         * @return false always.
+         */
+        bool IsParallelSafe(){return false;};
         
     private:
     
@@ -2549,6 +3126,12 @@ namespace DSL
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
             GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
+
+        /**
+         * @brief The Action updates other ODE Actions and must be serialized.
+         * @return false always.
+         */
+        bool IsParallelSafe(){return false;};
         
     private:
     
@@ -2593,6 +3176,12 @@ namespace DSL
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
             GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
+
+        /**
+         * @brief The Action updates other ODE Triggers and must be serialized.
+         * @return false always.
+         */
+        bool IsParallelSafe(){return false;};
         
     private:
     
@@ -2641,6 +3230,12 @@ namespace DSL
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
             GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
+
+        /**
+         * @brief The Action updates other ODE Triggers and must be serialized.
+         * @return false always.
+         */
+        bool IsParallelSafe(){return false;};
         
     private:
     
@@ -2945,10 +3540,11 @@ namespace DSL
         ~AddBranchOdeAction();
 
         /**
-         * @brief Function to perform the Action asynchronously as a Timer callback.
-         * @return int return 1 always to execute only once.
+         * @brief Function to perform the Action asynchronously.
+         * Function is called in the main-loop context.
+         * @param[in] occurrence occurrence payload captured on HandleOccurrence.
          */
-        void DoAsyncAction();
+        void DoAsyncAction(const AsyncOdeOccurrence& occurrence);
         
     private:
     
@@ -2991,23 +3587,11 @@ namespace DSL
         ~AddBranchToOdeAction();
 
         /**
-         * @brief Handles the ODE occurrence by adding a named Branch to a named Demuxer
-         * at the current stream-id, as indicated by the pFrameMeta.
-         * @param[in] pBuffer pointer to the batched stream buffer that triggered the event
-         * @param[in] pOdeTrigger shared pointer to ODE Trigger that triggered the event
-         * @param[in] pFrameMeta pointer to the Frame Meta data that triggered the event
-         * @param[in] pObjectMeta pointer to Object Meta if Object detection event, 
-         * NULL if Frame level absence, total, min, max, etc. events.
-         */
-        void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
-            NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
-
-        /**
-         * @brief Function to perform the Action asynchronously as a Timer callback.
-         * @return int return 1 always to execute only once.
+         * @brief Function to perform the Action asynchronously.
+         * Function is called in the main-loop context.
+         * @param[in] occurrence occurrence payload captured on HandleOccurrence.
          */
-        void DoAsyncAction();
+        void DoAsyncAction(const AsyncOdeOccurrence& occurrence);
         
     private:
     
@@ -3020,11 +3604,17 @@ namespace DSL
          * @brief Branch to add to the Tee on ODE occurrence
          */ 
         std::string m_branch;
-        
+
+    protected:
+    
         /**
-         * @brief Destination stream-id to add the branch to
-         */ 
-        int m_destStreamId;
+         * @brief Gets the key used to coalesce duplicate requests.
+         * @param[in] pFrameMeta pointer to the Frame Meta data that triggered 
+         * the event.
+         * @return the current stream-id so that pending requests for 
+         * different destination streams are not collapsed.
+         */
+        uint64_t GetCoalesceKey(NvDsFrameMeta* pFrameMeta);
 
     };
     
@@ -3052,23 +3642,11 @@ namespace DSL
         ~MoveBranchToOdeAction();
 
         /**
-         * @brief Handles the ODE occurrence by moving a named Branch connected to a 
-         * named Demuxer to the current stream-id, as indicated by the pFrameMeta.
-         * @param[in] pBuffer pointer to the batched stream buffer that triggered the event
-         * @param[in] pOdeTrigger shared pointer to ODE Trigger that triggered the event
-         * @param[in] pFrameMeta pointer to the Frame Meta data that triggered the event
-         * @param[in] pObjectMeta pointer to Object Meta if Object detection event, 
-         * NULL if Frame level absence, total, min, max, etc. events.
-         */
-        void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
-            NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
-        
-        /**
-         * @brief Function to perform the Action asynchronously as a Timer callback.
-         * @return int return 1 always to execute only once.
+         * @brief Function to perform the Action asynchronously.
+         * Function is called in the main-loop context.
+         * @param[in] occurrence occurrence payload captured on HandleOccurrence.
          */
-        void DoAsyncAction();
+        void DoAsyncAction(const AsyncOdeOccurrence& occurrence);
 
     private:
     
@@ -3081,11 +3659,17 @@ namespace DSL
          * @brief Branch to move on ODE occurrence
          */ 
         std::string m_branch;
-        
+
+    protected:
+    
         /**
-         * @brief Destination stream-id to move the branch to.
+         * @brief Gets the key used to coalesce duplicate requests.
+         * @param[in] pFrameMeta pointer to the Frame Meta data that triggered 
+         * the event.
+         * @return the current stream-id so that pending requests for 
+         * different destination streams are not collapsed.
          */
-        int m_destStreamId;
+        uint64_t GetCoalesceKey(NvDsFrameMeta* pFrameMeta);
 
     };
     
@@ -3114,10 +3698,11 @@ namespace DSL
         ~RemoveBranchOdeAction();
 
         /**
-         * @brief Function to perform the Action asynchronously as a Timer callback.
-         * @return int return 1 always to execute only once.
+         * @brief Function to perform the Action asynchronously.
+         * Function is called in the main-loop context.
+         * @param[in] occurrence occurrence payload captured on HandleOccurrence.
          */
-        void DoAsyncAction();
+        void DoAsyncAction(const AsyncOdeOccurrence& occurrence);
 
     private:
     
@@ -27,6 +27,51 @@ THE SOFTWARE.
 
 namespace DSL
 {
+    /**
+     * @brief Returns the orientation of point c relative to the line a-b.
+     * @return > 0 if counter-clockwise, < 0 if clockwise, 0 if collinear.
+     */
+    static int64_t orientation(const dsl_coordinate& a, 
+        const dsl_coordinate& b, const dsl_coordinate& c)
+    {
+        return ((int64_t)b.x - a.x) * ((int64_t)c.y - a.y) -
+            ((int64_t)b.y - a.y) * ((int64_t)c.x - a.x);
+    }
+    
+    /**
+     * @brief Tests if a point c, known to be collinear with a-b, lies
+     * on the closed segment a-b.
+     */
+    static bool is_on_segment(const dsl_coordinate& a, 
+        const dsl_coordinate& b, const dsl_coordinate& c)
+    {
+        return (c.x >= std::min(a.x, b.x) and c.x <= std::max(a.x, b.x) and
+            c.y >= std::min(a.y, b.y) and c.y <= std::max(a.y, b.y));
+    }
+    
+    /**
+     * @brief Tests if the closed segments p1-p2 and q1-q2 intersect, including
+     * touching end-points and collinear overlap. Exact for integer coordinates.
+     */
+    static bool do_segments_intersect(const dsl_coordinate& p1, 
+        const dsl_coordinate& p2, const dsl_coordinate& q1, 
+        const dsl_coordinate& q2)
+    {
+        int64_t o1 = orientation(p1, p2, q1);
+        int64_t o2 = orientation(p1, p2, q2);
+        int64_t o3 = orientation(q1, q2, p1);
+        int64_t o4 = orientation(q1, q2, p2);
+        
+        if (((o1 > 0 and o2 < 0) or (o1 < 0 and o2 > 0)) and
+            ((o3 > 0 and o4 < 0) or (o3 < 0 and o4 > 0)))
+        {
+            return true;
+        }
+        return ((o1 == 0 and is_on_segment(p1, p2, q1)) or
+            (o2 == 0 and is_on_segment(p1, p2, q2)) or
+            (o3 == 0 and is_on_segment(q1, q2, p1)) or
+            (o4 == 0 and is_on_segment(q1, q2, p2)));
+    }
 
     OdeArea::OdeArea(const char* name, 
         DSL_DISPLAY_TYPE_PTR pDisplayType, bool show, uint bboxTestPoint)
@@ -119,6 +164,76 @@ namespace DSL
         }          
     }
     
+    bool OdeArea::DoesTrackedObjectCrossLine(
+        std::shared_ptr<TrackedObject> pTrackedObject, uint testMethod, 
+        uint& direction)
+    {
+        // Do not log function entry
+        
+        dsl_coordinate firstCoordinate = 
+            pTrackedObject->GetFirstCoordinate(m_bboxTestPoint);
+        dsl_coordinate lastCoordinate = 
+            pTrackedObject->GetLastCoordinate(m_bboxTestPoint);
+            
+        // The end-points test method uses a single segment; first to last.
+        if (testMethod == DSL_OBJECT_TRACE_TEST_METHOD_END_POINTS)
+        {
+            return CheckForLineCross(
+                DoesSegmentIntersectLine(firstCoordinate, lastCoordinate),
+                firstCoordinate, lastCoordinate, direction);
+        }
+        
+        TraceCrossState& state = pTrackedObject->GetTraceCrossState(GetName());
+        
+        uint64_t traceEnd = pTrackedObject->GetTraceEnd();
+        
+        if (state.traceEnd != traceEnd)
+        {
+            // If the state was updated with the previous trace point, only the
+            // newest segment -- from the previous last coordinate -- needs to 
+            // be tested.
+            if (state.traceEnd and state.traceEnd+1 == traceEnd)
+            {
+                bool intersects = DoesSegmentIntersectLine(
+                    state.lastCoordinate, lastCoordinate);
+                state.segmentIntersects.push_back(intersects);
+                state.intersectCount += intersects;
+            }
+            // Else, the state is new or updates were missed, so rebuild the 
+            // state from the object's complete trace.
+            else
+            {
+                DSL_RGBA_MULTI_LINE_PTR pTrace = pTrackedObject->GetTrace(
+                    m_bboxTestPoint, DSL_OBJECT_TRACE_TEST_METHOD_ALL_POINTS, 0);
+                    
+                state.segmentIntersects.clear();
+                state.intersectCount = 0;
+                
+                for (uint i = 1; i < pTrace->num_coordinates; i++)
+                {
+                    bool intersects = DoesSegmentIntersectLine(
+                        pTrace->coordinates[i-1], pTrace->coordinates[i]);
+                    state.segmentIntersects.push_back(intersects);
+                    state.intersectCount += intersects;
+                }
+            }
+            // The trace only ever loses points from the front, so remove the 
+            // oldest segments until the state matches the current trace.
+            size_t numSegments = (pTrackedObject->BboxTraceSize())
+                ? pTrackedObject->BboxTraceSize()-1 : 0;
+                
+            while (state.segmentIntersects.size() > numSegments)
+            {
+                state.intersectCount -= state.segmentIntersects.front();
+                state.segmentIntersects.pop_front();
+            }
+            state.traceEnd = traceEnd;
+            state.lastCoordinate = lastCoordinate;
+        }
+        return CheckForLineCross((state.intersectCount > 0),
+            firstCoordinate, lastCoordinate, direction);
+    }
+    
     // *****************************************************************************
 
     OdePolygonArea::OdePolygonArea(const char* name, 
@@ -233,22 +348,69 @@ namespace DSL
         // covert the trace vector to line-parameters for testing
         dsl_multi_line_params lineParms = {coordinates, numCoordinates};
         
-        direction = DSL_AREA_CROSS_DIRECTION_NONE;
-
         // create a Geos object from the line-parameters to check 
         // for cross with this Area's line.
         GeosMultiLine multiLine(lineParms);
         
-        if (!multiLine.Crosses(*m_pPolygon))
+        return CheckForLineCross(multiLine.Crosses(*m_pPolygon),
+            coordinates[0], coordinates[numCoordinates-1], direction);
+    }
+    
+    bool OdePolygonArea::DoesSegmentIntersectLine(
+        const dsl_coordinate& coordinate1, const dsl_coordinate& coordinate2)
+    {
+        // Do not log function entry
+        
+        // test the segment against each side, including the closing side.
+        for (uint i = 0; i < m_pPolygon->num_coordinates; i++)
+        {
+            if (do_segments_intersect(coordinate1, coordinate2,
+                m_pPolygon->coordinates[i], 
+                m_pPolygon->coordinates[(i+1)%m_pPolygon->num_coordinates]))
+            {
+                return true;
+            }
+        }
+        
+        // Segment doesn't touch a side, so it's either completely inside or 
+        // completely outside. Use the crossing-number test for one end-point.
+        bool inside(false);
+        for (uint i = 0, j = m_pPolygon->num_coordinates-1; 
+            i < m_pPolygon->num_coordinates; j = i++)
+        {
+            const dsl_coordinate& a = m_pPolygon->coordinates[i];
+            const dsl_coordinate& b = m_pPolygon->coordinates[j];
+            
+            if ((a.y > coordinate2.y) != (b.y > coordinate2.y))
+            {
+                int64_t lhs = ((int64_t)coordinate2.x - a.x) * ((int64_t)b.y - a.y);
+                int64_t rhs = ((int64_t)coordinate2.y - a.y) * ((int64_t)b.x - a.x);
+                
+                if ((b.y > a.y) ? (lhs < rhs) : (lhs > rhs))
+                {
+                    inside = !inside;
+                }
+            }
+        }
+        return inside;
+    }
+    
+    bool OdePolygonArea::CheckForLineCross(bool intersects, 
+        const dsl_coordinate& firstCoordinate, 
+        const dsl_coordinate& lastCoordinate, uint& direction)
+    {
+        // Do not log function entry
+        
+        direction = DSL_AREA_CROSS_DIRECTION_NONE;
+
+        if (!intersects)
         { 
             return false;
         }
         
         // use the Area's line width and trace-endpoint to determine if the cross
         // is sufficient to report, i.e. the line width is used as hysteresis.
-        GeosPoint endPoint(
-            coordinates[numCoordinates-1].x, 
-            coordinates[numCoordinates-1].y);
+        GeosPoint endPoint(lastCoordinate.x, lastCoordinate.y);
         
         bool crossed(((GeosPolygon)*m_pPolygon).Distance(endPoint) > 
             (m_pPolygon->border_width/2));
@@ -256,12 +418,12 @@ namespace DSL
         if (crossed)
         {
             // in case the object's trace crosses the line more than once.
-            if (GetPointLocation(coordinates[numCoordinates-1]) == 
-                GetPointLocation(coordinates[0]))
+            if (GetPointLocation(lastCoordinate) == 
+                GetPointLocation(firstCoordinate))
             {
                 return false;
             }
-            direction = GetPointLocation(coordinates[numCoordinates-1]);
+            direction = GetPointLocation(lastCoordinate);
         }
         return crossed;
     }
@@ -373,22 +535,42 @@ namespace DSL
         dsl_multi_line_params lineParms = {coordinates, 
             numCoordinates};
 
-        direction = DSL_AREA_CROSS_DIRECTION_NONE;
-        
         // create a Geos object from the line-parameters to check 
         // for cross with this Area's line.
         GeosMultiLine multiLine(lineParms);
         
-        if (!multiLine.Crosses(*m_pLine))
+        return CheckForLineCross(multiLine.Crosses(*m_pLine),
+            coordinates[0], coordinates[numCoordinates-1], direction);
+    }
+    
+    bool OdeLineArea::DoesSegmentIntersectLine(
+        const dsl_coordinate& coordinate1, const dsl_coordinate& coordinate2)
+    {
+        // Do not log function entry
+        
+        dsl_coordinate lineStart{m_pLine->x1, m_pLine->y1};
+        dsl_coordinate lineEnd{m_pLine->x2, m_pLine->y2};
+        
+        return do_segments_intersect(coordinate1, coordinate2, 
+            lineStart, lineEnd);
+    }
+    
+    bool OdeLineArea::CheckForLineCross(bool intersects, 
+        const dsl_coordinate& firstCoordinate, 
+        const dsl_coordinate& lastCoordinate, uint& direction)
+    {
+        // Do not log function entry
+        
+        direction = DSL_AREA_CROSS_DIRECTION_NONE;
+        
+        if (!intersects)
         { 
             return false;
         }
 
         // use the Area's line width and trace-endpoint to determine if the cross
         // is sufficient to report, i.e. the line width is used as hysteresis.
-        GeosPoint endPoint(
-            coordinates[numCoordinates-1].x, 
-            coordinates[numCoordinates-1].y);
+        GeosPoint endPoint(lastCoordinate.x, lastCoordinate.y);
         
         bool crossed(((GeosLine)*m_pLine).Distance(endPoint) > 
             (m_pLine->line_width/2));
@@ -396,12 +578,12 @@ namespace DSL
         if (crossed)
         {
             // in case the object's trace crosses the line more than once.
-            if (GetPointLocation(coordinates[numCoordinates-1]) == 
-                GetPointLocation(coordinates[0]))
+            if (GetPointLocation(lastCoordinate) == 
+                GetPointLocation(firstCoordinate))
             {
                 return false;
             }
-            direction = GetPointLocation(coordinates[numCoordinates-1]);
+            direction = GetPointLocation(lastCoordinate);
         }
         return crossed;    
     }
@@ -532,22 +714,46 @@ namespace DSL
         dsl_multi_line_params lineParms = {coordinates, 
             numCoordinates};
 
-        direction = DSL_AREA_CROSS_DIRECTION_NONE;
-        
         // create a Geos object from the line-parameters to check 
         // for cross with this Area's line.
         GeosMultiLine multiLine(lineParms);
         
-        if (!multiLine.Crosses(*m_pMultiLine))
+        return CheckForLineCross(multiLine.Crosses(*m_pMultiLine),
+            coordinates[0], coordinates[numCoordinates-1], direction);
+    }
+    
+    bool OdeMultiLineArea::DoesSegmentIntersectLine(
+        const dsl_coordinate& coordinate1, const dsl_coordinate& coordinate2)
+    {
+        // Do not log function entry
+        
+        for (uint i = 0; i < m_pMultiLine->num_coordinates-1; i++)
+        {
+            if (do_segments_intersect(coordinate1, coordinate2,
+                m_pMultiLine->coordinates[i], m_pMultiLine->coordinates[i+1]))
+            {
+                return true;
+            }
+        }
+        return false;
+    }
+    
+    bool OdeMultiLineArea::CheckForLineCross(bool intersects, 
+        const dsl_coordinate& firstCoordinate, 
+        const dsl_coordinate& lastCoordinate, uint& direction)
+    {
+        // Do not log function entry
+        
+        direction = DSL_AREA_CROSS_DIRECTION_NONE;
+        
+        if (!intersects)
         { 
             return false;
         }
         
         // use the Area's line width and trace-endpoint to determine if the cross
         // is sufficient to report, i.e. the line width is used as hysteresis.
-        GeosPoint endPoint(
-            coordinates[numCoordinates-1].x, 
-            coordinates[numCoordinates-1].y);
+        GeosPoint endPoint(lastCoordinate.x, lastCoordinate.y);
         
         bool crossed(((GeosMultiLine)*m_pMultiLine).Distance(endPoint) > 
             (m_pMultiLine->line_width/2));
@@ -555,12 +761,12 @@ namespace DSL
         if (crossed)
         {
             // in case the object's trace crosses the line more than once.
-            if (GetPointLocation(coordinates[numCoordinates-1]) == 
-                GetPointLocation(coordinates[0]))
+            if (GetPointLocation(lastCoordinate) == 
+                GetPointLocation(firstCoordinate))
             {
                 return false;
             }
-            direction = GetPointLocation(coordinates[numCoordinates-1]);
+            direction = GetPointLocation(lastCoordinate);
         }
         return crossed;
     }
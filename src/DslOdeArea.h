@@ -132,6 +132,46 @@ namespace DSL
         virtual bool DoesTraceCrossLine(dsl_coordinate* coordinates, uint numCoordinates,
             uint& direction) = 0;
         
+        /**
+         * @brief Checks if a Tracked Object's bounding box trace crosses the 
+         * Area's underlying Display Type. The trace intersection state is 
+         * maintained incrementally by the Tracked Object, per Area, so that only
+         * the newest trace segment needs to be tested on each new frame.
+         * @param[in] pTrackedObject shared pointer to the Tracked Object to test.
+         * @param[in] testMethod one of the DSL_OBJECT_TRACE_TEST_METHOD_* constants.
+         * @param[out] direction one of the DSL_AREA_CROSS_DIRECTION_* constants 
+         * defining the direction of the cross, including DSL_AREA_CROSS_DIRECTION_NONE.
+         * @return true if trace fully crosses the Area's Display Type including 
+         * line-width, false otherwise.
+         */
+        bool DoesTrackedObjectCrossLine(std::shared_ptr<TrackedObject> pTrackedObject,
+            uint testMethod, uint& direction);
+            
+        /**
+         * @brief Checks if a single trace segment intersects the Area's
+         * underlying Display Type. Uses exact integer arithmetic.
+         * @param[in] coordinate1 first end-point of the trace segment.
+         * @param[in] coordinate2 second end-point of the trace segment.
+         * @return true if the segment touches or crosses the Display Type.
+         */
+        virtual bool DoesSegmentIntersectLine(const dsl_coordinate& coordinate1,
+            const dsl_coordinate& coordinate2) = 0;
+            
+        /**
+         * @brief Applies the line-width hysteresis and direction tests to a
+         * trace once its intersection with the Area has been determined.
+         * @param[in] intersects true if the trace intersects the Display Type.
+         * @param[in] firstCoordinate first coordinate of the trace.
+         * @param[in] lastCoordinate last coordinate of the trace.
+         * @param[out] direction one of the DSL_AREA_CROSS_DIRECTION_* constants 
+         * defining the direction of the cross, including DSL_AREA_CROSS_DIRECTION_NONE.
+         * @return true if trace fully crosses the Area's Display Type including 
+         * line-width, false otherwise.
+         */
+        virtual bool CheckForLineCross(bool intersects, 
+            const dsl_coordinate& firstCoordinate, 
+            const dsl_coordinate& lastCoordinate, uint& direction) = 0;
+        
         /**
          * @brief Gets the bbox test-point for the defined for this area
          * @return one of the DSL_BBOX_POINT_* constants defining the test point.
@@ -239,6 +279,31 @@ namespace DSL
         bool DoesTraceCrossLine(dsl_coordinate* coordinates, uint numCoordinates,
             uint& direction);
 
+        /**
+         * @brief Checks if a single trace segment intersects the Area's Polygon
+         * Display Type. Uses exact integer arithmetic.
+         * @param[in] coordinate1 first end-point of the trace segment.
+         * @param[in] coordinate2 second end-point of the trace segment.
+         * @return true if the segment touches or crosses the Polygon.
+         */
+        bool DoesSegmentIntersectLine(const dsl_coordinate& coordinate1,
+            const dsl_coordinate& coordinate2);
+            
+        /**
+         * @brief Applies the line-width hysteresis and direction tests to a
+         * trace once its intersection with the Area's Polygon has been determined.
+         * @param[in] intersects true if the trace intersects the Polygon.
+         * @param[in] firstCoordinate first coordinate of the trace.
+         * @param[in] lastCoordinate last coordinate of the trace.
+         * @param[out] direction one of the DSL_AREA_CROSS_DIRECTION_* constants 
+         * defining the direction of the cross, including DSL_AREA_CROSS_DIRECTION_NONE.
+         * @return true if trace fully crosses the Area's Polygon including 
+         * line-width, false otherwise.
+         */
+        bool CheckForLineCross(bool intersects, 
+            const dsl_coordinate& firstCoordinate, 
+            const dsl_coordinate& lastCoordinate, uint& direction);
+
         /**
          * @brief Polygon display type used to define the Area's location, dimensions, and color
          */
@@ -353,6 +418,31 @@ namespace DSL
          */
         bool DoesTraceCrossLine(dsl_coordinate* coordinates, uint numCoordinates,
             uint& direction);
+
+        /**
+         * @brief Checks if a single trace segment intersects the Area's Line
+         * Display Type. Uses exact integer arithmetic.
+         * @param[in] coordinate1 first end-point of the trace segment.
+         * @param[in] coordinate2 second end-point of the trace segment.
+         * @return true if the segment touches or crosses the Line.
+         */
+        bool DoesSegmentIntersectLine(const dsl_coordinate& coordinate1,
+            const dsl_coordinate& coordinate2);
+            
+        /**
+         * @brief Applies the line-width hysteresis and direction tests to a
+         * trace once its intersection with the Area's Line has been determined.
+         * @param[in] intersects true if the trace intersects the Line.
+         * @param[in] firstCoordinate first coordinate of the trace.
+         * @param[in] lastCoordinate last coordinate of the trace.
+         * @param[out] direction one of the DSL_AREA_CROSS_DIRECTION_* constants 
+         * defining the direction of the cross, including DSL_AREA_CROSS_DIRECTION_NONE.
+         * @return true if trace fully crosses the Area's Line including 
+         * line-width, false otherwise.
+         */
+        bool CheckForLineCross(bool intersects, 
+            const dsl_coordinate& firstCoordinate, 
+            const dsl_coordinate& lastCoordinate, uint& direction);
             
         /**
          * @brief RGBA Line Display Type used to define the Area's location, 
@@ -432,6 +522,31 @@ namespace DSL
         bool DoesTraceCrossLine(dsl_coordinate* coordinates, uint numCoordinates,
             uint& direction);
 
+        /**
+         * @brief Checks if a single trace segment intersects the Area's Multi-Line
+         * Display Type. Uses exact integer arithmetic.
+         * @param[in] coordinate1 first end-point of the trace segment.
+         * @param[in] coordinate2 second end-point of the trace segment.
+         * @return true if the segment touches or crosses the Multi-Line.
+         */
+        bool DoesSegmentIntersectLine(const dsl_coordinate& coordinate1,
+            const dsl_coordinate& coordinate2);
+            
+        /**
+         * @brief Applies the line-width hysteresis and direction tests to a
+         * trace once its intersection with the Area's Multi-Line has been determined.
+         * @param[in] intersects true if the trace intersects the Multi-Line.
+         * @param[in] firstCoordinate first coordinate of the trace.
+         * @param[in] lastCoordinate last coordinate of the trace.
+         * @param[out] direction one of the DSL_AREA_CROSS_DIRECTION_* constants 
+         * defining the direction of the cross, including DSL_AREA_CROSS_DIRECTION_NONE.
+         * @return true if trace fully crosses the Area's Multi-Line including 
+         * line-width, false otherwise.
+         */
+        bool CheckForLineCross(bool intersects, 
+            const dsl_coordinate& firstCoordinate, 
+            const dsl_coordinate& lastCoordinate, uint& direction);
+
         /**
          * @brief RGBA Multi-Line Display Type used to define the Area's location, 
          * dimensions, and color
@@ -27,35 +27,105 @@ THE SOFTWARE.
 
 namespace DSL
 {
+    TrackedObjectHistory::TrackedObjectHistory(uint64_t trackingId, 
+        uint64_t frameNumber, const NvBbox_Coords* pCoordinates, uint maxHistory)
+        : trackingId(trackingId)
+        , frameNumber(frameNumber)
+        , m_maxHistory(maxHistory)
+        , m_traceEnd(0)
+    {
+        // No function log - avoid overhead.
+        
+        if (m_maxHistory)
+        {
+            m_bboxTrace.push_back(*pCoordinates);
+            m_traceEnd++;
+        }
+    }
+    
+    void TrackedObjectHistory::SetMaxHistory(uint maxHistory)
+    {
+        LOG_FUNC();
+        
+        m_maxHistory = maxHistory;
+    }
+    
+    void TrackedObjectHistory::Update(uint64_t currentFrameNumber, 
+        const NvBbox_Coords* pCoordinates)
+    {
+        // No function log - avoid overhead.
+        
+        // Already updated by another Tracked Object for this frame.
+        if (m_traceEnd and currentFrameNumber == frameNumber)
+        {
+            return;
+        }
+        frameNumber = currentFrameNumber;
+        
+        // If maintaining bbox trace-point history
+        if (m_maxHistory)
+        {
+            while (m_bboxTrace.size() >= m_maxHistory)
+            {
+                m_bboxTrace.pop_front();
+            }
+            m_bboxTrace.push_back(*pCoordinates);
+            m_traceEnd++;
+        }
+    }
+
+    //********************************************************************************
+
+    static double wall_clock_time_ms()
+    {
+        timeval currentTime;
+        gettimeofday(&currentTime, NULL);
+        
+        return currentTime.tv_sec*1000.0 + currentTime.tv_usec/1000.0;
+    }
+
     TrackedObject::TrackedObject(uint64_t trackingId, uint64_t frameNumber,
         const NvBbox_Coords* pCoordinates, DSL_RGBA_COLOR_PTR pColor, 
         uint maxHistory)
-        : trackingId(trackingId)
-        , m_maxHistory(maxHistory)
-        , frameCount(0)
+        : TrackedObject(nullptr, std::shared_ptr<TrackedObjectHistory>(
+            new TrackedObjectHistory(trackingId, frameNumber, pCoordinates, 
+                maxHistory)), pCoordinates, pColor, maxHistory, 
+                wall_clock_time_ms())
+    {
+        // No function log - avoid overhead.
+    }
+    
+    TrackedObject::TrackedObject(std::shared_ptr<TrackedObjectStore> pStore,
+        std::shared_ptr<TrackedObjectHistory> pHistory,
+        const NvBbox_Coords* pCoordinates, DSL_RGBA_COLOR_PTR pColor, 
+        uint maxHistory, double creationTimeMs)
+        : trackingId(pHistory->trackingId)
+        , frameNumber(pHistory->frameNumber)
+        , frameCount(1)
         , preEventFrameCount(1)
         , onEventFrameCount(0)
+        , m_pStore(pStore)
+        , m_pHistory(pHistory)
+        , m_lastBbox(*pCoordinates)
+        , m_traceEnd(0)
+        , m_maxHistory(maxHistory)
+        , m_traceStart(0)
+        , m_prevTraceStart(0)
+        , m_hasPrevTrace(false)
     {
         // No function log - avoid overhead.
         
-        m_pBboxTrace = std::shared_ptr<std::deque<std::shared_ptr<NvBbox_Coords>>>(
-            new std::deque<std::shared_ptr<NvBbox_Coords>>);
-        
-        timeval creationTime;
-        gettimeofday(&creationTime, NULL);
-        m_creationTimeMs = creationTime.tv_sec*1000.0 + creationTime.tv_usec/1000.0;
+        // The creation time is per Tracking Trigger - not shared - so that 
+        // persistence is measured from when this Trigger started tracking.
+        m_creationTimeMs = creationTimeMs;
         
-        // update will increment the frameCount to 1
-        Update(frameNumber, pCoordinates);
+        // The trace starts with the history's bbox for the current frame
+        pushHistoryIndex();
         
         if (pColor)
         {
             m_pColor = std::shared_ptr<RgbaColor>(new RgbaColor(*pColor));
         }
-        else
-        {
-            m_pColor = std::shared_ptr<RgbaColor>(new RgbaColor());
-        }
     }
     
     void TrackedObject::SetMaxHistory(uint maxHistory)
@@ -70,69 +140,124 @@ namespace DSL
     {
         // No function log - avoid overhead.
         
+        // Already updated for this frame.
+        if (currentFrameNumber == frameNumber)
+        {
+            return;
+        }
         // increment the total number of tracked frames
         frameCount++;
         
         // update the tracked object's frame number - the filter used for purging.
         frameNumber = currentFrameNumber;
         
-        // Copy only the rectangle coordinates of the Object's RectParams
-        std::shared_ptr pBboxCoords = 
-            std::shared_ptr<NvBbox_Coords>(new NvBbox_Coords);
-            
-        *pBboxCoords = *pCoordinates;
-
-        // If maintaining bbox trace-point history
-        if (m_maxHistory)
+        m_lastBbox = *pCoordinates;
+        
+        // The shared history is updated once per frame - by the first 
+        // Tracked Object to be updated - under the lock of its store.
+        if (m_pStore)
         {
-            // if there's a previous trace, purge from this deque first.
-            if (m_pPrevBboxTrace)
+            m_pStore->UpdateHistory(m_pHistory, currentFrameNumber, pCoordinates);
+        }
+        else
+        {
+            m_pHistory->Update(currentFrameNumber, pCoordinates);
+        }
+        pushHistoryIndex();
+        
+        // If there's a previous trace, purge from the previous trace first. 
+        // The previous and current traces share the bbox at m_traceStart, 
+        // and together are limited to m_maxHistory bboxes.
+        if (m_hasPrevTrace)
+        {
+            if (m_traceEnd+1 > m_maxHistory)
             {
-                // while there are elements to purge..
-                while (m_pPrevBboxTrace and 
-                    (m_pPrevBboxTrace->size() + m_pBboxTrace->size() >= m_maxHistory))
-                {
-                   m_pPrevBboxTrace->pop_front();
-                   
-                   // If we've emptied the previous trace deque then remove it.
-                   if (m_pPrevBboxTrace->empty())
-                   {
-                       m_pPrevBboxTrace = nullptr;
-                   }
-                }
-                
+                m_prevTraceStart = std::max(m_prevTraceStart, 
+                    m_traceEnd+1 - m_maxHistory);
             }
-            else
+            // If we've emptied the previous trace then remove it.
+            if (m_prevTraceStart > m_traceStart)
             {
-                while (m_pBboxTrace->size() >= m_maxHistory)
-                {
-                   m_pBboxTrace->pop_front();
-                }
-            }            
-            m_pBboxTrace->push_back(pBboxCoords);
+                m_hasPrevTrace = false;
+            }
+        }
+    }
+
+    void TrackedObject::pushHistoryIndex()
+    {
+        // The history's last bbox is the bbox for the current frame.
+        if (!m_maxHistory or 
+            m_pHistory->GetTraceEnd() == m_pHistory->GetTraceBegin())
+        {
+            return;
+        }
+        m_historyIndexes.push_back(m_pHistory->GetTraceEnd()-1);
+        m_traceEnd++;
+        
+        // The previous and current traces share a bbox.
+        while (m_historyIndexes.size() > m_maxHistory+1)
+        {
+            m_historyIndexes.pop_front();
         }
     }
 
     double TrackedObject::GetDurationMs()
     {
-        timeval currentTime;
-        gettimeofday(&currentTime, NULL);
+        return GetDurationMs(wall_clock_time_ms());
+    }
+
+    double TrackedObject::GetDurationMs(double currentTimeMs)
+    {
+        return currentTimeMs - m_creationTimeMs;
+    }
+
+    uint64_t TrackedObject::historyBegin()
+    {
+        uint64_t begin = m_traceEnd - m_historyIndexes.size();
         
-        return (currentTime.tv_sec*1000.0 + currentTime.tv_usec/1000.0) -
-            m_creationTimeMs;
+        // Bboxes purged from the shared history are the oldest.
+        uint64_t historyTraceBegin = m_pHistory->GetTraceBegin();
+        for (auto index: m_historyIndexes)
+        {
+            if (index >= historyTraceBegin)
+            {
+                break;
+            }
+            begin++;
+        }
+        return begin;
+    }
+
+    uint64_t TrackedObject::traceBegin()
+    {
+        uint64_t begin = (m_traceEnd > m_maxHistory) 
+            ? std::max(m_traceStart, m_traceEnd - m_maxHistory) : m_traceStart;
+            
+        return std::max(begin, historyBegin());
+    }
+    
+    uint64_t TrackedObject::previousTraceBegin()
+    {
+        return std::max(m_prevTraceStart, historyBegin());
     }
 
     dsl_coordinate TrackedObject::GetFirstCoordinate(uint testPoint)
     {
         dsl_coordinate traceCoordinate{0};
-        getCoordinate(m_pBboxTrace->front(), testPoint, traceCoordinate);
+        uint64_t begin = traceBegin();
+        
+        getCoordinate((begin < m_traceEnd) ? getBbox(begin) : m_lastBbox,
+            testPoint, traceCoordinate);
         return traceCoordinate;
     }
     
     dsl_coordinate TrackedObject::GetLastCoordinate(uint testPoint)
     {
         dsl_coordinate traceCoordinate{0};
-        getCoordinate(m_pBboxTrace->back(), testPoint, traceCoordinate);
+        
+        // The history may be empty, or purged, while the object is tracked.
+        getCoordinate((traceBegin() < m_traceEnd) ? getBbox(m_traceEnd-1) 
+            : m_lastBbox, testPoint, traceCoordinate);
         return traceCoordinate;
     }
     
@@ -141,30 +266,12 @@ namespace DSL
     {
         // No function log - avoid overhead.
         
-        // Create the trace - i.e. a vector of pre-sized blank coordinates
-        std::vector<dsl_coordinate> traceCoordinates;
-
-        dsl_coordinate traceCoordinate{0};
-            
-        if (method == DSL_OBJECT_TRACE_TEST_METHOD_END_POINTS)
-        {
-            getCoordinate(m_pBboxTrace->front(), testPoint, traceCoordinate);
-            traceCoordinates.push_back(traceCoordinate);
-            
-            getCoordinate(m_pBboxTrace->back(), testPoint, traceCoordinate);
-            traceCoordinates.push_back(traceCoordinate);
-        }
+        return newTrace(traceBegin(), m_traceEnd, testPoint, method, lineWidth);
+    }
 
-        else
-        {
-            for (const auto& ideque: *m_pBboxTrace)
-            {
-                getCoordinate(ideque, testPoint, traceCoordinate);
-                traceCoordinates.push_back(traceCoordinate);
-            }
-        }
-        return DSL_RGBA_MULTI_LINE_NEW("", traceCoordinates.data(), 
-            traceCoordinates.size(), lineWidth, m_pColor);
+    bool TrackedObject::HasPreviousTrace()
+    {
+        return m_hasPrevTrace and (previousTraceBegin() <= m_traceStart);
     }
 
     DSL_RGBA_MULTI_LINE_PTR TrackedObject::GetPreviousTrace(
@@ -172,92 +279,110 @@ namespace DSL
     {
         // No function log - avoid overhead.
         
-        if (m_pPrevBboxTrace == nullptr)
+        if (!HasPreviousTrace())
         {
             return nullptr;
         }
-        
+        return newTrace(previousTraceBegin(), m_traceStart+1, 
+            testPoint, method, lineWidth);
+    }
+
+    DSL_RGBA_MULTI_LINE_PTR TrackedObject::newTrace(uint64_t begin, 
+        uint64_t end, uint testPoint, uint method, uint lineWidth)
+    {
         // Create the trace - i.e. a vector of pre-sized blank coordinates
         std::vector<dsl_coordinate> traceCoordinates;
 
         dsl_coordinate traceCoordinate{0};
-            
-        if (method == DSL_OBJECT_TRACE_TEST_METHOD_END_POINTS)
+        
+        // The trace is empty if the history is, use the last bbox updated.
+        if (begin >= end)
+        {
+            getCoordinate(m_lastBbox, testPoint, traceCoordinate);
+            traceCoordinates.push_back(traceCoordinate);
+        }
+        else if (method == DSL_OBJECT_TRACE_TEST_METHOD_END_POINTS)
         {
-            getCoordinate(m_pPrevBboxTrace->front(), testPoint, traceCoordinate);
+            getCoordinate(getBbox(begin), testPoint, traceCoordinate);
             traceCoordinates.push_back(traceCoordinate);
             
-            getCoordinate(m_pPrevBboxTrace->back(), testPoint, traceCoordinate);
+            getCoordinate(getBbox(end-1), testPoint, traceCoordinate);
             traceCoordinates.push_back(traceCoordinate);
         }
 
         else
         {
-            traceCoordinates.reserve(m_pPrevBboxTrace->size());
-            for (const auto& ideque: *m_pPrevBboxTrace)
+            traceCoordinates.reserve(end - begin);
+            for (uint64_t i = begin; i < end; i++)
             {
-                getCoordinate(ideque, testPoint, traceCoordinate);
+                getCoordinate(getBbox(i), testPoint, traceCoordinate);
                 traceCoordinates.push_back(traceCoordinate);
             }
         }
+        
+        // The color is only created if and when the trace is requested.
+        if (!m_pColor)
+        {
+            m_pColor = std::shared_ptr<RgbaColor>(new RgbaColor());
+        }
         return DSL_RGBA_MULTI_LINE_NEW("", traceCoordinates.data(), 
             traceCoordinates.size(), lineWidth, m_pColor);
     }
 
     void TrackedObject::HandleOccurrence()
     {
-        m_pPrevBboxTrace = m_pBboxTrace;
-        m_pBboxTrace = std::shared_ptr<std::deque<std::shared_ptr<NvBbox_Coords>>>(
-            new std::deque<std::shared_ptr<NvBbox_Coords>>);
-
-        // Add last point of previous trace as first point to current trace to ensure
-        // a continuous line (line segment between previous-trace-end and current-trace-start) 
-        m_pBboxTrace->push_back(m_pPrevBboxTrace->back());
+        // The current trace becomes the previous trace. The last point of the
+        // previous trace is the first point of the current trace to ensure a 
+        // continuous line (line segment between previous-trace-end and 
+        // current-trace-start) 
+        m_prevTraceStart = traceBegin();
+        m_traceStart = (m_traceEnd) ? m_traceEnd-1 : 0;
+        m_hasPrevTrace = true;
 
         preEventFrameCount = 1;
         onEventFrameCount = 0;
     }
     
-    void TrackedObject::getCoordinate(std::shared_ptr<NvBbox_Coords> pBbox, 
+    void TrackedObject::getCoordinate(const NvBbox_Coords& bbox, 
         uint testPoint, dsl_coordinate& traceCoordinate)
     {
         switch (testPoint)
         {
         case DSL_BBOX_POINT_CENTER :
-            traceCoordinate.x = round(pBbox->left + pBbox->width/2);
-            traceCoordinate.y = round(pBbox->top + pBbox->height/2);
+            traceCoordinate.x = round(bbox.left + bbox.width/2);
+            traceCoordinate.y = round(bbox.top + bbox.height/2);
             break;
         case DSL_BBOX_POINT_NORTH_WEST :
-            traceCoordinate.x = round(pBbox->left);
-            traceCoordinate.y = round(pBbox->top);
+            traceCoordinate.x = round(bbox.left);
+            traceCoordinate.y = round(bbox.top);
             break;
         case DSL_BBOX_POINT_NORTH :
-            traceCoordinate.x = round(pBbox->left + pBbox->width/2);
-            traceCoordinate.y = round(pBbox->top);
+            traceCoordinate.x = round(bbox.left + bbox.width/2);
+            traceCoordinate.y = round(bbox.top);
             break;
         case DSL_BBOX_POINT_NORTH_EAST :
-            traceCoordinate.x = round(pBbox->left + pBbox->width);
-            traceCoordinate.y = round(pBbox->top);
+            traceCoordinate.x = round(bbox.left + bbox.width);
+            traceCoordinate.y = round(bbox.top);
             break;
         case DSL_BBOX_POINT_EAST :
-            traceCoordinate.x = round(pBbox->left + pBbox->width);
-            traceCoordinate.y = round(pBbox->top + pBbox->height/2);
+            traceCoordinate.x = round(bbox.left + bbox.width);
+            traceCoordinate.y = round(bbox.top + bbox.height/2);
             break;
         case DSL_BBOX_POINT_SOUTH_EAST :
-            traceCoordinate.x = round(pBbox->left + pBbox->width);
-            traceCoordinate.y = round(pBbox->top + pBbox->height);
+            traceCoordinate.x = round(bbox.left + bbox.width);
+            traceCoordinate.y = round(bbox.top + bbox.height);
             break;
         case DSL_BBOX_POINT_SOUTH :
-            traceCoordinate.x = round(pBbox->left + pBbox->width/2);
-            traceCoordinate.y = round(pBbox->top + pBbox->height);
+            traceCoordinate.x = round(bbox.left + bbox.width/2);
+            traceCoordinate.y = round(bbox.top + bbox.height);
             break;
         case DSL_BBOX_POINT_SOUTH_WEST :
-            traceCoordinate.x = round(pBbox->left);
-            traceCoordinate.y = round(pBbox->top + pBbox->height);
+            traceCoordinate.x = round(bbox.left);
+            traceCoordinate.y = round(bbox.top + bbox.height);
             break;
         case DSL_BBOX_POINT_WEST :
-            traceCoordinate.x = round(pBbox->left);
-            traceCoordinate.y = round(pBbox->top + pBbox->height/2);
+            traceCoordinate.x = round(bbox.left);
+            traceCoordinate.y = round(bbox.top + bbox.height/2);
             break;
         default:
             LOG_ERROR("Invalid DSL_BBOX_POINT = '" << testPoint 
@@ -268,11 +393,185 @@ namespace DSL
     
     //********************************************************************************
     
+    TrackedObjectStore::TrackedObjectStore()
+        : m_maxHistory(0)
+    {
+        LOG_FUNC();
+    }
+    
+    std::shared_ptr<TrackedObjectHistory> TrackedObjectStore::Update(
+        NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
+    {
+        // No function log - avoid overhead.
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_storeMutex);
+        
+        HistoriesT& histories = m_historiesPerSource[pFrameMeta->source_id];
+        
+        auto iter = histories.find(pObjectMeta->object_id);
+        if (iter == histories.end())
+        {
+            std::shared_ptr<TrackedObjectHistory> pHistory = 
+                std::shared_ptr<TrackedObjectHistory>(new TrackedObjectHistory(
+                    pObjectMeta->object_id, pFrameMeta->frame_num,
+                    (NvBbox_Coords*)&pObjectMeta->rect_params, m_maxHistory));
+                    
+            histories[pObjectMeta->object_id] = pHistory;
+            return pHistory;
+        }
+        iter->second->Update(pFrameMeta->frame_num, 
+            (NvBbox_Coords*)&pObjectMeta->rect_params);
+        return iter->second;
+    }
+    
+    void TrackedObjectStore::UpdateHistory(
+        std::shared_ptr<TrackedObjectHistory> pHistory,
+        uint64_t frameNumber, const NvBbox_Coords* pCoordinates)
+    {
+        // No function log - avoid overhead.
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_storeMutex);
+        
+        pHistory->Update(frameNumber, pCoordinates);
+    }
+    
+    void TrackedObjectStore::Purge()
+    {
+        // No function log - avoid overhead.
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_storeMutex);
+
+        for (auto &histories: m_historiesPerSource)
+        {
+            auto history = histories.second.begin();
+            while (history != histories.second.end())
+            {
+                // If only referenced by the store, then no Tracked Object 
+                // of any Trigger is tracking the object.
+                if (history->second.use_count() == 1)
+                {
+                    history = histories.second.erase(history);
+                }
+                else
+                {
+                    history++;
+                }
+            }
+        }
+    }
+    
+    void TrackedObjectStore::Clear()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_storeMutex);
+        
+        m_historiesPerSource.clear();
+    }
+    
+    uint TrackedObjectStore::GetSize()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_storeMutex);
+        
+        uint size(0);
+        for (const auto &histories: m_historiesPerSource)
+        {
+            size += histories.second.size();
+        }
+        return size;
+    }
+    
+    void TrackedObjectStore::SetClientMaxHistory(const std::string& client, 
+        uint maxHistory)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_storeMutex);
+        
+        m_clientMaxHistories[client] = maxHistory;
+        updateMaxHistory();
+    }
+    
+    void TrackedObjectStore::RemoveClient(const std::string& client)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_storeMutex);
+        
+        m_clientMaxHistories.erase(client);
+        updateMaxHistory();
+    }
+    
+    uint TrackedObjectStore::GetMaxHistory()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_storeMutex);
+        
+        return m_maxHistory;
+    }
+    
+    void TrackedObjectStore::updateMaxHistory()
+    {
+        uint maxHistory(0);
+        for (const auto &imap: m_clientMaxHistories)
+        {
+            maxHistory = std::max(maxHistory, imap.second);
+        }
+        if (maxHistory == m_maxHistory)
+        {
+            return;
+        }
+        m_maxHistory = maxHistory;
+        
+        for (const auto &histories: m_historiesPerSource)
+        {
+            for (const auto &history: histories.second)
+            {
+                history.second->SetMaxHistory(m_maxHistory);
+            }
+        }
+    }
+    
+    //********************************************************************************
+    
     TrackedObjects::TrackedObjects(uint maxHistory, uint maxMissingFromFrame)
         : m_maxHistory(maxHistory)
         , m_maxMissingFromFrame(maxMissingFromFrame)
+        , m_replayEnabled(false)
+        , m_isStoreShared(false)
+    {
+        LOG_FUNC();
+        
+        m_pStore = std::shared_ptr<TrackedObjectStore>(new TrackedObjectStore());
+        m_pStore->SetClientMaxHistory(m_client, m_maxHistory);
+    }
+    
+    TrackedObjects::~TrackedObjects()
     {
         LOG_FUNC();
+        
+        // Release all histories before removing this client from the store.
+        m_trackedObjectsPerSource.clear();
+        
+        if (m_isStoreShared)
+        {
+            m_pStore->RemoveClient(m_client);
+        }
+    }
+    
+    void TrackedObjects::SetStore(std::shared_ptr<TrackedObjectStore> pStore, 
+        const std::string& client)
+    {
+        LOG_FUNC();
+        
+        m_trackedObjectsPerSource.clear();
+        
+        if (m_isStoreShared)
+        {
+            m_pStore->RemoveClient(m_client);
+        }
+        m_isStoreShared = (pStore != nullptr);
+        m_client = client;
+        m_pStore = (m_isStoreShared) 
+            ? pStore 
+            : std::shared_ptr<TrackedObjectStore>(new TrackedObjectStore());
+            
+        m_pStore->SetClientMaxHistory(m_client, m_maxHistory);
     }
     
     bool TrackedObjects::IsTracked(uint sourceId, uint64_t trackingId)
@@ -335,11 +634,12 @@ namespace DSL
                 << " for source = " << pFrameMeta->source_id);
             
             // create a new tracked object for this tracking Id and source
+            // with the object's shared history updated for the current frame.
             std::shared_ptr<TrackedObject> pTrackedObject = 
-                std::shared_ptr<TrackedObject>(new TrackedObject(
-                    pObjectMeta->object_id, pFrameMeta->frame_num, 
+                std::shared_ptr<TrackedObject>(new TrackedObject(m_pStore,
+                    m_pStore->Update(pFrameMeta, pObjectMeta), 
                     (NvBbox_Coords*)&pObjectMeta->rect_params, 
-                    pColor, m_maxHistory));
+                    pColor, m_maxHistory, GetCurrentTimeMs(pFrameMeta)));
                 
             // create a map of tracked objects for this source    
             std::shared_ptr<TrackedObjectsT> pTrackedObjects = 
@@ -366,11 +666,12 @@ namespace DSL
                 << " for source = " << pFrameMeta->source_id);
             
             // create a new tracked object for this tracking Id and source
+            // with the object's shared history updated for the current frame.
             std::shared_ptr<TrackedObject> pTrackedObject = 
-                std::shared_ptr<TrackedObject>(new TrackedObject(
-                    pObjectMeta->object_id, pFrameMeta->frame_num,
+                std::shared_ptr<TrackedObject>(new TrackedObject(m_pStore,
+                    m_pStore->Update(pFrameMeta, pObjectMeta), 
                     (NvBbox_Coords*)&pObjectMeta->rect_params, 
-                    pColor, m_maxHistory));
+                    pColor, m_maxHistory, GetCurrentTimeMs(pFrameMeta)));
 
             // insert the new tracked object into the new map    
             pTrackedObjects->insert(std::pair<uint64_t, 
@@ -443,11 +744,21 @@ namespace DSL
                 }            
             }
         }
+        // Histories in a shared store are purged by the owner of the store.
+        if (!m_isStoreShared)
+        {
+            m_pStore->Purge();
+        }
     }
     
     void TrackedObjects::Clear()
     {
         m_trackedObjectsPerSource.clear();
+        
+        if (!m_isStoreShared)
+        {
+            m_pStore->Clear();
+        }
     }
     
     double TrackedObjects::GetCreationTime(NvDsFrameMeta* pFrameMeta, 
@@ -465,7 +776,25 @@ namespace DSL
         std::shared_ptr<TrackedObjectsT> pTrackedObjects = 
             m_trackedObjectsPerSource[pFrameMeta->source_id];
             
-        return pTrackedObjects->at(pObjectMeta->object_id)->GetDurationMs();
+        return pTrackedObjects->at(pObjectMeta->object_id)->GetDurationMs(
+            GetCurrentTimeMs(pFrameMeta));
+    }
+
+    void TrackedObjects::SetReplayEnabled(bool enabled)
+    {
+        LOG_FUNC();
+        
+        m_replayEnabled = enabled;
+    }
+    
+    double TrackedObjects::GetCurrentTimeMs(NvDsFrameMeta* pFrameMeta)
+    {
+        // No function log - avoid overhead.
+        
+        // ntp_timestamp is in units of ns
+        return (m_replayEnabled)
+            ? pFrameMeta->ntp_timestamp/1000000.0
+            : wall_clock_time_ms();
     }
 
     void TrackedObjects::SetMaxHistory(uint maxHistory)
@@ -484,6 +813,7 @@ namespace DSL
                 trackedObject.second->SetMaxHistory(maxHistory);
             }
         }
+        m_pStore->SetClientMaxHistory(m_client, m_maxHistory);
     }
     
     void TrackedObjects::SetMaxMissingFromFrame(uint maxMissingFromFrame)
@@ -32,10 +32,144 @@ THE SOFTWARE.
 
 namespace DSL
 {
+    /**
+     * @struct TraceCrossState
+     * @brief Incremental line-cross state for a Tracked Object and a single
+     * ODE Area. Maintains one intersection flag for each segment of the
+     * object's current bbox trace so that only the newest segment needs to 
+     * be tested on each new frame.
+     */
+    struct TraceCrossState
+    {
+        TraceCrossState()
+            : traceEnd(0)
+            , lastCoordinate{0}
+            , intersectCount(0)
+        {};
+        
+        /**
+         * @brief Tracked Object's trace-end index when the state was last 
+         * updated, 0 if the state has yet to be updated.
+         */
+        uint64_t traceEnd;
+        
+        /**
+         * @brief last trace coordinate when the state was last updated.
+         */
+        dsl_coordinate lastCoordinate;
+        
+        /**
+         * @brief intersection flag for each segment of the current trace, 
+         * oldest segment first.
+         */
+        std::deque<bool> segmentIntersects;
+        
+        /**
+         * @brief number of segments in the current trace that intersect.
+         */
+        uint intersectCount;
+    };
+
+    /**
+     * @class TrackedObjectHistory
+     * @file DslOdeTrackedObject.h
+     * @brief Implements the bbox history of a single tracked object. The 
+     * history is shared by the Tracked Objects of all Tracking Triggers that 
+     * track the object, and is updated at most once per frame.
+     */
+    class TrackedObjectHistory
+    {
+    public:
+
+        /**
+         * @brief Ctor for the TrackedObjectHistory class
+         * @param[in] unique trackingId for the tracked object
+         * @param[in] frameNumber the object was first detected
+         * @param[in] pCoordinates bounding box coordinates from the object's meta 
+         * when first detected
+         * @param[in] maxHistory maximum number of bbox coordinates to maintain
+         */
+        TrackedObjectHistory(uint64_t trackingId, uint64_t frameNumber,
+            const NvBbox_Coords* pCoordinates, uint maxHistory);
+            
+        /**
+         * @brief Sets the max history for this tracked object history.
+         * @param maxHistory new max history setting.
+         */
+        void SetMaxHistory(uint maxHistory);
+        
+        /**
+         * @brief Updates the history's last frame number and pushes a new set
+         * of bbox coordinates on to the history's trace. Subsequent calls for
+         * the same frame number are ignored.
+         * @param[in] currentFrameNumber new frame number to save
+         * @param[in] pCoordinates new bounding box coordinates to push.
+         */
+        void Update(uint64_t currentFrameNumber, const NvBbox_Coords* pCoordinates);
+        
+        /**
+         * @brief Gets the index of the first bbox maintained in the trace.
+         * @return index of the first bbox, equal to GetTraceEnd() if empty.
+         */
+        uint64_t GetTraceBegin(){return m_traceEnd - m_bboxTrace.size();};
+        
+        /**
+         * @brief Gets the index one past the last bbox pushed on to the trace,
+         * i.e. the total number of bboxes pushed since creation.
+         * @return index one past the last bbox.
+         */
+        uint64_t GetTraceEnd(){return m_traceEnd;};
+        
+        /**
+         * @brief Gets a bbox from the trace by index.
+         * @param[in] index of the bbox, GetTraceBegin() <= index < GetTraceEnd()
+         * @return the bbox coordinates at index.
+         */
+        const NvBbox_Coords& GetBbox(uint64_t index)
+        {
+            return m_bboxTrace[index - GetTraceBegin()];
+        };
+        
+        /**
+         * @brief unique tracking id for the tracked object.
+         */
+        uint64_t trackingId;
+        
+        /**
+         * @brief frame number of the last update.
+         */
+        uint64_t frameNumber;
+        
+    private:
+
+        /**
+         * @brief maximum number of bbox coordinates to maintain.
+         */
+        uint m_maxHistory;
+
+        /**
+         * @brief index one past the last bbox pushed on to m_bboxTrace.
+         */
+        uint64_t m_traceEnd;
+        
+        /**
+         * @brief a max sized queue of bbox coordinates, oldest first.
+         */
+        std::deque<NvBbox_Coords> m_bboxTrace;
+    };
+    
+    //*******************************************************************************
+
+    class TrackedObjectStore;
+
     /**
      * @class TrackedObject
      * @file DslOdeTrackedObject.h
-     * @brief Implements a Tracked Object with a history of bbox coordinates.
+     * @brief Implements a Tracking Trigger's view of a Tracked Object. The 
+     * bbox coordinates are maintained by a TrackedObjectHistory that may be 
+     * shared with other Tracking Triggers. The view maintains the Trigger's 
+     * own frame counts and trace, as indexes into the shared history of the 
+     * frames the Trigger updated the object with.
      */
     class TrackedObject
     {
@@ -55,6 +189,24 @@ namespace DSL
             const NvBbox_Coords* pCoordinates, DSL_RGBA_COLOR_PTR pColor, 
             uint maxHistory);
             
+        /**
+         * @brief Ctor for the TrackedObject class with a shared history.
+         * @param[in] pStore store that maintains the shared history.
+         * @param[in] pHistory shared history for the tracked object, already
+         * updated with the current frame.
+         * @param[in] pCoordinates bounding box coordinates from the object's 
+         * meta when first detected
+         * @param[in] pColor shared pointer to an RGBA Color Type to
+         * set a unique color for the tracked object. 
+         * @param[in] maxHistory maximum number of bbox coordinates to track
+         * @param[in] creationTimeMs time the object was first detected, 
+         * wall-clock time or the recorded frame time when replaying.
+         */
+        TrackedObject(std::shared_ptr<TrackedObjectStore> pStore,
+            std::shared_ptr<TrackedObjectHistory> pHistory,
+            const NvBbox_Coords* pCoordinates, DSL_RGBA_COLOR_PTR pColor, 
+            uint maxHistory, double creationTimeMs);
+            
         /**
          * @brief Sets the max history for this tracked object
          * @param maxHistory new max history setting.
@@ -64,27 +216,45 @@ namespace DSL
         /**
          * @brief function to update the tracked-object's last frame number and 
          * push a new set of positional bbox coordinates on to the tracked 
-         * object's m_bboxTrace queue.
+         * object's trace. Subsequent calls for the same frame are ignored.
          * @param[in] currentFrameNumber new frame number to save
          * @param[in] pCoordinates new bounding box coordinates to push.
          */
         void Update(uint64_t currentFrameNumber, const NvBbox_Coords* pCoordinates);
         
         /**
-         * @brief calculates the duration of time the object has been tracked.
+         * @brief calculates the duration of time the object has been tracked
+         * by this Tracking Trigger, independent of the shared history.
          * @return the duration in units of ms
          */
         double GetDurationMs();
         
+        /**
+         * @brief calculates the duration of time the object has been tracked
+         * by this Tracking Trigger up to a given time.
+         * @param[in] currentTimeMs current time, wall-clock time or the 
+         * recorded frame time when replaying.
+         * @return the duration in units of ms
+         */
+        double GetDurationMs(double currentTimeMs);
+        
         /**
          * @brief Gets the current size of the bounding box trace.
          * @return current size of the bbox trace.
          */
-        size_t BboxTraceSize(){return m_pBboxTrace->size();};
+        size_t BboxTraceSize(){return m_traceEnd - traceBegin();};
+        
+        /**
+         * @brief Gets the index one past the last bbox in the trace. The index
+         * increases by one for each bbox added to the trace.
+         * @return index one past the last bbox.
+         */
+        uint64_t GetTraceEnd(){return m_traceEnd;};
         
         /**
          * @brief Gets the coordinates for a specific test-point for the 
-         * first bounding box in the TrackedObject's history.
+         * first bounding box in the TrackedObject's history, or for the 
+         * last bounding box updated if the history is empty.
          * @param[in] testPoint to generate the coordinates with
          * @return first coordinates 
          */
@@ -92,7 +262,8 @@ namespace DSL
         
         /**
          * @brief Gets the coordinates for a specific test-point for the 
-         * last bounding box in the TrackedObject's history.
+         * last bounding box in the TrackedObject's history, or for the 
+         * last bounding box updated if the history is empty.
          * @param[in] testPoint to generate the coordinates with
          * @return last coordinates
          */
@@ -113,7 +284,7 @@ namespace DSL
          * @brief used to query if the tracked object has a previous Trace
          * from a previous line cross event.
          */
-        bool HasPreviousTrace(){return m_pPrevBboxTrace != nullptr;};
+        bool HasPreviousTrace();
 
         /**
          * @brief Returns a vector of coordinates defining the TrackedObject's
@@ -128,10 +299,21 @@ namespace DSL
             
         /**
          * @brief Handles an ODE Occurrence for this tracked object. The current
-         * m_pBboxTrace is moved to the m_pPreviousBboxTrace and a new/empty
-         * m_pBboxTrace is created.
+         * trace becomes the previous trace and a new trace is started with the
+         * last point of the previous trace.
          */
         void HandleOccurrence();
+        
+        /**
+         * @brief Gets the incremental line-cross state for a named ODE Area,
+         * the state is created on first call.
+         * @param[in] areaName unique name of the ODE Area.
+         * @return reference to the line-cross state for the ODE Area.
+         */
+        TraceCrossState& GetTraceCrossState(const std::string& areaName)
+        {
+            return m_traceCrossStates[areaName];
+        };
 
         /**
          * @brief unique tracking id for the tracked object.
@@ -164,39 +346,241 @@ namespace DSL
         /**
          * @brief Get an x,y coordinate from a Bbox based on this Trigger's
          * client specified test-point
-         * @param[in] pBbox to optain the coordinate from
+         * @param[in] bbox to optain the coordinate from
          * @param[in] testPoint one of the DSL_BBOX_POINT_* constants
          * @param[out] traceCoordinate x,y coordinate value.
          */
-        void getCoordinate(std::shared_ptr<NvBbox_Coords> pBbox, 
+        void getCoordinate(const NvBbox_Coords& bbox, 
             uint testPoint, dsl_coordinate& traceCoordinate);
+            
+        /**
+         * @brief Pushes the index of the history's bbox for the current frame
+         * on to the trace, if the history is maintained.
+         */
+        void pushHistoryIndex();
+        
+        /**
+         * @brief Gets the index of the first bbox in the trace that is still 
+         * held by the shared history.
+         * @return index of the first bbox, equal to m_traceEnd if none.
+         */
+        uint64_t historyBegin();
+        
+        /**
+         * @brief Gets a bbox from the trace by index.
+         * @param[in] index of the bbox, historyBegin() <= index < m_traceEnd
+         * @return the bbox coordinates at index.
+         */
+        const NvBbox_Coords& getBbox(uint64_t index)
+        {
+            return m_pHistory->GetBbox(m_historyIndexes[index - 
+                (m_traceEnd - m_historyIndexes.size())]);
+        };
+        
+        /**
+         * @brief Gets the index of the first bbox in the current trace.
+         * @return index of the first bbox.
+         */
+        uint64_t traceBegin();
+        
+        /**
+         * @brief Gets the index of the first bbox in the previous trace.
+         * @return index of the first bbox, greater than m_traceStart if the
+         * previous trace is no longer in the shared history.
+         */
+        uint64_t previousTraceBegin();
+        
+        /**
+         * @brief Creates a multi-line from a range of the trace.
+         * @param[in] begin index of the first bbox in the range
+         * @param[in] end index one past the last bbox in the range
+         * @param[in] testPoint test-point to generate the trace with.
+         * @param[in] method one of the DSL_OBJECT_TRACE_TEST_METHOD_* constants
+         * @param[in] lineWidth the width value to assign to the line.
+         * @return shared pointer to a new multi-line.
+         */
+        DSL_RGBA_MULTI_LINE_PTR newTrace(uint64_t begin, uint64_t end, 
+            uint testPoint, uint method, uint lineWidth);
         
         /**
-         * @brief time of creation for this Tracked Object, used to test 
-         * for object persistence.
+         * @brief time this Tracking Trigger started tracking the object, 
+         * used to test for object persistence.
          */
         double m_creationTimeMs;
         
+        /**
+         * @brief store that maintains m_pHistory, nullptr if the history
+         * is private to this tracked object.
+         */
+        std::shared_ptr<TrackedObjectStore> m_pStore;
+        
+        /**
+         * @brief shared bbox history for the tracked object.
+         */
+        std::shared_ptr<TrackedObjectHistory> m_pHistory;
+        
+        /**
+         * @brief bbox coordinates from the last update.
+         */
+        NvBbox_Coords m_lastBbox;
+        
+        /**
+         * @brief index into m_pHistory of each bbox in this tracked object's 
+         * trace, oldest first. Only the frames this tracked object was updated
+         * with are included, even when the history is updated by other 
+         * Tracking Triggers.
+         */
+        std::deque<uint64_t> m_historyIndexes;
+        
+        /**
+         * @brief index one past the last bbox pushed on to the trace, i.e. 
+         * the total number of bboxes pushed since creation.
+         */
+        uint64_t m_traceEnd;
+        
         /**
          * @brief maximum number of bbox coordinates to maintain/trace.
          */
         uint m_maxHistory;
 
         /**
-         * @brief a max sized queue of Rectangle Params.
+         * @brief index of the first bbox in the current trace, before 
+         * limiting the trace to m_maxHistory.
          */
-        std::shared_ptr<std::deque<std::shared_ptr<NvBbox_Coords>>> m_pBboxTrace;
+        uint64_t m_traceStart;
         
         /**
-         * @brief a max sized queue of Rectangle Params.
+         * @brief index of the first bbox in the previous trace, purged on 
+         * update to limit both traces to m_maxHistory. Valid if m_hasPrevTrace.
          */
-        std::shared_ptr<std::deque<std::shared_ptr<NvBbox_Coords>>> m_pPrevBboxTrace;
+        uint64_t m_prevTraceStart;
+        
+        /**
+         * @brief true if a previous trace was created on ODE Occurrence.
+         */
+        bool m_hasPrevTrace;
         
         /**
          * @brief used to identify the tracked object with an RGBA color.
          */
         DSL_RGBA_COLOR_PTR m_pColor;
         
+        /**
+         * @brief map of incremental line-cross states - Key = unique Area name.
+         */
+        std::map<std::string, TraceCrossState> m_traceCrossStates;
+        
+    };
+    
+    //*******************************************************************************
+
+    /**
+     * @class TrackedObjectStore
+     * @file DslOdeTrackedObject.h
+     * @brief Manages a map of tracked object histories per source, shared by 
+     * the Tracked Objects of one or more Tracking Triggers - i.e. all Tracking 
+     * Triggers owned by an ODE Pad Probe Handler.
+     */
+    class TrackedObjectStore
+    {
+    public:
+        /**
+         * @brief Ctor for the TrackedObjectStore class
+         */
+        TrackedObjectStore();
+        
+        /**
+         * @brief Gets the history for an object, creating the history if the 
+         * object is not currently in the store, and updates the history with 
+         * the object's bbox coordinates once per frame.
+         * @param[in] pFrameMeta pointer to the parent NvDsFrameMeta data - 
+         * the frame that holds the Object Meta
+         * @param[in] pObjectMeta pointer to a NvDsObjectMeta data to update with
+         * @return a shared pointer to the object's history.
+         */
+        std::shared_ptr<TrackedObjectHistory> Update(NvDsFrameMeta* pFrameMeta, 
+            NvDsObjectMeta* pObjectMeta);
+        
+        /**
+         * @brief Updates a history from the store with the object's bbox 
+         * coordinates once per frame, under the store's lock.
+         * @param[in] pHistory history to update.
+         * @param[in] frameNumber frame number of the new bbox.
+         * @param[in] pCoordinates new bounding box coordinates to push.
+         */
+        void UpdateHistory(std::shared_ptr<TrackedObjectHistory> pHistory,
+            uint64_t frameNumber, const NvBbox_Coords* pCoordinates);
+        
+        /**
+         * @brief Purges all histories that are no longer referenced by a 
+         * Tracked Object.
+         */
+        void Purge();
+        
+        /**
+         * @brief Clears/deletes all histories.
+         */
+        void Clear();
+        
+        /**
+         * @brief Gets the total number of histories in the store.
+         * @return number of histories for all sources.
+         */
+        uint GetSize();
+        
+        /**
+         * @brief Sets the max history required by a client of the store. The 
+         * store maintains the largest max history of all clients.
+         * @param[in] client unique name of the client, i.e. the Trigger name.
+         * @param[in] maxHistory max history required by the client.
+         */
+        void SetClientMaxHistory(const std::string& client, uint maxHistory);
+        
+        /**
+         * @brief Removes a client's max history requirement from the store.
+         * @param[in] client unique name of the client to remove.
+         */
+        void RemoveClient(const std::string& client);
+        
+        /**
+         * @brief Gets the current max history for all histories in the store.
+         * @return largest max history of all clients.
+         */
+        uint GetMaxHistory();
+        
+    private:
+    
+        /**
+         * @brief Updates m_maxHistory and all histories from the current 
+         * max history of each client.
+         */
+        void updateMaxHistory();
+        
+        /**
+         * @brief largest max history of all clients.
+         */
+        uint m_maxHistory;
+        
+        /**
+         * @brief map of max history per client - Key = unique client name.
+         */
+        std::map<std::string, uint> m_clientMaxHistories;
+        
+        /**
+         * @brief map of histories - Key = unique Tracking Id
+         */
+        typedef std::map <uint64_t, std::shared_ptr<TrackedObjectHistory>> HistoriesT;
+
+        /**
+         * @brief map of histories per source - Key = source Id
+         */
+        std::map <uint, HistoriesT> m_historiesPerSource;
+        
+        /**
+         * @brief mutex to protect the store, and the updates to its histories,
+         * from concurrent per-source frame workers.
+         */
+        DslMutex m_storeMutex;
     };
     
     //*******************************************************************************
@@ -204,7 +588,9 @@ namespace DSL
     /**
      * @class TrackedObjects
      * @file DslOdeTrackedObject.h
-     * @brief Manages a map of tracked objects.
+     * @brief Manages a map of tracked objects for a single Tracking Trigger.
+     * The histories of the tracked objects are maintained by a private 
+     * TrackedObjectStore, or by a store shared with other Triggers.
      */
     class TrackedObjects
     {
@@ -217,6 +603,27 @@ namespace DSL
          */
         TrackedObjects(uint maxHistory, uint maxMissingFromFrame);
         
+        /**
+         * @brief Dtor TrackedObjects class
+         */
+        ~TrackedObjects();
+        
+        /**
+         * @brief Sets the store to maintain the histories of the tracked objects.
+         * All currently tracked objects are cleared.
+         * @param[in] pStore shared store to use, or nullptr to use a new 
+         * private store.
+         * @param[in] client unique name of the client of the shared store.
+         */
+        void SetStore(std::shared_ptr<TrackedObjectStore> pStore, 
+            const std::string& client);
+        
+        /**
+         * @brief Gets the store maintaining the histories of the tracked objects.
+         * @return shared pointer to the current store.
+         */
+        std::shared_ptr<TrackedObjectStore> GetStore(){return m_pStore;};
+        
         /**
          * @brief determines if an object is currently tracked for a given source.
          * @param[in] sourceId source to filter on
@@ -254,7 +661,9 @@ namespace DSL
         void DeleteObject(uint sourceId, uint64_t trackingId);
         
         /**
-         * @brief Purges all tracked objects that are not in the current frame
+         * @brief Purges all tracked objects that are not in the current frame.
+         * Histories in a private store are purged as well, histories in a 
+         * shared store are purged by the owner of the store.
          * @param currentFrameNumber current frame number to use as a purge filter.
          */
         void Purge(uint64_t currentFrameNumber);
@@ -293,6 +702,22 @@ namespace DSL
          */
         void SetMaxMissingFromFrame(uint maxMissingFromFrame);
         
+        /**
+         * @brief Enables/disables replay mode. When enabled, tracked time is
+         * measured with the frame's recorded ntp_timestamp instead of the 
+         * wall-clock so that replayed results match the recorded run.
+         * @param[in] enabled true to enable replay mode, false to disable.
+         */
+        void SetReplayEnabled(bool enabled);
+        
+        /**
+         * @brief Gets the current time for a frame, the frame's recorded 
+         * ntp_timestamp in replay mode, the wall-clock time otherwise.
+         * @param[in] pFrameMeta pointer to the frame's NvDsFrameMeta data.
+         * @return the current time in units of ms
+         */
+        double GetCurrentTimeMs(NvDsFrameMeta* pFrameMeta);
+        
     private:
     
         /**
@@ -306,6 +731,27 @@ namespace DSL
         */
         uint m_maxMissingFromFrame;
         
+        /**
+         * @brief true if tracked time is measured with the recorded frame 
+         * timestamps, false if measured with the wall-clock.
+         */
+        bool m_replayEnabled;
+        
+        /**
+         * @brief store maintaining the histories of the tracked objects.
+         */
+        std::shared_ptr<TrackedObjectStore> m_pStore;
+        
+        /**
+         * @brief true if m_pStore is shared with other clients. 
+         */
+        bool m_isStoreShared;
+        
+        /**
+         * @brief unique name of this client of m_pStore.
+         */
+        std::string m_client;
+        
         /**
          * @brief map of tracked objects - Key = unique Tracking Id
          */
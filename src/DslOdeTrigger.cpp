@@ -33,7 +33,7 @@ namespace DSL
 {
 
     // Initialize static Event Counter
-    uint64_t OdeTrigger::s_eventCount = 0;
+    std::atomic<uint64_t> OdeTrigger::s_eventCount(0);
 
     OdeTrigger::OdeTrigger(const char* name, const char* source, 
         uint classId, uint limit)
@@ -530,6 +530,44 @@ namespace DSL
         
         m_sourceId = id;
     }
+
+    int OdeTrigger::GetSourceIdFilter()
+    {
+        // Don't log function entry/exit - called for every batch
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        
+        if (!m_source.size())
+        {
+            return -1;
+        }
+        // a "one-time-get" of the source Id from the source name
+        if (m_sourceId == -1)
+        {
+            Services::GetServices()->SourceUniqueIdGet(m_source.c_str(), 
+                &m_sourceId);
+        }
+        return m_sourceId;
+    }
+    
+    bool OdeTrigger::IsPerSourceSafe()
+    {
+        // Don't log function entry/exit - called for every batch
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        
+        // Accumulators and Heat-Mappers are serialized with batch-global Triggers
+        if (!m_source.size() or m_pAccumulator or m_pHeatMapper)
+        {
+            return false;
+        }
+        for (const auto &imap: m_pOdeActionsIndexed)
+        {
+            if (!std::dynamic_pointer_cast<OdeAction>(imap.second)->IsParallelSafe())
+            {
+                return false;
+            }
+        }
+        return true;
+    }
     
     const char* OdeTrigger::GetInfer()
     {
@@ -1509,6 +1547,130 @@ namespace DSL
             displayMetaData, pFrameMeta);
     }
 
+    // *****************************************************************************
+
+    CustomBatchOdeTrigger::CustomBatchOdeTrigger(const char* name, 
+        const char* source, uint classId, uint limit, 
+        dsl_ode_check_for_occurrence_batch_cb clientChecker, void* clientData)
+        : OdeTrigger(name, source, classId, limit)
+        , m_clientChecker(clientChecker)
+        , m_clientData(clientData)
+    {
+        LOG_FUNC();
+    }
+
+    CustomBatchOdeTrigger::~CustomBatchOdeTrigger()
+    {
+        LOG_FUNC();
+    }
+    
+    bool CustomBatchOdeTrigger::CheckForOccurrence(GstBuffer* pBuffer, 
+        std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
+    {
+        // Note: function is called from the system (callback) context
+        // Gaurd against property updates from the client API
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        
+        // conditional execution
+        if (!m_enabled or 
+            !m_clientChecker or 
+            !CheckForSourceId(pFrameMeta->source_id) or 
+            !CheckForMinCriteria(pFrameMeta, pObjectMeta) or 
+            !CheckForInside(pObjectMeta))
+        {
+            return false;
+        }
+        
+        dsl_ode_object_record record;
+        record.tracking_id = pObjectMeta->object_id;
+        record.source_id = pFrameMeta->source_id;
+        record.class_id = pObjectMeta->class_id;
+        record.inference_confidence = pObjectMeta->confidence;
+        record.tracker_confidence = pObjectMeta->tracker_confidence;
+        record.left = pObjectMeta->rect_params.left;
+        record.top = pObjectMeta->rect_params.top;
+        record.width = pObjectMeta->rect_params.width;
+        record.height = pObjectMeta->rect_params.height;
+        record.frame_num = pFrameMeta->frame_num;
+        
+        m_objectRecords.push_back(record);
+        m_occurrenceMetaList.push_back(pObjectMeta);
+        
+        return true;
+    }
+    
+    uint CustomBatchOdeTrigger::PostProcessFrame(GstBuffer* pBuffer, 
+        std::vector<NvDsDisplayMeta*>& displayMetaData,  NvDsFrameMeta* pFrameMeta)
+    {
+        // create scope so the property-mutex can be unlocked before
+        // calling the base-class PostProcessFrame which locks the mutex.
+        {
+            // Note: function is called from the system (callback) context
+            // Gaurd against property updates from the client API
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+            
+            m_occurrences = 0;
+            
+            if (m_enabled and m_clientChecker and m_objectRecords.size())
+            {
+                uint flagged(0);
+                m_results.assign(m_objectRecords.size(), 0);
+                try
+                {
+                    // single client call for all objects in the frame
+                    flagged = m_clientChecker(&m_objectRecords[0], 
+                        m_objectRecords.size(), &m_results[0], m_clientData);
+                }
+                catch(...)
+                {
+                    LOG_ERROR("Custom Batch ODE Trigger '" << GetName() 
+                        << "' threw exception calling client callback");
+                    flagged = 0;
+                }
+                
+                for (uint i = 0; flagged and i < m_results.size(); i++)
+                {
+                    if (!m_results[i])
+                    {
+                        continue;
+                    }
+                    // Ensure that the event limit has not been reached 
+                    if (m_eventLimit and m_triggered >= m_eventLimit) 
+                    {
+                        break;
+                    }
+                    NvDsObjectMeta* pObjectMeta = m_occurrenceMetaList[i];
+
+                    IncrementAndCheckTriggerCount();
+                    m_occurrences++;
+                    
+                    // update the total event count static variable
+                    s_eventCount++;
+
+                    if (m_pHeatMapper)
+                    {
+                        std::dynamic_pointer_cast<OdeHeatMapper>(
+                            m_pHeatMapper)->HandleOccurrence(pFrameMeta, pObjectMeta);
+                    }
+                    for (const auto &imap: m_pOdeActionsIndexed)
+                    {
+                        DSL_ODE_ACTION_PTR pOdeAction = 
+                            std::dynamic_pointer_cast<OdeAction>(imap.second);
+                        pOdeAction->HandleOccurrence(shared_from_this(), 
+                            pBuffer, displayMetaData, pFrameMeta, pObjectMeta);
+                    }
+                }
+            }
+            // reset for next frame - capacity is retained.
+            m_objectRecords.clear();
+            m_occurrenceMetaList.clear();
+        }
+        // mutex unlocked - safe to call base class
+        return OdeTrigger::PostProcessFrame(pBuffer,
+            displayMetaData, pFrameMeta);
+    }
+
     // *****************************************************************************
     
     CountOdeTrigger::CountOdeTrigger(const char* name, const char* source,
@@ -2030,6 +2192,31 @@ namespace DSL
         // call the base class to complete the Reset
         OdeTrigger::Reset();
     }
+    
+    void TrackingOdeTrigger::SetTrackedObjectStore(
+        std::shared_ptr<TrackedObjectStore> pStore)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        
+        m_pTrackedObjectsPerSource->SetStore(pStore, GetName());
+    }
+    
+    std::shared_ptr<TrackedObjectStore> TrackingOdeTrigger::GetTrackedObjectStore()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        
+        return m_pTrackedObjectsPerSource->GetStore();
+    }
+    
+    void TrackingOdeTrigger::SetReplayEnabled(bool enabled)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        
+        m_pTrackedObjectsPerSource->SetReplayEnabled(enabled);
+    }
    
     // *****************************************************************************
     
@@ -2130,13 +2317,13 @@ namespace DSL
                 return false;
             }
             
-            // Get the trace vector for the testpoint defined for this Area
-            DSL_RGBA_MULTI_LINE_PTR pTrace = 
-                pTrackedObject->GetTrace(testPoint, m_testMethod, m_traceLineWidth);
-
             // If the client has enabled object tracing
             if (m_traceEnabled)
             {
+                // Get the trace vector for the testpoint defined for this Area
+                DSL_RGBA_MULTI_LINE_PTR pTrace = pTrackedObject->GetTrace(
+                    testPoint, m_testMethod, m_traceLineWidth);
+
                 // If the object has a previous trace from a line cross event.
                 if (pTrackedObject->HasPreviousTrace())
                 {
@@ -2157,9 +2344,10 @@ namespace DSL
             
             uint direction;
 
-            // Check of the trace has crossed the area
-            if (pOdeArea->DoesTraceCrossLine(pTrace->coordinates, 
-                pTrace->num_coordinates, direction))
+            // Check of the trace has crossed the area. The trace intersection
+            // state is updated incrementally with the object's newest segment.
+            if (pOdeArea->DoesTrackedObjectCrossLine(pTrackedObject, 
+                m_testMethod, direction))
             {
                 // If we've crosed before reaching the minimum frame count
                 if (pTrackedObject->preEventFrameCount < m_minFrameCount)
@@ -2206,7 +2394,8 @@ namespace DSL
                     direction;
 
                 pObjectMeta->misc_obj_info[DSL_OBJECT_INFO_PERSISTENCE] = 
-                    (uint64_t)(pTrackedObject->GetDurationMs());
+                    (uint64_t)(pTrackedObject->GetDurationMs(
+                        m_pTrackedObjectsPerSource->GetCurrentTimeMs(pFrameMeta)));
                     
                 for (const auto &imap: m_pOdeActionsIndexed)
                 {
@@ -2405,7 +2594,8 @@ namespace DSL
             pTrackedObject->Update(pFrameMeta->frame_num, 
                 (NvBbox_Coords*)&pObjectMeta->rect_params);
 
-            double trackedTimeMs = pTrackedObject->GetDurationMs();
+            double trackedTimeMs = pTrackedObject->GetDurationMs(
+                m_pTrackedObjectsPerSource->GetCurrentTimeMs(pFrameMeta));
             
             LOG_DEBUG("Persistence for tracked object with id = " 
                 << pObjectMeta->object_id << " for source = " 
@@ -2515,7 +2705,8 @@ namespace DSL
             pTrackedObject->Update(pFrameMeta->frame_num, 
                 (NvBbox_Coords*)&pObjectMeta->rect_params);
 
-            double trackedTimeMs = pTrackedObject->GetDurationMs();
+            double trackedTimeMs = pTrackedObject->GetDurationMs(
+                m_pTrackedObjectsPerSource->GetCurrentTimeMs(pFrameMeta));
             
             if ((m_pLatestObjectMeta == NULL) or (trackedTimeMs < m_latestTrackedTimeMs))
             {
@@ -2632,7 +2823,8 @@ namespace DSL
             pTrackedObject->Update(pFrameMeta->frame_num, 
                 (NvBbox_Coords*)&pObjectMeta->rect_params);
 
-            double trackedTimeMs = pTrackedObject->GetDurationMs();
+            double trackedTimeMs = pTrackedObject->GetDurationMs(
+                m_pTrackedObjectsPerSource->GetCurrentTimeMs(pFrameMeta));
                 
             if ((m_pEarliestObjectMeta == NULL) or 
                 (trackedTimeMs > m_earliestTrackedTimeMs))
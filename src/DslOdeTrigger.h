@@ -68,6 +68,12 @@ namespace DSL
         std::shared_ptr<CustomOdeTrigger>(new CustomOdeTrigger(name, \
             source, classId, limit, clientChecker, clientPostProcessor, clientData))
 
+    #define DSL_ODE_TRIGGER_CUSTOM_BATCH_PTR std::shared_ptr<CustomBatchOdeTrigger>
+    #define DSL_ODE_TRIGGER_CUSTOM_BATCH_NEW(name, \
+    source, classId, limit, clientChecker, clientData) \
+        std::shared_ptr<CustomBatchOdeTrigger>(new CustomBatchOdeTrigger(name, \
+            source, classId, limit, clientChecker, clientData))
+
     #define DSL_ODE_TRIGGER_COUNT_PTR std::shared_ptr<CountOdeTrigger>
     #define DSL_ODE_TRIGGER_COUNT_NEW(name, source, classId, limit, minimum, maximum) \
         std::shared_ptr<CountOdeTrigger> (new CountOdeTrigger(name, \
@@ -153,7 +159,7 @@ namespace DSL
         /**
          * @brief total count of all events
          */
-        static uint64_t s_eventCount;
+        static std::atomic<uint64_t> s_eventCount;
         
         /**
          * @brief Function to check a given Object Meta data structure for the 
@@ -356,6 +362,23 @@ namespace DSL
          */
         void _setSourceId(int id);
 
+        /**
+         * @brief Gets the unique Source Id of the Trigger's source filter,
+         * querying the Id by Source name if not previously set.
+         * @return unique Source Id, -1 if the filter is not set or the
+         * Source could not be found.
+         */
+        int GetSourceIdFilter();
+
+        /**
+         * @brief Determines if the Trigger can evaluate the frames of its 
+         * source concurrently with the frames of other sources. A Trigger
+         * is per-source safe if it filters on a single source, has no 
+         * Accumulator or Heat-Mapper, and all of its Actions are parallel safe.
+         * @return true if the Trigger is per-source safe, false otherwise.
+         */
+        virtual bool IsPerSourceSafe();
+
         /**
          * @brief Gets the inference component name filter used for Object detection
          * A value of NULL indicates no filter.
@@ -860,6 +883,28 @@ namespace DSL
          * @brief Overrides the base Reset in order to clear m_trackedObjectsPerSource
          */
         void Reset();
+        
+        /**
+         * @brief Sets the store to maintain the histories of all objects tracked
+         * by this Trigger. All currently tracked objects are cleared.
+         * @param[in] pStore store shared with other Tracking Triggers, i.e. by 
+         * the parent ODE Pad Probe Handler, or nullptr to use a private store.
+         */
+        void SetTrackedObjectStore(std::shared_ptr<TrackedObjectStore> pStore);
+        
+        /**
+         * @brief Gets the store maintaining the histories of all objects
+         * tracked by this Trigger.
+         * @return shared pointer to the current store.
+         */
+        std::shared_ptr<TrackedObjectStore> GetTrackedObjectStore();
+        
+        /**
+         * @brief Enables/disables replay mode. When enabled, the time objects
+         * have been tracked is measured with the recorded frame timestamps.
+         * @param[in] enabled true to enable replay mode, false to disable.
+         */
+        void SetReplayEnabled(bool enabled);
 
     protected:
 
@@ -1151,6 +1196,13 @@ namespace DSL
         uint PostProcessFrame(GstBuffer* pBuffer, 
             std::vector<NvDsDisplayMeta*>& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
+
+        /**
+         * @brief The Custom Trigger calls client functions and must be
+         * serialized.
+         * @return false always.
+         */
+        bool IsPerSourceSafe(){return false;};
         
     private:
     
@@ -1171,6 +1223,73 @@ namespace DSL
     
     };    
 
+    class CustomBatchOdeTrigger : public OdeTrigger
+    {
+    public:
+    
+        CustomBatchOdeTrigger(const char* name, const char* source, 
+            uint classId, uint limit, 
+            dsl_ode_check_for_occurrence_batch_cb clientChecker, void* clientData);
+        
+        ~CustomBatchOdeTrigger();
+
+        /**
+         * @brief Function to check a given Object Meta data structure for the 
+         * min criteria. Objects that pass are added as compact records to the 
+         * frame's batch to be checked by the client on PostProcessFrame.
+         * @param[in] pBuffer pointer to batched stream buffer - that holds the Frame 
+         * Meta - that holds the Object Meta
+         * @param[in] pFrameMeta pointer to the parent NvDsFrameMeta data - the frame 
+         * that holds the Object Meta
+         * @param[in] pObjectMeta pointer to a NvDsObjectMeta data to check
+         * @return true if the object was added to the batch, false otherwise
+         */
+        bool CheckForOccurrence(GstBuffer* pBuffer, 
+            std::vector<NvDsDisplayMeta*>& displayMetaData,
+            NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
+
+        /**
+         * @brief Function to call the client provided callback once with the
+         * frame's batch of object records, and to invoke all actions for each 
+         * object flagged by the client.
+         * @param[in] pBuffer pointer to batched stream buffer - that holds the Frame Meta
+         * @param[in] pFrameMeta Frame meta data to post process.
+         * @return the number of ODE Occurrences triggered on post process
+         */
+        uint PostProcessFrame(GstBuffer* pBuffer, 
+            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            NvDsFrameMeta* pFrameMeta);
+        
+    private:
+    
+        /**
+         * @brief client provided batch Check for Occurrence callback
+         */
+        dsl_ode_check_for_occurrence_batch_cb m_clientChecker;
+        
+        /**
+         * @brief client data to be returned to the client on callback
+         */
+        void* m_clientData;
+
+        /**
+         * @brief contiguous array of object records for the current frame.
+         * Capacity is retained between frames to avoid reallocation.
+         */
+        std::vector<dsl_ode_object_record> m_objectRecords;
+
+        /**
+         * @brief object meta for each record in m_objectRecords.
+         */
+        std::vector<NvDsObjectMeta*> m_occurrenceMetaList;
+
+        /**
+         * @brief results array returned by the client, one per record.
+         */
+        std::vector<uint8_t> m_results;
+    
+    };    
+
     class MinimumOdeTrigger : public OdeTrigger
     {
     public:
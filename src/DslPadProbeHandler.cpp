@@ -24,7 +24,9 @@ THE SOFTWARE.
 
 #include "Dsl.h"
 #include "DslPadProbeHandler.h"
+#include "DslStallWatchdog.h"
 #include "DslOdeTrigger.h"
+#include "DslOdeAction.h"
 #include "DslBintr.h"
 #include <gst-nvevent.h>
 
@@ -286,13 +288,32 @@ namespace DSL
 
     //--------------------------------------------------------------------------------
 
+    /**
+     * @brief Frame worker pool function for an ODE Pad Probe Handler 
+     * evaluating the frames of a batch in parallel.
+     * @param[in] pSourceWork source work to process.
+     * @param[in] pHandler ODE Pad Probe Handler that owns the pool.
+     */
+    static void OdePphFrameWorker(gpointer pSourceWork, gpointer pHandler)
+    {
+        static_cast<OdePadProbeHandler*>(pHandler)->HandleSourceWork(
+            static_cast<OdeSourceWork*>(pSourceWork));
+    }
+
     OdePadProbeHandler::OdePadProbeHandler(const char* name)
         : PadProbeBufferHandler(name)
         , m_nextTriggerIndex(0)
         , m_displayMetaAllocSize(1)
+        , m_frameWorkers(0)
+        , m_pFrameWorkerPool(NULL)
+        , m_pCurrentBuffer(NULL)
+        , m_pendingSourceWork(0)
     {
         LOG_FUNC();
         
+        m_pTrackedObjectStore = 
+            std::shared_ptr<TrackedObjectStore>(new TrackedObjectStore());
+        
         // Enable now
         if (!SetEnabled(true))
         {
@@ -303,6 +324,11 @@ namespace DSL
     OdePadProbeHandler::~OdePadProbeHandler()
     {
         LOG_FUNC();
+        
+        if (m_pFrameWorkerPool)
+        {
+            g_thread_pool_free(m_pFrameWorkerPool, FALSE, TRUE);
+        }
     }
 
     bool OdePadProbeHandler::AddChild(DSL_BASE_PTR pChild)
@@ -321,6 +347,13 @@ namespace DSL
         // Add the child to the Indexed map 
         m_pChildrenIndexed[m_nextTriggerIndex] = pChild;
         
+        // Tracking Triggers share a single store of tracked object histories.
+        DSL_ODE_TRACKING_TRIGGER_PTR pTrackingTrigger = 
+            std::dynamic_pointer_cast<TrackingOdeTrigger>(pChild);
+        if (pTrackingTrigger)
+        {
+            pTrackingTrigger->SetTrackedObjectStore(m_pTrackedObjectStore);
+        }
         return true;
     }
 
@@ -337,6 +370,13 @@ namespace DSL
         // Remove the the child from Indexed map
         m_pChildrenIndexed.erase(pChild->GetIndex());
         
+        // Tracking Triggers revert to their own private store.
+        DSL_ODE_TRACKING_TRIGGER_PTR pTrackingTrigger = 
+            std::dynamic_pointer_cast<TrackingOdeTrigger>(pChild);
+        if (pTrackingTrigger)
+        {
+            pTrackingTrigger->SetTrackedObjectStore(nullptr);
+        }
         return true;
     }
 
@@ -347,8 +387,19 @@ namespace DSL
         Base::RemoveAllChildren();
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
         
+        for (const auto &imap: m_pChildrenIndexed)
+        {
+            DSL_ODE_TRACKING_TRIGGER_PTR pTrackingTrigger = 
+                std::dynamic_pointer_cast<TrackingOdeTrigger>(imap.second);
+            if (pTrackingTrigger)
+            {
+                pTrackingTrigger->SetTrackedObjectStore(nullptr);
+            }
+        }
+        
         // Remove all children from Indexed map
         m_pChildrenIndexed.clear();
+        m_pTrackedObjectStore->Clear();
     }
 
     uint OdePadProbeHandler::GetDisplayMetaAllocSize()
@@ -366,19 +417,73 @@ namespace DSL
         m_displayMetaAllocSize = size;
     }
     
+    uint OdePadProbeHandler::GetFrameWorkers()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
+        
+        return m_frameWorkers;
+    }
+    
+    bool OdePadProbeHandler::SetFrameWorkers(uint workers)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
+        
+        if (m_pFrameWorkerPool)
+        {
+            // The pool is idle between batches.
+            g_thread_pool_free(m_pFrameWorkerPool, FALSE, TRUE);
+            m_pFrameWorkerPool = NULL;
+        }
+        m_frameWorkers = 0;
+        
+        if (workers)
+        {
+            GError* pError(NULL);
+            m_pFrameWorkerPool = g_thread_pool_new(OdePphFrameWorker, 
+                this, workers, TRUE, &pError);
+            if (!m_pFrameWorkerPool)
+            {
+                LOG_ERROR("ODE Pad Probe Handler '" << GetName() 
+                    << "' failed to create pool of " << workers 
+                    << " frame workers: " << pError->message);
+                g_error_free(pError);
+                return false;
+            }
+            m_frameWorkers = workers;
+        }
+        return true;
+    }
+    
     GstPadProbeReturn OdePadProbeHandler::HandlePadData(GstPadProbeInfo* pInfo)
+    {
+        GstBuffer* pBuffer = (GstBuffer*)pInfo->data;
+        
+        HandleBatchMeta(pBuffer, gst_buffer_get_nvds_batch_meta(pBuffer));
+        
+        return GST_PAD_PROBE_OK;
+    }
+    
+    void OdePadProbeHandler::HandleBatchMeta(GstBuffer* pBuffer, 
+        NvDsBatchMeta* pBatchMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
         
         if (!m_isEnabled)
         {
-            return GST_PAD_PROBE_OK;
+            return;
         }
-        GstBuffer* pBuffer = (GstBuffer*)pInfo->data;
+        std::vector<DSL_ODE_TRIGGER_PTR> triggers;
+        triggers.reserve(m_pChildrenIndexed.size());
         
-        NvDsBatchMeta* pBatchMeta = gst_buffer_get_nvds_batch_meta(pBuffer);
+        for (const auto &imap: m_pChildrenIndexed)
+        {
+            triggers.push_back(std::dynamic_pointer_cast<OdeTrigger>(imap.second));
+        }
         
         // For each frame in the batched meta data
+        m_frameWork.clear();
         for (NvDsMetaList* pFrameMetaList = pBatchMeta->frame_meta_list; 
             pFrameMetaList; pFrameMetaList = pFrameMetaList->next)
         {
@@ -386,87 +491,451 @@ namespace DSL
             NvDsFrameMeta* pFrameMeta = (NvDsFrameMeta*) (pFrameMetaList->data);
             if (pFrameMeta != NULL)
             {
-                std::vector<NvDsDisplayMeta*> displayMetaData;
+                m_frameWork.push_back({pFrameMeta});
+                
+                std::vector<NvDsDisplayMeta*>& displayMetaData = 
+                    m_frameWork.back().displayMetaData;
                 displayMetaData.reserve(m_displayMetaAllocSize);
                 
                 for (auto i=0; i<m_displayMetaAllocSize; i++)
                 {
                     // Acquire new Display meta for this frame, with each 
-                    // Trigger/Action(s) adding meta as needed.
+                    // Trigger/Action(s) adding meta as needed. All Display 
+                    // meta is acquired from the batch's pool in this thread.
                     NvDsDisplayMeta* pDisplayMeta = 
                         nvds_acquire_display_meta_from_pool(pBatchMeta);
                     displayMetaData.push_back(pDisplayMeta);
                 }
-                // Preprocess the frame
-                for (const auto &imap: m_pChildrenIndexed)
+            }
+        }
+        
+        if (m_pFrameWorkerPool and m_frameWork.size() > 1)
+        {
+            m_pCurrentBuffer = pBuffer;
+            HandleSourceWorkInParallel(triggers);
+            m_pCurrentBuffer = NULL;
+        }
+        
+        // Process each frame, in batch order, with all remaining Triggers
+        for (auto &frameWork: m_frameWork)
+        {
+            HandleFrame(pBuffer, frameWork, triggers);
+        }
+        
+        for (auto &frameWork: m_frameWork)
+        {
+            for (const auto & ivec: frameWork.displayMetaData)
+            {
+                // Add the updated display data to the frame
+                nvds_add_display_meta_to_frame(frameWork.pFrameMeta, ivec);
+            }
+        }
+        
+        // Purge the histories of all objects no longer tracked by any Trigger,
+        // once for all Tracking Triggers after all frames have been processed.
+        m_pTrackedObjectStore->Purge();
+    }
+
+    void OdePadProbeHandler::HandleSourceWorkInParallel(
+        std::vector<DSL_ODE_TRIGGER_PTR>& triggers)
+    {
+        // Partition the leading per-source safe Triggers by source, preserving 
+        // the execution order within each source. Partitioning stops at the
+        // first Trigger that is not per-source safe so that all Triggers are
+        // still evaluated in index order. Triggers filtering on different 
+        // sources never process the same frame, so their relative order 
+        // is of no consequence.
+        for (auto &sourceWork: m_sourceWork)
+        {
+            sourceWork.frameIndices.clear();
+            sourceWork.triggers.clear();
+        }
+        uint sourceWorkCount(0);
+        auto iterSerial = triggers.begin();
+        
+        for (; iterSerial != triggers.end(); iterSerial++)
+        {
+            const DSL_ODE_TRIGGER_PTR& pOdeTrigger = *iterSerial;
+            
+            int sourceId(-1);
+            if (!pOdeTrigger->IsPerSourceSafe() or 
+                (sourceId = pOdeTrigger->GetSourceIdFilter()) == -1)
+            {
+                break;
+            }
+            uint i(0);
+            while (i < sourceWorkCount and m_sourceWork[i].sourceId != sourceId)
+            {
+                i++;
+            }
+            if (i == sourceWorkCount)
+            {
+                if (sourceWorkCount == m_sourceWork.size())
                 {
-                    DSL_ODE_TRIGGER_PTR pOdeTrigger = 
-                        std::dynamic_pointer_cast<OdeTrigger>(imap.second);
-                    pOdeTrigger->PreProcessFrame(pBuffer, displayMetaData, pFrameMeta);
+                    m_sourceWork.push_back({sourceId});
                 }
-
-                NvDsMetaList* pNextMeta = pFrameMeta->obj_meta_list;
-                
-                // For each detected object in the frame.
-                while (pNextMeta != NULL)
+                m_sourceWork[i].sourceId = sourceId;
+                sourceWorkCount++;
+            }
+            m_sourceWork[i].triggers.push_back(pOdeTrigger);
+        }
+        if (!sourceWorkCount)
+        {
+            return;
+        }
+        
+        // Assign the frames of each source, in batch order
+        for (uint i = 0; i < m_frameWork.size(); i++)
+        {
+            for (uint j = 0; j < sourceWorkCount; j++)
+            {
+                if (m_sourceWork[j].sourceId == 
+                    (int)m_frameWork[i].pFrameMeta->source_id)
                 {
-                    NvDsObjectMeta* pObjectMeta = (NvDsObjectMeta*) (pNextMeta->data);
+                    m_sourceWork[j].frameIndices.push_back(i);
+                    break;
+                }
+            }
+        }
+        
+        // Queue all source work with frames to the pool, except the first 
+        // which is processed in this thread while waiting.
+        OdeSourceWork* pLocalWork(NULL);
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_sourceWorkMutex);
+            
+            for (uint i = 0; i < sourceWorkCount; i++)
+            {
+                if (m_sourceWork[i].frameIndices.empty())
+                {
+                    continue;
+                }
+                if (!pLocalWork)
+                {
+                    pLocalWork = &m_sourceWork[i];
+                    continue;
+                }
+                m_pendingSourceWork++;
+                g_thread_pool_push(m_pFrameWorkerPool, &m_sourceWork[i], NULL);
+            }
+        }
+        if (pLocalWork)
+        {
+            for (auto i: pLocalWork->frameIndices)
+            {
+                HandleFrame(m_pCurrentBuffer, m_frameWork[i], pLocalWork->triggers);
+            }
+        }
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_sourceWorkMutex);
+            
+            while (m_pendingSourceWork)
+            {
+                g_cond_wait(&m_sourceWorkCond, &m_sourceWorkMutex);
+            }
+        }
+        triggers.erase(triggers.begin(), iterSerial);
+    }
+    
+    void OdePadProbeHandler::HandleSourceWork(OdeSourceWork* pSourceWork)
+    {
+        for (auto i: pSourceWork->frameIndices)
+        {
+            HandleFrame(m_pCurrentBuffer, m_frameWork[i], pSourceWork->triggers);
+        }
+        
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_sourceWorkMutex);
+        
+        if (--m_pendingSourceWork == 0)
+        {
+            g_cond_signal(&m_sourceWorkCond);
+        }
+    }
+    
+    void OdePadProbeHandler::HandleFrame(GstBuffer* pBuffer, 
+        OdeFrameWork& frameWork, const std::vector<DSL_ODE_TRIGGER_PTR>& triggers)
+    {
+        NvDsFrameMeta* pFrameMeta = frameWork.pFrameMeta;
+        std::vector<NvDsDisplayMeta*>& displayMetaData = frameWork.displayMetaData;
+        
+        // Preprocess the frame
+        for (const auto &pOdeTrigger: triggers)
+        {
+            pOdeTrigger->PreProcessFrame(pBuffer, displayMetaData, pFrameMeta);
+        }
 
-                    // We need to advance the pointer now in case the object is removed
-                    // from the frame meta by an action which will null the pObjectMeta 
-                    // making pNextMeta in an invalid state an unable to increment. 
-                    pNextMeta = pNextMeta->next;
+        NvDsMetaList* pNextMeta = pFrameMeta->obj_meta_list;
+        
+        // For each detected object in the frame.
+        while (pNextMeta != NULL)
+        {
+            NvDsObjectMeta* pObjectMeta = (NvDsObjectMeta*) (pNextMeta->data);
+
+            // We need to advance the pointer now in case the object is removed
+            // from the frame meta by an action which will null the pObjectMeta 
+            // making pNextMeta in an invalid state an unable to increment. 
+            pNextMeta = pNextMeta->next;
 
-                    // For each ODE Trigger owned by this ODE Manager, check for ODE
-                    for (const auto &imap: m_pChildrenIndexed)
+            // For each ODE Trigger owned by this ODE Manager, check for ODE
+            for (const auto &pOdeTrigger: triggers)
+            {
+                // check for valid object meta as it may have be nulled by
+                // a trigger with a remove action
+                if (pObjectMeta != NULL)
+                {
+                    try
                     {
-                        // check for valid object meta as it may have be nulled by
-                        // a trigger with a remove action
-                        if (pObjectMeta != NULL)
-                        {
-                            DSL_ODE_TRIGGER_PTR pOdeTrigger = 
-                                std::dynamic_pointer_cast<OdeTrigger>(imap.second);
-                            try
-                            {
-                                pOdeTrigger->CheckForOccurrence(pBuffer, 
-                                    displayMetaData, pFrameMeta, pObjectMeta);
-                            }
-                            catch(...)
-                            {
-                                LOG_ERROR("Trigger '" << pOdeTrigger->GetName() 
-                                    << "' threw exception");
-                            }
-                        }
+                        pOdeTrigger->CheckForOccurrence(pBuffer, 
+                            displayMetaData, pFrameMeta, pObjectMeta);
+                    }
+                    catch(...)
+                    {
+                        LOG_ERROR("Trigger '" << pOdeTrigger->GetName() 
+                            << "' threw exception");
                     }
                 }
+            }
+        }
+        
+        // After each detected object is checked for ODE individually, post 
+        // process each frame for Absence events, Limit events, etc. (i.e. frame 
+        // level events).
+        for (const auto &pOdeTrigger: triggers)
+        {
+            pOdeTrigger->PostProcessFrame(pBuffer, displayMetaData, pFrameMeta);
+        }
+        
+        // Complete the frame-level work deferred by the Actions invoked above, 
+        // e.g. batched image captures, while the buffer is still valid.
+        OdeAction::PostProcessFrame(pBuffer, pFrameMeta);
+    }
+
+    uint64_t OdePadProbeHandler::ReplayMetaRecord(
+        DSL_META_RECORD_READER_PTR pReader)
+    {
+        LOG_FUNC();
+        
+        // Single batch meta, with pools sized for the largest batch, 
+        // reused for every batch replayed.
+        NvDsBatchMeta* pBatchMeta = nvds_create_batch_meta(
+            std::max(pReader->GetMaxBatchSize(), (uint32_t)1));
+        
+        // Tracked time is measured with the recorded frame timestamps so that
+        // the results match the recorded run when replayed at full speed.
+        setReplayEnabled(true);
+        
+        uint64_t frameCount(0);
+        
+        for (uint64_t i = 0; i < pReader->GetBatchCount(); i++)
+        {
+            const MetaRecordBatch* pBatch = pReader->GetBatch(i);
+            if (!pBatch)
+            {
+                LOG_ERROR("ODE Pad Probe Handler '" << GetName() 
+                    << "' stopped replay at invalid batch record " << i);
+                break;
+            }
+            const uint8_t* pNextRecord = (const uint8_t*)(pBatch + 1);
+            
+            for (uint j = 0; j < pBatch->frameCount; j++)
+            {
+                const MetaRecordFrame* pFrame = (const MetaRecordFrame*)pNextRecord;
+                pNextRecord += sizeof(MetaRecordFrame);
                 
-                // After each detected object is checked for ODE individually, post 
-                // process each frame for Absence events, Limit events, etc. (i.e. frame 
-                // level events).
-                for (const auto &imap: m_pChildrenIndexed)
-                {
-                    DSL_ODE_TRIGGER_PTR pOdeTrigger = 
-                        std::dynamic_pointer_cast<OdeTrigger>(imap.second);
-                    pOdeTrigger->PostProcessFrame(pBuffer, displayMetaData, pFrameMeta);
-                }
+                NvDsFrameMeta* pFrameMeta = 
+                    nvds_acquire_frame_meta_from_pool(pBatchMeta);
+                pFrameMeta->source_id = pFrame->sourceId;
+                pFrameMeta->pad_index = pFrame->sourceId;
+                pFrameMeta->batch_id = pFrame->batchId;
+                pFrameMeta->frame_num = pFrame->frameNum;
+                pFrameMeta->ntp_timestamp = pFrame->ntpTimestamp;
+                pFrameMeta->source_frame_width = pFrame->sourceFrameWidth;
+                pFrameMeta->source_frame_height = pFrame->sourceFrameHeight;
+                pFrameMeta->bInferDone = 
+                    (pFrame->flags & DSL_META_RECORD_FRAME_INFER_DONE) != 0;
+                    
+                nvds_add_frame_meta_to_batch(pBatchMeta, pFrameMeta);
                 
-                for (const auto & ivec: displayMetaData)
+                const MetaRecordObject* pObject = 
+                    (const MetaRecordObject*)pNextRecord;
+                pNextRecord += pFrame->objectCount * sizeof(MetaRecordObject);
+                
+                for (uint k = 0; k < pFrame->objectCount; k++, pObject++)
                 {
-                    // Add the updated display data to the frame
-                    nvds_add_display_meta_to_frame(pFrameMeta, ivec);
+                    NvDsObjectMeta* pObjectMeta = 
+                        nvds_acquire_obj_meta_from_pool(pBatchMeta);
+                    pObjectMeta->object_id = pObject->objectId;
+                    pObjectMeta->class_id = pObject->classId;
+                    pObjectMeta->unique_component_id = pObject->inferId;
+                    pObjectMeta->confidence = pObject->confidence;
+                    pObjectMeta->tracker_confidence = pObject->trackerConfidence;
+                    pObjectMeta->rect_params.left = pObject->left;
+                    pObjectMeta->rect_params.top = pObject->top;
+                    pObjectMeta->rect_params.width = pObject->width;
+                    pObjectMeta->rect_params.height = pObject->height;
+                    
+                    nvds_add_obj_meta_to_frame(pFrameMeta, pObjectMeta, NULL);
                 }
             }
+            pBatchMeta->num_frames_in_batch = pBatch->frameCount;
+            
+            HandleBatchMeta(NULL, pBatchMeta);
+            frameCount += pBatch->frameCount;
+            
+            // Release all frame meta -- along with the object and display 
+            // meta added to each -- back to the batch meta pools.
+            while (pBatchMeta->frame_meta_list)
+            {
+                nvds_remove_frame_meta_from_batch(pBatchMeta, 
+                    (NvDsFrameMeta*)pBatchMeta->frame_meta_list->data);
+            }
+        }
+        nvds_destroy_batch_meta(pBatchMeta);
+        
+        setReplayEnabled(false);
+        
+        LOG_INFO("ODE Pad Probe Handler '" << GetName() << "' replayed " 
+            << frameCount << " frames");
+        
+        return frameCount;
+    }
+    
+    void OdePadProbeHandler::setReplayEnabled(bool enabled)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
+        
+        for (const auto &imap: m_pChildrenIndexed)
+        {
+            DSL_ODE_TRACKING_TRIGGER_PTR pTrackingTrigger = 
+                std::dynamic_pointer_cast<TrackingOdeTrigger>(imap.second);
+            if (pTrackingTrigger)
+            {
+                pTrackingTrigger->SetReplayEnabled(enabled);
+            }
+        }
+    }
+    
+    //--------------------------------------------------------------------------------
+    
+    MetaRecorderPadProbeHandler::MetaRecorderPadProbeHandler(const char* name, 
+        const char* filePath)
+        : PadProbeBufferHandler(name)
+    {
+        LOG_FUNC();
+
+        // Throws on failure to create the file.
+        m_pWriter = DSL_META_RECORD_WRITER_NEW(filePath);
+    }
+
+    MetaRecorderPadProbeHandler::~MetaRecorderPadProbeHandler()
+    {
+        LOG_FUNC();
+        
+        // The writer closes the file on destruction
+    }
+
+    uint64_t MetaRecorderPadProbeHandler::GetBatchCount()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
+        
+        return m_pWriter->GetBatchCount();
+    }
+    
+    GstPadProbeReturn MetaRecorderPadProbeHandler::HandlePadData(
+        GstPadProbeInfo* pInfo)
+    {
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
+        
+        if (!m_isEnabled)
+        {
+            return GST_PAD_PROBE_OK;
+        }
+        GstBuffer* pBuffer = (GstBuffer*)pInfo->data;
+        
+        NvDsBatchMeta* pBatchMeta = gst_buffer_get_nvds_batch_meta(pBuffer);
+        if (pBatchMeta)
+        {
+            m_pWriter->Write(pBatchMeta);
         }
         return GST_PAD_PROBE_OK;
     }
 
     //--------------------------------------------------------------------------------
+    
+    MetaPublisherPadProbeHandler::MetaPublisherPadProbeHandler(const char* name, 
+        const char* shmName, uint slotCount, uint maxObjects)
+        : PadProbeBufferHandler(name)
+    {
+        LOG_FUNC();
+
+        // Throws on failure to create the shared-memory segment.
+        m_pWriter = DSL_META_SHM_WRITER_NEW(shmName, slotCount, maxObjects);
+    }
+
+    MetaPublisherPadProbeHandler::~MetaPublisherPadProbeHandler()
+    {
+        LOG_FUNC();
+        
+        // The writer unlinks the shared-memory segment on destruction
+    }
 
+    uint64_t MetaPublisherPadProbeHandler::GetSequence()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
+        
+        return m_pWriter->GetSequence();
+    }
+    
+    GstPadProbeReturn MetaPublisherPadProbeHandler::HandlePadData(
+        GstPadProbeInfo* pInfo)
+    {
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
+        
+        if (!m_isEnabled)
+        {
+            return GST_PAD_PROBE_OK;
+        }
+        GstBuffer* pBuffer = (GstBuffer*)pInfo->data;
+        
+        NvDsBatchMeta* pBatchMeta = gst_buffer_get_nvds_batch_meta(pBuffer);
+        if (pBatchMeta)
+        {
+            m_pWriter->Publish(pBatchMeta, GST_BUFFER_PTS(pBuffer));
+        }
+        return GST_PAD_PROBE_OK;
+    }
+
+    //--------------------------------------------------------------------------------
+
+    /**
+     * @brief Worker thread function for a Custom Pad Probe Handler 
+     * operating in asynchronous mode.
+     * @param[in] pHandler shared pointer to the Custom PPH.
+     * @return NULL on thread exit.
+     */
+    static gpointer CustomPphAsyncWorkerThread(gpointer pHandler)
+    {
+        static_cast<CustomPadProbeHandler*>(pHandler)->HandleAsyncQueue();
+        
+        return NULL;
+    }
+    
     CustomPadProbeHandler::CustomPadProbeHandler(const char* name, 
         dsl_pph_custom_client_handler_cb clientHandler, void* clientData)
         : PadProbeBufferHandler(name)
         , m_clientHandler(clientHandler)
         , m_clientData(clientData)
+        , m_asyncEnabled(false)
+        , m_asyncMaxSize(DSL_PPH_CUSTOM_ASYNC_DEFAULT_MAX_SIZE)
+        , m_asyncPolicy(DSL_PPH_CUSTOM_ASYNC_POLICY_DROP)
+        , m_asyncSampleInterval(DSL_PPH_CUSTOM_ASYNC_DEFAULT_SAMPLE_INTERVAL)
+        , m_asyncOverflowCount(0)
+        , m_asyncStop(false)
+        , m_pAsyncThread(NULL)
+        , m_asyncMetrics{0}
     {
         LOG_FUNC();
         
@@ -480,29 +949,283 @@ namespace DSL
     CustomPadProbeHandler::~CustomPadProbeHandler()
     {
         LOG_FUNC();
+        
+        StopAsyncWorker();
     }
     
     GstPadProbeReturn CustomPadProbeHandler::HandlePadData(GstPadProbeInfo* pInfo)
     {
+        GstBuffer* pBuffer = (GstBuffer*)pInfo->data;
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
+            if (!m_isEnabled)
+            {
+                return GST_PAD_PROBE_OK;
+            }
+            if (!m_asyncEnabled)
+            {
+                try
+                {
+                    return (GstPadProbeReturn)m_clientHandler(pBuffer, m_clientData);
+                }
+                catch(...)
+                {
+                    LOG_ERROR("CustomPadProbeHandler '" << GetName() 
+                        << "' threw an exception processing Pad Buffer");
+                    return GST_PAD_PROBE_REMOVE;
+                }
+            }
+        }
+        // Queue the buffer outside of the pad-handler mutex as the block 
+        // policy can wait on the worker thread.
+        QueueBuffer(pBuffer);
+        
+        return GST_PAD_PROBE_OK;
+    }
+    
+    bool CustomPadProbeHandler::GetAsyncEnabled()
+    {
+        LOG_FUNC();
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
-        if (!m_isEnabled)
+        
+        return m_asyncEnabled;
+    }
+    
+    bool CustomPadProbeHandler::SetAsyncEnabled(bool enabled)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
+        
+        if (m_asyncEnabled == enabled)
         {
-            return GST_PAD_PROBE_OK;
+            LOG_ERROR("Can't set Async Enabled to the same value of " 
+                << enabled << " for CustomPadProbeHandler '" << GetName() << "' ");
+            return false;
         }
-
-        GstBuffer* pBuffer = (GstBuffer*)pInfo->data;
-        try
+        if (enabled)
         {
-            return (GstPadProbeReturn)m_clientHandler(pBuffer, m_clientData);
+            {
+                LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_asyncQueueMutex);
+                m_asyncStop = false;
+                m_asyncOverflowCount = 0;
+            }
+            m_pAsyncThread = g_thread_new(GetCStrName(), 
+                CustomPphAsyncWorkerThread, this);
+            m_asyncEnabled = true;
         }
-        catch(...)
+        else
         {
-            LOG_ERROR("CustomPadProbeHandler '" << GetName() 
-                << "' threw an exception processing Pad Buffer");
-            return GST_PAD_PROBE_REMOVE;
+            m_asyncEnabled = false;
+            StopAsyncWorker();
+        }
+        LOG_INFO("CustomPadProbeHandler '" << GetName() 
+            << "' set Async Enabled = " << enabled);
+            
+        return true;
+    }
+    
+    void CustomPadProbeHandler::GetAsyncQueueSettings(uint* maxSize, 
+        uint* policy, uint* sampleInterval)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_asyncQueueMutex);
+        
+        *maxSize = m_asyncMaxSize;
+        *policy = m_asyncPolicy;
+        *sampleInterval = m_asyncSampleInterval;
+    }
+    
+    bool CustomPadProbeHandler::SetAsyncQueueSettings(uint maxSize, 
+        uint policy, uint sampleInterval)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
+        
+        if (m_asyncEnabled)
+        {
+            LOG_ERROR("Unable to set Async Queue Settings for CustomPadProbeHandler '" 
+                << GetName() << "' as async mode is currently enabled");
+            return false;
+        }
+        if (!maxSize or !sampleInterval or 
+            policy > DSL_PPH_CUSTOM_ASYNC_POLICY_BLOCK)
+        {
+            LOG_ERROR("Invalid Async Queue Settings for CustomPadProbeHandler '" 
+                << GetName() << "'");
+            return false;
+        }
+        LOCK_2ND_MUTEX_FOR_CURRENT_SCOPE(&m_asyncQueueMutex);
+        
+        m_asyncMaxSize = maxSize;
+        m_asyncPolicy = policy;
+        m_asyncSampleInterval = sampleInterval;
+        
+        return true;
+    }
+    
+    void CustomPadProbeHandler::GetAsyncMetrics(
+        dsl_pph_custom_async_metrics* pMetrics)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_asyncQueueMutex);
+        
+        *pMetrics = m_asyncMetrics;
+    }
+    
+    void CustomPadProbeHandler::ClearAsyncMetrics()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_asyncQueueMutex);
+        
+        m_asyncMetrics = {0};
+        m_asyncMetrics.current_level = m_asyncQueue.size();
+        m_asyncMetrics.max_level = m_asyncQueue.size();
+    }
+    
+    void CustomPadProbeHandler::QueueBuffer(GstBuffer* pBuffer)
+    {
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_asyncQueueMutex);
+        
+        if (m_asyncStop)
+        {
+            return;
+        }
+        if (m_asyncQueue.size() >= m_asyncMaxSize)
+        {
+            if (m_asyncPolicy == DSL_PPH_CUSTOM_ASYNC_POLICY_BLOCK)
+            {
+                uint64_t startTime = g_get_monotonic_time();
+                
+                while (!m_asyncStop and m_asyncQueue.size() >= m_asyncMaxSize)
+                {
+                    g_cond_wait(&m_asyncNotFullCond, &m_asyncQueueMutex);
+                }
+                m_asyncMetrics.blocked_time += g_get_monotonic_time() - startTime;
+                
+                if (m_asyncStop)
+                {
+                    return;
+                }
+            }
+            // sample policy - every Nth overflow buffer replaces the oldest
+            else if (m_asyncPolicy == DSL_PPH_CUSTOM_ASYNC_POLICY_SAMPLE and
+                (++m_asyncOverflowCount % m_asyncSampleInterval) == 0)
+            {
+                gst_buffer_unref(m_asyncQueue.front());
+                m_asyncQueue.pop();
+                m_asyncMetrics.dropped++;
+            }
+            else
+            {
+                m_asyncMetrics.dropped++;
+                return;
+            }
+        }
+        m_asyncQueue.push(snapshotBuffer(pBuffer));
+        
+        m_asyncMetrics.queued++;
+        m_asyncMetrics.current_level = m_asyncQueue.size();
+        m_asyncMetrics.max_level = std::max(m_asyncMetrics.max_level,
+            m_asyncMetrics.current_level);
+            
+        g_cond_signal(&m_asyncNotEmptyCond);
+    }
+    
+    GstBuffer* CustomPadProbeHandler::snapshotBuffer(GstBuffer* pBuffer)
+    {
+        // New buffer without memory - only the timestamps and a deep copy
+        // of the batch-meta are handed to the worker, so downstream elements
+        // remain free to modify or recycle the original buffer and its meta.
+        GstBuffer* pSnapshot = gst_buffer_new();
+        
+        GST_BUFFER_PTS(pSnapshot) = GST_BUFFER_PTS(pBuffer);
+        GST_BUFFER_DTS(pSnapshot) = GST_BUFFER_DTS(pBuffer);
+        GST_BUFFER_DURATION(pSnapshot) = GST_BUFFER_DURATION(pBuffer);
+        GST_BUFFER_OFFSET(pSnapshot) = GST_BUFFER_OFFSET(pBuffer);
+        
+        NvDsBatchMeta* pBatchMeta = gst_buffer_get_nvds_batch_meta(pBuffer);
+        if (pBatchMeta)
+        {
+            NvDsBatchMeta* pBatchMetaCopy = (NvDsBatchMeta*)
+                nvds_batch_meta_copy_func(pBatchMeta, NULL);
+                
+            NvDsMeta* pMeta = gst_buffer_add_nvds_meta(pSnapshot, 
+                pBatchMetaCopy, NULL, nvds_batch_meta_copy_func, 
+                nvds_batch_meta_release_func);
+            pMeta->meta_type = NVDS_BATCH_GST_META;
+        }
+        return pSnapshot;
+    }
+    
+    void CustomPadProbeHandler::HandleAsyncQueue()
+    {
+        LOG_FUNC();
+        
+        while (true)
+        {
+            GstBuffer* pBuffer(NULL);
+            {
+                LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_asyncQueueMutex);
+                
+                while (!m_asyncStop and m_asyncQueue.empty())
+                {
+                    g_cond_wait(&m_asyncNotEmptyCond, &m_asyncQueueMutex);
+                }
+                if (m_asyncStop)
+                {
+                    break;
+                }
+                pBuffer = m_asyncQueue.front();
+                m_asyncQueue.pop();
+                m_asyncMetrics.current_level = m_asyncQueue.size();
+                
+                g_cond_signal(&m_asyncNotFullCond);
+            }
+            try
+            {
+                // return value is ignored, the buffer has already moved on.
+                m_clientHandler(pBuffer, m_clientData);
+            }
+            catch(...)
+            {
+                LOG_ERROR("CustomPadProbeHandler '" << GetName() 
+                    << "' threw an exception processing Pad Buffer");
+            }
+            gst_buffer_unref(pBuffer);
+            
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_asyncQueueMutex);
+            m_asyncMetrics.processed++;
         }
     }
     
+    void CustomPadProbeHandler::StopAsyncWorker()
+    {
+        LOG_FUNC();
+        
+        if (!m_pAsyncThread)
+        {
+            return;
+        }
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_asyncQueueMutex);
+            m_asyncStop = true;
+            g_cond_broadcast(&m_asyncNotEmptyCond);
+            g_cond_broadcast(&m_asyncNotFullCond);
+        }
+        g_thread_join(m_pAsyncThread);
+        m_pAsyncThread = NULL;
+        
+        // release all buffers still waiting in the queue
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_asyncQueueMutex);
+        while (!m_asyncQueue.empty())
+        {
+            gst_buffer_unref(m_asyncQueue.front());
+            m_asyncQueue.pop();
+            m_asyncMetrics.dropped++;
+        }
+        m_asyncMetrics.current_level = 0;
+    }
+    
     //--------------------------------------------------------------------------------
 
     MeterPadProbeHandler::MeterPadProbeHandler(const char* name, 
@@ -704,28 +1427,29 @@ namespace DSL
     void TimestampPadProbeHandler::GetTime(struct timeval& timestamp)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
-        timestamp = m_timestamp;
+        
+        int64_t time = m_timestamp.load(std::memory_order_relaxed);
+        timestamp.tv_sec = time / G_USEC_PER_SEC;
+        timestamp.tv_usec = time % G_USEC_PER_SEC;
     }
     
     void TimestampPadProbeHandler::SetTime(struct timeval& timestamp)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
         
-        m_timestamp = timestamp;
+        m_timestamp.store((int64_t)timestamp.tv_sec*G_USEC_PER_SEC + 
+            timestamp.tv_usec, std::memory_order_relaxed);
     }
     
     GstPadProbeReturn TimestampPadProbeHandler::HandlePadData(GstPadProbeInfo* pInfo)
     {
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
-
+        // Note: called for every buffer - no lock, a single atomic store only.
         if (!m_isEnabled)
         {
             return GST_PAD_PROBE_OK;
         }
         
-        gettimeofday(&m_timestamp, NULL);
+        m_timestamp.store(g_get_real_time(), std::memory_order_relaxed);
         return GST_PAD_PROBE_OK;
     }
 
@@ -737,7 +1461,6 @@ namespace DSL
         , m_timeout(timeout)
         , m_clientHandler(handler)
         , m_clientData(clientData)
-        , m_bufferTimerId(0)
     {
         LOG_FUNC();
         
@@ -759,10 +1482,11 @@ namespace DSL
     BufferTimeoutPadProbeHandler::~BufferTimeoutPadProbeHandler()
     {
         LOG_FUNC();
-        if (m_bufferTimerId)
+        // Note: the Stall Watchdog holds a reference to this handler while 
+        // the timer handler is running, so it's never destroyed mid-call.
+        if (m_isEnabled)
         {
-            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
-            g_source_remove(m_bufferTimerId);
+            StallWatchdog::GetWatchdog()->RemoveDetector(this);
         }
     }
     
@@ -775,17 +1499,19 @@ namespace DSL
             return false;
         }
 
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
-
         if (m_isEnabled)
         {
-            m_bufferTimerId = g_timeout_add(10, 
-                buffer_timer_cb, this);
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
+            
+            StallWatchdog::GetWatchdog()->AddDetector(this, GetCStrName(),
+                this, m_timeout*1000, buffer_timer_cb, this);
         }
-        else if (m_bufferTimerId)
+        else
         {
-            g_source_remove(m_bufferTimerId);
-            m_bufferTimerId = 0;
+            // Note: the Stall Watchdog does not wait for the timer handler to
+            // return if it's currently running, as the caller may hold the 
+            // Services lock.
+            StallWatchdog::GetWatchdog()->RemoveDetector(this);
         }
         return true;
     }
@@ -804,41 +1530,27 @@ namespace DSL
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
         
         m_timeout = timeout;
+        
+        if (m_isEnabled)
+        {
+            StallWatchdog::GetWatchdog()->SetDetectorTimeout(this, 
+                m_timeout*1000);
+        }
     }
     
     int BufferTimeoutPadProbeHandler::TimerHanlder()
     {
-        // Note - wait to lock the mutex as GetTime will lock it.
-        
-        // Get the last buffer time. This timer callback will not be called
-        // until after the timer is started on main-loop run after play 
-        // therefore the lastBufferTime should be non-zero once the first
-        // buffer is received
-        struct timeval lastBufferTime;
-        GetTime(lastBufferTime);
-
-        // Now ok to lock
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
 
-        struct timeval currentTime;
-        gettimeofday(&currentTime, NULL);
-
-        if (lastBufferTime.tv_sec == 0)
+        // Note: the Stall Watchdog only calls this handler once the timeout 
+        // has been exceeded. The timeout is not reported until after the 
+        // first buffer is received.
+        if (GetTimeUs() == 0)
         {
             LOG_DEBUG("Waiting for first buffer before checking for timeout \
 for Buffer Timer PPH '" << GetName() << "'");
             return true;
         }
-
-        double timeSinceLastBufferMs = 
-            1000.0*(currentTime.tv_sec - lastBufferTime.tv_sec) + 
-            (currentTime.tv_usec - lastBufferTime.tv_usec) / 1000.0;
-
-        if (timeSinceLastBufferMs < (double)m_timeout*1000)
-        {
-            // Timeout has not been exceeded, so return true to sleep again
-            return true;
-        }
         LOG_INFO("Buffer timeout of " << m_timeout << " seconds exceeded for PPH '" 
             << GetName() << "'");
 
@@ -853,11 +1565,10 @@ for Buffer Timer PPH '" << GetName() << "'");
                     << "' threw an exception processing Pad Buffer");
             }
         }
-        // clear the timer id and set the enabled state disabling the pph.
-        m_bufferTimerId = 0;
+        // set the enabled state disabling the pph.
         m_isEnabled = false;
 
-        // return false to stop the timer.
+        // return false to remove the stall detector.
         return false;
     }
 
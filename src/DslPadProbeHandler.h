@@ -29,6 +29,8 @@ THE SOFTWARE.
 #include "DslApi.h"
 #include "DslBase.h"
 #include "DslSourceMeter.h"
+#include "DslMetaRecord.h"
+#include "DslMetaShm.h"
 
 
 namespace DSL
@@ -58,6 +60,16 @@ namespace DSL
     #define DSL_PPH_ODE_NEW(name) \
         std::shared_ptr<OdePadProbeHandler>(new OdePadProbeHandler(name))
 
+    #define DSL_PPH_META_RECORDER_PTR std::shared_ptr<MetaRecorderPadProbeHandler>
+    #define DSL_PPH_META_RECORDER_NEW(name, filePath) \
+        std::shared_ptr<MetaRecorderPadProbeHandler>( \
+            new MetaRecorderPadProbeHandler(name, filePath))
+
+    #define DSL_PPH_META_PUBLISHER_PTR std::shared_ptr<MetaPublisherPadProbeHandler>
+    #define DSL_PPH_META_PUBLISHER_NEW(name, shmName, slotCount, maxObjects) \
+        std::shared_ptr<MetaPublisherPadProbeHandler>( \
+            new MetaPublisherPadProbeHandler(name, shmName, slotCount, maxObjects))
+
     #define DSL_PPH_TIMESTAMP_PTR std::shared_ptr<TimestampPadProbeHandler>
     #define DSL_PPH_TIMESTAMP_NEW(name) \
         std::shared_ptr<TimestampPadProbeHandler>(new TimestampPadProbeHandler(name))
@@ -318,8 +330,79 @@ namespace DSL
          */
         GstPadProbeReturn HandlePadData(GstPadProbeInfo* pInfo);
 
+        /**
+         * @brief Gets the current asynchronous mode enabled setting.
+         * @return true if the client handler is called from the worker thread.
+         */
+        bool GetAsyncEnabled();
+        
+        /**
+         * @brief Sets the asynchronous mode enabled setting, starting or 
+         * stopping the worker thread that drains the queue.
+         * @param[in] enabled set to true to enable asynchronous mode.
+         * @return true if successfully set, false otherwise.
+         */
+        bool SetAsyncEnabled(bool enabled);
+        
+        /**
+         * @brief Gets the current asynchronous queue settings.
+         * @param[out] maxSize maximum number of buffers the queue can hold.
+         * @param[out] policy one of the DSL_PPH_CUSTOM_ASYNC_POLICY constants.
+         * @param[out] sampleInterval sample interval for the sample policy.
+         */
+        void GetAsyncQueueSettings(uint* maxSize, 
+            uint* policy, uint* sampleInterval);
+        
+        /**
+         * @brief Sets the asynchronous queue settings.
+         * @param[in] maxSize maximum number of buffers the queue can hold.
+         * @param[in] policy one of the DSL_PPH_CUSTOM_ASYNC_POLICY constants.
+         * @param[in] sampleInterval sample interval for the sample policy.
+         * @return true if successfully set, false otherwise.
+         */
+        bool SetAsyncQueueSettings(uint maxSize, 
+            uint policy, uint sampleInterval);
+        
+        /**
+         * @brief Gets the current asynchronous queue and drop metrics.
+         * @param[out] pMetrics metrics structure to fill in.
+         */
+        void GetAsyncMetrics(dsl_pph_custom_async_metrics* pMetrics);
+        
+        /**
+         * @brief Clears the asynchronous queue and drop metrics.
+         */
+        void ClearAsyncMetrics();
+        
+        /**
+         * @brief Worker thread function, calls the client handler with
+         * each buffer removed from the queue until stopped.
+         */
+        void HandleAsyncQueue();
+
     private:
     
+        /**
+         * @brief Adds a buffer to the asynchronous queue, applying the 
+         * queue-full policy as required. 
+         * @param[in] pBuffer buffer to add, a snapshot is queued in its place.
+         */
+        void QueueBuffer(GstBuffer* pBuffer);
+        
+        /**
+         * @brief Creates a read-only snapshot of a buffer for the worker 
+         * thread, i.e. a new buffer, without memory, holding the original 
+         * timestamps and a deep copy of its NvDsBatchMeta.
+         * @param[in] pBuffer buffer to snapshot.
+         * @return new snapshot buffer owned by the caller.
+         */
+        GstBuffer* snapshotBuffer(GstBuffer* pBuffer);
+        
+        /**
+         * @brief Stops the worker thread and releases all queued buffers.
+         */
+        void StopAsyncWorker();
+    
         /**
          * @brief client callback funtion, called on each HandlePadData
          */
@@ -330,6 +413,68 @@ namespace DSL
          */
         void* m_clientData;
         
+        /**
+         * @brief true if the client handler is called from the worker thread.
+         */
+        bool m_asyncEnabled;
+        
+        /**
+         * @brief maximum number of buffers the asynchronous queue can hold.
+         */
+        uint m_asyncMaxSize;
+        
+        /**
+         * @brief one of the DSL_PPH_CUSTOM_ASYNC_POLICY constants.
+         */
+        uint m_asyncPolicy;
+        
+        /**
+         * @brief every Nth buffer received while the queue is full replaces
+         * the oldest queued buffer, DSL_PPH_CUSTOM_ASYNC_POLICY_SAMPLE only.
+         */
+        uint m_asyncSampleInterval;
+        
+        /**
+         * @brief number of buffers received while the queue is full, 
+         * used by the sample policy. 
+         */
+        uint64_t m_asyncOverflowCount;
+        
+        /**
+         * @brief set to true to signal the worker thread to exit.
+         */
+        bool m_asyncStop;
+        
+        /**
+         * @brief worker thread that drains the asynchronous queue.
+         */
+        GThread* m_pAsyncThread;
+        
+        /**
+         * @brief bounded queue of referenced buffers waiting to be processed.
+         */
+        std::queue<GstBuffer*> m_asyncQueue;
+        
+        /**
+         * @brief mutex to protect the asynchronous queue and metrics.
+         */
+        DslMutex m_asyncQueueMutex;
+        
+        /**
+         * @brief condition signaled when a buffer is added to the queue.
+         */
+        DslCond m_asyncNotEmptyCond;
+        
+        /**
+         * @brief condition signaled when a buffer is removed from the queue.
+         */
+        DslCond m_asyncNotFullCond;
+        
+        /**
+         * @brief current queue and drop metrics.
+         */
+        dsl_pph_custom_async_metrics m_asyncMetrics;
+        
     };
 
     //--------------------------------------------------------------------------------
@@ -509,6 +654,50 @@ namespace DSL
     
     //--------------------------------------------------------------------------------
 
+    class OdeTrigger;
+    class TrackedObjectStore;
+    
+    /**
+     * @struct OdeFrameWork
+     * @brief A frame of a batch to process with its pre-acquired Display Meta.
+     */
+    struct OdeFrameWork
+    {
+        /**
+         * @brief frame metadata to process.
+         */
+        NvDsFrameMeta* pFrameMeta;
+        
+        /**
+         * @brief Display Meta acquired for the frame.
+         */
+        std::vector<NvDsDisplayMeta*> displayMetaData;
+    };
+    
+    /**
+     * @struct OdeSourceWork
+     * @brief The frames of a batch from a single source, in batch order, to
+     * process with the per-source safe Triggers that filter on the source.
+     */
+    struct OdeSourceWork
+    {
+        /**
+         * @brief unique id of the source.
+         */
+        int sourceId;
+        
+        /**
+         * @brief indices of the source's frames in the batch's frame work.
+         */
+        std::vector<uint> frameIndices;
+        
+        /**
+         * @brief per-source safe Triggers filtering on the source, 
+         * in execution order.
+         */
+        std::vector<std::shared_ptr<OdeTrigger>> triggers;
+    };
+    
     /**
      * @class OdePadProbeHandler
      * @brief Pad Probe Handler to Handle a collection ODE triggers
@@ -566,13 +755,137 @@ namespace DSL
          */
         GstPadProbeReturn HandlePadData(GstPadProbeInfo* pInfo);
         
+        /**
+         * @brief Processes the batch metadata with all ODE Triggers owned
+         * by this ODE Pad Probe Handler, if enabled.
+         * @param[in] pBuffer buffer containing the batch metadata, or NULL if
+         * the metadata was created without a buffer, i.e. on replay.
+         * @param[in] pBatchMeta batch metadata to process.
+         */
+        void HandleBatchMeta(GstBuffer* pBuffer, NvDsBatchMeta* pBatchMeta);
+        
+        /**
+         * @brief Replays all batch records from a Metadata Record file, as 
+         * synthetic batch metadata, through all ODE Triggers owned by this 
+         * ODE Pad Probe Handler. The batches are processed in the calling 
+         * thread, as fast as possible, without a buffer. Actions that require
+         * the frame buffer, i.e. Capture and Custom Actions, are not invoked.
+         * Tracked time, i.e. persistence, is measured with the recorded 
+         * frame timestamps.
+         * @param[in] pReader reader for the Metadata Record file to replay.
+         * @return total number of frames replayed.
+         */
+        uint64_t ReplayMetaRecord(DSL_META_RECORD_READER_PTR pReader);
+        
+        /**
+         * @brief Gets the number of frame workers used to evaluate the
+         * frames of a batch in parallel.
+         * @return number of frame workers, 0 if disabled.
+         */
+        uint GetFrameWorkers();
+        
+        /**
+         * @brief Sets the number of frame workers used to evaluate the frames 
+         * of a batch in parallel. The frames of each source are processed in 
+         * batch order, concurrently with other sources, by the leading Triggers
+         * that are per-source safe, up to the first Trigger in index order that
+         * is not. The remaining Triggers are processed serially after.
+         * @param[in] workers number of frame workers, 0 to disable.
+         * @return true on successful update, false otherwise.
+         */
+        bool SetFrameWorkers(uint workers);
+        
+        /**
+         * @brief Processes the frames of a single source with the source's
+         * per-source safe Triggers. Called by the frame worker pool.
+         * @param[in] pSourceWork source work to process.
+         */
+        void HandleSourceWork(OdeSourceWork* pSourceWork);
+        
+        /**
+         * @brief Gets the store of tracked object histories shared by all 
+         * Tracking Triggers owned by this ODE Pad Probe Handler.
+         * @return shared pointer to the Tracked Object Store.
+         */
+        std::shared_ptr<TrackedObjectStore> GetTrackedObjectStore()
+        {
+            return m_pTrackedObjectStore;
+        };
+        
     private:
     
+        /**
+         * @brief Enables/disables replay mode for all Tracking Triggers 
+         * owned by this ODE Pad Probe Handler.
+         * @param[in] enabled true to enable replay mode, false to disable.
+         */
+        void setReplayEnabled(bool enabled);
+    
+        /**
+         * @brief Processes a single frame with a set of Triggers.
+         * @param[in] pBuffer buffer containing the frame, may be NULL.
+         * @param[in] frameWork frame to process.
+         * @param[in] triggers Triggers to process the frame with, in order.
+         */
+        void HandleFrame(GstBuffer* pBuffer, OdeFrameWork& frameWork,
+            const std::vector<std::shared_ptr<OdeTrigger>>& triggers);
+    
+        /**
+         * @brief Processes the frames of a batch on the frame worker pool with 
+         * the leading per-source safe Triggers, up to the first Trigger that is
+         * not, and removes them from the Triggers to process serially.
+         * @param[in,out] triggers all Triggers on entry, remaining Triggers to
+         * process serially on return.
+         */
+        void HandleSourceWorkInParallel(
+            std::vector<std::shared_ptr<OdeTrigger>>& triggers);
+    
         /**
          * @brief specifies how many Display Meta structures are allocated for each frame
          */
         uint m_displayMetaAllocSize;
         
+        /**
+         * @brief number of frame workers, 0 if parallel evaluation is disabled.
+         */
+        uint m_frameWorkers;
+        
+        /**
+         * @brief fixed pool of frame worker threads, NULL if disabled.
+         */
+        GThreadPool* m_pFrameWorkerPool;
+        
+        /**
+         * @brief current buffer being processed by the frame workers.
+         */
+        GstBuffer* m_pCurrentBuffer;
+        
+        /**
+         * @brief frames of the current batch being processed.
+         */
+        std::vector<OdeFrameWork> m_frameWork;
+        
+        /**
+         * @brief per-source work for the current batch, reused for each batch.
+         */
+        std::vector<OdeSourceWork> m_sourceWork;
+        
+        /**
+         * @brief number of source work items not yet completed by the 
+         * frame workers.
+         */
+        uint m_pendingSourceWork;
+        
+        /**
+         * @brief mutex to protect m_pendingSourceWork.
+         */
+        DslMutex m_sourceWorkMutex;
+        
+        /**
+         * @brief condition signaled when all source work has completed.
+         */
+        DslCond m_sourceWorkCond;
+        
         /**
          * @brief Index variable to incremment/assign on ODE Trigger add.
          */
@@ -583,6 +896,111 @@ namespace DSL
          */
         std::map <uint, DSL_BASE_PTR> m_pChildrenIndexed; 
         
+        /**
+         * @brief store of tracked object histories shared by all child 
+         * Tracking Triggers. Each object is updated once per frame, and 
+         * unreferenced histories are purged once per batch.
+         */
+        std::shared_ptr<TrackedObjectStore> m_pTrackedObjectStore;
+        
+    };
+    
+    //--------------------------------------------------------------------------------
+
+    /**
+     * @class MetaRecorderPadProbeHandler
+     * @brief Pad Probe Handler to record the frame and object metadata of
+     * each batch to an indexed Metadata Record file.
+     */
+    class MetaRecorderPadProbeHandler : public PadProbeBufferHandler
+    {
+    public: 
+    
+        /**
+         * @brief ctor for the Metadata Recorder Pad Probe Handler
+         * @param[in] name unique name for the PPH
+         * @param[in] filePath path to the Metadata Record file to create.
+         */
+        MetaRecorderPadProbeHandler(const char* name, const char* filePath);
+
+        /**
+         * @brief dtor for the Metadata Recorder Pad Probe Handler.
+         * Closes the Metadata Record file.
+         */
+        ~MetaRecorderPadProbeHandler();
+
+        /**
+         * @brief Gets the number of batch records written to file.
+         * @return number of batch records.
+         */
+        uint64_t GetBatchCount();
+
+        /**
+         * @brief Metadata Recorder Pad Probe Handler
+         * @param[in] pBuffer Pad buffer
+         * @return GstPadProbeReturn see GST reference, one of 
+         * [GST_PAD_PROBE_DROP, GST_PAD_PROBE_OK, GST_PAD_PROBE_REMOVE, 
+         * GST_PAD_PROBE_PASS, GST_PAD_PROBE_HANDLED]
+         */
+        GstPadProbeReturn HandlePadData(GstPadProbeInfo* pInfo);
+        
+    private:
+    
+        /**
+         * @brief writer for the Metadata Record file.
+         */
+        DSL_META_RECORD_WRITER_PTR m_pWriter;
+    };
+    
+    //--------------------------------------------------------------------------------
+
+    /**
+     * @class MetaPublisherPadProbeHandler
+     * @brief Pad Probe Handler to publish the frame and object metadata of
+     * each frame to a ring buffer in POSIX shared-memory for co-located
+     * reader processes.
+     */
+    class MetaPublisherPadProbeHandler : public PadProbeBufferHandler
+    {
+    public: 
+    
+        /**
+         * @brief ctor for the Metadata Publisher Pad Probe Handler
+         * @param[in] name unique name for the PPH
+         * @param[in] shmName name of the shared-memory segment to create.
+         * @param[in] slotCount number of frame slots in the ring buffer.
+         * @param[in] maxObjects maximum number of objects per frame slot.
+         */
+        MetaPublisherPadProbeHandler(const char* name, const char* shmName,
+            uint slotCount, uint maxObjects);
+
+        /**
+         * @brief dtor for the Metadata Publisher Pad Probe Handler.
+         * Unlinks the shared-memory segment.
+         */
+        ~MetaPublisherPadProbeHandler();
+
+        /**
+         * @brief Gets the sequence number of the last frame published.
+         * @return last sequence number, 0 if no frames have been published.
+         */
+        uint64_t GetSequence();
+
+        /**
+         * @brief Metadata Publisher Pad Probe Handler
+         * @param[in] pBuffer Pad buffer
+         * @return GstPadProbeReturn see GST reference, one of 
+         * [GST_PAD_PROBE_DROP, GST_PAD_PROBE_OK, GST_PAD_PROBE_REMOVE, 
+         * GST_PAD_PROBE_PASS, GST_PAD_PROBE_HANDLED]
+         */
+        GstPadProbeReturn HandlePadData(GstPadProbeInfo* pInfo);
+        
+    private:
+    
+        /**
+         * @brief writer for the shared-memory ring buffer.
+         */
+        DSL_META_SHM_WRITER_PTR m_pWriter;
     };
     
     //--------------------------------------------------------------------------------
@@ -677,7 +1095,8 @@ namespace DSL
 
     /**
      * @class TimestampPadProbeHandler
-     * @brief implements a timestamp that is updated on each call to handle buffer
+     * @brief implements a timestamp that is updated on each call to handle buffer.
+     * The timestamp is stored atomically so that buffers are stamped lock-free.
      */
     class TimestampPadProbeHandler : public PadProbeBufferHandler
     {
@@ -699,6 +1118,13 @@ namespace DSL
          */
         void SetTime(struct timeval& timestamp);
         
+        /**
+         * @brief returns the time of the last buffer without locking.
+         * @return wall-clock time of the last buffer in microseconds, 
+         * 0 if no buffer has been received.
+         */
+        int64_t GetTimeUs(){return m_timestamp.load(std::memory_order_relaxed);};
+        
         /**
          * @brief Timestamp Pad Probe Handler. Updates the Timestamp to 
          * current-time on each buffer
@@ -713,9 +1139,9 @@ namespace DSL
     
         /**
          * @brief updated on each call to HandlePadData which provides a 
-         * time stamp for the last.
+         * time stamp, in microseconds, for the last buffer.
          */
-        timeval m_timestamp;
+        std::atomic<int64_t> m_timestamp;
         
     };
     
@@ -724,7 +1150,7 @@ namespace DSL
     /**
      * @class BufferTimeoutPadProbeHandler
      * @brief implements a PPH that will call a client callback on 
-     * new buffer timeout.
+     * new buffer timeout. The timeout is detected by the Stall Watchdog.
      */
     class BufferTimeoutPadProbeHandler : public TimestampPadProbeHandler
     {
@@ -766,7 +1192,8 @@ namespace DSL
         void SetTimeout(uint timeout);
         
         /**
-         * @brief handles the timer experation to check for new buffer timeout
+         * @brief handles a stall detected by the Stall Watchdog.
+         * @return true to continue watching, false to stop.
          */
         int TimerHanlder();
         
@@ -784,15 +1211,10 @@ namespace DSL
          */
         void* m_clientData;
         
-        /**
-         * @brief gnome timer Id for buffer timeout management 
-         */
-        uint m_bufferTimerId;
-        
     };
 
     /**
-     * @brief Timer callback for the BufferTimeoutPadProbeHandler.
+     * @brief Stall Watchdog callback for the BufferTimeoutPadProbeHandler.
      * @param pPph shared pointer to BufferTimeoutPadProbeHandler.
      * @return int true to continue, 0 to self remove
      */
@@ -36,6 +36,11 @@ namespace DSL
         : BranchBintr(name, true)      // Pipeline = true
         , PipelineStateMgr(m_pGstObj)
         , PipelineBusSyncMgr(m_pGstObj)
+        , m_standbyState(GST_STATE_NULL)
+        , m_firstFrameStartTime(0)
+        , m_timeToFirstFrame(0)
+        , m_firstFrameProbeId(0)
+        , m_pFirstFramePad(NULL)
     {
         LOG_FUNC();
 
@@ -62,6 +67,17 @@ namespace DSL
 
         // Add PipelineSourcesBintr as chid of this PipelineBintr.
         GstNodetr::AddChild(m_pPipelineSourcesBintr);
+
+        // Get the PipelineSourcesBintr's src pad for the first-frame probe.
+        m_pFirstFramePad = gst_element_get_static_pad(
+            m_pPipelineSourcesBintr->GetGstElement(), "src");
+
+        // Instantiate the Queue Sampler - disabled by default.
+        m_pQueueSampler = DSL_QUEUE_SAMPLER_NEW(GetCStrName(), this);
+
+        // Instantiate the Infer Interval Controller - disabled by default.
+        m_pInferIntervalController = DSL_INFER_INTERVAL_CONTROLLER_NEW(
+            GetCStrName(), this, m_pQueueSampler);
     }
 
     PipelineBintr::~PipelineBintr()
@@ -73,6 +89,11 @@ namespace DSL
             SetState(GST_STATE_NULL, 
                 DSL_DEFAULT_STATE_CHANGE_TIMEOUT_IN_SEC * GST_SECOND);
         }
+        cancelFirstFrameTimer();
+        if (m_pFirstFramePad)
+        {
+            gst_object_unref(m_pFirstFramePad);
+        }
         // clear the pipeline-id for reuse.
         m_usedPipelineIds[m_pipelineId] = false;
     }
@@ -319,7 +340,12 @@ namespace DSL
             LOG_INFO("Components for Pipeline '" << GetName() << "' are already assembled");
             return false;
         }
-        if (!m_pPipelineSourcesBintr->GetNumChildren())
+        int64_t startTime = g_get_monotonic_time();
+        
+        // Pipelines in standby mode are linked without Sources which are
+        // then added dynamically.
+        if (!m_pPipelineSourcesBintr->GetNumChildren() and 
+            m_standbyState == GST_STATE_NULL)
         {
             LOG_ERROR("Pipline '" << GetName() << "' has no required Source component - and is unable to link");
             return false;
@@ -359,7 +385,22 @@ namespace DSL
         }
 
         // call the base class to Link all remaining components.
-        return BranchBintr::LinkAll(); 
+        if (!BranchBintr::LinkAll())
+        {
+            return false;
+        }
+        RecordStartupLink(DSL_PIPELINE_STARTUP_EVENT_LINK, startTime);
+        return true;
+    }
+
+    void PipelineBintr::UnlinkAll()
+    {
+        LOG_FUNC();
+        
+        int64_t startTime = g_get_monotonic_time();
+
+        BranchBintr::UnlinkAll();
+        RecordStartupLink(DSL_PIPELINE_STARTUP_EVENT_UNLINK, startTime);
     }
 
     bool PipelineBintr::Play()
@@ -370,11 +411,16 @@ namespace DSL
         GetState(currentState, 0);
         if (currentState == GST_STATE_NULL or currentState == GST_STATE_READY)
         {
-            if (!LinkAll())
+            StartStartupProfile();
+            StartFirstFrameTimer();
+            
+            // Pipelines in standby mode are already linked in READY.
+            if (!m_isLinked and !LinkAll())
             {
                 LOG_ERROR("Unable to prepare Pipeline '" << GetName() << "' for Play");
                 return false;
             }
+            AddStartupPadProbes();
             // For non-live sources we Pause to preroll before we play
             if (!m_pPipelineSourcesBintr->StreammuxPlayTypeIsLiveGet())
             {
@@ -555,10 +601,182 @@ namespace DSL
         
         m_eosFlag = false;
         UnlinkAll();
+        cancelFirstFrameTimer();
+        RemoveStartupPadProbes();
         
         g_cond_signal(&m_asyncCommsCond);
     }
 
+    bool PipelineBintr::Standby(GstState state, bool isLive)
+    {
+        LOG_FUNC();
+        
+        if (state != GST_STATE_READY and state != GST_STATE_PAUSED)
+        {
+            LOG_ERROR("Invalid standby state '" << state 
+                << "' for Pipeline '" << GetName() << "'");
+            return false;
+        }
+        if (m_isLinked)
+        {
+            LOG_ERROR("Unable to place Pipeline '" << GetName() 
+                << "' in standby as it's currently linked");
+            return false;
+        }
+        // The batch-size can't be derived from the number of Sources, and
+        // must be set by the client, if standing by without Sources. 
+        if (!m_pPipelineSourcesBintr->GetNumChildren() and 
+            !GetStreammuxBatchSize())
+        {
+            LOG_ERROR("Pipeline '" << GetName() 
+                << "' requires a Streammuxer batch-size to standby without Sources");
+            return false;
+        }
+        if (!m_pPipelineSourcesBintr->GetNumChildren())
+        {
+            m_pPipelineSourcesBintr->StreammuxPlayTypeIsLiveSet(isLive);
+        }
+        else if (m_pPipelineSourcesBintr->StreammuxPlayTypeIsLiveGet() != isLive)
+        {
+            LOG_ERROR("Pipeline '" << GetName() << "' has Sources with IsLive=" 
+                << !isLive << " and can't standby with IsLive=" << isLive);
+            return false;
+        }
+        m_standbyState = state;
+        
+        StartStartupProfile();
+        if (!LinkAll())
+        {
+            LOG_ERROR("Unable to link Pipeline '" << GetName() 
+                << "' for standby");
+            m_standbyState = GST_STATE_NULL;
+            return false;
+        }
+        AddStartupPadProbes();
+        // All elements -- including the Inference engines -- complete their 
+        // state change synchronously. The sinks can't preroll until Sources 
+        // are added so we don't wait on the async state change to complete.
+        if (!SetState(state, 0))
+        {
+            LOG_ERROR("Failed to set Pipeline '" << GetName() 
+                << "' to its standby state");
+            return false;
+        }
+        LOG_INFO("Pipeline '" << GetName() << "' is in standby with state = " 
+            << gst_element_state_get_name(state));
+        return true;
+    }
+
+    void PipelineBintr::ExitStandby()
+    {
+        LOG_FUNC();
+        
+        if (m_standbyState == GST_STATE_NULL)
+        {
+            return;
+        }
+        if (m_isLinked and !m_pPipelineSourcesBintr->GetNumChildren())
+        {
+            SetState(GST_STATE_NULL, 
+                DSL_DEFAULT_STATE_CHANGE_TIMEOUT_IN_SEC * GST_SECOND);
+            UnlinkAll();
+            cancelFirstFrameTimer();
+            m_eosFlag = false;
+        }
+        m_standbyState = GST_STATE_NULL;
+    }
+
+    bool PipelineBintr::Recycle(bool& relinked)
+    {
+        LOG_FUNC();
+        
+        if (m_standbyState == GST_STATE_NULL)
+        {
+            LOG_ERROR("Unable to recycle Pipeline '" << GetName() 
+                << "' as it's not in standby mode");
+            return false;
+        }
+        if (m_pPipelineSourcesBintr->GetNumChildren())
+        {
+            LOG_ERROR("Unable to recycle Pipeline '" << GetName() 
+                << "' as it has Sources in use");
+            return false;
+        }
+        cancelFirstFrameTimer();
+        
+        // A Pipeline that has been stopped -- unlinked -- or has reached EOS 
+        // must be relinked and re-initialized.
+        relinked = (!m_isLinked or m_eosFlag);
+        if (!relinked)
+        {
+            return SetState(m_standbyState, 0);
+        }
+        if (m_isLinked)
+        {
+            SetState(GST_STATE_NULL, 
+                DSL_DEFAULT_STATE_CHANGE_TIMEOUT_IN_SEC * GST_SECOND);
+            UnlinkAll();
+        }
+        m_eosFlag = false;
+
+        return Standby(m_standbyState, 
+            m_pPipelineSourcesBintr->StreammuxPlayTypeIsLiveGet());
+    }
+
+    void PipelineBintr::StartFirstFrameTimer()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_firstFrameMutex);
+        
+        // Keep the start time of a measurement already in progress.
+        if (m_firstFrameProbeId or !m_pFirstFramePad)
+        {
+            return;
+        }
+        m_firstFrameStartTime = g_get_monotonic_time();
+        m_timeToFirstFrame = 0;
+        m_firstFrameProbeId = gst_pad_add_probe(m_pFirstFramePad, 
+            GST_PAD_PROBE_TYPE_BUFFER, 
+            (GstPadProbeCallback)PipelineFirstFrameProbeCB, this, NULL);
+    }
+
+    double PipelineBintr::GetTimeToFirstFrame()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_firstFrameMutex);
+        
+        return (double)m_timeToFirstFrame / 1000.0;
+    }
+
+    GstPadProbeReturn PipelineBintr::HandleFirstFrame()
+    {
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_firstFrameMutex);
+        
+        // Guard against a buffer racing with a cancel.
+        if (m_firstFrameProbeId)
+        {
+            m_timeToFirstFrame = 
+                std::max((gint64)1, g_get_monotonic_time() - m_firstFrameStartTime);
+            m_firstFrameProbeId = 0;
+            RecordStartupFirstFrame();
+            
+            LOG_INFO("Pipeline '" << GetName() << "' time-to-first-frame = " 
+                << m_timeToFirstFrame << "us");
+        }
+        return GST_PAD_PROBE_REMOVE;
+    }
+
+    void PipelineBintr::cancelFirstFrameTimer()
+    {
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_firstFrameMutex);
+        
+        if (m_firstFrameProbeId)
+        {
+            gst_pad_remove_probe(m_pFirstFramePad, m_firstFrameProbeId);
+            m_firstFrameProbeId = 0;
+        }
+    }
+
     bool PipelineBintr::IsLive()
     {
         LOG_FUNC();
@@ -576,16 +794,53 @@ namespace DSL
     {
         LOG_FUNC();
         
-        GST_DEBUG_BIN_TO_DOT_FILE(GST_BIN(m_pGstObj), 
-            GST_DEBUG_GRAPH_SHOW_ALL, filename);
+        dumpAnnotatedDot(filename, false);
     }
     
     void PipelineBintr::DumpToDotWithTs(char* filename)
     {
         LOG_FUNC();
         
-        GST_DEBUG_BIN_TO_DOT_FILE_WITH_TS(GST_BIN(m_pGstObj), 
-            GST_DEBUG_GRAPH_SHOW_ALL, filename);
+        dumpAnnotatedDot(filename, true);
+    }
+
+    void PipelineBintr::dumpAnnotatedDot(const char* filename, bool withTs)
+    {
+        // Same as GST_DEBUG_BIN_TO_DOT_FILE, dumping is disabled unless
+        // the dump directory is set.
+        const gchar* dumpDir = g_getenv("GST_DEBUG_DUMP_DOT_DIR");
+        if (!dumpDir)
+        {
+            return;
+        }
+        gchar* dotData = gst_debug_bin_to_dot_data(GST_BIN(m_pGstObj), 
+            GST_DEBUG_GRAPH_SHOW_ALL);
+        std::string annotatedDot(dotData);
+        g_free(dotData);
+        
+        AnnotateStartupProfile(annotatedDot);
+        
+        std::ostringstream filePath;
+        filePath << dumpDir << G_DIR_SEPARATOR_S;
+        if (withTs)
+        {
+            GstClockTime timestamp = g_get_monotonic_time() * GST_USECOND;
+            gchar* ts = g_strdup_printf("%" GST_TIME_FORMAT "-", 
+                GST_TIME_ARGS(timestamp));
+            filePath << ts;
+            g_free(ts);
+        }
+        filePath << filename << ".dot";
+        
+        std::ofstream dotFile(filePath.str());
+        if (!dotFile.is_open())
+        {
+            LOG_ERROR("Pipeline '" << GetName() << "' failed to open dot file '"
+                << filePath.str() << "'");
+            return;
+        }
+        dotFile << annotatedDot;
+        dotFile.close();
     }
 
     static int PipelineStop(gpointer pPipeline)
@@ -596,4 +851,10 @@ namespace DSL
         return false;
     }
 
+    static GstPadProbeReturn PipelineFirstFrameProbeCB(GstPad* pPad, 
+        GstPadProbeInfo* pInfo, gpointer pPipeline)
+    {
+        return static_cast<PipelineBintr*>(pPipeline)->HandleFirstFrame();
+    }
+
 } // DSL
@@ -34,6 +34,8 @@ THE SOFTWARE.
 #include "DslSourceBintr.h"
 #include "DslDewarperBintr.h"
 #include "DslPipelineSourcesBintr.h"
+#include "DslQueueSampler.h"
+#include "DslInferIntervalController.h"
     
 namespace DSL 
 {
@@ -65,12 +67,78 @@ namespace DSL
          */
         bool LinkAll();
 
+        /**
+         * @brief Unlinks all Child Bintrs owned by this Pipeline Bintr
+         */
+        void UnlinkAll();
+
         /**
          * @brief Attempts to link all and play the Pipeline
          * @return true if able to play, false otherwise
          */
         bool Play();
 
+        /**
+         * @brief Links all Child Bintrs -- without requiring a Source -- and 
+         * transitions the Pipeline to a warm-standby state of READY or PAUSED.
+         * Sources can then be added dynamically and the Pipeline played without
+         * repeating the costly NULL to PAUSED initialization, i.e. engine load.
+         * @param[in] state standby state, one of GST_STATE_READY or 
+         * GST_STATE_PAUSED.
+         * @param[in] isLive set to true if the Sources to be added are live,
+         * false otherwise. Must match the play type of any current Sources.
+         * @return true if the Pipeline was placed in standby, false otherwise.
+         */
+        bool Standby(GstState state, bool isLive);
+
+        /**
+         * @brief Gets the current standby state for the Pipeline.
+         * @return standby state, GST_STATE_NULL if not in standby mode.
+         */
+        GstState GetStandbyState()
+        {
+            return m_standbyState;
+        }
+
+        /**
+         * @brief Takes the Pipeline out of standby mode. A Pipeline without
+         * Sources is set to a state of NULL and unlinked. A Pipeline with 
+         * Sources is left in its current state.
+         */
+        void ExitStandby();
+
+        /**
+         * @brief Returns a Pipeline -- in standby mode with all Sources 
+         * removed -- to its standby state after use. A Pipeline that was
+         * stopped, or that reached EOS, is relinked and re-initialized.
+         * @param[out] relinked set to true if the Pipeline had to be relinked,
+         * false if returned directly from its current state.
+         * @return true if the Pipeline was returned to standby, false otherwise.
+         */
+        bool Recycle(bool& relinked);
+
+        /**
+         * @brief Starts the time-to-first-frame measurement. The measurement
+         * completes when the first batched buffer is produced by the 
+         * Pipeline's Streammuxer. Called by Play when starting from NULL or 
+         * READY.
+         */
+        void StartFirstFrameTimer();
+
+        /**
+         * @brief Gets the time-to-first-frame for the last measurement.
+         * @return time from the start of the measurement to the first frame
+         * in milliseconds, 0 if the measurement is pending or never started.
+         */
+        double GetTimeToFirstFrame();
+
+        /**
+         * @brief Handles the first buffer produced by the Pipeline's 
+         * Streammuxer, completing the time-to-first-frame measurement.
+         * @return GST_PAD_PROBE_REMOVE always to remove the one-shot probe.
+         */
+        GstPadProbeReturn HandleFirstFrame();
+
         /**
          * @brief Schedules a Timer Callback to call HandlePause in the mainloop context
          * @return true if HandlePause schedule correctly, false otherwise 
@@ -137,6 +205,24 @@ namespace DSL
             return m_pPipelineSourcesBintr;
         }
 
+        /**
+         * @brief Returns the Pipeline's Queue Sampler.
+         * @return Shared pointer to the Pipeline's Queue Sampler.
+         */
+        DSL_QUEUE_SAMPLER_PTR GetQueueSampler()
+        {
+            return m_pQueueSampler;
+        }
+
+        /**
+         * @brief Returns the Pipeline's Infer Interval Controller.
+         * @return Shared pointer to the Pipeline's Infer Interval Controller.
+         */
+        DSL_INFER_INTERVAL_CONTROLLER_PTR GetInferIntervalController()
+        {
+            return m_pInferIntervalController;
+        }
+
         /**
          * @brief Gets the current config-file in use by the Pipeline's Streammuxer.
          * Default = NULL. Streammuxer will use all default vaules.
@@ -314,7 +400,8 @@ namespace DSL
         bool RemoveStreammuxTiler();
         
         /**
-         * @brief dumps a Pipeline's graph to dot file.
+         * @brief dumps a Pipeline's graph to dot file, with each element
+         * annotated with its startup timings if a profile has been recorded.
          * @param[in] filename name of the file without extention.
          * The caller is responsible for providing a correctly formated filename
          * The diretory location is specified by the GStreamer debug 
@@ -324,7 +411,8 @@ namespace DSL
         
         /**
          * @brief dumps a Pipeline's graph to dot file prefixed
-         * with the current timestamp.  
+         * with the current timestamp, with each element annotated with 
+         * its startup timings if a profile has been recorded.
          * @param[in] filename name of the file without extention.
          * The caller is responsible for providing a correctly formated filename
          * The diretory location is specified by the GStreamer debug 
@@ -334,6 +422,15 @@ namespace DSL
         
     private:
 
+        /**
+         * @brief Writes the Pipeline's graph, annotated with the startup 
+         * profile, to file in the GST_DEBUG_DUMP_DOT_DIR directory.
+         * @param[in] filename name of the file without extention.
+         * @param[in] withTs if true, prefix the filename with the current
+         * monotonic time.
+         */
+        void dumpAnnotatedDot(const char* filename, bool withTs);
+
         /**
          * @brief 0-based unique (static) pipeline-id generator for the 
          * PipelineBintr class. Incremented after each pipeline instantiation.
@@ -354,7 +451,56 @@ namespace DSL
          * @brief optional Tiler for the Stream-muxer's output
          */
         DSL_TILER_PTR m_pStreammuxTilerBintr;
+
+        /**
+         * @brief Queue Sampler for all Component queues in this PipelineBintr
+         */
+        DSL_QUEUE_SAMPLER_PTR m_pQueueSampler;
+
+        /**
+         * @brief Infer Interval Controller for all Infer Components in this 
+         * PipelineBintr
+         */
+        DSL_INFER_INTERVAL_CONTROLLER_PTR m_pInferIntervalController;
+
+        /**
+         * @brief standby state for this PipelineBintr, GST_STATE_NULL if 
+         * not in standby mode.
+         */
+        GstState m_standbyState;
+
+        /**
+         * @brief mutex to protect the time-to-first-frame measurement.
+         */
+        DslMutex m_firstFrameMutex;
+
+        /**
+         * @brief monotonic start time of the current time-to-first-frame 
+         * measurement in microseconds.
+         */
+        gint64 m_firstFrameStartTime;
+
+        /**
+         * @brief time-to-first-frame of the last measurement in microseconds,
+         * 0 if pending or never started.
+         */
+        gint64 m_timeToFirstFrame;
+
+        /**
+         * @brief id of the pending one-shot first-frame pad probe, 0 if none.
+         */
+        gulong m_firstFrameProbeId;
+
+        /**
+         * @brief src pad of the PipelineSourcesBintr used for the first-frame
+         * pad probe.
+         */
+        GstPad* m_pFirstFramePad;
         
+        /**
+         * @brief Removes the pending first-frame pad probe if one exists.
+         */
+        void cancelFirstFrameTimer();
         
     }; // Pipeline
     
@@ -365,6 +511,17 @@ namespace DSL
      * @return false always to self destroy the on-shot timer.
      */
     static int PipelineStop(gpointer pPipeline);
+
+    /**
+     * @brief One-shot buffer pad probe callback to complete the Pipeline's
+     * time-to-first-frame measurement.
+     * @param[in] pPad unused
+     * @param[in] pInfo unused
+     * @param[in] pPipeline pointer to the Pipeline that added the probe.
+     * @return GST_PAD_PROBE_REMOVE always to remove the probe.
+     */
+    static GstPadProbeReturn PipelineFirstFrameProbeCB(GstPad* pPad, 
+        GstPadProbeInfo* pInfo, gpointer pPipeline);
     
 } // Namespace
 
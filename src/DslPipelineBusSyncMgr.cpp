@@ -82,6 +82,12 @@ namespace DSL
                 return GST_BUS_DROP;
             }
             break;
+        case GST_MESSAGE_STATE_CHANGED:
+            // Timestamp the state change in the posting thread for the
+            // Pipeline's startup profile recorded by the bus-watch.
+            GST_MESSAGE_TIMESTAMP(pMessage) =
+                g_get_monotonic_time() * GST_USECOND;
+            break;
         default:
             break;
         }
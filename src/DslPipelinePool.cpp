@@ -0,0 +1,312 @@
+/*
+The MIT License
+
+Copyright (c) 2019-2021, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include "Dsl.h"
+#include "DslPipelinePool.h"
+
+namespace DSL
+{
+    PipelinePool::PipelinePool(const char* name, 
+        GstState standbyState, bool isLive)
+        : m_name(name)
+        , m_standbyState(standbyState)
+        , m_isLive(isLive)
+        , m_metrics{0}
+        , m_totalStandbyTime(0)
+        , m_standbyCount(0)
+        , m_totalTimeToFirstFrame(0)
+        , m_firstFrameCount(0)
+    {
+        LOG_FUNC();
+    }
+
+    PipelinePool::~PipelinePool()
+    {
+        LOG_FUNC();
+
+        // Pipelines still acquired are left playing with their Sources.
+        for (auto const& imap: m_pipelines)
+        {
+            imap.second->ExitStandby();
+        }
+    }
+
+    bool PipelinePool::AddPipeline(DSL_PIPELINE_PTR pPipeline)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_poolMutex);
+
+        if (m_pipelines.find(pPipeline->GetName()) != m_pipelines.end())
+        {
+            LOG_ERROR("Pipeline '" << pPipeline->GetName() 
+                << "' is already a member of Pipeline Pool '" << m_name << "'");
+            return false;
+        }
+        if (pPipeline->GetStandbyState() != GST_STATE_NULL)
+        {
+            LOG_ERROR("Pipeline '" << pPipeline->GetName() 
+                << "' is already in standby and can't be added to Pipeline Pool '" 
+                << m_name << "'");
+            return false;
+        }
+        if (!standby(pPipeline, false))
+        {
+            LOG_ERROR("Pipeline Pool '" << m_name 
+                << "' failed to place Pipeline '" << pPipeline->GetName() 
+                << "' in standby");
+            pPipeline->ExitStandby();
+            return false;
+        }
+        m_pipelines[pPipeline->GetName()] = pPipeline;
+        m_wstrPipelineNames[pPipeline->GetName()] = std::wstring(
+            pPipeline->GetName().begin(), pPipeline->GetName().end());
+        m_available.push_back(pPipeline);
+        
+        LOG_INFO("Pipeline '" << pPipeline->GetName() 
+            << "' added to Pipeline Pool '" << m_name << "' successfully");
+        return true;
+    }
+
+    bool PipelinePool::IsMember(const char* name)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_poolMutex);
+
+        return (m_pipelines.find(name) != m_pipelines.end());
+    }
+
+    DSL_PIPELINE_PTR PipelinePool::Acquire(
+        const std::vector<DSL_BINTR_PTR>& sources, const wchar_t** pipeline)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_poolMutex);
+
+        if (m_available.empty())
+        {
+            LOG_ERROR("Pipeline Pool '" << m_name 
+                << "' has no Pipelines available to acquire");
+            m_metrics.exhausted++;
+            return nullptr;
+        }
+        DSL_PIPELINE_PTR pPipeline = m_available.front();
+        m_available.pop_front();
+
+        // The time-to-first-frame includes adding the Sources.
+        pPipeline->StartFirstFrameTimer();
+
+        std::vector<DSL_BINTR_PTR> addedSources;
+        bool result(true);
+        
+        // Add the Sources through the dynamic Source add path.
+        for (auto const& ivec: sources)
+        {
+            if (!ivec->AddToParent(pPipeline))
+            {
+                LOG_ERROR("Pipeline Pool '" << m_name 
+                    << "' failed to add Source '" << ivec->GetName() 
+                    << "' to Pipeline '" << pPipeline->GetName() << "'");
+                result = false;
+                break;
+            }
+            addedSources.push_back(ivec);
+        }
+        if (result and !pPipeline->Play())
+        {
+            LOG_ERROR("Pipeline Pool '" << m_name 
+                << "' failed to Play Pipeline '" << pPipeline->GetName() << "'");
+            result = false;
+        }
+        if (!result)
+        {
+            for (auto const& ivec: addedSources)
+            {
+                ivec->RemoveFromParent(pPipeline);
+            }
+            // Return the Pipeline to standby and to the front of the queue.
+            if (standby(pPipeline, true))
+            {
+                m_available.push_front(pPipeline);
+            }
+            return nullptr;
+        }
+        m_acquiredSources[pPipeline->GetName()] = addedSources;
+        m_pendingFirstFrames[pPipeline->GetName()] = pPipeline;
+        m_metrics.acquisitions++;
+        
+        *pipeline = m_wstrPipelineNames[pPipeline->GetName()].c_str();
+        
+        LOG_INFO("Pipeline '" << pPipeline->GetName() 
+            << "' acquired from Pipeline Pool '" << m_name << "' successfully");
+        return pPipeline;
+    }
+
+    bool PipelinePool::Release(DSL_PIPELINE_PTR pPipeline)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_poolMutex);
+
+        auto imap = m_acquiredSources.find(pPipeline->GetName());
+        if (imap == m_acquiredSources.end())
+        {
+            LOG_ERROR("Pipeline '" << pPipeline->GetName() 
+                << "' is not currently acquired from Pipeline Pool '" 
+                << m_name << "'");
+            return false;
+        }
+        // Collect the time-to-first-frame while it is still pending.
+        collectFirstFrameTimes();
+        m_pendingFirstFrames.erase(pPipeline->GetName());
+
+        // Remove the Sources through the dynamic Source remove path. 
+        for (auto const& ivec: imap->second)
+        {
+            if (ivec->IsParent(pPipeline))
+            {
+                ivec->RemoveFromParent(pPipeline);
+            }
+        }
+        imap->second.clear();
+
+        // If the Pipeline fails to return to standby, it remains acquired
+        // so that the client can retry the release.
+        if (!standby(pPipeline, true))
+        {
+            LOG_ERROR("Pipeline Pool '" << m_name 
+                << "' failed to return Pipeline '" << pPipeline->GetName() 
+                << "' to standby");
+            return false;
+        }
+        m_acquiredSources.erase(imap);
+        m_available.push_back(pPipeline);
+        m_metrics.releases++;
+        
+        LOG_INFO("Pipeline '" << pPipeline->GetName() 
+            << "' released to Pipeline Pool '" << m_name << "' successfully");
+        return true;
+    }
+
+    uint PipelinePool::GetSize()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_poolMutex);
+
+        return m_pipelines.size();
+    }
+
+    uint PipelinePool::GetAvailable()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_poolMutex);
+
+        return m_available.size();
+    }
+
+    uint PipelinePool::GetAcquired()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_poolMutex);
+
+        return m_acquiredSources.size();
+    }
+
+    void PipelinePool::GetMetrics(dsl_pipeline_pool_metrics* metrics)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_poolMutex);
+
+        collectFirstFrameTimes();
+        
+        m_metrics.size = m_pipelines.size();
+        m_metrics.available = m_available.size();
+        m_metrics.standby_time = (m_standbyCount)
+            ? m_totalStandbyTime / m_standbyCount
+            : 0;
+        m_metrics.average_time_to_first_frame = (m_firstFrameCount)
+            ? m_totalTimeToFirstFrame / m_firstFrameCount
+            : 0;
+        *metrics = m_metrics;
+    }
+
+    void PipelinePool::ClearMetrics()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_poolMutex);
+
+        m_metrics = {0};
+        m_totalStandbyTime = 0;
+        m_standbyCount = 0;
+        m_totalTimeToFirstFrame = 0;
+        m_firstFrameCount = 0;
+    }
+
+    bool PipelinePool::standby(DSL_PIPELINE_PTR pPipeline, bool recycle)
+    {
+        gint64 startTime = g_get_monotonic_time();
+        bool relinked(true);
+        
+        bool result = (recycle)
+            ? pPipeline->Recycle(relinked)
+            : pPipeline->Standby(m_standbyState, m_isLive);
+        
+        if (!result)
+        {
+            return false;
+        }
+        // Only count the cost of initializing the Pipeline, i.e. when linked
+        // and taken from NULL to the standby state.
+        if (relinked)
+        {
+            m_totalStandbyTime += 
+                (double)(g_get_monotonic_time() - startTime) / 1000.0;
+            m_standbyCount++;
+            
+            if (recycle)
+            {
+                m_metrics.relinks++;
+            }
+        }
+        return true;
+    }
+
+    void PipelinePool::collectFirstFrameTimes()
+    {
+        for (auto imap = m_pendingFirstFrames.begin(); 
+            imap != m_pendingFirstFrames.end();)
+        {
+            double timeToFirstFrame = imap->second->GetTimeToFirstFrame();
+            if (!timeToFirstFrame)
+            {
+                imap++;
+                continue;
+            }
+            m_metrics.last_time_to_first_frame = timeToFirstFrame;
+            m_metrics.max_time_to_first_frame = std::max(
+                m_metrics.max_time_to_first_frame, timeToFirstFrame);
+            m_totalTimeToFirstFrame += timeToFirstFrame;
+            m_firstFrameCount++;
+            
+            imap = m_pendingFirstFrames.erase(imap);
+        }
+    }
+}
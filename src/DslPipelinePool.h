@@ -0,0 +1,226 @@
+/*
+The MIT License
+
+Copyright (c) 2019-2021, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#ifndef _DSL_PIPELINE_POOL_H
+#define _DSL_PIPELINE_POOL_H
+
+#include "Dsl.h"
+#include "DslApi.h"
+#include "DslPipelineBintr.h"
+
+namespace DSL
+{
+    /**
+     * @brief convenience macros for shared pointer abstraction
+     */
+    #define DSL_PIPELINE_POOL_PTR std::shared_ptr<PipelinePool>
+    #define DSL_PIPELINE_POOL_NEW(name, standbyState, isLive) \
+        std::shared_ptr<PipelinePool>(new PipelinePool( \
+            name, standbyState, isLive))
+
+    /**
+     * @class PipelinePool
+     * @brief Implements a pool of warm-standby Pipelines. Each Pipeline is
+     * linked -- without Sources -- and held in a state of READY or PAUSED
+     * until acquired. On acquire, Sources are added dynamically and the 
+     * Pipeline is played. On release, the Sources are removed and the 
+     * Pipeline is returned to standby to be reused.
+     */
+    class PipelinePool
+    {
+    public:
+
+        /**
+         * @brief ctor for the PipelinePool class.
+         * @param[in] name unique name for the Pipeline Pool.
+         * @param[in] standbyState state to hold the Pipelines in while 
+         * available, one of GST_STATE_READY or GST_STATE_PAUSED.
+         * @param[in] isLive set to true if the Sources to be added are live,
+         * false otherwise.
+         */
+        PipelinePool(const char* name, GstState standbyState, bool isLive);
+
+        /**
+         * @brief dtor for the PipelinePool class. Takes all Pipelines out
+         * of standby mode.
+         */
+        ~PipelinePool();
+
+        /**
+         * @brief Adds a Pipeline to the Pool, placing it in standby.
+         * @param[in] pPipeline shared pointer to the Pipeline to add.
+         * @return true if the Pipeline was successfully added, false otherwise.
+         */
+        bool AddPipeline(DSL_PIPELINE_PTR pPipeline);
+
+        /**
+         * @brief Determines if a named Pipeline is a member of this Pool.
+         * @param[in] name unique name of the Pipeline to check.
+         * @return true if the Pipeline is a member, false otherwise.
+         */
+        bool IsMember(const char* name);
+
+        /**
+         * @brief Acquires an available Pipeline from the Pool, adds a set of
+         * Sources, and plays the Pipeline.
+         * @param[in] sources Sources to add to the acquired Pipeline.
+         * @param[out] pipeline unique name of the acquired Pipeline.
+         * @return shared pointer to the acquired Pipeline, nullptr if no 
+         * Pipeline is available or the Pipeline failed to play.
+         */
+        DSL_PIPELINE_PTR Acquire(const std::vector<DSL_BINTR_PTR>& sources,
+            const wchar_t** pipeline);
+
+        /**
+         * @brief Releases a previously acquired Pipeline, removing the 
+         * Sources added on acquire and returning it to standby.
+         * @param[in] pPipeline shared pointer to the Pipeline to release.
+         * @return true if the Pipeline was successfully released, false 
+         * otherwise.
+         */
+        bool Release(DSL_PIPELINE_PTR pPipeline);
+
+        /**
+         * @brief Gets the number of Pipelines in the Pool.
+         * @return current size of the Pool.
+         */
+        uint GetSize();
+
+        /**
+         * @brief Gets the number of Pipelines available to acquire.
+         * @return number of Pipelines in standby.
+         */
+        uint GetAvailable();
+
+        /**
+         * @brief Gets the number of Pipelines currently acquired.
+         * @return number of Pipelines in use.
+         */
+        uint GetAcquired();
+
+        /**
+         * @brief Gets the current metrics for the Pool.
+         * @param[out] metrics current metrics.
+         */
+        void GetMetrics(dsl_pipeline_pool_metrics* metrics);
+
+        /**
+         * @brief Clears the current metrics for the Pool.
+         */
+        void ClearMetrics();
+
+    private:
+
+        /**
+         * @brief Places a Pipeline in standby, or returns it to standby, 
+         * accumulating the time taken.
+         * @param[in] pPipeline shared pointer to the Pipeline.
+         * @param[in] recycle set to true to recycle after use, false to 
+         * place in standby for the first time.
+         * @return true on success, false otherwise.
+         */
+        bool standby(DSL_PIPELINE_PTR pPipeline, bool recycle);
+
+        /**
+         * @brief Collects the time-to-first-frame for all acquired Pipelines
+         * with a completed measurement.
+         */
+        void collectFirstFrameTimes();
+
+        /**
+         * @brief unique name for this PipelinePool.
+         */
+        std::string m_name;
+
+        /**
+         * @brief state to hold the Pipelines in while available.
+         */
+        GstState m_standbyState;
+
+        /**
+         * @brief true if the Sources to be added are live, false otherwise.
+         */
+        bool m_isLive;
+
+        /**
+         * @brief mutex to protect mutual access to the Pool.
+         */
+        DslMutex m_poolMutex;
+
+        /**
+         * @brief map of all member Pipelines by unique name.
+         */
+        std::map<std::string, DSL_PIPELINE_PTR> m_pipelines;
+
+        /**
+         * @brief map of all member Pipeline names, as wide strings, returned 
+         * to the client on acquire.
+         */
+        std::map<std::string, std::wstring> m_wstrPipelineNames;
+
+        /**
+         * @brief queue of Pipelines in standby, available to acquire. The 
+         * least recently released Pipeline is acquired first.
+         */
+        std::deque<DSL_PIPELINE_PTR> m_available;
+
+        /**
+         * @brief map of the Sources added to each acquired Pipeline.
+         */
+        std::map<std::string, std::vector<DSL_BINTR_PTR>> m_acquiredSources;
+
+        /**
+         * @brief map of acquired Pipelines with a pending time-to-first-frame
+         * measurement.
+         */
+        std::map<std::string, DSL_PIPELINE_PTR> m_pendingFirstFrames;
+
+        /**
+         * @brief current metrics for the Pool.
+         */
+        dsl_pipeline_pool_metrics m_metrics;
+
+        /**
+         * @brief accumulated time placing Pipelines in standby in ms.
+         */
+        double m_totalStandbyTime;
+
+        /**
+         * @brief number of times Pipelines have been placed in standby.
+         */
+        uint64_t m_standbyCount;
+
+        /**
+         * @brief accumulated time-to-first-frame in ms.
+         */
+        double m_totalTimeToFirstFrame;
+
+        /**
+         * @brief number of time-to-first-frame measurements completed.
+         */
+        uint64_t m_firstFrameCount;
+    };
+}
+
+#endif // _DSL_PIPELINE_POOL_H
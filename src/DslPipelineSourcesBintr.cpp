@@ -155,8 +155,9 @@ namespace DSL
             return false;
         }
         
-        // Set the play type based on the first source added
-        if (m_pChildSources.size() == 0)
+        // Set the play type based on the first source added. The play type
+        // of a Pipeline linked in standby, without sources, is already set.
+        if (m_pChildSources.size() == 0 and !IsLinked())
         {
             StreammuxPlayTypeIsLiveSet(pChildSource->IsLive());
         }
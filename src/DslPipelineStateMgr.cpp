@@ -35,6 +35,11 @@ namespace DSL
         , m_pBusWatch(NULL)
         , m_eosFlag(false)
         , m_errorNotificationTimerId(0)
+        , m_startupStartTime(0)
+        , m_startupLastStateChange(0)
+        , m_startupLinkTime(0)
+        , m_startupTimeToPlaying(0)
+        , m_startupTimeToFirstFrame(0)
     {
         LOG_FUNC();
 
@@ -59,6 +64,7 @@ namespace DSL
         {
             DeleteMainLoop();
         }
+        RemoveStartupPadProbes();
         gst_bus_remove_watch(m_pGstBus);
         gst_object_unref(m_pGstBus);
     }
@@ -406,6 +412,7 @@ namespace DSL
             HandleErrorMessage(pMessage);            
             break;
         case GST_MESSAGE_STATE_CHANGED:
+            RecordStartupStateChange(pMessage);
             HandleStateChanged(pMessage);
             break;
         case GST_MESSAGE_APPLICATION:
@@ -603,6 +610,330 @@ namespace DSL
         }
     }
     
+    void PipelineStateMgr::StartStartupProfile()
+    {
+        LOG_FUNC();
+        
+        // Remove any first-buffer probes left over from the previous profile
+        RemoveStartupPadProbes();
+        
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_startupMutex);
+
+        m_startupStartTime = g_get_monotonic_time();
+        m_startupLastStateChange = m_startupStartTime;
+        m_startupLinkTime = 0;
+        m_startupTimeToPlaying = 0;
+        m_startupTimeToFirstFrame = 0;
+        m_startupEvents.clear();
+    }
+
+    void PipelineStateMgr::AddStartupPadProbes()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_startupMutex);
+        
+        if (!m_startupStartTime)
+        {
+            return;
+        }
+        GstIterator* pElementIter = gst_bin_iterate_recurse(
+            GST_BIN(m_pGstPipeline));
+        GValue element = G_VALUE_INIT;
+        bool elementsDone(false);
+        
+        while (!elementsDone)
+        {
+            switch (gst_iterator_next(pElementIter, &element))
+            {
+            case GST_ITERATOR_OK:
+            {
+                GstElement* pElement = GST_ELEMENT(g_value_get_object(&element));
+                GstIterator* pPadIter = gst_element_iterate_pads(pElement);
+                GValue pad = G_VALUE_INIT;
+                bool padsDone(false);
+                
+                while (!padsDone)
+                {
+                    switch (gst_iterator_next(pPadIter, &pad))
+                    {
+                    case GST_ITERATOR_OK:
+                    {
+                        GstPad* pPad = GST_PAD(g_value_get_object(&pad));
+                        
+                        // A resync may return a pad that is already probed
+                        if (std::find_if(m_startupPadProbes.begin(), 
+                            m_startupPadProbes.end(), 
+                            [pPad](const std::pair<gulong, GstPad*>& probe)
+                                {return probe.second == pPad;}) 
+                            == m_startupPadProbes.end())
+                        {
+                            StartupPadProbe* pProbe = new StartupPadProbe{this, 0, 
+                                GST_OBJECT_NAME(pElement), GST_OBJECT_NAME(pPad)};
+                                
+                            // The callback is blocked on m_startupMutex until
+                            // the probe id is set and the probe is added to the map.
+                            pProbe->probeId = gst_pad_add_probe(pPad, 
+                                GST_PAD_PROBE_TYPE_BUFFER, StartupFirstBufferProbeCB, 
+                                pProbe, StartupPadProbeDestroyCB);
+                            m_startupPadProbes[pProbe->probeId] = 
+                                GST_PAD(gst_object_ref(pPad));
+                        }
+                        g_value_reset(&pad);
+                        break;
+                    }
+                    case GST_ITERATOR_RESYNC:
+                        gst_iterator_resync(pPadIter);
+                        break;
+                    default:
+                        padsDone = true;
+                    }
+                }
+                g_value_unset(&pad);
+                gst_iterator_free(pPadIter);
+                g_value_reset(&element);
+                break;
+            }
+            case GST_ITERATOR_RESYNC:
+                gst_iterator_resync(pElementIter);
+                break;
+            default:
+                elementsDone = true;
+            }
+        }
+        g_value_unset(&element);
+        gst_iterator_free(pElementIter);
+        
+        LOG_INFO("Pipeline '" << m_pipelineName << "' added " 
+            << m_startupPadProbes.size() << " first-buffer probes");
+    }
+
+    void PipelineStateMgr::RemoveStartupPadProbes()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_startupMutex);
+        
+        for (auto const& imap: m_startupPadProbes)
+        {
+            gst_pad_remove_probe(imap.second, imap.first);
+            gst_object_unref(imap.second);
+        }
+        m_startupPadProbes.clear();
+    }
+
+    void PipelineStateMgr::RecordStartupLink(uint type, int64_t startTime)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_startupMutex);
+        
+        if (!m_startupStartTime)
+        {
+            return;
+        }
+        int64_t endTime = g_get_monotonic_time();
+        
+        m_startupEvents.push_back({type, m_pipelineName, "", 0, 0, 
+            startTime, endTime - startTime});
+            
+        if (type == DSL_PIPELINE_STARTUP_EVENT_LINK)
+        {
+            m_startupLinkTime = endTime - startTime;
+            
+            // The first state change is measured from the end of the link.
+            m_startupLastStateChange = endTime;
+        }
+    }
+
+    void PipelineStateMgr::RecordStartupFirstFrame()
+    {
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_startupMutex);
+        
+        if (m_startupStartTime and !m_startupTimeToFirstFrame)
+        {
+            m_startupTimeToFirstFrame = std::max((int64_t)1, 
+                g_get_monotonic_time() - m_startupStartTime);
+        }
+    }
+
+    void PipelineStateMgr::RecordStartupStateChange(GstMessage* pMessage)
+    {
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_startupMutex);
+        
+        if (!m_startupStartTime)
+        {
+            return;
+        }
+        
+        // State-change messages are timestamped in the posting thread by the
+        // bus sync-handler so the profile is independent of when the 
+        // main-loop is run. 
+        int64_t timestamp = 
+            (GST_CLOCK_TIME_IS_VALID(GST_MESSAGE_TIMESTAMP(pMessage)))
+            ? (int64_t)(GST_MESSAGE_TIMESTAMP(pMessage) / GST_USECOND)
+            : g_get_monotonic_time();
+            
+        // Ignore messages posted before the start of the current profile.
+        if (timestamp < m_startupStartTime)
+        {
+            return;
+        }
+
+        GstState oldstate, newstate;
+        gst_message_parse_state_changed(pMessage, &oldstate, &newstate, NULL);
+
+        m_startupEvents.push_back({DSL_PIPELINE_STARTUP_EVENT_STATE_CHANGE,
+            GST_OBJECT_NAME(GST_MESSAGE_SRC(pMessage)), "", 
+            (uint)oldstate, (uint)newstate, timestamp, 
+            std::max((int64_t)0, timestamp - m_startupLastStateChange)});
+        m_startupLastStateChange = timestamp;
+
+        if (GST_MESSAGE_SRC(pMessage) == m_pGstPipeline and 
+            newstate == GST_STATE_PLAYING and !m_startupTimeToPlaying)
+        {
+            m_startupTimeToPlaying = 
+                std::max((int64_t)1, timestamp - m_startupStartTime);
+                
+            LOG_INFO("Pipeline '" << m_pipelineName << "' time-to-PLAYING = "
+                << m_startupTimeToPlaying << "us");
+        }
+    }
+
+    GstPadProbeReturn PipelineStateMgr::HandleStartupFirstBuffer(
+        StartupPadProbe* pProbe)
+    {
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_startupMutex);
+        
+        // Guard against a buffer racing with the removal of the probe.
+        auto ipad = m_startupPadProbes.find(pProbe->probeId);
+        if (ipad != m_startupPadProbes.end())
+        {
+            m_startupEvents.push_back({DSL_PIPELINE_STARTUP_EVENT_FIRST_BUFFER, 
+                pProbe->element, pProbe->pad, 0, 0, g_get_monotonic_time(), 0});
+                
+            gst_object_unref(ipad->second);
+            m_startupPadProbes.erase(ipad);
+        }
+        return GST_PAD_PROBE_REMOVE;
+    }
+
+    void PipelineStateMgr::GetStartupProfile(dsl_pipeline_startup_profile* profile,
+        const dsl_pipeline_startup_event** events, uint* size)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_startupMutex);
+        
+        m_startupProfileEvents.clear();
+        m_startupProfileNames.clear();
+        
+        // reserve up front so that the name pointers remain valid
+        m_startupProfileEvents.reserve(m_startupEvents.size());
+        m_startupProfileNames.reserve(m_startupEvents.size()*2);
+        
+        std::string slowestElement;
+        int64_t slowestStateChange(0);
+        
+        for (auto const& ivec: m_startupEvents)
+        {
+            if (ivec.type == DSL_PIPELINE_STARTUP_EVENT_STATE_CHANGE and
+                ivec.duration > slowestStateChange)
+            {
+                slowestElement = ivec.element;
+                slowestStateChange = ivec.duration;
+            }
+            dsl_pipeline_startup_event entry{0};
+            entry.type = ivec.type;
+            
+            m_startupProfileNames.push_back(
+                std::wstring(ivec.element.begin(), ivec.element.end()));
+            entry.element = m_startupProfileNames.back().c_str();
+            
+            m_startupProfileNames.push_back(
+                std::wstring(ivec.pad.begin(), ivec.pad.end()));
+            entry.pad = m_startupProfileNames.back().c_str();
+            
+            entry.previous_state = ivec.previousState;
+            entry.new_state = ivec.newState;
+            entry.timestamp = (double)(ivec.timestamp - m_startupStartTime) / 1000.0;
+            entry.duration = (double)ivec.duration / 1000.0;
+            
+            m_startupProfileEvents.push_back(entry);
+        }
+        m_startupSlowestElement.assign(slowestElement.begin(), slowestElement.end());
+        
+        profile->link_time = (double)m_startupLinkTime / 1000.0;
+        profile->time_to_playing = (double)m_startupTimeToPlaying / 1000.0;
+        profile->time_to_first_frame = (double)m_startupTimeToFirstFrame / 1000.0;
+        profile->slowest_element = m_startupSlowestElement.c_str();
+        profile->slowest_state_change = (double)slowestStateChange / 1000.0;
+        
+        *events = (m_startupProfileEvents.size()) 
+            ? &m_startupProfileEvents[0] : NULL;
+        *size = m_startupProfileEvents.size();
+    }
+
+    void PipelineStateMgr::AnnotateStartupProfile(std::string& dotData)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_startupMutex);
+        
+        // Build the annotation for each element in order of events.
+        std::map<std::string, std::ostringstream> annotations;
+        
+        for (auto const& ivec: m_startupEvents)
+        {
+            std::ostringstream& annotation = annotations[ivec.element];
+            annotation << std::fixed << std::setprecision(1) << "\\n";
+            
+            switch (ivec.type)
+            {
+            case DSL_PIPELINE_STARTUP_EVENT_STATE_CHANGE:
+                annotation << gst_element_state_get_name((GstState)ivec.previousState)
+                    << "->" << gst_element_state_get_name((GstState)ivec.newState)
+                    << " " << (double)ivec.duration / 1000.0 << " ms";
+                break;
+            case DSL_PIPELINE_STARTUP_EVENT_LINK:
+                annotation << "link " << (double)ivec.duration / 1000.0 << " ms";
+                break;
+            case DSL_PIPELINE_STARTUP_EVENT_UNLINK:
+                annotation << "unlink " << (double)ivec.duration / 1000.0 << " ms";
+                break;
+            case DSL_PIPELINE_STARTUP_EVENT_FIRST_BUFFER:
+                annotation << ivec.pad << " first-buffer @ " 
+                    << (double)(ivec.timestamp - m_startupStartTime) / 1000.0 
+                    << " ms";
+                break;
+            }
+        }
+        
+        // Element and Bin labels are of the form "<type>\n<name>[\n...]" 
+        // - insert each annotation immediately after the element's name.
+        std::istringstream dotStream(dotData);
+        std::ostringstream annotatedStream;
+        std::string line;
+        
+        while (std::getline(dotStream, line))
+        {
+            size_t labelPos = line.find("label=\"");
+            size_t namePos = (labelPos == std::string::npos) 
+                ? std::string::npos : line.find("\\n", labelPos);
+            if (namePos != std::string::npos)
+            {
+                namePos += 2;
+                size_t nameEnd = line.find_first_of("\\\"", namePos);
+                if (nameEnd != std::string::npos)
+                {
+                    auto imap = annotations.find(
+                        line.substr(namePos, nameEnd - namePos));
+                    if (imap != annotations.end())
+                    {
+                        line.insert(nameEnd, imap->second.str());
+                    }
+                }
+            }
+            annotatedStream << line << "\n";
+        }
+        dotData = annotatedStream.str();
+    }
+
     void PipelineStateMgr::_initMaps()
     {
         m_mapPipelineStates[GST_STATE_READY] = "GST_STATE_READY";
@@ -621,5 +952,17 @@ namespace DSL
         return static_cast<PipelineStateMgr*>(pPipeline)->
             NotifyErrorMessageHandlers();
     }
+
+    static GstPadProbeReturn StartupFirstBufferProbeCB(GstPad* pPad, 
+        GstPadProbeInfo* pInfo, gpointer pProbe)
+    {
+        return static_cast<StartupPadProbe*>(pProbe)->pStateMgr->
+            HandleStartupFirstBuffer(static_cast<StartupPadProbe*>(pProbe));
+    }
+
+    static void StartupPadProbeDestroyCB(gpointer pProbe)
+    {
+        delete static_cast<StartupPadProbe*>(pProbe);
+    }
     
 } // DSL   
\ No newline at end of file
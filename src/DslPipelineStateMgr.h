@@ -33,6 +33,69 @@ THE SOFTWARE.
 
 namespace DSL
 {
+    class PipelineStateMgr;
+
+    /**
+     * @struct StartupEvent
+     * @brief a single timestamped event recorded in a Pipeline's startup profile.
+     */
+    struct StartupEvent
+    {
+        /**
+         * @brief one of the DSL_PIPELINE_STARTUP_EVENT constants.
+         */
+        uint type;
+
+        /**
+         * @brief name of the element, or Pipeline, the event occurred on.
+         */
+        std::string element;
+
+        /**
+         * @brief name of the pad for first-buffer events, empty otherwise.
+         */
+        std::string pad;
+
+        /**
+         * @brief previous and new state for state-change events, 0 otherwise.
+         */
+        uint previousState;
+        uint newState;
+
+        /**
+         * @brief monotonic time of the event in microseconds.
+         */
+        int64_t timestamp;
+
+        /**
+         * @brief duration of the event in microseconds.
+         */
+        int64_t duration;
+    };
+
+    /**
+     * @struct StartupPadProbe
+     * @brief client data for a one-shot first-buffer pad probe, owned 
+     * and freed by the pad on probe removal.
+     */
+    struct StartupPadProbe
+    {
+        /**
+         * @brief the Pipeline's state manager to record the first buffer with.
+         */
+        PipelineStateMgr* pStateMgr;
+
+        /**
+         * @brief unique id of the pad probe.
+         */
+        gulong probeId;
+
+        /**
+         * @brief name of the parent element and pad.
+         */
+        std::string element;
+        std::string pad;
+    };
 
     class PipelineStateMgr
     {
@@ -175,8 +238,62 @@ namespace DSL
          */
         int NotifyErrorMessageHandlers();
 
+        /**
+         * @brief Gets the Pipeline's current startup profile.
+         * @param[out] profile client structure to fill in with the summary.
+         * @param[out] events array of startup events, owned by the Pipeline
+         * and valid until the next call to this service.
+         * @param[out] size number of events in the array.
+         */
+        void GetStartupProfile(dsl_pipeline_startup_profile* profile,
+            const dsl_pipeline_startup_event** events, uint* size);
+
+        /**
+         * @brief Annotates the element nodes of a Pipeline graph, as 
+         * produced by gst_debug_bin_to_dot_data, with their startup timings.
+         * @param[in,out] dotData Pipeline graph to annotate.
+         */
+        void AnnotateStartupProfile(std::string& dotData);
+
+        /**
+         * @brief Handles the first buffer on a pad probed by the startup profile.
+         * @param[in] pProbe client data for the one-shot pad probe.
+         * @return GST_PAD_PROBE_REMOVE always.
+         */
+        GstPadProbeReturn HandleStartupFirstBuffer(StartupPadProbe* pProbe);
+
     protected:
 
+        /**
+         * @brief Starts a new startup profile, clearing the previous profile.
+         * Called by the Pipeline at the start of Play from NULL or READY.
+         */
+        void StartStartupProfile();
+
+        /**
+         * @brief Adds a one-shot first-buffer probe to every pad of every 
+         * element in the Pipeline. Called once the Pipeline is linked.
+         */
+        void AddStartupPadProbes();
+
+        /**
+         * @brief Removes all first-buffer probes still pending.
+         */
+        void RemoveStartupPadProbes();
+
+        /**
+         * @brief Records a link or unlink of all Pipeline components.
+         * @param[in] type one of DSL_PIPELINE_STARTUP_EVENT_LINK or 
+         * DSL_PIPELINE_STARTUP_EVENT_UNLINK.
+         * @param[in] startTime monotonic time the link or unlink started.
+         */
+        void RecordStartupLink(uint type, int64_t startTime);
+
+        /**
+         * @brief Records the first batched buffer produced by the Pipeline.
+         */
+        void RecordStartupFirstFrame();
+
         /**
          * pointer to the Pipelines GST Bus
          */
@@ -335,6 +452,65 @@ namespace DSL
          */
         void HandleBufferingMessage(GstMessage* pMessage);
         
+        /**
+         * @brief private helper function to record an element state-change
+         * message in the startup profile.
+         * @param[in] pointer to the state-change message to record.
+         */
+        void RecordStartupStateChange(GstMessage* pMessage);
+
+        /**
+         * @brief mutex to protect the startup profile which is updated from
+         * the bus-watch and from streaming threads.
+         */
+        DslMutex m_startupMutex;
+
+        /**
+         * @brief monotonic time the current startup profile started in 
+         * microseconds, 0 if a profile has never been started.
+         */
+        int64_t m_startupStartTime;
+
+        /**
+         * @brief monotonic time of the last state change recorded in the 
+         * current startup profile in microseconds.
+         */
+        int64_t m_startupLastStateChange;
+
+        /**
+         * @brief time to link all components, to reach PLAYING, and to produce
+         * the first batched buffer for the current profile in microseconds.
+         */
+        int64_t m_startupLinkTime;
+        int64_t m_startupTimeToPlaying;
+        int64_t m_startupTimeToFirstFrame;
+
+        /**
+         * @brief all events recorded in the current startup profile in the 
+         * order they occurred.
+         */
+        std::vector<StartupEvent> m_startupEvents;
+
+        /**
+         * @brief map of pending first-buffer probe ids to their pads.
+         */
+        std::map<gulong, GstPad*> m_startupPadProbes;
+
+        /**
+         * @brief startup events, in client format, returned by GetStartupProfile.
+         */
+        std::vector<dsl_pipeline_startup_event> m_startupProfileEvents;
+
+        /**
+         * @brief wstring element and pad names referenced by m_startupProfileEvents.
+         */
+        std::vector<std::wstring> m_startupProfileNames;
+
+        /**
+         * @brief wstring name of the slowest element returned by GetStartupProfile.
+         */
+        std::wstring m_startupSlowestElement;
+
         /**
          * @brief maps a GstState constant value to a string for logging
          */
@@ -365,6 +541,23 @@ namespace DSL
      * @return false always to self destroy the one-shot timer.
      */
     static int ErrorMessageHandlersNotificationHandler(gpointer pPipeline);
+
+    /**
+     * @brief One-shot pad probe callback to record the first buffer on a pad
+     * in a Pipeline's startup profile.
+     * @param[in] pPad pad the buffer was received on.
+     * @param[in] pInfo pad probe info for the buffer.
+     * @param[in] pProbe pointer to the StartupPadProbe client data.
+     * @return GST_PAD_PROBE_REMOVE always.
+     */
+    static GstPadProbeReturn StartupFirstBufferProbeCB(GstPad* pPad, 
+        GstPadProbeInfo* pInfo, gpointer pProbe);
+
+    /**
+     * @brief Destroy notify to free a StartupPadProbe on probe removal.
+     * @param[in] pProbe pointer to the StartupPadProbe to free.
+     */
+    static void StartupPadProbeDestroyCB(gpointer pProbe);
 }
 
 #endif //  DSL_PIPELINE_BUS_MGR_H
@@ -0,0 +1,425 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include "Dsl.h"
+#include "DslPropertyBatch.h"
+
+namespace DSL
+{
+    PropertyBatch::PropertyBatch()
+    {
+        LOG_FUNC();
+    }
+
+    PropertyBatch::~PropertyBatch()
+    {
+        LOG_FUNC();
+    }
+
+    PropertyBatch::Setting::~Setting()
+    {
+        if (G_IS_VALUE(&value))
+        {
+            g_value_unset(&value);
+        }
+        if (G_IS_VALUE(&prevValue))
+        {
+            g_value_unset(&prevValue);
+        }
+    }
+
+    DslReturnType PropertyBatch::AddElementSetting(DSL_ELEMENT_PTR pElement, 
+        const PropertySetting& setting)
+    {
+        LOG_FUNC();
+        
+        GParamSpec* pParamSpec = g_object_class_find_property(
+            G_OBJECT_GET_CLASS(pElement->GetGObject()), setting.property.c_str());
+            
+        if (!pParamSpec)
+        {
+            LOG_ERROR("GST Element '" << pElement->GetName() 
+                << "' does not have a property named '" << setting.property << "'");
+            return DSL_RESULT_GST_ELEMENT_SET_FAILED;
+        }
+        if (!(pParamSpec->flags & G_PARAM_WRITABLE) or
+            (pParamSpec->flags & G_PARAM_CONSTRUCT_ONLY))
+        {
+            LOG_ERROR("Property '" << setting.property << "' for GST Element '" 
+                << pElement->GetName() << "' is not writable");
+            return DSL_RESULT_GST_ELEMENT_SET_FAILED;
+        }
+        
+        // value-initialized so that both GValues are zeroed.
+        std::unique_ptr<Setting> pSetting(new Setting());
+
+        pSetting->pElement = pElement;
+        pSetting->property = setting.property;
+        
+        GValue* pValue = &pSetting->value;
+        g_value_init(pValue, pParamSpec->value_type);
+        
+        bool converted(false);
+        
+        if (setting.type == DSL_COMPONENT_PROPERTY_TYPE_STRING)
+        {
+            if (G_VALUE_HOLDS_STRING(pValue))
+            {
+                g_value_set_string(pValue, setting.stringValue.c_str());
+                converted = true;
+            }
+            else
+            {
+                // enum nicks, flags, caps, fractions, etc.
+                converted = gst_value_deserialize(pValue, 
+                    setting.stringValue.c_str());
+            }
+        }
+        else if (setting.type <= DSL_COMPONENT_PROPERTY_TYPE_FLOAT)
+        {
+            GValue srcValue = G_VALUE_INIT;
+            
+            switch (setting.type)
+            {
+            case DSL_COMPONENT_PROPERTY_TYPE_BOOLEAN :
+                g_value_init(&srcValue, G_TYPE_BOOLEAN);
+                g_value_set_boolean(&srcValue, setting.booleanValue);
+                break;
+            case DSL_COMPONENT_PROPERTY_TYPE_INT :
+                g_value_init(&srcValue, G_TYPE_INT64);
+                g_value_set_int64(&srcValue, setting.intValue);
+                break;
+            case DSL_COMPONENT_PROPERTY_TYPE_UINT :
+                g_value_init(&srcValue, G_TYPE_UINT64);
+                g_value_set_uint64(&srcValue, setting.uintValue);
+                break;
+            default :
+                g_value_init(&srcValue, G_TYPE_DOUBLE);
+                g_value_set_double(&srcValue, setting.floatValue);
+                break;
+            }
+            
+            bool isInteger(setting.type == DSL_COMPONENT_PROPERTY_TYPE_INT or
+                setting.type == DSL_COMPONENT_PROPERTY_TYPE_UINT);
+
+            if (isInteger and G_TYPE_IS_ENUM(pParamSpec->value_type))
+            {
+                int64_t enumValue = 
+                    (setting.type == DSL_COMPONENT_PROPERTY_TYPE_INT)
+                    ? setting.intValue 
+                    : (int64_t)std::min(setting.uintValue, (uint64_t)INT64_MAX);
+                
+                GEnumClass* pEnumClass = 
+                    G_ENUM_CLASS(g_type_class_ref(pParamSpec->value_type));
+                    
+                if (enumValue >= G_MININT and enumValue <= G_MAXINT and
+                    g_enum_get_value(pEnumClass, (gint)enumValue))
+                {
+                    g_value_set_enum(pValue, (gint)enumValue);
+                    converted = true;
+                }
+                g_type_class_unref(pEnumClass);
+            }
+            else if (g_value_type_transformable(G_VALUE_TYPE(&srcValue), 
+                pParamSpec->value_type))
+            {
+                converted = g_value_transform(&srcValue, pValue);
+                
+                // integer values must survive the round trip, i.e. must not
+                // be truncated or change sign by the transform.
+                if (converted and isInteger)
+                {
+                    GValue checkValue = G_VALUE_INIT;
+                    g_value_init(&checkValue, G_VALUE_TYPE(&srcValue));
+                    
+                    converted = g_value_transform(pValue, &checkValue) and
+                        ((setting.type == DSL_COMPONENT_PROPERTY_TYPE_INT)
+                            ? g_value_get_int64(&checkValue) == setting.intValue
+                            : g_value_get_uint64(&checkValue) == setting.uintValue);
+                        
+                    g_value_unset(&checkValue);
+                }
+            }
+            g_value_unset(&srcValue);
+        }
+        else
+        {
+            LOG_ERROR("Invalid property type = " << setting.type 
+                << " for GST Element '" << pElement->GetName() << "'");
+            return DSL_RESULT_GST_ELEMENT_SET_FAILED;
+        }
+        
+        if (!converted)
+        {
+            LOG_ERROR("Unable to convert value of type = " << setting.type 
+                << " for property '" << setting.property << "' of type '" 
+                << g_type_name(pParamSpec->value_type) << "' for GST Element '" 
+                << pElement->GetName() << "'");
+            return DSL_RESULT_GST_ELEMENT_SET_FAILED;
+        }
+        
+        // returns true if the value had to be modified to fit the spec.
+        if (g_param_value_validate(pParamSpec, pValue))
+        {
+            LOG_ERROR("Value for property '" << setting.property 
+                << "' is out of range for GST Element '" 
+                << pElement->GetName() << "'");
+            return DSL_RESULT_GST_ELEMENT_SET_FAILED;
+        }
+
+        m_settings.push_back(std::move(pSetting));
+        
+        return DSL_RESULT_SUCCESS;
+    }
+
+    DslReturnType PropertyBatch::AddComponentSetting(DSL_BINTR_PTR pComponent, 
+        const PropertySetting& setting)
+    {
+        LOG_FUNC();
+        
+        static const std::map<std::string, std::pair<uint, uint>> properties = 
+        {
+            {"gpu-id", {GPU_ID, 0}},
+            {"nvbuf-mem-type", {NVBUF_MEM_TYPE, 0}},
+            {"queue-leaky", {QUEUE_LEAKY, 0}},
+            {"queue-max-size-buffers", 
+                {QUEUE_MAX_SIZE, DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS}},
+            {"queue-max-size-bytes", 
+                {QUEUE_MAX_SIZE, DSL_COMPONENT_QUEUE_UNIT_OF_BYTES}},
+            {"queue-max-size-time", 
+                {QUEUE_MAX_SIZE, DSL_COMPONENT_QUEUE_UNIT_OF_TIME}},
+            {"queue-min-threshold-buffers", 
+                {QUEUE_MIN_THRESHOLD, DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS}},
+            {"queue-min-threshold-bytes", 
+                {QUEUE_MIN_THRESHOLD, DSL_COMPONENT_QUEUE_UNIT_OF_BYTES}},
+            {"queue-min-threshold-time", 
+                {QUEUE_MIN_THRESHOLD, DSL_COMPONENT_QUEUE_UNIT_OF_TIME}}
+        };
+        
+        auto iter = properties.find(setting.property);
+        if (iter == properties.end())
+        {
+            LOG_ERROR("Component '" << pComponent->GetName() 
+                << "' does not have a property named '" << setting.property << "'");
+            return DSL_RESULT_COMPONENT_PROPERTY_INVALID;
+        }
+        
+        uint64_t value(0);
+        if (setting.type == DSL_COMPONENT_PROPERTY_TYPE_UINT)
+        {
+            value = setting.uintValue;
+        }
+        else if (setting.type == DSL_COMPONENT_PROPERTY_TYPE_INT and
+            setting.intValue >= 0)
+        {
+            value = setting.intValue;
+        }
+        else
+        {
+            LOG_ERROR("Property '" << setting.property << "' for Component '" 
+                << pComponent->GetName() << "' requires an unsigned integer value");
+            return DSL_RESULT_COMPONENT_PROPERTY_INVALID;
+        }
+
+        uint componentProperty(iter->second.first);
+        uint unit(iter->second.second);
+        
+        switch (componentProperty)
+        {
+        case GPU_ID :
+            if (value > G_MAXUINT or pComponent->IsLinked())
+            {
+                LOG_ERROR("Unable to set GPU ID = " << value 
+                    << " for Component '" << pComponent->GetName() << "'");
+                return DSL_RESULT_COMPONENT_SET_GPUID_FAILED;
+            }
+            break;
+        case NVBUF_MEM_TYPE :
+            if (value > DSL_NVBUF_MEM_TYPE_SURFACE_ARRAY or pComponent->IsInUse())
+            {
+                LOG_ERROR("Unable to set NVIDIA buffer memory type = " << value 
+                    << " for Component '" << pComponent->GetName() << "'");
+                return DSL_RESULT_COMPONENT_SET_NVBUF_MEM_TYPE_FAILED;
+            }
+            break;
+        default :
+            if (!std::dynamic_pointer_cast<QBintr>(pComponent))
+            {
+                LOG_ERROR("Component '" << pComponent->GetName() 
+                    << "' does not have a queue");
+                return DSL_RESULT_COMPONENT_NOT_THE_CORRECT_TYPE;
+            }
+            // buffers and bytes are guint queue properties
+            if ((componentProperty == QUEUE_LEAKY and 
+                    value > DSL_COMPONENT_QUEUE_LEAKY_DOWNSTREAM) or
+                (componentProperty != QUEUE_LEAKY and 
+                    unit != DSL_COMPONENT_QUEUE_UNIT_OF_TIME and value > G_MAXUINT))
+            {
+                LOG_ERROR("Invalid value = " << value << " for property '" 
+                    << setting.property << "' for Component '" 
+                    << pComponent->GetName() << "'");
+                return DSL_RESULT_COMPONENT_SET_QUEUE_PROPERTY_FAILED;
+            }
+            break;
+        }
+
+        std::unique_ptr<Setting> pSetting(new Setting());
+        
+        pSetting->pComponent = pComponent;
+        pSetting->property = setting.property;
+        pSetting->componentProperty = componentProperty;
+        pSetting->unit = unit;
+        pSetting->componentValue = value;
+        
+        m_settings.push_back(std::move(pSetting));
+        
+        return DSL_RESULT_SUCCESS;
+    }
+    
+    DslReturnType PropertyBatch::Apply(uint* failedIndex)
+    {
+        LOG_FUNC();
+        
+        for (uint i = 0; i < m_settings.size(); i++)
+        {
+            Setting& setting = *m_settings[i];
+            
+            try
+            {
+                if (setting.pElement)
+                {
+                    GObject* pObject = setting.pElement->GetGObject();
+                    
+                    g_value_init(&setting.prevValue, G_VALUE_TYPE(&setting.value));
+                    g_object_get_property(pObject, 
+                        setting.property.c_str(), &setting.prevValue);
+                    g_object_set_property(pObject, 
+                        setting.property.c_str(), &setting.value);
+                    setting.applied = true;
+                    continue;
+                }
+                
+                setting.prevComponentValue = getComponentProperty(setting);
+                if (setComponentProperty(setting, setting.componentValue))
+                {
+                    setting.applied = true;
+                    continue;
+                }
+            }
+            catch(...)
+            {
+                restore();
+                throw;
+            }
+            
+            LOG_ERROR("Failed to apply property '" << setting.property 
+                << "' for Component '" << setting.pComponent->GetName() 
+                << "' - restoring " << i << " applied settings");
+            
+            *failedIndex = i;
+            restore();
+            
+            switch (setting.componentProperty)
+            {
+            case GPU_ID :
+                return DSL_RESULT_COMPONENT_SET_GPUID_FAILED;
+            case NVBUF_MEM_TYPE :
+                return DSL_RESULT_COMPONENT_SET_NVBUF_MEM_TYPE_FAILED;
+            default :
+                return DSL_RESULT_COMPONENT_SET_QUEUE_PROPERTY_FAILED;
+            }
+        }
+        return DSL_RESULT_SUCCESS;
+    }
+    
+    bool PropertyBatch::setComponentProperty(Setting& setting, uint64_t value)
+    {
+        LOG_FUNC();
+        
+        switch (setting.componentProperty)
+        {
+        case GPU_ID :
+            return setting.pComponent->SetGpuId(value);
+        case NVBUF_MEM_TYPE :
+            return setting.pComponent->SetNvbufMemType(value);
+        case QUEUE_LEAKY :
+            return std::dynamic_pointer_cast<QBintr>(
+                setting.pComponent)->SetQueueLeaky(value);
+        case QUEUE_MAX_SIZE :
+            return std::dynamic_pointer_cast<QBintr>(
+                setting.pComponent)->SetQueueMaxSize(setting.unit, value);
+        default :
+            return std::dynamic_pointer_cast<QBintr>(
+                setting.pComponent)->SetQueueMinThreshold(setting.unit, value);
+        }
+    }
+    
+    uint64_t PropertyBatch::getComponentProperty(Setting& setting)
+    {
+        LOG_FUNC();
+        
+        switch (setting.componentProperty)
+        {
+        case GPU_ID :
+            return setting.pComponent->GetGpuId();
+        case NVBUF_MEM_TYPE :
+            return setting.pComponent->GetNvbufMemType();
+        case QUEUE_LEAKY :
+            return std::dynamic_pointer_cast<QBintr>(
+                setting.pComponent)->GetQueueLeaky();
+        case QUEUE_MAX_SIZE :
+            return std::dynamic_pointer_cast<QBintr>(
+                setting.pComponent)->GetQueueMaxSize(setting.unit);
+        default :
+            return std::dynamic_pointer_cast<QBintr>(
+                setting.pComponent)->GetQueueMinThreshold(setting.unit);
+        }
+    }
+    
+    void PropertyBatch::restore()
+    {
+        LOG_FUNC();
+        
+        for (auto ivec = m_settings.rbegin(); ivec != m_settings.rend(); ivec++)
+        {
+            Setting& setting = **ivec;
+            
+            if (!setting.applied)
+            {
+                continue;
+            }
+            if (setting.pElement)
+            {
+                g_object_set_property(setting.pElement->GetGObject(), 
+                    setting.property.c_str(), &setting.prevValue);
+            }
+            else if (!setComponentProperty(setting, setting.prevComponentValue))
+            {
+                LOG_ERROR("Failed to restore property '" << setting.property 
+                    << "' for Component '" << setting.pComponent->GetName() << "'");
+            }
+            setting.applied = false;
+        }
+    }
+}
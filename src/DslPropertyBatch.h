@@ -0,0 +1,245 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#ifndef _DSL_PROPERTY_BATCH_H
+#define _DSL_PROPERTY_BATCH_H
+
+#include "Dsl.h"
+#include "DslApi.h"
+#include "DslElementr.h"
+#include "DslQBintr.h"
+
+namespace DSL
+{
+    /**
+     * @struct PropertySetting
+     * @brief narrow-string copy of a single dsl_component_property.
+     */
+    struct PropertySetting
+    {
+        /**
+         * @brief unique name of the GST Element or Component to update.
+         */
+        std::string name;
+
+        /**
+         * @brief name of the property to update.
+         */
+        std::string property;
+
+        /**
+         * @brief one of the DSL_COMPONENT_PROPERTY_TYPE constants.
+         */
+        uint type;
+
+        /**
+         * @brief value for DSL_COMPONENT_PROPERTY_TYPE_BOOLEAN.
+         */
+        boolean booleanValue;
+
+        /**
+         * @brief value for DSL_COMPONENT_PROPERTY_TYPE_INT.
+         */
+        int64_t intValue;
+
+        /**
+         * @brief value for DSL_COMPONENT_PROPERTY_TYPE_UINT.
+         */
+        uint64_t uintValue;
+
+        /**
+         * @brief value for DSL_COMPONENT_PROPERTY_TYPE_FLOAT.
+         */
+        double floatValue;
+
+        /**
+         * @brief value for DSL_COMPONENT_PROPERTY_TYPE_STRING.
+         */
+        std::string stringValue;
+    };
+
+    /**
+     * @class PropertyBatch
+     * @brief Validates a batch of property settings for GST Elements and 
+     * Components, and then applies them atomically. Each setting is fully 
+     * validated - and its value converted - when added. On apply, the current
+     * value of each property is saved before it is set so that all settings 
+     * can be restored if any one of them fails.
+     */
+    class PropertyBatch
+    {
+    public: 
+    
+        /**
+         * @brief ctor for the PropertyBatch class
+         */
+        PropertyBatch();
+
+        /**
+         * @brief dtor for the PropertyBatch class
+         */
+        ~PropertyBatch();
+
+        /**
+         * @brief Validates and adds a GObject property setting for a GST Element.
+         * @param[in] pElement GST Element to update on apply.
+         * @param[in] setting property setting to validate and add.
+         * @return DSL_RESULT_SUCCESS if valid, one of DSL_RESULT_GST_ELEMENT
+         * otherwise.
+         */
+        DslReturnType AddElementSetting(DSL_ELEMENT_PTR pElement, 
+            const PropertySetting& setting);
+
+        /**
+         * @brief Validates and adds a property setting for a Component.
+         * @param[in] pComponent Component to update on apply.
+         * @param[in] setting property setting to validate and add.
+         * @return DSL_RESULT_SUCCESS if valid, one of DSL_RESULT_COMPONENT
+         * otherwise.
+         */
+        DslReturnType AddComponentSetting(DSL_BINTR_PTR pComponent, 
+            const PropertySetting& setting);
+
+        /**
+         * @brief Applies all settings in the order added. If a setting fails
+         * to apply, all settings already applied are restored in reverse order.
+         * @param[out] failedIndex index of the setting that failed to apply.
+         * @return DSL_RESULT_SUCCESS if all settings were applied, the result
+         * of the failed setting otherwise.
+         */
+        DslReturnType Apply(uint* failedIndex);
+
+        /**
+         * @brief Gets the number of settings in this PropertyBatch.
+         * @return current number of settings.
+         */
+        uint GetCount()
+        {
+            return m_settings.size();
+        }
+
+    private:
+    
+        /**
+         * @brief Component properties settable with a PropertyBatch.
+         */
+        enum ComponentProperty
+        {
+            GPU_ID = 0,
+            NVBUF_MEM_TYPE,
+            QUEUE_LEAKY,
+            QUEUE_MAX_SIZE,
+            QUEUE_MIN_THRESHOLD
+        };
+        
+        /**
+         * @struct Setting
+         * @brief a validated setting ready to apply. 
+         */
+        struct Setting
+        {
+            /**
+             * @brief GST Element to update, or nullptr for a Component setting.
+             */
+            DSL_ELEMENT_PTR pElement;
+
+            /**
+             * @brief Component to update, or nullptr for a GST Element setting.
+             */
+            DSL_BINTR_PTR pComponent;
+
+            /**
+             * @brief GST Element property name.
+             */
+            std::string property;
+            
+            /**
+             * @brief converted GST Element property value to set.
+             */
+            GValue value;
+
+            /**
+             * @brief saved GST Element property value to restore.
+             */
+            GValue prevValue;
+            
+            /**
+             * @brief one of the ComponentProperty values.
+             */
+            uint componentProperty;
+
+            /**
+             * @brief DSL_COMPONENT_QUEUE_UNIT_OF constant for queue properties.
+             */
+            uint unit;
+
+            /**
+             * @brief Component property value to set.
+             */
+            uint64_t componentValue;
+
+            /**
+             * @brief saved Component property value to restore.
+             */
+            uint64_t prevComponentValue;
+
+            /**
+             * @brief true once applied, i.e. if it must be restored on failure.
+             */
+            bool applied;
+
+            /**
+             * @brief dtor for the Setting struct - unsets both GValues.
+             */
+            ~Setting();
+        };
+
+        /**
+         * @brief Sets a validated Component setting.
+         * @param[in] setting Component setting to set.
+         * @param[in] value value to set, either new or saved. 
+         * @return true if successfully set, false otherwise.
+         */
+        bool setComponentProperty(Setting& setting, uint64_t value);
+        
+        /**
+         * @brief Gets the current value for a validated Component setting.
+         * @param[in] setting Component setting to query.
+         * @return current value of the Component property.
+         */
+        uint64_t getComponentProperty(Setting& setting);
+
+        /**
+         * @brief Restores all applied settings in reverse order.
+         */
+        void restore();
+
+        /**
+         * @brief validated settings in the order added.
+         */
+        std::vector<std::unique_ptr<Setting>> m_settings;
+    };
+}
+
+#endif // _DSL_PROPERTY_BATCH_H
@@ -28,9 +28,21 @@ namespace DSL
 {
     QBintr::QBintr(const char* name)
         : Bintr(name)
+        , m_queueOverrunCount(0)
+        , m_autoLeakyEnabled(false)
+        , m_autoLeakyActive(false)
+        , m_autoLeakyRestore(DSL_COMPONENT_QUEUE_LEAKY_NO)
     { 
         LOG_FUNC();
 
+        // auto-sizing is disabled for all units by default
+        for (uint unit = DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS; 
+            unit <= DSL_COMPONENT_QUEUE_UNIT_OF_TIME; unit++)
+        {
+            m_autoSizeMin[unit] = 0;
+            m_autoSizeMax[unit] = 0;
+        }
+
         // Persist the wstring name to pass to the client callbacks on queue
         // overrun/underrun
         m_wstrName.assign(m_name.begin(), m_name.end());
@@ -342,10 +354,176 @@ namespace DSL
         return true;
     }
 
+    uint64_t QBintr::GetQueueOverrunCount()
+    {
+        LOG_FUNC(); 
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_queueStatsMutex);
+
+        return m_queueOverrunCount;
+    }
+
+    void QBintr::GetQueueAutoSize(uint unit, uint64_t* minSize, uint64_t* maxSize)
+    {
+        LOG_FUNC(); 
+
+        *minSize = m_autoSizeMin[unit];
+        *maxSize = m_autoSizeMax[unit];
+    }
+
+    bool QBintr::SetQueueAutoSize(uint unit, uint64_t minSize, uint64_t maxSize)
+    {
+        LOG_FUNC(); 
+
+        if (unit > DSL_COMPONENT_QUEUE_UNIT_OF_TIME)
+        {
+            LOG_ERROR("Invalid queue unit = " << unit << " for QBintr '" 
+                << GetName() << "'");
+            return false;
+        }
+        if (minSize > maxSize)
+        {
+            LOG_ERROR("Invalid auto-size bounds min = " << minSize 
+                << ", max = " << maxSize << " for QBintr '" << GetName() << "'");
+            return false;
+        }
+        m_autoSizeMin[unit] = minSize;
+        m_autoSizeMax[unit] = maxSize;
+        return true;
+    }
+
+    bool QBintr::GetQueueAutoLeakyEnabled()
+    {
+        LOG_FUNC(); 
+
+        return m_autoLeakyEnabled;
+    }
+
+    void QBintr::SetQueueAutoLeakyEnabled(bool enabled)
+    {
+        LOG_FUNC(); 
+
+        // restore the client's leaky setting if currently overridden.
+        if (!enabled and m_autoLeakyActive)
+        {
+            m_pQueue->SetAttribute("leaky", m_autoLeakyRestore);
+            m_leaky = m_autoLeakyRestore;
+            m_autoLeakyActive = false;
+        }
+        m_autoLeakyEnabled = enabled;
+    }
+
+    bool QBintr::UpdateQueueAutoSize(double occupancy, uint64_t newOverruns)
+    {
+        LOG_FUNC(); 
+
+        bool updated(false);
+        bool autoSizeEnabled(false);
+        bool allAtMaxSize(true);
+
+        for (uint unit = DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS; 
+            unit <= DSL_COMPONENT_QUEUE_UNIT_OF_TIME; unit++)
+        {
+            // auto-sizing is disabled for this unit
+            if (!m_autoSizeMax[unit])
+            {
+                continue;
+            }
+            autoSizeEnabled = true;
+
+            uint64_t currentSize = GetQueueMaxSize(unit);
+            uint64_t newSize(currentSize);
+
+            // grow by 50% on any overrun or sustained high occupancy
+            if (newOverruns or occupancy >= DSL_QUEUE_AUTO_SIZE_GROW_THRESHOLD)
+            {
+                newSize = currentSize + std::max(currentSize/2, (uint64_t)1);
+            }
+            // shrink by 25% on sustained low occupancy
+            else if (occupancy <= DSL_QUEUE_AUTO_SIZE_SHRINK_THRESHOLD)
+            {
+                newSize = currentSize - currentSize/4;
+            }
+            newSize = std::min(std::max(newSize, m_autoSizeMin[unit]), 
+                m_autoSizeMax[unit]);
+
+            if (newSize < m_autoSizeMax[unit])
+            {
+                allAtMaxSize = false;
+            }
+            if (newSize == currentSize)
+            {
+                continue;
+            }
+            
+            // Note: max-size properties are mutable in any state, so we set
+            // the attributes directly without checking the linked state.
+            if (unit == DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS)
+            {
+                m_maxSizeBuffers = (uint)newSize;
+                m_pQueue->SetAttribute("max-size-buffers", m_maxSizeBuffers);
+            }
+            else if (unit == DSL_COMPONENT_QUEUE_UNIT_OF_BYTES)
+            {
+                m_maxSizeBytes = (uint)newSize;
+                m_pQueue->SetAttribute("max-size-bytes", m_maxSizeBytes);
+            }
+            else
+            {
+                m_maxSizeTime = newSize;
+                m_pQueue->SetAttribute("max-size-time", m_maxSizeTime);
+            }
+            LOG_INFO("Queue auto-size updated max-size for unit = " << unit 
+                << " from " << currentSize << " to " << newSize 
+                << " for component '" << GetName() << "'");
+            updated = true;
+        }
+
+        if (!m_autoLeakyEnabled)
+        {
+            return updated;
+        }
+
+        // Leak downstream only if the Queue continues to overrun with 
+        // no more room to grow.
+        if (!m_autoLeakyActive and newOverruns and 
+            (allAtMaxSize or !autoSizeEnabled))
+        {
+            m_autoLeakyRestore = GetQueueLeaky();
+            if (m_autoLeakyRestore != DSL_COMPONENT_QUEUE_LEAKY_DOWNSTREAM)
+            {
+                m_leaky = DSL_COMPONENT_QUEUE_LEAKY_DOWNSTREAM;
+                m_pQueue->SetAttribute("leaky", m_leaky);
+                LOG_WARN("Queue auto-leaky set leaky = downstream for component '" 
+                    << GetName() << "'");
+                updated = true;
+            }
+            m_autoLeakyActive = true;
+        }
+        else if (m_autoLeakyActive and !newOverruns and
+            occupancy <= DSL_QUEUE_AUTO_SIZE_SHRINK_THRESHOLD)
+        {
+            if (m_autoLeakyRestore != DSL_COMPONENT_QUEUE_LEAKY_DOWNSTREAM)
+            {
+                m_leaky = m_autoLeakyRestore;
+                m_pQueue->SetAttribute("leaky", m_leaky);
+                LOG_INFO("Queue auto-leaky restored leaky = " << m_leaky 
+                    << " for component '" << GetName() << "'");
+                updated = true;
+            }
+            m_autoLeakyActive = false;
+        }
+        return updated;
+    }
+
     void QBintr::HandleQueueOverrun() 
     {
         LOG_FUNC();
 
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_queueStatsMutex);
+            m_queueOverrunCount++;
+        }
+
         LOG_WARN("Queue overrun signal received for Component " 
             << GetName() << "'");
 
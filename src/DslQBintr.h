@@ -156,6 +156,60 @@ namespace DSL
         bool RemoveQueueUnderrunListener(
                 dsl_component_queue_underrun_listener_cb listener);
 
+        /**
+         * @brief Gets the total number of overrun signals received for the
+         * Queue element since the QBintr was created.
+         * @return total overrun count.
+         */
+        uint64_t GetQueueOverrunCount();
+
+        /**
+         * @brief Gets the current auto-size bounds for the Queue element by unit.
+         * @param[in] unit one of the DSL_COMPONENT_QUEUE_UNIT_OF constants.
+         * @param[out] minSize minimum max-size the Queue can be reduced to.
+         * @param[out] maxSize maximum max-size the Queue can be increased to.
+         * 0 = auto-sizing disabled for the specified unit.
+         */
+        void GetQueueAutoSize(uint unit, uint64_t* minSize, uint64_t* maxSize);
+
+        /**
+         * @brief Sets the auto-size bounds for the Queue element by unit. 
+         * The bounds are applied by the Pipeline's Queue Sampler when enabled.
+         * @param[in] unit one of the DSL_COMPONENT_QUEUE_UNIT_OF constants.
+         * @param[in] minSize minimum max-size the Queue can be reduced to.
+         * @param[in] maxSize maximum max-size the Queue can be increased to.
+         * Set both minSize and maxSize to 0 to disable auto-sizing for the unit.
+         * @return true if successfully set, false otherwise.
+         */
+        bool SetQueueAutoSize(uint unit, uint64_t minSize, uint64_t maxSize);
+
+        /**
+         * @brief Gets the current auto-leaky enabled setting for the Queue element.
+         * @return true if auto-leaky is enabled, false otherwise.
+         */
+        bool GetQueueAutoLeakyEnabled();
+
+        /**
+         * @brief Sets the auto-leaky enabled setting for the Queue element. 
+         * If enabled, the Queue will be set to leak downstream once all 
+         * auto-size units have reached their maximum bounds and the Queue 
+         * continues to overrun. The original leaky setting is restored once 
+         * the Queue's occupancy drops below the shrink threshold.
+         * @param[in] enabled set to true to enable auto-leaky, false otherwise.
+         */
+        void SetQueueAutoLeakyEnabled(bool enabled);
+
+        /**
+         * @brief Updates the Queue's max-size properties (and optionally the
+         * leaky property) within the current auto-size bounds based on the 
+         * most recent occupancy measurements. Called by the Queue Sampler
+         * from the main-loop context and can be called while linked.
+         * @param[in] occupancy recent occupancy as a percentage of max-size.
+         * @param[in] newOverruns number of overruns since the last update.
+         * @return true if one or more properties were updated, false otherwise.
+         */
+        bool UpdateQueueAutoSize(double occupancy, uint64_t newOverruns);
+
         /**
          * @brief Handles a queue overrun signal for the QBintr.
          */
@@ -219,6 +273,44 @@ namespace DSL
         std::map<dsl_component_queue_underrun_listener_cb, void*> 
             m_queueUnderrunListeners;
 
+        /**
+         * @brief mutex to protect mutual access to the queue overrun count 
+         * which is updated from the streaming thread.
+         */
+        DslMutex m_queueStatsMutex;
+
+        /**
+         * @brief total number of overrun signals received for the Queue.
+         */
+        uint64_t m_queueOverrunCount;
+
+        /**
+         * @brief auto-size lower bounds indexed by DSL_COMPONENT_QUEUE_UNIT_OF.
+         */
+        uint64_t m_autoSizeMin[DSL_COMPONENT_QUEUE_UNIT_OF_TIME+1];
+
+        /**
+         * @brief auto-size upper bounds indexed by DSL_COMPONENT_QUEUE_UNIT_OF.
+         * 0 = auto-sizing disabled for the unit.
+         */
+        uint64_t m_autoSizeMax[DSL_COMPONENT_QUEUE_UNIT_OF_TIME+1];
+
+        /**
+         * @brief true if auto-leaky is enabled, false otherwise.
+         */
+        bool m_autoLeakyEnabled;
+
+        /**
+         * @brief true if the Queue's leaky property is currently overridden
+         * by auto-leaky, false otherwise.
+         */
+        bool m_autoLeakyActive;
+
+        /**
+         * @brief leaky setting to restore when auto-leaky is deactivated.
+         */
+        uint m_autoLeakyRestore;
+
         /**
          * @brief wstring version of this QBintr's name to return to the client
          * when calling the overrun and underrun callback functions.
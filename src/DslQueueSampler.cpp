@@ -0,0 +1,485 @@
+/*
+The MIT License
+
+Copyright (c) 2019-2021, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include "Dsl.h"
+#include "DslServices.h"
+#include "DslQueueSampler.h"
+
+namespace DSL
+{
+    QueueLevelRing::QueueLevelRing(DSL_QBINTR_PTR pQBintr, uint capacity)
+        : m_pQBintr(pQBintr)
+        , m_samples(std::max(capacity, (uint)1))
+        , m_head(0)
+        , m_size(0)
+    {
+        LOG_FUNC();
+    }
+
+    QueueLevelRing::~QueueLevelRing()
+    {
+        LOG_FUNC();
+    }
+
+    void QueueLevelRing::Push(const QueueLevelSample& sample)
+    {
+        m_samples[m_head] = sample;
+        m_head = (m_head + 1) % m_samples.size();
+        if (m_size < m_samples.size())
+        {
+            m_size++;
+        }
+    }
+
+    void QueueLevelRing::Sample(int64_t timestamp)
+    {
+        QueueLevelSample sample{0};
+        sample.timestamp = timestamp;
+        sample.buffers = m_pQBintr->GetQueueCurrentLevel(
+            DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS);
+        sample.bytes = m_pQBintr->GetQueueCurrentLevel(
+            DSL_COMPONENT_QUEUE_UNIT_OF_BYTES);
+        sample.time = m_pQBintr->GetQueueCurrentLevel(
+            DSL_COMPONENT_QUEUE_UNIT_OF_TIME);
+        sample.overruns = m_pQBintr->GetQueueOverrunCount();
+
+        // occupancy is the maximum over all units with a max-size set, 
+        // i.e. the unit closest to causing an overrun.
+        uint64_t levels[] = {sample.buffers, sample.bytes, sample.time};
+        for (uint unit = DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS; 
+            unit <= DSL_COMPONENT_QUEUE_UNIT_OF_TIME; unit++)
+        {
+            uint64_t maxSize = m_pQBintr->GetQueueMaxSize(unit);
+            if (maxSize)
+            {
+                sample.occupancy = std::max(sample.occupancy, 
+                    std::min(100.0*levels[unit]/maxSize, 100.0));
+            }
+        }
+        Push(sample);
+    }
+
+    QueueLevelSample QueueLevelRing::GetLatest()
+    {
+        if (!m_size)
+        {
+            QueueLevelSample sample{0};
+            return sample;
+        }
+        return GetSample(0);
+    }
+
+    double QueueLevelRing::GetOccupancyPercentile(double percentile, uint count)
+    {
+        if (!count or count > m_size)
+        {
+            count = m_size;
+        }
+        if (!count)
+        {
+            return 0;
+        }
+        std::vector<double> occupancies;
+        occupancies.reserve(count);
+        for (uint age = 0; age < count; age++)
+        {
+            occupancies.push_back(GetSample(age).occupancy);
+        }
+        
+        // nearest-rank percentile
+        uint rank = (uint)ceil(percentile/100.0*count);
+        uint index = (rank) ? std::min(rank-1, count-1) : 0;
+        
+        std::nth_element(occupancies.begin(), 
+            occupancies.begin()+index, occupancies.end());
+        return occupancies[index];
+    }
+
+    uint64_t QueueLevelRing::GetOverruns(uint count)
+    {
+        if (!count or count > m_size)
+        {
+            count = m_size;
+        }
+        if (count < 2)
+        {
+            return 0;
+        }
+        return GetSample(0).overruns - GetSample(count-1).overruns;
+    }
+
+    double QueueLevelRing::GetOverrunRate()
+    {
+        if (m_size < 2)
+        {
+            return 0;
+        }
+        int64_t duration = GetSample(0).timestamp - GetSample(m_size-1).timestamp;
+        if (duration <= 0)
+        {
+            return 0;
+        }
+        return (double)GetOverruns()*1000000/duration;
+    }
+
+    void QueueLevelRing::Clear()
+    {
+        m_head = 0;
+        m_size = 0;
+    }
+
+    const QueueLevelSample& QueueLevelRing::GetSample(uint age)
+    {
+        return m_samples[(m_head + m_samples.size() - 1 - age) % m_samples.size()];
+    }
+
+    //--------------------------------------------------------------------------------
+
+    static int QueueSamplerTimeoutHandler(void* user_data);
+
+    QueueSampler::QueueSampler(const char* name, Base* pParent)
+        : m_name(name)
+        , m_pParent(pParent)
+        , m_interval(DSL_QUEUE_SAMPLER_DEFAULT_INTERVAL)
+        , m_windowSize(DSL_QUEUE_SAMPLER_DEFAULT_WINDOW_SIZE)
+        , m_isEnabled(false)
+        , m_timerId(0)
+        , m_samplesSinceUpdate(0)
+    {
+        LOG_FUNC();
+    }
+
+    QueueSampler::~QueueSampler()
+    {
+        LOG_FUNC();
+
+        if (m_timerId)
+        {
+            g_source_remove(m_timerId);
+        }
+    }
+
+    void QueueSampler::GetSettings(uint* interval, uint* windowSize)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_samplerMutex);
+
+        *interval = m_interval;
+        *windowSize = m_windowSize;
+    }
+
+    bool QueueSampler::SetSettings(uint interval, uint windowSize)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_samplerMutex);
+
+        if (m_isEnabled)
+        {
+            LOG_ERROR("Unable to set settings for the Queue Sampler of Pipeline '" 
+                << m_name << "' as it's currently enabled");
+            return false;
+        }
+        if (!interval or !windowSize)
+        {
+            LOG_ERROR("Invalid settings interval = " << interval 
+                << ", window-size = " << windowSize 
+                << " for the Queue Sampler of Pipeline '" << m_name << "'");
+            return false;
+        }
+        m_interval = interval;
+        m_windowSize = windowSize;
+        
+        // existing rings are sized for the previous window
+        m_rings.clear();
+        m_lastOverruns.clear();
+        m_samplesSinceUpdate = 0;
+        
+        return true;
+    }
+
+    bool QueueSampler::GetEnabled()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_samplerMutex);
+
+        return m_isEnabled;
+    }
+
+    bool QueueSampler::SetEnabled(bool enabled)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_samplerMutex);
+
+        if (m_isEnabled == enabled)
+        {
+            LOG_ERROR("Can't set Queue Sampler enabled to the same value of " 
+                << enabled << " for Pipeline '" << m_name << "'");
+            return false;
+        }
+        if (enabled)
+        {
+            LOG_INFO("Enabling the Queue Sampler for Pipeline '" << m_name 
+                << "' with interval = " << m_interval << "ms");
+            m_timerId = g_timeout_add(m_interval, 
+                QueueSamplerTimeoutHandler, this);
+        }
+        else
+        {
+            LOG_INFO("Disabling the Queue Sampler for Pipeline '" << m_name << "'");
+            if (m_timerId and !g_source_remove(m_timerId))
+            {
+                LOG_ERROR("Sample-timer shutdown failed for the Queue Sampler of Pipeline '" 
+                    << m_name << "'");
+                return false;
+            }
+            m_timerId = 0;
+        }
+        m_isEnabled = enabled;
+        return true;
+    }
+
+    void QueueSampler::Sample()
+    {
+        // Snapshot the QBintrs under the Services lock before taking the 
+        // Sampler lock, as Services calls into the Sampler holding its lock.
+        std::map<std::string, DSL_QBINTR_PTR> qbintrs;
+        if (!Services::GetServices()->PipelineQueueSamplerQBintrsGet(
+            m_pParent, qbintrs))
+        {
+            LOG_DEBUG("Services call in progress - skipping sample for "
+                << "the Queue Sampler of Pipeline '" << m_name << "'");
+            return;
+        }
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_samplerMutex);
+
+        // prune the rings for all Components removed since the last sample
+        for (auto iter = m_rings.begin(); iter != m_rings.end(); )
+        {
+            if (qbintrs.find(iter->first) == qbintrs.end())
+            {
+                m_lastOverruns.erase(iter->first);
+                iter = m_rings.erase(iter);
+            }
+            else
+            {
+                ++iter;
+            }
+        }
+
+        int64_t timestamp = g_get_monotonic_time();
+        for (auto const& imap: qbintrs)
+        {
+            if (m_rings.find(imap.first) == m_rings.end())
+            {
+                m_rings[imap.first] = DSL_QUEUE_LEVEL_RING_NEW(imap.second, 
+                    m_windowSize);
+                m_lastOverruns[imap.first] = imap.second->GetQueueOverrunCount();
+            }
+            m_rings[imap.first]->Sample(timestamp);
+        }
+
+        if (++m_samplesSinceUpdate < DSL_QUEUE_AUTO_SIZE_UPDATE_SAMPLES)
+        {
+            return;
+        }
+        m_samplesSinceUpdate = 0;
+
+        // auto-size update based on the samples since the last update only.
+        for (auto const& imap: m_rings)
+        {
+            uint64_t overruns = imap.second->GetLatest().overruns;
+            uint64_t newOverruns = overruns - m_lastOverruns[imap.first];
+            m_lastOverruns[imap.first] = overruns;
+
+            imap.second->GetQBintr()->UpdateQueueAutoSize(
+                imap.second->GetOccupancyPercentile(90, 
+                    DSL_QUEUE_AUTO_SIZE_UPDATE_SAMPLES), newOverruns);
+        }
+    }
+
+    int QueueSampler::HandleSampleTimeout()
+    {
+        try
+        {
+            Sample();
+        }
+        catch(...)
+        {
+            LOG_ERROR("Queue Sampler for Pipeline '" << m_name 
+                << "' threw an exception sampling queue levels");
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_samplerMutex);
+            m_isEnabled = false;
+            m_timerId = 0;
+            return false;
+        }
+        return true;
+    }
+
+    void QueueSampler::GetTelemetry(const dsl_queue_telemetry** telemetry, 
+        uint* size)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_samplerMutex);
+
+        std::string bottleneck = FindBottleneck();
+
+        m_telemetry.clear();
+        m_telemetryNames.clear();
+        
+        // reserve up front so that the name pointers remain valid
+        m_telemetry.reserve(m_rings.size());
+        m_telemetryNames.reserve(m_rings.size());
+
+        for (auto const& imap: m_rings)
+        {
+            DSL_QBINTR_PTR pQBintr = imap.second->GetQBintr();
+            QueueLevelSample latest = imap.second->GetLatest();
+
+            m_telemetryNames.push_back(
+                std::wstring(imap.first.begin(), imap.first.end()));
+
+            dsl_queue_telemetry entry{0};
+            entry.component = m_telemetryNames.back().c_str();
+            entry.samples = imap.second->GetSize();
+            entry.current_level_buffers = latest.buffers;
+            entry.current_level_bytes = latest.bytes;
+            entry.current_level_time = latest.time;
+            entry.max_size_buffers = pQBintr->GetQueueMaxSize(
+                DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS);
+            entry.max_size_bytes = pQBintr->GetQueueMaxSize(
+                DSL_COMPONENT_QUEUE_UNIT_OF_BYTES);
+            entry.max_size_time = pQBintr->GetQueueMaxSize(
+                DSL_COMPONENT_QUEUE_UNIT_OF_TIME);
+            entry.leaky = pQBintr->GetQueueLeaky();
+            entry.occupancy_p50 = imap.second->GetOccupancyPercentile(50);
+            entry.occupancy_p90 = imap.second->GetOccupancyPercentile(90);
+            entry.occupancy_p99 = imap.second->GetOccupancyPercentile(99);
+            entry.occupancy_max = imap.second->GetOccupancyPercentile(100);
+            entry.overruns = imap.second->GetOverruns();
+            entry.overrun_rate = imap.second->GetOverrunRate();
+            entry.is_bottleneck = (imap.first == bottleneck);
+            
+            m_telemetry.push_back(entry);
+        }
+        *telemetry = (m_telemetry.size()) ? &m_telemetry[0] : NULL;
+        *size = m_telemetry.size();
+    }
+
+    void QueueSampler::ClearTelemetry()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_samplerMutex);
+
+        for (auto const& imap: m_rings)
+        {
+            imap.second->Clear();
+        }
+        m_samplesSinceUpdate = 0;
+    }
+
+    void QueueSampler::GetPeakLoad(uint count, double* occupancy, 
+        uint64_t* overruns)
+    {
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_samplerMutex);
+
+        *occupancy = 0;
+        *overruns = 0;
+        for (auto const& imap: m_rings)
+        {
+            *occupancy = std::max(*occupancy, 
+                imap.second->GetOccupancyPercentile(90, count));
+            *overruns += imap.second->GetOverruns(count);
+        }
+    }
+
+    const wchar_t* QueueSampler::GetBottleneck()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_samplerMutex);
+
+        std::string bottleneck = FindBottleneck();
+        m_wstrBottleneck.assign(bottleneck.begin(), bottleneck.end());
+        
+        return m_wstrBottleneck.c_str();
+    }
+
+    void QueueSampler::CollectQBintrs(Base* pParent, 
+        std::map<std::string, DSL_QBINTR_PTR>& qbintrs)
+    {
+        if (!pParent)
+        {
+            return;
+        }
+        for (auto const& imap: pParent->GetChildren())
+        {
+            DSL_QBINTR_PTR pQBintr = std::dynamic_pointer_cast<QBintr>(imap.second);
+            if (pQBintr)
+            {
+                qbintrs[imap.first] = pQBintr;
+            }
+            CollectQBintrs(imap.second.get(), qbintrs);
+        }
+    }
+
+    std::string QueueSampler::FindBottleneck()
+    {
+        std::string bottleneck;
+        double maxOverrunRate(0);
+
+        // the queue overrunning most frequently is the bottleneck
+        for (auto const& imap: m_rings)
+        {
+            double overrunRate = imap.second->GetOverrunRate();
+            if (overrunRate > maxOverrunRate)
+            {
+                maxOverrunRate = overrunRate;
+                bottleneck = imap.first;
+            }
+        }
+        if (bottleneck.size())
+        {
+            return bottleneck;
+        }
+        
+        // otherwise, the queue with the highest sustained occupancy
+        double maxOccupancy(0);
+        for (auto const& imap: m_rings)
+        {
+            double occupancy = imap.second->GetOccupancyPercentile(90);
+            if (occupancy >= DSL_QUEUE_BOTTLENECK_THRESHOLD and 
+                occupancy > maxOccupancy)
+            {
+                maxOccupancy = occupancy;
+                bottleneck = imap.first;
+            }
+        }
+        return bottleneck;
+    }
+
+    static int QueueSamplerTimeoutHandler(void* user_data)
+    {
+        return static_cast<QueueSampler*>(user_data)->
+            HandleSampleTimeout();
+    }
+}
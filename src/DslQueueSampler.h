@@ -0,0 +1,370 @@
+/*
+The MIT License
+
+Copyright (c) 2019-2021, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#ifndef _DSL_QUEUE_SAMPLER_H
+#define _DSL_QUEUE_SAMPLER_H
+
+#include "Dsl.h"
+#include "DslApi.h"
+#include "DslBase.h"
+#include "DslQBintr.h"
+
+namespace DSL
+{
+    #define DSL_QUEUE_LEVEL_RING_PTR std::shared_ptr<QueueLevelRing>
+    #define DSL_QUEUE_LEVEL_RING_NEW(pQBintr, capacity) \
+        std::shared_ptr<QueueLevelRing>(new QueueLevelRing(pQBintr, capacity))
+
+    #define DSL_QUEUE_SAMPLER_PTR std::shared_ptr<QueueSampler>
+    #define DSL_QUEUE_SAMPLER_NEW(name, pParent) \
+        std::shared_ptr<QueueSampler>(new QueueSampler(name, pParent))
+
+    /**
+     * @struct QueueLevelSample
+     * @brief a single queue level sample taken by the Queue Sampler.
+     */
+    struct QueueLevelSample
+    {
+        /**
+         * @brief monotonic time of the sample in microseconds.
+         */
+        int64_t timestamp;
+
+        /**
+         * @brief current-level-buffers at the time of the sample.
+         */
+        uint64_t buffers;
+
+        /**
+         * @brief current-level-bytes at the time of the sample.
+         */
+        uint64_t bytes;
+
+        /**
+         * @brief current-level-time at the time of the sample.
+         */
+        uint64_t time;
+
+        /**
+         * @brief occupancy as a percentage of max-size, the maximum
+         * over all units with a max-size set.
+         */
+        double occupancy;
+
+        /**
+         * @brief cumulative overrun count at the time of the sample.
+         */
+        uint64_t overruns;
+    };
+
+    /**
+     * @class QueueLevelRing
+     * @brief Implements a fixed capacity ring buffer of queue level samples
+     * for a single QBintr.
+     */
+    class QueueLevelRing
+    {
+    public:
+
+        /**
+         * @brief ctor for the QueueLevelRing class.
+         * @param[in] pQBintr shared pointer to the QBintr to sample.
+         * @param[in] capacity maximum number of samples to retain.
+         */
+        QueueLevelRing(DSL_QBINTR_PTR pQBintr, uint capacity);
+
+        /**
+         * @brief dtor for the QueueLevelRing class.
+         */
+        ~QueueLevelRing();
+
+        /**
+         * @brief Gets the QBintr sampled by this QueueLevelRing.
+         * @return shared pointer to the sampled QBintr.
+         */
+        DSL_QBINTR_PTR GetQBintr(){return m_pQBintr;};
+
+        /**
+         * @brief Adds a new sample to the ring, overwriting the oldest
+         * sample once the ring is full.
+         * @param[in] sample new sample to add.
+         */
+        void Push(const QueueLevelSample& sample);
+
+        /**
+         * @brief Takes a new sample of the QBintr's current levels and 
+         * adds it to the ring.
+         * @param[in] timestamp monotonic time of the sample in microseconds.
+         */
+        void Sample(int64_t timestamp);
+
+        /**
+         * @brief Gets the number of samples currently in the ring.
+         * @return number of samples, 0 to capacity.
+         */
+        uint GetSize(){return m_size;};
+
+        /**
+         * @brief Gets the most recent sample in the ring. 
+         * @return most recent sample, all fields 0 if empty.
+         */
+        QueueLevelSample GetLatest();
+
+        /**
+         * @brief Gets an occupancy percentile over the most recent samples.
+         * @param[in] percentile percentile to calculate in the range 0..100.
+         * @param[in] count number of most recent samples to include, 
+         * 0 = all samples in the ring.
+         * @return occupancy percentile as a percentage of max-size.
+         */
+        double GetOccupancyPercentile(double percentile, uint count=0);
+
+        /**
+         * @brief Gets the number of overruns over the most recent samples.
+         * @param[in] count number of most recent samples to include,
+         * 0 = all samples in the ring.
+         * @return number of overruns.
+         */
+        uint64_t GetOverruns(uint count=0);
+
+        /**
+         * @brief Gets the overrun rate over all samples in the ring.
+         * @return overrun rate in overruns per second.
+         */
+        double GetOverrunRate();
+
+        /**
+         * @brief Clears all samples from the ring.
+         */
+        void Clear();
+
+    private:
+
+        /**
+         * @brief Gets a sample by age.
+         * @param[in] age 0 = most recent sample, GetSize()-1 = oldest sample.
+         * @return the requested sample.
+         */
+        const QueueLevelSample& GetSample(uint age);
+
+        /**
+         * @brief shared pointer to the QBintr being sampled.
+         */
+        DSL_QBINTR_PTR m_pQBintr;
+
+        /**
+         * @brief fixed size vector of samples used as a ring buffer.
+         */
+        std::vector<QueueLevelSample> m_samples;
+
+        /**
+         * @brief index of the next sample to write.
+         */
+        uint m_head;
+
+        /**
+         * @brief current number of samples in the ring.
+         */
+        uint m_size;
+    };
+
+    /**
+     * @class QueueSampler
+     * @brief Implements a periodic sampler of all Component queues in a 
+     * Pipeline. Computes occupancy percentiles, overrun rates, and the 
+     * Pipeline's bottleneck, and applies queue auto-sizing.
+     */
+    class QueueSampler
+    {
+    public:
+
+        /**
+         * @brief ctor for the QueueSampler class.
+         * @param[in] name unique name of the Pipeline that owns the Sampler.
+         * @param[in] pParent the parent object whose children will be sampled.
+         */
+        QueueSampler(const char* name, Base* pParent);
+
+        /**
+         * @brief dtor for the QueueSampler class.
+         */
+        ~QueueSampler();
+
+        /**
+         * @brief Gets the current sample interval and window size.
+         * @param[out] interval sample interval in milliseconds.
+         * @param[out] windowSize number of samples retained per queue.
+         */
+        void GetSettings(uint* interval, uint* windowSize);
+
+        /**
+         * @brief Sets the sample interval and window size. Can only be 
+         * called while the Sampler is disabled. Clears all current samples.
+         * @param[in] interval sample interval in milliseconds.
+         * @param[in] windowSize number of samples retained per queue.
+         * @return true if successfully set, false otherwise.
+         */
+        bool SetSettings(uint interval, uint windowSize);
+
+        /**
+         * @brief Gets the current enabled setting for the Sampler.
+         * @return true if enabled, false otherwise.
+         */
+        bool GetEnabled();
+
+        /**
+         * @brief Sets the enabled setting for the Sampler, starting or 
+         * stopping the sample timer.
+         * @param[in] enabled set to true to enable, false to disable.
+         * @return true if successfully set, false otherwise.
+         */
+        bool SetEnabled(bool enabled);
+
+        /**
+         * @brief Takes a single sample of all queues in the parent object.
+         * Called by the sample timer, and can be called directly. The sample
+         * is skipped if a Services call is in progress.
+         */
+        void Sample();
+
+        /**
+         * @brief Handles the sample timer timeout.
+         * @return true to continue the timer, false to stop.
+         */
+        int HandleSampleTimeout();
+
+        /**
+         * @brief Gets the current telemetry for all sampled queues.
+         * @param[out] telemetry pointer to an array of telemetry structures 
+         * owned by the Sampler, valid until the next call.
+         * @param[out] size number of structures in the array.
+         */
+        void GetTelemetry(const dsl_queue_telemetry** telemetry, uint* size);
+
+        /**
+         * @brief Clears all current samples for all queues.
+         */
+        void ClearTelemetry();
+
+        /**
+         * @brief Gets the peak load over the most recent samples of all queues.
+         * @param[in] count number of most recent samples to include per queue.
+         * @param[out] occupancy maximum 90th percentile occupancy, as a 
+         * percentage of max-size, over all queues.
+         * @param[out] overruns total number of overruns over all queues.
+         */
+        void GetPeakLoad(uint count, double* occupancy, uint64_t* overruns);
+
+        /**
+         * @brief Gets the name of the Component identified as the bottleneck.
+         * @return name of the bottleneck Component, empty string if none. 
+         */
+        const wchar_t* GetBottleneck();
+
+        /**
+         * @brief Recursively collects all QBintrs owned by a parent object.
+         * The caller must hold the Services lock.
+         * @param[in] pParent parent object to search.
+         * @param[out] qbintrs map of QBintrs found by unique name.
+         */
+        static void CollectQBintrs(Base* pParent, 
+            std::map<std::string, DSL_QBINTR_PTR>& qbintrs);
+
+    private:
+
+        /**
+         * @brief Identifies the current bottleneck queue.
+         * @return name of the bottleneck Component, empty string if none.
+         */
+        std::string FindBottleneck();
+
+        /**
+         * @brief unique name of the Pipeline that owns the Sampler.
+         */
+        std::string m_name;
+
+        /**
+         * @brief parent object whose children are sampled.
+         */
+        Base* m_pParent;
+
+        /**
+         * @brief mutex to protect mutual access to the sample rings.
+         */
+        DslMutex m_samplerMutex;
+
+        /**
+         * @brief sample interval in milliseconds.
+         */
+        uint m_interval;
+
+        /**
+         * @brief number of samples retained per queue.
+         */
+        uint m_windowSize;
+
+        /**
+         * @brief true if the Sampler is enabled, false otherwise.
+         */
+        bool m_isEnabled;
+
+        /**
+         * @brief gnome timer id for the sample timer.
+         */
+        uint m_timerId;
+
+        /**
+         * @brief number of samples taken since the last auto-size update.
+         */
+        uint m_samplesSinceUpdate;
+
+        /**
+         * @brief map of sample rings by Component name.
+         */
+        std::map<std::string, DSL_QUEUE_LEVEL_RING_PTR> m_rings;
+
+        /**
+         * @brief cumulative overrun count per Component at the last 
+         * auto-size update.
+         */
+        std::map<std::string, uint64_t> m_lastOverruns;
+
+        /**
+         * @brief telemetry array returned to the client on GetTelemetry.
+         */
+        std::vector<dsl_queue_telemetry> m_telemetry;
+
+        /**
+         * @brief wstring Component names referenced by m_telemetry.
+         */
+        std::vector<std::wstring> m_telemetryNames;
+
+        /**
+         * @brief wstring name of the bottleneck returned to the client.
+         */
+        std::wstring m_wstrBottleneck;
+    };
+}
+
+#endif // _DSL_QUEUE_SAMPLER_H
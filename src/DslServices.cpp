@@ -314,6 +314,8 @@ namespace DSL
         m_returnValueToString[DSL_RESULT_COMPONENT_ELEMENT_ADD_FAILED] = L"DSL_RESULT_COMPONENT_ELEMENT_ADD_FAILED";
         m_returnValueToString[DSL_RESULT_COMPONENT_ELEMENT_REMOVE_FAILED] = L"DSL_RESULT_COMPONENT_ELEMENT_REMOVE_FAILED";
         m_returnValueToString[DSL_RESULT_COMPONENT_ELEMENT_NOT_IN_USE] = L"DSL_RESULT_COMPONENT_ELEMENT_NOT_IN_USE";
+        m_returnValueToString[DSL_RESULT_COMPONENT_PROPERTY_INVALID] = L"DSL_RESULT_COMPONENT_PROPERTY_INVALID";
+        m_returnValueToString[DSL_RESULT_COMPONENT_PROPERTY_NOT_APPLIED] = L"DSL_RESULT_COMPONENT_PROPERTY_NOT_APPLIED";
 
         m_returnValueToString[DSL_RESULT_SOURCE_NAME_NOT_UNIQUE] = L"DSL_RESULT_SOURCE_NAME_NOT_UNIQUE";
         m_returnValueToString[DSL_RESULT_SOURCE_NAME_NOT_FOUND] = L"DSL_RESULT_SOURCE_NAME_NOT_FOUND";
@@ -379,6 +381,9 @@ namespace DSL
         m_returnValueToString[DSL_RESULT_PPH_ODE_TRIGGER_REMOVE_FAILED] = L"DSL_RESULT_PPH_ODE_TRIGGER_REMOVE_FAILED";
         m_returnValueToString[DSL_RESULT_PPH_ODE_TRIGGER_NOT_IN_USE] = L"DSL_RESULT_PPH_ODE_TRIGGER_NOT_IN_USE";
         m_returnValueToString[DSL_RESULT_PPH_METER_INVALID_INTERVAL] = L"DSL_RESULT_PPH_METER_INVALID_INTERVAL";
+        m_returnValueToString[DSL_RESULT_PPH_CUSTOM_ASYNC_POLICY_INVALID] = L"DSL_RESULT_PPH_CUSTOM_ASYNC_POLICY_INVALID";
+        m_returnValueToString[DSL_RESULT_PPH_META_RECORD_FILE_ERROR] = L"DSL_RESULT_PPH_META_RECORD_FILE_ERROR";
+        m_returnValueToString[DSL_RESULT_PPH_META_SHM_CREATE_FAILED] = L"DSL_RESULT_PPH_META_SHM_CREATE_FAILED";
 
         m_returnValueToString[DSL_RESULT_ODE_TRIGGER_NAME_NOT_UNIQUE] = L"DSL_RESULT_ODE_TRIGGER_NAME_NOT_UNIQUE";
         m_returnValueToString[DSL_RESULT_ODE_TRIGGER_NAME_NOT_FOUND] = L"DSL_RESULT_ODE_TRIGGER_NAME_NOT_FOUND";
@@ -526,6 +531,7 @@ namespace DSL
         m_returnValueToString[DSL_RESULT_TEE_HANDLER_ADD_FAILED] = L"DSL_RESULT_TEE_HANDLER_ADD_FAILED";
         m_returnValueToString[DSL_RESULT_TEE_HANDLER_REMOVE_FAILED] = L"DSL_RESULT_TEE_HANDLER_REMOVE_FAILED";
         m_returnValueToString[DSL_RESULT_TEE_COMPONENT_IS_NOT_TEE] = L"DSL_RESULT_TEE_COMPONENT_IS_NOT_TEE";
+        m_returnValueToString[DSL_RESULT_TEE_BRANCH_OP_INVALID] = L"DSL_RESULT_TEE_BRANCH_OP_INVALID";
 
         m_returnValueToString[DSL_RESULT_TILER_NAME_NOT_UNIQUE] = L"DSL_RESULT_TILER_NAME_NOT_UNIQUE";
         m_returnValueToString[DSL_RESULT_TILER_NAME_NOT_FOUND] = L"DSL_RESULT_TILER_NAME_NOT_FOUND";
@@ -567,6 +573,13 @@ namespace DSL
         m_returnValueToString[DSL_RESULT_PIPELINE_MAIN_LOOP_REQUEST_FAILED] = L"DSL_RESULT_PIPELINE_MAIN_LOOP_REQUEST_FAILED";
         m_returnValueToString[DSL_RESULT_PIPELINE_GET_FAILED] = L"DSL_RESULT_PIPELINE_GET_FAILED";
         m_returnValueToString[DSL_RESULT_PIPELINE_SET_FAILED] = L"DSL_RESULT_PIPELINE_SET_FAILED";
+        m_returnValueToString[DSL_RESULT_PIPELINE_POOL_NAME_NOT_UNIQUE] = L"DSL_RESULT_PIPELINE_POOL_NAME_NOT_UNIQUE";
+        m_returnValueToString[DSL_RESULT_PIPELINE_POOL_NAME_NOT_FOUND] = L"DSL_RESULT_PIPELINE_POOL_NAME_NOT_FOUND";
+        m_returnValueToString[DSL_RESULT_PIPELINE_POOL_IN_USE] = L"DSL_RESULT_PIPELINE_POOL_IN_USE";
+        m_returnValueToString[DSL_RESULT_PIPELINE_POOL_EXHAUSTED] = L"DSL_RESULT_PIPELINE_POOL_EXHAUSTED";
+        m_returnValueToString[DSL_RESULT_PIPELINE_POOL_STANDBY_FAILED] = L"DSL_RESULT_PIPELINE_POOL_STANDBY_FAILED";
+        m_returnValueToString[DSL_RESULT_PIPELINE_POOL_ACQUIRE_FAILED] = L"DSL_RESULT_PIPELINE_POOL_ACQUIRE_FAILED";
+        m_returnValueToString[DSL_RESULT_PIPELINE_POOL_RELEASE_FAILED] = L"DSL_RESULT_PIPELINE_POOL_RELEASE_FAILED";
 
         m_returnValueToString[DSL_RESULT_DISPLAY_TYPE_THREW_EXCEPTION] = L"DSL_RESULT_DISPLAY_TYPE_THREW_EXCEPTION";
         m_returnValueToString[DSL_RESULT_DISPLAY_TYPE_IN_USE] = L"DSL_RESULT_DISPLAY_TYPE_IN_USE";
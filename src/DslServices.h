@@ -35,11 +35,14 @@ THE SOFTWARE.
 #include "DslOdeHeatMapper.h"
 #include "DslOdeTrigger.h"
 #include "DslPipelineBintr.h"
+#include "DslPipelinePool.h"
 #include "DslMessageBroker.h"
+#include "DslPropertyBatch.h"
 #if !defined(BUILD_WEBRTC)
     #error "BUILD_WEBRTC must be defined"
 #elif BUILD_WEBRTC == true
     #include "DslSinkWebRtcBintr.h"
+    #include "DslOdeActionWebsocket.h"
 #endif
 
 
@@ -185,6 +188,20 @@ namespace DSL {
         DslReturnType OdeActionCaptureMailerRemove(const char* name,
             const char* mailer);
 
+        DslReturnType OdeActionCaptureWebsocketTopicSet(const char* name,
+            const char* topic);
+
+        DslReturnType OdeActionCaptureObjectBestShotGet(const char* name,
+            boolean* enabled, uint* timeout, uint* maxHold, boolean* sharpness);
+
+        DslReturnType OdeActionCaptureObjectBestShotSet(const char* name,
+            boolean enabled, uint timeout, uint maxHold, boolean sharpness);
+
+        DslReturnType OdeActionCaptureMetricsGet(const char* name,
+            dsl_ode_action_capture_metrics* metrics);
+
+        DslReturnType OdeActionCaptureMetricsClear(const char* name);
+
         DslReturnType OdeActionDisplayNew(const char* name, 
             const char* formatString, uint offsetX, uint offsetY, 
             const char* font, boolean hasBgColor, const char* bgColor);
@@ -276,6 +293,9 @@ namespace DSL {
         
         DslReturnType OdeActionRedactNew(const char* name);
 
+        DslReturnType OdeActionWebsocketPublishNew(const char* name, 
+            const char* topic);
+
         DslReturnType OdeActionSinkAddNew(const char* name, 
             const char* pipeline, const char* sink);
 
@@ -341,6 +361,11 @@ namespace DSL {
         DslReturnType OdeActionEnabledStateChangeListenerRemove(const char* name,
             dsl_ode_enabled_state_change_listener_cb listener);
 
+        DslReturnType OdeActionAsyncMetricsGet(const char* name,
+            dsl_ode_action_async_metrics* metrics);
+
+        DslReturnType OdeActionAsyncMetricsClear(const char* name);
+
         DslReturnType OdeActionDelete(const char* name);
         
         DslReturnType OdeActionDeleteAll();
@@ -393,6 +418,10 @@ namespace DSL {
             uint classId, uint limit,  dsl_ode_check_for_occurrence_cb client_checker, 
             dsl_ode_post_process_frame_cb client_post_processor, void* client_data);
 
+        DslReturnType OdeTriggerCustomBatchNew(const char* name, const char* source, 
+            uint classId, uint limit, dsl_ode_check_for_occurrence_batch_cb client_checker, 
+            void* client_data);
+
         DslReturnType OdeTriggerCountNew(const char* name, const char* source, 
             uint classId, uint limit, uint minimum, uint maximum);
 
@@ -639,6 +668,21 @@ namespace DSL {
         DslReturnType PphCustomNew(const char* name,
             dsl_pph_custom_client_handler_cb clientHandler, void* clientData);
 
+        DslReturnType PphCustomAsyncEnabledGet(const char* name, boolean* enabled);
+
+        DslReturnType PphCustomAsyncEnabledSet(const char* name, boolean enabled);
+
+        DslReturnType PphCustomAsyncQueueSettingsGet(const char* name, 
+            uint* maxSize, uint* policy, uint* sampleInterval);
+
+        DslReturnType PphCustomAsyncQueueSettingsSet(const char* name, 
+            uint maxSize, uint policy, uint sampleInterval);
+
+        DslReturnType PphCustomAsyncMetricsGet(const char* name, 
+            dsl_pph_custom_async_metrics* metrics);
+
+        DslReturnType PphCustomAsyncMetricsClear(const char* name);
+
         DslReturnType PphMeterNew(const char* name, uint interval, 
             dsl_pph_meter_client_handler_cb clientHandler, void* clientData);
             
@@ -658,6 +702,18 @@ namespace DSL {
 
         DslReturnType PphOdeDisplayMetaAllocSizeSet(const char* name, uint size);
 
+        DslReturnType PphOdeFrameWorkersGet(const char* name, uint* workers);
+
+        DslReturnType PphOdeFrameWorkersSet(const char* name, uint workers);
+
+        DslReturnType PphOdeReplay(const char* name, 
+            const char* filePath, uint64_t* frames);
+
+        DslReturnType PphMetaRecorderNew(const char* name, const char* filePath);
+
+        DslReturnType PphMetaPublisherNew(const char* name, const char* shmName,
+            uint slotCount, uint maxObjects);
+
         DslReturnType PphBufferTimeoutNew(const char* name,
             uint timeout, dsl_pph_buffer_timeout_handler_cb handler, void* clientData);
     
@@ -936,6 +992,18 @@ namespace DSL {
         DslReturnType SourceVideoBufferOutFrameRateSet(const char* name, 
             uint fps_n, uint fps_d);
 
+        DslReturnType SourceVideoDecimationFrameRateGet(const char* name, 
+            uint* fps_n, uint* fps_d);
+
+        DslReturnType SourceVideoDecimationFrameRateSet(const char* name, 
+            uint fps_n, uint fps_d);
+
+        DslReturnType SourceVideoDecimationStatsGet(const char* name, 
+            uint64_t* frames_passed, uint64_t* frames_dropped, 
+            uint64_t* frames_dropped_pre_decode);
+
+        DslReturnType SourceVideoDecimationStatsClear(const char* name);
+
         DslReturnType SourceVideoBufferOutCropRectangleGet(const char* name, 
             uint cropAt, uint* left, uint* top, uint* width, uint* height);
 
@@ -1236,6 +1304,26 @@ namespace DSL {
 
         DslReturnType TeeBranchCountGet(const char* name, uint* count);
 
+        DslReturnType TeeBranchOpsApply(const char* name, 
+            std::vector<BranchOp>& ops, dsl_tee_branch_op_result* results);
+
+        DslReturnType TeeBranchOpsApplyAsync(const char* name, 
+            std::vector<BranchOp>& ops, 
+            dsl_tee_branch_ops_complete_listener_cb listener, void* clientData);
+
+        /**
+         * @brief Executes the queued batches of Branch operations for a Tee
+         * under the Services lock, so that its Branches are never linked,
+         * unlinked, or removed while a Services call updates them.
+         * @param[in] pTee Tee to execute the queued batches of.
+         * @return false if the Services lock is held by a call in progress, 
+         * in which case nothing is executed, true otherwise.
+         */
+        bool TeeBranchOpsQueueExecute(MultiBranchesBintr* pTee);
+
+        // internal service to validate a single Tee Branch operation.
+        DslReturnType _teeBranchOpValidate(const char* name, BranchOp& op);
+
         DslReturnType TeeBlockingTimeoutGet(const char* name, uint* timeout);
         
         DslReturnType TeeBlockingTimeoutSet(const char* name, uint timeout);
@@ -1594,6 +1682,21 @@ namespace DSL {
         DslReturnType SinkFrameCaptureSchedule(const char* name,
             uint64_t frameNumber);
             
+        DslReturnType SinkFrameCaptureRingSettingsGet(const char* name,
+            uint* width, uint* duration, uint64_t* maxSize);
+            
+        DslReturnType SinkFrameCaptureRingSettingsSet(const char* name,
+            uint width, uint duration, uint64_t maxSize);
+            
+        DslReturnType SinkFrameCaptureRingSizeGet(const char* name,
+            uint* frames, uint64_t* size);
+            
+        DslReturnType SinkFrameCaptureRingInitiate(const char* name,
+            uint64_t timestamp);
+            
+        DslReturnType SinkFrameCaptureRingInitiateRange(const char* name,
+            uint64_t startTimestamp, uint64_t endTimestamp, uint* count);
+            
         DslReturnType SinkWebRtcNew(const char* name, const char* stunServer, 
             const char* turnServer, uint encoder, uint bitrate, uint iframeInterval);
 
@@ -1674,6 +1777,17 @@ namespace DSL {
         DslReturnType WebsocketServerClientListenerRemove(
             dsl_websocket_server_client_listener_cb listener);
 
+        DslReturnType WebsocketServerTopicAdd(const char* topic,
+            uint maxQueueSize, uint dropPolicy, boolean coalesce);
+
+        DslReturnType WebsocketServerTopicRemove(const char* topic);
+
+        DslReturnType WebsocketServerTopicPublish(const char* topic,
+            const char* message);
+
+        DslReturnType WebsocketServerTopicMetricsGet(const char* topic,
+            dsl_websocket_topic_metrics* metrics);
+
         DslReturnType SinkMessageNew(const char* name, 
             const char* converterConfigFile, uint payloadType, 
             const char* brokerConfigFile, const char* protocolLib, 
@@ -1749,6 +1863,18 @@ namespace DSL {
         DslReturnType ComponentQueueMinThresholdSet(const char* name, 
             uint unit, uint64_t minThreshold);
 
+        DslReturnType ComponentQueueAutoSizeGet(const char* name, 
+            uint unit, uint64_t* minSize, uint64_t* maxSize);
+
+        DslReturnType ComponentQueueAutoSizeSet(const char* name, 
+            uint unit, uint64_t minSize, uint64_t maxSize);
+
+        DslReturnType ComponentQueueAutoLeakyEnabledGet(const char* name, 
+            boolean* enabled);
+
+        DslReturnType ComponentQueueAutoLeakyEnabledSet(const char* name, 
+            boolean enabled);
+
         DslReturnType ComponentQueueOverrunListenerAdd(const char* name, 
             dsl_component_queue_overrun_listener_cb listener, void* clientData);
 
@@ -1769,6 +1895,9 @@ namespace DSL {
         
         DslReturnType ComponentNvbufMemTypeSet(const char* name, uint type);
         
+        DslReturnType ComponentPropertyBatchSet(
+            const std::vector<PropertySetting>& settings, DslReturnType* results);
+        
         DslReturnType BranchNew(const char* name);
         
         DslReturnType BranchComponentAdd(const char* branch, const char* component);
@@ -1893,6 +2022,89 @@ namespace DSL {
         
         DslReturnType PipelineDumpToDotWithTs(const char* name, const char* filename);
         
+        DslReturnType PipelineQueueSamplerSettingsGet(const char* name, 
+            uint* interval, uint* windowSize);
+        
+        DslReturnType PipelineQueueSamplerSettingsSet(const char* name, 
+            uint interval, uint windowSize);
+        
+        DslReturnType PipelineQueueSamplerEnabledGet(const char* name, 
+            boolean* enabled);
+        
+        DslReturnType PipelineQueueSamplerEnabledSet(const char* name, 
+            boolean enabled);
+        
+        DslReturnType PipelineQueueTelemetryGet(const char* name, 
+            const dsl_queue_telemetry** telemetry, uint* size);
+        
+        DslReturnType PipelineQueueTelemetryClear(const char* name);
+        
+        DslReturnType PipelineQueueBottleneckGet(const char* name, 
+            const wchar_t** component);
+        
+        /**
+         * @brief Collects the QBintrs of a Pipeline for its Queue Sampler
+         * under the Services lock, so that the child maps of the Pipeline's
+         * components are never walked while a Services call updates them.
+         * @param[in] pPipeline Pipeline to collect the QBintrs of.
+         * @param[out] qbintrs map of QBintrs found by unique name.
+         * @return false if the Services lock is held by a call in progress, 
+         * in which case nothing is collected, true otherwise.
+         */
+        bool PipelineQueueSamplerQBintrsGet(Base* pPipeline, 
+            std::map<std::string, DSL_QBINTR_PTR>& qbintrs);
+        
+        /**
+         * @brief Applies a load-shedding interval to the InferBintrs of a 
+         * Pipeline for its Infer Interval Controller under the Services lock,
+         * so that the child maps of the Pipeline's components are never 
+         * walked while a Services call updates them.
+         * @param[in] pPipeline Pipeline to apply the interval to.
+         * @param[in] interval the interval to apply, 0 to restore the 
+         * configured interval.
+         * @return false if the Services lock is held by a call in progress, 
+         * in which case nothing is applied, true otherwise.
+         */
+        bool PipelineInferIntervalApply(Base* pPipeline, uint interval);
+        
+        DslReturnType PipelineInferIntervalBoundsGet(const char* name, 
+            uint* minInterval, uint* maxInterval);
+        
+        DslReturnType PipelineInferIntervalBoundsSet(const char* name, 
+            uint minInterval, uint maxInterval);
+        
+        DslReturnType PipelineInferIntervalThresholdsGet(const char* name, 
+            uint* lowOccupancy, uint* highOccupancy, uint* maxLatency, uint* minFps);
+        
+        DslReturnType PipelineInferIntervalThresholdsSet(const char* name, 
+            uint lowOccupancy, uint highOccupancy, uint maxLatency, uint minFps);
+        
+        DslReturnType PipelineInferIntervalHysteresisGet(const char* name, 
+            uint* updateInterval, uint* stepUpCount, uint* stepDownCount);
+        
+        DslReturnType PipelineInferIntervalHysteresisSet(const char* name, 
+            uint updateInterval, uint stepUpCount, uint stepDownCount);
+        
+        DslReturnType PipelineInferIntervalControllerEnabledGet(const char* name, 
+            boolean* enabled);
+        
+        DslReturnType PipelineInferIntervalControllerEnabledSet(const char* name, 
+            boolean enabled);
+        
+        DslReturnType PipelineInferIntervalLoadReport(const char* name, 
+            double fps, uint latency);
+        
+        DslReturnType PipelineInferIntervalMetricsGet(const char* name, 
+            dsl_infer_interval_metrics* metrics);
+        
+        DslReturnType PipelineInferIntervalMetricsClear(const char* name);
+        
+        DslReturnType PipelineInferIntervalChangeListenerAdd(const char* name, 
+            dsl_infer_interval_change_listener_cb listener, void* clientData);
+        
+        DslReturnType PipelineInferIntervalChangeListenerRemove(const char* name, 
+            dsl_infer_interval_change_listener_cb listener);
+        
         DslReturnType PipelineStateChangeListenerAdd(const char* name, 
             dsl_state_change_listener_cb listener, void* clientData);
         
@@ -1928,6 +2140,39 @@ namespace DSL {
 
         DslReturnType PipelineMainLoopDelete(const char* name);
 
+        DslReturnType PipelineTimeToFirstFrameGet(const char* name, 
+            double* timeToFirstFrame);
+
+        DslReturnType PipelineStartupProfileGet(const char* name, 
+            dsl_pipeline_startup_profile* profile, 
+            const dsl_pipeline_startup_event** events, uint* size);
+
+        DslReturnType PipelinePoolNew(const char* name, 
+            uint standbyState, boolean isLive);
+
+        DslReturnType PipelinePoolPipelineAdd(const char* name, 
+            const char* pipeline);
+
+        DslReturnType PipelinePoolDelete(const char* name);
+
+        DslReturnType PipelinePoolDeleteAll();
+
+        uint PipelinePoolListSize();
+
+        DslReturnType PipelinePoolAcquire(const char* name, 
+            const char** sources, const wchar_t** pipeline);
+
+        DslReturnType PipelinePoolRelease(const char* name, 
+            const char* pipeline);
+
+        DslReturnType PipelinePoolSizeGet(const char* name, 
+            uint* size, uint* available);
+
+        DslReturnType PipelinePoolMetricsGet(const char* name, 
+            dsl_pipeline_pool_metrics* metrics);
+
+        DslReturnType PipelinePoolMetricsClear(const char* name);
+
         DslReturnType PlayerNew(const char* name, const char* source, const char* sink);
 
         DslReturnType PlayerRenderVideoNew(const char* name, const char* filePath,
@@ -2097,6 +2342,9 @@ namespace DSL {
         
         DslReturnType InfoLogFunctionRestore();
         
+        DslReturnType InfoStalledSourcesGet(const dsl_stalled_source** sources,
+            uint* size);
+        
         FILE* InfoLogFileHandleGet();
 
         GMainLoop* GetMainLoopHandle()
@@ -2243,6 +2491,11 @@ namespace DSL {
          * @brief map of all pipelines creaated by the client, key=name
          */
         std::map <std::string, DSL_PIPELINE_PTR> m_pipelines;
+
+        /**
+         * @brief map of all pipeline pools created by the client, key=name
+         */
+        std::map <std::string, DSL_PIPELINE_POOL_PTR> m_pipelinePools;
         
         /**
          * @brief map of all players creaated by the client, key=name
@@ -527,6 +527,142 @@ namespace DSL
         }
     }
     
+    DslReturnType Services::ComponentQueueAutoSizeGet(const char* name, 
+        uint unit, uint64_t* minSize, uint64_t* maxSize)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_QBINTR(m_components, name);
+            
+            if (unit > DSL_COMPONENT_QUEUE_UNIT_OF_TIME)
+            {
+                LOG_ERROR("Invalid queue measurement unit = " << unit 
+                    << " for Component '"  << name << "'");
+                return DSL_RESULT_COMPONENT_GET_QUEUE_PROPERTY_FAILED;
+            }
+            DSL_QBINTR_PTR pQBintrComponent = 
+                std::dynamic_pointer_cast<QBintr>(m_components[name]);
+
+            pQBintrComponent->GetQueueAutoSize(unit, minSize, maxSize);
+
+            LOG_INFO("Component '" << name << "' returned queue auto-size min = " 
+                << *minSize << ", max = " << *maxSize << " for unit = " 
+                << unit << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Component '" << name 
+                << "' threw exception getting queue auto-size");
+            return DSL_RESULT_COMPONENT_THREW_EXCEPTION;
+        }
+    }
+    
+    DslReturnType Services::ComponentQueueAutoSizeSet(const char* name, 
+        uint unit, uint64_t minSize, uint64_t maxSize)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_QBINTR(m_components, name);
+            
+            if (unit > DSL_COMPONENT_QUEUE_UNIT_OF_TIME)
+            {
+                LOG_ERROR("Invalid queue measurement unit = " << unit 
+                    << " for Component '"  << name << "'");
+                return DSL_RESULT_COMPONENT_SET_QUEUE_PROPERTY_FAILED;
+            }
+            DSL_QBINTR_PTR pQBintrComponent = 
+                std::dynamic_pointer_cast<QBintr>(m_components[name]);
+
+            if (!pQBintrComponent->SetQueueAutoSize(unit, minSize, maxSize))
+            {
+                LOG_ERROR("Component '" << name 
+                    << "' failed to set queue auto-size min = " << minSize
+                    << ", max = " << maxSize);
+                return DSL_RESULT_COMPONENT_SET_QUEUE_PROPERTY_FAILED;
+            }
+
+            LOG_INFO("Component '" << name << "' set queue auto-size min = " 
+                << minSize << ", max = " << maxSize << " for unit = " 
+                << unit << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Component '" << name 
+                << "' threw exception setting queue auto-size");
+            return DSL_RESULT_COMPONENT_THREW_EXCEPTION;
+        }
+    }
+    
+    DslReturnType Services::ComponentQueueAutoLeakyEnabledGet(const char* name, 
+        boolean* enabled)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_QBINTR(m_components, name);
+            
+            DSL_QBINTR_PTR pQBintrComponent = 
+                std::dynamic_pointer_cast<QBintr>(m_components[name]);
+
+            *enabled = pQBintrComponent->GetQueueAutoLeakyEnabled();
+
+            LOG_INFO("Component '" << name << "' returned queue auto-leaky enabled = " 
+                << *enabled << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Component '" << name 
+                << "' threw exception getting queue auto-leaky enabled");
+            return DSL_RESULT_COMPONENT_THREW_EXCEPTION;
+        }
+    }
+    
+    DslReturnType Services::ComponentQueueAutoLeakyEnabledSet(const char* name, 
+        boolean enabled)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_QBINTR(m_components, name);
+            
+            DSL_QBINTR_PTR pQBintrComponent = 
+                std::dynamic_pointer_cast<QBintr>(m_components[name]);
+
+            pQBintrComponent->SetQueueAutoLeakyEnabled(enabled);
+
+            LOG_INFO("Component '" << name << "' set queue auto-leaky enabled = " 
+                << enabled << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Component '" << name 
+                << "' threw exception setting queue auto-leaky enabled");
+            return DSL_RESULT_COMPONENT_THREW_EXCEPTION;
+        }
+    }
+    
     DslReturnType Services::ComponentQueueOverrunListenerAdd(const char* name, 
         dsl_component_queue_overrun_listener_cb listener, void* clientData)
     {
@@ -771,4 +907,86 @@ DslReturnType Services::ComponentNvbufMemTypeGet(const char* name, uint* type)
             return DSL_RESULT_COMPONENT_THREW_EXCEPTION;
         }
     }
+    
+    DslReturnType Services::ComponentPropertyBatchSet(
+        const std::vector<PropertySetting>& settings, DslReturnType* results)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            PropertyBatch propertyBatch;
+            DslReturnType retval(DSL_RESULT_SUCCESS);
+            
+            // validate all settings before applying any. GST Element names
+            // are searched first.
+            for (uint i = 0; i < settings.size(); i++)
+            {
+                auto iterElement = m_gstElements.find(settings[i].name);
+                auto iterComponent = m_components.find(settings[i].name);
+                
+                if (iterElement != m_gstElements.end() and iterElement->second)
+                {
+                    results[i] = propertyBatch.AddElementSetting(
+                        iterElement->second, settings[i]);
+                }
+                else if (iterComponent != m_components.end() and 
+                    iterComponent->second)
+                {
+                    results[i] = propertyBatch.AddComponentSetting(
+                        iterComponent->second, settings[i]);
+                }
+                else
+                {
+                    LOG_ERROR("Component or GST Element name '" 
+                        << settings[i].name << "' was not found");
+                    results[i] = DSL_RESULT_COMPONENT_NAME_NOT_FOUND;
+                }
+                if (retval == DSL_RESULT_SUCCESS)
+                {
+                    retval = results[i];
+                }
+            }
+            if (retval != DSL_RESULT_SUCCESS)
+            {
+                for (uint i = 0; i < settings.size(); i++)
+                {
+                    if (results[i] == DSL_RESULT_SUCCESS)
+                    {
+                        results[i] = DSL_RESULT_COMPONENT_PROPERTY_NOT_APPLIED;
+                    }
+                }
+                LOG_ERROR("Property batch of " << settings.size() 
+                    << " settings failed validation - no settings applied");
+                return retval;
+            }
+            
+            uint failedIndex(0);
+            retval = propertyBatch.Apply(&failedIndex);
+            
+            if (retval != DSL_RESULT_SUCCESS)
+            {
+                for (uint i = 0; i < settings.size(); i++)
+                {
+                    results[i] = (i == failedIndex) 
+                        ? retval 
+                        : DSL_RESULT_COMPONENT_PROPERTY_NOT_APPLIED;
+                }
+                LOG_ERROR("Property batch of " << settings.size() 
+                    << " settings failed to apply - all settings restored");
+                return retval;
+            }
+
+            LOG_INFO("Property batch of " << settings.size() 
+                << " settings applied successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Services threw exception applying property batch");
+            return DSL_RESULT_COMPONENT_THREW_EXCEPTION;
+        }
+    }
 }
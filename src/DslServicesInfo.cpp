@@ -25,6 +25,7 @@ THE SOFTWARE.
 #include "Dsl.h"
 #include "DslApi.h"
 #include "DslServices.h"
+#include "DslStallWatchdog.h"
 
 namespace DSL
 {
@@ -353,6 +354,27 @@ namespace DSL
         }
     }
 
+    DslReturnType Services::InfoStalledSourcesGet(
+        const dsl_stalled_source** sources, uint* size)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            StallWatchdog::GetWatchdog()->GetStalled(sources, size);
+
+            LOG_INFO("Stall Watchdog returned " << *size 
+                << " stalled sources successfully");
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("DSL threw an exception getting stalled sources");
+            return DSL_RESULT_THREW_EXCEPTION;
+        }
+    }
+
     static void gst_debug_log_override(GstDebugCategory * category, GstDebugLevel level,
         const gchar * file, const gchar * function, gint line,
         GObject * object, GstDebugMessage * message, gpointer unused)
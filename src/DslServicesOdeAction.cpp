@@ -299,6 +299,132 @@ namespace DSL
         }
     }
 
+    DslReturnType Services::OdeActionCaptureObjectBestShotGet(const char* name,
+        boolean* enabled, uint* timeout, uint* maxHold, boolean* sharpness)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+    
+        try
+        {
+            DSL_RETURN_IF_ODE_ACTION_NAME_NOT_FOUND(m_odeActions, name);
+            DSL_RETURN_IF_ODE_ACTION_IS_NOT_CORRECT_TYPE(m_odeActions, name, 
+                CaptureObjectOdeAction);
+
+            DSL_ODE_ACTION_CAPTURE_OBJECT_PTR pOdeAction = 
+                std::dynamic_pointer_cast<CaptureObjectOdeAction>(m_odeActions[name]);
+
+            bool bEnabled(false), bSharpness(false);
+            pOdeAction->GetBestShotSettings(&bEnabled, timeout, maxHold, &bSharpness);
+            *enabled = bEnabled;
+            *sharpness = bSharpness;
+            
+            LOG_INFO("ODE Capture Object Action '" << name 
+                << "' returned best-shot settings successfully");
+                
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Capture Object Action '" << name 
+                << "' threw an exception getting best-shot settings");
+            return DSL_RESULT_ODE_ACTION_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::OdeActionCaptureObjectBestShotSet(const char* name,
+        boolean enabled, uint timeout, uint maxHold, boolean sharpness)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+    
+        try
+        {
+            DSL_RETURN_IF_ODE_ACTION_NAME_NOT_FOUND(m_odeActions, name);
+            DSL_RETURN_IF_ODE_ACTION_IS_NOT_CORRECT_TYPE(m_odeActions, name, 
+                CaptureObjectOdeAction);
+
+            if (enabled and !timeout)
+            {
+                LOG_ERROR("Invalid best-shot timeout = 0 for ODE Capture Object Action '" 
+                    << name << "'");
+                return DSL_RESULT_ODE_ACTION_PARAMETER_INVALID;
+            }
+            DSL_ODE_ACTION_CAPTURE_OBJECT_PTR pOdeAction = 
+                std::dynamic_pointer_cast<CaptureObjectOdeAction>(m_odeActions[name]);
+
+            pOdeAction->SetBestShotSettings(enabled, timeout, maxHold, sharpness);
+            
+            LOG_INFO("ODE Capture Object Action '" << name 
+                << "' set best-shot settings successfully");
+                
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Capture Object Action '" << name 
+                << "' threw an exception setting best-shot settings");
+            return DSL_RESULT_ODE_ACTION_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::OdeActionCaptureMetricsGet(const char* name,
+        dsl_ode_action_capture_metrics* metrics)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+    
+        try
+        {
+            DSL_RETURN_IF_ODE_ACTION_NAME_NOT_FOUND(m_odeActions, name);
+            DSL_RETURN_IF_ODE_ACTION_IS_NOT_CAPTURE_TYPE(m_odeActions, name);   
+
+            DSL_ODE_ACTION_CATPURE_PTR pOdeAction = 
+                std::dynamic_pointer_cast<CaptureOdeAction>(m_odeActions[name]);
+
+            pOdeAction->GetCaptureMetrics(metrics);
+            
+            LOG_INFO("ODE Capture Action '" << name 
+                << "' returned capture metrics successfully");
+                
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Capture Action '" << name 
+                << "' threw an exception getting capture metrics");
+            return DSL_RESULT_ODE_ACTION_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::OdeActionCaptureMetricsClear(const char* name)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+    
+        try
+        {
+            DSL_RETURN_IF_ODE_ACTION_NAME_NOT_FOUND(m_odeActions, name);
+            DSL_RETURN_IF_ODE_ACTION_IS_NOT_CAPTURE_TYPE(m_odeActions, name);   
+
+            DSL_ODE_ACTION_CATPURE_PTR pOdeAction = 
+                std::dynamic_pointer_cast<CaptureOdeAction>(m_odeActions[name]);
+
+            pOdeAction->ClearCaptureMetrics();
+            
+            LOG_INFO("ODE Capture Action '" << name 
+                << "' cleared capture metrics successfully");
+                
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Capture Action '" << name 
+                << "' threw an exception clearing capture metrics");
+            return DSL_RESULT_ODE_ACTION_THREW_EXCEPTION;
+        }
+    }
+
     DslReturnType Services::OdeActionCustomNew(const char* name,
         dsl_ode_handle_occurrence_cb clientHandler, void* clientData)
     {
@@ -2259,6 +2385,73 @@ namespace DSL
         }
     }
 
+    DslReturnType Services::OdeActionAsyncMetricsGet(const char* name,
+        dsl_ode_action_async_metrics* metrics)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_ODE_ACTION_NAME_NOT_FOUND(m_odeActions, name);
+            
+            DSL_ODE_ACTION_ASYNC_PTR pOdeAction = 
+                std::dynamic_pointer_cast<AsyncOdeAction>(m_odeActions[name]);
+            
+            if (!pOdeAction)
+            {
+                LOG_ERROR("ODE Action '" << name 
+                    << "' is not an asynchronous ODE Action");
+                return DSL_RESULT_ODE_ACTION_NOT_THE_CORRECT_TYPE;
+            }
+            pOdeAction->GetAsyncMetrics(metrics);
+
+            LOG_INFO("ODE Action '" << name 
+                << "' returned async metrics successfully");
+            
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Action '" << name 
+                << "' threw exception getting async metrics");
+            return DSL_RESULT_ODE_ACTION_THREW_EXCEPTION;
+        }
+    }                
+
+    DslReturnType Services::OdeActionAsyncMetricsClear(const char* name)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_ODE_ACTION_NAME_NOT_FOUND(m_odeActions, name);
+            
+            DSL_ODE_ACTION_ASYNC_PTR pOdeAction = 
+                std::dynamic_pointer_cast<AsyncOdeAction>(m_odeActions[name]);
+            
+            if (!pOdeAction)
+            {
+                LOG_ERROR("ODE Action '" << name 
+                    << "' is not an asynchronous ODE Action");
+                return DSL_RESULT_ODE_ACTION_NOT_THE_CORRECT_TYPE;
+            }
+            pOdeAction->ClearAsyncMetrics();
+
+            LOG_INFO("ODE Action '" << name 
+                << "' cleared async metrics successfully");
+            
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Action '" << name 
+                << "' threw exception clearing async metrics");
+            return DSL_RESULT_ODE_ACTION_THREW_EXCEPTION;
+        }
+    }                
+
     DslReturnType Services::OdeActionDelete(const char* name)
     {
         LOG_FUNC();
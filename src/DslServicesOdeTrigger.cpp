@@ -306,6 +306,38 @@ namespace DSL
         }
     }
 
+    DslReturnType Services::OdeTriggerCustomBatchNew(const char* name, 
+        const char* source, uint classId, uint limit,  
+        dsl_ode_check_for_occurrence_batch_cb client_checker, void* client_data)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            // ensure event name uniqueness 
+            if (m_odeTriggers.find(name) != m_odeTriggers.end())
+            {   
+                LOG_ERROR("ODE Trigger name '" << name << "' is not unique");
+                return DSL_RESULT_ODE_TRIGGER_NAME_NOT_UNIQUE;
+            }
+            
+            m_odeTriggers[name] = DSL_ODE_TRIGGER_CUSTOM_BATCH_NEW(name, source,
+                classId, limit, client_checker, client_data);
+            
+            LOG_INFO("New Custom Batch ODE Trigger '" << name 
+                << "' created successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("New Custom Batch ODE Trigger '" << name 
+                << "' threw exception on create");
+            return DSL_RESULT_ODE_TRIGGER_THREW_EXCEPTION;
+        }
+    }
+
     DslReturnType Services::OdeTriggerCountNew(const char* name, const char* source, 
         uint classId, uint limit, uint minimum, uint maximum)
     {
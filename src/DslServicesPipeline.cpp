@@ -64,6 +64,16 @@ namespace DSL
             
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
 
+            for (auto const& imap: m_pipelinePools)
+            {
+                if (imap.second->IsMember(name))
+                {
+                    LOG_ERROR("Unable to delete Pipeline '" << name 
+                        << "' as it's in use by Pipeline Pool '" 
+                        << imap.first << "'");
+                    return DSL_RESULT_PIPELINE_POOL_IN_USE;
+                }
+            }
             m_pipelines[name]->RemoveAllChildren();
             m_pipelines.erase(name);
 
@@ -86,6 +96,10 @@ namespace DSL
 
         try
         {
+            // All Pipeline Pools must be deleted first to take their 
+            // Pipelines out of standby.
+            m_pipelinePools.clear();
+            
             for (auto &imap: m_pipelines)
             {
                 imap.second->RemoveAllChildren();
@@ -1156,8 +1170,8 @@ namespace DSL
         return DSL_RESULT_SUCCESS;
     }
 
-    DslReturnType Services::PipelineStateChangeListenerAdd(const char* name, 
-        dsl_state_change_listener_cb listener, void* clientData)
+    DslReturnType Services::PipelineQueueSamplerSettingsGet(const char* name, 
+        uint* interval, uint* windowSize)
     {
         LOG_FUNC();
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
@@ -1165,57 +1179,81 @@ namespace DSL
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+
+            m_pipelines[name]->GetQueueSampler()->GetSettings(interval, windowSize);
+
+            LOG_INFO("Pipeline '" << name << "' returned Queue Sampler interval = " 
+                << *interval << "ms and window-size = " << *windowSize 
+                << " successfully");
             
-            if (!m_pipelines[name]->AddStateChangeListener(listener, clientData))
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception getting Queue Sampler settings");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PipelineQueueSamplerSettingsSet(const char* name, 
+        uint interval, uint windowSize)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+
+            if (!m_pipelines[name]->GetQueueSampler()->SetSettings(interval, 
+                windowSize))
             {
                 LOG_ERROR("Pipeline '" << name 
-                    << "' failed to add a State Change Listener");
-                return DSL_RESULT_PIPELINE_CALLBACK_ADD_FAILED;
+                    << "' failed to set Queue Sampler settings");
+                return DSL_RESULT_PIPELINE_SET_FAILED;
             }
-            LOG_INFO("Pipeline '" << name 
-                << "' added State Change Listener successfully");
+            LOG_INFO("Pipeline '" << name << "' set Queue Sampler interval = " 
+                << interval << "ms and window-size = " << windowSize 
+                << " successfully");
             
             return DSL_RESULT_SUCCESS;
         }
         catch(...)
         {
             LOG_ERROR("Pipeline '" << name 
-                << "' threw an exception adding a State Change Lister");
+                << "' threw an exception setting Queue Sampler settings");
             return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
         }
     }
-        
-    DslReturnType Services::PipelineStateChangeListenerRemove(const char* name, 
-        dsl_state_change_listener_cb listener)
+
+    DslReturnType Services::PipelineQueueSamplerEnabledGet(const char* name, 
+        boolean* enabled)
     {
         LOG_FUNC();
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
-    
+
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
-            
-            if (!m_pipelines[name]->RemoveStateChangeListener(listener))
-            {
-                LOG_ERROR("Pipeline '" << name 
-                    << "' failed to remove a State Change Listener");
-                return DSL_RESULT_PIPELINE_CALLBACK_REMOVE_FAILED;
-            }
-            LOG_INFO("Pipeline '" << name 
-                << "' removed State Change Listener successfully");
 
+            *enabled = m_pipelines[name]->GetQueueSampler()->GetEnabled();
+
+            LOG_INFO("Pipeline '" << name << "' returned Queue Sampler enabled = " 
+                << *enabled << " successfully");
+            
             return DSL_RESULT_SUCCESS;
         }
         catch(...)
         {
             LOG_ERROR("Pipeline '" << name 
-                << "' threw an exception removing a State Change Lister");
+                << "' threw an exception getting Queue Sampler enabled");
             return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
         }
     }
-    
-    DslReturnType Services::PipelineEosListenerAdd(const char* name, 
-        dsl_eos_listener_cb listener, void* clientData)
+
+    DslReturnType Services::PipelineQueueSamplerEnabledSet(const char* name, 
+        boolean enabled)
     {
         LOG_FUNC();
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
@@ -1223,57 +1261,52 @@ namespace DSL
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
-            
-            if (!m_pipelines[name]->AddEosListener(listener, clientData))
+
+            if (!m_pipelines[name]->GetQueueSampler()->SetEnabled(enabled))
             {
                 LOG_ERROR("Pipeline '" << name 
-                    << "' failed to add an EOS Listener");
-                return DSL_RESULT_PIPELINE_CALLBACK_ADD_FAILED;
+                    << "' failed to set Queue Sampler enabled = " << enabled);
+                return DSL_RESULT_PIPELINE_SET_FAILED;
             }
-            LOG_INFO("Pipeline '" << name 
-                << "' added End of Stream Listener successfully");
-
+            LOG_INFO("Pipeline '" << name << "' set Queue Sampler enabled = " 
+                << enabled << " successfully");
+            
             return DSL_RESULT_SUCCESS;
         }
         catch(...)
         {
             LOG_ERROR("Pipeline '" << name 
-                << "' threw an exception adding an EOS Lister");
+                << "' threw an exception setting Queue Sampler enabled");
             return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
         }
     }
-        
-    DslReturnType Services::PipelineEosListenerRemove(const char* name, 
-        dsl_eos_listener_cb listener)
+
+    DslReturnType Services::PipelineQueueTelemetryGet(const char* name, 
+        const dsl_queue_telemetry** telemetry, uint* size)
     {
         LOG_FUNC();
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
-    
+
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
-            
-            if (!m_pipelines[name]->RemoveEosListener(listener))
-            {
-                LOG_ERROR("Pipeline '" << name 
-                    << "' failed to remove an EOS Listener");
-                return DSL_RESULT_PIPELINE_CALLBACK_REMOVE_FAILED;
-            }
-            LOG_INFO("Pipeline '" << name 
-                << "' removed End of Stream Listener successfully");
 
+            m_pipelines[name]->GetQueueSampler()->GetTelemetry(telemetry, size);
+
+            LOG_INFO("Pipeline '" << name << "' returned queue telemetry for " 
+                << *size << " Components successfully");
+            
             return DSL_RESULT_SUCCESS;
         }
         catch(...)
         {
             LOG_ERROR("Pipeline '" << name 
-                << "' threw an exception removing an EOS Listener");
+                << "' threw an exception getting queue telemetry");
             return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
         }
     }
-    
-    DslReturnType Services::PipelineErrorMessageHandlerAdd(const char* name, 
-        dsl_error_message_handler_cb handler, void* clientData)
+
+    DslReturnType Services::PipelineQueueTelemetryClear(const char* name)
     {
         LOG_FUNC();
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
@@ -1281,79 +1314,126 @@ namespace DSL
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
-            
-            if (!m_pipelines[name]->AddErrorMessageHandler(handler, clientData))
-            {
-                LOG_ERROR("Pipeline '" << name 
-                    << "' failed to add an Error Message Handler");
-                return DSL_RESULT_PIPELINE_CALLBACK_ADD_FAILED;
-            }
-            LOG_INFO("Pipeline '" << name 
-                << "' added Error Message Handler successfully");
 
+            m_pipelines[name]->GetQueueSampler()->ClearTelemetry();
+
+            LOG_INFO("Pipeline '" << name 
+                << "' cleared queue telemetry successfully");
+            
             return DSL_RESULT_SUCCESS;
         }
         catch(...)
         {
             LOG_ERROR("Pipeline '" << name 
-                << "' threw an exception adding an Error Message Handler");
+                << "' threw an exception clearing queue telemetry");
             return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
         }
     }
-        
-    DslReturnType Services::PipelineErrorMessageHandlerRemove(const char* name, 
-        dsl_error_message_handler_cb handler)
+
+    DslReturnType Services::PipelineQueueBottleneckGet(const char* name, 
+        const wchar_t** component)
     {
         LOG_FUNC();
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
-    
+
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
 
-            if (!m_pipelines[name]->RemoveErrorMessageHandler(handler))
-            {
-                LOG_ERROR("Pipeline '" << name 
-                    << "' failed to remove an Error Message Handler");
-                return DSL_RESULT_PIPELINE_CALLBACK_REMOVE_FAILED;
-            }
-            LOG_INFO("Pipeline '" << name 
-                << "' added a Error Message Handler successfully");
+            *component = m_pipelines[name]->GetQueueSampler()->GetBottleneck();
 
+            LOG_INFO("Pipeline '" << name 
+                << "' returned queue bottleneck successfully");
+            
             return DSL_RESULT_SUCCESS;
         }
         catch(...)
         {
             LOG_ERROR("Pipeline '" << name 
-                << "' threw an exception removing an Error Message Handler");
+                << "' threw an exception getting queue bottleneck");
             return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
         }
     }
 
-    DslReturnType Services::PipelineErrorMessageLastGet(const char* name,
-        std::wstring& source, std::wstring& message)
+    bool Services::PipelineQueueSamplerQBintrsGet(Base* pPipeline, 
+        std::map<std::string, DSL_QBINTR_PTR>& qbintrs)
+    {
+        LOG_FUNC();
+        
+        // Called from the main-loop by the Queue Sampler. A Services call in 
+        // progress may be waiting on the main-loop, so never block here.
+        if (!g_mutex_trylock(&m_servicesMutex))
+        {
+            return false;
+        }
+        try
+        {
+            QueueSampler::CollectQBintrs(pPipeline, qbintrs);
+        }
+        catch(...)
+        {
+            LOG_ERROR("Queue Sampler threw an exception collecting QBintrs");
+            qbintrs.clear();
+        }
+        g_mutex_unlock(&m_servicesMutex);
+        
+        return true;
+    }
+
+    bool Services::PipelineInferIntervalApply(Base* pPipeline, uint interval)
+    {
+        LOG_FUNC();
+        
+        // Called from the main-loop by the Infer Interval Controller. A 
+        // Services call in progress may be waiting on the main-loop, so never
+        // block here.
+        if (!g_mutex_trylock(&m_servicesMutex))
+        {
+            return false;
+        }
+        try
+        {
+            InferIntervalController::ApplyInterval(pPipeline, interval);
+        }
+        catch(...)
+        {
+            LOG_ERROR("Infer Interval Controller threw an exception applying interval");
+        }
+        g_mutex_unlock(&m_servicesMutex);
+        
+        return true;
+    }
+
+    DslReturnType Services::PipelineInferIntervalBoundsGet(const char* name, 
+        uint* minInterval, uint* maxInterval)
     {
         LOG_FUNC();
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
-    
+
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
-            
-            m_pipelines[name]->GetLastErrorMessage(source, message);
+
+            m_pipelines[name]->GetInferIntervalController()->GetBounds(
+                minInterval, maxInterval);
+
+            LOG_INFO("Pipeline '" << name 
+                << "' returned Infer Interval Controller min-interval = " 
+                << *minInterval << " and max-interval = " << *maxInterval 
+                << " successfully");
             
             return DSL_RESULT_SUCCESS;
         }
         catch(...)
         {
             LOG_ERROR("Pipeline '" << name 
-                << "' threw an exception removing an Error Message Handler");
+                << "' threw an exception getting Infer Interval Controller bounds");
             return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
         }
     }
-    
-    DslReturnType Services::PipelineBufferingMessageHandlerAdd(const char* name, 
-        dsl_buffering_message_handler_cb handler, void* clientData)
+
+    DslReturnType Services::PipelineInferIntervalBoundsSet(const char* name, 
+        uint minInterval, uint maxInterval)
     {
         LOG_FUNC();
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
@@ -1361,167 +1441,1048 @@ namespace DSL
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
-            
-            if (!m_pipelines[name]->AddBufferingMessageHandler(handler, clientData))
+
+            if (!m_pipelines[name]->GetInferIntervalController()->SetBounds(
+                minInterval, maxInterval))
             {
                 LOG_ERROR("Pipeline '" << name 
-                    << "' failed to add a Buffering Message Handler");
-                return DSL_RESULT_PIPELINE_CALLBACK_ADD_FAILED;
+                    << "' failed to set Infer Interval Controller bounds");
+                return DSL_RESULT_PIPELINE_SET_FAILED;
             }
             LOG_INFO("Pipeline '" << name 
-                << "' added Buffering Message Handler successfully");
-
+                << "' set Infer Interval Controller min-interval = " 
+                << minInterval << " and max-interval = " << maxInterval 
+                << " successfully");
+            
             return DSL_RESULT_SUCCESS;
         }
         catch(...)
         {
             LOG_ERROR("Pipeline '" << name 
-                << "' threw an exception adding an Buffering Message Handler");
+                << "' threw an exception setting Infer Interval Controller bounds");
             return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
         }
     }
-        
-    DslReturnType Services::PipelineBufferingMessageHandlerRemove(const char* name, 
-        dsl_buffering_message_handler_cb handler)
+
+    DslReturnType Services::PipelineInferIntervalThresholdsGet(const char* name, 
+        uint* lowOccupancy, uint* highOccupancy, uint* maxLatency, uint* minFps)
     {
         LOG_FUNC();
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
-    
+
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
 
-            if (!m_pipelines[name]->RemoveBufferingMessageHandler(handler))
-            {
-                LOG_ERROR("Pipeline '" << name 
-                    << "' failed to remove a Buffering Message Handler");
-                return DSL_RESULT_PIPELINE_CALLBACK_REMOVE_FAILED;
-            }
-            LOG_INFO("Pipeline '" << name 
-                << "' added a Buffering Message Handler successfully");
+            m_pipelines[name]->GetInferIntervalController()->GetThresholds(
+                lowOccupancy, highOccupancy, maxLatency, minFps);
 
+            LOG_INFO("Pipeline '" << name 
+                << "' returned Infer Interval Controller low-occupancy = " 
+                << *lowOccupancy << "%, high-occupancy = " << *highOccupancy 
+                << "%, max-latency = " << *maxLatency << "ms, and min-fps = "
+                << *minFps << " successfully");
+            
             return DSL_RESULT_SUCCESS;
         }
         catch(...)
         {
             LOG_ERROR("Pipeline '" << name 
-                << "' threw an exception removing an Buffering Message Handler");
+                << "' threw an exception getting Infer Interval Controller thresholds");
             return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
         }
     }
 
-    DslReturnType Services::PipelineMainLoopNew(const char* name)
+    DslReturnType Services::PipelineInferIntervalThresholdsSet(const char* name, 
+        uint lowOccupancy, uint highOccupancy, uint maxLatency, uint minFps)
     {
         LOG_FUNC();
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
-        
+
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
 
-            if (!m_pipelines[name]->NewMainLoop())
+            if (!m_pipelines[name]->GetInferIntervalController()->SetThresholds(
+                lowOccupancy, highOccupancy, maxLatency, minFps))
             {
                 LOG_ERROR("Pipeline '" << name 
-                    << "' failed to create a new Main-Loop");
-                return DSL_RESULT_PIPELINE_MAIN_LOOP_REQUEST_FAILED;
+                    << "' failed to set Infer Interval Controller thresholds");
+                return DSL_RESULT_PIPELINE_SET_FAILED;
             }
             LOG_INFO("Pipeline '" << name 
-                << "' created its own Main-Loop successfully");
-
+                << "' set Infer Interval Controller low-occupancy = " 
+                << lowOccupancy << "%, high-occupancy = " << highOccupancy 
+                << "%, max-latency = " << maxLatency << "ms, and min-fps = "
+                << minFps << " successfully");
+            
             return DSL_RESULT_SUCCESS;
         }
         catch(...)
         {
             LOG_ERROR("Pipeline '" << name 
-                << "' threw an exception creating Main-Loop");
+                << "' threw an exception setting Infer Interval Controller thresholds");
             return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
         }
     }
-    
-    DslReturnType Services::PipelineMainLoopRun(const char* name)
+
+    DslReturnType Services::PipelineInferIntervalHysteresisGet(const char* name, 
+        uint* updateInterval, uint* stepUpCount, uint* stepDownCount)
     {
         LOG_FUNC();
-        
-        // Note: do not lock mutex - blocking call
-        
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
 
-            if (!m_pipelines[name]->RunMainLoop())
-            {
-                LOG_ERROR("Pipeline '" << name 
-                    << "' failed to run its own Main-Loop");
-                return DSL_RESULT_PIPELINE_MAIN_LOOP_REQUEST_FAILED;
-            }
-            LOG_INFO("Pipeline '" << name 
-                << "' returned from running its own Main-Loop successfully");
+            m_pipelines[name]->GetInferIntervalController()->GetHysteresis(
+                updateInterval, stepUpCount, stepDownCount);
 
+            LOG_INFO("Pipeline '" << name 
+                << "' returned Infer Interval Controller update-interval = " 
+                << *updateInterval << "ms, step-up-count = " << *stepUpCount 
+                << ", and step-down-count = " << *stepDownCount << " successfully");
+            
             return DSL_RESULT_SUCCESS;
         }
         catch(...)
         {
             LOG_ERROR("Pipeline '" << name 
-                << "' threw an exception running its own Main-Loop");
+                << "' threw an exception getting Infer Interval Controller hysteresis");
             return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
         }
     }
 
-    DslReturnType Services::PipelineMainLoopQuit(const char* name)
+    DslReturnType Services::PipelineInferIntervalHysteresisSet(const char* name, 
+        uint updateInterval, uint stepUpCount, uint stepDownCount)
     {
         LOG_FUNC();
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
-        
+
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
 
-            if (!m_pipelines[name]->QuitMainLoop())
+            if (!m_pipelines[name]->GetInferIntervalController()->SetHysteresis(
+                updateInterval, stepUpCount, stepDownCount))
             {
                 LOG_ERROR("Pipeline '" << name 
-                    << "' failed to quit running its own Main-Loop");
-                return DSL_RESULT_PIPELINE_MAIN_LOOP_REQUEST_FAILED;
+                    << "' failed to set Infer Interval Controller hysteresis");
+                return DSL_RESULT_PIPELINE_SET_FAILED;
             }
             LOG_INFO("Pipeline '" << name 
-                << "' quit running its own Main-Loop successfully");
-
+                << "' set Infer Interval Controller update-interval = " 
+                << updateInterval << "ms, step-up-count = " << stepUpCount 
+                << ", and step-down-count = " << stepDownCount << " successfully");
+            
             return DSL_RESULT_SUCCESS;
         }
         catch(...)
         {
             LOG_ERROR("Pipeline '" << name 
-                << "' threw an exception quiting its own Main-Loop");
+                << "' threw an exception setting Infer Interval Controller hysteresis");
             return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
         }
     }
 
+    DslReturnType Services::PipelineInferIntervalControllerEnabledGet(
+        const char* name, boolean* enabled)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
 
-    DslReturnType Services::PipelineMainLoopDelete(const char* name)
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+
+            *enabled = m_pipelines[name]->GetInferIntervalController()->GetEnabled();
+
+            LOG_INFO("Pipeline '" << name 
+                << "' returned Infer Interval Controller enabled = " 
+                << *enabled << " successfully");
+            
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception getting Infer Interval Controller enabled");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PipelineInferIntervalControllerEnabledSet(
+        const char* name, boolean enabled)
     {
         LOG_FUNC();
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
-        
+
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
 
-            if (!m_pipelines[name]->DeleteMainLoop())
+            if (!m_pipelines[name]->GetInferIntervalController()->SetEnabled(
+                enabled))
             {
                 LOG_ERROR("Pipeline '" << name 
-                    << "' failed to delete its own Main-Loop");
-                return DSL_RESULT_PIPELINE_MAIN_LOOP_REQUEST_FAILED;
+                    << "' failed to set Infer Interval Controller enabled = " 
+                    << enabled);
+                return DSL_RESULT_PIPELINE_SET_FAILED;
             }
             LOG_INFO("Pipeline '" << name 
-                << "' deleted its own Main-Loop successfully");
-
+                << "' set Infer Interval Controller enabled = " 
+                << enabled << " successfully");
+            
             return DSL_RESULT_SUCCESS;
         }
         catch(...)
         {
             LOG_ERROR("Pipeline '" << name 
-                << "' threw an exception deleting its own Main-Loop");
+                << "' threw an exception setting Infer Interval Controller enabled");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PipelineInferIntervalLoadReport(const char* name, 
+        double fps, uint latency)
+    {
+        // Don't log function entry/exit - called on every client measurement
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+
+            m_pipelines[name]->GetInferIntervalController()->ReportLoad(
+                fps, latency);
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception reporting Infer Interval Controller load");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PipelineInferIntervalMetricsGet(const char* name, 
+        dsl_infer_interval_metrics* metrics)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+
+            m_pipelines[name]->GetInferIntervalController()->GetMetrics(metrics);
+
+            LOG_INFO("Pipeline '" << name 
+                << "' returned Infer Interval Controller metrics successfully");
+            
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception getting Infer Interval Controller metrics");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PipelineInferIntervalMetricsClear(const char* name)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+
+            m_pipelines[name]->GetInferIntervalController()->ClearMetrics();
+
+            LOG_INFO("Pipeline '" << name 
+                << "' cleared Infer Interval Controller metrics successfully");
+            
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception clearing Infer Interval Controller metrics");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PipelineInferIntervalChangeListenerAdd(
+        const char* name, dsl_infer_interval_change_listener_cb listener, 
+        void* clientData)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+            
+            if (!m_pipelines[name]->GetInferIntervalController()->
+                AddChangeListener(listener, clientData))
+            {
+                LOG_ERROR("Pipeline '" << name 
+                    << "' failed to add an Infer Interval Change Listener");
+                return DSL_RESULT_PIPELINE_CALLBACK_ADD_FAILED;
+            }
+            LOG_INFO("Pipeline '" << name 
+                << "' added Infer Interval Change Listener successfully");
+            
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception adding an Infer Interval Change Listener");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+        
+    DslReturnType Services::PipelineInferIntervalChangeListenerRemove(
+        const char* name, dsl_infer_interval_change_listener_cb listener)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+            
+            if (!m_pipelines[name]->GetInferIntervalController()->
+                RemoveChangeListener(listener))
+            {
+                LOG_ERROR("Pipeline '" << name 
+                    << "' failed to remove an Infer Interval Change Listener");
+                return DSL_RESULT_PIPELINE_CALLBACK_REMOVE_FAILED;
+            }
+            LOG_INFO("Pipeline '" << name 
+                << "' removed Infer Interval Change Listener successfully");
+            
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception removing an Infer Interval Change Listener");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PipelineStateChangeListenerAdd(const char* name, 
+        dsl_state_change_listener_cb listener, void* clientData)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+            
+            if (!m_pipelines[name]->AddStateChangeListener(listener, clientData))
+            {
+                LOG_ERROR("Pipeline '" << name 
+                    << "' failed to add a State Change Listener");
+                return DSL_RESULT_PIPELINE_CALLBACK_ADD_FAILED;
+            }
+            LOG_INFO("Pipeline '" << name 
+                << "' added State Change Listener successfully");
+            
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception adding a State Change Lister");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+        
+    DslReturnType Services::PipelineStateChangeListenerRemove(const char* name, 
+        dsl_state_change_listener_cb listener)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+    
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+            
+            if (!m_pipelines[name]->RemoveStateChangeListener(listener))
+            {
+                LOG_ERROR("Pipeline '" << name 
+                    << "' failed to remove a State Change Listener");
+                return DSL_RESULT_PIPELINE_CALLBACK_REMOVE_FAILED;
+            }
+            LOG_INFO("Pipeline '" << name 
+                << "' removed State Change Listener successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception removing a State Change Lister");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+    
+    DslReturnType Services::PipelineEosListenerAdd(const char* name, 
+        dsl_eos_listener_cb listener, void* clientData)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+            
+            if (!m_pipelines[name]->AddEosListener(listener, clientData))
+            {
+                LOG_ERROR("Pipeline '" << name 
+                    << "' failed to add an EOS Listener");
+                return DSL_RESULT_PIPELINE_CALLBACK_ADD_FAILED;
+            }
+            LOG_INFO("Pipeline '" << name 
+                << "' added End of Stream Listener successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception adding an EOS Lister");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+        
+    DslReturnType Services::PipelineEosListenerRemove(const char* name, 
+        dsl_eos_listener_cb listener)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+    
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+            
+            if (!m_pipelines[name]->RemoveEosListener(listener))
+            {
+                LOG_ERROR("Pipeline '" << name 
+                    << "' failed to remove an EOS Listener");
+                return DSL_RESULT_PIPELINE_CALLBACK_REMOVE_FAILED;
+            }
+            LOG_INFO("Pipeline '" << name 
+                << "' removed End of Stream Listener successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception removing an EOS Listener");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+    
+    DslReturnType Services::PipelineErrorMessageHandlerAdd(const char* name, 
+        dsl_error_message_handler_cb handler, void* clientData)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+            
+            if (!m_pipelines[name]->AddErrorMessageHandler(handler, clientData))
+            {
+                LOG_ERROR("Pipeline '" << name 
+                    << "' failed to add an Error Message Handler");
+                return DSL_RESULT_PIPELINE_CALLBACK_ADD_FAILED;
+            }
+            LOG_INFO("Pipeline '" << name 
+                << "' added Error Message Handler successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception adding an Error Message Handler");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+        
+    DslReturnType Services::PipelineErrorMessageHandlerRemove(const char* name, 
+        dsl_error_message_handler_cb handler)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+    
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+
+            if (!m_pipelines[name]->RemoveErrorMessageHandler(handler))
+            {
+                LOG_ERROR("Pipeline '" << name 
+                    << "' failed to remove an Error Message Handler");
+                return DSL_RESULT_PIPELINE_CALLBACK_REMOVE_FAILED;
+            }
+            LOG_INFO("Pipeline '" << name 
+                << "' added a Error Message Handler successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception removing an Error Message Handler");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PipelineErrorMessageLastGet(const char* name,
+        std::wstring& source, std::wstring& message)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+    
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+            
+            m_pipelines[name]->GetLastErrorMessage(source, message);
+            
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception removing an Error Message Handler");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+    
+    DslReturnType Services::PipelineBufferingMessageHandlerAdd(const char* name, 
+        dsl_buffering_message_handler_cb handler, void* clientData)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+            
+            if (!m_pipelines[name]->AddBufferingMessageHandler(handler, clientData))
+            {
+                LOG_ERROR("Pipeline '" << name 
+                    << "' failed to add a Buffering Message Handler");
+                return DSL_RESULT_PIPELINE_CALLBACK_ADD_FAILED;
+            }
+            LOG_INFO("Pipeline '" << name 
+                << "' added Buffering Message Handler successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception adding an Buffering Message Handler");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+        
+    DslReturnType Services::PipelineBufferingMessageHandlerRemove(const char* name, 
+        dsl_buffering_message_handler_cb handler)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+    
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+
+            if (!m_pipelines[name]->RemoveBufferingMessageHandler(handler))
+            {
+                LOG_ERROR("Pipeline '" << name 
+                    << "' failed to remove a Buffering Message Handler");
+                return DSL_RESULT_PIPELINE_CALLBACK_REMOVE_FAILED;
+            }
+            LOG_INFO("Pipeline '" << name 
+                << "' added a Buffering Message Handler successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception removing an Buffering Message Handler");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PipelineMainLoopNew(const char* name)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+
+            if (!m_pipelines[name]->NewMainLoop())
+            {
+                LOG_ERROR("Pipeline '" << name 
+                    << "' failed to create a new Main-Loop");
+                return DSL_RESULT_PIPELINE_MAIN_LOOP_REQUEST_FAILED;
+            }
+            LOG_INFO("Pipeline '" << name 
+                << "' created its own Main-Loop successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception creating Main-Loop");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+    
+    DslReturnType Services::PipelineMainLoopRun(const char* name)
+    {
+        LOG_FUNC();
+        
+        // Note: do not lock mutex - blocking call
+        
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+
+            if (!m_pipelines[name]->RunMainLoop())
+            {
+                LOG_ERROR("Pipeline '" << name 
+                    << "' failed to run its own Main-Loop");
+                return DSL_RESULT_PIPELINE_MAIN_LOOP_REQUEST_FAILED;
+            }
+            LOG_INFO("Pipeline '" << name 
+                << "' returned from running its own Main-Loop successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception running its own Main-Loop");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PipelineMainLoopQuit(const char* name)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+
+            if (!m_pipelines[name]->QuitMainLoop())
+            {
+                LOG_ERROR("Pipeline '" << name 
+                    << "' failed to quit running its own Main-Loop");
+                return DSL_RESULT_PIPELINE_MAIN_LOOP_REQUEST_FAILED;
+            }
+            LOG_INFO("Pipeline '" << name 
+                << "' quit running its own Main-Loop successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception quiting its own Main-Loop");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+
+
+    DslReturnType Services::PipelineMainLoopDelete(const char* name)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+
+            if (!m_pipelines[name]->DeleteMainLoop())
+            {
+                LOG_ERROR("Pipeline '" << name 
+                    << "' failed to delete its own Main-Loop");
+                return DSL_RESULT_PIPELINE_MAIN_LOOP_REQUEST_FAILED;
+            }
+            LOG_INFO("Pipeline '" << name 
+                << "' deleted its own Main-Loop successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception deleting its own Main-Loop");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PipelineTimeToFirstFrameGet(const char* name, 
+        double* timeToFirstFrame)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+
+            *timeToFirstFrame = m_pipelines[name]->GetTimeToFirstFrame();
+
+            LOG_INFO("Pipeline '" << name << "' returned time-to-first-frame = " 
+                << *timeToFirstFrame << "ms successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception getting time-to-first-frame");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PipelineStartupProfileGet(const char* name, 
+        dsl_pipeline_startup_profile* profile, 
+        const dsl_pipeline_startup_event** events, uint* size)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+
+            m_pipelines[name]->GetStartupProfile(profile, events, size);
+
+            LOG_INFO("Pipeline '" << name << "' returned startup profile with " 
+                << *size << " events successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception getting startup profile");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PipelinePoolNew(const char* name, 
+        uint standbyState, boolean isLive)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            if (m_pipelinePools.find(name) != m_pipelinePools.end())
+            {   
+                LOG_ERROR("Pipeline Pool name '" << name << "' is not unique");
+                return DSL_RESULT_PIPELINE_POOL_NAME_NOT_UNIQUE;
+            }
+            if (standbyState != DSL_STATE_READY and 
+                standbyState != DSL_STATE_PAUSED)
+            {
+                LOG_ERROR("Invalid standby state = " << standbyState 
+                    << " for new Pipeline Pool '" << name << "'");
+                return DSL_RESULT_PIPELINE_POOL_STANDBY_FAILED;
+            }
+            m_pipelinePools[name] = DSL_PIPELINE_POOL_NEW(name, 
+                (GstState)standbyState, isLive);
+                
+            LOG_INFO("New Pipeline Pool '" << name << "' created successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("New Pipeline Pool '" << name 
+                << "' threw exception on create");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PipelinePoolPipelineAdd(const char* name, 
+        const char* pipeline)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_POOL_NAME_NOT_FOUND(m_pipelinePools, name);
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, pipeline);
+            
+            for (auto const& imap: m_pipelinePools)
+            {
+                if (imap.second->IsMember(pipeline))
+                {
+                    LOG_ERROR("Pipeline '" << pipeline 
+                        << "' is already in use by Pipeline Pool '" 
+                        << imap.first << "'");
+                    return DSL_RESULT_PIPELINE_POOL_IN_USE;
+                }
+            }
+            if (!m_pipelinePools[name]->AddPipeline(m_pipelines[pipeline]))
+            {
+                LOG_ERROR("Pipeline Pool '" << name 
+                    << "' failed to add Pipeline '" << pipeline << "'");
+                return DSL_RESULT_PIPELINE_POOL_STANDBY_FAILED;
+            }
+            LOG_INFO("Pipeline '" << pipeline 
+                << "' was added to Pipeline Pool '" << name << "' successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline Pool '" << name 
+                << "' threw exception adding Pipeline '" << pipeline << "'");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PipelinePoolDelete(const char* name)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_POOL_NAME_NOT_FOUND(m_pipelinePools, name);
+            
+            if (m_pipelinePools[name]->GetAcquired())
+            {
+                LOG_ERROR("Unable to delete Pipeline Pool '" << name 
+                    << "' as it has Pipelines acquired");
+                return DSL_RESULT_PIPELINE_POOL_IN_USE;
+            }
+            m_pipelinePools.erase(name);
+
+            LOG_INFO("Pipeline Pool '" << name << "' deleted successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline Pool '" << name 
+                << "' threw an exception on delete");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PipelinePoolDeleteAll()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            m_pipelinePools.clear();
+
+            LOG_INFO("All Pipeline Pools deleted successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("DSL threw an exception on PipelinePoolDeleteAll");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+
+    uint Services::PipelinePoolListSize()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        return m_pipelinePools.size();
+    }
+
+    DslReturnType Services::PipelinePoolAcquire(const char* name, 
+        const char** sources, const wchar_t** pipeline)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_POOL_NAME_NOT_FOUND(m_pipelinePools, name);
+            
+            std::vector<DSL_BINTR_PTR> pSources;
+            
+            for (const char** source = sources; *source; source++)
+            {
+                DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, *source);
+                DSL_RETURN_IF_COMPONENT_IS_NOT_SOURCE(m_components, *source);
+                
+                if (m_components[*source]->IsInUse())
+                {
+                    LOG_ERROR("Unable to add Source '" << *source 
+                        << "' as it's currently in use");
+                    return DSL_RESULT_COMPONENT_IN_USE;
+                }
+                pSources.push_back(m_components[*source]);
+            }
+            uint available = m_pipelinePools[name]->GetAvailable();
+            
+            if (!m_pipelinePools[name]->Acquire(pSources, pipeline))
+            {
+                if (!available)
+                {
+                    LOG_ERROR("Pipeline Pool '" << name 
+                        << "' has no Pipelines available");
+                    return DSL_RESULT_PIPELINE_POOL_EXHAUSTED;
+                }
+                LOG_ERROR("Pipeline Pool '" << name 
+                    << "' failed to acquire a Pipeline");
+                return DSL_RESULT_PIPELINE_POOL_ACQUIRE_FAILED;
+            }
+            LOG_INFO("Pipeline Pool '" << name 
+                << "' acquired a Pipeline successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline Pool '" << name 
+                << "' threw an exception acquiring a Pipeline");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PipelinePoolRelease(const char* name, 
+        const char* pipeline)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_POOL_NAME_NOT_FOUND(m_pipelinePools, name);
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, pipeline);
+            
+            if (!m_pipelinePools[name]->Release(m_pipelines[pipeline]))
+            {
+                LOG_ERROR("Pipeline Pool '" << name 
+                    << "' failed to release Pipeline '" << pipeline << "'");
+                return DSL_RESULT_PIPELINE_POOL_RELEASE_FAILED;
+            }
+            LOG_INFO("Pipeline '" << pipeline 
+                << "' was released to Pipeline Pool '" << name << "' successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline Pool '" << name 
+                << "' threw an exception releasing Pipeline '" << pipeline << "'");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PipelinePoolSizeGet(const char* name, 
+        uint* size, uint* available)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_POOL_NAME_NOT_FOUND(m_pipelinePools, name);
+            
+            *size = m_pipelinePools[name]->GetSize();
+            *available = m_pipelinePools[name]->GetAvailable();
+
+            LOG_INFO("Pipeline Pool '" << name << "' returned size = " 
+                << *size << " and available = " << *available << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline Pool '" << name 
+                << "' threw an exception getting size");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PipelinePoolMetricsGet(const char* name, 
+        dsl_pipeline_pool_metrics* metrics)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_POOL_NAME_NOT_FOUND(m_pipelinePools, name);
+            
+            m_pipelinePools[name]->GetMetrics(metrics);
+
+            LOG_INFO("Pipeline Pool '" << name 
+                << "' returned metrics successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline Pool '" << name 
+                << "' threw an exception getting metrics");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PipelinePoolMetricsClear(const char* name)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_POOL_NAME_NOT_FOUND(m_pipelinePools, name);
+            
+            m_pipelinePools[name]->ClearMetrics();
+
+            LOG_INFO("Pipeline Pool '" << name 
+                << "' cleared metrics successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline Pool '" << name 
+                << "' threw an exception clearing metrics");
             return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
         }
     }
     
-}
\ No newline at end of file
+}
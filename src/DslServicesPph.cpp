@@ -61,6 +61,207 @@ namespace DSL
         }
     }
 
+    DslReturnType Services::PphCustomAsyncEnabledGet(const char* name, boolean* enabled)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_PPH_NAME_NOT_FOUND(m_padProbeHandlers, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_padProbeHandlers, name, 
+                CustomPadProbeHandler);
+
+            DSL_PPH_CUSTOM_PTR pCustomPph = 
+                std::dynamic_pointer_cast<CustomPadProbeHandler>(
+                    m_padProbeHandlers[name]);
+
+            *enabled = pCustomPph->GetAsyncEnabled();
+
+            LOG_INFO("Custom Pad Probe Handler '" << name 
+                << "' returned Async Enabled = " << *enabled << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Custom Pad Probe Handler '" << name 
+                << "' threw an exception getting async enabled");
+            return DSL_RESULT_PPH_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PphCustomAsyncEnabledSet(const char* name, boolean enabled)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_PPH_NAME_NOT_FOUND(m_padProbeHandlers, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_padProbeHandlers, name, 
+                CustomPadProbeHandler);
+
+            DSL_PPH_CUSTOM_PTR pCustomPph = 
+                std::dynamic_pointer_cast<CustomPadProbeHandler>(
+                    m_padProbeHandlers[name]);
+
+            if (!pCustomPph->SetAsyncEnabled(enabled))
+            {
+                LOG_ERROR("Custom Pad Probe Handler '" << name 
+                    << "' failed to set async enabled");
+                return DSL_RESULT_PPH_SET_FAILED;
+            }
+            LOG_INFO("Custom Pad Probe Handler '" << name 
+                << "' set Async Enabled = " << enabled << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Custom Pad Probe Handler '" << name 
+                << "' threw an exception setting async enabled");
+            return DSL_RESULT_PPH_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PphCustomAsyncQueueSettingsGet(const char* name, 
+        uint* maxSize, uint* policy, uint* sampleInterval)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_PPH_NAME_NOT_FOUND(m_padProbeHandlers, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_padProbeHandlers, name, 
+                CustomPadProbeHandler);
+
+            DSL_PPH_CUSTOM_PTR pCustomPph = 
+                std::dynamic_pointer_cast<CustomPadProbeHandler>(
+                    m_padProbeHandlers[name]);
+
+            pCustomPph->GetAsyncQueueSettings(maxSize, policy, sampleInterval);
+
+            LOG_INFO("Custom Pad Probe Handler '" << name 
+                << "' returned Async Queue Settings: max-size = " << *maxSize 
+                << ", policy = " << *policy << ", sample-interval = " 
+                << *sampleInterval << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Custom Pad Probe Handler '" << name 
+                << "' threw an exception getting async queue settings");
+            return DSL_RESULT_PPH_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PphCustomAsyncQueueSettingsSet(const char* name, 
+        uint maxSize, uint policy, uint sampleInterval)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_PPH_NAME_NOT_FOUND(m_padProbeHandlers, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_padProbeHandlers, name, 
+                CustomPadProbeHandler);
+
+            DSL_PPH_CUSTOM_PTR pCustomPph = 
+                std::dynamic_pointer_cast<CustomPadProbeHandler>(
+                    m_padProbeHandlers[name]);
+
+            if (policy > DSL_PPH_CUSTOM_ASYNC_POLICY_BLOCK)
+            {
+                LOG_ERROR("Invalid async queue-full policy = " << policy 
+                    << " for Custom Pad Probe Handler '" << name << "'");
+                return DSL_RESULT_PPH_CUSTOM_ASYNC_POLICY_INVALID;
+            }
+            if (!pCustomPph->SetAsyncQueueSettings(maxSize, policy, sampleInterval))
+            {
+                LOG_ERROR("Custom Pad Probe Handler '" << name 
+                    << "' failed to set async queue settings");
+                return DSL_RESULT_PPH_SET_FAILED;
+            }
+            LOG_INFO("Custom Pad Probe Handler '" << name 
+                << "' set Async Queue Settings: max-size = " << maxSize 
+                << ", policy = " << policy << ", sample-interval = " 
+                << sampleInterval << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Custom Pad Probe Handler '" << name 
+                << "' threw an exception setting async queue settings");
+            return DSL_RESULT_PPH_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PphCustomAsyncMetricsGet(const char* name, 
+        dsl_pph_custom_async_metrics* metrics)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_PPH_NAME_NOT_FOUND(m_padProbeHandlers, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_padProbeHandlers, name, 
+                CustomPadProbeHandler);
+
+            DSL_PPH_CUSTOM_PTR pCustomPph = 
+                std::dynamic_pointer_cast<CustomPadProbeHandler>(
+                    m_padProbeHandlers[name]);
+
+            pCustomPph->GetAsyncMetrics(metrics);
+
+            LOG_INFO("Custom Pad Probe Handler '" << name 
+                << "' returned Async Metrics successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Custom Pad Probe Handler '" << name 
+                << "' threw an exception getting async metrics");
+            return DSL_RESULT_PPH_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PphCustomAsyncMetricsClear(const char* name)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_PPH_NAME_NOT_FOUND(m_padProbeHandlers, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_padProbeHandlers, name, 
+                CustomPadProbeHandler);
+
+            DSL_PPH_CUSTOM_PTR pCustomPph = 
+                std::dynamic_pointer_cast<CustomPadProbeHandler>(
+                    m_padProbeHandlers[name]);
+
+            pCustomPph->ClearAsyncMetrics();
+
+            LOG_INFO("Custom Pad Probe Handler '" << name 
+                << "' cleared Async Metrics successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Custom Pad Probe Handler '" << name 
+                << "' threw an exception clearing async metrics");
+            return DSL_RESULT_PPH_THREW_EXCEPTION;
+        }
+    }
+
     DslReturnType Services::PphMeterNew(const char* name, uint interval, 
         dsl_pph_meter_client_handler_cb clientHandler, void* clientData)
     {
@@ -372,6 +573,206 @@ namespace DSL
         }
     }
 
+    DslReturnType Services::PphOdeFrameWorkersGet(const char* name, 
+        uint* workers)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_PPH_NAME_NOT_FOUND(m_padProbeHandlers, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_padProbeHandlers, name, 
+                OdePadProbeHandler);
+            
+            DSL_PPH_ODE_PTR pOde = 
+                std::dynamic_pointer_cast<OdePadProbeHandler>(
+                    m_padProbeHandlers[name]); 
+
+            *workers = pOde->GetFrameWorkers();
+
+            LOG_INFO("ODE Pad Probe Handler '" << name 
+                << "' returned Frame Workers = " << *workers << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Pad Probe Handler '" << name 
+                << "' threw an exception getting Frame Workers");
+            return DSL_RESULT_PPH_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PphOdeFrameWorkersSet(const char* name, 
+        uint workers)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_PPH_NAME_NOT_FOUND(m_padProbeHandlers, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_padProbeHandlers, name, 
+                OdePadProbeHandler);
+            
+            DSL_PPH_ODE_PTR pOde = 
+                std::dynamic_pointer_cast<OdePadProbeHandler>(
+                    m_padProbeHandlers[name]); 
+
+            if (!pOde->SetFrameWorkers(workers))
+            {
+                LOG_ERROR("ODE Pad Probe Handler '" << name 
+                    << "' failed to set Frame Workers = " << workers);
+                return DSL_RESULT_PPH_SET_FAILED;
+            }
+            LOG_INFO("ODE Pad Probe Handler '" << name 
+                << "' set Frame Workers = " << workers << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Pad Probe Handler '" << name 
+                << "' threw an exception setting Frame Workers");
+            return DSL_RESULT_PPH_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PphOdeReplay(const char* name, 
+        const char* filePath, uint64_t* frames)
+    {
+        LOG_FUNC();
+        
+        DSL_PPH_ODE_PTR pOde;
+        DSL_META_RECORD_READER_PTR pReader;
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+            try
+            {
+                DSL_RETURN_IF_PPH_NAME_NOT_FOUND(m_padProbeHandlers, name);
+                DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_padProbeHandlers, 
+                    name, OdePadProbeHandler);
+                
+                pOde = std::dynamic_pointer_cast<OdePadProbeHandler>(
+                    m_padProbeHandlers[name]); 
+            }
+            catch(...)
+            {
+                LOG_ERROR("ODE Pad Probe Handler '" << name 
+                    << "' threw an exception on replay");
+                return DSL_RESULT_PPH_THREW_EXCEPTION;
+            }
+            try
+            {
+                pReader = DSL_META_RECORD_READER_NEW(filePath);
+            }
+            catch(...)
+            {
+                LOG_ERROR("ODE Pad Probe Handler '" << name 
+                    << "' failed to open Metadata Record file '" << filePath << "'");
+                return DSL_RESULT_PPH_META_RECORD_FILE_ERROR;
+            }
+        }
+        // The Services mutex is released while replaying so that the Triggers' 
+        // client callbacks and actions can call into the Services API.
+        try
+        {
+            *frames = pOde->ReplayMetaRecord(pReader);
+
+            LOG_INFO("ODE Pad Probe Handler '" << name << "' replayed " 
+                << *frames << " frames from '" << filePath << "' successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Pad Probe Handler '" << name 
+                << "' threw an exception on replay");
+            return DSL_RESULT_PPH_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PphMetaRecorderNew(const char* name, 
+        const char* filePath)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            // ensure handler name uniqueness 
+            if (m_padProbeHandlers.find(name) != m_padProbeHandlers.end())
+            {   
+                LOG_ERROR("Metadata Recorder Pad Probe Handler name '" 
+                    << name << "' is not unique");
+                return DSL_RESULT_PPH_NAME_NOT_UNIQUE;
+            }
+            try
+            {
+                m_padProbeHandlers[name] = DSL_PPH_META_RECORDER_NEW(name, filePath);
+            }
+            catch(...)
+            {
+                LOG_ERROR("New Metadata Recorder Pad Probe Handler '" << name 
+                    << "' failed to create file '" << filePath << "'");
+                return DSL_RESULT_PPH_META_RECORD_FILE_ERROR;
+            }
+
+            LOG_INFO("New Metadata Recorder Pad Probe Handler '" << name 
+                << "' created successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("New Metadata Recorder Pad Probe Handler '" << name 
+                << "' threw exception on create");
+            return DSL_RESULT_PPH_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PphMetaPublisherNew(const char* name, 
+        const char* shmName, uint slotCount, uint maxObjects)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            // ensure handler name uniqueness 
+            if (m_padProbeHandlers.find(name) != m_padProbeHandlers.end())
+            {   
+                LOG_ERROR("Metadata Publisher Pad Probe Handler name '" 
+                    << name << "' is not unique");
+                return DSL_RESULT_PPH_NAME_NOT_UNIQUE;
+            }
+            try
+            {
+                m_padProbeHandlers[name] = DSL_PPH_META_PUBLISHER_NEW(name, 
+                    shmName, slotCount, maxObjects);
+            }
+            catch(...)
+            {
+                LOG_ERROR("New Metadata Publisher Pad Probe Handler '" << name 
+                    << "' failed to create shared-memory '" << shmName << "'");
+                return DSL_RESULT_PPH_META_SHM_CREATE_FAILED;
+            }
+
+            LOG_INFO("New Metadata Publisher Pad Probe Handler '" << name 
+                << "' created successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("New Metadata Publisher Pad Probe Handler '" << name 
+                << "' threw exception on create");
+            return DSL_RESULT_PPH_THREW_EXCEPTION;
+        }
+    }
+
     DslReturnType Services::PphBufferTimeoutNew(const char* name,
         uint timeout, dsl_pph_buffer_timeout_handler_cb handler, void* clientData)
     {
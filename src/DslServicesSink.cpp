@@ -3094,6 +3094,180 @@ namespace DSL
         }
     }
 
+    DslReturnType Services::SinkFrameCaptureRingSettingsGet(const char* name,
+        uint* width, uint* duration, uint64_t* maxSize)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, 
+                name, FrameCaptureSinkBintr);
+
+            DSL_FRAME_CAPTURE_SINK_PTR pFrameCaptureSink = 
+                std::dynamic_pointer_cast<FrameCaptureSinkBintr>(m_components[name]);
+
+            pFrameCaptureSink->GetRingSettings(width, duration, maxSize);
+
+            LOG_INFO("Frame-Capture Sink '" << name 
+                << "' returned ring settings width = " << *width 
+                << ", duration = " << *duration << ", max-size = " << *maxSize
+                << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Frame-Capture Sink '" << name 
+                << "' threw an exception getting ring settings");
+            return DSL_RESULT_SINK_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::SinkFrameCaptureRingSettingsSet(const char* name,
+        uint width, uint duration, uint64_t maxSize)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, 
+                name, FrameCaptureSinkBintr);
+
+            DSL_FRAME_CAPTURE_SINK_PTR pFrameCaptureSink = 
+                std::dynamic_pointer_cast<FrameCaptureSinkBintr>(m_components[name]);
+
+            pFrameCaptureSink->SetRingSettings(width, duration, maxSize);
+
+            LOG_INFO("Frame-Capture Sink '" << name 
+                << "' set ring settings width = " << width 
+                << ", duration = " << duration << ", max-size = " << maxSize
+                << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Frame-Capture Sink '" << name 
+                << "' threw an exception setting ring settings");
+            return DSL_RESULT_SINK_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::SinkFrameCaptureRingSizeGet(const char* name,
+        uint* frames, uint64_t* size)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, 
+                name, FrameCaptureSinkBintr);
+
+            DSL_FRAME_CAPTURE_SINK_PTR pFrameCaptureSink = 
+                std::dynamic_pointer_cast<FrameCaptureSinkBintr>(m_components[name]);
+
+            pFrameCaptureSink->GetRingSize(frames, size);
+
+            LOG_INFO("Frame-Capture Sink '" << name 
+                << "' returned ring size frames = " << *frames 
+                << ", size = " << *size << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Frame-Capture Sink '" << name 
+                << "' threw an exception getting ring size");
+            return DSL_RESULT_SINK_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::SinkFrameCaptureRingInitiate(const char* name,
+        uint64_t timestamp)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, 
+                name, FrameCaptureSinkBintr);
+
+            DSL_FRAME_CAPTURE_SINK_PTR pFrameCaptureSink = 
+                std::dynamic_pointer_cast<FrameCaptureSinkBintr>(m_components[name]);
+
+            if (!pFrameCaptureSink->InitiateRing(timestamp))
+            {
+                LOG_ERROR("Frame-Capture Sink '" << name 
+                    << "' failed to capture a retained frame for timestamp = "
+                    << timestamp);
+                return DSL_RESULT_SINK_SET_FAILED;
+            }
+            LOG_INFO("Frame-Capture Sink '" << name 
+                << "' captured a retained frame for timestamp = "
+                << timestamp << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Frame-Capture Sink '" << name 
+                << "' threw an exception capturing a retained frame");
+            return DSL_RESULT_SINK_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::SinkFrameCaptureRingInitiateRange(const char* name,
+        uint64_t startTimestamp, uint64_t endTimestamp, uint* count)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        
+        try
+        {
+            DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, 
+                name, FrameCaptureSinkBintr);
+
+            if (startTimestamp > endTimestamp)
+            {
+                LOG_ERROR("Invalid timestamp range " << startTimestamp 
+                    << " to " << endTimestamp << " for Frame-Capture Sink '" 
+                    << name << "'");
+                return DSL_RESULT_SINK_SET_FAILED;
+            }
+            DSL_FRAME_CAPTURE_SINK_PTR pFrameCaptureSink = 
+                std::dynamic_pointer_cast<FrameCaptureSinkBintr>(m_components[name]);
+
+            if (!pFrameCaptureSink->InitiateRingRange(startTimestamp, 
+                endTimestamp, count))
+            {
+                LOG_ERROR("Frame-Capture Sink '" << name 
+                    << "' failed to capture retained frames for timestamps "
+                    << startTimestamp << " to " << endTimestamp);
+                return DSL_RESULT_SINK_SET_FAILED;
+            }
+            LOG_INFO("Frame-Capture Sink '" << name 
+                << "' captured " << *count << " retained frames successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Frame-Capture Sink '" << name 
+                << "' threw an exception capturing retained frames");
+            return DSL_RESULT_SINK_THREW_EXCEPTION;
+        }
+    }
+
     DslReturnType Services::SinkV4l2New(const char* name, 
         const char* deviceLocation)
     {
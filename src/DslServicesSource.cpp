@@ -2315,6 +2315,134 @@ namespace DSL
         }
     }                
 
+    DslReturnType Services::SourceVideoDecimationFrameRateGet(const char* name, 
+        uint* fps_n, uint* fps_d)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_SOURCE(m_components, name);
+            
+            DSL_VIDEO_SOURCE_PTR pSourceBintr = 
+                std::dynamic_pointer_cast<VideoSourceBintr>(m_components[name]);
+         
+            pSourceBintr->GetDecimationFrameRate(fps_n, fps_d);
+
+            LOG_INFO("Source '" << name << "' returned fps_n = " 
+                << *fps_n << " and fps_d = " << *fps_d 
+                << " for decimation-frame-rate successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Source '" << name 
+                << "' threw exception getting decimation-frame-rate");
+            return DSL_RESULT_SOURCE_THREW_EXCEPTION;
+        }
+    }                
+
+    DslReturnType Services::SourceVideoDecimationFrameRateSet(const char* name, 
+        uint fps_n, uint fps_d)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_SOURCE(m_components, name);
+            
+            DSL_VIDEO_SOURCE_PTR pSourceBintr = 
+                std::dynamic_pointer_cast<VideoSourceBintr>(m_components[name]);
+
+            if (!pSourceBintr->SetDecimationFrameRate(fps_n, fps_d))
+            {
+                LOG_ERROR("Failed to set decimation-frame-rate to fps_n = " 
+                    << fps_n << " and fps_d = " << fps_d  
+                    << " for Source '" << name << "'");
+                return DSL_RESULT_SOURCE_SET_FAILED;
+            }
+
+            LOG_INFO("Source '" << name << "' set fps_n = " 
+                << fps_n << " and fps_d = " << fps_d 
+                << " for decimation-frame-rate successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Source '" << name 
+                << "' threw exception setting decimation-frame-rate");
+            return DSL_RESULT_SOURCE_THREW_EXCEPTION;
+        }
+    }                
+
+    DslReturnType Services::SourceVideoDecimationStatsGet(const char* name, 
+        uint64_t* frames_passed, uint64_t* frames_dropped, 
+        uint64_t* frames_dropped_pre_decode)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_SOURCE(m_components, name);
+            
+            DSL_VIDEO_SOURCE_PTR pSourceBintr = 
+                std::dynamic_pointer_cast<VideoSourceBintr>(m_components[name]);
+         
+            pSourceBintr->GetDecimationStats(frames_passed, frames_dropped,
+                frames_dropped_pre_decode);
+
+            LOG_INFO("Source '" << name << "' returned frames_passed = " 
+                << *frames_passed << ", frames_dropped = " << *frames_dropped 
+                << ", and frames_dropped_pre_decode = " 
+                << *frames_dropped_pre_decode 
+                << " for decimation-stats successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Source '" << name 
+                << "' threw exception getting decimation-stats");
+            return DSL_RESULT_SOURCE_THREW_EXCEPTION;
+        }
+    }                
+
+    DslReturnType Services::SourceVideoDecimationStatsClear(const char* name)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_SOURCE(m_components, name);
+            
+            DSL_VIDEO_SOURCE_PTR pSourceBintr = 
+                std::dynamic_pointer_cast<VideoSourceBintr>(m_components[name]);
+         
+            pSourceBintr->ClearDecimationStats();
+
+            LOG_INFO("Source '" << name 
+                << "' cleared decimation-stats successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Source '" << name 
+                << "' threw exception clearing decimation-stats");
+            return DSL_RESULT_SOURCE_THREW_EXCEPTION;
+        }
+    }                
+
     DslReturnType Services::SourceVideoBufferOutCropRectangleGet(const char* name, 
         uint cropAt, uint* left, uint* top, uint* width, uint* height)
     {
@@ -390,6 +390,169 @@ namespace DSL
         }
     }
 
+    DslReturnType Services::_teeBranchOpValidate(const char* name, 
+        BranchOp& op)
+    {
+        LOG_FUNC();
+        
+        DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, op.branch);
+        DSL_RETURN_IF_COMPONENT_IS_NOT_BRANCH(m_components, op.branch);
+        
+        if (op.op > DSL_TEE_BRANCH_OP_MOVE_TO)
+        {
+            LOG_ERROR("Invalid operation = " << op.op << " for branch '" 
+                << op.branch << "' and Tee '" << name << "'");
+            return DSL_RESULT_TEE_BRANCH_OP_INVALID;
+        }
+        // Only the Demuxer can add or move branches to a specific stream-id
+        if (!m_components[name]->IsType(typeid(DemuxerBintr)) and
+            (op.op == DSL_TEE_BRANCH_OP_MOVE_TO or 
+                op.streamId != DSL_TEE_BRANCH_ANY_STREAM))
+        {
+            LOG_ERROR("Splitter Tee '" << name 
+                << "' can not add or move branch '" << op.branch 
+                << "' to a stream-id");
+            return DSL_RESULT_TEE_BRANCH_OP_INVALID;
+        }
+        // Can't add components if they're In use by another Branch
+        if (op.op == DSL_TEE_BRANCH_OP_ADD and 
+            m_components[op.branch]->IsInUse())
+        {
+            LOG_ERROR("Unable to add branch '" << op.branch 
+                << "' as it's currently in use");
+            return DSL_RESULT_COMPONENT_IN_USE;
+        }
+        op.pBranch = std::dynamic_pointer_cast<Bintr>(m_components[op.branch]);
+        
+        return DSL_RESULT_SUCCESS;
+    }
+
+    DslReturnType Services::TeeBranchOpsApply(const char* name, 
+        std::vector<BranchOp>& ops, dsl_tee_branch_op_result* results)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_TEE(m_components, name);
+
+            for (auto& ivec: ops)
+            {
+                ivec.result = _teeBranchOpValidate(name, ivec);
+            }
+            std::dynamic_pointer_cast<MultiBranchesBintr>(
+                m_components[name])->ApplyBranchOps(ops);
+
+            DslReturnType retval(DSL_RESULT_SUCCESS);
+            
+            for (uint i = 0; i < ops.size(); i++)
+            {
+                results[i].op = ops[i].op;
+                results[i].stream_id = (ops[i].op == DSL_TEE_BRANCH_OP_REMOVE)
+                    ? ops[i].prevStreamId
+                    : ops[i].streamId;
+                results[i].result = ops[i].result;
+                results[i].time_us = ops[i].timeUs;
+                
+                if (retval == DSL_RESULT_SUCCESS)
+                {
+                    retval = ops[i].result;
+                }
+            }
+            if (retval != DSL_RESULT_SUCCESS)
+            {
+                LOG_ERROR("Tee '" << name << "' failed to apply one or more of " 
+                    << ops.size() << " branch operations");
+                return retval;
+            }
+            LOG_INFO("Batch of " << ops.size() 
+                << " branch operations applied to Tee '" << name 
+                << "' successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Tee '" <<  name
+                << "' threw an exception applying branch operations");
+            return DSL_RESULT_TEE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::TeeBranchOpsApplyAsync(const char* name, 
+        std::vector<BranchOp>& ops, 
+        dsl_tee_branch_ops_complete_listener_cb listener, void* clientData)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_TEE(m_components, name);
+
+            DslReturnType retval(DSL_RESULT_SUCCESS);
+            
+            for (auto& ivec: ops)
+            {
+                ivec.result = _teeBranchOpValidate(name, ivec);
+                
+                if (retval == DSL_RESULT_SUCCESS)
+                {
+                    retval = ivec.result;
+                }
+            }
+            std::dynamic_pointer_cast<MultiBranchesBintr>(
+                m_components[name])->QueueBranchOps(
+                    DSL_BRANCH_OPS_BATCH_NEW(ops, listener, clientData));
+
+            if (retval != DSL_RESULT_SUCCESS)
+            {
+                LOG_ERROR("One or more of " << ops.size() 
+                    << " branch operations for Tee '" << name 
+                    << "' failed validation");
+                return retval;
+            }
+            LOG_INFO("Batch of " << ops.size() 
+                << " branch operations queued for Tee '" << name 
+                << "' successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Tee '" <<  name
+                << "' threw an exception queuing branch operations");
+            return DSL_RESULT_TEE_THREW_EXCEPTION;
+        }
+    }
+
+    bool Services::TeeBranchOpsQueueExecute(MultiBranchesBintr* pTee)
+    {
+        LOG_FUNC();
+        
+        // Called by the Tee's worker thread. A Services call in progress may
+        // be waiting on the queued batches, so never block here.
+        if (!g_mutex_trylock(&m_servicesMutex))
+        {
+            return false;
+        }
+        try
+        {
+            pTee->ExecuteQueuedBranchOps();
+        }
+        catch(...)
+        {
+            LOG_ERROR("Tee '" << pTee->GetName() 
+                << "' threw an exception executing queued branch operations");
+        }
+        g_mutex_unlock(&m_servicesMutex);
+        
+        return true;
+    }
+
     DslReturnType Services::TeeBlockingTimeoutGet(const char* name, 
         uint* timeout)
     {
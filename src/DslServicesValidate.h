@@ -119,6 +119,15 @@ THE SOFTWARE.
     } \
 }while(0); 
     
+#define DSL_RETURN_IF_PIPELINE_POOL_NAME_NOT_FOUND(pools, name) do \
+{ \
+    if (pools.find(name) == pools.end()) \
+    { \
+        LOG_ERROR("Pipeline Pool name '" << name << "' was not found"); \
+        return DSL_RESULT_PIPELINE_POOL_NAME_NOT_FOUND; \
+    } \
+}while(0); 
+    
 #define DSL_RETURN_IF_PLAYER_NAME_NOT_FOUND(players, name) do \
 { \
     if (players.find(name) == players.end()) \
@@ -599,6 +599,12 @@ namespace DSL
             on_new_buffer_cb, NULL)
         , m_pFrameCaptureAction(pFrameCaptureAction)
         , m_captureNextBuffer(false)
+        , m_ringWidth(0)
+        , m_ringDuration(0)
+        , m_ringMaxSize(0)
+        , m_ringMemType(NVBUF_MEM_CUDA_PINNED)
+        , m_ringSyncForCpu(false)
+        , m_lastRetainedFrameNumber(0)
     {
         LOG_FUNC();
 
@@ -623,6 +629,10 @@ namespace DSL
         
         // override the client data (set to NULL above) to this pointer.
         m_clientData = this;
+        
+        // Free surfaces are only needed to replace those evicted from the ring.
+        m_pRingSurfacePool = std::shared_ptr<DslBufferSurfacePool>(
+            new DslBufferSurfacePool(2));
     }
     
     FrameCaptureSinkBintr::~FrameCaptureSinkBintr()
@@ -656,16 +666,200 @@ namespace DSL
             return false;
         }
         
+        // If the frame has already passed, capture it from the ring if retained.
+        if (m_pRing and m_pRing->GetCount() and 
+            frameNumber <= m_lastRetainedFrameNumber)
+        {
+            DslBufferSurfaceRing::Entry* pEntry = m_pRing->FindFrame(frameNumber);
+            if (!pEntry)
+            {
+                LOG_ERROR("Frame-number (" << frameNumber 
+                    << ") is no longer retained by FrameCaptureSinkBintr '" 
+                    << GetName() << "'");
+                return false;
+            }
+            return captureRetainedFrame(pEntry);
+        }
         m_captureFrameNumbers.emplace(frameNumber);
         return true;
     }
     
+    void FrameCaptureSinkBintr::GetRingSettings(uint* width, 
+        uint* duration, uint64_t* maxSize)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_captureMutex);
+        
+        *width = m_ringWidth;
+        *duration = m_ringDuration;
+        *maxSize = m_ringMaxSize;
+    }
+    
+    void FrameCaptureSinkBintr::SetRingSettings(uint width, 
+        uint duration, uint64_t maxSize)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_captureMutex);
+        
+        // Width must be even to match the plane width of the new surfaces.
+        m_ringWidth = GST_ROUND_DOWN_2(width);
+        m_ringDuration = duration;
+        m_ringMaxSize = maxSize;
+        
+        // Release all currently retained frames before starting anew.
+        m_pRing = nullptr;
+        
+        if (m_ringDuration and m_ringMaxSize)
+        {
+            m_pRing = std::unique_ptr<DslBufferSurfaceRing>(
+                new DslBufferSurfaceRing(m_ringMaxSize, 
+                    uint64_t(m_ringDuration)*GST_MSECOND));
+        }
+    }
+    
+    void FrameCaptureSinkBintr::GetRingSize(uint* frames, uint64_t* size)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_captureMutex);
+        
+        *frames = (m_pRing) ? m_pRing->GetCount() : 0;
+        *size = (m_pRing) ? m_pRing->GetBytes() : 0;
+    }
+    
+    bool FrameCaptureSinkBintr::InitiateRing(uint64_t timestamp)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_captureMutex);
+        
+        if (!m_pRing or !m_pRing->GetCount())
+        {
+            LOG_ERROR("Unable to capture a retained frame with FrameCaptureSinkBintr '"
+                << GetName() << "' as there are no retained frames");
+            return false;
+        }
+        return captureRetainedFrame(m_pRing->FindNearest(timestamp));
+    }
+    
+    bool FrameCaptureSinkBintr::InitiateRingRange(uint64_t startTimestamp, 
+        uint64_t endTimestamp, uint* count)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_captureMutex);
+        
+        *count = 0;
+        if (!m_pRing)
+        {
+            LOG_ERROR("Unable to capture retained frames with FrameCaptureSinkBintr '"
+                << GetName() << "' as the ring is disabled");
+            return false;
+        }
+        for (auto pEntry: m_pRing->FindRange(startTimestamp, endTimestamp))
+        {
+            if (pEntry->captured)
+            {
+                continue;
+            }
+            if (!captureRetainedFrame(pEntry))
+            {
+                return false;
+            }
+            (*count)++;
+        }
+        return true;
+    }
+    
+    bool FrameCaptureSinkBintr::captureRetainedFrame(
+        DslBufferSurfaceRing::Entry* pEntry)
+    {
+        LOG_FUNC();
+        
+        if (pEntry->captured)
+        {
+            LOG_INFO("Retained frame-number (" << pEntry->frameNumber 
+                << ") has already been captured by FrameCaptureSinkBintr '" 
+                << GetName() << "'");
+            return true;
+        }
+        DSL_ODE_ACTION_CAPTURE_FRAME_PTR pCaptureAction =
+            std::dynamic_pointer_cast<CaptureFrameOdeAction>(m_pFrameCaptureAction);
+            
+        if (!pCaptureAction->QueueRetainedImage(pEntry->pBufferSurface))
+        {
+            return false;
+        }
+        pEntry->captured = true;
+        return true;
+    }
+    
+    void FrameCaptureSinkBintr::retainFrame(GstBuffer* pBuffer, 
+        NvDsFrameMeta* pFrameMeta)
+    {
+        // No function log - avoid overhead.
+        
+        std::unique_ptr<DslMappedBuffer> pMappedBuffer = 
+            std::unique_ptr<DslMappedBuffer>(new DslMappedBuffer(pBuffer));
+            
+        DslMonoSurface monoSurface(pMappedBuffer->pSurface, pFrameMeta->batch_id);
+
+        // One time setup of the Cuda stream and memory type for the retained frames
+        if (!m_pRingCudaStream)
+        {
+            cudaDeviceProp cudaDeviceProp{0};
+            cudaGetDeviceProperties(&cudaDeviceProp, monoSurface.gpuId);
+            
+            m_ringMemType = (cudaDeviceProp.integrated)
+                ? NVBUF_MEM_DEFAULT
+                : NVBUF_MEM_CUDA_PINNED;
+            m_ringSyncForCpu = cudaDeviceProp.integrated;
+            
+            m_pRingCudaStream = std::shared_ptr<DslCudaStream>(
+                new DslCudaStream(monoSurface.gpuId));
+        }
+        DslSurfaceTransformSessionParams dslTransformSessionParams(
+            monoSurface.gpuId, *m_pRingCudaStream);
+        if (!dslTransformSessionParams.Set())
+        {
+            LOG_ERROR("Failed to set transform session params for FrameCaptureSinkBintr '"
+                << GetName() << "'");
+            return;
+        }
+        
+        // Downscale to the ring's width, preserving the aspect ratio.
+        gint width(monoSurface.width), height(monoSurface.height);
+        if (m_ringWidth and m_ringWidth < (uint)width)
+        {
+            height = std::max(2, 
+                GST_ROUND_DOWN_2(gint(uint64_t(height)*m_ringWidth/width)));
+            width = m_ringWidth;
+        }
+        std::shared_ptr<DslBufferSurface> pBufferSurface = 
+            m_pRingSurfacePool->Acquire(monoSurface.gpuId, width, height, 
+                m_ringMemType, 0);
+        if (!pBufferSurface)
+        {
+            return;
+        }
+        DslTransformParams transformParams(0, 0, 
+            monoSurface.width, monoSurface.height, width, height);
+            
+        if (!pBufferSurface->TransformMonoSurface(monoSurface, 0, transformParams)
+            or (m_ringSyncForCpu and !pBufferSurface->SyncForCpu()))
+        {
+            LOG_ERROR("Failed to retain frame-number (" << pFrameMeta->frame_num 
+                << ") for FrameCaptureSinkBintr '" << GetName() << "'");
+            return;
+        }
+        m_pRing->Push(pFrameMeta->frame_num, 
+            pFrameMeta->ntp_timestamp, pBufferSurface);
+        m_lastRetainedFrameNumber = pFrameMeta->frame_num;
+    }
+    
     uint FrameCaptureSinkBintr::HandleNewBuffer(void* buffer)
     {
         // don't log function
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_captureMutex);
         
-        if (m_captureNextBuffer or m_captureFrameNumbers.size())
+        if (m_captureNextBuffer or m_captureFrameNumbers.size() or m_pRing)
         {
             // flag for final determination to capture this frame.
             bool captureThisFrame(false);
@@ -685,6 +879,12 @@ namespace DSL
                 return GST_FLOW_OK;
             }
             
+            // Retain every frame while the ring is enabled.
+            if (m_pRing)
+            {
+                retainFrame((GstBuffer*)buffer, pFrameMeta);
+            }
+            
             // If there are frame-numbers schedule for capture
             if (m_captureFrameNumbers.size())
             {
@@ -719,6 +919,7 @@ namespace DSL
                 
                 
                 pCaptureAction->HandleOccurrence((GstBuffer*)buffer, pFrameMeta, NULL);
+                OdeAction::PostProcessFrame((GstBuffer*)buffer, pFrameMeta);
             }
         }
         
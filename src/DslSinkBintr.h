@@ -31,6 +31,7 @@ THE SOFTWARE.
 #include "DslElementr.h"
 #include "DslRecordMgr.h"
 #include "DslSourceMeter.h"
+#include "DslSurfaceTransform.h"
 
 namespace DSL
 {
@@ -381,6 +382,54 @@ namespace DSL
          */
         bool Schedule(uint64_t frameNumber);
 
+        /**
+         * @brief Gets the current settings for the ring of retained frames.
+         * @param[out] width width to downscale the retained frames to, 
+         * 0 = full size.
+         * @param[out] duration maximum duration of the retained frames in ms,
+         * 0 = ring disabled.
+         * @param[out] maxSize maximum total size of the retained frames in bytes,
+         * 0 = ring disabled.
+         */
+        void GetRingSettings(uint* width, uint* duration, uint64_t* maxSize);
+
+        /**
+         * @brief Sets the settings for the ring of retained frames. All currently
+         * retained frames are released. 
+         * @param[in] width width to downscale the retained frames to, 
+         * 0 = full size.
+         * @param[in] duration maximum duration of the retained frames in ms,
+         * 0 to disable the ring.
+         * @param[in] maxSize maximum total size of the retained frames in bytes,
+         * 0 to disable the ring.
+         */
+        void SetRingSettings(uint width, uint duration, uint64_t maxSize);
+
+        /**
+         * @brief Gets the current number and total size of the retained frames.
+         * @param[out] frames current number of retained frames.
+         * @param[out] size current total size of the retained frames in bytes.
+         */
+        void GetRingSize(uint* frames, uint64_t* size);
+
+        /**
+         * @brief Captures the retained frame with the closest NTP timestamp.
+         * @param[in] timestamp NTP timestamp of the frame to capture in ns.
+         * @return false if the ring is disabled or empty, true otherwise.
+         */
+        bool InitiateRing(uint64_t timestamp);
+
+        /**
+         * @brief Captures all retained frames within a range of NTP timestamps
+         * that have not already been captured.
+         * @param[in] startTimestamp start of the range in ns, inclusive.
+         * @param[in] endTimestamp end of the range in ns, inclusive.
+         * @param[out] count number of frames captured.
+         * @return false if the ring is disabled, true otherwise.
+         */
+        bool InitiateRingRange(uint64_t startTimestamp, 
+            uint64_t endTimestamp, uint* count);
+
         /**
          * @brief Function to handle each new buffer provided by the AppSinkBintr.
          * @param[in] buffer new buffer to capture if m_captureNextBuffer == true.
@@ -390,6 +439,22 @@ namespace DSL
         
     private:
 
+        /**
+         * @brief Copies the current frame, downscaled, to a pooled surface and
+         * adds it to the ring of retained frames.
+         * @param[in] pBuffer buffer with the frame to retain.
+         * @param[in] pFrameMeta frame metadata for the frame to retain.
+         */
+        void retainFrame(GstBuffer* pBuffer, NvDsFrameMeta* pFrameMeta);
+
+        /**
+         * @brief Queues a retained frame with the Frame Capture Action for
+         * conversion. Each retained frame is captured at most once.
+         * @param[in] pEntry ring entry for the retained frame.
+         * @return false if the Frame Capture Action is disabled, true otherwise.
+         */
+        bool captureRetainedFrame(DslBufferSurfaceRing::Entry* pEntry);
+
         /**
          * @brief boolean flag used by the client to signal to the HandleNewBuffer
          * function to capture the next frame-buffer.
@@ -412,6 +477,55 @@ namespace DSL
          * to selectively call to capture the current buffer
          */
         DSL_BASE_PTR m_pFrameCaptureAction;
+
+        /**
+         * @brief width to downscale the retained frames to, 0 = full size.
+         */
+        uint m_ringWidth;
+
+        /**
+         * @brief maximum duration of the retained frames in ms.
+         */
+        uint m_ringDuration;
+
+        /**
+         * @brief maximum total size of the retained frames in bytes.
+         */
+        uint64_t m_ringMaxSize;
+
+        /**
+         * @brief ring of retained frames, nullptr if disabled.
+         */
+        std::unique_ptr<DslBufferSurfaceRing> m_pRing;
+
+        /**
+         * @brief pool of surfaces for the retained frames, reused once 
+         * evicted from the ring and converted.
+         */
+        std::shared_ptr<DslBufferSurfacePool> m_pRingSurfacePool;
+
+        /**
+         * @brief persistent Cuda stream for the transform session used to 
+         * downscale the retained frames.
+         */
+        std::shared_ptr<DslCudaStream> m_pRingCudaStream;
+
+        /**
+         * @brief memory type for the retained frames, system memory 
+         * accessible to both the CPU and GPU.
+         */
+        NvBufSurfaceMemType m_ringMemType;
+
+        /**
+         * @brief true if the retained frames must be synchronized for CPU access,
+         * i.e. on integrated GPUs.
+         */
+        bool m_ringSyncForCpu;
+
+        /**
+         * @brief frame number of the last frame retained.
+         */
+        uint64_t m_lastRetainedFrameNumber;
     };
 
     /**
@@ -29,6 +29,7 @@ THE SOFTWARE.
 #include "DslSourceBintr.h"
 #include "DslPipelineBintr.h"
 #include "DslSurfaceTransform.h"
+#include "DslStallWatchdog.h"
 #include <nvdsgstutils.h>
 #include <gst/app/gstappsrc.h>
 
@@ -151,6 +152,9 @@ namespace DSL
     {
         LOG_FUNC();
 
+        // New Frame Decimator, disabled until a decimation frame-rate is set.
+        m_pFrameDecimator = DSL_FRAME_DECIMATOR_NEW(name);
+
         // Media type is fixed to "video/x-raw"
         std::wstring L_mediaType(DSL_MEDIA_TYPE_VIDEO_XRAW);
         m_mediaType.assign(L_mediaType.begin(), L_mediaType.end());
@@ -308,14 +312,20 @@ namespace DSL
                 return false;
             }
         }
-            
-        return true;
+        
+        // Decimate the decoded stream before any of the common elements.
+        return m_pFrameDecimator->AddPadProbe(pSrcPad, false);
     }
     
     void VideoSourceBintr::UnlinkCommon()
     {
         LOG_FUNC();
 
+        // Remove the decoded stream's probe, added on LinkToCommon. Probes 
+        // on the encoded stream are owned by the derived Sources as their
+        // decoders may be linked only once, e.g. the RtspSourceBintr.
+        m_pFrameDecimator->RemovePadProbes(false);
+
         // Get a reference to the sink pad of the first common element
         GstPad* pStaticSinkPad = gst_element_get_static_pad(
                 m_linkedCommonElements.front()->GetGstElement(), "sink");
@@ -614,6 +624,38 @@ namespace DSL
         // Update the output-buffer's caps filter now
         return updateVidConvCaps();
     }
+
+    void VideoSourceBintr::GetDecimationFrameRate(uint* fpsN, uint* fpsD)
+    {
+        LOG_FUNC();
+        
+        m_pFrameDecimator->GetFrameRate(fpsN, fpsD);
+    }
+    
+    bool VideoSourceBintr::SetDecimationFrameRate(uint fpsN, uint fpsD)
+    {
+        LOG_FUNC();
+        
+        // Note: unlike the buffer-out-frame-rate, the decimation frame-rate
+        // is implemented with pad probes and can be set in any state.
+        return m_pFrameDecimator->SetFrameRate(fpsN, fpsD);
+    }
+
+    void VideoSourceBintr::GetDecimationStats(uint64_t* framesPassed, 
+        uint64_t* framesDropped, uint64_t* framesDroppedPreDecode)
+    {
+        LOG_FUNC();
+        
+        m_pFrameDecimator->GetStats(framesPassed, framesDropped, 
+            framesDroppedPreDecode);
+    }
+
+    void VideoSourceBintr::ClearDecimationStats()
+    {
+        LOG_FUNC();
+        
+        m_pFrameDecimator->ClearStats();
+    }
     
     void tokenize(std::string const &str, const char delim,
                 std::vector<std::string> &out)
@@ -2243,6 +2285,9 @@ namespace DSL
         {
             UnlinkCommon();
         }
+        // The decoder's pre-decode probe is added on child-added and must 
+        // be removed even if the decoded stream was never linked.
+        m_pFrameDecimator->RemoveAllPadProbes();
         m_isFullyLinked = false;
         m_isLinked = false;
     }
@@ -2342,6 +2387,16 @@ namespace DSL
                     
                 // Note - m_pDecoderStaticSinkpad unreferenced in DisableEosConsumer
             }
+            
+            // Decimate the parsed stream, a GOP at a time, before decode. 
+            // Added after the restart probe so that buffer PTS are adjusted.
+            GstPad* pDecoderSinkPad = 
+                gst_element_get_static_pad(GST_ELEMENT(pObject), "sink");
+            if (pDecoderSinkPad)
+            {
+                m_pFrameDecimator->AddPadProbe(pDecoderSinkPad, true);
+                gst_object_unref(pDecoderSinkPad);
+            }
         }
     }
     
@@ -3294,7 +3349,6 @@ namespace DSL
         , m_latency(latency)
         , m_firstConnectTime(0)
         , m_bufferTimeout(timeout)
-        , m_streamManagerTimerId(0)
         , m_reconnectionManagerTimerId(0)
         , m_connectionData{0}
         , m_reconnectionFailed(false)
@@ -3443,6 +3497,8 @@ namespace DSL
 
         // Note: don't need t worry about stopping the one-shot m_listenerNotifierTimerId
         
+        StallWatchdog::GetWatchdog()->RemoveDetector(this);
+        
         m_pSrcPadBufferProbe->RemovePadProbeHandler(m_TimestampPph);
     }
     
@@ -3462,12 +3518,14 @@ namespace DSL
         // Start the Stream mangement timer, only if timeout is enable and 
         if (m_bufferTimeout)
         {
-            // reset the first connect counter in case the pipeline is relinking 
+            // reset the first connect time in case the pipeline is relinking 
             // and playing after a previous play and stop.
-            m_firstConnectTime = 0;
+            m_firstConnectTime = g_get_real_time();
             
-            m_streamManagerTimerId = g_timeout_add(
-                DSL_RTSP_TEST_FOR_BUFFER_TIMEOUT_PERIOD_MS, 
+            // The single Stall Watchdog monitors the Timestamp PPH and calls
+            // the Stream Manager once the buffer timeout is exceeded.
+            StallWatchdog::GetWatchdog()->AddDetector(this, GetCStrName(),
+                m_TimestampPph.get(), m_bufferTimeout*1000, 
                 RtspStreamManagerHandler, this);
             LOG_INFO("Starting stream management for RTSP Source '" 
                 << GetName() << "'");
@@ -3488,12 +3546,11 @@ namespace DSL
             return;
         }
         
-        if (m_streamManagerTimerId)
+        // Note: the Stall Watchdog does not wait for the Stream Manager to 
+        // return if it's currently running. It holds a reference to this 
+        // Source until the Stream Manager returns.
+        if (StallWatchdog::GetWatchdog()->RemoveDetector(this))
         {
-            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_streamManagerMutex);
-            
-            g_source_remove(m_streamManagerTimerId);
-            m_streamManagerTimerId = 0;
             LOG_INFO("Stream management disabled for RTSP Source '" 
                 << GetName() << "'");
         }
@@ -3560,32 +3617,39 @@ namespace DSL
     void RtspSourceBintr::SetBufferTimeout(uint timeout)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_streamManagerMutex);
-        
-        if (m_bufferTimeout == timeout)
         {
-            LOG_WARN("Buffer timeout for RTSP Source '" << GetName() 
-                << "' is already set to " << timeout);
-            return;
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_streamManagerMutex);
+            
+            if (m_bufferTimeout == timeout)
+            {
+                LOG_WARN("Buffer timeout for RTSP Source '" << GetName() 
+                    << "' is already set to " << timeout);
+                return;
+            }
+            m_bufferTimeout = timeout;
         }
 
         // If we're all ready in a linked state, 
         if (IsLinked()) 
         {
-            // If stream management is currently running, shut it down regardless
-            if (m_streamManagerTimerId)
+            // If stream management is currently running, shut it down regardless.
+            // Note: the Stall Watchdog does not wait for the Stream Manager to
+            // return if it's currently running. It holds a reference to this 
+            // Source until the Stream Manager returns.
+            if (StallWatchdog::GetWatchdog()->RemoveDetector(this))
             {
-                // shutdown the current session
-                g_source_remove(m_streamManagerTimerId);
-                m_streamManagerTimerId = 0;
                 LOG_INFO("Stream management disabled for RTSP Source '" << GetName() << "'");
             }
             // If we have a new timeout value, we can renable
             if (timeout)
             {
+                LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_streamManagerMutex);
+                
                 // Start up stream mangement
-                m_streamManagerTimerId = g_timeout_add(timeout, 
-                    RtspReconnectionMangerHandler, this);
+                m_firstConnectTime = g_get_real_time();
+                StallWatchdog::GetWatchdog()->AddDetector(this, GetCStrName(),
+                    m_TimestampPph.get(), timeout*1000, 
+                    RtspStreamManagerHandler, this);
                 LOG_INFO("Stream management enabled for RTSP Source '" 
                     << GetName() << "' with timeout = " << timeout);
             }
@@ -3600,7 +3664,6 @@ namespace DSL
                 LOG_INFO("Reconnection management disabled for RTSP Source '" << GetName() << "'");
             }
         }
-        m_bufferTimeout = timeout;
     }
 
     void RtspSourceBintr::GetConnectionParams(uint* sleep, uint* timeout)
@@ -3941,6 +4004,29 @@ namespace DSL
                 return false;
             }
             
+            // Decimate the encoded stream, a GOP at a time, before decode.
+            // Note: the probe is added once, with the decoder, and is kept 
+            // when the Source is unlinked so that it's still in place when 
+            // the Source is relinked and played after a stop.
+            GstPad* pDecoderSinkPad = gst_element_get_static_pad(
+                m_pDecoder->GetGstElement(), "sink");
+            if (!pDecoderSinkPad)
+            {
+                LOG_ERROR("Failed to get decoder sink pad for RtspSourceBitnr '" 
+                    << GetName() << "'");
+                return false;
+            }
+            bool retval = m_pFrameDecimator->AddPadProbe(pDecoderSinkPad, true);
+            gst_object_unref(pDecoderSinkPad);
+            
+            if (!retval)
+            {
+                LOG_ERROR(
+                    "Failed to add pre-decode decimation for RtspSourceBitnr '" 
+                    << GetName() << "'");
+                return false;
+            }
+            
             if (!gst_element_sync_state_with_parent(m_pDepay->GetGstElement()) or
                 !gst_element_sync_state_with_parent(m_pParser->GetGstElement()))
             {
@@ -4018,26 +4104,27 @@ namespace DSL
             return true;
         }
 
-        struct timeval currentTime;
-        gettimeofday(&currentTime, NULL);
+        int64_t currentTime = g_get_real_time();
 
         GstState currentState;
         uint stateResult = GetState(currentState, 0);
         SetCurrentState(currentState);
         
         // Get the last buffer-time so we can determine if connection is nominal
-        struct timeval lastBufferTime;
-        m_TimestampPph->GetTime(lastBufferTime);
+        int64_t lastBufferTime = m_TimestampPph->GetTimeUs();
         
         // If we still haven't received our first buffer... we're waiting for the
         // the first connection attemp to complete
-        if (lastBufferTime.tv_sec == 0)
+        if (lastBufferTime == 0)
         {
-            // Increment the total time we've been waiting for connection.
-            m_firstConnectTime += DSL_RTSP_TEST_FOR_BUFFER_TIMEOUT_PERIOD_MS;
+            if (!m_firstConnectTime)
+            {
+                m_firstConnectTime = currentTime;
+            }
             
             // If we haven't exceeded our first connection wait time.
-            if (m_firstConnectTime < (m_connectionData.timeout*1000))
+            if ((currentTime - m_firstConnectTime) < 
+                (int64_t)m_connectionData.timeout*G_USEC_PER_SEC)
             {
                 LOG_DEBUG("RtspSourceBintr '" << GetName() 
                     << "' is waiting for first connection" );
@@ -4050,10 +4137,8 @@ namespace DSL
         }
         else
         {
-            double timeSinceLastBufferMs = 1000.0*(currentTime.tv_sec - lastBufferTime.tv_sec) + 
-                (currentTime.tv_usec - lastBufferTime.tv_usec) / 1000.0;
-
-            if (timeSinceLastBufferMs < m_bufferTimeout*1000)
+            if ((currentTime - lastBufferTime) < 
+                (int64_t)m_bufferTimeout*G_USEC_PER_SEC)
             {
                 // Timeout has not been exceeded, so return true to sleep again
                 return true;
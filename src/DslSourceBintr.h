@@ -32,6 +32,7 @@ THE SOFTWARE.
 #include "DslDewarperBintr.h"
 #include "DslTapBintr.h"
 #include "DslStateChange.h"
+#include "DslFrameDecimator.h"
 
 namespace DSL
 {
@@ -338,6 +339,38 @@ namespace DSL
          * @return true if successfully set, false otherwise.
          */
         bool SetBufferOutFrameRate(uint fpsN, uint fpsD);
+
+        /**
+         * @brief Gets the decimation frame-rate for the SourceBintr.
+         * The default value of 0 for fps_n and fps_d indicates no decimation.
+         * @param[out] fpsN current fpsN value to decimate the stream to.
+         * @param[out] fpsD current fpsD value to decimate the stream to.
+         */
+        void GetDecimationFrameRate(uint* fpsN, uint* fpsD);
+        
+        /**
+         * @brief Sets the decimation frame-rate for the SourceBintr. Can be 
+         * called at any time. Set fps_n and fps_d to 0 to disable decimation.
+         * @param[in] fpsN new fpsN value to decimate the stream to.
+         * @param[in] fpsD new fpsD value to decimate the stream to.
+         * @return true if successfully set, false otherwise.
+         */
+        bool SetDecimationFrameRate(uint fpsN, uint fpsD);
+
+        /**
+         * @brief Gets the decimation frame counters for the SourceBintr.
+         * @param[out] framesPassed number of frames passed.
+         * @param[out] framesDropped total number of frames dropped.
+         * @param[out] framesDroppedPreDecode number of the dropped frames
+         * that were dropped before decode.
+         */
+        void GetDecimationStats(uint64_t* framesPassed, uint64_t* framesDropped,
+            uint64_t* framesDroppedPreDecode);
+
+        /**
+         * @brief Clears the decimation frame counters for the SourceBintr.
+         */
+        void ClearDecimationStats();
         
         /**
          * @brief Gets the buffer-out-crop values for the SourceBintr.
@@ -523,6 +556,11 @@ namespace DSL
          */
         uint m_bufferOutOrientation;
 
+        /**
+         * @brief Frame decimator for this SourceBintr, disabled by default.
+         */
+        DSL_FRAME_DECIMATOR_PTR m_pFrameDecimator;
+
         /**
          * @brief Output-buffer Video Converter element for this SourceBintr.
          */
@@ -1862,8 +1900,9 @@ namespace DSL
         bool RemoveStateChangeListener(dsl_state_change_listener_cb listener);
 
         /**
-         * @brief Called periodically on timer experation to Check the status of the RTSP stream
-         * and to initiate a reconnection cycle when the last buffer time execeeds timeout
+         * @brief Called by the Stall Watchdog when the last buffer time exceeds 
+         * timeout to check the status of the RTSP stream and to initiate a 
+         * reconnection cycle
          */
         int StreamManager();
         
@@ -2083,9 +2122,10 @@ namespace DSL
         DSL_PPH_TIMESTAMP_PTR m_TimestampPph;
 
         /**
-         * @brief time incremented while waiting for first connection in ms.
+         * @brief wall-clock time, in microseconds, stream management started 
+         * waiting for the first connection, 0 if not waiting.
          */
-        uint m_firstConnectTime;
+        int64_t m_firstConnectTime;
         
         /**
          * @brief maximim time between successive buffers before determining the 
@@ -2093,11 +2133,6 @@ namespace DSL
          */
         uint m_bufferTimeout;
         
-        /**
-         * @brief gnome timer Id for RTSP stream-status and reconnect management 
-         */
-        uint m_streamManagerTimerId;
-        
         /**
          * @brief mutux to guard the buffer timeout managment read/write attributes.
          */
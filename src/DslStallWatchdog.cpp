@@ -0,0 +1,481 @@
+/*
+The MIT License
+
+Copyright (c) 2019-2021, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include "Dsl.h"
+#include "DslStallWatchdog.h"
+
+namespace DSL
+{
+    StallWatchdog* StallWatchdog::GetWatchdog()
+    {
+        // One time, thread-safe, initialization of the single instance. 
+        // Sources and PPHs can be created from any client thread.
+        static StallWatchdog* pInstance = []()
+        {
+            LOG_INFO("Stall Watchdog Initialization");
+
+            return new StallWatchdog();
+        }();
+        
+        return pInstance;
+    }
+
+    StallWatchdog::StallWatchdog()
+        : m_rootSlots(DSL_STALL_WHEEL_ROOT_SIZE)
+        , m_levelSlots(DSL_STALL_WHEEL_UPPER_LEVELS,
+            std::vector<std::list<gpointer>>(DSL_STALL_WHEEL_LEVEL_SIZE))
+        , m_currentTick(0)
+        , m_tickTime(0)
+        , m_tickTimerId(0)
+        , m_nextId(1)
+    {
+        LOG_FUNC();
+    }
+
+    StallWatchdog::~StallWatchdog()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_watchdogMutex);
+
+        if (m_tickTimerId)
+        {
+            g_source_remove(m_tickTimerId);
+        }
+    }
+
+    bool StallWatchdog::AddDetector(gpointer pDetector, const char* name,
+        TimestampPadProbeHandler* pTimestamp, uint timeout, GSourceFunc handler,
+        Base* pOwner)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_watchdogMutex);
+
+        if (m_detectors.find(pDetector) != m_detectors.end())
+        {
+            LOG_ERROR("Stall detector for '" << name
+                << "' has already been added to the Stall Watchdog");
+            return false;
+        }
+
+        // Start the single tick timer with the first detector.
+        if (!m_tickTimerId)
+        {
+            m_tickTime = g_get_monotonic_time();
+            m_tickTimerId = g_timeout_add(DSL_STALL_WATCHDOG_TICK_MS,
+                stall_watchdog_tick_cb, this);
+            LOG_INFO("Stall Watchdog tick timer started");
+        }
+
+        StallDetector& detector = m_detectors[pDetector];
+
+        detector.name = name;
+        detector.pTimestamp = pTimestamp;
+        detector.timeout = timeout;
+        detector.handler = handler;
+        detector.pOwner = pOwner;
+        detector.id = m_nextId++;
+        detector.addTime = g_get_real_time();
+        detector.armTime = detector.addTime;
+        detector.isStalled = false;
+        detector.stallBufferTime = 0;
+        detector.expiryTick = 0;
+        detector.pSlot = nullptr;
+
+        _schedule(pDetector, detector, (int64_t)timeout*1000);
+
+        LOG_INFO("Stall detector for '" << name
+            << "' added to the Stall Watchdog with timeout = " << timeout);
+        return true;
+    }
+
+    bool StallWatchdog::RemoveDetector(gpointer pDetector)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_watchdogMutex);
+
+        auto imap = m_detectors.find(pDetector);
+        if (imap == m_detectors.end())
+        {
+            return false;
+        }
+        LOG_INFO("Stall detector for '" << imap->second.name
+            << "' removed from the Stall Watchdog");
+
+        // Note: a handler currently being called is not waited on. Its owner
+        // is held by HandleTick until the handler returns.
+        _erase(imap);
+
+        return true;
+    }
+
+    bool StallWatchdog::SetDetectorTimeout(gpointer pDetector, uint timeout)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_watchdogMutex);
+
+        auto imap = m_detectors.find(pDetector);
+        if (imap == m_detectors.end())
+        {
+            return false;
+        }
+        StallDetector& detector = imap->second;
+
+        detector.timeout = timeout;
+
+        // Reschedule from the start of the current timeout period so that
+        // a shorter timeout is not delayed by the previous expiry.
+        if (detector.pSlot)
+        {
+            int64_t lastTime = std::max(detector.pTimestamp->GetTimeUs(),
+                detector.armTime);
+            int64_t delay = lastTime + (int64_t)timeout*1000 - g_get_real_time();
+
+            _schedule(pDetector, detector, std::max(delay, (int64_t)0));
+        }
+        return true;
+    }
+
+    uint StallWatchdog::GetNumDetectors()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_watchdogMutex);
+
+        return m_detectors.size();
+    }
+
+    void StallWatchdog::GetStalled(const dsl_stalled_source** sources,
+        uint* size)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_watchdogMutex);
+
+        m_stalledSources.clear();
+        m_stalledSourceNames.clear();
+
+        // reserve up front so that the name pointers remain valid
+        m_stalledSources.reserve(m_detectors.size());
+        m_stalledSourceNames.reserve(m_detectors.size());
+
+        int64_t currentTime = g_get_real_time();
+
+        for (auto const& imap: m_detectors)
+        {
+            const StallDetector& detector = imap.second;
+            int64_t bufferTime = detector.pTimestamp->GetTimeUs();
+
+            // A new buffer since the stall was detected clears the stall.
+            // Detectors still waiting on their first buffer, i.e. an RTSP
+            // Source that has yet to connect, are not reported as stalled.
+            if (!detector.isStalled or !bufferTime or 
+                bufferTime > detector.stallBufferTime)
+            {
+                continue;
+            }
+            m_stalledSourceNames.push_back(
+                std::wstring(detector.name.begin(), detector.name.end()));
+
+            dsl_stalled_source entry{0};
+            entry.name = m_stalledSourceNames.back().c_str();
+            entry.timeout = detector.timeout;
+            entry.time_since_last_buffer = (currentTime -
+                std::max(bufferTime, detector.addTime))/1000;
+
+            m_stalledSources.push_back(entry);
+        }
+        *sources = (m_stalledSources.size()) ? &m_stalledSources[0] : NULL;
+        *size = m_stalledSources.size();
+    }
+
+    int StallWatchdog::HandleTick()
+    {
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_watchdogMutex);
+
+            if (m_detectors.empty())
+            {
+                return false;
+            }
+
+            int64_t currentTime = g_get_real_time();
+            int64_t monotonicTime = g_get_monotonic_time();
+
+            // Process every tick that has elapsed since the last call. More
+            // than one if the main-loop was delayed.
+            while (m_tickTime <= monotonicTime)
+            {
+                uint index = m_currentTick & (DSL_STALL_WHEEL_ROOT_SIZE-1);
+
+                // Cascade the upper levels each time the root level wraps.
+                if (!index)
+                {
+                    for (uint level = 0; level < DSL_STALL_WHEEL_UPPER_LEVELS;
+                        level++)
+                    {
+                        uint levelIndex = (m_currentTick >>
+                            (DSL_STALL_WHEEL_ROOT_BITS +
+                                level*DSL_STALL_WHEEL_LEVEL_BITS)) &
+                            (DSL_STALL_WHEEL_LEVEL_SIZE-1);
+                        if (_cascade(level, levelIndex))
+                        {
+                            break;
+                        }
+                    }
+                }
+                // Check every detector in the expired slot. Note: detectors
+                // that are rescheduled are always moved to a later slot.
+                std::list<gpointer>& slot = m_rootSlots[index];
+                while (!slot.empty())
+                {
+                    gpointer pDetector = slot.front();
+
+                    _unschedule(m_detectors[pDetector]);
+                    _check(pDetector, currentTime);
+                }
+                m_currentTick++;
+                m_tickTime += DSL_STALL_WATCHDOG_TICK_MS*1000;
+            }
+            if (m_stalledBatch.empty())
+            {
+                return true;
+            }
+            LOG_DEBUG("Stall Watchdog delivering a batch of "
+                << m_stalledBatch.size() << " stalled detectors");
+        }
+
+        // Deliver the batch with the mutex released so that handlers are
+        // free to add, remove, and update detectors.
+        for (uint i = 0; ; i++)
+        {
+            gpointer pDetector(nullptr);
+            GSourceFunc handler(nullptr);
+            uint64_t id(0);
+            
+            // Holds the detector's owner until the handler returns. Declared
+            // before the mutex is locked below so that it's released with
+            // the mutex unlocked, as the owner's destructor removes the 
+            // detector.
+            std::shared_ptr<Base> pOwner;
+            {
+                LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_watchdogMutex);
+
+                if (i >= m_stalledBatch.size())
+                {
+                    m_stalledBatch.clear();
+                    break;
+                }
+                // skip detectors removed during delivery
+                pDetector = m_stalledBatch[i];
+                if (!pDetector)
+                {
+                    continue;
+                }
+                StallDetector& detector = m_detectors[pDetector];
+                if (detector.pOwner)
+                {
+                    try
+                    {
+                        pOwner = detector.pOwner->shared_from_this();
+                    }
+                    catch(const std::bad_weak_ptr&)
+                    {
+                        // The owner is not yet, or no longer, shared - i.e. 
+                        // being constructed or destroyed. Re-arm and skip.
+                        _schedule(pDetector, detector, 
+                            (int64_t)detector.timeout*1000);
+                        continue;
+                    }
+                }
+                handler = detector.handler;
+                id = detector.id;
+            }
+
+            int result(false);
+            try
+            {
+                result = handler(pDetector);
+            }
+            catch(...)
+            {
+                LOG_ERROR("Stall Watchdog caught an exception calling the "
+                    << "stall handler - removing the detector");
+            }
+
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_watchdogMutex);
+
+            // The detector may have been removed, or removed and added again,
+            // by the handler. In either case there is nothing more to do.
+            auto imap = m_detectors.find(pDetector);
+            if (imap == m_detectors.end() or imap->second.id != id)
+            {
+                continue;
+            }
+            if (!result)
+            {
+                _erase(imap);
+                continue;
+            }
+            // Re-arm the detector for a full timeout period.
+            imap->second.armTime = g_get_real_time();
+            _schedule(pDetector, imap->second, 
+                (int64_t)imap->second.timeout*1000);
+        }
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_watchdogMutex);
+
+        // false if the timer was stopped by the removal of the last detector
+        return (m_tickTimerId != 0);
+    }
+
+    void StallWatchdog::_erase(
+        std::unordered_map<gpointer, StallDetector>::iterator imap)
+    {
+        _unschedule(imap->second);
+
+        // If the detector is in the batch currently being delivered,
+        // clear it so that its handler is not called.
+        std::replace(m_stalledBatch.begin(), m_stalledBatch.end(),
+            imap->first, (gpointer)nullptr);
+
+        m_detectors.erase(imap);
+
+        // Stop the single tick timer with the last detector.
+        if (m_detectors.empty() and m_tickTimerId)
+        {
+            g_source_remove(m_tickTimerId);
+            m_tickTimerId = 0;
+            LOG_INFO("Stall Watchdog tick timer stopped");
+        }
+    }
+
+    void StallWatchdog::_schedule(gpointer pDetector, StallDetector& detector, 
+        int64_t delay)
+    {
+        _unschedule(detector);
+
+        int64_t tickUs = DSL_STALL_WATCHDOG_TICK_MS*1000;
+        int64_t ticks = (delay + tickUs - 1)/tickUs;
+
+        detector.expiryTick = m_currentTick + std::max(ticks, (int64_t)1);
+
+        _insert(pDetector, detector);
+    }
+
+    void StallWatchdog::_insert(gpointer pDetector, StallDetector& detector)
+    {
+        uint64_t delta = (detector.expiryTick > m_currentTick)
+            ? detector.expiryTick - m_currentTick
+            : 0;
+
+        std::list<gpointer>* pSlot(nullptr);
+
+        if (delta < DSL_STALL_WHEEL_ROOT_SIZE)
+        {
+            // Note: an expiry tick in the past is placed in the current slot
+            uint64_t expiryTick = std::max(detector.expiryTick, m_currentTick);
+            pSlot = &m_rootSlots[expiryTick & (DSL_STALL_WHEEL_ROOT_SIZE-1)];
+        }
+        else
+        {
+            uint level(0);
+            uint shift(DSL_STALL_WHEEL_ROOT_BITS);
+
+            while (level < DSL_STALL_WHEEL_UPPER_LEVELS-1 and
+                delta >= (1ULL << (shift + DSL_STALL_WHEEL_LEVEL_BITS)))
+            {
+                level++;
+                shift += DSL_STALL_WHEEL_LEVEL_BITS;
+            }
+            // Clamp expiries beyond the span of the wheel. The detector
+            // will be checked, and rescheduled, when the span is reached.
+            uint64_t maxDelta = (1ULL <<
+                (shift + DSL_STALL_WHEEL_LEVEL_BITS)) - 1;
+            if (delta > maxDelta)
+            {
+                detector.expiryTick = m_currentTick + maxDelta;
+            }
+            pSlot = &m_levelSlots[level][(detector.expiryTick >> shift) &
+                (DSL_STALL_WHEEL_LEVEL_SIZE-1)];
+        }
+        detector.pSlot = pSlot;
+        detector.slotPos = pSlot->insert(pSlot->end(), pDetector);
+    }
+
+    void StallWatchdog::_unschedule(StallDetector& detector)
+    {
+        if (detector.pSlot)
+        {
+            detector.pSlot->erase(detector.slotPos);
+            detector.pSlot = nullptr;
+        }
+    }
+
+    uint StallWatchdog::_cascade(uint level, uint index)
+    {
+        std::list<gpointer> slot;
+        slot.swap(m_levelSlots[level][index]);
+
+        for (auto const& pDetector: slot)
+        {
+            StallDetector& detector = m_detectors[pDetector];
+
+            detector.pSlot = nullptr;
+            _insert(pDetector, detector);
+        }
+        return index;
+    }
+
+    void StallWatchdog::_check(gpointer pDetector, int64_t currentTime)
+    {
+        StallDetector& detector = m_detectors[pDetector];
+
+        int64_t bufferTime = detector.pTimestamp->GetTimeUs();
+        int64_t deadline = std::max(bufferTime, detector.armTime) +
+            (int64_t)detector.timeout*1000;
+
+        // Buffers have been stamped within the timeout - lazily reschedule
+        // to the new deadline and clear any previous stall.
+        if (currentTime < deadline)
+        {
+            if (detector.isStalled and bufferTime > detector.stallBufferTime)
+            {
+                LOG_INFO("Stall cleared for '" << detector.name << "'");
+                detector.isStalled = false;
+            }
+            _schedule(pDetector, detector, deadline - currentTime);
+            return;
+        }
+        if (!detector.isStalled or bufferTime > detector.stallBufferTime)
+        {
+            LOG_INFO("Stall detected for '" << detector.name
+                << "' with timeout = " << detector.timeout);
+            detector.isStalled = true;
+            detector.stallBufferTime = bufferTime;
+        }
+        m_stalledBatch.push_back(pDetector);
+    }
+
+    static int stall_watchdog_tick_cb(gpointer pWatchdog)
+    {
+        return static_cast<StallWatchdog*>(pWatchdog)->HandleTick();
+    }
+}
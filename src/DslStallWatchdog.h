@@ -0,0 +1,336 @@
+/*
+The MIT License
+
+Copyright (c) 2019-2021, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#ifndef _DSL_STALL_WATCHDOG_H
+#define _DSL_STALL_WATCHDOG_H
+
+#include "Dsl.h"
+#include "DslApi.h"
+#include "DslPadProbeHandler.h"
+
+namespace DSL
+{
+    /**
+     * @brief period of the Stall Watchdog's single main-loop timer.
+     */
+    #define DSL_STALL_WATCHDOG_TICK_MS          10
+
+    /**
+     * @brief number of slots in the first level of the timer wheel, and
+     * in each of the upper levels. One first-level slot per tick.
+     */
+    #define DSL_STALL_WHEEL_ROOT_BITS           8
+    #define DSL_STALL_WHEEL_LEVEL_BITS          6
+    #define DSL_STALL_WHEEL_ROOT_SIZE           (1 << DSL_STALL_WHEEL_ROOT_BITS)
+    #define DSL_STALL_WHEEL_LEVEL_SIZE          (1 << DSL_STALL_WHEEL_LEVEL_BITS)
+
+    /**
+     * @brief number of upper levels in the timer wheel. With a 10 ms tick
+     * the wheel spans ~7.7 days. Longer timeouts are re-checked at the span.
+     */
+    #define DSL_STALL_WHEEL_UPPER_LEVELS        3
+
+    /**
+     * @struct StallDetector
+     * @brief a single stall detector registered with the Stall Watchdog.
+     */
+    struct StallDetector
+    {
+        /**
+         * @brief unique name of the detector's owner.
+         */
+        std::string name;
+
+        /**
+         * @brief Timestamp PPH stamped with the time of the last buffer.
+         */
+        TimestampPadProbeHandler* pTimestamp;
+
+        /**
+         * @brief maximum time between buffers in milliseconds.
+         */
+        uint timeout;
+
+        /**
+         * @brief handler to call on stall, returns true to continue
+         * watching, false to remove the detector.
+         */
+        GSourceFunc handler;
+
+        /**
+         * @brief object that owns the detector, held while the handler is
+         * being called. nullptr if the client guarantees its lifetime.
+         */
+        Base* pOwner;
+
+        /**
+         * @brief unique registration id, used to detect a detector that is
+         * removed and added again while its handler is being called.
+         */
+        uint64_t id;
+
+        /**
+         * @brief wall-clock time in microseconds the detector was added.
+         */
+        int64_t addTime;
+
+        /**
+         * @brief wall-clock time in microseconds the detector was last
+         * armed. The timeout is measured from the later of this time and
+         * the time of the last buffer.
+         */
+        int64_t armTime;
+
+        /**
+         * @brief true if the detector is currently stalled.
+         */
+        bool isStalled;
+
+        /**
+         * @brief time of the last buffer when the stall was detected. The
+         * stall is cleared once a newer buffer is stamped.
+         */
+        int64_t stallBufferTime;
+
+        /**
+         * @brief absolute tick the detector is scheduled to expire on.
+         */
+        uint64_t expiryTick;
+
+        /**
+         * @brief wheel slot the detector is currently in, nullptr if none.
+         */
+        std::list<gpointer>* pSlot;
+
+        /**
+         * @brief position of the detector in its wheel slot.
+         */
+        std::list<gpointer>::iterator slotPos;
+    };
+
+    /**
+     * @class StallWatchdog
+     * @brief Implements a single, process-wide watchdog for all buffer stall
+     * detectors. Detectors are kept in a hierarchical timer wheel driven by
+     * one main-loop timer. Buffers are stamped lock-free by each detector's
+     * Timestamp PPH and the timeout is checked lazily when the detector's
+     * wheel slot expires. All detectors that stall on the same tick are
+     * delivered as a single batch.
+     */
+    class StallWatchdog
+    {
+    public:
+
+        /**
+         * @brief Gets the singleton Stall Watchdog, creating it on first call.
+         * @return pointer to the Stall Watchdog.
+         */
+        static StallWatchdog* GetWatchdog();
+
+        /**
+         * @brief Adds a new stall detector to the Watchdog. The timeout is
+         * measured from the later of the last buffer and the time of add.
+         * @param[in] pDetector unique client pointer to identify the detector,
+         * passed to the handler on stall.
+         * @param[in] name unique name of the detector's owner.
+         * @param[in] pTimestamp Timestamp PPH to monitor.
+         * @param[in] timeout maximum time between buffers in milliseconds.
+         * @param[in] handler function to call on stall. Returns true to
+         * continue watching, false to remove the detector.
+         * @param[in] pOwner shared object that owns the detector. A reference
+         * is held while the handler is being called so that the owner is 
+         * never destroyed before the handler returns. nullptr if the client
+         * guarantees the lifetime of the detector.
+         * @return true if successfully added, false otherwise.
+         */
+        bool AddDetector(gpointer pDetector, const char* name,
+            TimestampPadProbeHandler* pTimestamp, uint timeout,
+            GSourceFunc handler, Base* pOwner = nullptr);
+
+        /**
+         * @brief Removes a stall detector from the Watchdog.
+         * @param[in] pDetector unique client pointer of the detector to remove.
+         * @return true if successfully removed, false if not found.
+         * Note: this call never waits on a handler being called by another
+         * thread, as the caller may hold a lock, i.e. the Services lock, that
+         * the handler needs. The handler's owner is held until it returns, 
+         * deferring its destruction to the thread calling the handler.
+         */
+        bool RemoveDetector(gpointer pDetector);
+
+        /**
+         * @brief Updates the timeout for a stall detector.
+         * @param[in] pDetector unique client pointer of the detector to update.
+         * @param[in] timeout new maximum time between buffers in milliseconds.
+         * @return true if successfully updated, false if not found.
+         */
+        bool SetDetectorTimeout(gpointer pDetector, uint timeout);
+
+        /**
+         * @brief Gets the number of stall detectors currently added.
+         * @return number of detectors.
+         */
+        uint GetNumDetectors();
+
+        /**
+         * @brief Gets all stall detectors currently in a stalled state.
+         * Detectors that have yet to receive their first buffer are excluded.
+         * @param[out] sources pointer to an array of dsl_stalled_source
+         * structures owned by the Watchdog, valid until the next call.
+         * @param[out] size number of structures in the array.
+         */
+        void GetStalled(const dsl_stalled_source** sources, uint* size);
+
+        /**
+         * @brief Handles the Watchdog's timer tick. Advances the timer wheel
+         * to the current time and calls the handler of every stalled
+         * detector. Can be called directly.
+         * @return true to continue the timer, false to stop.
+         */
+        int HandleTick();
+
+    private:
+
+        /**
+         * @brief private ctor for the singleton StallWatchdog.
+         */
+        StallWatchdog();
+
+        /**
+         * @brief private dtor for the singleton StallWatchdog.
+         */
+        ~StallWatchdog();
+
+        /**
+         * @brief Schedules a detector to expire after a delay.
+         * @param[in] pDetector unique client pointer of the detector.
+         * @param[in] detector detector to schedule.
+         * @param[in] delay delay in microseconds.
+         */
+        void _schedule(gpointer pDetector, StallDetector& detector, 
+            int64_t delay);
+
+        /**
+         * @brief Inserts a detector into the wheel slot for its expiry tick.
+         * @param[in] pDetector unique client pointer of the detector.
+         * @param[in] detector detector to insert.
+         */
+        void _insert(gpointer pDetector, StallDetector& detector);
+
+        /**
+         * @brief Removes a detector from its current wheel slot, if any.
+         * @param[in] detector detector to remove.
+         */
+        void _unschedule(StallDetector& detector);
+
+        /**
+         * @brief Erases a detector from the Watchdog, stopping the tick
+         * timer if it was the last detector.
+         * @param[in] imap iterator to the detector to erase.
+         */
+        void _erase(std::unordered_map<gpointer, StallDetector>::iterator imap);
+
+        /**
+         * @brief Moves all detectors in an upper-level slot down the wheel.
+         * @param[in] level upper level to cascade, 0..2.
+         * @param[in] index slot to cascade.
+         * @return the index of the cascaded slot.
+         */
+        uint _cascade(uint level, uint index);
+
+        /**
+         * @brief Checks a detector whose slot has expired, rescheduling it
+         * if a buffer has been stamped within its timeout, or adding it
+         * to the current batch of stalled detectors otherwise.
+         * @param[in] pDetector unique client pointer of the detector.
+         * @param[in] currentTime current wall-clock time in microseconds.
+         */
+        void _check(gpointer pDetector, int64_t currentTime);
+
+        /**
+         * @brief mutex to protect mutual access to the Watchdog's data.
+         */
+        DslMutex m_watchdogMutex;
+
+        /**
+         * @brief map of all detectors by client pointer.
+         */
+        std::unordered_map<gpointer, StallDetector> m_detectors;
+
+        /**
+         * @brief first level of the timer wheel, one slot per tick.
+         */
+        std::vector<std::list<gpointer>> m_rootSlots;
+
+        /**
+         * @brief upper levels of the timer wheel.
+         */
+        std::vector<std::vector<std::list<gpointer>>> m_levelSlots;
+
+        /**
+         * @brief next tick to be processed.
+         */
+        uint64_t m_currentTick;
+
+        /**
+         * @brief monotonic time in microseconds of the next tick.
+         */
+        int64_t m_tickTime;
+
+        /**
+         * @brief gnome timer Id for the Watchdog's tick timer.
+         */
+        uint m_tickTimerId;
+
+        /**
+         * @brief next unique registration id.
+         */
+        uint64_t m_nextId;
+
+        /**
+         * @brief current batch of stalled detectors being delivered.
+         * Detectors removed during delivery are set to nullptr.
+         */
+        std::vector<gpointer> m_stalledBatch;
+
+        /**
+         * @brief stalled sources returned by the last call to GetStalled.
+         */
+        std::vector<dsl_stalled_source> m_stalledSources;
+
+        /**
+         * @brief wstring names referenced by m_stalledSources.
+         */
+        std::vector<std::wstring> m_stalledSourceNames;
+    };
+
+    /**
+     * @brief Timer callback for the StallWatchdog's tick timer.
+     * @param[in] pWatchdog pointer to the StallWatchdog.
+     * @return true to continue the timer, false to stop.
+     */
+    static int stall_watchdog_tick_cb(gpointer pWatchdog);
+}
+
+#endif // _DSL_STALL_WATCHDOG_H
@@ -52,13 +52,13 @@ namespace DSL
             if (cudaError != cudaSuccess)
             {
                 LOG_ERROR("cudaSetDevice failed with error '" << cudaError << "'");
-                throw;
+                throw std::exception();
             }
             cudaError = cudaStreamCreate(&stream);
             if (cudaError != cudaSuccess)
             {    
                 LOG_ERROR("cudaStreamCreate failed with error '" << cudaError << "'");
-                throw;
+                throw std::exception();
             }
         }
 
@@ -104,7 +104,7 @@ namespace DSL
             if (!gst_buffer_map(pBuffer, this, GST_MAP_READ))
             {
                 LOG_ERROR("Failed to map gst buffer");
-                throw;
+                throw std::exception();
             }
             // set only when successful
             m_pBuffer = pBuffer;
@@ -229,8 +229,8 @@ namespace DSL
     /**
      * @struct DslTransformParams
      * @brief Surface transform params with coordinates and dimensions for 
-     * both source and destination surfaces. Scaling of source to destination 
-     * is not (currently) supported.
+     * both source and destination surfaces. The source rectangle is scaled
+     * to the destination rectangle when their dimensions differ.
      */
     struct DslTransformParams : public NvBufSurfTransformParams
     {
@@ -263,6 +263,31 @@ namespace DSL
             transform_filter = NvBufSurfTransformInter_Default;    
         }   
 
+        /**
+         * @brief ctor for the DslTransformParams structure, scaling the 
+         * source rectangle to the destination dimensions.
+         * @param left x-positional coordinate for upper left corner
+         * @param top y-positional coordinate for upper left corner
+         * @param width width of the source rectangle for the transform
+         * @param height height of the source rectangle for the transform
+         * @param dstWidth width of the destination rectangle for the transform
+         * @param dstHeight height of the destination rectangle for the transform
+         */
+        DslTransformParams(uint32_t left, uint32_t top, 
+            uint32_t width, uint32_t height, uint32_t dstWidth, uint32_t dstHeight)
+            : NvBufSurfTransformParams{0}
+            , m_srcRect{top, left, width, height} 
+            , m_dstRect{0, 0, dstWidth, dstHeight} 
+        {
+            LOG_FUNC();
+
+            src_rect = &m_srcRect;
+            dst_rect = &m_dstRect;
+            transform_flag = NVBUFSURF_TRANSFORM_CROP_SRC | 
+                NVBUFSURF_TRANSFORM_CROP_DST | NVBUFSURF_TRANSFORM_FILTER;
+            transform_filter = NvBufSurfTransformInter_Bilinear;    
+        }   
+
         /**
          * @brief dtor for the DslTransformParams structure
          */
@@ -399,21 +424,16 @@ namespace DSL
                 != NvBufSurfTransformError_Success)
             {
                 LOG_ERROR("NvBufSurfaceCreate failed");
-                throw;
+                throw std::exception();
             }
             if (NvBufSurfaceMemSet(m_pBufSurface, -1, -1, 0) != 
                 NvBufSurfTransformError_Success)
             {
                 LOG_ERROR("NvBufSurfaceMemSet failed");
-                throw;
+                NvBufSurfaceDestroy(m_pBufSurface);
+                throw std::exception();
             }
-            char dateTime[64] = {0};
-            time_t seconds = time(NULL);
-            struct tm currentTm;
-            localtime_r(&seconds, &currentTm);
-
-            std::strftime(dateTime, sizeof(dateTime), "%Y%m%d-%H%M%S", &currentTm);
-            m_dateTimeStr = dateTime;
+            updateDateTimeStr();
         }
         
         /**
@@ -498,6 +518,19 @@ namespace DSL
             return m_uniqueId;
         }
         
+        /**
+         * @brief Sets a new unique id for the BufferSurface, and updates its
+         * date-time string, when reused for a new image.
+         * @param[in] uniqueId new unique id for the BufferSurface.
+         */
+        void SetUniqueId(uint64_t uniqueId)
+        {
+            // No function log - avoid overhead.
+            
+            m_uniqueId = uniqueId;
+            updateDateTimeStr();
+        }
+        
         const char* GetDateTimeStr()
         {
             LOG_FUNC();
@@ -507,6 +540,20 @@ namespace DSL
         
     private:    
 
+        /**
+         * @brief Updates the date-time string with the current local time.
+         */
+        void updateDateTimeStr()
+        {
+            char dateTime[64] = {0};
+            time_t seconds = time(NULL);
+            struct tm currentTm;
+            localtime_r(&seconds, &currentTm);
+
+            std::strftime(dateTime, sizeof(dateTime), "%Y%m%d-%H%M%S", &currentTm);
+            m_dateTimeStr = dateTime;
+        }
+
         /**
          * @brief pointer to an NVIDIA NvBufferSurface structure.
          */
@@ -530,5 +577,670 @@ namespace DSL
 
     };
 
+    // -------------------------------------------------------------------------------
+
+    /**
+     * @brief Width and height granularity of the Surface Pool's buckets.
+     */
+    #define DSL_SURFACE_POOL_BUCKET_GRANULARITY 64
+    
+    /**
+     * @class DslBufferSurfacePool
+     * @brief Pool of mono RGBA BufferSurfaces bucketed by gpu-id, memory type,
+     * and dimensions rounded up to DSL_SURFACE_POOL_BUCKET_GRANULARITY. Each 
+     * surface is created and mapped once, and returned to its bucket when the 
+     * last reference to the acquired surface is released. The width and height 
+     * of an acquired surface are set to the requested dimensions within the 
+     * bucket's surface - the pitch is unchanged.
+     */
+    class DslBufferSurfacePool 
+        : public std::enable_shared_from_this<DslBufferSurfacePool>
+    {
+    public:
+    
+        /**
+         * @brief ctor for the DslBufferSurfacePool class
+         * @param[in] maxSurfacesPerBucket maximum number of free surfaces to 
+         * hold in each bucket, surfaces released to a full bucket are destroyed.
+         */
+        DslBufferSurfacePool(uint maxSurfacesPerBucket)
+            : m_maxSurfacesPerBucket(maxSurfacesPerBucket)
+            , m_inUse(0)
+            , m_acquired(0)
+            , m_hits(0)
+            , m_allocated(0)
+            , m_failed(0)
+        {
+            LOG_FUNC();
+        }
+        
+        /**
+         * @brief dtor for the DslBufferSurfacePool class
+         */
+        ~DslBufferSurfacePool()
+        {
+            LOG_FUNC();
+            
+            for (auto& bucket: m_buckets)
+            {
+                for (auto pSurface: bucket.second)
+                {
+                    delete pSurface;
+                }
+            }
+        }
+        
+        /**
+         * @brief Acquires a mapped mono RGBA surface from the pool, creating
+         * a new surface if the bucket for the requested dimensions is empty.
+         * @param[in] gpuId GPU ID for the surface.
+         * @param[in] width width of the requested surface in pixels.
+         * @param[in] height height of the requested surface in pixels.
+         * @param[in] memType memory type for the surface.
+         * @param[in] uniqueId unique id to assign to the surface.
+         * @return shared pointer to the surface, nullptr on failure.
+         */
+        std::shared_ptr<DslBufferSurface> Acquire(uint32_t gpuId, 
+            uint32_t width, uint32_t height, NvBufSurfaceMemType memType,
+            uint64_t uniqueId)
+        {
+            // No function log - avoid overhead.
+            
+            BucketKeyT bucketKey(gpuId, memType,
+                GST_ROUND_UP_N(width, DSL_SURFACE_POOL_BUCKET_GRANULARITY),
+                GST_ROUND_UP_N(height, DSL_SURFACE_POOL_BUCKET_GRANULARITY));
+
+            DslBufferSurface* pSurface(NULL);
+            {
+                LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_poolMutex);
+                
+                m_acquired++;
+                
+                std::vector<DslBufferSurface*>& bucket = m_buckets[bucketKey];
+                if (bucket.size())
+                {
+                    pSurface = bucket.back();
+                    bucket.pop_back();
+                    m_hits++;
+                }
+                else
+                {
+                    m_allocated++;
+                }
+                m_inUse++;
+            }
+            if (pSurface)
+            {
+                pSurface->SetUniqueId(uniqueId);
+            }
+            else
+            {
+                try
+                {
+                    DslSurfaceCreateParams surfaceCreateParams(gpuId, 
+                        std::get<2>(bucketKey), std::get<3>(bucketKey), 0, 
+                        NVBUF_COLOR_FORMAT_RGBA, memType);
+                        
+                    pSurface = new DslBufferSurface(1, surfaceCreateParams, uniqueId);
+                }
+                catch(...)
+                {
+                    pSurface = NULL;
+                }
+                if (!pSurface or !pSurface->Map())
+                {
+                    LOG_ERROR("Failed to create a new surface for the Surface Pool");
+                    delete pSurface;
+                    
+                    LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_poolMutex);
+                    m_inUse--;
+                    m_failed++;
+                    return nullptr;
+                }
+            }
+            
+            // The acquired surface is a view of the requested dimensions. 
+            setDimensions(pSurface, width, height);
+            
+            // Return the surface to the pool when the last reference is released,
+            // or destroy it if the pool has been destroyed first.
+            std::weak_ptr<DslBufferSurfacePool> pPool = shared_from_this();
+            
+            return std::shared_ptr<DslBufferSurface>(pSurface,
+                [pPool, bucketKey](DslBufferSurface* pSurface)
+                {
+                    std::shared_ptr<DslBufferSurfacePool> pSharedPool = pPool.lock();
+                    if (pSharedPool)
+                    {
+                        pSharedPool->release(pSurface, bucketKey);
+                    }
+                    else
+                    {
+                        delete pSurface;
+                    }
+                });
+        }
+        
+        /**
+         * @brief Gets the current metrics for the Surface Pool.
+         * @param[out] pooled number of free surfaces held by the pool.
+         * @param[out] inUse number of acquired surfaces not yet released.
+         * @param[out] acquired total number of surfaces acquired.
+         * @param[out] hits total number of surfaces acquired from a bucket.
+         * @param[out] allocated total number of new surfaces created.
+         * @param[out] failed total number of new surfaces that failed to create.
+         */
+        void GetMetrics(uint* pooled, uint* inUse, uint64_t* acquired, 
+            uint64_t* hits, uint64_t* allocated, uint64_t* failed)
+        {
+            LOG_FUNC();
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_poolMutex);
+            
+            *pooled = 0;
+            for (auto const& bucket: m_buckets)
+            {
+                *pooled += bucket.second.size();
+            }
+            *inUse = m_inUse;
+            *acquired = m_acquired;
+            *hits = m_hits;
+            *allocated = m_allocated;
+            *failed = m_failed;
+        }
+        
+        /**
+         * @brief Clears the acquired, hits, allocated, and failed counters. The 
+         * pooled and in-use counts are retained.
+         */
+        void ClearMetrics()
+        {
+            LOG_FUNC();
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_poolMutex);
+            
+            m_acquired = 0;
+            m_hits = 0;
+            m_allocated = 0;
+            m_failed = 0;
+        }
+        
+    private:
+    
+        /**
+         * @brief Bucket key - gpu-id, memory type, bucket width and height.
+         */
+        typedef std::tuple<uint32_t, uint, uint32_t, uint32_t> BucketKeyT;
+    
+        /**
+         * @brief Sets the width and height of a pooled surface and its 
+         * single RGBA plane.
+         * @param[in] pSurface pooled surface to update.
+         * @param[in] width new width in pixels.
+         * @param[in] height new height in pixels.
+         */
+        void setDimensions(DslBufferSurface* pSurface, 
+            uint32_t width, uint32_t height)
+        {
+            // No function log - avoid overhead.
+            
+            NvBufSurfaceParams& surfaceParams = (&(*pSurface))->surfaceList[0];
+            
+            surfaceParams.width = width;
+            surfaceParams.height = height;
+            surfaceParams.planeParams.width[0] = width;
+            surfaceParams.planeParams.height[0] = height;
+        }
+        
+        /**
+         * @brief Returns a released surface to its bucket, restoring the
+         * bucket's dimensions, or destroys it if the bucket is full.
+         * @param[in] pSurface surface to return to the pool.
+         * @param[in] bucketKey key of the bucket the surface was acquired from.
+         */
+        void release(DslBufferSurface* pSurface, const BucketKeyT& bucketKey)
+        {
+            // No function log - avoid overhead.
+            
+            setDimensions(pSurface, std::get<2>(bucketKey), std::get<3>(bucketKey));
+            {
+                LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_poolMutex);
+                
+                m_inUse--;
+                
+                std::vector<DslBufferSurface*>& bucket = m_buckets[bucketKey];
+                if (bucket.size() < m_maxSurfacesPerBucket)
+                {
+                    bucket.push_back(pSurface);
+                    return;
+                }
+            }
+            delete pSurface;
+        }
+        
+        /**
+         * @brief maximum number of free surfaces held in each bucket.
+         */
+        uint m_maxSurfacesPerBucket;
+        
+        /**
+         * @brief map of buckets of free surfaces.
+         */
+        std::map<BucketKeyT, std::vector<DslBufferSurface*>> m_buckets;
+        
+        /**
+         * @brief number of acquired surfaces not yet released.
+         */
+        uint m_inUse;
+        
+        /**
+         * @brief total number of surfaces acquired since last cleared.
+         */
+        uint64_t m_acquired;
+        
+        /**
+         * @brief total number of surfaces acquired from a bucket since last cleared.
+         */
+        uint64_t m_hits;
+        
+        /**
+         * @brief total number of new surfaces created since last cleared.
+         */
+        uint64_t m_allocated;
+        
+        /**
+         * @brief total number of new surfaces that failed to create since 
+         * last cleared.
+         */
+        uint64_t m_failed;
+        
+        /**
+         * @brief mutex to guard the buckets and metrics.
+         */
+        DslMutex m_poolMutex;
+    };
+
+    // -------------------------------------------------------------------------------
+
+    /**
+     * @class DslBatchedCropTransform
+     * @brief Crops any number of rectangles from a single surface of a batched
+     * buffer to destination surfaces with a single, batched NvBufSurfTransform. 
+     * The source surface is repeated once for each crop in the source batch.
+     */
+    class DslBatchedCropTransform
+    {
+    public:
+    
+        /**
+         * @brief ctor for the DslBatchedCropTransform class
+         * @param[in] pBatchedSurface batched surface to crop from.
+         * @param[in] index index of the surface to crop from.
+         */
+        DslBatchedCropTransform(NvBufSurface* pBatchedSurface, uint32_t index)
+            : m_pBatchedSurface(pBatchedSurface)
+            , m_index(index)
+        {
+            // No function log - avoid overhead.
+        }
+        
+        /**
+         * @brief Adds a crop to the batched transform.
+         * @param[in] pDstSurface mono surface to crop to, with the same
+         * width and height as the crop rectangle.
+         * @param left x-positional coordinate of the crop rectangle.
+         * @param top y-positional coordinate of the crop rectangle.
+         * @param width width of the crop rectangle.
+         * @param height height of the crop rectangle.
+         */
+        void Add(std::shared_ptr<DslBufferSurface> pDstSurface,
+            uint32_t left, uint32_t top, uint32_t width, uint32_t height)
+        {
+            // No function log - avoid overhead.
+            
+            m_srcSurfaceList.push_back(m_pBatchedSurface->surfaceList[m_index]);
+            m_dstSurfaceList.push_back((&(*pDstSurface))->surfaceList[0]);
+            m_srcRects.push_back({top, left, width, height});
+            m_dstRects.push_back({0, 0, width, height});
+            m_dstSurfaces.push_back(pDstSurface);
+        }
+        
+        /**
+         * @brief Transforms all crops added with a single batched transform.
+         * All destination surfaces must have the same gpu-id and memory type.
+         * @return true on successful transform, false otherwise
+         */
+        bool Transform()
+        {
+            // No function log - avoid overhead.
+            
+            if (m_dstSurfaces.empty())
+            {
+                return true;
+            }
+            uint32_t batchSize(m_dstSurfaces.size());
+            
+            NvBufSurface srcSurface = *m_pBatchedSurface;
+            srcSurface.batchSize = batchSize;
+            srcSurface.numFilled = batchSize;
+            srcSurface.isContiguous = false;
+            srcSurface.surfaceList = m_srcSurfaceList.data();
+            
+            NvBufSurface dstSurface = *(&(*m_dstSurfaces[0]));
+            dstSurface.batchSize = batchSize;
+            dstSurface.numFilled = batchSize;
+            dstSurface.isContiguous = false;
+            dstSurface.surfaceList = m_dstSurfaceList.data();
+            
+            NvBufSurfTransformParams transformParams{0};
+            transformParams.src_rect = m_srcRects.data();
+            transformParams.dst_rect = m_dstRects.data();
+            transformParams.transform_flag = NVBUFSURF_TRANSFORM_CROP_SRC | 
+                NVBUFSURF_TRANSFORM_CROP_DST;
+            transformParams.transform_filter = NvBufSurfTransformInter_Default;
+            
+            return (NvBufSurfTransform(&srcSurface, &dstSurface, 
+                &transformParams) == NvBufSurfTransformError_Success);
+        }
+        
+    private:
+    
+        /**
+         * @brief batched surface to crop from.
+         */
+        NvBufSurface* m_pBatchedSurface;
+        
+        /**
+         * @brief index of the surface to crop from.
+         */
+        uint32_t m_index;
+        
+        /**
+         * @brief source surface list - the source surface once for each crop.
+         */
+        std::vector<NvBufSurfaceParams> m_srcSurfaceList;
+        
+        /**
+         * @brief destination surface list - one destination surface per crop.
+         */
+        std::vector<NvBufSurfaceParams> m_dstSurfaceList;
+        
+        /**
+         * @brief source crop rectangles.
+         */
+        std::vector<NvBufSurfTransformRect> m_srcRects;
+        
+        /**
+         * @brief destination rectangles.
+         */
+        std::vector<NvBufSurfTransformRect> m_dstRects;
+        
+        /**
+         * @brief destination surfaces, held for the life of the transform.
+         */
+        std::vector<std::shared_ptr<DslBufferSurface>> m_dstSurfaces;
+    };
+
+    // -------------------------------------------------------------------------------
+
+    /**
+     * @class DslBufferSurfaceRing
+     * @brief Ring of mapped mono surfaces keyed by frame number and NTP timestamp,
+     * bounded by the total size of its surfaces and by the age of its oldest 
+     * surface relative to its newest. The ring's slots are reused, and evicted 
+     * surfaces are released to their owner, e.g. a DslBufferSurfacePool.
+     */
+    class DslBufferSurfaceRing
+    {
+    public:
+    
+        /**
+         * @brief Retained surface with the frame number and NTP timestamp of 
+         * the frame it was copied from.
+         */
+        struct Entry
+        {
+            /**
+             * @brief frame number of the retained frame.
+             */
+            uint64_t frameNumber;
+            
+            /**
+             * @brief NTP timestamp of the retained frame in nanoseconds.
+             */
+            uint64_t ntpTimestamp;
+            
+            /**
+             * @brief size of the retained surface in bytes.
+             */
+            uint64_t size;
+            
+            /**
+             * @brief true once the retained surface has been captured.
+             */
+            bool captured;
+            
+            /**
+             * @brief the retained surface, nullptr if the slot is free.
+             */
+            std::shared_ptr<DslBufferSurface> pBufferSurface;
+        };
+    
+        /**
+         * @brief ctor for the DslBufferSurfaceRing class
+         * @param[in] maxBytes maximum total size of the retained surfaces.
+         * @param[in] maxAge maximum age in nanoseconds of the oldest surface
+         * relative to the newest.
+         */
+        DslBufferSurfaceRing(uint64_t maxBytes, uint64_t maxAge)
+            : m_maxBytes(maxBytes)
+            , m_maxAge(maxAge)
+            , m_head(0)
+            , m_count(0)
+            , m_bytes(0)
+        {
+            LOG_FUNC();
+        }
+        
+        /**
+         * @brief Adds a surface to the ring, then evicts the oldest surfaces
+         * until the ring is within its size and age bounds.
+         * @param[in] frameNumber frame number of the frame copied to the surface.
+         * @param[in] ntpTimestamp NTP timestamp of the frame in nanoseconds.
+         * @param[in] pBufferSurface mapped surface to retain.
+         */
+        void Push(uint64_t frameNumber, uint64_t ntpTimestamp, 
+            std::shared_ptr<DslBufferSurface> pBufferSurface)
+        {
+            // No function log - avoid overhead.
+            
+            // The slots only grow until the ring reaches its steady-state size.
+            if (m_count == m_entries.size())
+            {
+                std::vector<Entry> entries(std::max<size_t>(8, m_count*2));
+                for (uint i = 0; i < m_count; i++)
+                {
+                    entries[i] = std::move(m_entries[(m_head+i) % m_count]);
+                }
+                m_entries.swap(entries);
+                m_head = 0;
+            }
+            Entry& entry = m_entries[(m_head+m_count) % m_entries.size()];
+            
+            entry.frameNumber = frameNumber;
+            entry.ntpTimestamp = ntpTimestamp;
+            entry.size = (&(*pBufferSurface))->surfaceList[0].dataSize;
+            entry.captured = false;
+            entry.pBufferSurface = pBufferSurface;
+            
+            m_count++;
+            m_bytes += entry.size;
+            
+            // Always keep the newest surface, even if over budget on its own.
+            while (m_count > 1 and (m_bytes > m_maxBytes or 
+                (ntpTimestamp > m_entries[m_head].ntpTimestamp and
+                    ntpTimestamp - m_entries[m_head].ntpTimestamp > m_maxAge)))
+            {
+                pop();
+            }
+        }
+        
+        /**
+         * @brief Finds the retained surface for a frame number.
+         * @param[in] frameNumber frame number to find.
+         * @return pointer to the entry, NULL if not found.
+         */
+        Entry* FindFrame(uint64_t frameNumber)
+        {
+            // No function log - avoid overhead.
+            
+            for (uint i = 0; i < m_count; i++)
+            {
+                Entry& entry = at(i);
+                if (entry.frameNumber == frameNumber)
+                {
+                    return &entry;
+                }
+            }
+            return NULL;
+        }
+        
+        /**
+         * @brief Finds the retained surface with the closest NTP timestamp.
+         * @param[in] ntpTimestamp NTP timestamp in nanoseconds to find.
+         * @return pointer to the entry, NULL if the ring is empty.
+         */
+        Entry* FindNearest(uint64_t ntpTimestamp)
+        {
+            // No function log - avoid overhead.
+            
+            Entry* pNearest(NULL);
+            uint64_t nearestDelta(UINT64_MAX);
+            
+            for (uint i = 0; i < m_count; i++)
+            {
+                Entry& entry = at(i);
+                uint64_t delta = (entry.ntpTimestamp > ntpTimestamp)
+                    ? entry.ntpTimestamp - ntpTimestamp
+                    : ntpTimestamp - entry.ntpTimestamp;
+                if (delta < nearestDelta)
+                {
+                    pNearest = &entry;
+                    nearestDelta = delta;
+                }
+            }
+            return pNearest;
+        }
+        
+        /**
+         * @brief Finds all retained surfaces within a range of NTP timestamps.
+         * @param[in] startTimestamp start of the range, inclusive.
+         * @param[in] endTimestamp end of the range, inclusive.
+         * @return pointers to the entries found, oldest first.
+         */
+        std::vector<Entry*> FindRange(uint64_t startTimestamp, uint64_t endTimestamp)
+        {
+            // No function log - avoid overhead.
+            
+            std::vector<Entry*> entries;
+            for (uint i = 0; i < m_count; i++)
+            {
+                Entry& entry = at(i);
+                if (entry.ntpTimestamp >= startTimestamp and 
+                    entry.ntpTimestamp <= endTimestamp)
+                {
+                    entries.push_back(&entry);
+                }
+            }
+            return entries;
+        }
+        
+        /**
+         * @brief Releases all retained surfaces.
+         */
+        void Clear()
+        {
+            LOG_FUNC();
+            
+            while (m_count)
+            {
+                pop();
+            }
+        }
+        
+        /**
+         * @brief Gets the current number of retained surfaces.
+         * @return number of retained surfaces.
+         */
+        uint GetCount()
+        {
+            return m_count;
+        }
+        
+        /**
+         * @brief Gets the current total size of the retained surfaces.
+         * @return total size in bytes.
+         */
+        uint64_t GetBytes()
+        {
+            return m_bytes;
+        }
+        
+    private:
+    
+        /**
+         * @brief Gets the entry at a position in the ring, oldest first.
+         * @param[in] index position of the entry.
+         * @return reference to the entry.
+         */
+        Entry& at(uint index)
+        {
+            return m_entries[(m_head+index) % m_entries.size()];
+        }
+        
+        /**
+         * @brief Evicts the oldest retained surface.
+         */
+        void pop()
+        {
+            Entry& entry = m_entries[m_head];
+            
+            m_bytes -= entry.size;
+            entry.pBufferSurface = nullptr;
+            
+            m_head = (m_head+1) % m_entries.size();
+            m_count--;
+        }
+        
+        /**
+         * @brief maximum total size of the retained surfaces in bytes.
+         */
+        uint64_t m_maxBytes;
+        
+        /**
+         * @brief maximum age in nanoseconds of the oldest surface relative 
+         * to the newest.
+         */
+        uint64_t m_maxAge;
+        
+        /**
+         * @brief ring slots, reused once the ring reaches its steady-state size.
+         */
+        std::vector<Entry> m_entries;
+        
+        /**
+         * @brief index of the oldest entry.
+         */
+        uint m_head;
+        
+        /**
+         * @brief current number of entries.
+         */
+        uint m_count;
+        
+        /**
+         * @brief current total size of the retained surfaces in bytes.
+         */
+        uint64_t m_bytes;
+    };
+
 }
 #endif // _DSL_SURFACE_TRANSFORM_H
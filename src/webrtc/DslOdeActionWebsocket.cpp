@@ -0,0 +1,114 @@
+/*
+The MIT License
+
+Copyright (c) 2019-2021, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include "Dsl.h"
+#include "DslOdeTrigger.h"
+#include "DslOdeActionWebsocket.h"
+
+namespace DSL
+{
+    WebsocketPublishOdeAction::WebsocketPublishOdeAction(const char* name,
+        const char* topic)
+        : OdeAction(name)
+        , m_topic(topic)
+    {
+        LOG_FUNC();
+    }
+
+    WebsocketPublishOdeAction::~WebsocketPublishOdeAction()
+    {
+        LOG_FUNC();
+    }
+
+    void WebsocketPublishOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
+        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+        NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
+    {
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        
+        if (!m_enabled)
+        {
+            return;
+        }
+        DSL_ODE_TRIGGER_PTR pTrigger = 
+            std::dynamic_pointer_cast<OdeTrigger>(pOdeTrigger);
+
+        JsonObject* eventJson = json_object_new();
+        json_object_set_string_member(eventJson, "trigger", 
+            pTrigger->GetCStrName());
+        json_object_set_int_member(eventJson, "event_id", 
+            pTrigger->s_eventCount);
+        json_object_set_int_member(eventJson, "ntp_timestamp", 
+            pFrameMeta->ntp_timestamp);
+        json_object_set_int_member(eventJson, "source_id", 
+            pFrameMeta->source_id);
+        json_object_set_int_member(eventJson, "frame_num", 
+            pFrameMeta->frame_num);
+        json_object_set_boolean_member(eventJson, "inference_done", 
+            pFrameMeta->bInferDone);
+
+        if (pObjectMeta)
+        {
+            JsonObject* objectJson = json_object_new();
+            json_object_set_int_member(objectJson, "class_id", 
+                pObjectMeta->class_id);
+            json_object_set_int_member(objectJson, "tracking_id", 
+                pObjectMeta->object_id);
+            json_object_set_string_member(objectJson, "label", 
+                pObjectMeta->obj_label);
+            json_object_set_double_member(objectJson, "confidence", 
+                pObjectMeta->confidence);
+            json_object_set_int_member(objectJson, "persistence", 
+                pObjectMeta->misc_obj_info[DSL_OBJECT_INFO_PERSISTENCE]);
+            json_object_set_int_member(objectJson, "left", 
+                lrint(pObjectMeta->rect_params.left));
+            json_object_set_int_member(objectJson, "top", 
+                lrint(pObjectMeta->rect_params.top));
+            json_object_set_int_member(objectJson, "width", 
+                lrint(pObjectMeta->rect_params.width));
+            json_object_set_int_member(objectJson, "height", 
+                lrint(pObjectMeta->rect_params.height));
+            json_object_set_object_member(eventJson, "object", objectJson);
+        }
+        else
+        {
+            json_object_set_int_member(eventJson, "occurrences", 
+                pFrameMeta->misc_frame_info[DSL_FRAME_INFO_OCCURRENCES]);
+        }
+
+        JsonNode* root = json_node_init_object(json_node_alloc(), eventJson);
+        JsonGenerator* generator = json_generator_new();
+        json_generator_set_root(generator, root);
+        gchar* data = json_generator_to_data(generator, NULL);
+
+        // Thread safe, queues the message and returns without blocking
+        SoupServerMgr::GetMgr()->Publish(m_topic.c_str(), data);
+
+        g_free(data);
+        g_object_unref(generator);
+        json_node_free(root);
+        json_object_unref(eventJson);
+    }
+
+}
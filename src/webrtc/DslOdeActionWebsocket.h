@@ -0,0 +1,84 @@
+/*
+The MIT License
+
+Copyright (c) 2019-2021, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#ifndef _DSL_ODE_ACTION_WEBSOCKET_H
+#define _DSL_ODE_ACTION_WEBSOCKET_H
+
+#include "Dsl.h"
+#include "DslApi.h"
+#include "DslOdeAction.h"
+#include "DslSoupServerMgr.h"
+
+namespace DSL
+{
+    #define DSL_ODE_ACTION_WEBSOCKET_PUBLISH_PTR \
+        std::shared_ptr<WebsocketPublishOdeAction>
+    #define DSL_ODE_ACTION_WEBSOCKET_PUBLISH_NEW(name, topic) \
+        std::shared_ptr<WebsocketPublishOdeAction>( \
+            new WebsocketPublishOdeAction(name, topic))
+
+    /**
+     * @class WebsocketPublishOdeAction
+     * @brief Websocket Publish ODE Action class
+     */
+    class WebsocketPublishOdeAction : public OdeAction
+    {
+    public:
+    
+        /**
+         * @brief ctor for the Websocket Publish ODE Action class
+         * @param[in] name unique name for the ODE Action
+         * @param[in] topic name of the Websocket Topic to publish to.
+         */
+        WebsocketPublishOdeAction(const char* name, const char* topic);
+        
+        /**
+         * @brief dtor for the Websocket Publish ODE Action class
+         */
+        ~WebsocketPublishOdeAction();
+        
+        /**
+         * @brief Handles the ODE occurrence by publishing the occurrence 
+         * data as a JSON object to the Websocket Topic.
+         * @param[in] pOdeTrigger shared pointer to ODE Trigger that triggered the event
+         * @param[in] pBuffer pointer to the batched stream buffer that triggered the event
+         * @param[in] pFrameMeta pointer to the Frame Meta data that triggered the event
+         * @param[in] pObjectMeta pointer to Object Meta if Object detection event, 
+         * NULL if Frame level absence, total, min, max, etc. events.
+         */
+        void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
+            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
+
+    private:
+
+        /**
+         * @brief name of the Websocket Topic to publish to.
+         */
+        std::string m_topic;
+    };
+
+}
+
+#endif // _DSL_ODE_ACTION_WEBSOCKET_H
@@ -27,6 +27,7 @@ THE SOFTWARE.
 #include "DslServicesValidate.h"
 #include "DslSinkWebRtcBintr.h"
 #include "DslSoupServerMgr.h"
+#include "DslOdeActionWebsocket.h"
 
 namespace DSL
 {
@@ -359,4 +360,199 @@ namespace DSL
         }
     }
 
-}
\ No newline at end of file
+    DslReturnType Services::WebsocketServerTopicAdd(const char* topic,
+        uint maxQueueSize, uint dropPolicy, boolean coalesce)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            if (SoupServerMgr::GetMgr()->HasTopic(topic))
+            {
+                LOG_ERROR("Websocket Server Topic '" << topic << "' is not unique");
+                return DSL_RESULT_WEBSOCKET_SERVER_TOPIC_NOT_UNIQUE;
+            }
+            if (!SoupServerMgr::GetMgr()->AddTopic(topic, 
+                maxQueueSize, dropPolicy, coalesce))
+            {
+                LOG_ERROR("The Websocket Server failed to add Topic '" 
+                    << topic << "'");
+                return DSL_RESULT_WEBSOCKET_SERVER_SET_FAILED;
+            }
+            LOG_INFO("The Websocket Server added Topic '" << topic 
+                << "' successfully");
+                
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("The Websocket Server threw an exception adding Topic '"
+                << topic << "'");
+            return DSL_RESULT_WEBSOCKET_SERVER_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::WebsocketServerTopicRemove(const char* topic)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            if (!SoupServerMgr::GetMgr()->HasTopic(topic))
+            {
+                LOG_ERROR("Websocket Server Topic '" << topic << "' was not found");
+                return DSL_RESULT_WEBSOCKET_SERVER_TOPIC_NOT_FOUND;
+            }
+            SoupServerMgr::GetMgr()->RemoveTopic(topic);
+
+            LOG_INFO("The Websocket Server removed Topic '" << topic 
+                << "' successfully");
+                
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("The Websocket Server threw an exception removing Topic '"
+                << topic << "'");
+            return DSL_RESULT_WEBSOCKET_SERVER_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::WebsocketServerTopicPublish(const char* topic,
+        const char* message)
+    {
+        // Note: the Services mutex is not required, the Soup Server 
+        // Manager's publish services are thread safe.
+        try
+        {
+            if (!SoupServerMgr::GetMgr()->HasTopic(topic))
+            {
+                LOG_ERROR("Websocket Server Topic '" << topic << "' was not found");
+                return DSL_RESULT_WEBSOCKET_SERVER_TOPIC_NOT_FOUND;
+            }
+            // The message is used as the "data" value of the publish envelope
+            // and must be valid JSON.
+            JsonParser* pJsonParser = json_parser_new();
+            bool isJson = json_parser_load_from_data(pJsonParser, 
+                message, -1, NULL);
+            g_object_unref(pJsonParser);
+
+            if (!isJson)
+            {
+                LOG_ERROR("Message for Websocket Server Topic '" << topic 
+                    << "' is not valid JSON");
+                return DSL_RESULT_WEBSOCKET_SERVER_TOPIC_PUBLISH_FAILED;
+            }
+            if (!SoupServerMgr::GetMgr()->Publish(topic, message))
+            {
+                LOG_ERROR("The Websocket Server failed to publish to Topic '" 
+                    << topic << "'");
+                return DSL_RESULT_WEBSOCKET_SERVER_TOPIC_PUBLISH_FAILED;
+            }
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("The Websocket Server threw an exception publishing to Topic '"
+                << topic << "'");
+            return DSL_RESULT_WEBSOCKET_SERVER_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::WebsocketServerTopicMetricsGet(const char* topic,
+        dsl_websocket_topic_metrics* metrics)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            if (!SoupServerMgr::GetMgr()->GetTopicMetrics(topic, metrics))
+            {
+                LOG_ERROR("Websocket Server Topic '" << topic << "' was not found");
+                return DSL_RESULT_WEBSOCKET_SERVER_TOPIC_NOT_FOUND;
+            }
+            LOG_INFO("The Websocket Server returned metrics for Topic '" 
+                << topic << "' successfully");
+                
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("The Websocket Server threw an exception getting metrics for Topic '"
+                << topic << "'");
+            return DSL_RESULT_WEBSOCKET_SERVER_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::OdeActionWebsocketPublishNew(const char* name, 
+        const char* topic)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            // ensure action name uniqueness 
+            if (m_odeActions.find(name) != m_odeActions.end())
+            {   
+                LOG_ERROR("ODE Action name '" << name << "' is not unique");
+                return DSL_RESULT_ODE_ACTION_NAME_NOT_UNIQUE;
+            }
+            if (!SoupServerMgr::GetMgr()->HasTopic(topic))
+            {
+                LOG_ERROR("Websocket Server Topic '" << topic << "' was not found");
+                return DSL_RESULT_WEBSOCKET_SERVER_TOPIC_NOT_FOUND;
+            }
+            m_odeActions[name] = DSL_ODE_ACTION_WEBSOCKET_PUBLISH_NEW(name, topic);
+
+            LOG_INFO("New ODE Websocket Publish Action '" << name 
+                << "' created successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("New ODE Websocket Publish Action '" << name 
+                << "' threw exception on create");
+            return DSL_RESULT_ODE_ACTION_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::OdeActionCaptureWebsocketTopicSet(const char* name, 
+        const char* topic)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+
+        try
+        {
+            DSL_RETURN_IF_ODE_ACTION_NAME_NOT_FOUND(m_odeActions, name);
+            DSL_RETURN_IF_ODE_ACTION_IS_NOT_CAPTURE_TYPE(m_odeActions, name);
+
+            if (strlen(topic) and !SoupServerMgr::GetMgr()->HasTopic(topic))
+            {
+                LOG_ERROR("Websocket Server Topic '" << topic << "' was not found");
+                return DSL_RESULT_WEBSOCKET_SERVER_TOPIC_NOT_FOUND;
+            }
+            DSL_ODE_ACTION_CATPURE_PTR pOdeAction = 
+                std::dynamic_pointer_cast<CaptureOdeAction>(m_odeActions[name]);
+
+            pOdeAction->SetWebsocketTopic(topic);
+
+            LOG_INFO("ODE Capture Action '" << name << "' set Websocket Topic '"
+                << topic << "' successfully");
+                
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Capture Action '" << name 
+                << "' threw an exception setting Websocket Topic '" << topic << "'");
+            return DSL_RESULT_ODE_ACTION_THREW_EXCEPTION;
+        }
+    }
+
+}
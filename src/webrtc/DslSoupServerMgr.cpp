@@ -176,7 +176,8 @@ namespace DSL
         : m_pSoupServer(NULL)
         , m_portNumber(0)
         , m_isListening(false)
-
+        , m_drainTimerId(0)
+        , m_pJsonParser(NULL)
     {
         LOG_FUNC();
 
@@ -190,13 +191,47 @@ namespace DSL
         soup_server_add_websocket_handler(m_pSoupServer, "/ws", NULL, NULL, 
             websocket_handler_cb, (gpointer)this, NULL);
 
+        // Separate handler for clients subscribing to published Topics
+        std::wstring wstrPublishPath(DSL_WEBSOCKET_SERVER_PUBLISH_PATH);
+        std::string publishPath(wstrPublishPath.begin(), wstrPublishPath.end());
+
+        soup_server_add_websocket_handler(m_pSoupServer, publishPath.c_str(), 
+            NULL, NULL, publish_handler_cb, (gpointer)this, NULL);
+
+        // New JSON Parser for subscriber requests
+        m_pJsonParser = json_parser_new();
+        if (!m_pJsonParser)
+        {
+            LOG_ERROR("Websocket Server Manager failed to create new JSON Parser");
+            throw;
+        }
+
         g_mutex_init(&m_serverMutex);
+        g_mutex_init(&m_publishMutex);
     }
 
     SoupServerMgr::~SoupServerMgr()
     {
         LOG_FUNC();
 
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_publishMutex);
+            if (m_drainTimerId)
+            {
+                g_source_remove(m_drainTimerId);
+            }
+            for (auto &imap: m_subscribers)
+            {
+                g_signal_handlers_disconnect_by_data(
+                    G_OBJECT(imap.first), (gpointer)this);
+                g_object_unref(G_OBJECT(imap.first));
+            }
+            m_subscribers.clear();
+            if (m_pJsonParser)
+            {
+                g_object_unref(G_OBJECT(m_pJsonParser));
+            }
+        }
         {
             LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_serverMutex);
             if (m_pSoupServer)
@@ -204,6 +239,7 @@ namespace DSL
                 g_object_unref(G_OBJECT(m_pSoupServer));        
             }
         }
+        g_mutex_clear(&m_publishMutex);
         g_mutex_clear(&m_serverMutex);
 
     }
@@ -428,6 +464,455 @@ namespace DSL
     }
 
 
+    bool SoupServerMgr::AddTopic(const char* topic, uint maxQueueSize, 
+        uint dropPolicy, bool coalesce)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_publishMutex);
+
+        if (m_topics.find(topic) != m_topics.end())
+        {
+            LOG_ERROR("Topic '" << topic 
+                << "' is not unique for the Websocket Server Manager");
+            return false;
+        }
+        if (!maxQueueSize or dropPolicy > DSL_WEBSOCKET_TOPIC_DROP_POLICY_DISCONNECT)
+        {
+            LOG_ERROR("Invalid queue size or drop policy for Topic '" 
+                << topic << "'");
+            return false;
+        }
+        m_topics[topic] = std::shared_ptr<WebsocketTopic>(
+            new WebsocketTopic(maxQueueSize, dropPolicy, coalesce));
+
+        return true;
+    }
+
+    bool SoupServerMgr::RemoveTopic(const char* topic)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_publishMutex);
+
+        if (m_topics.find(topic) == m_topics.end())
+        {
+            LOG_ERROR("Topic '" << topic 
+                << "' was not found with the Websocket Server Manager");
+            return false;
+        }
+        m_topics.erase(topic);
+
+        // Discard all unsent messages, subscriptions remain in place 
+        // in case the Topic is added again.
+        for (auto &imap: m_subscribers)
+        {
+            auto iter = imap.second->m_queues.find(topic);
+            if (iter != imap.second->m_queues.end())
+            {
+                iter->second.clear();
+            }
+        }
+        return true;
+    }
+
+    bool SoupServerMgr::HasTopic(const char* topic)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_publishMutex);
+
+        return (m_topics.find(topic) != m_topics.end());
+    }
+
+    bool SoupServerMgr::GetTopicMetrics(const char* topic, 
+        dsl_websocket_topic_metrics* metrics)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_publishMutex);
+
+        auto iter = m_topics.find(topic);
+        if (iter == m_topics.end())
+        {
+            LOG_ERROR("Topic '" << topic 
+                << "' was not found with the Websocket Server Manager");
+            return false;
+        }
+        *metrics = iter->second->m_metrics;
+
+        metrics->subscribers = 0;
+        for (auto &imap: m_subscribers)
+        {
+            if (imap.second->m_queues.find(topic) != imap.second->m_queues.end())
+            {
+                metrics->subscribers++;
+            }
+        }
+        return true;
+    }
+
+    bool SoupServerMgr::Publish(const char* topic, const char* data)
+    {
+        // Note: called from streaming threads - no LOG_FUNC
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_publishMutex);
+
+        if (m_topics.find(topic) == m_topics.end())
+        {
+            LOG_ERROR("Unable to publish to Topic '" << topic 
+                << "' - Topic not found");
+            return false;
+        }
+        std::shared_ptr<WebsocketMessage> pMessage = 
+            std::shared_ptr<WebsocketMessage>(new WebsocketMessage(
+                envelope(topic, data), NULL, 0));
+
+        queueMessage(topic, pMessage, 0, true);
+        return true;
+    }
+
+    bool SoupServerMgr::PublishImage(const char* topic, const char* data,
+        const void* pImage, size_t size, uint width, bool fullSize)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_publishMutex);
+
+        if (m_topics.find(topic) == m_topics.end())
+        {
+            LOG_ERROR("Unable to publish image to Topic '" << topic 
+                << "' - Topic not found");
+            return false;
+        }
+        std::shared_ptr<WebsocketMessage> pMessage = 
+            std::shared_ptr<WebsocketMessage>(new WebsocketMessage(
+                envelope(topic, data), pImage, size));
+
+        queueMessage(topic, pMessage, width, fullSize);
+        return true;
+    }
+
+    std::vector<uint> SoupServerMgr::GetThumbnailWidths(const char* topic)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_publishMutex);
+
+        std::vector<uint> widths;
+        for (auto &imap: m_subscribers)
+        {
+            if (imap.second->m_queues.find(topic) != imap.second->m_queues.end()
+                and std::find(widths.begin(), widths.end(), 
+                    imap.second->m_thumbnailWidth) == widths.end())
+            {
+                widths.push_back(imap.second->m_thumbnailWidth);
+            }
+        }
+        std::sort(widths.begin(), widths.end());
+        return widths;
+    }
+
+    void SoupServerMgr::queueMessage(const std::string& topic, 
+        std::shared_ptr<WebsocketMessage> pMessage, uint width, bool fullSize)
+    {
+        std::shared_ptr<WebsocketTopic> pTopic = m_topics[topic];
+        pTopic->m_metrics.published++;
+
+        for (auto &imap: m_subscribers)
+        {
+            std::shared_ptr<WebsocketSubscriber> pSubscriber = imap.second;
+
+            auto iter = pSubscriber->m_queues.find(topic);
+            if (iter == pSubscriber->m_queues.end() or pSubscriber->m_closePending)
+            {
+                continue;
+            }
+            // Image messages are only sent to clients requesting the image size.
+            if (width)
+            {
+                uint requested(pSubscriber->m_thumbnailWidth);
+                if ((fullSize and requested and requested < width) or
+                    (!fullSize and requested != width))
+                {
+                    continue;
+                }
+            }
+            std::deque<std::shared_ptr<WebsocketMessage>>& queue = iter->second;
+
+            // Replace the unsent message in place if coalescing.
+            if (pTopic->m_coalesce and queue.size())
+            {
+                queue.back() = pMessage;
+                pTopic->m_metrics.coalesced++;
+                continue;
+            }
+            if (queue.size() >= pTopic->m_maxQueueSize)
+            {
+                if (pTopic->m_dropPolicy == DSL_WEBSOCKET_TOPIC_DROP_POLICY_DROP_NEWEST)
+                {
+                    pTopic->m_metrics.dropped++;
+                    continue;
+                }
+                if (pTopic->m_dropPolicy == DSL_WEBSOCKET_TOPIC_DROP_POLICY_DISCONNECT)
+                {
+                    LOG_WARN("Disconnecting slow client from Topic '" << topic << "'");
+
+                    // Connection is closed by the drain timer in the main-loop.
+                    pTopic->m_metrics.dropped += queue.size() + 1;
+                    pTopic->m_metrics.disconnects++;
+                    pSubscriber->m_closePending = true;
+                    for (auto &iq: pSubscriber->m_queues)
+                    {
+                        iq.second.clear();
+                    }
+                    continue;
+                }
+                queue.pop_front();
+                pTopic->m_metrics.dropped++;
+            }
+            queue.push_back(pMessage);
+        }
+        if (!m_drainTimerId)
+        {
+            m_drainTimerId = g_timeout_add(DSL_WEBSOCKET_PUBLISH_DRAIN_INTERVAL_MS, 
+                publish_drain_timer_cb, (gpointer)this);
+        }
+    }
+
+    std::string SoupServerMgr::envelope(const char* topic, const char* data)
+    {
+        std::string text("{\"topic\":\"");
+        for (const char* c = topic; *c; c++)
+        {
+            if (*c == '"' or *c == '\\')
+            {
+                text.push_back('\\');
+                text.push_back(*c);
+            }
+            else if ((unsigned char)*c < 0x20)
+            {
+                char escaped[8];
+                snprintf(escaped, sizeof(escaped), "\\u%04x", *c);
+                text.append(escaped);
+            }
+            else
+            {
+                text.push_back(*c);
+            }
+        }
+        text.append("\",\"data\":");
+        text.append(data);
+        text.push_back('}');
+        return text;
+    }
+
+    void SoupServerMgr::HandlePublishOpen(SoupWebsocketConnection* pConnection)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_publishMutex);
+
+        // Need to add a reference so the object won't be freed on return.
+        g_object_ref(G_OBJECT(pConnection));
+
+        g_signal_connect(G_OBJECT(pConnection), "closed", 
+            G_CALLBACK(on_publish_closed_cb), (gpointer)this);
+        g_signal_connect(G_OBJECT(pConnection), "message", 
+            G_CALLBACK(on_publish_message_cb), (gpointer)this);
+
+        m_subscribers[pConnection] = std::shared_ptr<WebsocketSubscriber>(
+            new WebsocketSubscriber(pConnection));
+
+        LOG_INFO("New publish client connected, total = " << m_subscribers.size());
+    }
+
+    void SoupServerMgr::HandlePublishClosed(SoupWebsocketConnection* pConnection)
+    {
+        LOG_FUNC();
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_publishMutex);
+
+            if (m_subscribers.find(pConnection) == m_subscribers.end())
+            {
+                return;
+            }
+            m_subscribers.erase(pConnection);
+
+            LOG_INFO("Publish client disconnected, total = " << m_subscribers.size());
+        }
+        g_signal_handlers_disconnect_by_data(G_OBJECT(pConnection), (gpointer)this);
+        g_object_unref(G_OBJECT(pConnection));
+    }
+
+    void SoupServerMgr::HandlePublishMessage(SoupWebsocketConnection* pConnection, 
+        SoupWebsocketDataType dataType, GBytes* message)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_publishMutex);
+
+        auto iter = m_subscribers.find(pConnection);
+        if (iter == m_subscribers.end())
+        {
+            return;
+        }
+        if (dataType != SOUP_WEBSOCKET_DATA_TEXT)
+        {
+            LOG_ERROR("Publish client sent unsupported binary message");
+            return;
+        }
+        gsize size;
+        const gchar* data = (const gchar*)g_bytes_get_data(message, &size);
+
+        if (!json_parser_load_from_data(m_pJsonParser, data, size, NULL))
+        {
+            LOG_ERROR("Publish client sent an unknown message");
+            return;
+        }
+        JsonNode* pRootJson = json_parser_get_root(m_pJsonParser);
+        if (!JSON_NODE_HOLDS_OBJECT(pRootJson))
+        {
+            LOG_ERROR("Publish client sent a message without a root object");
+            return;
+        }
+        JsonObject* pRootJsonObject = json_node_get_object(pRootJson);
+        std::shared_ptr<WebsocketSubscriber> pSubscriber = iter->second;
+
+        if (json_object_has_member(pRootJsonObject, "subscribe"))
+        {
+            const gchar* topic = json_object_get_string_member(
+                pRootJsonObject, "subscribe");
+            if (topic)
+            {
+                LOG_INFO("Publish client subscribed to Topic '" << topic << "'");
+                pSubscriber->m_queues[topic];
+            }
+        }
+        if (json_object_has_member(pRootJsonObject, "unsubscribe"))
+        {
+            const gchar* topic = json_object_get_string_member(
+                pRootJsonObject, "unsubscribe");
+            if (topic)
+            {
+                LOG_INFO("Publish client unsubscribed from Topic '" << topic << "'");
+                pSubscriber->m_queues.erase(topic);
+            }
+        }
+        if (json_object_has_member(pRootJsonObject, "thumbnail_width"))
+        {
+            gint64 width = json_object_get_int_member(
+                pRootJsonObject, "thumbnail_width");
+
+            // Surface widths are always even, see CaptureOdeAction
+            pSubscriber->m_thumbnailWidth = (width > 0) 
+                ? GST_ROUND_DOWN_2((uint)width) 
+                : 0;
+            LOG_INFO("Publish client set thumbnail width to " 
+                << pSubscriber->m_thumbnailWidth);
+        }
+    }
+
+    bool SoupServerMgr::DrainPublishQueues()
+    {
+        // Messages and connections to service outside of the mutex, as 
+        // soup may emit the "closed" signal synchronously on send/close.
+        std::vector<std::pair<SoupWebsocketConnection*, 
+            std::shared_ptr<WebsocketMessage>>> messagesToSend;
+        std::vector<SoupWebsocketConnection*> connectionsToClose;
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_publishMutex);
+
+            for (auto &imap: m_subscribers)
+            {
+                SoupWebsocketConnection* pConnection = imap.first;
+                std::shared_ptr<WebsocketSubscriber> pSubscriber = imap.second;
+
+                if (soup_websocket_connection_get_state(pConnection) !=
+                    SOUP_WEBSOCKET_STATE_OPEN)
+                {
+                    continue;
+                }
+                if (pSubscriber->m_closePending)
+                {
+                    g_object_ref(G_OBJECT(pConnection));
+                    connectionsToClose.push_back(pConnection);
+                    continue;
+                }
+                // Backpressure - leave the client's messages queued until its 
+                // socket can accept more data.
+                GOutputStream* pOutputStream = g_io_stream_get_output_stream(
+                    soup_websocket_connection_get_io_stream(pConnection));
+                if (G_IS_POLLABLE_OUTPUT_STREAM(pOutputStream) and
+                    g_pollable_output_stream_can_poll(
+                        G_POLLABLE_OUTPUT_STREAM(pOutputStream)) and
+                    !g_pollable_output_stream_is_writable(
+                        G_POLLABLE_OUTPUT_STREAM(pOutputStream)))
+                {
+                    continue;
+                }
+                // Round-robin over the client's Topics so that a high-rate Topic 
+                // can't starve the others.
+                uint count(0);
+                bool dequeued(true);
+                while (dequeued and count < DSL_WEBSOCKET_PUBLISH_MAX_SENDS_PER_DRAIN)
+                {
+                    dequeued = false;
+                    for (auto &iq: pSubscriber->m_queues)
+                    {
+                        if (iq.second.empty() or 
+                            count == DSL_WEBSOCKET_PUBLISH_MAX_SENDS_PER_DRAIN)
+                        {
+                            continue;
+                        }
+                        g_object_ref(G_OBJECT(pConnection));
+                        messagesToSend.push_back(
+                            std::make_pair(pConnection, iq.second.front()));
+                        iq.second.pop_front();
+
+                        auto iter = m_topics.find(iq.first);
+                        if (iter != m_topics.end())
+                        {
+                            iter->second->m_metrics.sent++;
+                        }
+                        dequeued = true;
+                        count++;
+                    }
+                }
+            }
+        }
+        for (auto &ivec: messagesToSend)
+        {
+            if (soup_websocket_connection_get_state(ivec.first) ==
+                SOUP_WEBSOCKET_STATE_OPEN)
+            {
+                soup_websocket_connection_send_text(ivec.first, 
+                    ivec.second->m_text.c_str());
+                if (ivec.second->m_pBinary)
+                {
+                    gsize size;
+                    gconstpointer data = g_bytes_get_data(
+                        ivec.second->m_pBinary, &size);
+                    soup_websocket_connection_send_binary(ivec.first, data, size);
+                }
+            }
+            g_object_unref(G_OBJECT(ivec.first));
+        }
+        for (auto &ivec: connectionsToClose)
+        {
+            soup_websocket_connection_close(ivec, 
+                SOUP_WEBSOCKET_CLOSE_POLICY_VIOLATION, "send queue overflow");
+            g_object_unref(G_OBJECT(ivec));
+        }
+
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_publishMutex);
+
+        // Keep the timer running while any client has messages queued.
+        for (auto &imap: m_subscribers)
+        {
+            for (auto &iq: imap.second->m_queues)
+            {
+                if (iq.second.size())
+                {
+                    return true;
+                }
+            }
+        }
+        m_drainTimerId = 0;
+        return false;
+    }
+
     static void websocket_handler_cb(G_GNUC_UNUSED SoupServer* pServer, 
         SoupWebsocketConnection* pConnection, const char *path,
         G_GNUC_UNUSED SoupClientContext* clientContext, gpointer pSoupServerMgr)
@@ -437,4 +922,30 @@ namespace DSL
             pConnection, path);
     }
 
-}
\ No newline at end of file
+    static void publish_handler_cb(G_GNUC_UNUSED SoupServer* pServer, 
+        SoupWebsocketConnection* pConnection, const char *path,
+        G_GNUC_UNUSED SoupClientContext* clientContext, gpointer pSoupServerMgr)
+    {
+        LOG_INFO("Incomming publish connection.");
+        static_cast<SoupServerMgr*>(pSoupServerMgr)->HandlePublishOpen(pConnection);
+    }
+
+    static void on_publish_closed_cb(SoupWebsocketConnection* pConnection, 
+        gpointer pSoupServerMgr)
+    {
+        static_cast<SoupServerMgr*>(pSoupServerMgr)->HandlePublishClosed(pConnection);
+    }
+
+    static void on_publish_message_cb(SoupWebsocketConnection* pConnection, 
+        SoupWebsocketDataType dataType, GBytes* message, gpointer pSoupServerMgr)
+    {
+        static_cast<SoupServerMgr*>(pSoupServerMgr)->HandlePublishMessage(
+            pConnection, dataType, message);
+    }
+
+    static gboolean publish_drain_timer_cb(gpointer pSoupServerMgr)
+    {
+        return static_cast<SoupServerMgr*>(pSoupServerMgr)->DrainPublishQueues();
+    }
+
+}
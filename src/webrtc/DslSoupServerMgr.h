@@ -37,6 +37,13 @@ THE SOFTWARE.
 
 namespace DSL
 {
+    /**
+     * @brief interval for the timer that drains the publish send-queues, and
+     * the maximum number of messages sent to a single client per interval.
+     */
+    #define DSL_WEBSOCKET_PUBLISH_DRAIN_INTERVAL_MS     10
+    #define DSL_WEBSOCKET_PUBLISH_MAX_SENDS_PER_DRAIN   32
+
     class SignalingTransceiver
     {
     public:
@@ -129,6 +136,120 @@ namespace DSL
 
     static void on_remote_desc_set_cb(GstPromise * promise, gpointer pSignalingTransceiver);
 
+    /**
+     * @struct WebsocketMessage
+     * @brief A single message published to a Websocket Topic. The message is 
+     * shared by all subscribed clients that have it queued for sending.
+     */
+    struct WebsocketMessage
+    {
+        /**
+         * @brief ctor for the WebsocketMessage struct
+         * @param[in] text JSON envelope, sent as a text frame.
+         * @param[in] pData optional binary payload sent as a binary frame 
+         * following the text frame, NULL if none.
+         * @param[in] size size of the binary payload in bytes.
+         */
+        WebsocketMessage(const std::string& text, const void* pData, size_t size)
+            : m_text(text)
+            , m_pBinary(NULL)
+        {
+            if (pData)
+            {
+                m_pBinary = g_bytes_new(pData, size);
+            }
+        };
+
+        /**
+         * @brief dtor for the WebsocketMessage struct
+         */
+        ~WebsocketMessage()
+        {
+            if (m_pBinary)
+            {
+                g_bytes_unref(m_pBinary);
+            }
+        };
+
+        /**
+         * @brief JSON envelope {"topic":<topic>,"data":<data>}
+         */
+        std::string m_text;
+
+        /**
+         * @brief optional binary payload, i.e. a JPEG image.
+         */
+        GBytes* m_pBinary;
+    };
+
+    /**
+     * @struct WebsocketTopic
+     * @brief Publish settings and metrics for a Websocket Topic.
+     */
+    struct WebsocketTopic
+    {
+        WebsocketTopic(uint maxQueueSize, uint dropPolicy, bool coalesce)
+            : m_maxQueueSize(maxQueueSize)
+            , m_dropPolicy(dropPolicy)
+            , m_coalesce(coalesce)
+            , m_metrics{0}
+        {};
+
+        /**
+         * @brief maximum number of unsent messages queued per client.
+         */
+        uint m_maxQueueSize;
+
+        /**
+         * @brief one of the DSL_WEBSOCKET_TOPIC_DROP_POLICY constants.
+         */
+        uint m_dropPolicy;
+
+        /**
+         * @brief if true, only the latest unsent message is queued per client.
+         */
+        bool m_coalesce;
+
+        /**
+         * @brief running metrics for the Topic.
+         */
+        dsl_websocket_topic_metrics m_metrics;
+    };
+
+    /**
+     * @struct WebsocketSubscriber
+     * @brief A client connected on the publish path with its subscribed 
+     * Topics and bounded, per-Topic send-queues.
+     */
+    struct WebsocketSubscriber
+    {
+        WebsocketSubscriber(SoupWebsocketConnection* pConnection)
+            : m_pConnection(pConnection)
+            , m_thumbnailWidth(0)
+            , m_closePending(false)
+        {};
+
+        /**
+         * @brief client's unique Websocket connection.
+         */
+        SoupWebsocketConnection* m_pConnection;
+
+        /**
+         * @brief requested width for published images, 0 for full size.
+         */
+        uint m_thumbnailWidth;
+
+        /**
+         * @brief set when the drop policy requires the connection to be closed.
+         */
+        bool m_closePending;
+
+        /**
+         * @brief unsent messages mapped by subscribed Topic name.
+         */
+        std::map<std::string, std::deque<std::shared_ptr<WebsocketMessage>>> m_queues;
+    };
+
 
     class SoupServerMgr
     {
@@ -229,8 +350,125 @@ namespace DSL
          */
         bool RemoveClientListener(dsl_websocket_server_client_listener_cb listener);
 
+        /**
+         * @brief Adds a new Topic for subscribed clients.
+         * @param[in] topic unique name for the new Topic.
+         * @param[in] maxQueueSize maximum unsent messages queued per client.
+         * @param[in] dropPolicy one of the DSL_WEBSOCKET_TOPIC_DROP_POLICY constants.
+         * @param[in] coalesce if true, queue only the latest unsent message.
+         * @return true on successful add, false otherwise
+         */
+        bool AddTopic(const char* topic, uint maxQueueSize, 
+            uint dropPolicy, bool coalesce);
+
+        /**
+         * @brief Removes a Topic, discarding all unsent messages for the Topic.
+         * @param[in] topic unique name of the Topic to remove.
+         * @return true on successful remove, false otherwise
+         */
+        bool RemoveTopic(const char* topic);
+
+        /**
+         * @brief Checks whether a Topic has been previously added.
+         * @param[in] topic unique name of the Topic to check for.
+         * @return true if found, false otherwise
+         */
+        bool HasTopic(const char* topic);
+
+        /**
+         * @brief Gets the current metrics for a named Topic.
+         * @param[in] topic unique name of the Topic to query.
+         * @param[out] metrics current metrics for the Topic.
+         * @return true if the Topic was found, false otherwise
+         */
+        bool GetTopicMetrics(const char* topic, 
+            dsl_websocket_topic_metrics* metrics);
+
+        /**
+         * @brief Publishes a JSON value to all clients subscribed to a Topic.
+         * Thread safe - the message is queued and sent from the main-loop.
+         * @param[in] topic unique name of the Topic to publish to.
+         * @param[in] data JSON value to send as the "data" of the envelope.
+         * @return true if the Topic was found, false otherwise
+         */
+        bool Publish(const char* topic, const char* data);
+
+        /**
+         * @brief Publishes a JSON value followed by a binary image to all clients 
+         * subscribed to a Topic whose requested thumbnail width matches.
+         * @param[in] topic unique name of the Topic to publish to.
+         * @param[in] data JSON value to send as the "data" of the envelope.
+         * @param[in] pImage pointer to the encoded image data.
+         * @param[in] size size of the encoded image data in bytes.
+         * @param[in] width width of the image in pixels. 
+         * @param[in] fullSize if true, the image is sent to clients requesting
+         * full size images or a thumbnail width of at least width. If false,
+         * the image is sent to clients requesting a thumbnail of exactly width.
+         * @return true if the Topic was found, false otherwise
+         */
+        bool PublishImage(const char* topic, const char* data,
+            const void* pImage, size_t size, uint width, bool fullSize);
+
+        /**
+         * @brief Gets the set of distinct thumbnail widths requested by the
+         * clients currently subscribed to a Topic. 
+         * @param[in] topic unique name of the Topic to query.
+         * @return vector of distinct requested widths, 0 for full size.
+         */
+        std::vector<uint> GetThumbnailWidths(const char* topic);
+
+        /**
+         * @brief Handles a new Websocket Connection on the publish path.
+         * @param[in] pConnection unique connection to open 
+         */
+        void HandlePublishOpen(SoupWebsocketConnection* pConnection);
+
+        /**
+         * @brief Handles the close of a publish-path Websocket Connection.
+         * @param[in] pConnection unique connection that closed
+         */
+        void HandlePublishClosed(SoupWebsocketConnection* pConnection);
+
+        /**
+         * @brief Handles a subscribe, unsubscribe, or thumbnail request
+         * from a publish-path Websocket Connection.
+         * @param[in] pConnection unique connection for this message
+         * @param[in] dataType text or binary, only text is supported.
+         * @param[in] message JSON request message.
+         */
+        void HandlePublishMessage(SoupWebsocketConnection* pConnection, 
+            SoupWebsocketDataType dataType, GBytes* message);
+
+        /**
+         * @brief Sends queued messages to each subscribed client while the 
+         * client's connection remains writable. Called by the drain timer.
+         * @return true to reschedule while messages remain queued, 
+         * false otherwise.
+         */
+        bool DrainPublishQueues();
+
     private:
 
+        /**
+         * @brief Queues a new message for each client subscribed to a Topic,
+         * applying the Topic's coalesce setting and drop policy.
+         * ** Must be called with the publish mutex held **
+         * @param[in] topic name of the Topic to queue for.
+         * @param[in] pMessage shared message to queue.
+         * @param[in] width image width, 0 if not an image message.
+         * @param[in] fullSize see PublishImage.
+         */
+        void queueMessage(const std::string& topic, 
+            std::shared_ptr<WebsocketMessage> pMessage, uint width, bool fullSize);
+
+        /**
+         * @brief Wraps a JSON value in the publish envelope for a Topic.
+         * @param[in] topic name of the Topic, escaped for JSON.
+         * @param[in] data JSON value, used as is.
+         * @return {"topic":<topic>,"data":<data>}
+         */
+        std::string envelope(const char* topic, const char* data);
+
         /**
          * @brief instance pointer for this singleton class
          */
@@ -268,11 +506,48 @@ namespace DSL
          */
         std::map<dsl_websocket_server_client_listener_cb, void*> m_clientListeners;
 
+        /**
+         * @brief mutex to protect mutual access to Topics and Subscribers
+         */
+        GMutex m_publishMutex;
+
+        /**
+         * @brief map of all Topics mapped by their unique name.
+         */
+        std::map<std::string, std::shared_ptr<WebsocketTopic>> m_topics;
+
+        /**
+         * @brief map of all publish-path clients mapped by their connection.
+         */
+        std::map<SoupWebsocketConnection*, 
+            std::shared_ptr<WebsocketSubscriber>> m_subscribers;
+
+        /**
+         * @brief gnome timer id for the publish drain timer, 0 when not running.
+         */
+        uint m_drainTimerId;
+
+        /**
+         * @brief JSON Parser for parsing all subscriber requests.
+         */
+        JsonParser* m_pJsonParser;
     };
 
     static void websocket_handler_cb(G_GNUC_UNUSED SoupServer* pServer, 
         SoupWebsocketConnection* pConnection, const char *path,
         G_GNUC_UNUSED SoupClientContext* clientContext, gpointer pSoupServerMgr);
 
+    static void publish_handler_cb(G_GNUC_UNUSED SoupServer* pServer, 
+        SoupWebsocketConnection* pConnection, const char *path,
+        G_GNUC_UNUSED SoupClientContext* clientContext, gpointer pSoupServerMgr);
+
+    static void on_publish_closed_cb(SoupWebsocketConnection* pConnection, 
+        gpointer pSoupServerMgr);
+
+    static void on_publish_message_cb(SoupWebsocketConnection* pConnection, 
+        SoupWebsocketDataType dataType, GBytes* message, gpointer pSoupServerMgr);
+
+    static gboolean publish_drain_timer_cb(gpointer pSoupServerMgr);
+
 } // DSL
 #endif // _DSL_SOUP_SERVER_H
\ No newline at end of file
@@ -1240,6 +1240,133 @@ SCENARIO( "Multiple new components can Set and Get their NVIDIA mem type", "[com
     }
 }    
     
+SCENARIO( "A batch of properties can be set for GST Elements and Components", 
+    "[component-api]" )
+{
+    GIVEN( "A new GST Element and a new Component" ) 
+    {
+        std::wstring element_name(L"queue-element");
+        std::wstring property_leaky(L"leaky");
+        std::wstring property_max_size_buffers(L"max-size-buffers");
+        std::wstring property_max_size_time(L"queue-max-size-time");
+        std::wstring property_gpu_id(L"gpu-id");
+        std::wstring property_bad(L"non-existent-property");
+        std::wstring value_downstream(L"downstream");
+        
+        REQUIRE( dsl_gst_element_new(element_name.c_str(), 
+            L"queue") == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_tiler_new(tiler_name.c_str(), 
+            1280, 720) == DSL_RESULT_SUCCESS );
+
+        dsl_component_property properties[4] = {{0}};
+        DslReturnType results[4] = {99, 99, 99, 99};
+
+        properties[0].name = element_name.c_str();
+        properties[0].property = property_leaky.c_str();
+        properties[0].type = DSL_COMPONENT_PROPERTY_TYPE_STRING;
+        properties[0].string_value = value_downstream.c_str();
+
+        properties[1].name = element_name.c_str();
+        properties[1].property = property_max_size_buffers.c_str();
+        properties[1].type = DSL_COMPONENT_PROPERTY_TYPE_UINT;
+        properties[1].uint_value = 50;
+
+        properties[2].name = tiler_name.c_str();
+        properties[2].property = property_max_size_time.c_str();
+        properties[2].type = DSL_COMPONENT_PROPERTY_TYPE_UINT;
+        properties[2].uint_value = 2000000000;
+
+        properties[3].name = tiler_name.c_str();
+        properties[3].property = property_gpu_id.c_str();
+        properties[3].type = DSL_COMPONENT_PROPERTY_TYPE_UINT;
+        properties[3].uint_value = 0;
+
+        WHEN( "A valid batch of properties is set" ) 
+        {
+            REQUIRE( dsl_component_property_batch_set(properties, 
+                4, results) == DSL_RESULT_SUCCESS );
+
+            THEN( "All properties are updated correctly" ) 
+            {
+                for (uint i = 0; i < 4; i++)
+                {
+                    REQUIRE( results[i] == DSL_RESULT_SUCCESS );
+                }
+                int retLeaky(0);
+                uint retMaxSizeBuffers(0);
+                uint64_t retMaxSizeTime(0);
+                REQUIRE( dsl_gst_element_property_int_get(element_name.c_str(),
+                    property_leaky.c_str(), &retLeaky) == DSL_RESULT_SUCCESS );
+                REQUIRE( retLeaky == DSL_COMPONENT_QUEUE_LEAKY_DOWNSTREAM );
+                REQUIRE( dsl_gst_element_property_uint_get(element_name.c_str(),
+                    property_max_size_buffers.c_str(), 
+                    &retMaxSizeBuffers) == DSL_RESULT_SUCCESS );
+                REQUIRE( retMaxSizeBuffers == 50 );
+                REQUIRE( dsl_component_queue_max_size_get(tiler_name.c_str(),
+                    DSL_COMPONENT_QUEUE_UNIT_OF_TIME, 
+                    &retMaxSizeTime) == DSL_RESULT_SUCCESS );
+                REQUIRE( retMaxSizeTime == 2000000000 );
+
+                REQUIRE( dsl_component_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_gst_element_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+        WHEN( "A batch with one invalid property is set" ) 
+        {
+            properties[3].property = property_bad.c_str();
+            
+            REQUIRE( dsl_component_property_batch_set(properties, 
+                4, results) == DSL_RESULT_COMPONENT_PROPERTY_INVALID );
+
+            THEN( "No properties are updated" ) 
+            {
+                for (uint i = 0; i < 3; i++)
+                {
+                    REQUIRE( results[i] == DSL_RESULT_COMPONENT_PROPERTY_NOT_APPLIED );
+                }
+                REQUIRE( results[3] == DSL_RESULT_COMPONENT_PROPERTY_INVALID );
+                
+                int retLeaky(99);
+                uint retMaxSizeBuffers(0);
+                uint64_t retMaxSizeTime(0);
+                REQUIRE( dsl_gst_element_property_int_get(element_name.c_str(),
+                    property_leaky.c_str(), &retLeaky) == DSL_RESULT_SUCCESS );
+                REQUIRE( retLeaky == DSL_COMPONENT_QUEUE_LEAKY_NO );
+                REQUIRE( dsl_gst_element_property_uint_get(element_name.c_str(),
+                    property_max_size_buffers.c_str(), 
+                    &retMaxSizeBuffers) == DSL_RESULT_SUCCESS );
+                REQUIRE( retMaxSizeBuffers == 200 );
+                REQUIRE( dsl_component_queue_max_size_get(tiler_name.c_str(),
+                    DSL_COMPONENT_QUEUE_UNIT_OF_TIME, 
+                    &retMaxSizeTime) == DSL_RESULT_SUCCESS );
+                REQUIRE( retMaxSizeTime == 1000000000 );
+
+                REQUIRE( dsl_component_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_gst_element_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+        WHEN( "A batch with an out-of-range GST Element value is set" ) 
+        {
+            properties[0].type = DSL_COMPONENT_PROPERTY_TYPE_UINT;
+            properties[0].uint_value = 99;
+            
+            REQUIRE( dsl_component_property_batch_set(properties, 
+                4, results) == DSL_RESULT_GST_ELEMENT_SET_FAILED );
+
+            THEN( "The correct results are returned" ) 
+            {
+                REQUIRE( results[0] == DSL_RESULT_GST_ELEMENT_SET_FAILED );
+                for (uint i = 1; i < 4; i++)
+                {
+                    REQUIRE( results[i] == DSL_RESULT_COMPONENT_PROPERTY_NOT_APPLIED );
+                }
+                REQUIRE( dsl_component_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_gst_element_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
 SCENARIO( "The Component API checks for NULL input parameters", "[component-api]" )
 {
     GIVEN( "An empty list of Components" ) 
@@ -1370,6 +1497,15 @@ SCENARIO( "The Component API checks for NULL input parameters", "[component-api]
                     nvbufMemType) == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_component_nvbuf_mem_type_set_many(NULL, 
                     nvbufMemType) == DSL_RESULT_INVALID_INPUT_PARAM );
+
+                dsl_component_property properties[1] = {{0}};
+                DslReturnType results[1] = {0};
+                REQUIRE( dsl_component_property_batch_set(NULL, 
+                    1, results) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_component_property_batch_set(properties, 
+                    1, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_component_property_batch_set(properties, 
+                    1, results) == DSL_RESULT_INVALID_INPUT_PARAM );
                 
                 REQUIRE( dsl_component_list_size() == 0 );
             }
@@ -651,6 +651,112 @@ SCENARIO( "A Mailer can be added and removed from a Capture Action", "[ode-actio
     }
 }    
 
+SCENARIO( "A Capture Object Action can Get/Set its best-shot settings", "[ode-action-api]" )
+{
+    GIVEN( "A new Capture Object Action" )
+    {
+        std::wstring action_name(L"capture-action");
+        std::wstring outdir(L"./");
+
+        REQUIRE( dsl_ode_action_capture_object_new(action_name.c_str(), 
+            outdir.c_str()) == DSL_RESULT_SUCCESS );
+
+        boolean enabled(true), sharpness(true);
+        uint timeout(99), max_hold(99);
+        
+        REQUIRE( dsl_ode_action_capture_object_best_shot_get(action_name.c_str(),
+            &enabled, &timeout, &max_hold, &sharpness) == DSL_RESULT_SUCCESS );
+        REQUIRE( enabled == false );
+        REQUIRE( timeout == 0 );
+        REQUIRE( max_hold == 0 );
+        REQUIRE( sharpness == false );
+
+        WHEN( "New best-shot settings are set" )
+        {
+            REQUIRE( dsl_ode_action_capture_object_best_shot_set(action_name.c_str(),
+                true, 500, 10000, true) == DSL_RESULT_SUCCESS );
+
+            THEN( "The correct values are returned on get" ) 
+            {
+                REQUIRE( dsl_ode_action_capture_object_best_shot_get(action_name.c_str(),
+                    &enabled, &timeout, &max_hold, &sharpness) == DSL_RESULT_SUCCESS );
+                REQUIRE( enabled == true );
+                REQUIRE( timeout == 500 );
+                REQUIRE( max_hold == 10000 );
+                REQUIRE( sharpness == true );
+                    
+                REQUIRE( dsl_ode_action_delete(action_name.c_str()) == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_action_list_size() == 0 );
+            }
+        }
+        WHEN( "Best-shot is enabled with a timeout of 0" )
+        {
+            THEN( "The service must fail" ) 
+            {
+                REQUIRE( dsl_ode_action_capture_object_best_shot_set(action_name.c_str(),
+                    true, 0, 0, false) == DSL_RESULT_ODE_ACTION_PARAMETER_INVALID );
+                    
+                REQUIRE( dsl_ode_action_delete(action_name.c_str()) == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_action_list_size() == 0 );
+            }
+        }
+    }
+}    
+
+SCENARIO( "A Capture Action's capture metrics can be queried and cleared", "[ode-action-api]" )
+{
+    GIVEN( "A new Capture Frame Action and a new Print Action" )
+    {
+        std::wstring action_name(L"capture-action");
+        std::wstring print_action_name(L"print-action");
+        std::wstring outdir(L"./");
+
+        REQUIRE( dsl_ode_action_capture_frame_new(action_name.c_str(), 
+            outdir.c_str()) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_ode_action_print_new(print_action_name.c_str(), 
+            false) == DSL_RESULT_SUCCESS );
+
+        dsl_ode_action_capture_metrics metrics{99,99,99,99,99,99,99};
+
+        WHEN( "The capture metrics are queried" )
+        {
+            REQUIRE( dsl_ode_action_capture_metrics_get(action_name.c_str(),
+                &metrics) == DSL_RESULT_SUCCESS );
+
+            THEN( "All metrics are zero and can be cleared" ) 
+            {
+                REQUIRE( metrics.pooled == 0 );
+                REQUIRE( metrics.in_use == 0 );
+                REQUIRE( metrics.acquired == 0 );
+                REQUIRE( metrics.hits == 0 );
+                REQUIRE( metrics.allocated == 0 );
+                REQUIRE( metrics.failed == 0 );
+                REQUIRE( metrics.batches == 0 );
+                REQUIRE( metrics.captures == 0 );
+                
+                REQUIRE( dsl_ode_action_capture_metrics_clear(
+                    action_name.c_str()) == DSL_RESULT_SUCCESS );
+                    
+                REQUIRE( dsl_ode_action_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_action_list_size() == 0 );
+            }
+        }
+        WHEN( "The capture metrics are queried for a non-Capture Action" )
+        {
+            THEN( "The services must fail" ) 
+            {
+                REQUIRE( dsl_ode_action_capture_metrics_get(print_action_name.c_str(),
+                    &metrics) == DSL_RESULT_ODE_ACTION_NOT_THE_CORRECT_TYPE );
+                REQUIRE( dsl_ode_action_capture_metrics_clear(
+                    print_action_name.c_str()) == DSL_RESULT_ODE_ACTION_NOT_THE_CORRECT_TYPE );
+                    
+                REQUIRE( dsl_ode_action_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_action_list_size() == 0 );
+            }
+        }
+    }
+}    
+
 SCENARIO( "A new Customize Label ODE Action can be created and deleted", "[ode-action-api]" )
 {
     GIVEN( "Attributes for a new Customize Lable ODE Action" ) 
@@ -1435,6 +1541,62 @@ SCENARIO( "A new Pause Pipeline ODE Action can be created and deleted",
     }
 }
 
+SCENARIO( "The Async Metrics for an asynchronous ODE Action can be queried and cleared", 
+    "[ode-action-api]" )
+{
+    GIVEN( "A new Pause Pipeline ODE Action and a Print ODE Action" ) 
+    {
+        std::wstring action_name(L"pause-pipeline-action");
+        std::wstring pipelineName(L"pipeline");
+        std::wstring print_action_name(L"print-action");
+
+        REQUIRE( dsl_ode_action_pipeline_pause_new(action_name.c_str(), 
+            pipelineName.c_str()) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_ode_action_print_new(print_action_name.c_str(), 
+            false) == DSL_RESULT_SUCCESS );
+
+        WHEN( "The Async Metrics are queried for a new Action" ) 
+        {
+            dsl_ode_action_async_metrics metrics{0};
+            metrics.queued = 99;
+            REQUIRE( dsl_ode_action_async_metrics_get(action_name.c_str(), 
+                &metrics) == DSL_RESULT_SUCCESS );
+            
+            THEN( "All metrics are zero and can be cleared" ) 
+            {
+                REQUIRE( metrics.pending == 0 );
+                REQUIRE( metrics.max_pending == 0 );
+                REQUIRE( metrics.queued == 0 );
+                REQUIRE( metrics.coalesced == 0 );
+                REQUIRE( metrics.executed == 0 );
+                REQUIRE( metrics.latency_total == 0 );
+                REQUIRE( metrics.latency_max == 0 );
+                
+                REQUIRE( dsl_ode_action_async_metrics_clear(
+                    action_name.c_str()) == DSL_RESULT_SUCCESS );
+
+                REQUIRE( dsl_ode_action_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+        WHEN( "The Async Metrics are queried for a synchronous Action" ) 
+        {
+            dsl_ode_action_async_metrics metrics{0};
+            
+            THEN( "The services fail with the correct result" ) 
+            {
+                REQUIRE( dsl_ode_action_async_metrics_get(
+                    print_action_name.c_str(), &metrics) == 
+                    DSL_RESULT_ODE_ACTION_NOT_THE_CORRECT_TYPE );
+                REQUIRE( dsl_ode_action_async_metrics_clear(
+                    print_action_name.c_str()) == 
+                    DSL_RESULT_ODE_ACTION_NOT_THE_CORRECT_TYPE );
+
+                REQUIRE( dsl_ode_action_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
 SCENARIO( "A new Stop Pipeline ODE Action can be created and deleted", 
     "[ode-action-api]" )
 {
@@ -2407,6 +2569,18 @@ SCENARIO( "The ODE Action API checks for NULL input parameters", "[ode-action-ap
                     NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_ode_action_capture_object_new(action_name.c_str(), 
                     NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_action_capture_object_best_shot_get(NULL, 
+                    NULL, NULL, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_action_capture_object_best_shot_get(action_name.c_str(), 
+                    NULL, NULL, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_action_capture_object_best_shot_set(NULL, 
+                    true, 500, 0, false) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_action_capture_metrics_get(NULL, 
+                    NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_action_capture_metrics_get(action_name.c_str(), 
+                    NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_action_capture_metrics_clear(
+                    NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
 
                 REQUIRE( dsl_ode_action_label_customize_new(NULL,
                     NULL, 0) == DSL_RESULT_INVALID_INPUT_PARAM );
@@ -2564,6 +2738,13 @@ SCENARIO( "The ODE Action API checks for NULL input parameters", "[ode-action-ap
                 REQUIRE( dsl_ode_action_enabled_set(NULL, 
                     false) == DSL_RESULT_INVALID_INPUT_PARAM );
 
+                REQUIRE( dsl_ode_action_async_metrics_get(NULL, 
+                    NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_action_async_metrics_get(action_name.c_str(), 
+                    NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_action_async_metrics_clear(NULL) 
+                    == DSL_RESULT_INVALID_INPUT_PARAM );
+
                 REQUIRE( dsl_ode_action_delete(NULL) 
                     == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_ode_action_delete_many(NULL) 
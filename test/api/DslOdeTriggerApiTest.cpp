@@ -61,6 +61,45 @@ SCENARIO( "The ODE Triggers container is updated correctly on multiple new ODE T
     }
 }    
 
+static uint ode_check_for_occurrence_batch_cb(
+    const dsl_ode_object_record* records, uint count, 
+    uint8_t* results, void* client_data)
+{
+    return 0;
+}
+
+SCENARIO( "A new Custom Batch ODE Trigger can be created and deleted", 
+    "[ode-trigger-api]" )
+{
+    GIVEN( "Attributes for a new Custom Batch ODE Trigger" ) 
+    {
+        std::wstring odeTriggerName(L"custom-batch");
+        uint class_id(0);
+        uint limit(0);
+
+        REQUIRE( dsl_ode_trigger_list_size() == 0 );
+
+        WHEN( "A new Custom Batch ODE Trigger is created" ) 
+        {
+            REQUIRE( dsl_ode_trigger_custom_batch_new(odeTriggerName.c_str(), 
+                NULL, class_id, limit, ode_check_for_occurrence_batch_cb, 
+                NULL) == DSL_RESULT_SUCCESS );
+            
+            THEN( "The same name can't be used twice" ) 
+            {
+                REQUIRE( dsl_ode_trigger_list_size() == 1 );
+                REQUIRE( dsl_ode_trigger_custom_batch_new(odeTriggerName.c_str(), 
+                    NULL, class_id, limit, ode_check_for_occurrence_batch_cb, 
+                    NULL) == DSL_RESULT_ODE_TRIGGER_NAME_NOT_UNIQUE );
+
+                REQUIRE( dsl_ode_trigger_delete(odeTriggerName.c_str()) 
+                    == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_trigger_list_size() == 0 );
+            }
+        }
+    }
+}    
+
 SCENARIO( "The Triggers container is updated correctly on ODE Trigger deletion", 
     "[ode-trigger-api]" )
 {
@@ -1844,6 +1883,10 @@ SCENARIO( "The ODE Trigger API checks for NULL input parameters", "[ode-trigger-
                     0, 0) == DSL_RESULT_INVALID_INPUT_PARAM );
                 
                 REQUIRE( dsl_ode_trigger_absence_new(NULL, NULL, 0, 0) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_trigger_custom_batch_new(NULL, 
+                    NULL, 0, 0, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_trigger_custom_batch_new(triggerName.c_str(), 
+                    NULL, 0, 0, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_ode_trigger_intersection_new(NULL, NULL, 0, 0, 0) == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_ode_trigger_summation_new(NULL, NULL, 0, 0) == DSL_RESULT_INVALID_INPUT_PARAM );
 
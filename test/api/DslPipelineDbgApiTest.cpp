@@ -77,3 +77,32 @@ SCENARIO( "A Pipeline's graph can be dumped to .dot with and without timestamp",
         }
     }
 }
+
+SCENARIO( "The Pipeline Startup Profile API checks for NULL input parameters", 
+    "[pipeline-dbg-api]" )
+{
+    GIVEN( "An empty list of Pipelines" ) 
+    {
+        std::wstring pipelineName  = L"test-pipeline";
+        dsl_pipeline_startup_profile profile{0};
+        const dsl_pipeline_startup_event* events(NULL);
+        uint size(0);
+
+        WHEN( "When NULL pointers are used as input" ) 
+        {
+            THEN( "The API returns DSL_RESULT_INVALID_INPUT_PARAM in all cases" ) 
+            {
+                REQUIRE( dsl_pipeline_startup_profile_get(NULL, 
+                    &profile, &events, &size) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_startup_profile_get(pipelineName.c_str(), 
+                    NULL, &events, &size) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_startup_profile_get(pipelineName.c_str(), 
+                    &profile, NULL, &size) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_startup_profile_get(pipelineName.c_str(), 
+                    &profile, &events, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                    
+                REQUIRE( dsl_pipeline_list_size() == 0 );
+            }
+        }
+    }
+}
@@ -0,0 +1,252 @@
+/*
+The MIT License
+
+Copyright (c) 2019-2021, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include "catch.hpp"
+#include "DslApi.h"
+
+static const std::wstring pipeline_name(L"test-pipeline");
+
+static void infer_interval_change_listener_cb(uint prev_interval, 
+    uint curr_interval, dsl_infer_interval_metrics* metrics, void* client_data)
+{
+}
+
+SCENARIO( "A Pipeline's Infer Interval Controller settings can be updated correctly", 
+    "[pipeline-infer-interval-api]" )
+{
+    GIVEN( "A new Pipeline" ) 
+    {
+        REQUIRE( dsl_pipeline_new(pipeline_name.c_str()) == DSL_RESULT_SUCCESS );
+
+        uint ret_min_interval(99), ret_max_interval(99);
+        REQUIRE( dsl_pipeline_infer_interval_bounds_get(pipeline_name.c_str(), 
+            &ret_min_interval, &ret_max_interval) == DSL_RESULT_SUCCESS );
+        REQUIRE( ret_min_interval == DSL_INFER_INTERVAL_DEFAULT_MIN_INTERVAL );
+        REQUIRE( ret_max_interval == DSL_INFER_INTERVAL_DEFAULT_MAX_INTERVAL );
+
+        uint ret_low_occupancy(0), ret_high_occupancy(0);
+        uint ret_max_latency(99), ret_min_fps(99);
+        REQUIRE( dsl_pipeline_infer_interval_thresholds_get(pipeline_name.c_str(), 
+            &ret_low_occupancy, &ret_high_occupancy, &ret_max_latency, 
+            &ret_min_fps) == DSL_RESULT_SUCCESS );
+        REQUIRE( ret_low_occupancy == DSL_INFER_INTERVAL_DEFAULT_LOW_OCCUPANCY );
+        REQUIRE( ret_high_occupancy == DSL_INFER_INTERVAL_DEFAULT_HIGH_OCCUPANCY );
+        REQUIRE( ret_max_latency == 0 );
+        REQUIRE( ret_min_fps == 0 );
+
+        uint ret_update_interval(0), ret_step_up_count(0), ret_step_down_count(0);
+        REQUIRE( dsl_pipeline_infer_interval_hysteresis_get(pipeline_name.c_str(), 
+            &ret_update_interval, &ret_step_up_count, 
+            &ret_step_down_count) == DSL_RESULT_SUCCESS );
+        REQUIRE( ret_update_interval == DSL_INFER_INTERVAL_DEFAULT_UPDATE_INTERVAL );
+        REQUIRE( ret_step_up_count == DSL_INFER_INTERVAL_DEFAULT_STEP_UP_COUNT );
+        REQUIRE( ret_step_down_count == DSL_INFER_INTERVAL_DEFAULT_STEP_DOWN_COUNT );
+
+        boolean ret_enabled(true);
+        REQUIRE( dsl_pipeline_infer_interval_controller_enabled_get(
+            pipeline_name.c_str(), &ret_enabled) == DSL_RESULT_SUCCESS );
+        REQUIRE( ret_enabled == false );
+
+        WHEN( "The Infer Interval Controller settings are updated" ) 
+        {
+            REQUIRE( dsl_pipeline_infer_interval_bounds_set(pipeline_name.c_str(), 
+                1, 7) == DSL_RESULT_SUCCESS );
+            REQUIRE( dsl_pipeline_infer_interval_thresholds_set(
+                pipeline_name.c_str(), 20, 70, 500, 25) == DSL_RESULT_SUCCESS );
+            REQUIRE( dsl_pipeline_infer_interval_hysteresis_set(
+                pipeline_name.c_str(), 500, 3, 10) == DSL_RESULT_SUCCESS );
+
+            THEN( "The correct values are returned on get" ) 
+            {
+                REQUIRE( dsl_pipeline_infer_interval_bounds_get(
+                    pipeline_name.c_str(), &ret_min_interval, 
+                    &ret_max_interval) == DSL_RESULT_SUCCESS );
+                REQUIRE( ret_min_interval == 1 );
+                REQUIRE( ret_max_interval == 7 );
+                REQUIRE( dsl_pipeline_infer_interval_thresholds_get(
+                    pipeline_name.c_str(), &ret_low_occupancy, &ret_high_occupancy, 
+                    &ret_max_latency, &ret_min_fps) == DSL_RESULT_SUCCESS );
+                REQUIRE( ret_low_occupancy == 20 );
+                REQUIRE( ret_high_occupancy == 70 );
+                REQUIRE( ret_max_latency == 500 );
+                REQUIRE( ret_min_fps == 25 );
+                REQUIRE( dsl_pipeline_infer_interval_hysteresis_get(
+                    pipeline_name.c_str(), &ret_update_interval, &ret_step_up_count, 
+                    &ret_step_down_count) == DSL_RESULT_SUCCESS );
+                REQUIRE( ret_update_interval == 500 );
+                REQUIRE( ret_step_up_count == 3 );
+                REQUIRE( ret_step_down_count == 10 );
+
+                REQUIRE( dsl_pipeline_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+        WHEN( "Invalid settings are used" ) 
+        {
+            THEN( "The settings are rejected" ) 
+            {
+                REQUIRE( dsl_pipeline_infer_interval_bounds_set(pipeline_name.c_str(), 
+                    7, 1) == DSL_RESULT_PIPELINE_SET_FAILED );
+                REQUIRE( dsl_pipeline_infer_interval_thresholds_set(
+                    pipeline_name.c_str(), 70, 20, 0, 0) == 
+                    DSL_RESULT_PIPELINE_SET_FAILED );
+                REQUIRE( dsl_pipeline_infer_interval_hysteresis_set(
+                    pipeline_name.c_str(), 0, 1, 1) == DSL_RESULT_PIPELINE_SET_FAILED );
+
+                REQUIRE( dsl_pipeline_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+        WHEN( "The Infer Interval Controller is enabled" ) 
+        {
+            REQUIRE( dsl_pipeline_infer_interval_controller_enabled_set(
+                pipeline_name.c_str(), true) == DSL_RESULT_SUCCESS );
+
+            THEN( "The hysteresis can not be updated while enabled" ) 
+            {
+                REQUIRE( dsl_pipeline_infer_interval_controller_enabled_get(
+                    pipeline_name.c_str(), &ret_enabled) == DSL_RESULT_SUCCESS );
+                REQUIRE( ret_enabled == true );
+                REQUIRE( dsl_pipeline_infer_interval_hysteresis_set(
+                    pipeline_name.c_str(), 500, 3, 10) == 
+                    DSL_RESULT_PIPELINE_SET_FAILED );
+                REQUIRE( dsl_pipeline_infer_interval_controller_enabled_set(
+                    pipeline_name.c_str(), true) == DSL_RESULT_PIPELINE_SET_FAILED );
+                REQUIRE( dsl_pipeline_infer_interval_controller_enabled_set(
+                    pipeline_name.c_str(), false) == DSL_RESULT_SUCCESS );
+
+                REQUIRE( dsl_pipeline_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
+SCENARIO( "A Pipeline's Infer Interval Controller metrics and listeners are managed correctly", 
+    "[pipeline-infer-interval-api]" )
+{
+    GIVEN( "A new Pipeline" ) 
+    {
+        REQUIRE( dsl_pipeline_new(pipeline_name.c_str()) == DSL_RESULT_SUCCESS );
+
+        WHEN( "Load is reported and the metrics are queried" ) 
+        {
+            REQUIRE( dsl_pipeline_infer_interval_load_report(pipeline_name.c_str(), 
+                30.0, 150) == DSL_RESULT_SUCCESS );
+
+            THEN( "The initial metrics are returned" ) 
+            {
+                dsl_infer_interval_metrics metrics{0};
+                REQUIRE( dsl_pipeline_infer_interval_metrics_get(
+                    pipeline_name.c_str(), &metrics) == DSL_RESULT_SUCCESS );
+                REQUIRE( metrics.interval == 0 );
+                REQUIRE( metrics.updates == 0 );
+                REQUIRE( dsl_pipeline_infer_interval_metrics_clear(
+                    pipeline_name.c_str()) == DSL_RESULT_SUCCESS );
+
+                REQUIRE( dsl_pipeline_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+        WHEN( "A change listener is added" ) 
+        {
+            REQUIRE( dsl_pipeline_infer_interval_change_listener_add(
+                pipeline_name.c_str(), infer_interval_change_listener_cb, 
+                NULL) == DSL_RESULT_SUCCESS );
+
+            THEN( "The same listener can not be added twice and can be removed" ) 
+            {
+                REQUIRE( dsl_pipeline_infer_interval_change_listener_add(
+                    pipeline_name.c_str(), infer_interval_change_listener_cb, 
+                    NULL) == DSL_RESULT_PIPELINE_CALLBACK_ADD_FAILED );
+                REQUIRE( dsl_pipeline_infer_interval_change_listener_remove(
+                    pipeline_name.c_str(), infer_interval_change_listener_cb) == 
+                    DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_pipeline_infer_interval_change_listener_remove(
+                    pipeline_name.c_str(), infer_interval_change_listener_cb) == 
+                    DSL_RESULT_PIPELINE_CALLBACK_REMOVE_FAILED );
+
+                REQUIRE( dsl_pipeline_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
+SCENARIO( "The Pipeline Infer Interval API checks for NULL input parameters", 
+    "[pipeline-infer-interval-api]" )
+{
+    GIVEN( "An empty list of Pipelines" ) 
+    {
+        uint value(0);
+        boolean enabled(0);
+        dsl_infer_interval_metrics metrics{0};
+
+        WHEN( "When NULL pointers are used as input" ) 
+        {
+            THEN( "The API returns DSL_RESULT_INVALID_INPUT_PARAM in all cases" ) 
+            {
+                REQUIRE( dsl_pipeline_infer_interval_bounds_get(NULL, 
+                    &value, &value) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_infer_interval_bounds_get(
+                    pipeline_name.c_str(), NULL, &value) 
+                    == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_infer_interval_bounds_set(NULL, 
+                    0, 0) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_infer_interval_thresholds_get(NULL, 
+                    &value, &value, &value, &value) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_infer_interval_thresholds_get(
+                    pipeline_name.c_str(), &value, &value, &value, NULL) 
+                    == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_infer_interval_thresholds_set(NULL, 
+                    0, 0, 0, 0) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_infer_interval_hysteresis_get(NULL, 
+                    &value, &value, &value) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_infer_interval_hysteresis_get(
+                    pipeline_name.c_str(), &value, NULL, &value) 
+                    == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_infer_interval_hysteresis_set(NULL, 
+                    0, 0, 0) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_infer_interval_controller_enabled_get(NULL, 
+                    &enabled) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_infer_interval_controller_enabled_get(
+                    pipeline_name.c_str(), NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_infer_interval_controller_enabled_set(NULL, 
+                    true) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_infer_interval_load_report(NULL, 
+                    0, 0) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_infer_interval_metrics_get(NULL, 
+                    &metrics) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_infer_interval_metrics_get(
+                    pipeline_name.c_str(), NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_infer_interval_metrics_clear(NULL) 
+                    == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_infer_interval_change_listener_add(NULL, 
+                    NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_infer_interval_change_listener_add(
+                    pipeline_name.c_str(), NULL, NULL) 
+                    == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_infer_interval_change_listener_remove(NULL, 
+                    NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_infer_interval_change_listener_remove(
+                    pipeline_name.c_str(), NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+            }
+        }
+    }
+}
@@ -0,0 +1,226 @@
+/*
+The MIT License
+
+Copyright (c) 2019-2021, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include "catch.hpp"
+#include "DslApi.h"
+
+static const std::wstring pool_name(L"test-pool");
+static const std::wstring pipeline_name(L"test-pipeline");
+static const std::wstring source_name(L"test-source");
+
+SCENARIO( "The Pipeline Pools container is updated correctly on new and delete", 
+    "[pipeline-pool-api]" )
+{
+    GIVEN( "An empty list of Pipeline Pools" ) 
+    {
+        REQUIRE( dsl_pipeline_pool_list_size() == 0 );
+
+        WHEN( "A new Pipeline Pool is created without Pipelines" ) 
+        {
+            const wchar_t* pipelines[] = {NULL};
+            
+            REQUIRE( dsl_pipeline_pool_new(pool_name.c_str(), pipelines, 
+                DSL_STATE_PAUSED, false) == DSL_RESULT_SUCCESS );
+            REQUIRE( dsl_pipeline_pool_list_size() == 1 );
+
+            THEN( "The Pipeline Pool name must be unique" ) 
+            {
+                REQUIRE( dsl_pipeline_pool_new(pool_name.c_str(), pipelines, 
+                    DSL_STATE_PAUSED, false) == 
+                        DSL_RESULT_PIPELINE_POOL_NAME_NOT_UNIQUE );
+                        
+                REQUIRE( dsl_pipeline_pool_delete(pool_name.c_str()) == 
+                    DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_pipeline_pool_list_size() == 0 );
+                REQUIRE( dsl_pipeline_pool_delete(pool_name.c_str()) == 
+                    DSL_RESULT_PIPELINE_POOL_NAME_NOT_FOUND );
+            }
+        }
+        WHEN( "A new Pipeline Pool is created with an invalid standby state" ) 
+        {
+            const wchar_t* pipelines[] = {NULL};
+            
+            THEN( "The Pipeline Pool fails to create" ) 
+            {
+                REQUIRE( dsl_pipeline_pool_new(pool_name.c_str(), pipelines, 
+                    DSL_STATE_PLAYING, false) == 
+                        DSL_RESULT_PIPELINE_POOL_STANDBY_FAILED );
+                REQUIRE( dsl_pipeline_pool_list_size() == 0 );
+            }
+        }
+    }
+}
+
+SCENARIO( "A Pipeline without a Streammuxer batch-size fails to enter standby", 
+    "[pipeline-pool-api]" )
+{
+    GIVEN( "A new Pipeline without Sources" ) 
+    {
+        REQUIRE( dsl_pipeline_new(pipeline_name.c_str()) == DSL_RESULT_SUCCESS );
+
+        WHEN( "A new Pipeline Pool is created with the Pipeline" ) 
+        {
+            const wchar_t* pipelines[] = {pipeline_name.c_str(), NULL};
+            
+            THEN( "The Pipeline fails to enter standby" ) 
+            {
+                REQUIRE( dsl_pipeline_pool_new(pool_name.c_str(), pipelines, 
+                    DSL_STATE_PAUSED, false) == 
+                        DSL_RESULT_PIPELINE_POOL_STANDBY_FAILED );
+
+                uint size(99), available(99);
+                REQUIRE( dsl_pipeline_pool_size_get(pool_name.c_str(), 
+                    &size, &available) == DSL_RESULT_SUCCESS );
+                REQUIRE( size == 0 );
+                REQUIRE( available == 0 );
+
+                REQUIRE( dsl_pipeline_pool_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_pipeline_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
+SCENARIO( "An empty Pipeline Pool fails to acquire and updates its metrics correctly", 
+    "[pipeline-pool-api]" )
+{
+    GIVEN( "A new Pipeline Pool without Pipelines and a new Source" ) 
+    {
+        const wchar_t* pipelines[] = {NULL};
+        
+        REQUIRE( dsl_pipeline_pool_new(pool_name.c_str(), pipelines, 
+            DSL_STATE_PAUSED, false) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_source_app_new(source_name.c_str(), false, 
+            DSL_VIDEO_FORMAT_I420, 1280, 720, 30, 1) == DSL_RESULT_SUCCESS );
+
+        dsl_pipeline_pool_metrics metrics{0};
+        REQUIRE( dsl_pipeline_pool_metrics_get(pool_name.c_str(), 
+            &metrics) == DSL_RESULT_SUCCESS );
+        REQUIRE( metrics.size == 0 );
+        REQUIRE( metrics.exhausted == 0 );
+
+        WHEN( "A Pipeline is acquired" ) 
+        {
+            const wchar_t* sources[] = {source_name.c_str(), NULL};
+            const wchar_t* pipeline(NULL);
+
+            REQUIRE( dsl_pipeline_pool_acquire(pool_name.c_str(), sources, 
+                &pipeline) == DSL_RESULT_PIPELINE_POOL_EXHAUSTED );
+            
+            THEN( "The exhausted count is updated and can be cleared" ) 
+            {
+                REQUIRE( pipeline == NULL );
+                REQUIRE( dsl_pipeline_pool_metrics_get(pool_name.c_str(), 
+                    &metrics) == DSL_RESULT_SUCCESS );
+                REQUIRE( metrics.exhausted == 1 );
+                REQUIRE( metrics.acquisitions == 0 );
+
+                REQUIRE( dsl_pipeline_pool_metrics_clear(
+                    pool_name.c_str()) == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_pipeline_pool_metrics_get(pool_name.c_str(), 
+                    &metrics) == DSL_RESULT_SUCCESS );
+                REQUIRE( metrics.exhausted == 0 );
+
+                REQUIRE( dsl_pipeline_pool_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_component_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
+SCENARIO( "A new Pipeline returns a time-to-first-frame of 0", 
+    "[pipeline-pool-api]" )
+{
+    GIVEN( "A new Pipeline" ) 
+    {
+        REQUIRE( dsl_pipeline_new(pipeline_name.c_str()) == DSL_RESULT_SUCCESS );
+
+        WHEN( "The time-to-first-frame is queried" ) 
+        {
+            double time_to_first_frame(99.0);
+
+            REQUIRE( dsl_pipeline_time_to_first_frame_get(pipeline_name.c_str(), 
+                &time_to_first_frame) == DSL_RESULT_SUCCESS );
+            
+            THEN( "The correct value is returned" ) 
+            {
+                REQUIRE( time_to_first_frame == 0 );
+
+                REQUIRE( dsl_pipeline_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
+SCENARIO( "The Pipeline Pool API checks for NULL input parameters", 
+    "[pipeline-pool-api]" )
+{
+    GIVEN( "An empty list of Pipeline Pools" ) 
+    {
+        const wchar_t* pipelines[] = {NULL};
+        const wchar_t* pipeline(NULL);
+        uint size(0), available(0);
+        double time_to_first_frame(0);
+        dsl_pipeline_pool_metrics metrics{0};
+
+        WHEN( "When NULL pointers are used as input" ) 
+        {
+            THEN( "The API returns DSL_RESULT_INVALID_INPUT_PARAM in all cases" ) 
+            {
+                REQUIRE( dsl_pipeline_time_to_first_frame_get(NULL, 
+                    &time_to_first_frame) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_time_to_first_frame_get(
+                    pipeline_name.c_str(), NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_pool_new(NULL, pipelines, 
+                    DSL_STATE_PAUSED, false) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_pool_new(pool_name.c_str(), NULL, 
+                    DSL_STATE_PAUSED, false) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_pool_delete(NULL) == 
+                    DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_pool_acquire(NULL, pipelines, 
+                    &pipeline) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_pool_acquire(pool_name.c_str(), NULL, 
+                    &pipeline) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_pool_acquire(pool_name.c_str(), pipelines, 
+                    NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_pool_release(NULL, 
+                    pipeline_name.c_str()) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_pool_release(pool_name.c_str(), 
+                    NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_pool_size_get(NULL, 
+                    &size, &available) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_pool_size_get(pool_name.c_str(), 
+                    NULL, &available) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_pool_size_get(pool_name.c_str(), 
+                    &size, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_pool_metrics_get(NULL, 
+                    &metrics) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_pool_metrics_get(pool_name.c_str(), 
+                    NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_pool_metrics_clear(NULL) == 
+                    DSL_RESULT_INVALID_INPUT_PARAM );
+            }
+        }
+    }
+}
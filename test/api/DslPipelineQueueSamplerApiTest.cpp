@@ -0,0 +1,245 @@
+/*
+The MIT License
+
+Copyright (c) 2019-2021, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include "catch.hpp"
+#include "DslApi.h"
+
+static const std::wstring pipeline_name(L"test-pipeline");
+
+static const std::wstring tracker_name(L"iou-tracker");
+static const std::wstring tracker_config_file(
+    L"/opt/nvidia/deepstream/deepstream/samples/configs/deepstream-app/config_tracker_IOU.yml");
+
+SCENARIO( "A Pipeline's Queue Sampler settings can be updated correctly", 
+    "[pipeline-queue-sampler-api]" )
+{
+    GIVEN( "A new Pipeline" ) 
+    {
+        REQUIRE( dsl_pipeline_new(pipeline_name.c_str()) == DSL_RESULT_SUCCESS );
+
+        uint ret_interval(0), ret_window_size(0);
+        REQUIRE( dsl_pipeline_queue_sampler_settings_get(pipeline_name.c_str(), 
+            &ret_interval, &ret_window_size) == DSL_RESULT_SUCCESS );
+        REQUIRE( ret_interval == DSL_QUEUE_SAMPLER_DEFAULT_INTERVAL );
+        REQUIRE( ret_window_size == DSL_QUEUE_SAMPLER_DEFAULT_WINDOW_SIZE );
+
+        boolean ret_enabled(true);
+        REQUIRE( dsl_pipeline_queue_sampler_enabled_get(pipeline_name.c_str(), 
+            &ret_enabled) == DSL_RESULT_SUCCESS );
+        REQUIRE( ret_enabled == false );
+
+        WHEN( "The Queue Sampler settings are updated" ) 
+        {
+            uint new_interval(50), new_window_size(200);
+            REQUIRE( dsl_pipeline_queue_sampler_settings_set(pipeline_name.c_str(), 
+                new_interval, new_window_size) == DSL_RESULT_SUCCESS );
+
+            THEN( "The correct values are returned on get" ) 
+            {
+                REQUIRE( dsl_pipeline_queue_sampler_settings_get(pipeline_name.c_str(), 
+                    &ret_interval, &ret_window_size) == DSL_RESULT_SUCCESS );
+                REQUIRE( ret_interval == new_interval );
+                REQUIRE( ret_window_size == new_window_size );
+
+                REQUIRE( dsl_pipeline_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+        WHEN( "The Queue Sampler is enabled" ) 
+        {
+            REQUIRE( dsl_pipeline_queue_sampler_enabled_set(pipeline_name.c_str(), 
+                true) == DSL_RESULT_SUCCESS );
+
+            THEN( "The settings can not be updated while enabled" ) 
+            {
+                REQUIRE( dsl_pipeline_queue_sampler_enabled_get(pipeline_name.c_str(), 
+                    &ret_enabled) == DSL_RESULT_SUCCESS );
+                REQUIRE( ret_enabled == true );
+                REQUIRE( dsl_pipeline_queue_sampler_settings_set(pipeline_name.c_str(), 
+                    50, 200) == DSL_RESULT_PIPELINE_SET_FAILED );
+                REQUIRE( dsl_pipeline_queue_sampler_enabled_set(pipeline_name.c_str(), 
+                    true) == DSL_RESULT_PIPELINE_SET_FAILED );
+
+                REQUIRE( dsl_pipeline_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
+SCENARIO( "A Pipeline's queue telemetry can be queried correctly", 
+    "[pipeline-queue-sampler-api]" )
+{
+    GIVEN( "A new Pipeline with a Tracker component" ) 
+    {
+        REQUIRE( dsl_tracker_new(tracker_name.c_str(), tracker_config_file.c_str(), 
+            480, 272) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_pipeline_new(pipeline_name.c_str()) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_pipeline_component_add(pipeline_name.c_str(), 
+            tracker_name.c_str()) == DSL_RESULT_SUCCESS );
+
+        WHEN( "No samples have been taken" ) 
+        {
+            THEN( "Empty telemetry and no bottleneck are returned" ) 
+            {
+                const dsl_queue_telemetry* telemetry(NULL);
+                uint size(99);
+                REQUIRE( dsl_pipeline_queue_telemetry_get(pipeline_name.c_str(), 
+                    &telemetry, &size) == DSL_RESULT_SUCCESS );
+                REQUIRE( size == 0 );
+                REQUIRE( telemetry == NULL );
+
+                const wchar_t* ret_component(NULL);
+                REQUIRE( dsl_pipeline_queue_bottleneck_get(pipeline_name.c_str(), 
+                    &ret_component) == DSL_RESULT_SUCCESS );
+                REQUIRE( std::wstring(ret_component) == L"" );
+
+                REQUIRE( dsl_pipeline_queue_telemetry_clear(pipeline_name.c_str()) 
+                    == DSL_RESULT_SUCCESS );
+
+                REQUIRE( dsl_pipeline_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_component_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
+SCENARIO( "A Component's queue auto-size settings can be updated correctly", 
+    "[pipeline-queue-sampler-api]" )
+{
+    GIVEN( "A new Tracker component" ) 
+    {
+        REQUIRE( dsl_tracker_new(tracker_name.c_str(), tracker_config_file.c_str(), 
+            480, 272) == DSL_RESULT_SUCCESS );
+
+        uint64_t ret_min_size(99), ret_max_size(99);
+        REQUIRE( dsl_component_queue_auto_size_get(tracker_name.c_str(), 
+            DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS, &ret_min_size, &ret_max_size) 
+            == DSL_RESULT_SUCCESS );
+        REQUIRE( ret_min_size == 0 );
+        REQUIRE( ret_max_size == 0 );
+
+        boolean ret_enabled(true);
+        REQUIRE( dsl_component_queue_auto_leaky_enabled_get(tracker_name.c_str(), 
+            &ret_enabled) == DSL_RESULT_SUCCESS );
+        REQUIRE( ret_enabled == false );
+
+        WHEN( "The auto-size and auto-leaky settings are updated" ) 
+        {
+            const wchar_t* components[] = {tracker_name.c_str(), NULL};
+            
+            REQUIRE( dsl_component_queue_auto_size_set_many(components, 
+                DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS, 10, 400) 
+                == DSL_RESULT_SUCCESS );
+            REQUIRE( dsl_component_queue_auto_leaky_enabled_set(tracker_name.c_str(), 
+                true) == DSL_RESULT_SUCCESS );
+
+            THEN( "The correct values are returned on get" ) 
+            {
+                REQUIRE( dsl_component_queue_auto_size_get(tracker_name.c_str(), 
+                    DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS, &ret_min_size, &ret_max_size) 
+                    == DSL_RESULT_SUCCESS );
+                REQUIRE( ret_min_size == 10 );
+                REQUIRE( ret_max_size == 400 );
+                REQUIRE( dsl_component_queue_auto_leaky_enabled_get(
+                    tracker_name.c_str(), &ret_enabled) == DSL_RESULT_SUCCESS );
+                REQUIRE( ret_enabled == true );
+
+                REQUIRE( dsl_component_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+        WHEN( "Invalid auto-size settings are used" ) 
+        {
+            THEN( "The services fail" ) 
+            {
+                REQUIRE( dsl_component_queue_auto_size_set(tracker_name.c_str(), 
+                    DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS, 400, 10) 
+                    == DSL_RESULT_COMPONENT_SET_QUEUE_PROPERTY_FAILED );
+                REQUIRE( dsl_component_queue_auto_size_set(tracker_name.c_str(), 
+                    DSL_COMPONENT_QUEUE_UNIT_OF_TIME+1, 10, 400) 
+                    == DSL_RESULT_COMPONENT_SET_QUEUE_PROPERTY_FAILED );
+
+                REQUIRE( dsl_component_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
+SCENARIO( "The Queue Sampler API checks for NULL input parameters", 
+    "[pipeline-queue-sampler-api]" )
+{
+    GIVEN( "An empty list of Pipelines and Components" ) 
+    {
+        uint interval(0), window_size(0);
+        boolean enabled(0);
+        uint64_t min_size(0), max_size(0);
+        const dsl_queue_telemetry* telemetry(NULL);
+        uint size(0);
+        const wchar_t* component(NULL);
+
+        WHEN( "When NULL pointers are used as input" ) 
+        {
+            THEN( "The API returns DSL_RESULT_INVALID_INPUT_PARAM in all cases" ) 
+            {
+                REQUIRE( dsl_pipeline_queue_sampler_settings_get(NULL, 
+                    &interval, &window_size) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_queue_sampler_settings_get(
+                    pipeline_name.c_str(), NULL, &window_size) 
+                    == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_queue_sampler_settings_set(NULL, 
+                    interval, window_size) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_queue_sampler_enabled_get(NULL, 
+                    &enabled) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_queue_sampler_enabled_get(
+                    pipeline_name.c_str(), NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_queue_sampler_enabled_set(NULL, 
+                    enabled) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_queue_telemetry_get(NULL, 
+                    &telemetry, &size) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_queue_telemetry_get(pipeline_name.c_str(), 
+                    NULL, &size) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_queue_telemetry_clear(NULL) 
+                    == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_queue_bottleneck_get(NULL, 
+                    &component) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_queue_bottleneck_get(pipeline_name.c_str(), 
+                    NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+
+                REQUIRE( dsl_component_queue_auto_size_get(NULL, 0,
+                    &min_size, &max_size) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_component_queue_auto_size_get(tracker_name.c_str(), 
+                    0, NULL, &max_size) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_component_queue_auto_size_set(NULL, 0,
+                    min_size, max_size) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_component_queue_auto_size_set_many(NULL, 0,
+                    min_size, max_size) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_component_queue_auto_leaky_enabled_get(NULL, 
+                    &enabled) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_component_queue_auto_leaky_enabled_set(NULL, 
+                    enabled) == DSL_RESULT_INVALID_INPUT_PARAM );
+
+                REQUIRE( dsl_pipeline_list_size() == 0 );
+                REQUIRE( dsl_component_list_size() == 0 );
+            }
+        }
+    }
+}
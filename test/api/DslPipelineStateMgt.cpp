@@ -93,3 +93,59 @@ SCENARIO( "A new Pipeline with minimal components can Play", "[PipelineStateMgt]
     }
 }
 
+
+SCENARIO( "A Pipeline records its startup profile on Play", "[PipelineStateMgt]" )
+{
+    GIVEN( "A Pipeline with minimal components" ) 
+    {
+        std::wstring sourceName = L"test-uri-source";
+        std::wstring uri = L"/opt/nvidia/deepstream/deepstream/samples/streams/sample_1080p_h265.mp4";
+
+        std::wstring sinkName = L"fake-sink";
+        std::wstring pipelineName  = L"test-pipeline";
+        
+        REQUIRE( dsl_source_uri_new(sourceName.c_str(), uri.c_str(),
+            false, false, 0) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_sink_fake_new(sinkName.c_str()) == DSL_RESULT_SUCCESS );
+            
+        const wchar_t* components[] = {L"test-uri-source", L"fake-sink", NULL};
+        
+        REQUIRE( dsl_pipeline_new_component_add_many(pipelineName.c_str(), 
+            components) == DSL_RESULT_SUCCESS );
+
+        dsl_pipeline_startup_profile profile{0};
+        const dsl_pipeline_startup_event* events(NULL);
+        uint size(99);
+
+        REQUIRE( dsl_pipeline_startup_profile_get(pipelineName.c_str(), 
+            &profile, &events, &size) == DSL_RESULT_SUCCESS );
+        REQUIRE( size == 0 );
+        REQUIRE( events == NULL );
+        REQUIRE( profile.link_time == 0 );
+        REQUIRE( profile.time_to_playing == 0 );
+        REQUIRE( profile.time_to_first_frame == 0 );
+        REQUIRE( std::wstring(profile.slowest_element) == L"" );
+        
+        WHEN( "When the Pipeline is Played" ) 
+        {
+            REQUIRE( dsl_pipeline_play(pipelineName.c_str()) == DSL_RESULT_SUCCESS );
+            std::this_thread::sleep_for(std::chrono::milliseconds(500));
+
+            THEN( "The startup profile starts with the link of all components" )
+            {
+                REQUIRE( dsl_pipeline_startup_profile_get(pipelineName.c_str(), 
+                    &profile, &events, &size) == DSL_RESULT_SUCCESS );
+                REQUIRE( size > 0 );
+                REQUIRE( events[0].type == DSL_PIPELINE_STARTUP_EVENT_LINK );
+                REQUIRE( std::wstring(events[0].element) == pipelineName );
+                REQUIRE( events[0].duration > 0 );
+                REQUIRE( profile.link_time == events[0].duration );
+
+                REQUIRE( dsl_pipeline_stop(pipelineName.c_str()) == DSL_RESULT_SUCCESS );
+
+                REQUIRE( dsl_pipeline_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_component_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
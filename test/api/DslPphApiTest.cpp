@@ -177,6 +177,36 @@ SCENARIO( "A new ODE Handler can Add and Remove multiple ODE Triggers", "[pph-ap
     }
 }
 
+SCENARIO( "An ODE Handler's Frame Workers setting can be updated", "[pph-api]" )
+{
+    GIVEN( "A new ODE Handler" ) 
+    {
+        std::wstring odePphName(L"pph");
+        uint workers(99);
+
+        REQUIRE( dsl_pph_ode_new(odePphName.c_str()) == DSL_RESULT_SUCCESS );
+
+        REQUIRE( dsl_pph_ode_frame_workers_get(odePphName.c_str(), 
+            &workers) == DSL_RESULT_SUCCESS );
+        REQUIRE( workers == 0 );
+
+        WHEN( "The ODE Handler's Frame Workers setting is updated" ) 
+        {
+            REQUIRE( dsl_pph_ode_frame_workers_set(odePphName.c_str(), 
+                4) == DSL_RESULT_SUCCESS );
+            
+            THEN( "The correct value is returned on get" ) 
+            {
+                REQUIRE( dsl_pph_ode_frame_workers_get(odePphName.c_str(), 
+                    &workers) == DSL_RESULT_SUCCESS );
+                REQUIRE( workers == 4 );
+                
+                REQUIRE( dsl_pph_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
 void buffer_timeout_handler_cb(uint timeout, void* client_data)
 {
     
@@ -343,6 +373,184 @@ SCENARIO( "A Stream Event Pad Probe Handler can be created and deleted", "[pph-a
     }
 }
 
+static uint custom_pph_client_handler_cb(void* buffer, void* client_data)
+{
+    return DSL_PAD_PROBE_OK;
+}
+
+SCENARIO( "A Custom Pad Probe Handler's async settings can be updated", "[pph-api]" )
+{
+    GIVEN( "A new Custom Pad Probe Handler" ) 
+    {
+        std::wstring customHandlerName(L"custom-handler");
+        
+        REQUIRE( dsl_pph_custom_new(customHandlerName.c_str(), 
+            custom_pph_client_handler_cb, NULL) == DSL_RESULT_SUCCESS );
+
+        boolean enabled(true);
+        REQUIRE( dsl_pph_custom_async_enabled_get(customHandlerName.c_str(), 
+            &enabled) == DSL_RESULT_SUCCESS );
+        REQUIRE( enabled == false );
+        
+        uint maxSize(0), policy(99), sampleInterval(0);
+        REQUIRE( dsl_pph_custom_async_queue_settings_get(customHandlerName.c_str(), 
+            &maxSize, &policy, &sampleInterval) == DSL_RESULT_SUCCESS );
+        REQUIRE( maxSize == DSL_PPH_CUSTOM_ASYNC_DEFAULT_MAX_SIZE );
+        REQUIRE( policy == DSL_PPH_CUSTOM_ASYNC_POLICY_DROP );
+        REQUIRE( sampleInterval == DSL_PPH_CUSTOM_ASYNC_DEFAULT_SAMPLE_INTERVAL );
+
+        WHEN( "The Custom Pad Probe Handler's async settings are updated" ) 
+        {
+            REQUIRE( dsl_pph_custom_async_queue_settings_set(customHandlerName.c_str(), 
+                16, DSL_PPH_CUSTOM_ASYNC_POLICY_BLOCK, 1) == DSL_RESULT_SUCCESS );
+            REQUIRE( dsl_pph_custom_async_enabled_set(customHandlerName.c_str(), 
+                true) == DSL_RESULT_SUCCESS );
+
+            THEN( "The correct values are returned on get" ) 
+            {
+                REQUIRE( dsl_pph_custom_async_enabled_get(customHandlerName.c_str(), 
+                    &enabled) == DSL_RESULT_SUCCESS );
+                REQUIRE( enabled == true );
+                REQUIRE( dsl_pph_custom_async_queue_settings_get(
+                    customHandlerName.c_str(), &maxSize, &policy, 
+                    &sampleInterval) == DSL_RESULT_SUCCESS );
+                REQUIRE( maxSize == 16 );
+                REQUIRE( policy == DSL_PPH_CUSTOM_ASYNC_POLICY_BLOCK );
+                REQUIRE( sampleInterval == 1 );
+                
+                // settings can't be changed while async is enabled
+                REQUIRE( dsl_pph_custom_async_queue_settings_set(
+                    customHandlerName.c_str(), 16, DSL_PPH_CUSTOM_ASYNC_POLICY_DROP, 
+                    1) == DSL_RESULT_PPH_SET_FAILED );
+                
+                dsl_pph_custom_async_metrics metrics{0};
+                REQUIRE( dsl_pph_custom_async_metrics_get(customHandlerName.c_str(), 
+                    &metrics) == DSL_RESULT_SUCCESS );
+                REQUIRE( metrics.queued == 0 );
+                REQUIRE( dsl_pph_custom_async_metrics_clear(
+                    customHandlerName.c_str()) == DSL_RESULT_SUCCESS );
+
+                REQUIRE( dsl_pph_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_pph_list_size() == 0 );
+            }
+        }
+        WHEN( "An invalid queue-full policy is used" ) 
+        {
+            THEN( "The update fails" ) 
+            {
+                REQUIRE( dsl_pph_custom_async_queue_settings_set(
+                    customHandlerName.c_str(), 16, DSL_PPH_CUSTOM_ASYNC_POLICY_BLOCK+1, 
+                    1) == DSL_RESULT_PPH_CUSTOM_ASYNC_POLICY_INVALID );
+
+                REQUIRE( dsl_pph_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_pph_list_size() == 0 );
+            }
+        }
+    }
+}
+
+SCENARIO( "A new Metadata Recorder can be replayed through an ODE Handler", 
+    "[pph-api]" )
+{
+    GIVEN( "A new Metadata Recorder" ) 
+    {
+        std::wstring recorderName(L"meta-recorder");
+        std::wstring odeHandlerName(L"ode-handler");
+        std::wstring customHandlerName(L"custom-handler");
+        std::wstring filePath(L"/tmp/meta-recorder-api-test.dslmeta");
+        uint64_t frames(99);
+
+        REQUIRE( dsl_pph_meta_recorder_new(recorderName.c_str(), 
+            filePath.c_str()) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_pph_meta_recorder_new(recorderName.c_str(), 
+            filePath.c_str()) == DSL_RESULT_PPH_NAME_NOT_UNIQUE );
+        REQUIRE( dsl_pph_list_size() == 1 );
+
+        REQUIRE( dsl_pph_ode_new(odeHandlerName.c_str()) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_pph_custom_new(customHandlerName.c_str(), 
+            custom_pph_client_handler_cb, NULL) == DSL_RESULT_SUCCESS );
+
+        WHEN( "The Metadata Recorder is deleted" ) 
+        {
+            REQUIRE( dsl_pph_delete(recorderName.c_str()) == DSL_RESULT_SUCCESS );
+            
+            THEN( "The empty file can be replayed through the ODE Handler" ) 
+            {
+                REQUIRE( dsl_pph_ode_replay(odeHandlerName.c_str(), 
+                    filePath.c_str(), &frames) == DSL_RESULT_SUCCESS );
+                REQUIRE( frames == 0 );
+                
+                // only ODE Handlers can replay
+                REQUIRE( dsl_pph_ode_replay(customHandlerName.c_str(), 
+                    filePath.c_str(), &frames) == DSL_RESULT_COMPONENT_NOT_THE_CORRECT_TYPE );
+                REQUIRE( dsl_pph_ode_replay(odeHandlerName.c_str(), 
+                    L"/tmp/not-a-file.dslmeta", &frames) == 
+                    DSL_RESULT_PPH_META_RECORD_FILE_ERROR );
+
+                REQUIRE( dsl_pph_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_pph_list_size() == 0 );
+            }
+        }
+    }
+}
+
+SCENARIO( "A new Metadata Recorder fails to create with an invalid file path", 
+    "[pph-api]" )
+{
+    GIVEN( "Attributes for a new Metadata Recorder" ) 
+    {
+        std::wstring recorderName(L"meta-recorder");
+        std::wstring filePath(L"/tmp/not-a-directory/meta-recorder.dslmeta");
+
+        WHEN( "The Metadata Recorder is created" ) 
+        {
+            REQUIRE( dsl_pph_meta_recorder_new(recorderName.c_str(), 
+                filePath.c_str()) == DSL_RESULT_PPH_META_RECORD_FILE_ERROR );
+            
+            THEN( "The list size is unchanged" ) 
+            {
+                REQUIRE( dsl_pph_list_size() == 0 );
+            }
+        }
+    }
+}
+
+SCENARIO( "A new Metadata Publisher can be created and deleted", "[pph-api]" )
+{
+    GIVEN( "Attributes for a new Metadata Publisher" ) 
+    {
+        std::wstring publisherName(L"meta-publisher");
+        std::wstring shmName(L"/dsl-meta-publisher-api-test");
+
+        WHEN( "A new Metadata Publisher is created" ) 
+        {
+            REQUIRE( dsl_pph_meta_publisher_new(publisherName.c_str(), 
+                shmName.c_str(), 64, 16) == DSL_RESULT_SUCCESS );
+            REQUIRE( dsl_pph_meta_publisher_new(publisherName.c_str(), 
+                shmName.c_str(), 64, 16) == DSL_RESULT_PPH_NAME_NOT_UNIQUE );
+            
+            THEN( "The list size is updated and the Publisher can be deleted" ) 
+            {
+                REQUIRE( dsl_pph_list_size() == 1 );
+                REQUIRE( dsl_pph_delete(publisherName.c_str()) == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_pph_list_size() == 0 );
+            }
+        }
+        WHEN( "A new Metadata Publisher is created with invalid sizes" ) 
+        {
+            REQUIRE( dsl_pph_meta_publisher_new(publisherName.c_str(), 
+                shmName.c_str(), 0, 16) == DSL_RESULT_PPH_META_SHM_CREATE_FAILED );
+            REQUIRE( dsl_pph_meta_publisher_new(publisherName.c_str(), 
+                shmName.c_str(), 64, 0) == DSL_RESULT_PPH_META_SHM_CREATE_FAILED );
+            
+            THEN( "The list size is unchanged" ) 
+            {
+                REQUIRE( dsl_pph_list_size() == 0 );
+            }
+        }
+    }
+}
+
 SCENARIO( "The Pad Probe Handler API checks for NULL input parameters", "[pph-api]" )
 {
     GIVEN( "An empty list of Components" ) 
@@ -371,8 +579,31 @@ SCENARIO( "The Pad Probe Handler API checks for NULL input parameters", "[pph-ap
                 REQUIRE( dsl_pph_ode_trigger_remove_many(pphName.c_str(), NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_pph_ode_trigger_remove_all(NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
 
+                REQUIRE( dsl_pph_ode_frame_workers_get(NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_ode_frame_workers_get(pphName.c_str(), NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_ode_frame_workers_set(NULL, 0) == DSL_RESULT_INVALID_INPUT_PARAM );
+
                 REQUIRE( dsl_pph_custom_new(NULL, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_pph_custom_new(pphName.c_str(), NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_custom_async_enabled_get(NULL, &enabled) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_custom_async_enabled_get(pphName.c_str(), NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_custom_async_enabled_set(NULL, enabled) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_custom_async_queue_settings_get(NULL, 
+                    NULL, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_custom_async_queue_settings_get(pphName.c_str(), 
+                    NULL, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_custom_async_queue_settings_set(NULL, 
+                    0, 0, 0) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_custom_async_metrics_get(NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_custom_async_metrics_get(pphName.c_str(), NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_custom_async_metrics_clear(NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_ode_replay(NULL, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_ode_replay(pphName.c_str(), NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_ode_replay(pphName.c_str(), otherName.c_str(), NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_meta_recorder_new(NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_meta_recorder_new(pphName.c_str(), NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_meta_publisher_new(NULL, NULL, 0, 0) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_meta_publisher_new(pphName.c_str(), NULL, 0, 0) == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_pph_meter_new(NULL, 0, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_pph_meter_new(pphName.c_str(), 0, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
 
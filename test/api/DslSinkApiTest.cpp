@@ -198,6 +198,71 @@ SCENARIO( "The Components container is updated correctly on new and delete Frame
         }
     }
 }
+
+SCENARIO( "A Frame-Capture Sink can update its ring settings correctly", "[sink-api]" )
+{
+    GIVEN( "A new Frame-Capture Sink" ) 
+    {
+        std::wstring action_name(L"capture-action");
+        std::wstring outdir(L"./");
+
+        std::wstring sink_name = L"frame-capture-sink";
+
+        REQUIRE( dsl_ode_action_capture_frame_new(action_name.c_str(), 
+            outdir.c_str()) == DSL_RESULT_SUCCESS );
+
+        REQUIRE( dsl_sink_frame_capture_new(sink_name.c_str(), 
+            action_name.c_str()) == DSL_RESULT_SUCCESS );
+
+        uint ret_width(99), ret_duration(99), ret_frames(99), count(99);
+        uint64_t ret_max_size(99), ret_size(99);
+        
+        REQUIRE( dsl_sink_frame_capture_ring_settings_get(sink_name.c_str(), 
+            &ret_width, &ret_duration, &ret_max_size) == DSL_RESULT_SUCCESS );
+        REQUIRE( ret_width == 0 );
+        REQUIRE( ret_duration == 0 );
+        REQUIRE( ret_max_size == 0 );
+
+        // ring is disabled by default
+        REQUIRE( dsl_sink_frame_capture_ring_initiate(sink_name.c_str(), 
+            0) == DSL_RESULT_SINK_SET_FAILED );
+        REQUIRE( dsl_sink_frame_capture_ring_initiate_range(sink_name.c_str(), 
+            0, 1, &count) == DSL_RESULT_SINK_SET_FAILED );
+
+        WHEN( "The Frame-Capture Sink's ring is enabled" ) 
+        {
+            REQUIRE( dsl_sink_frame_capture_ring_settings_set(sink_name.c_str(), 
+                640, 5000, 1000000) == DSL_RESULT_SUCCESS );
+
+            THEN( "The correct values are returned on get" ) 
+            {
+                REQUIRE( dsl_sink_frame_capture_ring_settings_get(sink_name.c_str(), 
+                    &ret_width, &ret_duration, &ret_max_size) == DSL_RESULT_SUCCESS );
+                REQUIRE( ret_width == 640 );
+                REQUIRE( ret_duration == 5000 );
+                REQUIRE( ret_max_size == 1000000 );
+                REQUIRE( dsl_sink_frame_capture_ring_size_get(sink_name.c_str(), 
+                    &ret_frames, &ret_size) == DSL_RESULT_SUCCESS );
+                REQUIRE( ret_frames == 0 );
+                REQUIRE( ret_size == 0 );
+
+                // empty ring - nothing to capture
+                REQUIRE( dsl_sink_frame_capture_ring_initiate(sink_name.c_str(), 
+                    0) == DSL_RESULT_SINK_SET_FAILED );
+                REQUIRE( dsl_sink_frame_capture_ring_initiate_range(sink_name.c_str(), 
+                    0, 1, &count) == DSL_RESULT_SUCCESS );
+                REQUIRE( count == 0 );
+                
+                // start after end
+                REQUIRE( dsl_sink_frame_capture_ring_initiate_range(sink_name.c_str(), 
+                    1, 0, &count) == DSL_RESULT_SINK_SET_FAILED );
+
+                REQUIRE( dsl_component_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_action_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
     
 SCENARIO( "The Components container is updated correctly on new and delete Custom Sink",
     "[sink-api]" )
@@ -3022,6 +3087,22 @@ SCENARIO( "The Sink API checks for NULL input parameters", "[sink-api]" )
                     == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_sink_frame_capture_schedule(NULL, 0) 
                     == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_sink_frame_capture_ring_settings_get(NULL, 
+                    NULL, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_sink_frame_capture_ring_settings_get(sink_name.c_str(), 
+                    NULL, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_sink_frame_capture_ring_settings_set(NULL, 
+                    0, 0, 0) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_sink_frame_capture_ring_size_get(NULL, 
+                    NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_sink_frame_capture_ring_size_get(sink_name.c_str(), 
+                    NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_sink_frame_capture_ring_initiate(NULL, 0) 
+                    == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_sink_frame_capture_ring_initiate_range(NULL, 
+                    0, 0, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_sink_frame_capture_ring_initiate_range(sink_name.c_str(), 
+                    0, 0, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
 
                 REQUIRE( dsl_sink_v4l2_new(NULL, 
                     NULL ) == DSL_RESULT_INVALID_INPUT_PARAM );
@@ -598,6 +598,46 @@ SCENARIO( "An App Source can update its buffer-out settings correctly",
                 REQUIRE( dsl_component_delete_all() == DSL_RESULT_SUCCESS );
             }
         }
+        WHEN( "The App Source's decimation-frame-rate is set" ) 
+        {
+            uint ret_fps_n(99), ret_fps_d(99);
+            REQUIRE( dsl_source_video_decimation_frame_rate_get(source_name.c_str(), 
+                &ret_fps_n, &ret_fps_d) == DSL_RESULT_SUCCESS );
+            REQUIRE( ret_fps_n == 0 );
+            REQUIRE( ret_fps_d == 0 );
+
+            // a zero denominator is invalid unless disabling
+            REQUIRE( dsl_source_video_decimation_frame_rate_set(source_name.c_str(), 
+                5, 0) == DSL_RESULT_SOURCE_SET_FAILED );
+
+            uint new_fps_n(5), new_fps_d(1);
+            REQUIRE( dsl_source_video_decimation_frame_rate_set(source_name.c_str(), 
+                new_fps_n, new_fps_d) == DSL_RESULT_SUCCESS );
+
+            THEN( "The correct values are returned on get" ) 
+            {
+                REQUIRE( dsl_source_video_decimation_frame_rate_get(source_name.c_str(), 
+                    &ret_fps_n, &ret_fps_d) == DSL_RESULT_SUCCESS );
+                REQUIRE( ret_fps_n == new_fps_n );
+                REQUIRE( ret_fps_d == new_fps_d );
+
+                uint64_t frames_passed(99), frames_dropped(99), 
+                    frames_dropped_pre_decode(99);
+                REQUIRE( dsl_source_video_decimation_stats_get(source_name.c_str(), 
+                    &frames_passed, &frames_dropped, 
+                    &frames_dropped_pre_decode) == DSL_RESULT_SUCCESS );
+                REQUIRE( frames_passed == 0 );
+                REQUIRE( frames_dropped == 0 );
+                REQUIRE( frames_dropped_pre_decode == 0 );
+                REQUIRE( dsl_source_video_decimation_stats_clear(
+                    source_name.c_str()) == DSL_RESULT_SUCCESS );
+
+                REQUIRE( dsl_source_video_decimation_frame_rate_set(
+                    source_name.c_str(), 0, 0) == DSL_RESULT_SUCCESS );
+
+                REQUIRE( dsl_component_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
         
         WHEN( "The App Source's buffer-out-crop settings are set" ) 
         {
@@ -1929,6 +1969,21 @@ SCENARIO( "The Source API checks for NULL input parameters", "[source-api]" )
                 REQUIRE( dsl_source_video_buffer_out_frame_rate_set(NULL, 
                     1, 1) == DSL_RESULT_INVALID_INPUT_PARAM );
 
+                REQUIRE( dsl_source_video_decimation_frame_rate_get(NULL, 
+                    NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_source_video_decimation_frame_rate_get(source_name.c_str(), 
+                    NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_source_video_decimation_frame_rate_get(source_name.c_str(), 
+                    &fps_n, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_source_video_decimation_frame_rate_set(NULL, 
+                    1, 1) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_source_video_decimation_stats_get(NULL, 
+                    NULL, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_source_video_decimation_stats_get(source_name.c_str(), 
+                    NULL, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_source_video_decimation_stats_clear(NULL) 
+                    == DSL_RESULT_INVALID_INPUT_PARAM );
+
                 REQUIRE( dsl_source_video_buffer_out_crop_rectangle_get(NULL, 
                     0, NULL, NULL, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_source_video_buffer_out_crop_rectangle_get(source_name.c_str(), 
@@ -350,6 +350,129 @@ SCENARIO( "A Demuxer can update its max-branches correctly", "[tee-api]" )
     }
 }
 
+SCENARIO( "A Demuxer can apply a batch of Branch operations correctly", "[tee-api]" )
+{
+    GIVEN( "A Demuxer and three Branches" ) 
+    {
+        std::wstring demuxerName(L"demuxer");
+        std::wstring branchName1(L"branch1");
+        std::wstring branchName2(L"branch2");
+        std::wstring branchName3(L"branch3");
+
+        REQUIRE( dsl_tee_demuxer_new(demuxerName.c_str(), 
+            3) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_branch_new(branchName1.c_str()) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_branch_new(branchName2.c_str()) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_branch_new(branchName3.c_str()) == DSL_RESULT_SUCCESS );
+
+        dsl_tee_branch_op addOps[] = {
+            {DSL_TEE_BRANCH_OP_ADD, branchName1.c_str(), 0},
+            {DSL_TEE_BRANCH_OP_ADD, branchName2.c_str(), 1}};
+        dsl_tee_branch_op_result addResults[2];
+        
+        REQUIRE( dsl_tee_branch_ops_apply(demuxerName.c_str(), 
+            addOps, 2, addResults) == DSL_RESULT_SUCCESS );
+        REQUIRE( addResults[0].result == DSL_RESULT_SUCCESS );
+        REQUIRE( addResults[0].stream_id == 0 );
+        REQUIRE( addResults[1].result == DSL_RESULT_SUCCESS );
+        REQUIRE( addResults[1].stream_id == 1 );
+
+        WHEN( "Two Branches are swapped and a third is added in one batch" ) 
+        {
+            dsl_tee_branch_op ops[] = {
+                {DSL_TEE_BRANCH_OP_MOVE_TO, branchName1.c_str(), 1},
+                {DSL_TEE_BRANCH_OP_MOVE_TO, branchName2.c_str(), 0},
+                {DSL_TEE_BRANCH_OP_ADD, branchName3.c_str(), 
+                    DSL_TEE_BRANCH_ANY_STREAM}};
+            dsl_tee_branch_op_result results[3];
+            
+            REQUIRE( dsl_tee_branch_ops_apply(demuxerName.c_str(), 
+                ops, 3, results) == DSL_RESULT_SUCCESS );
+            
+            THEN( "All operations are applied to the correct streams" ) 
+            {
+                REQUIRE( results[0].result == DSL_RESULT_SUCCESS );
+                REQUIRE( results[0].stream_id == 1 );
+                REQUIRE( results[1].result == DSL_RESULT_SUCCESS );
+                REQUIRE( results[1].stream_id == 0 );
+                REQUIRE( results[2].result == DSL_RESULT_SUCCESS );
+                REQUIRE( results[2].stream_id == 2 );
+                REQUIRE( std::wstring(results[2].branch) == branchName3 );
+
+                uint count(0);
+                REQUIRE( dsl_tee_branch_count_get(demuxerName.c_str(), 
+                    &count) == DSL_RESULT_SUCCESS );
+                REQUIRE( count == 3 );
+
+                REQUIRE( dsl_component_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+        WHEN( "A batch contains invalid operations" ) 
+        {
+            dsl_tee_branch_op ops[] = {
+                {DSL_TEE_BRANCH_OP_REMOVE, branchName1.c_str(), 
+                    DSL_TEE_BRANCH_ANY_STREAM},
+                {DSL_TEE_BRANCH_OP_REMOVE, branchName3.c_str(), 
+                    DSL_TEE_BRANCH_ANY_STREAM},
+                {DSL_TEE_BRANCH_OP_ADD, branchName2.c_str(), 
+                    DSL_TEE_BRANCH_ANY_STREAM}};
+            dsl_tee_branch_op_result results[3];
+            
+            REQUIRE( dsl_tee_branch_ops_apply(demuxerName.c_str(), 
+                ops, 3, results) == DSL_RESULT_TEE_BRANCH_IS_NOT_CHILD );
+            
+            THEN( "Only the valid operations are applied" ) 
+            {
+                REQUIRE( results[0].result == DSL_RESULT_SUCCESS );
+                REQUIRE( results[0].stream_id == 0 );
+                REQUIRE( results[1].result == DSL_RESULT_TEE_BRANCH_IS_NOT_CHILD );
+                REQUIRE( results[2].result == DSL_RESULT_COMPONENT_IN_USE );
+
+                uint count(0);
+                REQUIRE( dsl_tee_branch_count_get(demuxerName.c_str(), 
+                    &count) == DSL_RESULT_SUCCESS );
+                REQUIRE( count == 1 );
+
+                REQUIRE( dsl_component_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
+SCENARIO( "A Splitter rejects Branch operations to a stream-id", "[tee-api]" )
+{
+    GIVEN( "A Splitter and a Branch" ) 
+    {
+        std::wstring splitterName(L"splitter");
+        std::wstring branchName1(L"branch1");
+
+        REQUIRE( dsl_tee_splitter_new(splitterName.c_str()) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_branch_new(branchName1.c_str()) == DSL_RESULT_SUCCESS );
+
+        WHEN( "The Branch is added to a specific stream-id" ) 
+        {
+            dsl_tee_branch_op ops[] = {
+                {DSL_TEE_BRANCH_OP_ADD, branchName1.c_str(), 1}};
+            dsl_tee_branch_op_result results[1];
+            
+            THEN( "The operation fails and the Branch is not added" ) 
+            {
+                REQUIRE( dsl_tee_branch_ops_apply_async(splitterName.c_str(), 
+                    ops, 1, NULL, NULL) == DSL_RESULT_TEE_BRANCH_OP_INVALID );
+                REQUIRE( dsl_tee_branch_ops_apply(splitterName.c_str(), 
+                    ops, 1, results) == DSL_RESULT_TEE_BRANCH_OP_INVALID );
+
+                uint count(99);
+                REQUIRE( dsl_tee_branch_count_get(splitterName.c_str(), 
+                    &count) == DSL_RESULT_SUCCESS );
+                REQUIRE( count == 0 );
+
+                REQUIRE( dsl_component_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
 SCENARIO( "A Tee can update its blocking-timeout setting correctly", "[tee-api]" )
 {
     GIVEN( "A Demuxer and three Branchs" ) 
@@ -489,6 +612,14 @@ SCENARIO( "The Tee API checks for NULL input parameters", "[tee-api]" )
                     NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_tee_blocking_timeout_set(NULL, 
                     1) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_tee_branch_ops_apply(NULL, 
+                    NULL, 0, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_tee_branch_ops_apply(teeName.c_str(), 
+                    NULL, 0, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_tee_branch_ops_apply_async(NULL, 
+                    NULL, 0, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_tee_branch_ops_apply_async(teeName.c_str(), 
+                    NULL, 0, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
                 
                 REQUIRE( dsl_component_list_size() == 0 );
             }
@@ -0,0 +1,629 @@
+/*
+The MIT License
+
+Copyright (c) 2019-2021, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+/**
+ * @file DslOdeBenchmark.cpp
+ * @brief CPU-only throughput benchmark for the ODE engine. Parameterized 
+ * synthetic batch-metadata (sources x objects x classes x movement models)
+ * is driven through representative ODE Trigger, Area, and Action graphs
+ * owned by an ODE Pad Probe Handler -- without a Pipeline or GPU. 
+ * One JSON object is written to stdout for each run so that results can
+ * be compared across commits. Build with "make benchmark".
+ */
+
+#include <atomic>
+#include <getopt.h>
+
+#include "Dsl.h"
+#include "DslServices.h"
+#include "DslPadProbeHandler.h"
+#include "DslOdeTrigger.h"
+#include "DslOdeAction.h"
+#include "DslOdeArea.h"
+#include "DslOdeAccumulator.h"
+#include "DslOdeHeatMapper.h"
+#include "DslDisplayTypes.h"
+
+using namespace DSL;
+
+//--------------------------------------------------------------------------------
+// Allocation counting - counts all C++ heap allocations, including those made
+// by shared libraries, while enabled. Allocations made with malloc/g_malloc 
+// directly (i.e. by the NvDs metadata pools) are not counted.
+
+static std::atomic<bool> s_countAllocations(false);
+static std::atomic<uint64_t> s_allocationCount(0);
+static std::atomic<uint64_t> s_allocationBytes(0);
+
+void* operator new(std::size_t size)
+{
+    if (s_countAllocations.load(std::memory_order_relaxed))
+    {
+        s_allocationCount.fetch_add(1, std::memory_order_relaxed);
+        s_allocationBytes.fetch_add(size, std::memory_order_relaxed);
+    }
+    void* pMemory = malloc(size ? size : 1);
+    if (!pMemory)
+    {
+        throw std::bad_alloc();
+    }
+    return pMemory;
+}
+
+void operator delete(void* pMemory) noexcept
+{
+    free(pMemory);
+}
+
+void operator delete(void* pMemory, std::size_t size) noexcept
+{
+    free(pMemory);
+}
+
+//--------------------------------------------------------------------------------
+
+#define BENCHMARK_FRAME_WIDTH                   1920
+#define BENCHMARK_FRAME_HEIGHT                  1080
+#define BENCHMARK_OBJECT_WIDTH                  80
+#define BENCHMARK_OBJECT_HEIGHT                 160
+#define BENCHMARK_MAX_SPEED                     8
+
+#define BENCHMARK_MOVEMENT_STATIC               0
+#define BENCHMARK_MOVEMENT_LINEAR               1
+#define BENCHMARK_MOVEMENT_RANDOM               2
+
+static const std::vector<std::string> s_movementNames = 
+    {"static", "linear", "random"};
+
+/**
+ * @struct SyntheticObject
+ * @brief state of a single synthetic tracked object.
+ */
+struct SyntheticObject
+{
+    uint64_t objectId;
+    int classId;
+    float left;
+    float top;
+    float dx;
+    float dy;
+};
+
+/**
+ * @class SyntheticBatchGenerator
+ * @brief Generates batch-metadata for a fixed set of tracked objects
+ * per source, moved between batches according to a movement model.
+ */
+class SyntheticBatchGenerator
+{
+public:
+
+    SyntheticBatchGenerator(uint sources, uint objectsPerFrame, uint classes, 
+        uint movement)
+        : m_sources(sources)
+        , m_movement(movement)
+        , m_frameNum(0)
+        , m_random(1) // fixed seed for repeatable runs
+    {
+        std::uniform_real_distribution<float> xDist(0, 
+            BENCHMARK_FRAME_WIDTH - BENCHMARK_OBJECT_WIDTH);
+        std::uniform_real_distribution<float> yDist(0, 
+            BENCHMARK_FRAME_HEIGHT - BENCHMARK_OBJECT_HEIGHT);
+        std::uniform_real_distribution<float> speedDist(-BENCHMARK_MAX_SPEED, 
+            BENCHMARK_MAX_SPEED);
+            
+        m_objects.resize(sources);
+        for (auto& objects: m_objects)
+        {
+            for (uint i = 0; i < objectsPerFrame; i++)
+            {
+                objects.push_back({i+1, (int)(i % classes), 
+                    xDist(m_random), yDist(m_random), 
+                    speedDist(m_random), speedDist(m_random)});
+            }
+        }
+    }
+    
+    /**
+     * @brief Moves all objects and adds a frame for each source, with
+     * its object metadata, to a batch-meta.
+     */
+    void FillBatch(NvDsBatchMeta* pBatchMeta)
+    {
+        m_frameNum++;
+        
+        for (uint sourceId = 0; sourceId < m_sources; sourceId++)
+        {
+            NvDsFrameMeta* pFrameMeta = 
+                nvds_acquire_frame_meta_from_pool(pBatchMeta);
+            pFrameMeta->source_id = sourceId;
+            pFrameMeta->pad_index = sourceId;
+            pFrameMeta->batch_id = sourceId;
+            pFrameMeta->frame_num = m_frameNum;
+            pFrameMeta->ntp_timestamp = m_frameNum * 33333333;
+            pFrameMeta->source_frame_width = BENCHMARK_FRAME_WIDTH;
+            pFrameMeta->source_frame_height = BENCHMARK_FRAME_HEIGHT;
+            pFrameMeta->bInferDone = true;
+            nvds_add_frame_meta_to_batch(pBatchMeta, pFrameMeta);
+            
+            for (auto& object: m_objects[sourceId])
+            {
+                Move(object);
+                
+                NvDsObjectMeta* pObjectMeta = 
+                    nvds_acquire_obj_meta_from_pool(pBatchMeta);
+                pObjectMeta->object_id = object.objectId;
+                pObjectMeta->class_id = object.classId;
+                pObjectMeta->confidence = 0.9;
+                pObjectMeta->tracker_confidence = 0.9;
+                pObjectMeta->rect_params.left = object.left;
+                pObjectMeta->rect_params.top = object.top;
+                pObjectMeta->rect_params.width = BENCHMARK_OBJECT_WIDTH;
+                pObjectMeta->rect_params.height = BENCHMARK_OBJECT_HEIGHT;
+                nvds_add_obj_meta_to_frame(pFrameMeta, pObjectMeta, NULL);
+            }
+        }
+        pBatchMeta->num_frames_in_batch = m_sources;
+    }
+    
+    /**
+     * @brief Releases all frame-meta, and their object and display meta, 
+     * back to the batch-meta pools.
+     */
+    void ClearBatch(NvDsBatchMeta* pBatchMeta)
+    {
+        while (pBatchMeta->frame_meta_list)
+        {
+            nvds_remove_frame_meta_from_batch(pBatchMeta, 
+                (NvDsFrameMeta*)pBatchMeta->frame_meta_list->data);
+        }
+    }
+    
+private:
+
+    void Move(SyntheticObject& object)
+    {
+        if (m_movement == BENCHMARK_MOVEMENT_STATIC)
+        {
+            return;
+        }
+        if (m_movement == BENCHMARK_MOVEMENT_RANDOM)
+        {
+            std::uniform_real_distribution<float> speedDist(
+                -BENCHMARK_MAX_SPEED, BENCHMARK_MAX_SPEED);
+            object.dx = speedDist(m_random);
+            object.dy = speedDist(m_random);
+        }
+        object.left += object.dx;
+        object.top += object.dy;
+        
+        // bounce off the frame edges
+        if (object.left < 0 or 
+            object.left > BENCHMARK_FRAME_WIDTH - BENCHMARK_OBJECT_WIDTH)
+        {
+            object.dx = -object.dx;
+            object.left = std::min(std::max(object.left, 0.0f), 
+                (float)(BENCHMARK_FRAME_WIDTH - BENCHMARK_OBJECT_WIDTH));
+        }
+        if (object.top < 0 or 
+            object.top > BENCHMARK_FRAME_HEIGHT - BENCHMARK_OBJECT_HEIGHT)
+        {
+            object.dy = -object.dy;
+            object.top = std::min(std::max(object.top, 0.0f), 
+                (float)(BENCHMARK_FRAME_HEIGHT - BENCHMARK_OBJECT_HEIGHT));
+        }
+    }
+
+    uint m_sources;
+    uint m_movement;
+    int m_frameNum;
+    std::mt19937 m_random;
+    std::vector<std::vector<SyntheticObject>> m_objects;
+};
+
+//--------------------------------------------------------------------------------
+// Trigger, Area, and Action graphs
+
+static void occurrence_counter_cb(uint64_t event_id, const wchar_t* name,
+    void* buffer, void* display_meta, void* frame_meta, void* object_meta, 
+    void* client_data)
+{
+    (*(uint64_t*)client_data)++;
+}
+
+static uint64_t s_occurrences(0);
+
+static DSL_RGBA_COLOR_PTR benchmark_color()
+{
+    return DSL_RGBA_PREDEFINED_COLOR_NEW("benchmark-color", 
+        DSL_COLOR_PREDEFINED_BLACK, 1.0);
+}
+
+static void add_occurrence_area_graph(DSL_PPH_ODE_PTR pOdeHandler)
+{
+    dsl_coordinate coordinates[4] = {{480,270},{1440,270},{1440,810},{480,810}};
+    
+    DSL_RGBA_POLYGON_PTR pPolygon = DSL_RGBA_POLYGON_NEW("benchmark-polygon", 
+        coordinates, 4, 4, benchmark_color());
+    DSL_ODE_AREA_INCLUSION_PTR pArea = DSL_ODE_AREA_INCLUSION_NEW(
+        "benchmark-inclusion-area", pPolygon, true, DSL_BBOX_POINT_SOUTH);
+    
+    DSL_ODE_TRIGGER_OCCURRENCE_PTR pTrigger = DSL_ODE_TRIGGER_OCCURRENCE_NEW(
+        "occurrence-area", "", DSL_ODE_ANY_CLASS, DSL_ODE_TRIGGER_LIMIT_NONE);
+    DSL_ODE_ACTION_BBOX_FORMAT_PTR pAction = DSL_ODE_ACTION_BBOX_FORMAT_NEW(
+        "benchmark-format-bbox", 4, benchmark_color(), false, benchmark_color());
+        
+    pTrigger->AddArea(pArea);
+    pTrigger->AddAction(pAction);
+    pOdeHandler->AddChild(pTrigger);
+}
+
+static void add_cross_multi_line_graph(DSL_PPH_ODE_PTR pOdeHandler)
+{
+    dsl_coordinate coordinates[4] = {{200,540},{700,300},{1200,780},{1700,540}};
+
+    DSL_RGBA_MULTI_LINE_PTR pMultiLine = DSL_RGBA_MULTI_LINE_NEW(
+        "benchmark-multi-line", coordinates, 4, 4, benchmark_color());
+    DSL_ODE_AREA_MULTI_LINE_PTR pArea = DSL_ODE_AREA_MULTI_LINE_NEW(
+        "benchmark-multi-line-area", pMultiLine, false, DSL_BBOX_POINT_SOUTH);
+
+    DSL_ODE_TRIGGER_CROSS_PTR pTrigger = DSL_ODE_TRIGGER_CROSS_NEW(
+        "cross-multi-line", "", DSL_ODE_ANY_CLASS, DSL_ODE_TRIGGER_LIMIT_NONE, 
+        4, 16, DSL_OBJECT_TRACE_TEST_METHOD_END_POINTS, benchmark_color());
+    DSL_ODE_ACTION_CUSTOM_PTR pAction = DSL_ODE_ACTION_CUSTOM_NEW(
+        "benchmark-cross-counter", occurrence_counter_cb, &s_occurrences);
+        
+    pTrigger->AddArea(pArea);
+    pTrigger->AddAction(pAction);
+    pOdeHandler->AddChild(pTrigger);
+}
+
+static void add_distance_graph(DSL_PPH_ODE_PTR pOdeHandler)
+{
+    DSL_ODE_TRIGGER_DISTANCE_PTR pTrigger = DSL_ODE_TRIGGER_DISTANCE_NEW(
+        "distance", "", 0, 1, DSL_ODE_TRIGGER_LIMIT_NONE, 0, 100, 
+        DSL_BBOX_POINT_ANY, DSL_DISTANCE_METHOD_FIXED_PIXELS);
+    DSL_ODE_ACTION_CUSTOM_PTR pAction = DSL_ODE_ACTION_CUSTOM_NEW(
+        "benchmark-distance-counter", occurrence_counter_cb, &s_occurrences);
+
+    pTrigger->AddAction(pAction);
+    pOdeHandler->AddChild(pTrigger);
+}
+
+static void add_persistence_graph(DSL_PPH_ODE_PTR pOdeHandler)
+{
+    DSL_ODE_TRIGGER_PERSISTENCE_PTR pTrigger = DSL_ODE_TRIGGER_PERSISTENCE_NEW(
+        "persistence", "", DSL_ODE_ANY_CLASS, DSL_ODE_TRIGGER_LIMIT_NONE, 0, 3600);
+    DSL_ODE_ACTION_BBOX_FORMAT_PTR pAction = DSL_ODE_ACTION_BBOX_FORMAT_NEW(
+        "benchmark-persistence-bbox", 2, benchmark_color(), false, benchmark_color());
+
+    pTrigger->AddAction(pAction);
+    pOdeHandler->AddChild(pTrigger);
+}
+
+static void add_heat_mapper_graph(DSL_PPH_ODE_PTR pOdeHandler)
+{
+    std::shared_ptr<std::vector<DSL_RGBA_COLOR_PTR>> pColorPalette = 
+        std::shared_ptr<std::vector<DSL_RGBA_COLOR_PTR>>{
+            new std::vector<DSL_RGBA_COLOR_PTR>};
+    
+    for (auto const& ivec: RgbaPredefinedColor::s_predefinedColorPalettes[
+        DSL_COLOR_PREDEFINED_PALETTE_SPECTRAL])
+    {
+        DSL_RGBA_COLOR_PTR pColor = std::shared_ptr<RgbaColor>
+            (new RgbaColor("", ivec));
+        pColor->alpha = 0.2;
+        pColorPalette->push_back(pColor);
+    }
+    DSL_ODE_HEAT_MAPPER_PTR pHeatMapper = DSL_ODE_HEAT_MAPPER_NEW(
+        "benchmark-heat-mapper", 16, 9, DSL_BBOX_POINT_SOUTH, 
+        DSL_RGBA_COLOR_PALETTE_NEW("benchmark-palette", pColorPalette));
+
+    DSL_ODE_TRIGGER_OCCURRENCE_PTR pTrigger = DSL_ODE_TRIGGER_OCCURRENCE_NEW(
+        "heat-mapper", "", DSL_ODE_ANY_CLASS, DSL_ODE_TRIGGER_LIMIT_NONE);
+
+    pTrigger->AddHeatMapper(pHeatMapper);
+    pOdeHandler->AddChild(pTrigger);
+}
+
+static void add_accumulator_graph(DSL_PPH_ODE_PTR pOdeHandler)
+{
+    DSL_RGBA_FONT_PTR pFont = DSL_RGBA_FONT_NEW("benchmark-font", 
+        "arial", 12, benchmark_color());
+    DSL_ODE_ACTION_DISPLAY_PTR pAction = DSL_ODE_ACTION_DISPLAY_NEW(
+        "benchmark-display", "Occurrences: %8", 10, 10, pFont, 
+        false, benchmark_color());
+    
+    DSL_ODE_ACCUMULATOR_PTR pAccumulator = 
+        DSL_ODE_ACCUMULATOR_NEW("benchmark-accumulator");
+    pAccumulator->AddAction(pAction);
+
+    DSL_ODE_TRIGGER_OCCURRENCE_PTR pTrigger = DSL_ODE_TRIGGER_OCCURRENCE_NEW(
+        "accumulator", "", DSL_ODE_ANY_CLASS, DSL_ODE_TRIGGER_LIMIT_NONE);
+
+    pTrigger->AddAccumulator(pAccumulator);
+    pOdeHandler->AddChild(pTrigger);
+}
+
+static const std::map<std::string, 
+    std::function<void(DSL_PPH_ODE_PTR)>> s_graphs = 
+{
+    {"occurrence-area", add_occurrence_area_graph},
+    {"cross-multi-line", add_cross_multi_line_graph},
+    {"distance", add_distance_graph},
+    {"persistence", add_persistence_graph},
+    {"heat-mapper", add_heat_mapper_graph},
+    {"accumulator", add_accumulator_graph},
+};
+
+//--------------------------------------------------------------------------------
+
+/**
+ * @struct BenchmarkRun
+ * @brief parameters for a single benchmark run.
+ */
+struct BenchmarkRun
+{
+    std::string graph;
+    uint sources;
+    uint objects;
+    uint classes;
+    uint movement;
+    uint batches;
+    uint warmup;
+};
+
+static void run_benchmark(const BenchmarkRun& run, const std::string& label)
+{
+    DSL_PPH_ODE_PTR pOdeHandler = DSL_PPH_ODE_NEW("benchmark-ode-handler");
+    
+    if (run.graph == "all")
+    {
+        for (auto const& imap: s_graphs)
+        {
+            imap.second(pOdeHandler);
+        }
+    }
+    else
+    {
+        s_graphs.at(run.graph)(pOdeHandler);
+    }
+    
+    SyntheticBatchGenerator generator(run.sources, run.objects, 
+        run.classes, run.movement);
+    NvDsBatchMeta* pBatchMeta = nvds_create_batch_meta(run.sources);
+    
+    s_occurrences = 0;
+    uint64_t elapsedNs(0);
+    uint64_t allocations(0);
+    uint64_t allocationBytes(0);
+    
+    for (uint i = 0; i < run.warmup + run.batches; i++)
+    {
+        generator.FillBatch(pBatchMeta);
+        
+        // only the ODE Handler is measured, not the batch generation
+        bool measure(i >= run.warmup);
+        s_allocationCount = 0;
+        s_allocationBytes = 0;
+        s_countAllocations = measure;
+        
+        auto start = std::chrono::steady_clock::now();
+        pOdeHandler->HandleBatchMeta(NULL, pBatchMeta);
+        auto end = std::chrono::steady_clock::now();
+        
+        s_countAllocations = false;
+        
+        if (measure)
+        {
+            elapsedNs += std::chrono::duration_cast<std::chrono::nanoseconds>(
+                end - start).count();
+            allocations += s_allocationCount;
+            allocationBytes += s_allocationBytes;
+        }
+        generator.ClearBatch(pBatchMeta);
+    }
+    nvds_destroy_batch_meta(pBatchMeta);
+    
+    uint64_t frames = (uint64_t)run.batches * run.sources;
+    uint64_t objects = frames * run.objects;
+    double seconds = (double)elapsedNs / 1000000000.0;
+    
+    std::cout << std::fixed << std::setprecision(3)
+        << "{\"label\": \"" << label << "\""
+        << ", \"graph\": \"" << run.graph << "\""
+        << ", \"sources\": " << run.sources
+        << ", \"objects\": " << run.objects
+        << ", \"classes\": " << run.classes
+        << ", \"movement\": \"" << s_movementNames[run.movement] << "\""
+        << ", \"batches\": " << run.batches
+        << ", \"frames\": " << frames
+        << ", \"elapsed_ns\": " << elapsedNs
+        << ", \"frames_per_sec\": " << (seconds ? frames / seconds : 0)
+        << ", \"ns_per_object\": " << (objects ? (double)elapsedNs / objects : 0)
+        << ", \"allocs_per_frame\": " << (double)allocations / frames
+        << ", \"alloc_bytes_per_frame\": " << (double)allocationBytes / frames
+        << ", \"occurrences\": " << s_occurrences
+        << "}" << std::endl;
+}
+
+//--------------------------------------------------------------------------------
+
+static std::vector<std::string> split_list(const char* list)
+{
+    std::vector<std::string> items;
+    std::stringstream stream(list);
+    std::string item;
+    while (std::getline(stream, item, ','))
+    {
+        items.push_back(item);
+    }
+    return items;
+}
+
+static std::vector<uint> split_uint_list(const char* list)
+{
+    std::vector<uint> values;
+    for (auto const& item: split_list(list))
+    {
+        values.push_back(std::stoul(item));
+    }
+    return values;
+}
+
+static void print_usage(const char* app)
+{
+    std::cerr << "Usage: " << app << " [options]\n"
+        << "  --graph=LIST      comma separated list of graphs, or \"all\" to run\n"
+        << "                    every graph in a single ODE Handler, default all of\n"
+        << "                    occurrence-area, cross-multi-line, distance,\n"
+        << "                    persistence, heat-mapper, accumulator, all\n"
+        << "  --sources=LIST    number of sources per batch, default 1,4,16\n"
+        << "  --objects=LIST    number of objects per frame, default 10,50\n"
+        << "  --classes=LIST    number of object classes, default 2\n"
+        << "  --movement=LIST   static, linear, random, default linear\n"
+        << "  --batches=N       number of measured batches per run, default 1000\n"
+        << "  --warmup=N        number of unmeasured batches per run, default 100\n"
+        << "  --label=STRING    label added to each result, i.e. a commit id\n";
+}
+
+int main(int argc, char** argv)
+{
+    // Initializes GStreamer and the DSL debug category for logging.
+    DSL::Services::GetServices();
+    
+    std::vector<std::string> graphs;
+    for (auto const& imap: s_graphs)
+    {
+        graphs.push_back(imap.first);
+    }
+    graphs.push_back("all");
+    
+    std::vector<uint> sources{1, 4, 16};
+    std::vector<uint> objects{10, 50};
+    std::vector<uint> classes{2};
+    std::vector<uint> movements{BENCHMARK_MOVEMENT_LINEAR};
+    uint batches(1000);
+    uint warmup(100);
+    std::string label;
+    
+    static struct option options[] = {
+        {"graph", required_argument, 0, 'g'},
+        {"sources", required_argument, 0, 's'},
+        {"objects", required_argument, 0, 'o'},
+        {"classes", required_argument, 0, 'c'},
+        {"movement", required_argument, 0, 'm'},
+        {"batches", required_argument, 0, 'b'},
+        {"warmup", required_argument, 0, 'w'},
+        {"label", required_argument, 0, 'l'},
+        {"help", no_argument, 0, 'h'},
+        {0, 0, 0, 0}
+    };
+    
+    try
+    {
+        int opt;
+        while ((opt = getopt_long(argc, argv, "", options, NULL)) != -1)
+        {
+            switch (opt)
+            {
+            case 'g':
+                graphs = split_list(optarg);
+                break;
+            case 's':
+                sources = split_uint_list(optarg);
+                break;
+            case 'o':
+                objects = split_uint_list(optarg);
+                break;
+            case 'c':
+                classes = split_uint_list(optarg);
+                break;
+            case 'm':
+                movements.clear();
+                for (auto const& name: split_list(optarg))
+                {
+                    auto iter = std::find(s_movementNames.begin(), 
+                        s_movementNames.end(), name);
+                    if (iter == s_movementNames.end())
+                    {
+                        throw std::invalid_argument(name);
+                    }
+                    movements.push_back(iter - s_movementNames.begin());
+                }
+                break;
+            case 'b':
+                batches = std::stoul(optarg);
+                break;
+            case 'w':
+                warmup = std::stoul(optarg);
+                break;
+            case 'l':
+                label = optarg;
+                break;
+            default:
+                print_usage(argv[0]);
+                return 1;
+            }
+        }
+        for (auto const& graph: graphs)
+        {
+            if (graph != "all" and s_graphs.find(graph) == s_graphs.end())
+            {
+                throw std::invalid_argument(graph);
+            }
+        }
+        if (!batches or 
+            std::find(sources.begin(), sources.end(), 0) != sources.end() or
+            std::find(classes.begin(), classes.end(), 0) != classes.end())
+        {
+            throw std::invalid_argument("0");
+        }
+    }
+    catch(const std::exception& e)
+    {
+        std::cerr << "Invalid argument: " << e.what() << "\n";
+        print_usage(argv[0]);
+        return 1;
+    }
+    
+    for (auto const& graph: graphs)
+    {
+        for (auto const& numSources: sources)
+        {
+            for (auto const& numObjects: objects)
+            {
+                for (auto const& numClasses: classes)
+                {
+                    for (auto const& movement: movements)
+                    {
+                        run_benchmark({graph, numSources, numObjects, 
+                            numClasses, movement, batches, warmup}, label);
+                    }
+                }
+            }
+        }
+    }
+    return 0;
+}
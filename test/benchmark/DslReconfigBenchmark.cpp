@@ -0,0 +1,835 @@
+/*
+The MIT License
+
+Copyright (c) 2019-2021, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+/**
+ * @file DslReconfigBenchmark.cpp
+ * @brief Latency and stability benchmark for dynamic Pipeline
+ * reconfiguration. Custom Sources (videotestsrc) and Custom Sinks (fakesink)
+ * are repeatedly added to and removed from a playing Pipeline, a Splitter
+ * Tee, and moved between the streams of a Demuxer Tee -- with no models,
+ * decoders, or media files. For each scenario, the p50/p99/max latency of
+ * each operation, the frames lost at the observed sink during each change,
+ * and the GStreamer elements and pads leaked over all cycles are written to
+ * stdout as a single JSON object. Build with "make benchmark".
+ */
+
+#include <atomic>
+#include <condition_variable>
+#include <getopt.h>
+#include <thread>
+
+#include "Dsl.h"
+#include "DslApi.h"
+
+//--------------------------------------------------------------------------------
+
+#define BENCHMARK_FRAME_WIDTH                   320
+#define BENCHMARK_FRAME_HEIGHT                  240
+#define BENCHMARK_FIRST_FRAMES                  10
+#define BENCHMARK_FIRST_FRAMES_TIMEOUT_MS       10000
+
+static const std::wstring s_pipelineName(L"benchmark-pipeline");
+static const std::wstring s_capsName(L"benchmark-caps");
+static const std::wstring s_teeName(L"benchmark-tee");
+static const std::wstring s_baseSinkName(L"base-sink");
+
+/**
+ * @class FrameMonitor
+ * @brief Buffer probe for the sink pad of an observed fakesink. Tracks the
+ * largest gap between frames since the last Reset, including the time
+ * since the last frame, to count the frames lost during a change.
+ */
+class FrameMonitor
+{
+public:
+
+    FrameMonitor()
+        : m_frames(0)
+        , m_lastNs(0)
+        , m_maxGapNs(0)
+    {
+    }
+
+    bool AddTo(GstElement* pElement)
+    {
+        GstPad* pPad = gst_element_get_static_pad(pElement, "sink");
+        if (!pPad)
+        {
+            return false;
+        }
+        gst_pad_add_probe(pPad, GST_PAD_PROBE_TYPE_BUFFER, OnBuffer, this, NULL);
+        gst_object_unref(pPad);
+        return true;
+    }
+
+    void Reset()
+    {
+        std::lock_guard<std::mutex> lock(m_mutex);
+        m_lastNs = NowNs();
+        m_maxGapNs = 0;
+    }
+
+    /**
+     * @brief Returns the number of whole frame-intervals missed since the
+     * last Reset, based on the largest gap between consecutive frames.
+     */
+    uint64_t FramesLost(int64_t frameNs)
+    {
+        std::lock_guard<std::mutex> lock(m_mutex);
+        int64_t maxGapNs = std::max(m_maxGapNs, NowNs() - m_lastNs);
+        int64_t intervals = (maxGapNs + frameNs/2) / frameNs;
+        return (intervals > 1) ? intervals - 1 : 0;
+    }
+
+    bool WaitForFrames(uint64_t count, uint timeoutMs)
+    {
+        std::unique_lock<std::mutex> lock(m_mutex);
+        uint64_t target = m_frames + count;
+        return m_frameCond.wait_for(lock, std::chrono::milliseconds(timeoutMs),
+            [&]{return m_frames >= target;});
+    }
+
+private:
+
+    static int64_t NowNs()
+    {
+        return std::chrono::duration_cast<std::chrono::nanoseconds>(
+            std::chrono::steady_clock::now().time_since_epoch()).count();
+    }
+
+    static GstPadProbeReturn OnBuffer(GstPad* pPad,
+        GstPadProbeInfo* pInfo, gpointer pMonitor)
+    {
+        FrameMonitor* pThis = static_cast<FrameMonitor*>(pMonitor);
+        {
+            std::lock_guard<std::mutex> lock(pThis->m_mutex);
+            int64_t nowNs = NowNs();
+            pThis->m_maxGapNs = std::max(pThis->m_maxGapNs,
+                nowNs - pThis->m_lastNs);
+            pThis->m_lastNs = nowNs;
+            pThis->m_frames++;
+        }
+        pThis->m_frameCond.notify_all();
+        return GST_PAD_PROBE_OK;
+    }
+
+    std::mutex m_mutex;
+    std::condition_variable m_frameCond;
+    uint64_t m_frames;
+    int64_t m_lastNs;
+    int64_t m_maxGapNs;
+};
+
+//--------------------------------------------------------------------------------
+// Element accounting - elements created by the benchmark are weak-referenced
+// so that elements never finalized after their deletion can be counted.
+
+static std::atomic<uint64_t> s_elementsCreated(0);
+static std::atomic<uint64_t> s_elementsFinalized(0);
+
+static void element_finalized_cb(gpointer pData, GObject* pObject)
+{
+    s_elementsFinalized++;
+}
+
+static GstElement* get_gst_element(const std::wstring& name)
+{
+    void* pElement(NULL);
+    if (dsl_gst_element_get(name.c_str(), &pElement) != DSL_RESULT_SUCCESS)
+    {
+        return NULL;
+    }
+    return (GstElement*)pElement;
+}
+
+static DslReturnType new_tracked_element(const std::wstring& name,
+    const wchar_t* factoryName)
+{
+    DslReturnType retval = dsl_gst_element_new(name.c_str(), factoryName);
+    if (retval == DSL_RESULT_SUCCESS)
+    {
+        g_object_weak_ref(G_OBJECT(get_gst_element(name)),
+            element_finalized_cb, NULL);
+        s_elementsCreated++;
+    }
+    return retval;
+}
+
+/**
+ * @brief Counts all elements and pads in a bin, recursively.
+ */
+static void count_gst_objects(GstElement* pElement,
+    uint64_t& elements, uint64_t& pads)
+{
+    elements++;
+    GST_OBJECT_LOCK(pElement);
+    pads += pElement->numpads;
+    if (GST_IS_BIN(pElement))
+    {
+        for (GList* pChild = GST_BIN_CHILDREN(pElement); pChild;
+            pChild = pChild->next)
+        {
+            count_gst_objects(GST_ELEMENT(pChild->data), elements, pads);
+        }
+    }
+    GST_OBJECT_UNLOCK(pElement);
+}
+
+/**
+ * @brief Counts all elements and pads in the Pipeline that owns pElement.
+ */
+static void count_pipeline_objects(GstElement* pElement,
+    uint64_t& elements, uint64_t& pads)
+{
+    elements = pads = 0;
+
+    GstObject* pTop = GST_OBJECT(gst_object_ref(pElement));
+    GstObject* pParent;
+    while ((pParent = gst_object_get_parent(pTop)))
+    {
+        gst_object_unref(pTop);
+        pTop = pParent;
+    }
+    count_gst_objects(GST_ELEMENT(pTop), elements, pads);
+    gst_object_unref(pTop);
+}
+
+//--------------------------------------------------------------------------------
+// Test Sources and Sinks - pure GStreamer elements in Custom Components
+
+static DslReturnType new_test_source(const std::wstring& name)
+{
+    std::wstring srcName(name + L"-videotestsrc");
+    std::wstring capsName(name + L"-capsfilter");
+
+    DslReturnType retval = new_tracked_element(srcName, L"videotestsrc");
+    if (retval == DSL_RESULT_SUCCESS)
+    {
+        retval = dsl_gst_element_property_boolean_set(srcName.c_str(),
+            L"is-live", true);
+    }
+    if (retval == DSL_RESULT_SUCCESS)
+    {
+        retval = new_tracked_element(capsName, L"capsfilter");
+    }
+    if (retval == DSL_RESULT_SUCCESS)
+    {
+        retval = dsl_gst_element_property_caps_set(capsName.c_str(),
+            L"caps", s_capsName.c_str());
+    }
+    if (retval == DSL_RESULT_SUCCESS)
+    {
+        const wchar_t* elements[] = {srcName.c_str(), capsName.c_str(), NULL};
+        retval = dsl_source_custom_new_element_add_many(name.c_str(),
+            true, elements);
+    }
+    return retval;
+}
+
+static DslReturnType delete_test_source(const std::wstring& name)
+{
+    std::wstring srcName(name + L"-videotestsrc");
+    std::wstring capsName(name + L"-capsfilter");
+    const wchar_t* elements[] = {srcName.c_str(), capsName.c_str(), NULL};
+
+    DslReturnType retval = dsl_source_custom_element_remove_many(
+        name.c_str(), elements);
+    if (retval == DSL_RESULT_SUCCESS)
+    {
+        retval = dsl_component_delete(name.c_str());
+    }
+    if (retval == DSL_RESULT_SUCCESS)
+    {
+        retval = dsl_gst_element_delete_many(elements);
+    }
+    return retval;
+}
+
+static DslReturnType new_test_sink(const std::wstring& name)
+{
+    std::wstring sinkName(name + L"-fakesink");
+
+    DslReturnType retval = new_tracked_element(sinkName, L"fakesink");
+    if (retval == DSL_RESULT_SUCCESS)
+    {
+        retval = dsl_gst_element_property_boolean_set(sinkName.c_str(),
+            L"async", false);
+    }
+    if (retval == DSL_RESULT_SUCCESS)
+    {
+        retval = dsl_sink_custom_new_element_add(name.c_str(),
+            sinkName.c_str());
+    }
+    return retval;
+}
+
+static DslReturnType delete_test_sink(const std::wstring& name)
+{
+    std::wstring sinkName(name + L"-fakesink");
+
+    DslReturnType retval = dsl_sink_custom_element_remove(
+        name.c_str(), sinkName.c_str());
+    if (retval == DSL_RESULT_SUCCESS)
+    {
+        retval = dsl_component_delete(name.c_str());
+    }
+    if (retval == DSL_RESULT_SUCCESS)
+    {
+        retval = dsl_gst_element_delete(sinkName.c_str());
+    }
+    return retval;
+}
+
+//--------------------------------------------------------------------------------
+
+/**
+ * @struct BenchmarkRun
+ * @brief parameters for a single benchmark run.
+ */
+struct BenchmarkRun
+{
+    std::string scenario;
+    uint cycles;
+    uint warmup;
+    uint fps;
+    uint settleMs;
+    uint blockingTimeout;
+};
+
+/**
+ * @class BenchmarkResults
+ * @brief Latencies and failures per operation, and frames lost per change,
+ * for all measured cycles of a run.
+ */
+class BenchmarkResults
+{
+public:
+
+    BenchmarkResults()
+        : measure(false)
+    {
+    }
+
+    /**
+     * @brief Calls and times a single reconfiguration operation.
+     * @return true if the operation succeeded.
+     */
+    bool Time(const std::string& operation,
+        std::function<DslReturnType()> function)
+    {
+        auto start = std::chrono::steady_clock::now();
+        DslReturnType retval = function();
+        auto end = std::chrono::steady_clock::now();
+
+        if (measure)
+        {
+            m_latenciesNs[operation].push_back(
+                std::chrono::duration_cast<std::chrono::nanoseconds>(
+                    end - start).count());
+            if (retval != DSL_RESULT_SUCCESS)
+            {
+                m_failures[operation]++;
+            }
+        }
+        return (retval == DSL_RESULT_SUCCESS);
+    }
+
+    /**
+     * @brief Counts a failed setup or cleanup step of a cycle.
+     */
+    bool Check(const std::string& step, DslReturnType retval)
+    {
+        if (measure and retval != DSL_RESULT_SUCCESS)
+        {
+            m_failures[step]++;
+        }
+        return (retval == DSL_RESULT_SUCCESS);
+    }
+
+    void AddFramesLost(uint64_t framesLost)
+    {
+        if (measure)
+        {
+            m_framesLost.push_back(framesLost);
+        }
+    }
+
+    void Write(std::ostream& stream)
+    {
+        stream << "\"operations\": {";
+        for (auto iter = m_latenciesNs.begin(); iter != m_latenciesNs.end(); iter++)
+        {
+            std::vector<uint64_t>& latencies = iter->second;
+            std::sort(latencies.begin(), latencies.end());
+
+            stream << (iter == m_latenciesNs.begin() ? "" : ", ")
+                << "\"" << iter->first << "\": {"
+                << "\"count\": " << latencies.size()
+                << ", \"failures\": " << m_failures[iter->first]
+                << ", \"p50_us\": " << Percentile(latencies, 50)/1000.0
+                << ", \"p99_us\": " << Percentile(latencies, 99)/1000.0
+                << ", \"max_us\": " << latencies.back()/1000.0
+                << "}";
+        }
+        stream << "}, \"step_failures\": {";
+        bool first(true);
+        for (auto const& imap: m_failures)
+        {
+            if (m_latenciesNs.find(imap.first) == m_latenciesNs.end())
+            {
+                stream << (first ? "" : ", ")
+                    << "\"" << imap.first << "\": " << imap.second;
+                first = false;
+            }
+        }
+        uint64_t total(0), maximum(0), changes(0);
+        for (auto const& framesLost: m_framesLost)
+        {
+            total += framesLost;
+            maximum = std::max(maximum, framesLost);
+            changes += (framesLost > 0);
+        }
+        stream << "}, \"frames_lost\": " << total
+            << ", \"frames_lost_max\": " << maximum
+            << ", \"changes_with_frames_lost\": " << changes;
+    }
+
+    bool measure;
+
+private:
+
+    static uint64_t Percentile(const std::vector<uint64_t>& sorted, uint percent)
+    {
+        if (sorted.empty())
+        {
+            return 0;
+        }
+        return sorted[std::min(sorted.size() - 1,
+            (size_t)((sorted.size() * percent + 99) / 100) - 1)];
+    }
+
+    std::map<std::string, std::vector<uint64_t>> m_latenciesNs;
+    std::map<std::string, uint64_t> m_failures;
+    std::vector<uint64_t> m_framesLost;
+};
+
+//--------------------------------------------------------------------------------
+// Scenarios - each sets up the static part of the Pipeline and returns the
+// name of the Custom Sink to observe, and runs a single reconfiguration cycle.
+
+/**
+ * @struct Scenario
+ * @brief setup and cycle functions for a benchmark scenario.
+ */
+struct Scenario
+{
+    std::function<bool(const BenchmarkRun&, std::wstring&)> setup;
+    std::function<void(const BenchmarkRun&, uint, FrameMonitor&,
+        BenchmarkResults&)> cycle;
+};
+
+static void settle(const BenchmarkRun& run)
+{
+    std::this_thread::sleep_for(std::chrono::milliseconds(run.settleMs));
+}
+
+static int64_t frame_ns(const BenchmarkRun& run)
+{
+    return 1000000000LL / run.fps;
+}
+
+static bool setup_source_pipeline(const BenchmarkRun& run,
+    std::wstring& observedSink)
+{
+    observedSink = s_baseSinkName;
+    const wchar_t* components[] =
+        {L"base-source", s_baseSinkName.c_str(), NULL};
+
+    return new_test_source(L"base-source") == DSL_RESULT_SUCCESS and
+        new_test_sink(s_baseSinkName) == DSL_RESULT_SUCCESS and
+        dsl_pipeline_new_component_add_many(s_pipelineName.c_str(),
+            components) == DSL_RESULT_SUCCESS and
+        dsl_pipeline_streammux_batch_size_set(s_pipelineName.c_str(),
+            2) == DSL_RESULT_SUCCESS;
+}
+
+static void source_add_remove_cycle(const BenchmarkRun& run, uint index,
+    FrameMonitor& monitor, BenchmarkResults& results)
+{
+    std::wstring name(L"dynamic-source-" + std::to_wstring(index));
+    if (!results.Check("source-new", new_test_source(name)))
+    {
+        return;
+    }
+    monitor.Reset();
+    bool added = results.Time("source-add", [&]{
+        return dsl_pipeline_component_add(s_pipelineName.c_str(), name.c_str());});
+    settle(run);
+    results.AddFramesLost(monitor.FramesLost(frame_ns(run)));
+
+    if (added)
+    {
+        monitor.Reset();
+        results.Time("source-remove", [&]{
+            return dsl_pipeline_component_remove(s_pipelineName.c_str(),
+                name.c_str());});
+        settle(run);
+        results.AddFramesLost(monitor.FramesLost(frame_ns(run)));
+    }
+    results.Check("source-delete", delete_test_source(name));
+}
+
+static void sink_add_remove_cycle(const BenchmarkRun& run, uint index,
+    FrameMonitor& monitor, BenchmarkResults& results)
+{
+    std::wstring name(L"dynamic-sink-" + std::to_wstring(index));
+    if (!results.Check("sink-new", new_test_sink(name)))
+    {
+        return;
+    }
+    monitor.Reset();
+    bool added = results.Time("sink-add", [&]{
+        return dsl_pipeline_component_add(s_pipelineName.c_str(), name.c_str());});
+    settle(run);
+    results.AddFramesLost(monitor.FramesLost(frame_ns(run)));
+
+    if (added)
+    {
+        monitor.Reset();
+        results.Time("sink-remove", [&]{
+            return dsl_pipeline_component_remove(s_pipelineName.c_str(),
+                name.c_str());});
+        settle(run);
+        results.AddFramesLost(monitor.FramesLost(frame_ns(run)));
+    }
+    results.Check("sink-delete", delete_test_sink(name));
+}
+
+static bool setup_splitter_pipeline(const BenchmarkRun& run,
+    std::wstring& observedSink)
+{
+    observedSink = s_baseSinkName;
+    const wchar_t* components[] = {L"base-source", s_teeName.c_str(), NULL};
+
+    return new_test_source(L"base-source") == DSL_RESULT_SUCCESS and
+        new_test_sink(s_baseSinkName) == DSL_RESULT_SUCCESS and
+        dsl_tee_splitter_new(s_teeName.c_str()) == DSL_RESULT_SUCCESS and
+        dsl_tee_blocking_timeout_set(s_teeName.c_str(),
+            run.blockingTimeout) == DSL_RESULT_SUCCESS and
+        dsl_tee_branch_add(s_teeName.c_str(),
+            s_baseSinkName.c_str()) == DSL_RESULT_SUCCESS and
+        dsl_pipeline_new_component_add_many(s_pipelineName.c_str(),
+            components) == DSL_RESULT_SUCCESS;
+}
+
+static void branch_add_remove_cycle(const BenchmarkRun& run, uint index,
+    FrameMonitor& monitor, BenchmarkResults& results)
+{
+    std::wstring name(L"dynamic-branch-" + std::to_wstring(index));
+    if (!results.Check("branch-new", new_test_sink(name)))
+    {
+        return;
+    }
+    monitor.Reset();
+    bool added = results.Time("branch-add", [&]{
+        return dsl_tee_branch_add(s_teeName.c_str(), name.c_str());});
+    settle(run);
+    results.AddFramesLost(monitor.FramesLost(frame_ns(run)));
+
+    if (added)
+    {
+        monitor.Reset();
+        results.Time("branch-remove", [&]{
+            return dsl_tee_branch_remove(s_teeName.c_str(), name.c_str());});
+        settle(run);
+        results.AddFramesLost(monitor.FramesLost(frame_ns(run)));
+    }
+    results.Check("branch-delete", delete_test_sink(name));
+}
+
+static bool setup_demuxer_pipeline(const BenchmarkRun& run,
+    std::wstring& observedSink)
+{
+    observedSink = s_baseSinkName;
+    const wchar_t* components[] = {L"base-source-0", L"base-source-1",
+        s_teeName.c_str(), NULL};
+
+    return new_test_source(L"base-source-0") == DSL_RESULT_SUCCESS and
+        new_test_source(L"base-source-1") == DSL_RESULT_SUCCESS and
+        new_test_sink(s_baseSinkName) == DSL_RESULT_SUCCESS and
+        dsl_tee_demuxer_new(s_teeName.c_str(), 2) == DSL_RESULT_SUCCESS and
+        dsl_tee_blocking_timeout_set(s_teeName.c_str(),
+            run.blockingTimeout) == DSL_RESULT_SUCCESS and
+        dsl_tee_demuxer_branch_add_to(s_teeName.c_str(),
+            s_baseSinkName.c_str(), 0) == DSL_RESULT_SUCCESS and
+        dsl_pipeline_new_component_add_many(s_pipelineName.c_str(),
+            components) == DSL_RESULT_SUCCESS;
+}
+
+static void demuxer_move_cycle(const BenchmarkRun& run, uint index,
+    FrameMonitor& monitor, BenchmarkResults& results)
+{
+    // The observed sink starts on stream 0, alternate between the streams
+    monitor.Reset();
+    results.Time("branch-move", [&]{
+        return dsl_tee_demuxer_branch_move_to(s_teeName.c_str(),
+            s_baseSinkName.c_str(), (index+1) % 2);});
+    settle(run);
+    results.AddFramesLost(monitor.FramesLost(frame_ns(run)));
+}
+
+static const std::map<std::string, Scenario> s_scenarios =
+{
+    {"source-add-remove", {setup_source_pipeline, source_add_remove_cycle}},
+    {"sink-add-remove", {setup_source_pipeline, sink_add_remove_cycle}},
+    {"branch-add-remove", {setup_splitter_pipeline, branch_add_remove_cycle}},
+    {"demuxer-move", {setup_demuxer_pipeline, demuxer_move_cycle}},
+};
+
+//--------------------------------------------------------------------------------
+
+static bool run_benchmark(const BenchmarkRun& run, const std::string& label)
+{
+    std::wstring capsString(L"video/x-raw,width="
+        + std::to_wstring(BENCHMARK_FRAME_WIDTH) + L",height="
+        + std::to_wstring(BENCHMARK_FRAME_HEIGHT) + L",framerate="
+        + std::to_wstring(run.fps) + L"/1");
+
+    const Scenario& scenario = s_scenarios.at(run.scenario);
+    std::wstring observedSink;
+    FrameMonitor monitor;
+
+    if (dsl_gst_caps_new(s_capsName.c_str(),
+            capsString.c_str()) != DSL_RESULT_SUCCESS or
+        !scenario.setup(run, observedSink) or
+        !monitor.AddTo(get_gst_element(observedSink + L"-fakesink")) or
+        dsl_pipeline_play(s_pipelineName.c_str()) != DSL_RESULT_SUCCESS or
+        !monitor.WaitForFrames(BENCHMARK_FIRST_FRAMES,
+            BENCHMARK_FIRST_FRAMES_TIMEOUT_MS))
+    {
+        std::cerr << "Failed to setup and play scenario '"
+            << run.scenario << "'\n";
+        dsl_pipeline_stop(s_pipelineName.c_str());
+        dsl_delete_all();
+        return false;
+    }
+
+    BenchmarkResults results;
+    GstElement* pObservedSink = get_gst_element(observedSink + L"-fakesink");
+    uint64_t startElements(0), startPads(0);
+    uint startComponents(0), startGstElements(0);
+    uint64_t startFinalized(0), startCreated(0);
+
+    auto start = std::chrono::steady_clock::now();
+
+    for (uint i = 0; i < run.warmup + run.cycles; i++)
+    {
+        // Baseline is taken after the warmup cycles, once all lazily
+        // created elements and pads exist.
+        if (i == run.warmup)
+        {
+            count_pipeline_objects(pObservedSink, startElements, startPads);
+            startComponents = dsl_component_list_size();
+            startGstElements = dsl_gst_element_list_size();
+            startCreated = s_elementsCreated;
+            startFinalized = s_elementsFinalized;
+            results.measure = true;
+            start = std::chrono::steady_clock::now();
+        }
+        scenario.cycle(run, i, monitor, results);
+    }
+
+    double seconds = std::chrono::duration_cast<std::chrono::milliseconds>(
+        std::chrono::steady_clock::now() - start).count() / 1000.0;
+    uint64_t endElements(0), endPads(0);
+    count_pipeline_objects(pObservedSink, endElements, endPads);
+
+    std::cout << std::fixed << std::setprecision(3)
+        << "{\"label\": \"" << label << "\""
+        << ", \"scenario\": \"" << run.scenario << "\""
+        << ", \"cycles\": " << run.cycles
+        << ", \"fps\": " << run.fps
+        << ", \"settle_ms\": " << run.settleMs
+        << ", \"blocking_timeout\": " << run.blockingTimeout
+        << ", \"elapsed_sec\": " << seconds << ", ";
+    results.Write(std::cout);
+    std::cout << ", \"leaked_pipeline_elements\": "
+            << (int64_t)(endElements - startElements)
+        << ", \"leaked_pipeline_pads\": " << (int64_t)(endPads - startPads)
+        << ", \"leaked_components\": "
+            << (int)(dsl_component_list_size() - startComponents)
+        << ", \"leaked_gst_elements\": "
+            << (int)(dsl_gst_element_list_size() - startGstElements)
+        << ", \"elements_not_finalized\": "
+            << (int64_t)((s_elementsCreated - startCreated)
+                - (s_elementsFinalized - startFinalized))
+        << "}" << std::endl;
+
+    dsl_pipeline_stop(s_pipelineName.c_str());
+    dsl_delete_all();
+    return true;
+}
+
+/**
+ * @struct BenchmarkContext
+ * @brief all runs to execute from the benchmark worker thread.
+ */
+struct BenchmarkContext
+{
+    std::vector<std::string> scenarios;
+    BenchmarkRun run;
+    std::string label;
+    int result;
+    std::thread worker;
+};
+
+static gboolean start_benchmark_cb(gpointer pContext)
+{
+    BenchmarkContext* pBenchmark = static_cast<BenchmarkContext*>(pContext);
+
+    pBenchmark->worker = std::thread([pBenchmark]{
+        for (auto const& scenario: pBenchmark->scenarios)
+        {
+            pBenchmark->run.scenario = scenario;
+            if (!run_benchmark(pBenchmark->run, pBenchmark->label))
+            {
+                pBenchmark->result = 1;
+            }
+        }
+        dsl_main_loop_quit();
+    });
+    return FALSE;
+}
+
+//--------------------------------------------------------------------------------
+
+static std::vector<std::string> split_list(const char* list)
+{
+    std::vector<std::string> items;
+    std::stringstream stream(list);
+    std::string item;
+    while (std::getline(stream, item, ','))
+    {
+        items.push_back(item);
+    }
+    return items;
+}
+
+static void print_usage(const char* app)
+{
+    std::cerr << "Usage: " << app << " [options]\n"
+        << "  --scenario=LIST         comma separated list of scenarios, default\n"
+        << "                          all of source-add-remove, sink-add-remove,\n"
+        << "                          branch-add-remove, demuxer-move\n"
+        << "  --cycles=N              number of measured cycles, default 1000\n"
+        << "  --warmup=N              number of unmeasured cycles, default 10\n"
+        << "  --fps=N                 frame-rate of the test sources, default 30\n"
+        << "  --settle-ms=N           time to play after each change, default 100\n"
+        << "  --blocking-timeout=N    Tee blocking-timeout in seconds, default 1\n"
+        << "  --label=STRING          label added to each result, i.e. a commit id\n";
+}
+
+int main(int argc, char** argv)
+{
+    std::vector<std::string> scenarios;
+    for (auto const& imap: s_scenarios)
+    {
+        scenarios.push_back(imap.first);
+    }
+    BenchmarkRun run{"", 1000, 10, 30, 100, 1};
+    std::string label;
+
+    static struct option options[] = {
+        {"scenario", required_argument, 0, 's'},
+        {"cycles", required_argument, 0, 'c'},
+        {"warmup", required_argument, 0, 'w'},
+        {"fps", required_argument, 0, 'f'},
+        {"settle-ms", required_argument, 0, 'm'},
+        {"blocking-timeout", required_argument, 0, 'b'},
+        {"label", required_argument, 0, 'l'},
+        {"help", no_argument, 0, 'h'},
+        {0, 0, 0, 0}
+    };
+
+    try
+    {
+        int opt;
+        while ((opt = getopt_long(argc, argv, "", options, NULL)) != -1)
+        {
+            switch (opt)
+            {
+            case 's':
+                scenarios = split_list(optarg);
+                break;
+            case 'c':
+                run.cycles = std::stoul(optarg);
+                break;
+            case 'w':
+                run.warmup = std::stoul(optarg);
+                break;
+            case 'f':
+                run.fps = std::stoul(optarg);
+                break;
+            case 'm':
+                run.settleMs = std::stoul(optarg);
+                break;
+            case 'b':
+                run.blockingTimeout = std::stoul(optarg);
+                break;
+            case 'l':
+                label = optarg;
+                break;
+            default:
+                print_usage(argv[0]);
+                return 1;
+            }
+        }
+        for (auto const& scenario: scenarios)
+        {
+            if (s_scenarios.find(scenario) == s_scenarios.end())
+            {
+                throw std::invalid_argument(scenario);
+            }
+        }
+        if (!run.cycles or !run.fps or !run.blockingTimeout)
+        {
+            throw std::invalid_argument("0");
+        }
+    }
+    catch(const std::exception& e)
+    {
+        std::cerr << "Invalid argument: " << e.what() << "\n";
+        print_usage(argv[0]);
+        return 1;
+    }
+
+    // The scenarios are run from a worker thread, started once the main-loop
+    // -- required for the Pipeline bus-watch -- is running in the main thread.
+    BenchmarkContext context{scenarios, run, label, 0};
+    g_idle_add(start_benchmark_cb, &context);
+    dsl_main_loop_run();
+    context.worker.join();
+
+    return context.result;
+}
@@ -0,0 +1,103 @@
+
+################################################################################
+# The MIT License
+#
+# Copyright (c) 2019-2024, Prominence AI, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+#!/usr/bin/env python
+
+import sys
+
+import dsl
+from dsl import *
+
+NUM_RECORDS = 4
+
+##
+# Returns the client checker's result for every record, as set by the test.
+##
+def check_for_occurrences(records, client_data):
+    return client_data['flags']
+
+##
+# Calls the batch checker of the last Custom Batch Trigger created - as the
+# Trigger would for a frame with NUM_RECORDS objects - returning the number
+# of occurrences and the per-record results.
+##
+def batch_checker_call():
+    records = (dsl_ode_object_record * NUM_RECORDS)()
+    for i in range(NUM_RECORDS):
+        records[i].class_id = i
+    results = (c_uint8 * NUM_RECORDS)()
+    occurrences = dsl.callbacks[-1](addressof(records), NUM_RECORDS,
+        addressof(results), None)
+    return occurrences, list(results)
+
+def main(args):
+
+    client_data = {'flags': None}
+    passed = True
+
+    try:
+        retval = dsl_ode_trigger_custom_batch_new('batch-trigger',
+            DSL_ODE_ANY_SOURCE, DSL_ODE_ANY_CLASS, DSL_ODE_TRIGGER_LIMIT_NONE,
+            check_for_occurrences, client_data)
+        if retval != DSL_RETURN_SUCCESS:
+            print('FAILED: unable to create batch-trigger')
+            passed = False
+
+        # Valid masks and indices, with and without NumPy arrays
+        valid_flags = [[True, False, True, False], [0, 2]]
+        if dsl.np is not None:
+            valid_flags += [dsl.np.array([True, False, True, False]),
+                dsl.np.array([0, 2])]
+        for flags in valid_flags:
+            client_data['flags'] = flags
+            occurrences, results = batch_checker_call()
+            if occurrences != 2 or results != [1, 0, 1, 0]:
+                print('FAILED: valid flags', flags, 'returned', occurrences,
+                    results)
+                passed = False
+
+        # Masks of the wrong length and indices out of range result in no
+        # occurrence, rather than an exception raised in the callback.
+        invalid_flags = [[True, False], [True] * (NUM_RECORDS+1),
+            [0, NUM_RECORDS], [-1]]
+        if dsl.np is not None:
+            invalid_flags += [dsl.np.array([True, False]),
+                dsl.np.ones(NUM_RECORDS+1, dtype=bool),
+                dsl.np.array([0, NUM_RECORDS]), dsl.np.array([-1]),
+                dsl.np.array([0.0, 2.0])]
+        for flags in invalid_flags:
+            client_data['flags'] = flags
+            occurrences, results = batch_checker_call()
+            if occurrences != 0 or any(results):
+                print('FAILED: invalid flags', flags, 'returned', occurrences,
+                    results)
+                passed = False
+    finally:
+        dsl_delete_all()
+
+    print('PASSED' if passed else 'FAILED')
+    return 0 if passed else 1
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,79 @@
+
+
+################################################################################
+# The MIT License
+#
+# Copyright (c) 2019-2024, Prominence AI, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+#!/usr/bin/env python
+
+import os
+import sys
+import tempfile
+
+from dsl_spec import *
+from dsl_spec import _config_file_validate
+
+# Unterminated flow-sequence, which PyYAML fails to parse.
+MALFORMED_YAML = 'pipelines:\n  - name: [pipeline\n'
+
+##
+# Writes contents to a new temporary file with suffix, returning its path.
+##
+def temp_file_write(suffix, contents):
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    with os.fdopen(fd, 'w') as temp_file:
+        temp_file.write(contents)
+    return path
+
+def main(args):
+
+    spec_path = temp_file_write('.yaml', MALFORMED_YAML)
+    config_path = temp_file_write('.yml', MALFORMED_YAML)
+    passed = True
+
+    try:
+        # A malformed YAML spec file must raise a SpecError
+        try:
+            dsl_spec_file_load(spec_path)
+            print('FAILED: malformed YAML spec file loaded without error')
+            passed = False
+        except SpecError as e:
+            print('malformed YAML spec file raised SpecError:', e)
+
+        # A malformed YAML config file must be reported as a spec error
+        errors = []
+        dsl_spec_config_cache_clear()
+        _config_file_validate('config_file', config_path, errors, 'test')
+        if not errors:
+            print('FAILED: malformed YAML config file validated without error')
+            passed = False
+        else:
+            print('malformed YAML config file reported:', errors)
+    finally:
+        os.remove(spec_path)
+        os.remove(config_path)
+
+    print('PASSED' if passed else 'FAILED')
+    return 0 if passed else 1
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
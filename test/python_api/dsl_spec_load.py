@@ -0,0 +1,151 @@
+
+################################################################################
+# The MIT License
+#
+# Copyright (c) 2019-2024, Prominence AI, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+#!/usr/bin/env python
+
+import os
+import sys
+import tempfile
+
+from dsl import *
+from dsl_spec import *
+
+# Infer config file without any referenced files to validate.
+INFER_CONFIG = '[property]\ngpu-id=0\nnetwork-mode=2\n'
+
+##
+# Writes contents to a new temporary file with suffix, returning its path.
+##
+def temp_file_write(suffix, contents):
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    with os.fdopen(fd, 'w') as temp_file:
+        temp_file.write(contents)
+    return path
+
+##
+# Returns a spec with a single Primary GIE using infer_config_file.
+##
+def infer_spec(name, infer_config_file):
+    return {'components': [{'name': name, 'type': 'infer_gie_primary',
+        'infer_config_file': infer_config_file, 'model_engine_file': None,
+        'interval': 0}]}
+
+##
+# Returns True if calling dsl_spec_load(spec, max_workers) raises a SpecError
+# with an error containing expected.
+##
+def spec_load_fails(spec, expected, max_workers=DSL_SPEC_DEFAULT_MAX_WORKERS):
+    try:
+        dsl_spec_load(spec, max_workers=max_workers)
+    except SpecError as e:
+        print('spec raised SpecError:', e)
+        return any(expected in error for error in e.errors)
+    return False
+
+def main(args):
+
+    config_path = temp_file_write('.txt', INFER_CONFIG)
+    passed = True
+
+    try:
+        # Spec validation errors - all errors are reported together
+        errors = dsl_spec_validate({
+            'unknown_section': [],
+            'components': [
+                {'name': 'fake-sink', 'type': 'sink_fake'},
+                {'name': 'fake-sink', 'type': 'sink_fake'},
+                {'type': 'sink_fake'},
+                {'name': 'missing-config', 'type': 'infer_gie_primary',
+                    'infer_config_file': '/tmp/no-such-config.txt',
+                    'model_engine_file': None, 'interval': 0}],
+            'pipelines': [
+                {'name': 'pipeline', 'components': ['fake-sink', 'no-sink']}]})
+        expected = ['unknown section unknown_section',
+            "components 'fake-sink': name is not unique",
+            'components: every entry requires a name',
+            "components 'missing-config': infer_config_file not found",
+            "pipelines 'pipeline': components 'no-sink' not found"]
+        for error in expected:
+            if not any(error in found for found in errors):
+                print('FAILED: validation error not reported:', error)
+                passed = False
+
+        # Unknown component types - rejected before any object is created
+        if not spec_load_fails({'components': [
+            {'name': 'fake-sink', 'type': 'sink_fake'},
+            {'name': 'bad-sink', 'type': 'sink_no_such_type'}]},
+            "components 'bad-sink': unknown type sink_no_such_type"):
+            print('FAILED: unknown component type was not reported')
+            passed = False
+        if dsl_component_list_size() != 0:
+            print('FAILED: components created for an invalid spec')
+            passed = False
+
+        # Config files are parsed once and cached across specs
+        dsl_spec_config_cache_clear()
+        if dsl_spec_validate(infer_spec('primary-gie-1', config_path)) or \
+            dsl_spec_validate(infer_spec('primary-gie-2', config_path)):
+            print('FAILED: infer specs failed validation')
+            passed = False
+        metrics = dsl_spec_config_cache_metrics_get()
+        print('config cache metrics:', metrics)
+        if metrics != {'files': 1, 'hits': 1, 'misses': 1}:
+            print('FAILED: config file was not cached across specs')
+            passed = False
+
+        # A changed config file is parsed again
+        with open(config_path, 'a') as config_file:
+            config_file.write('batch-size=4\n')
+        dsl_spec_validate(infer_spec('primary-gie-3', config_path))
+        if dsl_spec_config_cache_metrics_get()['misses'] != 2:
+            print('FAILED: changed config file was not parsed again')
+            passed = False
+
+        # Failure rollback of parallel construction - the name of the last
+        # Sink is already in use, so its constructor fails while the others
+        # are constructed in parallel.
+        retval = dsl_sink_fake_new('fake-sink-in-use')
+        if retval != DSL_RETURN_SUCCESS:
+            print('FAILED: unable to create fake-sink-in-use')
+            passed = False
+        if not spec_load_fails({'components': [
+            {'name': 'fake-sink-' + str(i), 'type': 'sink_fake'}
+                for i in range(1, 8)]
+            + [{'name': 'fake-sink-in-use', 'type': 'sink_fake'}]},
+            "components 'fake-sink-in-use'", max_workers=4):
+            print('FAILED: construction failure was not reported')
+            passed = False
+        if dsl_component_list_size() != 1:
+            print('FAILED: components created were not rolled back')
+            passed = False
+    finally:
+        dsl_component_delete_all()
+        dsl_spec_config_cache_clear()
+        os.remove(config_path)
+
+    print('PASSED' if passed else 'FAILED')
+    return 0 if passed else 1
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,272 @@
+
+################################################################################
+# The MIT License
+#
+# Copyright (c) 2019-2024, Prominence AI, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+#!/usr/bin/env python
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+from dsl_supervisor import *
+
+# Fake dsl module imported by each worker in place of libdsl, so that the
+# Supervisor can be tested without GStreamer or DeepStream.
+FAKE_DSL = '''
+import threading
+
+DSL_RETURN_SUCCESS = 0
+DSL_RESULT_PIPELINE_NAME_NOT_FOUND = 0x00080001
+DSL_STATE_PLAYING = 4
+
+_pipelines = {}
+_main_loop_done = threading.Event()
+
+def dsl_pipeline_new(name):
+    _pipelines[name] = 0
+    return DSL_RETURN_SUCCESS
+
+def dsl_pipeline_play(name):
+    if name not in _pipelines:
+        return DSL_RESULT_PIPELINE_NAME_NOT_FOUND
+    _pipelines[name] = DSL_STATE_PLAYING
+    return DSL_RETURN_SUCCESS
+
+def dsl_pipeline_stop(name):
+    _pipelines[name] = 0
+    return DSL_RETURN_SUCCESS
+
+def dsl_pipeline_state_get(name):
+    if name not in _pipelines:
+        return DSL_RESULT_PIPELINE_NAME_NOT_FOUND, 0
+    return DSL_RETURN_SUCCESS, _pipelines[name]
+
+def dsl_pipeline_list_size():
+    return len(_pipelines)
+
+def dsl_delete_all():
+    _pipelines.clear()
+
+def dsl_return_value_to_string(result):
+    return str(result)
+
+def dsl_main_loop_run():
+    _main_loop_done.wait()
+
+def dsl_main_loop_quit():
+    _main_loop_done.set()
+'''
+
+# Seconds to wait for an expected worker event or state.
+WAIT_TIMEOUT = 20.0
+
+##
+# Builder that creates a single Pipeline named after the worker.
+##
+def build_pipeline(name):
+    import dsl
+    dsl.dsl_pipeline_new('pipeline-' + name)
+    return 'pipeline-' + name
+
+##
+# Builder that fails to build.
+##
+def build_failure(name):
+    return None
+
+##
+# Builder that creates a Pipeline and then crashes its worker after
+# crash_delay seconds, for the first num_crashes starts counted in count_path.
+##
+def build_crashing_pipeline(name, count_path, num_crashes, crash_delay):
+    with open(count_path, 'a') as count_file:
+        count_file.write('x')
+    with open(count_path) as count_file:
+        starts = len(count_file.read())
+    if starts <= num_crashes:
+        threading.Timer(crash_delay, os._exit, (1,)).start()
+    return build_pipeline(name)
+
+##
+# Collects all Supervisor events, by type, for the test to wait on.
+##
+class EventCollector:
+    def __init__(self):
+        self.events = []
+        self.lock = threading.Lock()
+
+    def __call__(self, event_type, name, data):
+        with self.lock:
+            self.events.append((event_type, name, data))
+
+    def count(self, event_type, name):
+        with self.lock:
+            return sum(1 for event in self.events
+                if event[0] == event_type and event[1] == name)
+
+    def wait(self, event_type, name, count=1, timeout=WAIT_TIMEOUT):
+        end_time = time.time() + timeout
+        while time.time() < end_time:
+            if self.count(event_type, name) >= count:
+                return True
+            time.sleep(0.05)
+        return False
+
+def main(args):
+
+    # Workers are spawned with the sys.path of this process, so each imports
+    # the fake dsl module ahead of any installed one.
+    fake_dsl_dir = tempfile.mkdtemp()
+    with open(os.path.join(fake_dsl_dir, 'dsl.py'), 'w') as fake_dsl_file:
+        fake_dsl_file.write(FAKE_DSL)
+    sys.path.insert(0, fake_dsl_dir)
+    count_path = os.path.join(fake_dsl_dir, 'starts')
+
+    passed = True
+
+    # Proxy calls, build-failure, and stop
+    supervisor = Supervisor(metrics_interval=0.2)
+    collector = EventCollector()
+    supervisor.event_listener_add(collector)
+    supervisor.worker_add('worker-1', build_pipeline)
+    supervisor.worker_add('worker-2', build_failure)
+    try:
+        supervisor.start()
+        if not collector.wait(DSL_SUPERVISOR_EVENT_WORKER_STARTED, 'worker-1'):
+            print('FAILED: worker-1 was not started')
+            passed = False
+
+        proxy = supervisor.proxy('worker-1')
+        if proxy.dsl_pipeline_state_get('pipeline-worker-1') != (0, 4):
+            print('FAILED: proxy call returned the wrong result')
+            passed = False
+        if proxy.dsl_pipeline_list_size() != 1:
+            print('FAILED: proxy call returned the wrong list size')
+            passed = False
+        try:
+            proxy.dsl_no_such_service()
+            print('FAILED: proxy call to an unknown service did not raise')
+            passed = False
+        except SupervisorError as e:
+            print('unknown service raised SupervisorError:', e)
+
+        if not collector.wait(DSL_SUPERVISOR_EVENT_WORKER_FAILED, 'worker-2'):
+            print('FAILED: worker-2 build failure was not reported')
+            passed = False
+        if collector.count(DSL_SUPERVISOR_EVENT_WORKER_RESTARTED, 'worker-2'):
+            print('FAILED: worker-2 was restarted after a build failure')
+            passed = False
+        if not collector.wait(DSL_SUPERVISOR_EVENT_WORKER_METRICS, 'worker-1'):
+            print('FAILED: worker-1 metrics were not posted')
+            passed = False
+    finally:
+        supervisor.stop()
+
+    metrics = supervisor.metrics()
+    print('metrics:', metrics)
+    if metrics['worker-1']['state'] != DSL_SUPERVISOR_WORKER_STATE_STOPPED or \
+        metrics['worker-2']['state'] != DSL_SUPERVISOR_WORKER_STATE_FAILED:
+        print('FAILED: workers in the wrong state after stop')
+        passed = False
+    if not collector.count(DSL_SUPERVISOR_EVENT_WORKER_STOPPED, 'worker-1'):
+        print('FAILED: worker-1 did not stop')
+        passed = False
+    if not supervisor.join(0):
+        print('FAILED: supervisor not done after stop')
+        passed = False
+
+    # Crash restart - the worker crashes once and is restarted
+    supervisor = Supervisor(restart_backoff=0.1)
+    collector = EventCollector()
+    supervisor.event_listener_add(collector)
+    supervisor.worker_add('worker-1', build_crashing_pipeline,
+        args=(count_path, 1, 0.5))
+    try:
+        supervisor.start()
+        if not collector.wait(DSL_SUPERVISOR_EVENT_WORKER_STARTED,
+            'worker-1', count=2):
+            print('FAILED: crashed worker was not restarted')
+            passed = False
+        if collector.count(DSL_SUPERVISOR_EVENT_WORKER_CRASHED, 'worker-1') != 1:
+            print('FAILED: worker crash was not reported once')
+            passed = False
+        if supervisor.proxy('worker-1').dsl_pipeline_state_get(
+            'pipeline-worker-1') != (0, 4):
+            print('FAILED: restarted worker is not playing')
+            passed = False
+        if supervisor.metrics()['worker-1']['restarts'] != 1:
+            print('FAILED: worker restart was not counted')
+            passed = False
+    finally:
+        supervisor.stop()
+    os.remove(count_path)
+
+    # Restart count reset - the worker runs for the healthy uptime before each
+    # of its crashes, so it's restarted more often than max_restarts.
+    supervisor = Supervisor(max_restarts=1, restart_backoff=0.1,
+        healthy_uptime=0.5)
+    collector = EventCollector()
+    supervisor.event_listener_add(collector)
+    supervisor.worker_add('worker-1', build_crashing_pipeline,
+        args=(count_path, 3, 1.0))
+    try:
+        supervisor.start()
+        if not collector.wait(DSL_SUPERVISOR_EVENT_WORKER_STARTED,
+            'worker-1', count=4):
+            print('FAILED: healthy worker was not restarted after each crash')
+            passed = False
+        if collector.count(DSL_SUPERVISOR_EVENT_WORKER_FAILED, 'worker-1'):
+            print('FAILED: healthy worker failed')
+            passed = False
+    finally:
+        supervisor.stop()
+    os.remove(count_path)
+
+    # Without a restart count reset, the second crash fails the worker.
+    supervisor = Supervisor(max_restarts=1, restart_backoff=0.1,
+        healthy_uptime=None)
+    collector = EventCollector()
+    supervisor.event_listener_add(collector)
+    supervisor.worker_add('worker-1', build_crashing_pipeline,
+        args=(count_path, 3, 1.0))
+    try:
+        supervisor.start()
+        if not collector.wait(DSL_SUPERVISOR_EVENT_WORKER_FAILED, 'worker-1'):
+            print('FAILED: worker did not fail after max_restarts')
+            passed = False
+        if collector.count(DSL_SUPERVISOR_EVENT_WORKER_CRASHED, 'worker-1') != 2:
+            print('FAILED: worker failed after the wrong number of crashes')
+            passed = False
+    finally:
+        supervisor.stop()
+
+    shutil.rmtree(fake_dsl_dir)
+
+    print('PASSED' if passed else 'FAILED')
+    return 0 if passed else 1
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
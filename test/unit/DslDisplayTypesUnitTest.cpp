@@ -351,6 +351,79 @@ SCENARIO( "A RGBA Polygon is constructed correctly", "[DisplayTypes]" )
     }
 }
 
+SCENARIO( "A RGBA Polygon bulk copies its compiled lines into Display Meta", 
+    "[DisplayTypes]" )
+{
+    GIVEN( "A new RGBA Polygon with a dynamic color" )
+    {
+        std::string polygonName  = "my-polygon";
+        dsl_coordinate coordinates[4] = {{100,100},{210,110},{220, 300},{110,330}};
+        uint numCoordinates(4);
+        uint lineWidth(4);
+
+        std::string colorName  = "my-random-color";
+
+        DSL_RGBA_RANDOM_COLOR_PTR pColor = DSL_RGBA_RANDOM_COLOR_NEW(
+            colorName.c_str(), DSL_COLOR_HUE_RANDOM, 
+            DSL_COLOR_LUMINOSITY_RANDOM, 1.0, 1234);
+        
+        DSL_RGBA_POLYGON_PTR pPolygon = DSL_RGBA_POLYGON_NEW(polygonName.c_str(), 
+            coordinates, numCoordinates, lineWidth, pColor);
+            
+        NvDsDisplayMeta displayMeta1 = {0};
+        NvDsDisplayMeta displayMeta2 = {0};
+        
+        // leave room for only one line in the first display meta
+        displayMeta1.num_lines = MAX_ELEMENTS_IN_DISPLAY_META-1;
+        
+        std::vector<NvDsDisplayMeta*> displayMetaData = 
+            {&displayMeta1, &displayMeta2};
+        
+        WHEN( "The RGBA Polygon's meta is added" )
+        {
+            pPolygon->AddMeta(displayMetaData, NULL);
+            
+            THEN( "The lines are split across the Display Meta in order" )
+            {
+                REQUIRE( displayMeta1.num_lines == MAX_ELEMENTS_IN_DISPLAY_META );
+                REQUIRE( displayMeta2.num_lines == numCoordinates-1 );
+                
+                NvOSD_LineParams& line1 = 
+                    displayMeta1.line_params[MAX_ELEMENTS_IN_DISPLAY_META-1];
+                REQUIRE( line1.x1 == 100 );
+                REQUIRE( line1.y1 == 100 );
+                REQUIRE( line1.x2 == 210 );
+                REQUIRE( line1.y2 == 110 );
+                REQUIRE( line1.line_width == lineWidth );
+                
+                NvOSD_LineParams& line4 = displayMeta2.line_params[2];
+                REQUIRE( line4.x1 == 110 );
+                REQUIRE( line4.y1 == 330 );
+                REQUIRE( line4.x2 == 100 );
+                REQUIRE( line4.y2 == 100 );
+            }
+        }
+        WHEN( "The RGBA Polygon's color changes" )
+        {
+            pColor->SetNext();
+            pPolygon->AddMeta(displayMetaData, NULL);
+            
+            THEN( "The compiled lines are updated with the new color" )
+            {
+                for (uint i = 0; i < displayMeta2.num_lines; i++)
+                {
+                    REQUIRE( displayMeta2.line_params[i].line_color.red == 
+                        pColor->red );
+                    REQUIRE( displayMeta2.line_params[i].line_color.green == 
+                        pColor->green );
+                    REQUIRE( displayMeta2.line_params[i].line_color.blue == 
+                        pColor->blue );
+                }
+            }
+        }
+    }
+}
+
 SCENARIO( "A RGBA Multi-Line is constructed correctly", "[DisplayTypes]" )
 {
     GIVEN( "Attrubutes for a new RGBA Multi-Line" )
@@ -506,6 +579,62 @@ SCENARIO( "A Source Dimensions Display is constructed correctly", "[DisplayTypes
     }
 }
 
+SCENARIO( "A Source Dimensions Display re-renders its text on change", "[DisplayTypes]" )
+{
+    GIVEN( "A new Source Dimensions Display Type" )
+    {
+        std::string displayName("source-dimensions");
+        int xOffset(123), yOffset(456);
+        std::string fontName("arial-10");
+        std::string font("arial");
+        uint size(10);
+        std::string colorName("my-custom-color");
+        
+        double red(0.12), green(0.34), blue(0.56), alpha(0.78);
+
+        DSL_RGBA_COLOR_PTR pColor = DSL_RGBA_COLOR_NEW(colorName.c_str(), red, green, blue, alpha);
+        DSL_RGBA_FONT_PTR pFont = DSL_RGBA_FONT_NEW(fontName.c_str(), font.c_str(), size, pColor);
+        
+        DSL_SOURCE_DIMENSIONS_PTR pDisplayType = DSL_SOURCE_DIMENSIONS_NEW(displayName.c_str(),
+            xOffset, yOffset, pFont, true, pColor);
+
+        NvDsFrameMeta frameMeta = {0};
+        frameMeta.source_id = 1;
+        frameMeta.source_frame_width = 1920;
+        frameMeta.source_frame_height = 1080;
+        
+        NvDsDisplayMeta displayMeta = {0};
+        std::vector<NvDsDisplayMeta*> displayMetaData = {&displayMeta};
+        
+        WHEN( "The Source Dimensions change between frames" )
+        {
+            pDisplayType->AddMeta(displayMetaData, &frameMeta);
+
+            frameMeta.source_frame_width = 1280;
+            frameMeta.source_frame_height = 720;
+
+            pDisplayType->AddMeta(displayMetaData, &frameMeta);
+            
+            THEN( "The correct text is added for each frame" )
+            {
+                REQUIRE( displayMeta.num_labels == 2 );
+                REQUIRE( std::string(displayMeta.text_params[0].display_text) == 
+                    "1920 x 1080" );
+                REQUIRE( std::string(displayMeta.text_params[1].display_text) == 
+                    "1280 x 720" );
+                REQUIRE( displayMeta.text_params[1].x_offset == xOffset );
+                REQUIRE( displayMeta.text_params[1].y_offset == yOffset );
+                
+                for (uint i = 0; i < displayMeta.num_labels; i++)
+                {
+                    g_free(displayMeta.text_params[i].display_text);
+                    g_free(displayMeta.text_params[i].font_params.font_name);
+                }
+            }
+        }
+    }
+}
+
 SCENARIO( "A Source Frame Rate Display is constructed correctly", "[DisplayTypes]" )
 {
     GIVEN( "Attrubutes for a new Source Frame Rate Display Type" )
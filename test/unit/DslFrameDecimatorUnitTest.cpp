@@ -0,0 +1,213 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+
+#include "catch.hpp"
+#include "Dsl.h"
+#include "DslApi.h"
+#include "DslFrameDecimator.h"
+
+using namespace DSL;
+
+static const GstClockTime frameDuration(GST_SECOND/30);
+
+static GstBuffer* new_test_buffer(uint frame, bool keyFrame)
+{
+    GstBuffer* pBuffer = gst_buffer_new();
+    GST_BUFFER_PTS(pBuffer) = frame*frameDuration;
+    GST_BUFFER_DURATION(pBuffer) = frameDuration;
+    if (!keyFrame)
+    {
+        GST_BUFFER_FLAG_SET(pBuffer, GST_BUFFER_FLAG_DELTA_UNIT);
+    }
+    return pBuffer;
+}
+
+// Runs a 30 fps encoded stream with a GOP of gopSize through both the
+// pre-decode and post-decode stages of a FrameDecimator.
+static void run_test_stream(FrameDecimator& decimator, 
+    uint firstFrame, uint numFrames, uint gopSize)
+{
+    for (uint i = firstFrame; i < firstFrame+numFrames; i++)
+    {
+        GstBuffer* pBuffer = new_test_buffer(i, !(i % gopSize));
+        if (decimator.HandleEncodedBuffer(pBuffer) == GST_PAD_PROBE_OK)
+        {
+            decimator.HandleDecodedBuffer(pBuffer);
+        }
+        gst_buffer_unref(pBuffer);
+    }
+}
+
+SCENARIO( "A FrameDecimator decimates a decoded stream correctly", "[FrameDecimator]" )
+{
+    GIVEN( "A new FrameDecimator" )
+    {
+        FrameDecimator decimator("test-source");
+
+        uint fpsN(99), fpsD(99);
+        decimator.GetFrameRate(&fpsN, &fpsD);
+        REQUIRE( fpsN == 0 );
+        REQUIRE( fpsD == 0 );
+        REQUIRE( decimator.SetFrameRate(5, 0) == false );
+
+        WHEN( "The FrameDecimator is disabled" )
+        {
+            for (uint i = 0; i < 30; i++)
+            {
+                GstBuffer* pBuffer = new_test_buffer(i, true);
+                REQUIRE( decimator.HandleDecodedBuffer(pBuffer) == 
+                    GST_PAD_PROBE_OK );
+                gst_buffer_unref(pBuffer);
+            }
+            THEN( "All frames are passed and counted" )
+            {
+                uint64_t passed(0), dropped(99), droppedPreDecode(99);
+                decimator.GetStats(&passed, &dropped, &droppedPreDecode);
+                REQUIRE( passed == 30 );
+                REQUIRE( dropped == 0 );
+                REQUIRE( droppedPreDecode == 0 );
+                
+                decimator.ClearStats();
+                decimator.GetStats(&passed, &dropped, &droppedPreDecode);
+                REQUIRE( passed == 0 );
+            }
+        }
+        WHEN( "The FrameDecimator is set to 5 fps" )
+        {
+            REQUIRE( decimator.SetFrameRate(5, 1) == true );
+
+            uint numPassed(0);
+            for (uint i = 30; i < 60; i++)
+            {
+                GstBuffer* pBuffer = new_test_buffer(i, true);
+                if (decimator.HandleDecodedBuffer(pBuffer) == GST_PAD_PROBE_OK)
+                {
+                    numPassed++;
+                }
+                gst_buffer_unref(pBuffer);
+            }
+            THEN( "One in six frames is passed" )
+            {
+                REQUIRE( numPassed == 5 );
+
+                uint64_t passed(0), dropped(0), droppedPreDecode(99);
+                decimator.GetStats(&passed, &dropped, &droppedPreDecode);
+                REQUIRE( passed == 5 );
+                REQUIRE( dropped == 25 );
+                REQUIRE( droppedPreDecode == 0 );
+
+                // PTS moving back restarts the schedule
+                GstBuffer* pBuffer = new_test_buffer(0, true);
+                REQUIRE( decimator.HandleDecodedBuffer(pBuffer) == 
+                    GST_PAD_PROBE_OK );
+                gst_buffer_unref(pBuffer);
+            }
+        }
+    }
+}
+
+SCENARIO( "A FrameDecimator drops whole GOPs before decode", "[FrameDecimator]" )
+{
+    GIVEN( "A new FrameDecimator set to 0.5 fps" )
+    {
+        FrameDecimator decimator("test-source");
+        REQUIRE( decimator.SetFrameRate(1, 2) == true );
+
+        WHEN( "A 30 fps stream with 1 second GOPs is decimated" )
+        {
+            run_test_stream(decimator, 0, 120, 30);
+
+            THEN( "GOPs and GOP tails not needed are dropped before decode" )
+            {
+                // The first GOP is decoded to measure the GOP duration.
+                // The second and fourth GOPs and the tail of the third
+                // GOP are dropped before decode.
+                uint64_t passed(0), dropped(0), droppedPreDecode(0);
+                decimator.GetStats(&passed, &dropped, &droppedPreDecode);
+                REQUIRE( passed == 2 );
+                REQUIRE( dropped == 118 );
+                REQUIRE( droppedPreDecode == 89 );
+            }
+        }
+        WHEN( "The FrameDecimator is disabled in the middle of a dropped GOP" )
+        {
+            run_test_stream(decimator, 0, 35, 30);
+            REQUIRE( decimator.SetFrameRate(0, 0) == true );
+
+            THEN( "Frames are dropped until the next key frame" )
+            {
+                GstBuffer* pBuffer = new_test_buffer(35, false);
+                REQUIRE( decimator.HandleEncodedBuffer(pBuffer) == 
+                    GST_PAD_PROBE_DROP );
+                gst_buffer_unref(pBuffer);
+
+                pBuffer = new_test_buffer(60, true);
+                REQUIRE( decimator.HandleEncodedBuffer(pBuffer) == 
+                    GST_PAD_PROBE_OK );
+                gst_buffer_unref(pBuffer);
+            }
+        }
+    }
+}
+
+SCENARIO( "A FrameDecimator keeps its pre-decode probe over stop and play", "[FrameDecimator]" )
+{
+    GIVEN( "A new FrameDecimator with a probe on a decoder's sink pad" )
+    {
+        FrameDecimator decimator("test-source");
+
+        // Decoder sink pad, probed once when the decoder is linked, as with
+        // the select-stream callback of an RtspSourceBintr.
+        GstPad* pDecoderSinkPad = gst_pad_new("sink", GST_PAD_SINK);
+        GstPad* pDecoderSrcPad = gst_pad_new("src", GST_PAD_SRC);
+        
+        REQUIRE( decimator.AddPadProbe(pDecoderSinkPad, true) == true );
+        REQUIRE( decimator.AddPadProbe(pDecoderSinkPad, true) == false );
+
+        WHEN( "The Source is played and stopped twice" )
+        {
+            for (uint i = 0; i < 2; i++)
+            {
+                // Play - VideoSourceBintr::LinkToCommon
+                REQUIRE( decimator.AddPadProbe(pDecoderSrcPad, false) == true );
+                REQUIRE( decimator.GetNumPadProbes(false) == 1 );
+                REQUIRE( decimator.GetNumPadProbes(true) == 1 );
+                
+                // Stop - VideoSourceBintr::UnlinkCommon
+                decimator.RemovePadProbes(false);
+                REQUIRE( decimator.GetNumPadProbes(false) == 0 );
+            }
+            THEN( "The pre-decode probe is still in place" )
+            {
+                REQUIRE( decimator.GetNumPadProbes(true) == 1 );
+                
+                decimator.RemoveAllPadProbes();
+                REQUIRE( decimator.GetNumPadProbes(true) == 0 );
+            }
+        }
+        gst_object_unref(pDecoderSinkPad);
+        gst_object_unref(pDecoderSrcPad);
+    }
+}
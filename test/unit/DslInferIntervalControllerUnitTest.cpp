@@ -0,0 +1,341 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include "catch.hpp"
+#include "Dsl.h"
+#include "DslApi.h"
+#include "DslInferIntervalController.h"
+#include "DslInferBintr.h"
+#include "DslPipelineBintr.h"
+
+using namespace DSL;
+
+static std::string inferConfigFile(
+    "/opt/nvidia/deepstream/deepstream/samples/configs/deepstream-app/config_infer_primary.txt");
+static std::string modelEngineFile(
+    "/opt/nvidia/deepstream/deepstream/samples/models/Primary_Detector/resnet18_trafficcamnet.etlt_b8_gpu0_int8.engine");
+
+static dsl_infer_load make_load(double occupancy, uint64_t overruns, 
+    double fps, uint latency)
+{
+    dsl_infer_load load{0};
+    load.occupancy = occupancy;
+    load.overruns = overruns;
+    load.fps = fps;
+    load.latency = latency;
+    return load;
+}
+
+/**
+ * @brief Drives a controller with a simulated load trace.
+ * @return the interval after each update.
+ */
+static std::vector<uint> run_trace(DSL_INFER_INTERVAL_CONTROLLER_PTR pController,
+    const std::vector<dsl_infer_load>& trace)
+{
+    std::vector<uint> intervals;
+    for (auto const& load: trace)
+    {
+        intervals.push_back(pController->Update(load));
+    }
+    return intervals;
+}
+
+SCENARIO( "An InferIntervalController is created with default settings", 
+    "[InferIntervalController]" )
+{
+    GIVEN( "A new InferIntervalController" ) 
+    {
+        DSL_INFER_INTERVAL_CONTROLLER_PTR pController = 
+            DSL_INFER_INTERVAL_CONTROLLER_NEW("pipeline", NULL, nullptr);
+
+        uint minInterval(99), maxInterval(99);
+        pController->GetBounds(&minInterval, &maxInterval);
+        REQUIRE( minInterval == DSL_INFER_INTERVAL_DEFAULT_MIN_INTERVAL );
+        REQUIRE( maxInterval == DSL_INFER_INTERVAL_DEFAULT_MAX_INTERVAL );
+        
+        uint lowOccupancy(0), highOccupancy(0), maxLatency(99), minFps(99);
+        pController->GetThresholds(&lowOccupancy, &highOccupancy, 
+            &maxLatency, &minFps);
+        REQUIRE( lowOccupancy == DSL_INFER_INTERVAL_DEFAULT_LOW_OCCUPANCY );
+        REQUIRE( highOccupancy == DSL_INFER_INTERVAL_DEFAULT_HIGH_OCCUPANCY );
+        REQUIRE( maxLatency == 0 );
+        REQUIRE( minFps == 0 );
+        
+        uint updateInterval(0), stepUpCount(0), stepDownCount(0);
+        pController->GetHysteresis(&updateInterval, &stepUpCount, &stepDownCount);
+        REQUIRE( updateInterval == DSL_INFER_INTERVAL_DEFAULT_UPDATE_INTERVAL );
+        REQUIRE( stepUpCount == DSL_INFER_INTERVAL_DEFAULT_STEP_UP_COUNT );
+        REQUIRE( stepDownCount == DSL_INFER_INTERVAL_DEFAULT_STEP_DOWN_COUNT );
+        
+        REQUIRE( pController->GetEnabled() == false );
+        REQUIRE( pController->GetInterval() == 0 );
+
+        WHEN( "Invalid settings are used" )
+        {
+            THEN( "The settings are rejected" )
+            {
+                REQUIRE( pController->SetBounds(4, 2) == false );
+                REQUIRE( pController->SetThresholds(80, 30, 0, 0) == false );
+                REQUIRE( pController->SetThresholds(30, 101, 0, 0) == false );
+                REQUIRE( pController->SetHysteresis(0, 1, 1) == false );
+                REQUIRE( pController->SetHysteresis(100, 0, 1) == false );
+                REQUIRE( pController->SetHysteresis(100, 1, 0) == false );
+            }
+        }
+    }
+}
+
+SCENARIO( "An InferIntervalController sheds and recovers load with hysteresis", 
+    "[InferIntervalController]" )
+{
+    GIVEN( "A new InferIntervalController with step-up = 2 and step-down = 3" ) 
+    {
+        DSL_INFER_INTERVAL_CONTROLLER_PTR pController = 
+            DSL_INFER_INTERVAL_CONTROLLER_NEW("pipeline", NULL, nullptr);
+            
+        REQUIRE( pController->SetBounds(0, 7) == true );
+        REQUIRE( pController->SetHysteresis(100, 2, 3) == true );
+        
+        dsl_infer_load high = make_load(95, 0, 0, 0);
+        dsl_infer_load mid = make_load(50, 0, 0, 0);
+        dsl_infer_load low = make_load(10, 0, 0, 0);
+
+        WHEN( "A burst of load is followed by a drop in load" )
+        {
+            std::vector<uint> intervals = run_trace(pController, {
+                high, high, high, high, high, high, high, high,
+                low, low, low, low, low, low, low, low, low, 
+                low, low, low, low, low, low, low, low, low, low});
+                
+            THEN( "The interval steps up fast and recovers slowly to full rate" )
+            {
+                std::vector<uint> expected = {
+                    0, 1, 1, 3, 3, 7, 7, 7,
+                    7, 7, 6, 6, 6, 5, 5, 5, 4, 
+                    4, 4, 3, 3, 3, 2, 2, 2, 1, 1};
+                REQUIRE( intervals == expected );
+                
+                intervals = run_trace(pController, {low, low, low, low});
+                REQUIRE( intervals.back() == 0 );
+                
+                dsl_infer_interval_metrics metrics{0};
+                pController->GetMetrics(&metrics);
+                REQUIRE( metrics.interval == 0 );
+                REQUIRE( metrics.updates == 31 );
+                REQUIRE( metrics.overloaded_updates == 8 );
+                REQUIRE( metrics.underloaded_updates == 23 );
+                REQUIRE( metrics.step_ups == 3 );
+                REQUIRE( metrics.step_downs == 7 );
+                REQUIRE( metrics.last_load.occupancy == 10 );
+                
+                pController->ClearMetrics();
+                pController->GetMetrics(&metrics);
+                REQUIRE( metrics.updates == 0 );
+                REQUIRE( metrics.step_ups == 0 );
+            }
+        }
+        WHEN( "The load oscillates within the dead-band" )
+        {
+            std::vector<uint> intervals = run_trace(pController, {
+                high, mid, high, mid, high, mid, low, low, mid, low, low, mid});
+                
+            THEN( "The interval is never changed" )
+            {
+                for (auto interval: intervals)
+                {
+                    REQUIRE( interval == 0 );
+                }
+            }
+        }
+        WHEN( "The load is high at one interval and low at the next" )
+        {
+            std::vector<uint> intervals = run_trace(pController, {
+                high, high, mid, low, low, low, high, high, mid});
+                
+            THEN( "The interval settles between the two" )
+            {
+                std::vector<uint> expected = {0, 1, 1, 1, 1, 0, 0, 1, 1};
+                REQUIRE( intervals == expected );
+            }
+        }
+    }
+}
+
+SCENARIO( "An InferIntervalController evaluates overruns, latency and fps correctly", 
+    "[InferIntervalController]" )
+{
+    GIVEN( "A new InferIntervalController with latency and fps thresholds" ) 
+    {
+        DSL_INFER_INTERVAL_CONTROLLER_PTR pController = 
+            DSL_INFER_INTERVAL_CONTROLLER_NEW("pipeline", NULL, nullptr);
+            
+        REQUIRE( pController->SetHysteresis(100, 1, 1) == true );
+        REQUIRE( pController->SetThresholds(30, 80, 400, 25) == true );
+
+        WHEN( "Queues overrun at low occupancy" )
+        {
+            std::vector<uint> intervals = run_trace(pController, {
+                make_load(10, 3, 0, 0)});
+                
+            THEN( "The interval is stepped up" )
+            {
+                REQUIRE( intervals.back() == 1 );
+            }
+        }
+        WHEN( "The reported latency exceeds the threshold" )
+        {
+            std::vector<uint> intervals = run_trace(pController, {
+                make_load(10, 0, 30, 500), 
+                make_load(10, 0, 30, 350),
+                make_load(10, 0, 30, 300)});
+                
+            THEN( "The interval recovers only once latency is well below" )
+            {
+                std::vector<uint> expected = {1, 1, 0};
+                REQUIRE( intervals == expected );
+            }
+        }
+        WHEN( "The reported frame-rate drops below the threshold" )
+        {
+            std::vector<uint> intervals = run_trace(pController, {
+                make_load(10, 0, 20, 0), make_load(10, 0, 30, 0)});
+                
+            THEN( "The interval is stepped up and recovers" )
+            {
+                std::vector<uint> expected = {1, 0};
+                REQUIRE( intervals == expected );
+            }
+        }
+        WHEN( "The bounds are reduced while shedding load" )
+        {
+            REQUIRE( pController->SetBounds(1, 7) == true );
+            run_trace(pController, {make_load(90, 0, 0, 0), 
+                make_load(90, 0, 0, 0)});
+            REQUIRE( pController->GetInterval() == 7 );
+
+            REQUIRE( pController->SetBounds(1, 2) == true );
+            
+            THEN( "The interval is clamped on the next update" )
+            {
+                std::vector<uint> intervals = run_trace(pController, {
+                    make_load(50, 0, 0, 0), make_load(10, 0, 0, 0), 
+                    make_load(10, 0, 0, 0)});
+                std::vector<uint> expected = {2, 1, 1};
+                REQUIRE( intervals == expected );
+            }
+        }
+    }
+}
+
+static void interval_change_listener_cb(uint prev_interval, uint curr_interval, 
+    dsl_infer_interval_metrics* metrics, void* client_data)
+{
+    (*(uint*)client_data)++;
+}
+
+SCENARIO( "A Pipeline's InferIntervalController applies the interval to its Infer Components", 
+    "[InferIntervalController]" )
+{
+    GIVEN( "A new Pipeline with a PrimaryGieBintr" ) 
+    {
+        DSL_PIPELINE_PTR pPipelineBintr = DSL_PIPELINE_NEW("pipeline");
+
+        DSL_PRIMARY_GIE_PTR pPrimaryGieBintr = 
+            DSL_PRIMARY_GIE_NEW("primary-gie", inferConfigFile.c_str(), 
+            modelEngineFile.c_str(), 1);
+            
+        REQUIRE( pPrimaryGieBintr->AddToParent(pPipelineBintr) == true );
+        
+        DSL_INFER_INTERVAL_CONTROLLER_PTR pController = 
+            pPipelineBintr->GetInferIntervalController();
+
+        uint changes(0);
+        REQUIRE( pController->AddChangeListener(
+            interval_change_listener_cb, &changes) == true );
+        REQUIRE( pController->AddChangeListener(
+            interval_change_listener_cb, &changes) == false );
+        REQUIRE( pController->SetHysteresis(100, 1, 1) == true );
+        REQUIRE( pController->SetEnabled(true) == true );
+
+        WHEN( "The Queue Sampler reports overruns" )
+        {
+            pController->ReportLoad(0, 0);
+            pController->Update(make_load(90, 0, 0, 0));
+            pController->Update(make_load(90, 0, 0, 0));
+            pController->Update(make_load(90, 0, 0, 0));
+            REQUIRE( pController->GetInterval() == 4 );
+            
+            THEN( "The Controller can be disabled to restore the configured interval" )
+            {
+                REQUIRE( pController->SetHysteresis(100, 1, 1) == false );
+                REQUIRE( pController->SetEnabled(true) == false );
+                REQUIRE( pController->SetEnabled(false) == true );
+                
+                REQUIRE( pController->GetInterval() == 0 );
+                REQUIRE( pPrimaryGieBintr->GetLoadSheddingInterval() == 0 );
+                REQUIRE( pPrimaryGieBintr->GetActiveInterval() == 1 );
+                REQUIRE( pController->RemoveChangeListener(
+                    interval_change_listener_cb) == true );
+                REQUIRE( pController->RemoveChangeListener(
+                    interval_change_listener_cb) == false );
+            }
+        }
+        WHEN( "The Controller update timer expires" )
+        {
+            // no Queue Sampler telemetry and no reported load 
+            REQUIRE( pController->HandleUpdateTimeout() == true );
+            
+            THEN( "The Pipeline is evaluated as underloaded" )
+            {
+                dsl_infer_interval_metrics metrics{0};
+                pController->GetMetrics(&metrics);
+                REQUIRE( metrics.updates == 1 );
+                REQUIRE( metrics.underloaded_updates == 1 );
+                REQUIRE( changes == 0 );
+                REQUIRE( pController->SetEnabled(false) == true );
+            }
+        }
+        WHEN( "A latency over threshold is reported and the timer expires" )
+        {
+            REQUIRE( pController->SetThresholds(30, 80, 100, 0) == true );
+            pController->ReportLoad(30, 200);
+            REQUIRE( pController->HandleUpdateTimeout() == true );
+            
+            THEN( "The interval is applied to the PrimaryGieBintr" )
+            {
+                REQUIRE( changes == 1 );
+                REQUIRE( pController->GetInterval() == 1 );
+                REQUIRE( pPrimaryGieBintr->GetLoadSheddingInterval() == 1 );
+                REQUIRE( pPrimaryGieBintr->GetInterval() == 1 );
+
+                REQUIRE( pController->HandleUpdateTimeout() == true );
+                REQUIRE( changes == 2 );
+                REQUIRE( pPrimaryGieBintr->GetLoadSheddingInterval() == 3 );
+                REQUIRE( pPrimaryGieBintr->GetActiveInterval() == 3 );
+                REQUIRE( pController->SetEnabled(false) == true );
+            }
+        }
+    }
+}
@@ -683,6 +683,105 @@ SCENARIO( "An CaptureOdeAction can add and remove Capture Complete Listeners",
     }
 }
 
+SCENARIO( "A CaptureObjectOdeAction can Get/Set its best-shot settings correctly",  "[OdeAction]" )
+{
+    GIVEN( "A new CaptureObjectOdeAction" ) 
+    {
+        std::string actionName("ode-action");
+        std::string outdir("./");
+
+        DSL_ODE_ACTION_CAPTURE_OBJECT_PTR pAction = 
+            DSL_ODE_ACTION_CAPTURE_OBJECT_NEW(actionName.c_str(), 
+                outdir.c_str());
+        
+        bool enabled(true), sharpness(true);
+        uint timeout(99), maxHold(99);
+        
+        pAction->GetBestShotSettings(&enabled, &timeout, &maxHold, &sharpness);
+        REQUIRE( enabled == false );
+        REQUIRE( timeout == 0 );
+        REQUIRE( maxHold == 0 );
+        REQUIRE( sharpness == false );
+        REQUIRE( pAction->GetBestShotCount() == 0 );
+        
+        WHEN( "Best-shot is enabled" )
+        {
+            pAction->SetBestShotSettings(true, 500, 10000, true);
+
+            THEN( "The correct settings are returned on get" )
+            {
+                pAction->GetBestShotSettings(&enabled, &timeout, &maxHold, &sharpness);
+                REQUIRE( enabled == true );
+                REQUIRE( timeout == 500 );
+                REQUIRE( maxHold == 10000 );
+                REQUIRE( sharpness == true );
+                
+                // No buffer to capture from when replaying recorded metadata
+                NvDsFrameMeta frameMeta =  {0};
+                frameMeta.source_id = 1;
+                NvDsObjectMeta objectMeta = {0};
+                objectMeta.object_id = 123;
+                
+                pAction->HandleOccurrence(NULL, &frameMeta, &objectMeta);
+                REQUIRE( pAction->GetBestShotCount() == 0 );
+                
+                pAction->SetBestShotSettings(false, 500, 10000, true);
+                pAction->GetBestShotSettings(&enabled, &timeout, &maxHold, &sharpness);
+                REQUIRE( enabled == false );
+            }
+        }
+    }
+}
+
+SCENARIO( "A CaptureFrameOdeAction can Get and Clear its capture metrics correctly",  "[OdeAction]" )
+{
+    GIVEN( "A new CaptureFrameOdeAction" ) 
+    {
+        std::string actionName("ode-action");
+        std::string outdir("./");
+
+        DSL_ODE_ACTION_CAPTURE_FRAME_PTR pAction = 
+            DSL_ODE_ACTION_CAPTURE_FRAME_NEW(actionName.c_str(), outdir.c_str());
+        
+        dsl_ode_action_capture_metrics metrics{99,99,99,99,99,99,99};
+        
+        WHEN( "The capture metrics are queried" )
+        {
+            pAction->GetCaptureMetrics(&metrics);
+
+            THEN( "All metrics are zero" )
+            {
+                REQUIRE( metrics.pooled == 0 );
+                REQUIRE( metrics.in_use == 0 );
+                REQUIRE( metrics.acquired == 0 );
+                REQUIRE( metrics.hits == 0 );
+                REQUIRE( metrics.allocated == 0 );
+                REQUIRE( metrics.failed == 0 );
+                REQUIRE( metrics.batches == 0 );
+                REQUIRE( metrics.captures == 0 );
+            }
+        }
+        WHEN( "Nothing is captured on an occurrence without a buffer" )
+        {
+            // No buffer to capture from when replaying recorded metadata
+            NvDsFrameMeta frameMeta =  {0};
+            
+            pAction->HandleOccurrence(NULL, &frameMeta, NULL);
+            OdeAction::PostProcessFrame(NULL, &frameMeta);
+            
+            pAction->ClearCaptureMetrics();
+            pAction->GetCaptureMetrics(&metrics);
+
+            THEN( "All metrics remain zero" )
+            {
+                REQUIRE( metrics.acquired == 0 );
+                REQUIRE( metrics.batches == 0 );
+                REQUIRE( metrics.captures == 0 );
+            }
+        }
+    }
+}
+
 //SCENARIO( "An CaptureOdeAction calls all Listeners on Capture Complete", "[OdeAction]" )
 //{
 //    GIVEN( "A new CaptureObjectOdeAction" ) 
@@ -1585,6 +1684,158 @@ SCENARIO( "A PipelinePauseOdeAction handles an ODE Occurence correctly", "[OdeAc
     }
 }
 
+SCENARIO( "A PipelinePauseOdeAction coalesces pending requests correctly", "[OdeAction]" )
+{
+    GIVEN( "A new PipelinePauseOdeAction" ) 
+    {
+        std::string triggerName("first-occurence");
+        std::string source;
+        uint classId(1);
+        uint limit(0);
+        
+        std::string actionName = "ode-action";
+        std::string pipelineName("pipeline");
+
+        DSL_ODE_TRIGGER_OCCURRENCE_PTR pTrigger = 
+            DSL_ODE_TRIGGER_OCCURRENCE_NEW(triggerName.c_str(), source.c_str(), classId, limit);
+
+        DSL_ODE_ACTION_PIPELINE_PAUSE_PTR pAction = 
+            DSL_ODE_ACTION_PIPELINE_PAUSE_NEW(actionName.c_str(), pipelineName.c_str());
+
+        NvDsFrameMeta frameMeta =  {0};
+        frameMeta.bInferDone = true;  // required to process
+        frameMeta.frame_num = 444;
+        frameMeta.source_id = 2;
+
+        NvDsObjectMeta objectMeta = {0};
+        objectMeta.class_id = classId; // must match Detections Trigger's classId
+
+        WHEN( "The Action handles several occurrences before the main-loop runs" )
+        {
+            pAction->HandleOccurrence(pTrigger, NULL, 
+                displayMetaData, &frameMeta, &objectMeta);
+            pAction->HandleOccurrence(pTrigger, NULL, 
+                displayMetaData, &frameMeta, &objectMeta);
+            pAction->HandleOccurrence(pTrigger, NULL, 
+                displayMetaData, &frameMeta, &objectMeta);
+            
+            THEN( "The duplicate requests are collapsed into a single request" )
+            {
+                dsl_ode_action_async_metrics metrics{0};
+                pAction->GetAsyncMetrics(&metrics);
+                REQUIRE( metrics.pending == 1 );
+                REQUIRE( metrics.max_pending == 1 );
+                REQUIRE( metrics.queued == 3 );
+                REQUIRE( metrics.coalesced == 2 );
+                REQUIRE( metrics.executed == 0 );
+                
+                // Execute the batch directly as the main-loop is not running.
+                // Errors will be logged as the Pipeline does not exist.
+                AsyncOdeActionExecutor::GetExecutor()->ExecuteBatch();
+
+                pAction->GetAsyncMetrics(&metrics);
+                REQUIRE( metrics.pending == 0 );
+                REQUIRE( metrics.executed == 1 );
+                REQUIRE( metrics.latency_max == metrics.latency_total );
+
+                pAction->ClearAsyncMetrics();
+                pAction->GetAsyncMetrics(&metrics);
+                REQUIRE( metrics.queued == 0 );
+                REQUIRE( metrics.coalesced == 0 );
+                REQUIRE( metrics.executed == 0 );
+            }
+        }
+        WHEN( "The Action is disabled" )
+        {
+            pAction->SetEnabled(false);
+            pAction->HandleOccurrence(pTrigger, NULL, 
+                displayMetaData, &frameMeta, &objectMeta);
+            
+            THEN( "No request is queued" )
+            {
+                dsl_ode_action_async_metrics metrics{0};
+                pAction->GetAsyncMetrics(&metrics);
+                REQUIRE( metrics.pending == 0 );
+                REQUIRE( metrics.queued == 0 );
+            }
+        }
+    }
+}
+
+SCENARIO( "Interleaved AsyncOdeAction requests are executed in order", "[OdeAction]" )
+{
+    GIVEN( "A new PipelinePauseOdeAction and PipelinePlayOdeAction" ) 
+    {
+        std::string triggerName("first-occurence");
+        std::string source;
+        uint classId(1);
+        uint limit(0);
+        
+        std::string pauseActionName("pause-action");
+        std::string playActionName("play-action");
+        std::string pipelineName("pipeline");
+
+        DSL_ODE_TRIGGER_OCCURRENCE_PTR pTrigger = 
+            DSL_ODE_TRIGGER_OCCURRENCE_NEW(triggerName.c_str(), source.c_str(), classId, limit);
+
+        DSL_ODE_ACTION_PIPELINE_PAUSE_PTR pPauseAction = 
+            DSL_ODE_ACTION_PIPELINE_PAUSE_NEW(pauseActionName.c_str(), 
+                pipelineName.c_str());
+
+        DSL_ODE_ACTION_PIPELINE_PLAY_PTR pPlayAction = 
+            DSL_ODE_ACTION_PIPELINE_PLAY_NEW(playActionName.c_str(), 
+                pipelineName.c_str());
+
+        NvDsFrameMeta frameMeta =  {0};
+        frameMeta.bInferDone = true;  // required to process
+        frameMeta.frame_num = 444;
+        frameMeta.source_id = 2;
+
+        NvDsObjectMeta objectMeta = {0};
+        objectMeta.class_id = classId; // must match Detections Trigger's classId
+
+        WHEN( "Requests for another Action are queued in between" )
+        {
+            pPauseAction->HandleOccurrence(pTrigger, NULL, 
+                displayMetaData, &frameMeta, &objectMeta);
+            pPlayAction->HandleOccurrence(pTrigger, NULL, 
+                displayMetaData, &frameMeta, &objectMeta);
+            pPauseAction->HandleOccurrence(pTrigger, NULL, 
+                displayMetaData, &frameMeta, &objectMeta);
+            pPauseAction->HandleOccurrence(pTrigger, NULL, 
+                displayMetaData, &frameMeta, &objectMeta);
+            
+            THEN( "Only the consecutive duplicate request is collapsed" )
+            {
+                dsl_ode_action_async_metrics pauseMetrics{0};
+                dsl_ode_action_async_metrics playMetrics{0};
+                
+                pPauseAction->GetAsyncMetrics(&pauseMetrics);
+                REQUIRE( pauseMetrics.queued == 3 );
+                REQUIRE( pauseMetrics.coalesced == 1 );
+                REQUIRE( pauseMetrics.pending == 2 );
+                
+                pPlayAction->GetAsyncMetrics(&playMetrics);
+                REQUIRE( playMetrics.queued == 1 );
+                REQUIRE( playMetrics.coalesced == 0 );
+                REQUIRE( playMetrics.pending == 1 );
+                
+                // Execute the batch directly as the main-loop is not running.
+                // Errors will be logged as the Pipeline does not exist.
+                AsyncOdeActionExecutor::GetExecutor()->ExecuteBatch();
+
+                pPauseAction->GetAsyncMetrics(&pauseMetrics);
+                REQUIRE( pauseMetrics.pending == 0 );
+                REQUIRE( pauseMetrics.executed == 2 );
+
+                pPlayAction->GetAsyncMetrics(&playMetrics);
+                REQUIRE( playMetrics.pending == 0 );
+                REQUIRE( playMetrics.executed == 1 );
+            }
+        }
+    }
+}
+
 SCENARIO( "A new PipelinePlayOdeAction is created correctly", "[OdeAction]" )
 {
     GIVEN( "Attributes for a new PipelinePlayOdeAction" ) 
@@ -3027,7 +3278,7 @@ SCENARIO( "A AddBranchOdeAction handles an ODE Occurence correctly", "[OdeAction
             
             THEN( "The OdeAction can Handle the Occurrence" )
             {
-                // This will call g_timeout_add to schedule the add to be performed
+                // This will queue a request with the shared executor to perform the add
                 // in the context of the main-loop which is not running. 
                 pAction->HandleOccurrence(pTrigger, NULL, 
                     displayMetaData, &frameMeta, &objectMeta);
@@ -3087,7 +3338,7 @@ SCENARIO( "A AddBranchToOdeAction handles an ODE Occurence correctly", "[OdeActi
             
             THEN( "The OdeAction can Handle the Occurrence" )
             {
-                // This will call g_timeout_add to schedule the add to be performed
+                // This will queue a request with the shared executor to perform the add
                 // in the context of the main-loop which is not running. 
                 pAction->HandleOccurrence(pTrigger, NULL, 
                     displayMetaData, &frameMeta, &objectMeta);
@@ -3147,7 +3398,7 @@ SCENARIO( "A MoveBranchToOdeAction handles an ODE Occurence correctly", "[OdeAct
             
             THEN( "The OdeAction can Handle the Occurrence" )
             {
-                // This will call g_timeout_add to schedule the add to be performed
+                // This will queue a request with the shared executor to perform the add
                 // in the context of the main-loop which is not running. 
                 pAction->HandleOccurrence(pTrigger, NULL, 
                     displayMetaData, &frameMeta, &objectMeta);
@@ -3207,7 +3458,7 @@ SCENARIO( "A RemoveBranchOdeAction handles an ODE Occurence correctly", "[OdeAct
             
             THEN( "The OdeAction can Handle the Occurrence" )
             {
-                // This will call g_timeout_add to schedule the add to be performed
+                // This will queue a request with the shared executor to perform the add
                 // in the context of the main-loop which is not running. 
                 pAction->HandleOccurrence(pTrigger, NULL, 
                     displayMetaData, &frameMeta, &objectMeta);
@@ -1053,3 +1053,315 @@ SCENARIO( "A new OdeExclusionArea is created correctly", "[OdeArea]" )
     }
 }
 
+
+/**
+ * @brief Records a trace of alternating down and up vertical sweeps, one 
+ * sweep for each x position provided.
+ */
+static std::vector<dsl_coordinate> record_trace(const std::vector<uint>& sweeps,
+    uint yMin, uint yMax, uint step)
+{
+    std::vector<dsl_coordinate> trace;
+    
+    for (uint i = 0; i < sweeps.size(); i++)
+    {
+        for (uint y = yMin; y <= yMax; y += step)
+        {
+            dsl_coordinate coordinate{sweeps[i], (i%2) ? (yMax - (y - yMin)) : y};
+            trace.push_back(coordinate);
+        }
+    }
+    return trace;
+}
+
+/**
+ * @brief Plays a recorded trace through two Tracked Objects, testing one with
+ * the incremental DoesTrackedObjectCrossLine and the other with the full-trace
+ * DoesTraceCrossLine, and counts the IN and OUT occurrences for each.
+ */
+static void play_recorded_trace(DSL_ODE_AREA_PTR pOdeArea, 
+    const std::vector<dsl_coordinate>& trace, uint maxTracePoints, 
+    uint testMethod, uint* incrementalCounts, uint* referenceCounts)
+{
+    NvBbox_Coords bbox{0};
+    bbox.left = trace[0].x;
+    bbox.top = trace[0].y;
+    
+    std::shared_ptr<TrackedObject> pIncremental = std::shared_ptr<TrackedObject>
+        (new TrackedObject(1, 0, &bbox, nullptr, maxTracePoints));
+    std::shared_ptr<TrackedObject> pReference = std::shared_ptr<TrackedObject>
+        (new TrackedObject(2, 0, &bbox, nullptr, maxTracePoints));
+        
+    for (uint i = 1; i < trace.size(); i++)
+    {
+        bbox.left = trace[i].x;
+        bbox.top = trace[i].y;
+        
+        pIncremental->Update(i, &bbox);
+        pReference->Update(i, &bbox);
+        
+        uint direction(DSL_AREA_CROSS_DIRECTION_NONE);
+        
+        if (pOdeArea->DoesTrackedObjectCrossLine(pIncremental, 
+            testMethod, direction))
+        {
+            incrementalCounts[direction]++;
+            pIncremental->HandleOccurrence();
+        }
+        
+        DSL_RGBA_MULTI_LINE_PTR pTrace = pReference->GetTrace(
+            pOdeArea->GetBboxTestPoint(), testMethod, 0);
+            
+        if (pOdeArea->DoesTraceCrossLine(pTrace->coordinates, 
+            pTrace->num_coordinates, direction))
+        {
+            referenceCounts[direction]++;
+            pReference->HandleOccurrence();
+        }
+    }
+}
+
+SCENARIO( "DoesTrackedObjectCrossLine produces the same occurrences as DoesTraceCrossLine", 
+    "[OdeArea]" )
+{
+    GIVEN( "A Line, Multi-Line, and Polygon Area and a recorded trace" ) 
+    {
+        bool show(false);
+        uint bboxTestPoint(DSL_BBOX_POINT_NORTH_WEST);
+        
+        std::string colorName  = "custom-color";
+        DSL_RGBA_COLOR_PTR pColor = DSL_RGBA_COLOR_NEW(colorName.c_str(), 
+            0.12, 0.34, 0.56, 0.78);
+
+        DSL_RGBA_LINE_PTR pLine = DSL_RGBA_LINE_NEW("rgba-line", 
+            100, 100, 400, 100, 10, pColor);
+        DSL_ODE_AREA_PTR pLineArea = DSL_ODE_AREA_LINE_NEW("line-area", 
+            pLine, show, bboxTestPoint);
+
+        dsl_coordinate multiLineCoordinates[4] = 
+            {{100,100},{200,90},{300,130},{400,150}};
+        DSL_RGBA_MULTI_LINE_PTR pMultiLine = DSL_RGBA_MULTI_LINE_NEW(
+            "rgba-multi-line", multiLineCoordinates, 4, 4, pColor);
+        DSL_ODE_AREA_PTR pMultiLineArea = DSL_ODE_AREA_MULTI_LINE_NEW(
+            "multi-line-area", pMultiLine, show, bboxTestPoint);
+
+        dsl_coordinate polygonCoordinates[4] = 
+            {{100,100},{210,110},{220, 300},{110,330}};
+        DSL_RGBA_POLYGON_PTR pPolygon = DSL_RGBA_POLYGON_NEW("rgba-polygon", 
+            polygonCoordinates, 4, 4, pColor);
+        DSL_ODE_AREA_PTR pPolygonArea = DSL_ODE_AREA_INCLUSION_NEW(
+            "polygon-area", pPolygon, show, bboxTestPoint);
+
+        // sweeps inside, and outside, of the end-points of each Area.
+        std::vector<dsl_coordinate> trace = 
+            record_trace({150, 180, 450, 250, 60, 120}, 30, 200, 7);
+
+        std::vector<DSL_ODE_AREA_PTR> areas = 
+            {pLineArea, pMultiLineArea, pPolygonArea};
+        
+        WHEN( "The trace is played with the all-points test method" )
+        {
+            THEN( "The IN and OUT counts are identical for all trace lengths" )
+            {
+                for (auto& pOdeArea: areas)
+                {
+                    for (uint maxTracePoints: {2, 5, 16, 100})
+                    {
+                        uint incrementalCounts[3] = {0};
+                        uint referenceCounts[3] = {0};
+                        
+                        play_recorded_trace(pOdeArea, trace, maxTracePoints,
+                            DSL_OBJECT_TRACE_TEST_METHOD_ALL_POINTS, 
+                            incrementalCounts, referenceCounts);
+                            
+                        REQUIRE( incrementalCounts[DSL_AREA_CROSS_DIRECTION_IN] ==
+                            referenceCounts[DSL_AREA_CROSS_DIRECTION_IN] );
+                        REQUIRE( incrementalCounts[DSL_AREA_CROSS_DIRECTION_OUT] ==
+                            referenceCounts[DSL_AREA_CROSS_DIRECTION_OUT] );
+                        REQUIRE( incrementalCounts[DSL_AREA_CROSS_DIRECTION_IN] > 0 );
+                        REQUIRE( incrementalCounts[DSL_AREA_CROSS_DIRECTION_OUT] > 0 );
+                    }
+                }
+            }
+        }
+        WHEN( "The trace is played with the end-points test method" )
+        {
+            THEN( "The IN and OUT counts are identical for all trace lengths" )
+            {
+                for (auto& pOdeArea: areas)
+                {
+                    for (uint maxTracePoints: {2, 5, 16, 100})
+                    {
+                        uint incrementalCounts[3] = {0};
+                        uint referenceCounts[3] = {0};
+                        
+                        play_recorded_trace(pOdeArea, trace, maxTracePoints,
+                            DSL_OBJECT_TRACE_TEST_METHOD_END_POINTS, 
+                            incrementalCounts, referenceCounts);
+                            
+                        REQUIRE( incrementalCounts[DSL_AREA_CROSS_DIRECTION_IN] ==
+                            referenceCounts[DSL_AREA_CROSS_DIRECTION_IN] );
+                        REQUIRE( incrementalCounts[DSL_AREA_CROSS_DIRECTION_OUT] ==
+                            referenceCounts[DSL_AREA_CROSS_DIRECTION_OUT] );
+                    }
+                }
+            }
+        }
+    }
+}
+
+/**
+ * @brief Plays a trace through a Tracked Object, testing it with the 
+ * incremental DoesTrackedObjectCrossLine once per frame.
+ * @return the direction of the occurrence for each frame after the first,
+ * DSL_AREA_CROSS_DIRECTION_NONE if there was no occurrence.
+ */
+static std::vector<uint> play_trace(DSL_ODE_AREA_PTR pOdeArea, 
+    const std::vector<dsl_coordinate>& trace)
+{
+    NvBbox_Coords bbox{0};
+    bbox.left = trace[0].x;
+    bbox.top = trace[0].y;
+    
+    std::shared_ptr<TrackedObject> pTrackedObject = 
+        std::shared_ptr<TrackedObject>(new TrackedObject(1, 0, &bbox, nullptr, 100));
+        
+    std::vector<uint> directions;
+    
+    for (uint i = 1; i < trace.size(); i++)
+    {
+        bbox.left = trace[i].x;
+        bbox.top = trace[i].y;
+        
+        pTrackedObject->Update(i, &bbox);
+        
+        uint direction(DSL_AREA_CROSS_DIRECTION_NONE);
+        
+        if (pOdeArea->DoesTrackedObjectCrossLine(pTrackedObject, 
+            DSL_OBJECT_TRACE_TEST_METHOD_ALL_POINTS, direction))
+        {
+            pTrackedObject->HandleOccurrence();
+        }
+        directions.push_back(direction);
+    }
+    return directions;
+}
+
+SCENARIO( "DoesTrackedObjectCrossLine handles collinear, touching, and re-crossing traces", 
+    "[OdeArea]" )
+{
+    GIVEN( "A horizontal OdeLineArea with a hysteresis of 5 pixels" ) 
+    {
+        bool show(false);
+        uint bboxTestPoint(DSL_BBOX_POINT_NORTH_WEST);
+        
+        std::string colorName  = "custom-color";
+        DSL_RGBA_COLOR_PTR pColor = DSL_RGBA_COLOR_NEW(colorName.c_str(), 
+            0.12, 0.34, 0.56, 0.78);
+
+        // Points above the line (y < 100) are outside, below are inside.
+        DSL_RGBA_LINE_PTR pLine = DSL_RGBA_LINE_NEW("rgba-line", 
+            100, 100, 400, 100, 10, pColor);
+        DSL_ODE_AREA_PTR pOdeArea = DSL_ODE_AREA_LINE_NEW("line-area", 
+            pLine, show, bboxTestPoint);
+            
+        uint none(DSL_AREA_CROSS_DIRECTION_NONE);
+        uint in(DSL_AREA_CROSS_DIRECTION_IN);
+        uint out(DSL_AREA_CROSS_DIRECTION_OUT);
+
+        WHEN( "A trace crosses the Line in a single step" )
+        {
+            std::vector<dsl_coordinate> trace = {{150,50},{150,150}};
+            
+            THEN( "The cross is reported on the first frame" )
+            {
+                std::vector<uint> expected = {in};
+                REQUIRE( play_trace(pOdeArea, trace) == expected );
+            }
+        }
+        WHEN( "A trace runs along the Line before leaving it" )
+        {
+            std::vector<dsl_coordinate> trace = 
+                {{150,50},{150,100},{200,100},{250,100},{250,150}};
+            
+            THEN( "The cross is reported once the trace is clear of the Line" )
+            {
+                std::vector<uint> expected = {none, none, none, in};
+                REQUIRE( play_trace(pOdeArea, trace) == expected );
+            }
+        }
+        WHEN( "A trace runs along the Line's extension, past its end-point" )
+        {
+            std::vector<dsl_coordinate> trace = 
+                {{420,50},{420,100},{450,100},{450,150}};
+            
+            THEN( "No cross is reported as the trace never meets the Line" )
+            {
+                std::vector<uint> expected = {none, none, none};
+                REQUIRE( play_trace(pOdeArea, trace) == expected );
+            }
+        }
+        WHEN( "A trace touches the Line and retreats" )
+        {
+            std::vector<dsl_coordinate> trace = {{150,50},{150,100},{150,50}};
+            
+            THEN( "No cross is reported as the trace ends on the same side" )
+            {
+                std::vector<uint> expected = {none, none};
+                REQUIRE( play_trace(pOdeArea, trace) == expected );
+            }
+        }
+        WHEN( "A trace passes through the Line's end-point" )
+        {
+            std::vector<dsl_coordinate> trace = {{400,50},{400,150}};
+            
+            THEN( "The cross is reported as the Line includes its end-points" )
+            {
+                std::vector<uint> expected = {in};
+                REQUIRE( play_trace(pOdeArea, trace) == expected );
+            }
+        }
+        WHEN( "A trace passes just beyond the Line's end-point" )
+        {
+            std::vector<dsl_coordinate> trace = {{401,50},{401,150}};
+            
+            THEN( "No cross is reported" )
+            {
+                std::vector<uint> expected = {none};
+                REQUIRE( play_trace(pOdeArea, trace) == expected );
+            }
+        }
+        WHEN( "A trace re-crosses the Line after each occurrence" )
+        {
+            std::vector<dsl_coordinate> trace = 
+                {{150,50},{150,150},{150,50},{150,150}};
+            
+            THEN( "Each cross is reported in the direction of travel" )
+            {
+                std::vector<uint> expected = {in, out, in};
+                REQUIRE( play_trace(pOdeArea, trace) == expected );
+            }
+        }
+        WHEN( "A trace turns back after an occurrence before reaching the Line" )
+        {
+            std::vector<dsl_coordinate> trace = 
+                {{150,50},{150,150},{150,103},{150,150}};
+            
+            THEN( "Only the first cross is reported" )
+            {
+                std::vector<uint> expected = {in, none, none};
+                REQUIRE( play_trace(pOdeArea, trace) == expected );
+            }
+        }
+        WHEN( "A trace crosses back within the hysteresis before an occurrence" )
+        {
+            std::vector<dsl_coordinate> trace = {{150,50},{150,103},{150,50}};
+            
+            THEN( "No cross is reported as the trace ends on the same side" )
+            {
+                std::vector<uint> expected = {none, none};
+                REQUIRE( play_trace(pOdeArea, trace) == expected );
+            }
+        }
+    }
+}
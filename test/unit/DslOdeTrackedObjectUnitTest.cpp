@@ -352,3 +352,173 @@ SCENARIO( "A TrackedObjects Container manages multiple Tracked Objects correctly
     }
 }
 
+
+SCENARIO( "Multiple TrackedObjects Containers share a TrackedObjectStore correctly", "[TrackedObject]" )
+{
+    GIVEN( "Two TrackedObjects containers and a shared TrackedObjectStore" ) 
+    {
+        NvDsFrameMeta frameMeta =  {0};
+        frameMeta.frame_num = 1;
+        frameMeta.source_id = 2;
+
+        NvDsObjectMeta objectMeta = {0};
+        objectMeta.object_id = 123;
+        objectMeta.rect_params.left = 10;
+        objectMeta.rect_params.top = 10;
+        objectMeta.rect_params.width = 100;
+        objectMeta.rect_params.height = 100;
+
+        std::shared_ptr<TrackedObjectStore> pTrackedObjectStore = 
+            std::shared_ptr<TrackedObjectStore>(new TrackedObjectStore());
+
+        std::shared_ptr<TrackedObjects>pTrackedObjects1 = 
+            std::shared_ptr<TrackedObjects>(new TrackedObjects(0, 0));
+        std::shared_ptr<TrackedObjects>pTrackedObjects2 = 
+            std::shared_ptr<TrackedObjects>(new TrackedObjects(10, 0));
+            
+        pTrackedObjects1->SetStore(pTrackedObjectStore, "client-1");
+        pTrackedObjects2->SetStore(pTrackedObjectStore, "client-2");
+        
+        REQUIRE( pTrackedObjectStore->GetMaxHistory() == 10 );
+
+        WHEN( "The same Object is tracked by both containers" )
+        {
+            std::shared_ptr<TrackedObject> pTrackedObject1 = 
+                pTrackedObjects1->Track(&frameMeta, &objectMeta, nullptr);
+            std::shared_ptr<TrackedObject> pTrackedObject2 = 
+                pTrackedObjects2->Track(&frameMeta, &objectMeta, nullptr);
+            
+            // Both containers update their Tracked Objects for the next frame
+            objectMeta.rect_params.left = 20;
+            pTrackedObject1->Update(2, (NvBbox_Coords*)&objectMeta.rect_params);
+            pTrackedObject2->Update(2, (NvBbox_Coords*)&objectMeta.rect_params);
+            
+            THEN( "A single history is maintained and updated once per frame" )
+            {
+                REQUIRE( pTrackedObjectStore->GetSize() == 1 );
+                REQUIRE( pTrackedObject1->frameCount == 2 );
+                REQUIRE( pTrackedObject2->frameCount == 2 );
+                REQUIRE( pTrackedObject2->BboxTraceSize() == 2 );
+                
+                pTrackedObject1 = nullptr;
+                pTrackedObject2 = nullptr;
+                
+                // Still referenced by the second container.
+                pTrackedObjects1->Purge(3);
+                pTrackedObjectStore->Purge();
+                REQUIRE( pTrackedObjectStore->GetSize() == 1 );
+
+                pTrackedObjects2->Purge(3);
+                pTrackedObjectStore->Purge();
+                REQUIRE( pTrackedObjectStore->GetSize() == 0 );
+            }
+        }
+        WHEN( "A container is removed from the shared store" )
+        {
+            pTrackedObjects2->SetStore(nullptr, "client-2");
+            
+            THEN( "The store's max history is updated correctly" )
+            {
+                REQUIRE( pTrackedObjectStore->GetMaxHistory() == 0 );
+            }
+        }
+    }
+}
+
+SCENARIO( "A TrackedObject's trace excludes frames it was not updated with", "[TrackedObject]" )
+{
+    GIVEN( "Two TrackedObjects containers sharing a TrackedObjectStore" ) 
+    {
+        NvDsFrameMeta frameMeta =  {0};
+        frameMeta.frame_num = 1;
+        frameMeta.source_id = 2;
+
+        NvDsObjectMeta objectMeta = {0};
+        objectMeta.object_id = 123;
+        objectMeta.rect_params.left = 10;
+        objectMeta.rect_params.top = 10;
+        objectMeta.rect_params.width = 100;
+        objectMeta.rect_params.height = 100;
+
+        std::shared_ptr<TrackedObjectStore> pTrackedObjectStore = 
+            std::shared_ptr<TrackedObjectStore>(new TrackedObjectStore());
+
+        std::shared_ptr<TrackedObjects>pTrackedObjects1 = 
+            std::shared_ptr<TrackedObjects>(new TrackedObjects(10, 10));
+        std::shared_ptr<TrackedObjects>pTrackedObjects2 = 
+            std::shared_ptr<TrackedObjects>(new TrackedObjects(10, 10));
+            
+        pTrackedObjects1->SetStore(pTrackedObjectStore, "client-1");
+        pTrackedObjects2->SetStore(pTrackedObjectStore, "client-2");
+        
+        std::shared_ptr<TrackedObject> pTrackedObject1 = 
+            pTrackedObjects1->Track(&frameMeta, &objectMeta, nullptr);
+        std::shared_ptr<TrackedObject> pTrackedObject2 = 
+            pTrackedObjects2->Track(&frameMeta, &objectMeta, nullptr);
+
+        WHEN( "Only the first container updates the object for a frame" )
+        {
+            objectMeta.rect_params.left = 20;
+            pTrackedObject1->Update(2, (NvBbox_Coords*)&objectMeta.rect_params);
+
+            objectMeta.rect_params.left = 30;
+            pTrackedObject1->Update(3, (NvBbox_Coords*)&objectMeta.rect_params);
+            pTrackedObject2->Update(3, (NvBbox_Coords*)&objectMeta.rect_params);
+            
+            // A second update for the same frame is ignored.
+            objectMeta.rect_params.left = 40;
+            pTrackedObject2->Update(3, (NvBbox_Coords*)&objectMeta.rect_params);
+            
+            THEN( "Each trace holds the frames it was updated with only" )
+            {
+                REQUIRE( pTrackedObjectStore->GetSize() == 1 );
+                REQUIRE( pTrackedObject1->frameCount == 3 );
+                REQUIRE( pTrackedObject2->frameCount == 2 );
+                REQUIRE( pTrackedObject1->BboxTraceSize() == 3 );
+                REQUIRE( pTrackedObject2->BboxTraceSize() == 2 );
+
+                DSL_RGBA_MULTI_LINE_PTR pTrace = 
+                    pTrackedObject2->GetTrace(DSL_BBOX_POINT_NORTH_WEST,
+                        DSL_OBJECT_TRACE_TEST_METHOD_ALL_POINTS, 5);
+                        
+                REQUIRE( pTrace->num_coordinates == 2 );
+                REQUIRE( pTrace->coordinates[0].x == 10 );
+                REQUIRE( pTrace->coordinates[1].x == 30 );
+            }
+        }
+    }
+}
+
+SCENARIO( "A TrackedObject without a history returns its last bbox coordinates", "[TrackedObject]" )
+{
+    GIVEN( "A new TrackedObject with a max history of 0" ) 
+    {
+        NvBbox_Coords bbox{10, 20, 100, 200};
+
+        std::shared_ptr<TrackedObject> pTrackedObject = 
+            std::shared_ptr<TrackedObject>(new TrackedObject(1, 1, 
+                &bbox, nullptr, 0));
+        
+        WHEN( "The TrackedObject is updated" )
+        {
+            bbox.left = 30;
+            bbox.top = 40;
+            pTrackedObject->Update(2, &bbox);
+            
+            THEN( "The first and last coordinates are from the last update" )
+            {
+                REQUIRE( pTrackedObject->BboxTraceSize() == 0 );
+                
+                dsl_coordinate coordinate = 
+                    pTrackedObject->GetFirstCoordinate(DSL_BBOX_POINT_NORTH_WEST);
+                REQUIRE( coordinate.x == 30 );
+                REQUIRE( coordinate.y == 40 );
+                
+                coordinate = 
+                    pTrackedObject->GetLastCoordinate(DSL_BBOX_POINT_NORTH_WEST);
+                REQUIRE( coordinate.x == 30 );
+                REQUIRE( coordinate.y == 40 );
+            }
+        }
+    }
+}
@@ -46,6 +46,26 @@ static boolean ode_post_process_frame_cb(void* buffer,
     return true;
 }
 
+static uint ode_check_for_occurrence_batch_cb(
+    const dsl_ode_object_record* records, uint count, 
+    uint8_t* results, void* client_data)
+{
+    uint* pCallCount = (uint*)client_data;
+    *pCallCount += 1;
+    
+    // flag every object with a confidence greater than 0.5
+    uint flagged(0);
+    for (uint i = 0; i < count; i++)
+    {
+        if (records[i].inference_confidence > 0.5)
+        {
+            results[i] = 1;
+            flagged++;
+        }
+    }
+    return flagged;
+}
+
 static void ode_occurrence_handler_cb_1(uint64_t event_id, const wchar_t* name,
     void* buffer, void* display_meta, void* frame_meta, void* object_meta, void* client_data)
 {
@@ -2888,6 +2908,89 @@ SCENARIO( "A Custom OdeTrigger checks for and handles Occurrence correctly", "[O
     }
 }
 
+SCENARIO( "A Custom Batch OdeTrigger checks for and handles Occurrence correctly", 
+    "[OdeTrigger]" )
+{
+    GIVEN( "A new CustomBatchOdeTrigger with client batch occurrence checker" ) 
+    {
+        std::string odeTriggerName("custom-batch");
+        std::string source;
+        uint classId(1);
+        uint limit(0);
+        uint callCount(0);
+
+        std::string odeActionName("action");
+
+        DSL_ODE_TRIGGER_CUSTOM_BATCH_PTR pOdeTrigger = 
+            DSL_ODE_TRIGGER_CUSTOM_BATCH_NEW(odeTriggerName.c_str(), 
+                source.c_str(), classId, limit, ode_check_for_occurrence_batch_cb, 
+                &callCount);
+
+        DSL_ODE_ACTION_PRINT_PTR pOdeAction = 
+            DSL_ODE_ACTION_PRINT_NEW(odeActionName.c_str(), false);
+            
+        REQUIRE( pOdeTrigger->AddAction(pOdeAction) == true );        
+
+        NvDsFrameMeta frameMeta =  {0};
+        frameMeta.bInferDone = true;  
+        frameMeta.frame_num = 444;
+        frameMeta.ntp_timestamp = INT64_MAX;
+        frameMeta.source_id = 2;
+
+        NvDsObjectMeta objectMeta1 = {0};
+        objectMeta1.class_id = classId; // must match ODE Trigger's classId
+        objectMeta1.confidence = 0.9;
+        
+        NvDsObjectMeta objectMeta2 = {0};
+        objectMeta2.class_id = classId; // must match ODE Trigger's classId
+        objectMeta2.confidence = 0.2;
+        
+        NvDsObjectMeta objectMeta3 = {0};
+        objectMeta3.class_id = classId; // must match ODE Trigger's classId
+        objectMeta3.confidence = 0.7;
+        
+        NvDsObjectMeta objectMeta4 = {0};
+        objectMeta4.class_id = classId+1; // must not match ODE Trigger's classId
+        objectMeta4.confidence = 0.9;
+
+        WHEN( "Three objects meet the minimum criteria" )
+        {
+            pOdeTrigger->PreProcessFrame(NULL, displayMetaData, &frameMeta);
+            
+            REQUIRE( pOdeTrigger->CheckForOccurrence(NULL, 
+                displayMetaData, &frameMeta, &objectMeta1) == true );
+            REQUIRE( pOdeTrigger->CheckForOccurrence(NULL, 
+                displayMetaData, &frameMeta, &objectMeta2) == true );
+            REQUIRE( pOdeTrigger->CheckForOccurrence(NULL, 
+                displayMetaData, &frameMeta, &objectMeta3) == true );
+            REQUIRE( pOdeTrigger->CheckForOccurrence(NULL, 
+                displayMetaData, &frameMeta, &objectMeta4) == false );
+            
+            THEN( "The client is called once and two ODE occurrences are detected" )
+            {
+                REQUIRE( callCount == 0 );
+                REQUIRE( pOdeTrigger->PostProcessFrame(NULL, 
+                    displayMetaData, &frameMeta) == 2 );
+                REQUIRE( callCount == 1 );
+            }
+        }
+        WHEN( "No objects meet the minimum criteria" )
+        {
+            pOdeTrigger->PreProcessFrame(NULL, displayMetaData, &frameMeta);
+            
+            REQUIRE( pOdeTrigger->CheckForOccurrence(NULL, 
+                displayMetaData, &frameMeta, &objectMeta4) == false );
+            
+            THEN( "The client is not called and no ODE occurrences are detected" )
+            {
+                REQUIRE( pOdeTrigger->PostProcessFrame(NULL, 
+                    displayMetaData, &frameMeta) == 0 );
+                REQUIRE( callCount == 0 );
+            }
+        }
+    }
+}
+
 SCENARIO( "A CountOdeTrigger handles ODE Occurrence correctly", "[OdeTrigger]" )
 {
     GIVEN( "A new CountOdeTrigger with Maximum criteria" ) 
@@ -3343,6 +3446,65 @@ SCENARIO( "A PersistenceOdeTrigger Post Processes ODE Occurrences correctly", "[
     }
 }
 
+SCENARIO( "A PersistenceOdeTrigger measures persistence from its own tracking with a shared store", 
+    "[OdeTrigger]" )
+{
+    GIVEN( "An InstanceOdeTrigger and a PersistenceOdeTrigger sharing a TrackedObjectStore" ) 
+    {
+        uint classId(1);
+        uint limit(0);
+        uint minimum(1);
+        uint maximum(3);
+
+        DSL_ODE_TRIGGER_INSTANCE_PTR pInstanceTrigger = 
+            DSL_ODE_TRIGGER_INSTANCE_NEW("instance", "", classId, limit);
+        DSL_ODE_TRIGGER_PERSISTENCE_PTR pPersistenceTrigger = 
+            DSL_ODE_TRIGGER_PERSISTENCE_NEW("persistence", "", 
+                classId, limit, minimum, maximum);
+
+        std::shared_ptr<TrackedObjectStore> pTrackedObjectStore = 
+            std::shared_ptr<TrackedObjectStore>(new TrackedObjectStore());
+        pInstanceTrigger->SetTrackedObjectStore(pTrackedObjectStore);
+        pPersistenceTrigger->SetTrackedObjectStore(pTrackedObjectStore);
+
+        NvDsFrameMeta frameMeta =  {0};
+        frameMeta.ntp_timestamp = INT64_MAX;
+        frameMeta.frame_num = 1;
+        frameMeta.source_id = 1;
+
+        NvDsObjectMeta objectMeta = {0};
+        objectMeta.class_id = classId;
+        objectMeta.object_id = 1;
+        
+        WHEN( "The object is seen by the InstanceOdeTrigger before the PersistenceOdeTrigger" )
+        {
+            pInstanceTrigger->CheckForOccurrence(NULL, 
+                displayMetaData, &frameMeta, &objectMeta);
+            std::this_thread::sleep_for(std::chrono::milliseconds(1000));
+            
+            frameMeta.frame_num = 2;
+            pInstanceTrigger->CheckForOccurrence(NULL, 
+                displayMetaData, &frameMeta, &objectMeta);
+            REQUIRE( pPersistenceTrigger->CheckForOccurrence(NULL, 
+                displayMetaData, &frameMeta, &objectMeta) == true );
+            
+            THEN( "Persistence is measured from when the PersistenceOdeTrigger started tracking" )
+            {
+                REQUIRE( pTrackedObjectStore->GetSize() == 1 );
+                REQUIRE( pPersistenceTrigger->PostProcessFrame(NULL, 
+                    displayMetaData, &frameMeta) == 0 );
+
+                std::this_thread::sleep_for(std::chrono::milliseconds(1000));
+                frameMeta.frame_num = 3;
+                REQUIRE( pPersistenceTrigger->CheckForOccurrence(NULL, 
+                    displayMetaData, &frameMeta, &objectMeta) == true );
+                REQUIRE( pPersistenceTrigger->PostProcessFrame(NULL, 
+                    displayMetaData, &frameMeta) == 1 );
+            }
+        }
+    }
+}
+
 SCENARIO( "A LatestOdeTrigger adds/updates tracked objects correctly", "[OdeTrigger]" )
 {
     GIVEN( "A new LatestOdeTrigger with criteria" ) 
@@ -22,10 +22,13 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 */
 
+#include <unistd.h>
 #include "catch.hpp"
 #include "DslPadProbeHandler.h"
+#include "DslMetaShmReader.h"
 #include "DslTrackerBintr.h"
 #include "DslOdeTrigger.h"
+#include "DslOdeAction.h"
 
 using namespace DSL;
 
@@ -168,6 +171,953 @@ SCENARIO( "A OdePadProbeHandler can add and remove an OdeTrigger", "[PadProbeHan
     }
 }
 
+static void replay_occurrence_counter_cb(dsl_ode_occurrence_info* occurrence_info,
+    void* client_data)
+{
+    (*(uint*)client_data)++;
+}    
+
+static void replay_custom_action_cb(uint64_t event_id, const wchar_t* name,
+    void* buffer, void* display_meta, void* frame_meta, void* object_meta, 
+    void* client_data)
+{
+    // Custom Actions require the buffer and are not invoked on replay
+    (*(uint*)client_data)++;
+}    
+
+/**
+ * @brief Adds a new frame, with one object per class-id provided, to a batch-meta
+ * @return pointer to the new frame meta added to the batch.
+ */
+static NvDsFrameMeta* add_frame_to_batch(NvDsBatchMeta* pBatchMeta, 
+    uint sourceId, int frameNum, std::vector<int> classIds)
+{
+    NvDsFrameMeta* pFrameMeta = nvds_acquire_frame_meta_from_pool(pBatchMeta);
+    pFrameMeta->source_id = sourceId;
+    pFrameMeta->frame_num = frameNum;
+    pFrameMeta->ntp_timestamp = 1000000 + frameNum;
+    pFrameMeta->source_frame_width = 1920;
+    pFrameMeta->source_frame_height = 1080;
+    pFrameMeta->bInferDone = true;
+    nvds_add_frame_meta_to_batch(pBatchMeta, pFrameMeta);
+    
+    for (uint i = 0; i < classIds.size(); i++)
+    {
+        NvDsObjectMeta* pObjectMeta = nvds_acquire_obj_meta_from_pool(pBatchMeta);
+        pObjectMeta->class_id = classIds[i];
+        pObjectMeta->object_id = i+1;
+        pObjectMeta->confidence = 0.5;
+        pObjectMeta->tracker_confidence = 0.75;
+        pObjectMeta->rect_params.left = 10*i;
+        pObjectMeta->rect_params.top = 20*i;
+        pObjectMeta->rect_params.width = 100;
+        pObjectMeta->rect_params.height = 200;
+        nvds_add_obj_meta_to_frame(pFrameMeta, pObjectMeta, NULL);
+    }
+    return pFrameMeta;
+}
+
+SCENARIO( "A MetaRecordWriter and MetaRecordReader write and read records correctly", 
+    "[PadProbeHandler]" )
+{
+    GIVEN( "A batch of frame and object metadata" ) 
+    {
+        std::string filePath("/tmp/meta-record-test.dslmeta");
+        
+        NvDsBatchMeta* pBatchMeta = nvds_create_batch_meta(2);
+        
+        add_frame_to_batch(pBatchMeta, 0, 1, {1, 1, 2});
+        add_frame_to_batch(pBatchMeta, 1, 1, {});
+
+        WHEN( "The batch is written twice and the file is closed" )
+        {
+            DSL_META_RECORD_WRITER_PTR pWriter = 
+                DSL_META_RECORD_WRITER_NEW(filePath.c_str());
+            
+            REQUIRE( pWriter->Write(pBatchMeta) == true );
+            REQUIRE( pWriter->Write(pBatchMeta) == true );
+            REQUIRE( pWriter->GetBatchCount() == 2 );
+            REQUIRE( pWriter->Close() == true );
+            
+            // Second call must fail
+            REQUIRE( pWriter->Close() == false );
+            REQUIRE( pWriter->Write(pBatchMeta) == false );
+            
+            THEN( "The records are read back correctly" )
+            {
+                DSL_META_RECORD_READER_PTR pReader = 
+                    DSL_META_RECORD_READER_NEW(filePath.c_str());
+                    
+                REQUIRE( pReader->GetBatchCount() == 2 );
+                REQUIRE( pReader->GetMaxBatchSize() == 2 );
+                REQUIRE( pReader->GetBatch(2) == NULL );
+                
+                const MetaRecordBatch* pBatch = pReader->GetBatch(1);
+                REQUIRE( pBatch != NULL );
+                REQUIRE( pBatch->frameCount == 2 );
+                REQUIRE( pBatch->objectCount == 3 );
+                
+                const MetaRecordFrame* pFrame = (const MetaRecordFrame*)(pBatch + 1);
+                REQUIRE( pFrame->sourceId == 0 );
+                REQUIRE( pFrame->frameNum == 1 );
+                REQUIRE( pFrame->ntpTimestamp == 1000001 );
+                REQUIRE( pFrame->sourceFrameWidth == 1920 );
+                REQUIRE( pFrame->sourceFrameHeight == 1080 );
+                REQUIRE( pFrame->flags == DSL_META_RECORD_FRAME_INFER_DONE );
+                REQUIRE( pFrame->objectCount == 3 );
+                
+                const MetaRecordObject* pObject = 
+                    (const MetaRecordObject*)(pFrame + 1);
+                REQUIRE( pObject[2].classId == 2 );
+                REQUIRE( pObject[2].objectId == 3 );
+                REQUIRE( pObject[2].confidence == 0.5 );
+                REQUIRE( pObject[2].trackerConfidence == 0.75 );
+                REQUIRE( pObject[2].left == 20 );
+                REQUIRE( pObject[2].top == 40 );
+                REQUIRE( pObject[2].width == 100 );
+                REQUIRE( pObject[2].height == 200 );
+                
+                pFrame = (const MetaRecordFrame*)(pObject + 3);
+                REQUIRE( pFrame->sourceId == 1 );
+                REQUIRE( pFrame->objectCount == 0 );
+            }
+        }
+        WHEN( "The file is truncated before the writer is closed" )
+        {
+            DSL_META_RECORD_WRITER_PTR pWriter = 
+                DSL_META_RECORD_WRITER_NEW(filePath.c_str());
+            
+            REQUIRE( pWriter->Write(pBatchMeta) == true );
+            REQUIRE( pWriter->Write(pBatchMeta) == true );
+            REQUIRE( pWriter->Close() == true );
+            
+            // Remove the index and the end of the last batch record, 
+            // and clear the header's index offset. 
+            struct stat fileStat;
+            REQUIRE( stat(filePath.c_str(), &fileStat) == 0 );
+            REQUIRE( truncate(filePath.c_str(), fileStat.st_size - 
+                2*sizeof(uint64_t) - sizeof(MetaRecordObject)) == 0 );
+            std::fstream file(filePath, std::fstream::in | 
+                std::fstream::out | std::fstream::binary);
+            uint64_t indexOffset(0);
+            file.seekp(offsetof(MetaRecordFileHeader, indexOffset));
+            file.write((const char*)&indexOffset, sizeof(indexOffset));
+            file.close();
+            
+            THEN( "Only the complete batch records are read" )
+            {
+                DSL_META_RECORD_READER_PTR pReader = 
+                    DSL_META_RECORD_READER_NEW(filePath.c_str());
+                    
+                REQUIRE( pReader->GetBatchCount() == 1 );
+                REQUIRE( pReader->GetMaxBatchSize() == 2 );
+                REQUIRE( pReader->GetBatch(0) != NULL );
+            }
+        }
+        nvds_destroy_batch_meta(pBatchMeta);
+    }
+}
+
+SCENARIO( "A MetaRecordReader fails to open an invalid file", "[PadProbeHandler]" )
+{
+    GIVEN( "A file that is not a Metadata Record file" ) 
+    {
+        std::string filePath("/tmp/meta-record-invalid.dslmeta");
+        
+        std::ofstream file(filePath, std::ofstream::out | 
+            std::ofstream::binary | std::ofstream::trunc);
+        file << "not-a-metadata-record-file-header-and-more";
+        file.close();
+
+        WHEN( "A MetaRecordReader is created for the file" )
+        {
+            THEN( "The MetaRecordReader throws an exception" )
+            {
+                REQUIRE_THROWS( DSL_META_RECORD_READER_NEW(filePath.c_str()) );
+                REQUIRE_THROWS( DSL_META_RECORD_READER_NEW("/tmp/not-a-file") );
+            }
+        }
+    }
+}
+
+SCENARIO( "An OdePadProbeHandler replays a Metadata Record file correctly", 
+    "[PadProbeHandler]" )
+{
+    GIVEN( "A Metadata Record file and an OdePadProbeHandler with an OdeTrigger" ) 
+    {
+        std::string filePath("/tmp/meta-record-replay.dslmeta");
+        uint classId(1);
+        uint occurrences(0);
+        uint customOccurrences(0);
+        
+        NvDsBatchMeta* pBatchMeta = nvds_create_batch_meta(2);
+        
+        add_frame_to_batch(pBatchMeta, 0, 1, {1, 1, 2});
+        add_frame_to_batch(pBatchMeta, 1, 1, {1});
+        {
+            DSL_META_RECORD_WRITER_PTR pWriter = 
+                DSL_META_RECORD_WRITER_NEW(filePath.c_str());
+            for (auto i = 0; i < 10; i++)
+            {
+                REQUIRE( pWriter->Write(pBatchMeta) == true );
+            }
+        }
+        nvds_destroy_batch_meta(pBatchMeta);
+
+        DSL_PPH_ODE_PTR pPadProbeHandler = DSL_PPH_ODE_NEW("ode-handler");
+
+        DSL_ODE_TRIGGER_OCCURRENCE_PTR pOdeTrigger = 
+            DSL_ODE_TRIGGER_OCCURRENCE_NEW("occurrence", "", 
+                classId, DSL_ODE_TRIGGER_LIMIT_NONE);
+                
+        DSL_ODE_ACTION_MONITOR_PTR pOdeAction = 
+            DSL_ODE_ACTION_MONITOR_NEW("counter", 
+                replay_occurrence_counter_cb, &occurrences);
+            
+        DSL_ODE_ACTION_CUSTOM_PTR pCustomOdeAction = 
+            DSL_ODE_ACTION_CUSTOM_NEW("custom", 
+                replay_custom_action_cb, &customOccurrences);
+            
+        REQUIRE( pOdeTrigger->AddAction(pOdeAction) == true );        
+        REQUIRE( pOdeTrigger->AddAction(pCustomOdeAction) == true );        
+        REQUIRE( pPadProbeHandler->AddChild(pOdeTrigger) == true );
+
+        WHEN( "The Metadata Record file is replayed" )
+        {
+            DSL_META_RECORD_READER_PTR pReader = 
+                DSL_META_RECORD_READER_NEW(filePath.c_str());
+            
+            REQUIRE( pPadProbeHandler->ReplayMetaRecord(pReader) == 20 );
+            
+            THEN( "The Trigger checks every replayed object" )
+            {
+                REQUIRE( occurrences == 30 );
+                REQUIRE( customOccurrences == 0 );
+            }
+        }
+        WHEN( "The Metadata Record file is replayed while disabled" )
+        {
+            DSL_META_RECORD_READER_PTR pReader = 
+                DSL_META_RECORD_READER_NEW(filePath.c_str());
+            
+            REQUIRE( pPadProbeHandler->SetEnabled(false) == true );
+            REQUIRE( pPadProbeHandler->ReplayMetaRecord(pReader) == 20 );
+            
+            THEN( "No objects are checked" )
+            {
+                REQUIRE( occurrences == 0 );
+            }
+        }
+    }
+}
+
+SCENARIO( "An OdePadProbeHandler replays a Persistence Trigger with recorded time", 
+    "[PadProbeHandler]" )
+{
+    GIVEN( "A Metadata Record file and an OdePadProbeHandler with a PersistenceTrigger" ) 
+    {
+        std::string filePath("/tmp/meta-record-persistence.dslmeta");
+        uint classId(1);
+        uint minimum(3), maximum(100);
+        uint occurrences(0);
+        
+        // One frame per second, recorded over 10 seconds, with the same 
+        // tracked object in each frame.
+        {
+            DSL_META_RECORD_WRITER_PTR pWriter = 
+                DSL_META_RECORD_WRITER_NEW(filePath.c_str());
+            for (auto i = 0; i < 10; i++)
+            {
+                NvDsBatchMeta* pBatchMeta = nvds_create_batch_meta(1);
+                NvDsFrameMeta* pFrameMeta = 
+                    add_frame_to_batch(pBatchMeta, 0, i, {1});
+                pFrameMeta->ntp_timestamp = 1000000000ULL*(1000+i);
+                
+                REQUIRE( pWriter->Write(pBatchMeta) == true );
+                nvds_destroy_batch_meta(pBatchMeta);
+            }
+        }
+
+        DSL_PPH_ODE_PTR pPadProbeHandler = DSL_PPH_ODE_NEW("ode-handler");
+
+        DSL_ODE_TRIGGER_PERSISTENCE_PTR pOdeTrigger = 
+            DSL_ODE_TRIGGER_PERSISTENCE_NEW("persistence", "", 
+                classId, DSL_ODE_TRIGGER_LIMIT_NONE, minimum, maximum);
+                
+        DSL_ODE_ACTION_MONITOR_PTR pOdeAction = 
+            DSL_ODE_ACTION_MONITOR_NEW("counter", 
+                replay_occurrence_counter_cb, &occurrences);
+            
+        REQUIRE( pOdeTrigger->AddAction(pOdeAction) == true );        
+        REQUIRE( pPadProbeHandler->AddChild(pOdeTrigger) == true );
+
+        WHEN( "The Metadata Record file is replayed at full speed" )
+        {
+            DSL_META_RECORD_READER_PTR pReader = 
+                DSL_META_RECORD_READER_NEW(filePath.c_str());
+            
+            REQUIRE( pPadProbeHandler->ReplayMetaRecord(pReader) == 10 );
+            
+            THEN( "Persistence is measured with the recorded frame time" )
+            {
+                // the object persists for 3 seconds or more in frames 3 to 9
+                REQUIRE( occurrences == 7 );
+            }
+        }
+    }
+}
+
+SCENARIO( "An OdePadProbeHandler can Get/Set its Frame Workers correctly", 
+    "[PadProbeHandler]" )
+{
+    GIVEN( "A new OdePadProbeHandler" ) 
+    {
+        DSL_PPH_ODE_PTR pPadProbeHandler = DSL_PPH_ODE_NEW("ode-handler");
+        
+        REQUIRE( pPadProbeHandler->GetFrameWorkers() == 0 );
+
+        WHEN( "The Frame Workers are set" )
+        {
+            REQUIRE( pPadProbeHandler->SetFrameWorkers(4) == true );
+            
+            THEN( "The correct value is returned on get" )
+            {
+                REQUIRE( pPadProbeHandler->GetFrameWorkers() == 4 );
+                
+                REQUIRE( pPadProbeHandler->SetFrameWorkers(0) == true );
+                REQUIRE( pPadProbeHandler->GetFrameWorkers() == 0 );
+            }
+        }
+    }
+}
+
+SCENARIO( "An OdeTrigger determines if it is per-source safe correctly", 
+    "[PadProbeHandler]" )
+{
+    GIVEN( "A new OdeTrigger with a source filter" ) 
+    {
+        uint occurrences(0);
+        
+        DSL_ODE_TRIGGER_OCCURRENCE_PTR pOdeTrigger = 
+            DSL_ODE_TRIGGER_OCCURRENCE_NEW("occurrence", "source-1", 
+                1, DSL_ODE_TRIGGER_LIMIT_NONE);
+        pOdeTrigger->_setSourceId(1);
+        
+        REQUIRE( pOdeTrigger->IsPerSourceSafe() == true );
+        REQUIRE( pOdeTrigger->GetSourceIdFilter() == 1 );
+
+        WHEN( "An Action that is not parallel safe is added" )
+        {
+            DSL_ODE_ACTION_CUSTOM_PTR pOdeAction = 
+                DSL_ODE_ACTION_CUSTOM_NEW("counter", 
+                    replay_occurrence_counter_cb, &occurrences);
+            REQUIRE( pOdeTrigger->AddAction(pOdeAction) == true );        
+            
+            THEN( "The Trigger is no longer per-source safe" )
+            {
+                REQUIRE( pOdeTrigger->IsPerSourceSafe() == false );
+            }
+        }
+        WHEN( "The source filter is cleared" )
+        {
+            pOdeTrigger->SetSource("");
+            
+            THEN( "The Trigger is no longer per-source safe" )
+            {
+                REQUIRE( pOdeTrigger->IsPerSourceSafe() == false );
+                REQUIRE( pOdeTrigger->GetSourceIdFilter() == -1 );
+            }
+        }
+    }
+}
+
+SCENARIO( "An OdePadProbeHandler with Frame Workers evaluates each frame correctly", 
+    "[PadProbeHandler]" )
+{
+    GIVEN( "A batch of frames and an OdePadProbeHandler with per-source Triggers" ) 
+    {
+        uint sourceCount(8);
+        uint classId(1);
+        
+        NvDsBatchMeta* pBatchMeta = nvds_create_batch_meta(sourceCount*2);
+        
+        // Two frames per source, with one object of class 1 per source id + 1
+        for (uint frameNum = 1; frameNum <= 2; frameNum++)
+        {
+            for (uint sourceId = 0; sourceId < sourceCount; sourceId++)
+            {
+                add_frame_to_batch(pBatchMeta, sourceId, frameNum, 
+                    std::vector<int>(sourceId+1, classId));
+            }
+        }
+
+        DSL_PPH_ODE_PTR pPadProbeHandler = DSL_PPH_ODE_NEW("ode-handler");
+        
+        for (uint sourceId = 0; sourceId < sourceCount; sourceId++)
+        {
+            std::string sourceName("source-" + std::to_string(sourceId));
+            DSL_ODE_TRIGGER_OCCURRENCE_PTR pOdeTrigger = 
+                DSL_ODE_TRIGGER_OCCURRENCE_NEW(sourceName.c_str(), 
+                    sourceName.c_str(), classId, DSL_ODE_TRIGGER_LIMIT_NONE);
+            pOdeTrigger->_setSourceId(sourceId);
+            
+            REQUIRE( pPadProbeHandler->AddChild(pOdeTrigger) == true );
+        }
+        REQUIRE( pPadProbeHandler->SetFrameWorkers(4) == true );
+
+        WHEN( "The batch is processed" )
+        {
+            pPadProbeHandler->HandleBatchMeta(NULL, pBatchMeta);
+            
+            THEN( "Each object is checked once, in order, by its source's Trigger" )
+            {
+                for (NvDsMetaList* pFrameMetaList = pBatchMeta->frame_meta_list; 
+                    pFrameMetaList; pFrameMetaList = pFrameMetaList->next)
+                {
+                    NvDsFrameMeta* pFrameMeta = (NvDsFrameMeta*)(pFrameMetaList->data);
+                    
+                    REQUIRE( pFrameMeta->num_obj_meta == pFrameMeta->source_id+1 );
+                    
+                    // The primary metric is the occurrence count for the frame
+                    uint occurrence(0);
+                    for (NvDsMetaList* pObjectMetaList = pFrameMeta->obj_meta_list; 
+                        pObjectMetaList; pObjectMetaList = pObjectMetaList->next)
+                    {
+                        NvDsObjectMeta* pObjectMeta = 
+                            (NvDsObjectMeta*)(pObjectMetaList->data);
+                        REQUIRE( pObjectMeta->misc_obj_info[
+                            DSL_OBJECT_INFO_PRIMARY_METRIC] == ++occurrence );
+                    }
+                    REQUIRE( occurrence == pFrameMeta->source_id+1 );
+                }
+            }
+        }
+        nvds_destroy_batch_meta(pBatchMeta);
+    }
+}
+
+SCENARIO( "An OdePadProbeHandler with Frame Workers evaluates Triggers in index order", 
+    "[PadProbeHandler]" )
+{
+    GIVEN( "A batch of frames and a batch-global Trigger ahead of a per-source Trigger" ) 
+    {
+        uint classId(1);
+        
+        NvDsBatchMeta* pBatchMeta = nvds_create_batch_meta(2);
+        
+        add_frame_to_batch(pBatchMeta, 0, 1, {1, 1});
+        add_frame_to_batch(pBatchMeta, 1, 1, {1, 1});
+
+        DSL_RGBA_COLOR_PTR pColor = DSL_RGBA_COLOR_NEW("color", 
+            0.1, 0.2, 0.3, 0.4);
+
+        // Batch-global Trigger, added first, formats with a border width of 1
+        DSL_ODE_TRIGGER_OCCURRENCE_PTR pGlobalTrigger = 
+            DSL_ODE_TRIGGER_OCCURRENCE_NEW("global", "", 
+                classId, DSL_ODE_TRIGGER_LIMIT_NONE);
+        DSL_ODE_ACTION_BBOX_FORMAT_PTR pGlobalAction = 
+            DSL_ODE_ACTION_BBOX_FORMAT_NEW("format-1", 1, pColor, false, pColor);
+        REQUIRE( pGlobalTrigger->AddAction(pGlobalAction) == true );
+        
+        // Per-source safe Trigger, added second, with a border width of 2
+        DSL_ODE_TRIGGER_OCCURRENCE_PTR pSourceTrigger = 
+            DSL_ODE_TRIGGER_OCCURRENCE_NEW("source-0", "source-0", 
+                classId, DSL_ODE_TRIGGER_LIMIT_NONE);
+        pSourceTrigger->_setSourceId(0);
+        DSL_ODE_ACTION_BBOX_FORMAT_PTR pSourceAction = 
+            DSL_ODE_ACTION_BBOX_FORMAT_NEW("format-2", 2, pColor, false, pColor);
+        REQUIRE( pSourceTrigger->AddAction(pSourceAction) == true );
+        
+        REQUIRE( pGlobalTrigger->IsPerSourceSafe() == false );
+        REQUIRE( pSourceTrigger->IsPerSourceSafe() == true );
+
+        DSL_PPH_ODE_PTR pPadProbeHandler = DSL_PPH_ODE_NEW("ode-handler");
+        
+        REQUIRE( pPadProbeHandler->AddChild(pGlobalTrigger) == true );
+        REQUIRE( pPadProbeHandler->AddChild(pSourceTrigger) == true );
+        REQUIRE( pPadProbeHandler->SetFrameWorkers(4) == true );
+
+        WHEN( "The batch is processed" )
+        {
+            pPadProbeHandler->HandleBatchMeta(NULL, pBatchMeta);
+            
+            THEN( "The per-source Trigger is evaluated after the batch-global Trigger" )
+            {
+                for (NvDsMetaList* pFrameMetaList = pBatchMeta->frame_meta_list; 
+                    pFrameMetaList; pFrameMetaList = pFrameMetaList->next)
+                {
+                    NvDsFrameMeta* pFrameMeta = (NvDsFrameMeta*)(pFrameMetaList->data);
+                    
+                    uint expectedWidth = (pFrameMeta->source_id == 0) ? 2 : 1;
+                    
+                    for (NvDsMetaList* pObjectMetaList = pFrameMeta->obj_meta_list; 
+                        pObjectMetaList; pObjectMetaList = pObjectMetaList->next)
+                    {
+                        NvDsObjectMeta* pObjectMeta = 
+                            (NvDsObjectMeta*)(pObjectMetaList->data);
+                        REQUIRE( pObjectMeta->rect_params.border_width == 
+                            expectedWidth );
+                    }
+                }
+            }
+        }
+        nvds_destroy_batch_meta(pBatchMeta);
+    }
+}
+
+SCENARIO( "An OdePadProbeHandler shares one Tracked Object Store across its Tracking Triggers", 
+    "[PadProbeHandler]" )
+{
+    GIVEN( "A batch of frames and an OdePadProbeHandler with two Tracking Triggers" ) 
+    {
+        uint classId(1);
+        
+        NvDsBatchMeta* pBatchMeta = nvds_create_batch_meta(2);
+        
+        add_frame_to_batch(pBatchMeta, 0, 1, {1, 1, 1});
+        add_frame_to_batch(pBatchMeta, 1, 1, {1, 1});
+
+        DSL_PPH_ODE_PTR pPadProbeHandler = DSL_PPH_ODE_NEW("ode-handler");
+        
+        DSL_ODE_TRIGGER_INSTANCE_PTR pInstanceTrigger = 
+            DSL_ODE_TRIGGER_INSTANCE_NEW("instance", "", 
+                classId, DSL_ODE_TRIGGER_LIMIT_NONE);
+        DSL_ODE_TRIGGER_PERSISTENCE_PTR pPersistenceTrigger = 
+            DSL_ODE_TRIGGER_PERSISTENCE_NEW("persistence", "", 
+                classId, DSL_ODE_TRIGGER_LIMIT_NONE, 0, 10);
+        
+        REQUIRE( pPadProbeHandler->AddChild(pInstanceTrigger) == true );
+        REQUIRE( pPadProbeHandler->AddChild(pPersistenceTrigger) == true );
+        
+        REQUIRE( pInstanceTrigger->GetTrackedObjectStore() == 
+            pPadProbeHandler->GetTrackedObjectStore() );
+        REQUIRE( pPersistenceTrigger->GetTrackedObjectStore() == 
+            pPadProbeHandler->GetTrackedObjectStore() );
+
+        WHEN( "The batch is processed" )
+        {
+            pPadProbeHandler->HandleBatchMeta(NULL, pBatchMeta);
+            
+            THEN( "Each object is stored once for all Triggers" )
+            {
+                REQUIRE( pPadProbeHandler->GetTrackedObjectStore()->GetSize() == 5 );
+                
+                REQUIRE( pPadProbeHandler->RemoveChild(pInstanceTrigger) == true );
+                REQUIRE( pInstanceTrigger->GetTrackedObjectStore() != 
+                    pPadProbeHandler->GetTrackedObjectStore() );
+                
+                pPadProbeHandler->RemoveAllChildren();
+                REQUIRE( pPadProbeHandler->GetTrackedObjectStore()->GetSize() == 0 );
+            }
+        }
+        nvds_destroy_batch_meta(pBatchMeta);
+    }
+}
+
+SCENARIO( "A new MetaRecorderPadProbeHandler is created correctly", "[PadProbeHandler]" )
+{
+    GIVEN( "Attributes for a new MetaRecorderPadProbeHandler" ) 
+    {
+        std::string handlerName("meta-recorder");
+        std::string filePath("/tmp/meta-recorder.dslmeta");
+
+        WHEN( "A new MetaRecorderPadProbeHandler is created" )
+        {
+            DSL_PPH_META_RECORDER_PTR pPadProbeHandler = 
+                DSL_PPH_META_RECORDER_NEW(handlerName.c_str(), filePath.c_str());
+
+            THEN( "All attributes are setup correctly" )
+            {
+                REQUIRE( pPadProbeHandler->GetName() == handlerName );
+                REQUIRE( pPadProbeHandler->GetEnabled() == true );
+                REQUIRE( pPadProbeHandler->GetBatchCount() == 0 );
+            }
+        }
+        WHEN( "A new MetaRecorderPadProbeHandler is created with an invalid path" )
+        {
+            THEN( "The constructor throws an exception" )
+            {
+                REQUIRE_THROWS( DSL_PPH_META_RECORDER_NEW(handlerName.c_str(), 
+                    "/tmp/not-a-directory/meta-recorder.dslmeta") );
+            }
+        }
+    }
+}
+
+SCENARIO( "A MetaShmWriter publishes frames to an attached reader correctly", 
+    "[PadProbeHandler]" )
+{
+    GIVEN( "A batch of frame and object metadata and a new MetaShmWriter" ) 
+    {
+        std::string shmName("/dsl-meta-shm-test");
+        
+        NvDsBatchMeta* pBatchMeta = nvds_create_batch_meta(2);
+        
+        add_frame_to_batch(pBatchMeta, 0, 1, {1, 1, 2, 3});
+        add_frame_to_batch(pBatchMeta, 1, 1, {});
+
+        DSL_META_SHM_WRITER_PTR pWriter = 
+            DSL_META_SHM_WRITER_NEW(shmName.c_str(), 4, 3);
+            
+        dsl_meta_shm_reader reader;
+        REQUIRE( dsl_meta_shm_reader_open(&reader, shmName.c_str()) == 0 );
+        REQUIRE( reader.header->slot_count == 4 );
+        REQUIRE( reader.header->max_objects == 3 );
+        REQUIRE( reader.header->slot_size % 64 == 0 );
+        
+        dsl_meta_shm_frame frame;
+        dsl_meta_shm_object objects[4];
+
+        REQUIRE( dsl_meta_shm_reader_next(&reader, &frame, objects, 4) == 0 );
+        REQUIRE( dsl_meta_shm_reader_wait(&reader, 0) == 0 );
+
+        WHEN( "The batch is published" )
+        {
+            REQUIRE( pWriter->Publish(pBatchMeta, 12345) == 2 );
+            REQUIRE( pWriter->GetSequence() == 2 );
+            
+            THEN( "The frames are read correctly" )
+            {
+                REQUIRE( dsl_meta_shm_reader_wait(&reader, 0) == 1 );
+                REQUIRE( dsl_meta_shm_reader_next(&reader, &frame, objects, 4) == 1 );
+                REQUIRE( frame.sequence == 1 );
+                REQUIRE( frame.source_id == 0 );
+                REQUIRE( frame.frame_num == 1 );
+                REQUIRE( frame.ntp_timestamp == 1000001 );
+                REQUIRE( frame.buf_pts == 12345 );
+                REQUIRE( frame.source_frame_width == 1920 );
+                REQUIRE( frame.source_frame_height == 1080 );
+                REQUIRE( frame.flags == (DSL_META_SHM_FRAME_INFER_DONE | 
+                    DSL_META_SHM_FRAME_OBJECTS_TRUNCATED) );
+                REQUIRE( frame.object_count == 3 );
+                REQUIRE( objects[2].class_id == 2 );
+                REQUIRE( objects[2].object_id == 3 );
+                REQUIRE( objects[2].confidence == 0.5 );
+                REQUIRE( objects[2].tracker_confidence == 0.75 );
+                REQUIRE( objects[2].left == 20 );
+                REQUIRE( objects[2].top == 40 );
+                REQUIRE( objects[2].width == 100 );
+                REQUIRE( objects[2].height == 200 );
+                
+                REQUIRE( dsl_meta_shm_reader_next(&reader, &frame, objects, 4) == 1 );
+                REQUIRE( frame.sequence == 2 );
+                REQUIRE( frame.source_id == 1 );
+                REQUIRE( frame.object_count == 0 );
+                
+                REQUIRE( dsl_meta_shm_reader_next(&reader, &frame, objects, 4) == 0 );
+                REQUIRE( reader.frames_read == 2 );
+                REQUIRE( reader.frames_skipped == 0 );
+            }
+        }
+        WHEN( "The reader lags by more than the slot count" )
+        {
+            for (uint i = 0; i < 5; i++)
+            {
+                REQUIRE( pWriter->Publish(pBatchMeta, i) == 2 );
+            }
+            
+            THEN( "The overwritten frames are skipped" )
+            {
+                uint count(0);
+                while (dsl_meta_shm_reader_next(&reader, &frame, objects, 4))
+                {
+                    count++;
+                }
+                REQUIRE( count == 4 );
+                REQUIRE( frame.sequence == 10 );
+                REQUIRE( reader.frames_read == 4 );
+                REQUIRE( reader.frames_skipped == 6 );
+            }
+        }
+        dsl_meta_shm_reader_close(&reader);
+        nvds_destroy_batch_meta(pBatchMeta);
+    }
+}
+
+SCENARIO( "A new MetaPublisherPadProbeHandler is created correctly", "[PadProbeHandler]" )
+{
+    GIVEN( "Attributes for a new MetaPublisherPadProbeHandler" ) 
+    {
+        std::string handlerName("meta-publisher");
+        std::string shmName("dsl-meta-publisher-test");
+
+        WHEN( "A new MetaPublisherPadProbeHandler is created" )
+        {
+            DSL_PPH_META_PUBLISHER_PTR pPadProbeHandler = 
+                DSL_PPH_META_PUBLISHER_NEW(handlerName.c_str(), 
+                    shmName.c_str(), 16, 8);
+
+            THEN( "All attributes are setup correctly" )
+            {
+                REQUIRE( pPadProbeHandler->GetName() == handlerName );
+                REQUIRE( pPadProbeHandler->GetEnabled() == true );
+                REQUIRE( pPadProbeHandler->GetSequence() == 0 );
+                
+                // A leading '/' is added to the name if not provided
+                dsl_meta_shm_reader reader;
+                REQUIRE( dsl_meta_shm_reader_open(&reader, 
+                    "/dsl-meta-publisher-test") == 0 );
+                dsl_meta_shm_reader_close(&reader);
+            }
+        }
+        WHEN( "A new MetaPublisherPadProbeHandler is created with a slot count of 0" )
+        {
+            THEN( "The constructor throws an exception" )
+            {
+                REQUIRE_THROWS( DSL_PPH_META_PUBLISHER_NEW(handlerName.c_str(), 
+                    shmName.c_str(), 0, 8) );
+            }
+        }
+    }
+}
+
+static uint custom_pph_client_handler_cb(void* buffer, void* client_data)
+{
+    return DSL_PAD_PROBE_OK;
+}
+
+SCENARIO( "A new CustomPadProbeHandler is created correctly", "[PadProbeHandler]" )
+{
+    GIVEN( "Attributes for a new CustomPadProbeHandler" ) 
+    {
+        std::string customHandlerName("custom-handler");
+
+        WHEN( "The PadProbeHandler is created " )
+        {
+            DSL_PPH_CUSTOM_PTR pPadProbeHandler = 
+                DSL_PPH_CUSTOM_NEW(customHandlerName.c_str(), 
+                    custom_pph_client_handler_cb, NULL);
+                
+            THEN( "The correct attribute values are returned" )
+            {
+                REQUIRE( pPadProbeHandler->GetEnabled() == true );
+                REQUIRE( pPadProbeHandler->GetAsyncEnabled() == false );
+                
+                uint maxSize(0), policy(99), sampleInterval(0);
+                pPadProbeHandler->GetAsyncQueueSettings(&maxSize, 
+                    &policy, &sampleInterval);
+                REQUIRE( maxSize == DSL_PPH_CUSTOM_ASYNC_DEFAULT_MAX_SIZE );
+                REQUIRE( policy == DSL_PPH_CUSTOM_ASYNC_POLICY_DROP );
+                REQUIRE( sampleInterval == 
+                    DSL_PPH_CUSTOM_ASYNC_DEFAULT_SAMPLE_INTERVAL );
+                
+                dsl_pph_custom_async_metrics metrics{0};
+                pPadProbeHandler->GetAsyncMetrics(&metrics);
+                REQUIRE( metrics.current_level == 0 );
+                REQUIRE( metrics.queued == 0 );
+                REQUIRE( metrics.dropped == 0 );
+            }
+        }
+    }
+}
+
+SCENARIO( "A CustomPadProbeHandler can Get/Set its async attributes correctly", 
+    "[PadProbeHandler]" )
+{
+    GIVEN( "A new CustomPadProbeHandler" ) 
+    {
+        std::string customHandlerName("custom-handler");
+
+        DSL_PPH_CUSTOM_PTR pPadProbeHandler = 
+            DSL_PPH_CUSTOM_NEW(customHandlerName.c_str(), 
+                custom_pph_client_handler_cb, NULL);
+
+        WHEN( "The async queue settings are updated" )
+        {
+            REQUIRE( pPadProbeHandler->SetAsyncQueueSettings(4, 
+                DSL_PPH_CUSTOM_ASYNC_POLICY_SAMPLE, 5) == true );
+            
+            THEN( "The correct attribute values are returned" )
+            {
+                uint maxSize(0), policy(99), sampleInterval(0);
+                pPadProbeHandler->GetAsyncQueueSettings(&maxSize, 
+                    &policy, &sampleInterval);
+                REQUIRE( maxSize == 4 );
+                REQUIRE( policy == DSL_PPH_CUSTOM_ASYNC_POLICY_SAMPLE );
+                REQUIRE( sampleInterval == 5 );
+            }
+        }
+        WHEN( "Invalid async queue settings are used" )
+        {
+            THEN( "The settings are not updated" )
+            {
+                REQUIRE( pPadProbeHandler->SetAsyncQueueSettings(0, 
+                    DSL_PPH_CUSTOM_ASYNC_POLICY_DROP, 1) == false );
+                REQUIRE( pPadProbeHandler->SetAsyncQueueSettings(4, 
+                    DSL_PPH_CUSTOM_ASYNC_POLICY_BLOCK+1, 1) == false );
+                REQUIRE( pPadProbeHandler->SetAsyncQueueSettings(4, 
+                    DSL_PPH_CUSTOM_ASYNC_POLICY_SAMPLE, 0) == false );
+            }
+        }
+        WHEN( "Async mode is enabled" )
+        {
+            REQUIRE( pPadProbeHandler->SetAsyncEnabled(true) == true );
+            
+            THEN( "The queue settings can not be updated until disabled" )
+            {
+                REQUIRE( pPadProbeHandler->GetAsyncEnabled() == true );
+                REQUIRE( pPadProbeHandler->SetAsyncEnabled(true) == false );
+                REQUIRE( pPadProbeHandler->SetAsyncQueueSettings(4, 
+                    DSL_PPH_CUSTOM_ASYNC_POLICY_DROP, 1) == false );
+                REQUIRE( pPadProbeHandler->SetAsyncEnabled(false) == true );
+                REQUIRE( pPadProbeHandler->SetAsyncQueueSettings(4, 
+                    DSL_PPH_CUSTOM_ASYNC_POLICY_DROP, 1) == true );
+            }
+        }
+    }
+}
+
+SCENARIO( "A CustomPadProbeHandler in async mode accounts for every buffer", 
+    "[PadProbeHandler]" )
+{
+    GIVEN( "A new CustomPadProbeHandler with async mode enabled" ) 
+    {
+        std::string customHandlerName("custom-handler");
+        uint bufferCount(100);
+
+        DSL_PPH_CUSTOM_PTR pPadProbeHandler = 
+            DSL_PPH_CUSTOM_NEW(customHandlerName.c_str(), 
+                custom_pph_client_handler_cb, NULL);
+                
+        WHEN( "Buffers are handled with the sample policy" )
+        {
+            REQUIRE( pPadProbeHandler->SetAsyncQueueSettings(2, 
+                DSL_PPH_CUSTOM_ASYNC_POLICY_SAMPLE, 2) == true );
+            REQUIRE( pPadProbeHandler->SetAsyncEnabled(true) == true );
+
+            for (uint i = 0; i < bufferCount; i++)
+            {
+                GstPadProbeInfo info = {(GstPadProbeType)0};
+                GstBuffer* pBuffer = gst_buffer_new();
+                info.data = pBuffer;
+                
+                REQUIRE( pPadProbeHandler->HandlePadData(&info) == 
+                    GST_PAD_PROBE_OK );
+                gst_buffer_unref(pBuffer);
+            }
+            REQUIRE( pPadProbeHandler->SetAsyncEnabled(false) == true );
+            
+            THEN( "Every buffer is either processed or dropped" )
+            {
+                dsl_pph_custom_async_metrics metrics{0};
+                pPadProbeHandler->GetAsyncMetrics(&metrics);
+                
+                REQUIRE( metrics.current_level == 0 );
+                REQUIRE( metrics.max_level <= 2 );
+                REQUIRE( (metrics.processed + metrics.dropped) == bufferCount );
+                
+                pPadProbeHandler->ClearAsyncMetrics();
+                pPadProbeHandler->GetAsyncMetrics(&metrics);
+                REQUIRE( metrics.queued == 0 );
+                REQUIRE( metrics.processed == 0 );
+                REQUIRE( metrics.dropped == 0 );
+            }
+        }
+        WHEN( "Buffers are handled with the block policy" )
+        {
+            REQUIRE( pPadProbeHandler->SetAsyncQueueSettings(2, 
+                DSL_PPH_CUSTOM_ASYNC_POLICY_BLOCK, 1) == true );
+            REQUIRE( pPadProbeHandler->SetAsyncEnabled(true) == true );
+
+            for (uint i = 0; i < bufferCount; i++)
+            {
+                GstPadProbeInfo info = {(GstPadProbeType)0};
+                GstBuffer* pBuffer = gst_buffer_new();
+                info.data = pBuffer;
+                
+                REQUIRE( pPadProbeHandler->HandlePadData(&info) == 
+                    GST_PAD_PROBE_OK );
+                gst_buffer_unref(pBuffer);
+            }
+            
+            THEN( "All buffers are queued without drops" )
+            {
+                dsl_pph_custom_async_metrics metrics{0};
+                pPadProbeHandler->GetAsyncMetrics(&metrics);
+                
+                REQUIRE( metrics.queued == bufferCount );
+                REQUIRE( metrics.max_level <= 2 );
+                REQUIRE( pPadProbeHandler->SetAsyncEnabled(false) == true );
+            }
+        }
+    }
+}
+
+struct SnapshotTestData
+{
+    GstBuffer* pBuffer;
+    NvDsBatchMeta* pBatchMeta;
+    uint frameCount;
+};
+
+static uint custom_pph_snapshot_handler_cb(void* buffer, void* client_data)
+{
+    SnapshotTestData* pData = (SnapshotTestData*)client_data;
+    
+    pData->pBuffer = (GstBuffer*)buffer;
+    pData->pBatchMeta = gst_buffer_get_nvds_batch_meta((GstBuffer*)buffer);
+    pData->frameCount = (pData->pBatchMeta) 
+        ? pData->pBatchMeta->num_frames_in_batch : 0;
+    
+    return DSL_PAD_PROBE_OK;
+}
+
+SCENARIO( "A CustomPadProbeHandler in async mode calls the client with a snapshot", 
+    "[PadProbeHandler]" )
+{
+    GIVEN( "A new CustomPadProbeHandler with async mode enabled" ) 
+    {
+        std::string customHandlerName("custom-handler");
+        SnapshotTestData snapshotData{0};
+
+        DSL_PPH_CUSTOM_PTR pPadProbeHandler = 
+            DSL_PPH_CUSTOM_NEW(customHandlerName.c_str(), 
+                custom_pph_snapshot_handler_cb, &snapshotData);
+                
+        REQUIRE( pPadProbeHandler->SetAsyncEnabled(true) == true );
+
+        GstBuffer* pBuffer = gst_buffer_new();
+        NvDsBatchMeta* pBatchMeta = nvds_create_batch_meta(2);
+        add_frame_to_batch(pBatchMeta, 0, 1, {1, 2});
+        add_frame_to_batch(pBatchMeta, 1, 1, {});
+        
+        NvDsMeta* pMeta = gst_buffer_add_nvds_meta(pBuffer, pBatchMeta, 
+            NULL, nvds_batch_meta_copy_func, nvds_batch_meta_release_func);
+        pMeta->meta_type = NVDS_BATCH_GST_META;
+
+        WHEN( "A buffer with batch-meta is handled" )
+        {
+            GstPadProbeInfo info = {(GstPadProbeType)0};
+            info.data = pBuffer;
+            
+            REQUIRE( pPadProbeHandler->HandlePadData(&info) == 
+                GST_PAD_PROBE_OK );
+                
+            // the original buffer is left unreferenced and writable
+            REQUIRE( gst_buffer_is_writable(pBuffer) == true );
+            
+            dsl_pph_custom_async_metrics metrics{0};
+            for (uint i = 0; i < 100 and metrics.processed == 0; i++)
+            {
+                g_usleep(10000);
+                pPadProbeHandler->GetAsyncMetrics(&metrics);
+            }
+            REQUIRE( pPadProbeHandler->SetAsyncEnabled(false) == true );
+            
+            THEN( "The client receives a copy of the batch-meta" )
+            {
+                REQUIRE( metrics.processed == 1 );
+                REQUIRE( snapshotData.pBuffer != pBuffer );
+                REQUIRE( snapshotData.pBatchMeta != NULL );
+                REQUIRE( snapshotData.pBatchMeta != pBatchMeta );
+                REQUIRE( snapshotData.frameCount == 2 );
+                
+                gst_buffer_unref(pBuffer);
+            }
+        }
+    }
+}
+
 SCENARIO( "A new MeterPadProbeHandler is created correctly", "[PadProbeHandler]" )
 {
     GIVEN( "Attributes for a new MeterPadProbeHandler" ) 
@@ -0,0 +1,111 @@
+/*
+The MIT License
+
+Copyright (c) 2019-2021, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include "catch.hpp"
+#include "DslPipelineBintr.h"
+#include "DslPipelinePool.h"
+
+using namespace DSL;
+
+static const std::string poolName("pool");
+static const std::string pipelineName("pipeline");
+
+SCENARIO( "A new PipelinePool is created correctly", "[PipelinePool]" )
+{
+    GIVEN( "Attributes for a new PipelinePool" ) 
+    {
+        WHEN( "The PipelinePool is created" )
+        {
+            DSL_PIPELINE_POOL_PTR pPipelinePool = 
+                DSL_PIPELINE_POOL_NEW(poolName.c_str(), GST_STATE_PAUSED, false);
+
+            THEN( "All attributes are setup correctly" )
+            {
+                REQUIRE( pPipelinePool->GetSize() == 0 );
+                REQUIRE( pPipelinePool->GetAvailable() == 0 );
+                REQUIRE( pPipelinePool->GetAcquired() == 0 );
+                
+                dsl_pipeline_pool_metrics metrics{0};
+                pPipelinePool->GetMetrics(&metrics);
+                REQUIRE( metrics.size == 0 );
+                REQUIRE( metrics.acquisitions == 0 );
+                REQUIRE( metrics.standby_time == 0 );
+            }
+        }
+    }
+}
+
+SCENARIO( "A PipelineBintr without a batch-size fails to enter standby", 
+    "[PipelinePool]" )
+{
+    GIVEN( "A new PipelinePool and a new PipelineBintr without Sources" ) 
+    {
+        DSL_PIPELINE_POOL_PTR pPipelinePool = 
+            DSL_PIPELINE_POOL_NEW(poolName.c_str(), GST_STATE_PAUSED, false);
+        DSL_PIPELINE_PTR pPipelineBintr = DSL_PIPELINE_NEW(pipelineName.c_str());
+
+        WHEN( "The PipelineBintr is added to the PipelinePool" )
+        {
+            REQUIRE( pPipelinePool->AddPipeline(pPipelineBintr) == false );
+
+            THEN( "The PipelineBintr is not a member and is not in standby" )
+            {
+                REQUIRE( pPipelinePool->GetSize() == 0 );
+                REQUIRE( pPipelinePool->IsMember(pipelineName.c_str()) == false );
+                REQUIRE( pPipelineBintr->GetStandbyState() == GST_STATE_NULL );
+                REQUIRE( pPipelineBintr->IsLinked() == false );
+            }
+        }
+    }
+}
+
+SCENARIO( "An empty PipelinePool fails to acquire", "[PipelinePool]" )
+{
+    GIVEN( "A new PipelinePool without PipelineBintrs" ) 
+    {
+        DSL_PIPELINE_POOL_PTR pPipelinePool = 
+            DSL_PIPELINE_POOL_NEW(poolName.c_str(), GST_STATE_PAUSED, false);
+
+        WHEN( "A PipelineBintr is acquired" )
+        {
+            std::vector<DSL_BINTR_PTR> sources;
+            const wchar_t* pipeline(NULL);
+            
+            REQUIRE( pPipelinePool->Acquire(sources, &pipeline) == nullptr );
+
+            THEN( "The exhausted count is updated correctly" )
+            {
+                REQUIRE( pipeline == NULL );
+                
+                dsl_pipeline_pool_metrics metrics{0};
+                pPipelinePool->GetMetrics(&metrics);
+                REQUIRE( metrics.exhausted == 1 );
+                
+                pPipelinePool->ClearMetrics();
+                pPipelinePool->GetMetrics(&metrics);
+                REQUIRE( metrics.exhausted == 0 );
+            }
+        }
+    }
+}
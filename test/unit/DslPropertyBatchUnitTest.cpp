@@ -0,0 +1,186 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include "catch.hpp"
+#include "Dsl.h"
+#include "DslApi.h"
+#include "DslPropertyBatch.h"
+#include "DslTilerBintr.h"
+
+using namespace DSL;
+
+static PropertySetting newSetting(const char* name, const char* property, 
+    uint type)
+{
+    PropertySetting setting{name, property, type, false, 0, 0, 0.0, ""};
+    return setting;
+}
+
+SCENARIO( "A PropertyBatch validates GST Element settings correctly", 
+    "[PropertyBatch]" )
+{
+    GIVEN( "A new PropertyBatch and GST Element" ) 
+    {
+        std::string elementName("queue");
+        
+        DSL_ELEMENT_PTR pQueue = DSL_ELEMENT_NEW("queue", elementName.c_str());
+        
+        PropertyBatch propertyBatch;
+
+        WHEN( "Valid settings are added" )
+        {
+            PropertySetting leakySetting = newSetting(elementName.c_str(), 
+                "leaky", DSL_COMPONENT_PROPERTY_TYPE_STRING);
+            leakySetting.stringValue = "upstream";
+            PropertySetting maxSizeSetting = newSetting(elementName.c_str(), 
+                "max-size-time", DSL_COMPONENT_PROPERTY_TYPE_UINT);
+            maxSizeSetting.uintValue = 5000000000;
+            PropertySetting flushSetting = newSetting(elementName.c_str(), 
+                "flush-on-eos", DSL_COMPONENT_PROPERTY_TYPE_BOOLEAN);
+            flushSetting.booleanValue = true;
+
+            REQUIRE( propertyBatch.AddElementSetting(pQueue, 
+                leakySetting) == DSL_RESULT_SUCCESS );
+            REQUIRE( propertyBatch.AddElementSetting(pQueue, 
+                maxSizeSetting) == DSL_RESULT_SUCCESS );
+            REQUIRE( propertyBatch.AddElementSetting(pQueue, 
+                flushSetting) == DSL_RESULT_SUCCESS );
+            
+            THEN( "The settings are applied correctly" )
+            {
+                uint failedIndex(99);
+                REQUIRE( propertyBatch.GetCount() == 3 );
+                REQUIRE( propertyBatch.Apply(&failedIndex) == DSL_RESULT_SUCCESS );
+                
+                int retLeaky(0);
+                uint64_t retMaxSizeTime(0);
+                boolean retFlush(false);
+                pQueue->GetAttribute("leaky", &retLeaky);
+                pQueue->GetAttribute("max-size-time", &retMaxSizeTime);
+                pQueue->GetAttribute("flush-on-eos", &retFlush);
+                REQUIRE( retLeaky == DSL_COMPONENT_QUEUE_LEAKY_UPSTREAM );
+                REQUIRE( retMaxSizeTime == 5000000000 );
+                REQUIRE( retFlush == true );
+            }
+        }
+        WHEN( "Invalid settings are added" )
+        {
+            PropertySetting badNameSetting = newSetting(elementName.c_str(), 
+                "non-existent", DSL_COMPONENT_PROPERTY_TYPE_UINT);
+            PropertySetting badEnumSetting = newSetting(elementName.c_str(), 
+                "leaky", DSL_COMPONENT_PROPERTY_TYPE_UINT);
+            badEnumSetting.uintValue = 99;
+            PropertySetting badSignSetting = newSetting(elementName.c_str(), 
+                "max-size-buffers", DSL_COMPONENT_PROPERTY_TYPE_INT);
+            badSignSetting.intValue = -1;
+            PropertySetting badSizeSetting = newSetting(elementName.c_str(), 
+                "max-size-buffers", DSL_COMPONENT_PROPERTY_TYPE_UINT);
+            badSizeSetting.uintValue = UINT64_MAX;
+            PropertySetting badStringSetting = newSetting(elementName.c_str(), 
+                "leaky", DSL_COMPONENT_PROPERTY_TYPE_STRING);
+            badStringSetting.stringValue = "sideways";
+            
+            THEN( "All settings are rejected" )
+            {
+                REQUIRE( propertyBatch.AddElementSetting(pQueue, 
+                    badNameSetting) == DSL_RESULT_GST_ELEMENT_SET_FAILED );
+                REQUIRE( propertyBatch.AddElementSetting(pQueue, 
+                    badEnumSetting) == DSL_RESULT_GST_ELEMENT_SET_FAILED );
+                REQUIRE( propertyBatch.AddElementSetting(pQueue, 
+                    badSignSetting) == DSL_RESULT_GST_ELEMENT_SET_FAILED );
+                REQUIRE( propertyBatch.AddElementSetting(pQueue, 
+                    badSizeSetting) == DSL_RESULT_GST_ELEMENT_SET_FAILED );
+                REQUIRE( propertyBatch.AddElementSetting(pQueue, 
+                    badStringSetting) == DSL_RESULT_GST_ELEMENT_SET_FAILED );
+                REQUIRE( propertyBatch.GetCount() == 0 );
+            }
+        }
+    }
+}
+
+SCENARIO( "A PropertyBatch validates Component settings correctly", 
+    "[PropertyBatch]" )
+{
+    GIVEN( "A new PropertyBatch and Component" ) 
+    {
+        std::string tilerName("tiler");
+        
+        DSL_TILER_PTR pTilerBintr = 
+            DSL_TILER_NEW(tilerName.c_str(), 1280, 720);
+        
+        PropertyBatch propertyBatch;
+
+        WHEN( "Valid settings are added" )
+        {
+            PropertySetting leakySetting = newSetting(tilerName.c_str(), 
+                "queue-leaky", DSL_COMPONENT_PROPERTY_TYPE_UINT);
+            leakySetting.uintValue = DSL_COMPONENT_QUEUE_LEAKY_DOWNSTREAM;
+            PropertySetting minThresholdSetting = newSetting(tilerName.c_str(), 
+                "queue-min-threshold-buffers", DSL_COMPONENT_PROPERTY_TYPE_INT);
+            minThresholdSetting.intValue = 10;
+
+            REQUIRE( propertyBatch.AddComponentSetting(pTilerBintr, 
+                leakySetting) == DSL_RESULT_SUCCESS );
+            REQUIRE( propertyBatch.AddComponentSetting(pTilerBintr, 
+                minThresholdSetting) == DSL_RESULT_SUCCESS );
+            
+            THEN( "The settings are applied correctly" )
+            {
+                uint failedIndex(99);
+                REQUIRE( propertyBatch.Apply(&failedIndex) == DSL_RESULT_SUCCESS );
+                
+                REQUIRE( pTilerBintr->GetQueueLeaky() == 
+                    DSL_COMPONENT_QUEUE_LEAKY_DOWNSTREAM );
+                REQUIRE( pTilerBintr->GetQueueMinThreshold(
+                    DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS) == 10 );
+            }
+        }
+        WHEN( "Invalid settings are added" )
+        {
+            PropertySetting badNameSetting = newSetting(tilerName.c_str(), 
+                "non-existent", DSL_COMPONENT_PROPERTY_TYPE_UINT);
+            PropertySetting badTypeSetting = newSetting(tilerName.c_str(), 
+                "gpu-id", DSL_COMPONENT_PROPERTY_TYPE_STRING);
+            PropertySetting badLeakySetting = newSetting(tilerName.c_str(), 
+                "queue-leaky", DSL_COMPONENT_PROPERTY_TYPE_UINT);
+            badLeakySetting.uintValue = 99;
+            PropertySetting badMemTypeSetting = newSetting(tilerName.c_str(), 
+                "nvbuf-mem-type", DSL_COMPONENT_PROPERTY_TYPE_UINT);
+            badMemTypeSetting.uintValue = 99;
+            
+            THEN( "All settings are rejected" )
+            {
+                REQUIRE( propertyBatch.AddComponentSetting(pTilerBintr, 
+                    badNameSetting) == DSL_RESULT_COMPONENT_PROPERTY_INVALID );
+                REQUIRE( propertyBatch.AddComponentSetting(pTilerBintr, 
+                    badTypeSetting) == DSL_RESULT_COMPONENT_PROPERTY_INVALID );
+                REQUIRE( propertyBatch.AddComponentSetting(pTilerBintr, 
+                    badLeakySetting) == DSL_RESULT_COMPONENT_SET_QUEUE_PROPERTY_FAILED );
+                REQUIRE( propertyBatch.AddComponentSetting(pTilerBintr, 
+                    badMemTypeSetting) == DSL_RESULT_COMPONENT_SET_NVBUF_MEM_TYPE_FAILED );
+                REQUIRE( propertyBatch.GetCount() == 0 );
+            }
+        }
+    }
+}
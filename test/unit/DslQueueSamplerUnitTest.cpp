@@ -0,0 +1,324 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include "catch.hpp"
+#include "Dsl.h"
+#include "DslApi.h"
+#include "DslQueueSampler.h"
+#include "DslTrackerBintr.h"
+#include "DslPipelineBintr.h"
+
+using namespace DSL;
+
+static const std::string iouTrackerConfigFile(
+    "/opt/nvidia/deepstream/deepstream/samples/configs/deepstream-app/config_tracker_IOU.yml");
+
+static QueueLevelSample make_sample(int64_t timestamp, 
+    double occupancy, uint64_t overruns)
+{
+    QueueLevelSample sample{0};
+    sample.timestamp = timestamp;
+    sample.occupancy = occupancy;
+    sample.overruns = overruns;
+    return sample;
+}
+
+SCENARIO( "A QueueLevelRing calculates occupancy percentiles correctly", 
+    "[QueueSampler]" )
+{
+    GIVEN( "A new QueueLevelRing with a capacity of 100 samples" ) 
+    {
+        DSL_TRACKER_PTR pTrackerBintr = DSL_TRACKER_NEW("iou-tracker", 
+            iouTrackerConfigFile.c_str(), 200, 100);
+
+        DSL_QUEUE_LEVEL_RING_PTR pRing = 
+            DSL_QUEUE_LEVEL_RING_NEW(pTrackerBintr, 100);
+
+        REQUIRE( pRing->GetSize() == 0 );
+        REQUIRE( pRing->GetOccupancyPercentile(50) == 0 );
+
+        WHEN( "Samples with occupancy 1 to 100 are added in reverse order" )
+        {
+            for (uint i = 100; i > 0; i--)
+            {
+                pRing->Push(make_sample(i, i, 0));
+            }
+            THEN( "The correct percentiles are returned" )
+            {
+                REQUIRE( pRing->GetSize() == 100 );
+                REQUIRE( pRing->GetOccupancyPercentile(50) == 50 );
+                REQUIRE( pRing->GetOccupancyPercentile(90) == 90 );
+                REQUIRE( pRing->GetOccupancyPercentile(99) == 99 );
+                REQUIRE( pRing->GetOccupancyPercentile(100) == 100 );
+                
+                // most recent 10 samples have occupancy 1 to 10
+                REQUIRE( pRing->GetOccupancyPercentile(100, 10) == 10 );
+            }
+        }
+        WHEN( "More samples than the ring's capacity are added" )
+        {
+            for (uint i = 0; i < 150; i++)
+            {
+                pRing->Push(make_sample(i, (i < 100) ? 100 : 10, 0));
+            }
+            THEN( "Only the most recent samples are retained" )
+            {
+                REQUIRE( pRing->GetSize() == 100 );
+                REQUIRE( pRing->GetOccupancyPercentile(100, 50) == 10 );
+                REQUIRE( pRing->GetOccupancyPercentile(100) == 100 );
+                REQUIRE( pRing->GetLatest().timestamp == 149 );
+            }
+        }
+        WHEN( "The ring is cleared" )
+        {
+            pRing->Push(make_sample(1, 50, 0));
+            pRing->Clear();
+            
+            THEN( "All samples are removed" )
+            {
+                REQUIRE( pRing->GetSize() == 0 );
+                REQUIRE( pRing->GetLatest().timestamp == 0 );
+            }
+        }
+    }
+}
+
+SCENARIO( "A QueueLevelRing calculates overruns and overrun rates correctly", 
+    "[QueueSampler]" )
+{
+    GIVEN( "A new QueueLevelRing with a capacity of 11 samples" ) 
+    {
+        DSL_TRACKER_PTR pTrackerBintr = DSL_TRACKER_NEW("iou-tracker", 
+            iouTrackerConfigFile.c_str(), 200, 100);
+
+        DSL_QUEUE_LEVEL_RING_PTR pRing = 
+            DSL_QUEUE_LEVEL_RING_NEW(pTrackerBintr, 11);
+
+        WHEN( "Samples 100ms apart with 2 overruns per sample are added" )
+        {
+            for (uint i = 0; i < 11; i++)
+            {
+                pRing->Push(make_sample(i*100000, 100, i*2));
+            }
+            THEN( "The correct overruns and overrun-rate are returned" )
+            {
+                REQUIRE( pRing->GetOverruns() == 20 );
+                REQUIRE( pRing->GetOverruns(3) == 4 );
+                REQUIRE( pRing->GetOverrunRate() == 20.0 );
+            }
+        }
+    }
+}
+
+SCENARIO( "A QBintr updates its max-size within its auto-size bounds correctly", 
+    "[QueueSampler]" )
+{
+    GIVEN( "A new Tracker as sample component" ) 
+    {
+        DSL_TRACKER_PTR pTrackerBintr = DSL_TRACKER_NEW("iou-tracker", 
+            iouTrackerConfigFile.c_str(), 200, 100);
+
+        uint64_t minSize(99), maxSize(99);
+        pTrackerBintr->GetQueueAutoSize(DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS,
+            &minSize, &maxSize);
+        REQUIRE( minSize == 0 );
+        REQUIRE( maxSize == 0 );
+        REQUIRE( pTrackerBintr->GetQueueAutoLeakyEnabled() == false );
+        REQUIRE( pTrackerBintr->GetQueueOverrunCount() == 0 );
+
+        WHEN( "Auto-sizing is disabled" )
+        {
+            THEN( "Overruns do not update the queue's max-size" )
+            {
+                REQUIRE( pTrackerBintr->UpdateQueueAutoSize(100, 10) == false );
+                REQUIRE( pTrackerBintr->GetQueueMaxSize(
+                    DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS) == 200 );
+            }
+        }
+        WHEN( "Auto-size bounds are set for buffers" )
+        {
+            REQUIRE( pTrackerBintr->SetQueueAutoSize(
+                DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS, 100, 400) == true );
+
+            THEN( "The max-size grows on overrun and is clamped to the upper bound" )
+            {
+                REQUIRE( pTrackerBintr->UpdateQueueAutoSize(100, 1) == true );
+                REQUIRE( pTrackerBintr->GetQueueMaxSize(
+                    DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS) == 300 );
+                REQUIRE( pTrackerBintr->UpdateQueueAutoSize(100, 1) == true );
+                REQUIRE( pTrackerBintr->GetQueueMaxSize(
+                    DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS) == 400 );
+                REQUIRE( pTrackerBintr->UpdateQueueAutoSize(100, 1) == false );
+                REQUIRE( pTrackerBintr->GetQueueMaxSize(
+                    DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS) == 400 );
+            }
+            THEN( "The max-size is unchanged at moderate occupancy" )
+            {
+                REQUIRE( pTrackerBintr->UpdateQueueAutoSize(50, 0) == false );
+                REQUIRE( pTrackerBintr->GetQueueMaxSize(
+                    DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS) == 200 );
+            }
+            THEN( "The max-size shrinks on low occupancy and is clamped to the lower bound" )
+            {
+                REQUIRE( pTrackerBintr->UpdateQueueAutoSize(0, 0) == true );
+                REQUIRE( pTrackerBintr->GetQueueMaxSize(
+                    DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS) == 150 );
+                REQUIRE( pTrackerBintr->UpdateQueueAutoSize(0, 0) == true );
+                REQUIRE( pTrackerBintr->GetQueueMaxSize(
+                    DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS) == 113 );
+                REQUIRE( pTrackerBintr->UpdateQueueAutoSize(0, 0) == true );
+                REQUIRE( pTrackerBintr->GetQueueMaxSize(
+                    DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS) == 100 );
+            }
+        }
+        WHEN( "Invalid auto-size bounds are set" )
+        {
+            THEN( "The bounds are rejected" )
+            {
+                REQUIRE( pTrackerBintr->SetQueueAutoSize(
+                    DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS, 400, 100) == false );
+                REQUIRE( pTrackerBintr->SetQueueAutoSize(
+                    DSL_COMPONENT_QUEUE_UNIT_OF_TIME+1, 100, 400) == false );
+            }
+        }
+        WHEN( "Auto-leaky is enabled with the max-size at its upper bound" )
+        {
+            REQUIRE( pTrackerBintr->SetQueueAutoSize(
+                DSL_COMPONENT_QUEUE_UNIT_OF_BUFFERS, 100, 200) == true );
+            pTrackerBintr->SetQueueAutoLeakyEnabled(true);
+
+            THEN( "The queue leaks on overrun and is restored on low occupancy" )
+            {
+                REQUIRE( pTrackerBintr->UpdateQueueAutoSize(100, 1) == true );
+                REQUIRE( pTrackerBintr->GetQueueLeaky() == 
+                    DSL_COMPONENT_QUEUE_LEAKY_DOWNSTREAM );
+                REQUIRE( pTrackerBintr->UpdateQueueAutoSize(0, 0) == true );
+                REQUIRE( pTrackerBintr->GetQueueLeaky() == 
+                    DSL_COMPONENT_QUEUE_LEAKY_NO );
+            }
+            THEN( "Disabling auto-leaky restores the original leaky setting" )
+            {
+                REQUIRE( pTrackerBintr->UpdateQueueAutoSize(100, 1) == true );
+                pTrackerBintr->SetQueueAutoLeakyEnabled(false);
+                REQUIRE( pTrackerBintr->GetQueueLeaky() == 
+                    DSL_COMPONENT_QUEUE_LEAKY_NO );
+            }
+        }
+    }
+}
+
+SCENARIO( "A Pipeline's QueueSampler samples all Component queues correctly", 
+    "[QueueSampler]" )
+{
+    GIVEN( "A new Pipeline with a Tracker as sample component" ) 
+    {
+        DSL_PIPELINE_PTR pPipelineBintr = DSL_PIPELINE_NEW("pipeline");
+
+        DSL_TRACKER_PTR pTrackerBintr = DSL_TRACKER_NEW("iou-tracker", 
+            iouTrackerConfigFile.c_str(), 200, 100);
+            
+        REQUIRE( pTrackerBintr->AddToParent(pPipelineBintr) == true );
+        
+        DSL_QUEUE_SAMPLER_PTR pQueueSampler = pPipelineBintr->GetQueueSampler();
+
+        uint interval(0), windowSize(0);
+        pQueueSampler->GetSettings(&interval, &windowSize);
+        REQUIRE( interval == DSL_QUEUE_SAMPLER_DEFAULT_INTERVAL );
+        REQUIRE( windowSize == DSL_QUEUE_SAMPLER_DEFAULT_WINDOW_SIZE );
+        REQUIRE( pQueueSampler->GetEnabled() == false );
+
+        WHEN( "The Sampler takes multiple samples" )
+        {
+            for (uint i = 0; i < 5; i++)
+            {
+                pQueueSampler->Sample();
+            }
+            THEN( "The correct telemetry is returned" )
+            {
+                const dsl_queue_telemetry* pTelemetry(NULL);
+                uint size(0);
+                pQueueSampler->GetTelemetry(&pTelemetry, &size);
+                
+                REQUIRE( pTelemetry != NULL );
+                
+                bool found(false);
+                for (uint i = 0; i < size; i++)
+                {
+                    if (std::wstring(pTelemetry[i].component) == L"iou-tracker")
+                    {
+                        found = true;
+                        REQUIRE( pTelemetry[i].samples == 5 );
+                        REQUIRE( pTelemetry[i].max_size_buffers == 200 );
+                        REQUIRE( pTelemetry[i].occupancy_max == 0 );
+                        REQUIRE( pTelemetry[i].overruns == 0 );
+                        REQUIRE( pTelemetry[i].is_bottleneck == false );
+                    }
+                }
+                REQUIRE( found == true );
+                REQUIRE( std::wstring(pQueueSampler->GetBottleneck()) == L"" );
+
+                pQueueSampler->ClearTelemetry();
+                pQueueSampler->GetTelemetry(&pTelemetry, &size);
+                for (uint i = 0; i < size; i++)
+                {
+                    REQUIRE( pTelemetry[i].samples == 0 );
+                }
+            }
+        }
+        WHEN( "The Sampler is enabled" )
+        {
+            REQUIRE( pQueueSampler->SetEnabled(true) == true );
+
+            THEN( "The settings can not be updated until disabled" )
+            {
+                REQUIRE( pQueueSampler->SetEnabled(true) == false );
+                REQUIRE( pQueueSampler->SetSettings(50, 100) == false );
+                REQUIRE( pQueueSampler->SetEnabled(false) == true );
+                REQUIRE( pQueueSampler->SetSettings(50, 100) == true );
+                
+                pQueueSampler->GetSettings(&interval, &windowSize);
+                REQUIRE( interval == 50 );
+                REQUIRE( windowSize == 100 );
+            }
+        }
+        WHEN( "The Tracker is removed from the Pipeline" )
+        {
+            pQueueSampler->Sample();
+            REQUIRE( pTrackerBintr->RemoveFromParent(pPipelineBintr) == true );
+            pQueueSampler->Sample();
+
+            THEN( "The Tracker's telemetry is removed" )
+            {
+                const dsl_queue_telemetry* pTelemetry(NULL);
+                uint size(0);
+                pQueueSampler->GetTelemetry(&pTelemetry, &size);
+
+                for (uint i = 0; i < size; i++)
+                {
+                    REQUIRE( std::wstring(pTelemetry[i].component) != L"iou-tracker" );
+                }
+            }
+        }
+    }
+}
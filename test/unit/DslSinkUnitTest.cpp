@@ -121,6 +121,68 @@ SCENARIO( "A new FrameCaptureSinkBintr is created correctly",  "[SinkBintr]" )
                 REQUIRE( retMaxLatness == -1 );
                 REQUIRE( pSinkBintr->GetQosEnabled(&retEnabled) == true );
                 REQUIRE( retEnabled == false );
+
+                uint retWidth(99), retDuration(99), retFrames(99);
+                uint64_t retMaxSize(99), retSize(99);
+                pSinkBintr->GetRingSettings(&retWidth, &retDuration, &retMaxSize);
+                REQUIRE( retWidth == 0 );
+                REQUIRE( retDuration == 0 );
+                REQUIRE( retMaxSize == 0 );
+                pSinkBintr->GetRingSize(&retFrames, &retSize);
+                REQUIRE( retFrames == 0 );
+                REQUIRE( retSize == 0 );
+            }
+        }
+    }
+}
+
+SCENARIO( "A FrameCaptureSinkBintr can update its ring settings correctly",
+    "[SinkBintr]" )
+{
+    GIVEN( "A new FrameCaptureSinkBintr" ) 
+    {
+        std::string actionName("ode-action");
+        std::string outdir("./");
+
+        DSL_ODE_ACTION_CAPTURE_FRAME_PTR pAction = 
+            DSL_ODE_ACTION_CAPTURE_FRAME_NEW(actionName.c_str(), 
+                outdir.c_str());
+
+        std::string sinkName("frame-capture-sink");
+
+        DSL_FRAME_CAPTURE_SINK_PTR pSinkBintr =
+            DSL_FRAME_CAPTURE_SINK_NEW(sinkName.c_str(), pAction);
+
+        uint count(99);
+
+        // ring is disabled by default
+        REQUIRE( pSinkBintr->InitiateRing(0) == false );
+        REQUIRE( pSinkBintr->InitiateRingRange(0, 
+            UINT64_MAX, &count) == false );
+
+        WHEN( "The FrameCaptureSinkBintr's ring is enabled" )
+        {
+            pSinkBintr->SetRingSettings(641, 5000, 1000000);
+            
+            THEN( "The correct attribute values are returned" )
+            {
+                uint retWidth(0), retDuration(0), retFrames(99);
+                uint64_t retMaxSize(0), retSize(99);
+                pSinkBintr->GetRingSettings(&retWidth, &retDuration, &retMaxSize);
+                
+                // width is rounded down to an even value
+                REQUIRE( retWidth == 640 );
+                REQUIRE( retDuration == 5000 );
+                REQUIRE( retMaxSize == 1000000 );
+                pSinkBintr->GetRingSize(&retFrames, &retSize);
+                REQUIRE( retFrames == 0 );
+                REQUIRE( retSize == 0 );
+
+                // empty ring - nothing to capture
+                REQUIRE( pSinkBintr->InitiateRing(0) == false );
+                REQUIRE( pSinkBintr->InitiateRingRange(0, 
+                    UINT64_MAX, &count) == true );
+                REQUIRE( count == 0 );
             }
         }
     }
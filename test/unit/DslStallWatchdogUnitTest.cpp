@@ -0,0 +1,295 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include "catch.hpp"
+#include "Dsl.h"
+#include "DslApi.h"
+#include "DslStallWatchdog.h"
+
+using namespace DSL;
+
+struct test_detector
+{
+    uint calls;
+    int result;
+};
+
+static int test_stall_handler(gpointer pDetector)
+{
+    test_detector* pTestDetector = static_cast<test_detector*>(pDetector);
+
+    pTestDetector->calls++;
+    return pTestDetector->result;
+}
+
+struct owned_test_detector
+{
+    std::atomic<bool> inHandler;
+    std::atomic<bool> release;
+};
+
+static int owned_test_stall_handler(gpointer pDetector)
+{
+    owned_test_detector* pTestDetector = 
+        static_cast<owned_test_detector*>(pDetector);
+
+    // block until released by the test, as a handler waiting on a lock would
+    pTestDetector->inHandler = true;
+    while (!pTestDetector->release)
+    {
+        g_usleep(1000);
+    }
+    return true;
+}
+
+static gpointer handle_tick_thread(gpointer pWatchdog)
+{
+    static_cast<StallWatchdog*>(pWatchdog)->HandleTick();
+    return NULL;
+}
+
+static void stamp_now(DSL_PPH_TIMESTAMP_PTR pTimestamp)
+{
+    timeval currentTime{0};
+    gettimeofday(&currentTime, NULL);
+    pTimestamp->SetTime(currentTime);
+}
+
+SCENARIO( "A StallWatchdog detects and clears a stall correctly", "[StallWatchdog]" )
+{
+    GIVEN( "A Timestamp PPH and a new stall detector" )
+    {
+        std::string handlerName("timestamp-handler");
+        uint timeout(50);
+        test_detector detector{0, true};
+
+        DSL_PPH_TIMESTAMP_PTR pTimestamp =
+            DSL_PPH_TIMESTAMP_NEW(handlerName.c_str());
+
+        StallWatchdog* pWatchdog = StallWatchdog::GetWatchdog();
+
+        REQUIRE( pWatchdog->AddDetector(&detector, handlerName.c_str(),
+            pTimestamp.get(), timeout, test_stall_handler) == true );
+        REQUIRE( pWatchdog->GetNumDetectors() == 1 );
+
+        // second add of the same detector must fail
+        REQUIRE( pWatchdog->AddDetector(&detector, handlerName.c_str(),
+            pTimestamp.get(), timeout, test_stall_handler) == false );
+
+        WHEN( "No buffer is stamped within the timeout" )
+        {
+            stamp_now(pTimestamp);
+            pWatchdog->HandleTick();
+            REQUIRE( detector.calls == 0 );
+
+            g_usleep(timeout*1000*3);
+            pWatchdog->HandleTick();
+
+            THEN( "The stall handler is called and the stall is reported" )
+            {
+                REQUIRE( detector.calls == 1 );
+
+                const dsl_stalled_source* sources(NULL);
+                uint size(0);
+                pWatchdog->GetStalled(&sources, &size);
+                REQUIRE( size == 1 );
+                REQUIRE( std::wstring(sources[0].name) == L"timestamp-handler" );
+                REQUIRE( sources[0].timeout == timeout );
+                REQUIRE( sources[0].time_since_last_buffer >= timeout );
+
+                // a new buffer clears the stall
+                stamp_now(pTimestamp);
+                pWatchdog->GetStalled(&sources, &size);
+                REQUIRE( size == 0 );
+                REQUIRE( sources == NULL );
+
+                REQUIRE( pWatchdog->RemoveDetector(&detector) == true );
+                REQUIRE( pWatchdog->GetNumDetectors() == 0 );
+            }
+        }
+        WHEN( "No first buffer is stamped within the timeout" )
+        {
+            g_usleep(timeout*1000*3);
+            pWatchdog->HandleTick();
+
+            THEN( "The stall handler is called but no stall is reported" )
+            {
+                REQUIRE( detector.calls == 1 );
+
+                const dsl_stalled_source* sources(NULL);
+                uint size(99);
+                pWatchdog->GetStalled(&sources, &size);
+                REQUIRE( size == 0 );
+                REQUIRE( sources == NULL );
+
+                REQUIRE( pWatchdog->RemoveDetector(&detector) == true );
+            }
+        }
+        WHEN( "Buffers are stamped within the timeout" )
+        {
+            for (uint i = 0; i < 8; i++)
+            {
+                g_usleep(timeout*1000/5);
+                stamp_now(pTimestamp);
+                pWatchdog->HandleTick();
+            }
+            THEN( "The stall handler is never called" )
+            {
+                REQUIRE( detector.calls == 0 );
+
+                const dsl_stalled_source* sources(NULL);
+                uint size(99);
+                pWatchdog->GetStalled(&sources, &size);
+                REQUIRE( size == 0 );
+
+                REQUIRE( pWatchdog->RemoveDetector(&detector) == true );
+                REQUIRE( pWatchdog->RemoveDetector(&detector) == false );
+            }
+        }
+    }
+}
+
+SCENARIO( "A StallWatchdog delivers all stalled detectors in one batch", "[StallWatchdog]" )
+{
+    GIVEN( "A Timestamp PPH and three stall detectors" )
+    {
+        std::string handlerName("timestamp-handler");
+        uint timeout(20);
+        test_detector detector1{0, true};
+        test_detector detector2{0, true};
+        test_detector detector3{0, false};
+
+        DSL_PPH_TIMESTAMP_PTR pTimestamp =
+            DSL_PPH_TIMESTAMP_NEW(handlerName.c_str());
+
+        StallWatchdog* pWatchdog = StallWatchdog::GetWatchdog();
+
+        REQUIRE( pWatchdog->AddDetector(&detector1, "detector-1",
+            pTimestamp.get(), timeout, test_stall_handler) == true );
+        REQUIRE( pWatchdog->AddDetector(&detector2, "detector-2",
+            pTimestamp.get(), timeout, test_stall_handler) == true );
+        REQUIRE( pWatchdog->AddDetector(&detector3, "detector-3",
+            pTimestamp.get(), timeout, test_stall_handler) == true );
+
+        WHEN( "All detectors stall on the same tick" )
+        {
+            g_usleep(timeout*1000*3);
+            pWatchdog->HandleTick();
+
+            THEN( "All handlers are called and false removes the detector" )
+            {
+                REQUIRE( detector1.calls == 1 );
+                REQUIRE( detector2.calls == 1 );
+                REQUIRE( detector3.calls == 1 );
+                REQUIRE( pWatchdog->GetNumDetectors() == 2 );
+
+                REQUIRE( pWatchdog->RemoveDetector(&detector1) == true );
+                REQUIRE( pWatchdog->RemoveDetector(&detector2) == true );
+                REQUIRE( pWatchdog->RemoveDetector(&detector3) == false );
+                REQUIRE( pWatchdog->GetNumDetectors() == 0 );
+            }
+        }
+    }
+}
+
+SCENARIO( "A StallWatchdog handles timeouts beyond the first wheel level", "[StallWatchdog]" )
+{
+    GIVEN( "A Timestamp PPH and a stall detector with a long timeout" )
+    {
+        std::string handlerName("timestamp-handler");
+        uint timeout(DSL_STALL_WATCHDOG_TICK_MS*DSL_STALL_WHEEL_ROOT_SIZE*4);
+        test_detector detector{0, true};
+
+        DSL_PPH_TIMESTAMP_PTR pTimestamp =
+            DSL_PPH_TIMESTAMP_NEW(handlerName.c_str());
+
+        StallWatchdog* pWatchdog = StallWatchdog::GetWatchdog();
+
+        REQUIRE( pWatchdog->AddDetector(&detector, handlerName.c_str(),
+            pTimestamp.get(), timeout, test_stall_handler) == true );
+
+        WHEN( "The timeout is reduced" )
+        {
+            REQUIRE( pWatchdog->SetDetectorTimeout(&detector, 20) == true );
+
+            g_usleep(20*1000*3);
+            pWatchdog->HandleTick();
+
+            THEN( "The detector is rescheduled and the stall handler is called" )
+            {
+                REQUIRE( detector.calls == 1 );
+
+                REQUIRE( pWatchdog->RemoveDetector(&detector) == true );
+            }
+        }
+    }
+}
+
+SCENARIO( "A StallWatchdog does not wait on a handler when removing its detector", "[StallWatchdog]" )
+{
+    GIVEN( "A stall detector owned by a Timestamp PPH" )
+    {
+        std::string handlerName("timestamp-handler");
+        uint timeout(20);
+        owned_test_detector detector;
+        detector.inHandler = false;
+        detector.release = false;
+
+        DSL_PPH_TIMESTAMP_PTR pOwner =
+            DSL_PPH_TIMESTAMP_NEW(handlerName.c_str());
+        std::weak_ptr<Base> pWeakOwner(pOwner);
+
+        StallWatchdog* pWatchdog = StallWatchdog::GetWatchdog();
+
+        stamp_now(pOwner);
+        REQUIRE( pWatchdog->AddDetector(&detector, handlerName.c_str(),
+            pOwner.get(), timeout, owned_test_stall_handler, 
+            pOwner.get()) == true );
+
+        WHEN( "The detector is removed while its handler is being called" )
+        {
+            g_usleep(timeout*1000*3);
+            GThread* pThread = g_thread_new("handle-tick", 
+                handle_tick_thread, pWatchdog);
+            while (!detector.inHandler)
+            {
+                g_usleep(1000);
+            }
+            
+            REQUIRE( pWatchdog->RemoveDetector(&detector) == true );
+            REQUIRE( pWatchdog->GetNumDetectors() == 0 );
+            pOwner = nullptr;
+            
+            THEN( "The owner is released only after the handler returns" )
+            {
+                REQUIRE( pWeakOwner.expired() == false );
+                
+                detector.release = true;
+                g_thread_join(pThread);
+
+                REQUIRE( pWeakOwner.expired() == true );
+            }
+        }
+    }
+}
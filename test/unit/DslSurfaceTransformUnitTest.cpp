@@ -0,0 +1,83 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include "catch.hpp"
+#include "Dsl.h"
+#include "DslSurfaceTransform.h"
+
+using namespace DSL;
+
+// An invalid memory type forces NvBufSurfaceCreate to fail.
+static const NvBufSurfaceMemType invalidMemType((NvBufSurfaceMemType)0xFF);
+
+SCENARIO( "A DslBufferSurface throws an exception on allocation failure", 
+    "[SurfaceTransform]" )
+{
+    GIVEN( "Surface create params with an invalid memory type" ) 
+    {
+        DslSurfaceCreateParams surfaceCreateParams(0, 320, 240, 0,
+            NVBUF_COLOR_FORMAT_RGBA, invalidMemType);
+
+        WHEN( "A new DslBufferSurface is created" )
+        {
+            THEN( "An exception is thrown that can be caught" )
+            {
+                REQUIRE_THROWS_AS(DslBufferSurface(1, surfaceCreateParams, 0),
+                    std::exception);
+            }
+        }
+    }
+}
+
+SCENARIO( "A DslBufferSurfacePool returns nullptr on allocation failure", 
+    "[SurfaceTransform]" )
+{
+    GIVEN( "A new DslBufferSurfacePool" ) 
+    {
+        std::shared_ptr<DslBufferSurfacePool> pSurfacePool = 
+            std::shared_ptr<DslBufferSurfacePool>(new DslBufferSurfacePool(2));
+
+        WHEN( "A surface is acquired with an invalid memory type" )
+        {
+            std::shared_ptr<DslBufferSurface> pSurface = 
+                pSurfacePool->Acquire(0, 320, 240, invalidMemType, 1);
+
+            THEN( "No surface is returned and the failure is counted" )
+            {
+                REQUIRE( pSurface == nullptr );
+                
+                uint pooled(99), inUse(99);
+                uint64_t acquired(0), hits(0), allocated(0), failed(0);
+                pSurfacePool->GetMetrics(&pooled, &inUse, 
+                    &acquired, &hits, &allocated, &failed);
+                    
+                REQUIRE( pooled == 0 );
+                REQUIRE( inUse == 0 );
+                REQUIRE( acquired == 1 );
+                REQUIRE( hits == 0 );
+                REQUIRE( failed == 1 );
+            }
+        }
+    }
+}
@@ -225,3 +225,164 @@ SCENARIO( "A Connection event results in the Soup Server client listener to be c
         }
     }
 }
+
+SCENARIO( "A Soup Server Manager can add and remove a Topic", "[SoupServerMgr]" )
+{
+    GIVEN( "A the Soup Server manager" )
+    {
+        std::string topic("unit-test-topic");
+        dsl_websocket_topic_metrics metrics{0};
+
+        REQUIRE( SoupServerMgr::GetMgr()->HasTopic(topic.c_str()) == false );
+        REQUIRE( SoupServerMgr::GetMgr()->GetTopicMetrics(topic.c_str(), 
+            &metrics) == false );
+
+        WHEN( "The Topic is added" )
+        {
+            REQUIRE( SoupServerMgr::GetMgr()->AddTopic(topic.c_str(), 4,
+                DSL_WEBSOCKET_TOPIC_DROP_POLICY_DROP_OLDEST, false) == true );
+
+            // Second call with the same Topic must fail
+            REQUIRE( SoupServerMgr::GetMgr()->AddTopic(topic.c_str(), 4,
+                DSL_WEBSOCKET_TOPIC_DROP_POLICY_DROP_OLDEST, false) == false );
+
+            THEN( "The Topic can be published to and removed" )
+            {
+                REQUIRE( SoupServerMgr::GetMgr()->Publish(topic.c_str(), "1") == true );
+                REQUIRE( SoupServerMgr::GetMgr()->GetTopicMetrics(topic.c_str(), 
+                    &metrics) == true );
+                REQUIRE( metrics.published == 1 );
+                REQUIRE( metrics.subscribers == 0 );
+                REQUIRE( SoupServerMgr::GetMgr()->GetThumbnailWidths(
+                    topic.c_str()).size() == 0 );
+
+                REQUIRE( SoupServerMgr::GetMgr()->RemoveTopic(topic.c_str()) == true );
+                REQUIRE( SoupServerMgr::GetMgr()->RemoveTopic(topic.c_str()) == false );
+                REQUIRE( SoupServerMgr::GetMgr()->Publish(topic.c_str(), "2") == false );
+            }
+        }
+        WHEN( "The Topic is added with invalid parameters" )
+        {
+            THEN( "The add fails" )
+            {
+                REQUIRE( SoupServerMgr::GetMgr()->AddTopic(topic.c_str(), 0,
+                    DSL_WEBSOCKET_TOPIC_DROP_POLICY_DROP_OLDEST, false) == false );
+                REQUIRE( SoupServerMgr::GetMgr()->AddTopic(topic.c_str(), 1,
+                    DSL_WEBSOCKET_TOPIC_DROP_POLICY_DISCONNECT+1, false) == false );
+            }
+        }
+    }
+}
+
+/**
+ * @brief Iterates the default main-context until the condition is met
+ * or the timeout expires. Returns the final condition.
+ */
+static bool iterate_main_context_until(std::function<bool()> condition, 
+    uint timeoutMs)
+{
+    gint64 endTime = g_get_monotonic_time() + timeoutMs*1000;
+
+    while (!condition() and g_get_monotonic_time() < endTime)
+    {
+        if (!g_main_context_iteration(NULL, FALSE))
+        {
+            g_usleep(1000);
+        }
+    }
+    return condition();
+}
+
+static void local_client_connected_cb(GObject* session, GAsyncResult* result, 
+    gpointer pConnection)
+{
+    *(SoupWebsocketConnection**)pConnection = 
+        soup_session_websocket_connect_finish(SOUP_SESSION(session), result, NULL);
+}
+
+static void local_client_message_cb(SoupWebsocketConnection* pConnection,
+    SoupWebsocketDataType dataType, GBytes* message, gpointer pMessages)
+{
+    gsize size;
+    const gchar* data = (const gchar*)g_bytes_get_data(message, &size);
+    static_cast<std::vector<std::string>*>(pMessages)->push_back(
+        std::string(data, size));
+}
+
+SCENARIO( "A local Websocket client receives messages published to a subscribed Topic", 
+    "[SoupServerMgr]" )
+{
+    GIVEN( "A listening Soup Server manager with a new Topic" )
+    {
+        std::string topic("local-client-topic");
+        dsl_websocket_topic_metrics metrics{0};
+
+        REQUIRE( SoupServerMgr::GetMgr()->AddTopic(topic.c_str(), 4,
+            DSL_WEBSOCKET_TOPIC_DROP_POLICY_DROP_OLDEST, false) == true );
+        REQUIRE( SoupServerMgr::GetMgr()->StartListening(
+            DSL_WEBSOCKET_SERVER_DEFAULT_WEBSOCKET_PORT) == true );
+
+        WHEN( "A local client connects and subscribes to the Topic" )
+        {
+            std::string uri("ws://127.0.0.1:" + 
+                std::to_string(DSL_WEBSOCKET_SERVER_DEFAULT_WEBSOCKET_PORT) + 
+                "/pubsub");
+
+            SoupSession* pSession = soup_session_new();
+            SoupMessage* pMessage = soup_message_new(SOUP_METHOD_GET, uri.c_str());
+            SoupWebsocketConnection* pConnection(NULL);
+
+            soup_session_websocket_connect_async(pSession, pMessage, 
+                NULL, NULL, NULL, local_client_connected_cb, &pConnection);
+            REQUIRE( iterate_main_context_until(
+                [&]() { return pConnection != NULL; }, 2000) == true );
+
+            std::vector<std::string> messages;
+            g_signal_connect(G_OBJECT(pConnection), "message", 
+                G_CALLBACK(local_client_message_cb), &messages);
+
+            soup_websocket_connection_send_text(pConnection, 
+                "{\"subscribe\":\"local-client-topic\"}");
+            REQUIRE( iterate_main_context_until([&]() 
+                { 
+                    SoupServerMgr::GetMgr()->GetTopicMetrics(topic.c_str(), &metrics);
+                    return metrics.subscribers == 1; 
+                }, 2000) == true );
+
+            THEN( "The client receives each published message in order" )
+            {
+                REQUIRE( SoupServerMgr::GetMgr()->Publish(topic.c_str(), 
+                    "{\"count\":1}") == true );
+                REQUIRE( SoupServerMgr::GetMgr()->Publish(topic.c_str(), 
+                    "{\"count\":2}") == true );
+                REQUIRE( iterate_main_context_until(
+                    [&]() { return messages.size() == 2; }, 2000) == true );
+
+                REQUIRE( messages[0] == 
+                    "{\"topic\":\"local-client-topic\",\"data\":{\"count\":1}}" );
+                REQUIRE( messages[1] == 
+                    "{\"topic\":\"local-client-topic\",\"data\":{\"count\":2}}" );
+
+                REQUIRE( SoupServerMgr::GetMgr()->GetTopicMetrics(topic.c_str(), 
+                    &metrics) == true );
+                REQUIRE( metrics.sent == 2 );
+                REQUIRE( metrics.dropped == 0 );
+
+                soup_websocket_connection_close(pConnection, 
+                    SOUP_WEBSOCKET_CLOSE_NORMAL, NULL);
+                REQUIRE( iterate_main_context_until([&]() 
+                    { 
+                        SoupServerMgr::GetMgr()->GetTopicMetrics(topic.c_str(), &metrics);
+                        return metrics.subscribers == 0; 
+                    }, 2000) == true );
+
+                g_object_unref(pConnection);
+                g_object_unref(pMessage);
+                g_object_unref(pSession);
+
+                REQUIRE( SoupServerMgr::GetMgr()->StopListening() == true );
+                REQUIRE( SoupServerMgr::GetMgr()->RemoveTopic(topic.c_str()) == true );
+            }
+        }
+    }
+}
@@ -113,3 +113,153 @@ SCENARIO( "The Websocket Server can add a handler for a new a Path", "[websocket
     }
 }
 
+
+SCENARIO( "The Websocket Server can add and remove a Topic", "[websocket-server-api]" )
+{
+    GIVEN( "The singleton Websocket server" )
+    {
+        std::wstring topic(L"events");
+        dsl_websocket_topic_metrics metrics{0};
+
+        REQUIRE( dsl_websocket_server_topic_metrics_get(topic.c_str(),
+            &metrics) == DSL_RESULT_WEBSOCKET_SERVER_TOPIC_NOT_FOUND );
+
+        WHEN( "A new Topic is added" )
+        {
+            REQUIRE( dsl_websocket_server_topic_add(topic.c_str(), 
+                DSL_WEBSOCKET_TOPIC_DEFAULT_MAX_QUEUE_SIZE,
+                DSL_WEBSOCKET_TOPIC_DROP_POLICY_DROP_OLDEST, 
+                false) == DSL_RESULT_SUCCESS );
+
+            // Second call with the same Topic must fail
+            REQUIRE( dsl_websocket_server_topic_add(topic.c_str(), 
+                DSL_WEBSOCKET_TOPIC_DEFAULT_MAX_QUEUE_SIZE,
+                DSL_WEBSOCKET_TOPIC_DROP_POLICY_DROP_OLDEST, 
+                false) == DSL_RESULT_WEBSOCKET_SERVER_TOPIC_NOT_UNIQUE );
+
+            THEN( "Messages can be published and the Topic removed" )
+            {
+                REQUIRE( dsl_websocket_server_topic_publish(topic.c_str(),
+                    L"{\"count\":1}") == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_websocket_server_topic_publish(topic.c_str(),
+                    L"not-json") == DSL_RESULT_WEBSOCKET_SERVER_TOPIC_PUBLISH_FAILED );
+
+                REQUIRE( dsl_websocket_server_topic_metrics_get(topic.c_str(),
+                    &metrics) == DSL_RESULT_SUCCESS );
+                REQUIRE( metrics.subscribers == 0 );
+                REQUIRE( metrics.published == 1 );
+                REQUIRE( metrics.sent == 0 );
+
+                REQUIRE( dsl_websocket_server_topic_remove(topic.c_str()) 
+                    == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_websocket_server_topic_remove(topic.c_str()) 
+                    == DSL_RESULT_WEBSOCKET_SERVER_TOPIC_NOT_FOUND );
+                REQUIRE( dsl_websocket_server_topic_publish(topic.c_str(),
+                    L"{\"count\":2}") == DSL_RESULT_WEBSOCKET_SERVER_TOPIC_NOT_FOUND );
+            }
+        }
+    }
+}
+
+SCENARIO( "A Websocket Publish ODE Action requires an existing Topic", "[websocket-server-api]" )
+{
+    GIVEN( "The singleton Websocket server" )
+    {
+        std::wstring action_name(L"publish-action");
+        std::wstring topic(L"ode-events");
+
+        REQUIRE( dsl_ode_action_websocket_publish_new(action_name.c_str(), 
+            topic.c_str()) == DSL_RESULT_WEBSOCKET_SERVER_TOPIC_NOT_FOUND );
+
+        WHEN( "The Topic is added" )
+        {
+            REQUIRE( dsl_websocket_server_topic_add(topic.c_str(), 
+                DSL_WEBSOCKET_TOPIC_DEFAULT_MAX_QUEUE_SIZE,
+                DSL_WEBSOCKET_TOPIC_DROP_POLICY_DROP_NEWEST, 
+                true) == DSL_RESULT_SUCCESS );
+
+            THEN( "The Websocket Publish ODE Action can be created and deleted" )
+            {
+                REQUIRE( dsl_ode_action_websocket_publish_new(action_name.c_str(), 
+                    topic.c_str()) == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_action_websocket_publish_new(action_name.c_str(), 
+                    topic.c_str()) == DSL_RESULT_ODE_ACTION_NAME_NOT_UNIQUE );
+
+                REQUIRE( dsl_ode_action_delete(action_name.c_str()) 
+                    == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_websocket_server_topic_remove(topic.c_str()) 
+                    == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
+SCENARIO( "A Capture Action can set a Websocket Topic to publish to", "[websocket-server-api]" )
+{
+    GIVEN( "A new Capture Action" )
+    {
+        std::wstring action_name(L"capture-action");
+        std::wstring outdir(L"./");
+        std::wstring topic(L"thumbnails");
+
+        REQUIRE( dsl_ode_action_capture_frame_new(action_name.c_str(), 
+            outdir.c_str()) == DSL_RESULT_SUCCESS );
+
+        REQUIRE( dsl_ode_action_capture_websocket_topic_set(action_name.c_str(), 
+            topic.c_str()) == DSL_RESULT_WEBSOCKET_SERVER_TOPIC_NOT_FOUND );
+
+        WHEN( "The Topic is added" )
+        {
+            REQUIRE( dsl_websocket_server_topic_add(topic.c_str(), 2,
+                DSL_WEBSOCKET_TOPIC_DROP_POLICY_DISCONNECT, 
+                false) == DSL_RESULT_SUCCESS );
+
+            THEN( "The Topic can be set and cleared" )
+            {
+                REQUIRE( dsl_ode_action_capture_websocket_topic_set(
+                    action_name.c_str(), topic.c_str()) == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_action_capture_websocket_topic_set(
+                    action_name.c_str(), NULL) == DSL_RESULT_SUCCESS );
+
+                REQUIRE( dsl_ode_action_delete(action_name.c_str()) 
+                    == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_websocket_server_topic_remove(topic.c_str()) 
+                    == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
+SCENARIO( "The Websocket Server Topic API checks for NULL input parameters", "[websocket-server-api]" )
+{
+    GIVEN( "An empty list of Components" )
+    {
+        std::wstring topic(L"events");
+        dsl_websocket_topic_metrics metrics{0};
+
+        WHEN( "When NULL pointers are used as input" )
+        {
+            THEN( "The API returns DSL_RESULT_INVALID_INPUT_PARAM in all cases" ) 
+            {
+                REQUIRE( dsl_websocket_server_topic_add(NULL, 1, 0, false) 
+                    == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_websocket_server_topic_remove(NULL) 
+                    == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_websocket_server_topic_publish(NULL, L"{}") 
+                    == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_websocket_server_topic_publish(topic.c_str(), NULL) 
+                    == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_websocket_server_topic_metrics_get(NULL, &metrics) 
+                    == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_websocket_server_topic_metrics_get(topic.c_str(), NULL) 
+                    == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_action_websocket_publish_new(NULL, topic.c_str()) 
+                    == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_action_websocket_publish_new(L"action", NULL) 
+                    == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_action_capture_websocket_topic_set(NULL, topic.c_str()) 
+                    == DSL_RESULT_INVALID_INPUT_PARAM );
+            }
+        }
+    }
+}